@@ -1,19 +1,18 @@
-import sqlite3
 import json
 import time
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
-import re
-from database_manager import db
+import threading
+import storage
+from offline_vocab import offline_vocab
+from tokenizer import tokenizer
+from review_scheduler import review_scheduler, format_due
+from progress_service import progress_service, level_for_xp
 
 class AdaptiveChatbot:
     def __init__(self):
-        # Offline vocabulary for 3 languages
-        self.offline_vocab = {
-            'en': self.load_offline_vocab('en'),
-            'es': self.load_offline_vocab('es'), 
-            'hi': self.load_offline_vocab('hi')
-        }
+        # Offline vocabulary for 3 languages (shared index, loaded once)
+        self.offline_vocab = offline_vocab.levels
         
         # Learning patterns
         self.difficulty_levels = ['beginner', 'intermediate', 'advanced', 'proficient']
@@ -21,30 +20,15 @@ class AdaptiveChatbot:
         
         # Ensure lessons table structure exists (if not created by manager)
         self.populate_initial_lessons()
+        
+        # Short-lived cache of dashboard stats: user_id -> (fetched_at, stats)
+        self.stats_cache = {}
+        self.stats_cache_ttl = 5
+        self.stats_cache_lock = threading.Lock()
     
-    def get_connection(self):
-        return db.get_connection()
-
     def load_offline_vocab(self, language):
-        """Load offline vocabulary for each language (simulated)"""
-        vocab_sets = {
-            'en': {
-                'basic': ['hello', 'goodbye', 'please', 'thank', 'yes', 'no', 'water', 'food', 'house', 'family'],
-                'intermediate': ['beautiful', 'important', 'different', 'possible', 'available', 'necessary'],
-                'advanced': ['sophisticated', 'comprehensive', 'extraordinary', 'magnificent', 'tremendous']
-            },
-            'es': {
-                'basic': ['hola', 'adiós', 'por favor', 'gracias', 'sí', 'no', 'agua', 'comida', 'casa', 'familia'],
-                'intermediate': ['hermoso', 'importante', 'diferente', 'posible', 'disponible', 'necesario'],
-                'advanced': ['sofisticado', 'comprensivo', 'extraordinario', 'magnífico', 'tremendo']
-            },
-            'hi': {
-                'basic': ['namaste', 'alvida', 'kripaya', 'dhanyawad', 'haan', 'nahin', 'paani', 'khana', 'ghar', 'parivar'],
-                'intermediate': ['sundar', 'mahattvapurna', 'alag', 'sambhav', 'uplabdh', 'aavashyak'],
-                'advanced': ['pariskhrit', 'vyapak', 'asadharan', 'shानदार', 'bhayanak']
-            }
-        }
-        return vocab_sets.get(language, {})
+        """Offline vocabulary for a language, {level: words} (from dictionaries/offline_vocab.json)"""
+        return offline_vocab.get_levels(language)
     
     
     def populate_initial_lessons(self):
@@ -57,48 +41,25 @@ class AdaptiveChatbot:
     
     def process_spoken_words(self, user_id, text, language, session_id=None):
         """Process newly spoken words and update vocabulary"""
-        words = self.extract_words(text)
+        words = self.extract_words(text, language)
         new_words = []
         oov_words = []
         
-        conn = self.get_connection()
-        today = datetime.now().date()
+        today = datetime.now().date().isoformat()
+        due_now = format_due(datetime.now())
         
-        for word in words:
-            word_lower = word.lower()
-            is_known = self.is_word_in_offline_vocab(word_lower, language)
-            
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT frequency, mastery_level FROM vocabulary WHERE user_id=? AND word=? AND language=?",
-                (user_id, word_lower, language)
-            )
-            result = cursor.fetchone()
-            
-            if result:
-                frequency, mastery = result
-                conn.execute(
-                    "UPDATE vocabulary SET frequency=?, last_practiced=? WHERE user_id=? AND word=? AND language=?",
-                    (frequency + 1, today, user_id, word_lower, language)
-                )
-            else:
-                conn.execute(
-                    "INSERT INTO vocabulary (user_id, word, language, first_seen, last_practiced) VALUES (?, ?, ?, ?, ?)",
-                    (user_id, word_lower, language, today, today)
-                )
+        with storage.store.transaction() as cursor:
+            for word in words:
+                word_lower = word.lower()
+                if storage.vocabulary.practice(user_id, word_lower, language, today, cursor=cursor):
+                    continue
+                storage.vocabulary.add(user_id, word_lower, language, today, due_now, cursor=cursor)
                 new_words.append(word_lower)
                 
-                if not is_known:
+                # Unambiguous ASR near-misses ("gracia") count as the known word
+                if not self.is_word_in_offline_vocab(word_lower, language, fuzzy=True):
                     oov_words.append(word_lower)
-                    conn.execute("""
-                        INSERT INTO oov_words (user_id, word, language, first_seen, last_seen, occurrences)
-                        VALUES (?, ?, ?, ?, ?, 1)
-                        ON CONFLICT(user_id, word, language)
-                        DO UPDATE SET last_seen=excluded.last_seen, occurrences=occurrences+1
-                    """, (user_id, word_lower, language, today, today))
-        
-        conn.commit()
-        conn.close()
+                    storage.vocabulary.record_oov(user_id, word_lower, language, today, cursor=cursor)
         
         self.update_session_stats(user_id, language, len(new_words))
         
@@ -110,127 +71,36 @@ class AdaptiveChatbot:
         }
 
     def get_new_words_by_date(self, user_id, days=7, language=None):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        params = [user_id]
-        lang_filter = ""
-        if language:
-            lang_filter = "AND language=?"
-            params.append(language)
-
-        cursor.execute(f"""
-            SELECT first_seen, word, language
-            FROM vocabulary
-            WHERE user_id=? {lang_filter}
-              AND first_seen >= date('now', ? || ' days')
-            ORDER BY first_seen DESC
-        """, params + [ str(-abs(days)) ])
-
-        rows = cursor.fetchall()
-        conn.close()
-
+        since = (datetime.now().date() - timedelta(days=abs(days))).isoformat()
         grouped = {}
-        for date_str, word, lang in rows:
+        for date_str, word, lang in storage.vocabulary.added_since(user_id, since, language):
             grouped.setdefault(date_str, []).append({'word': word, 'language': lang})
         return grouped
 
     def get_oov_words(self, user_id, language=None):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        params = [user_id]
-        lang_clause = ""
-        if language:
-            lang_clause = "AND language=?"
-            params.append(language)
-
-        cursor.execute(f"""
-            SELECT word, language, first_seen, last_seen, occurrences
-            FROM oov_words
-            WHERE user_id=? {lang_clause}
-            ORDER BY last_seen DESC
-        """, params)
-
-        rows = cursor.fetchall()
-        conn.close()
-        return [
-            {'word': r[0], 'language': r[1], 'first_seen': r[2], 'last_seen': r[3], 'occurrences': r[4]} for r in rows
-        ]
+        return storage.vocabulary.oov(user_id, language)
 
     def get_vocabulary(self, user_id, language=None, limit=200):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        params = [user_id]
-        lang_clause = ""
-        if language:
-            lang_clause = "AND language=?"
-            params.append(language)
-
-        cursor.execute(f"""
-            SELECT word, language, first_seen, frequency, mastery_level,
-                   correct_attempts, incorrect_attempts
-            FROM vocabulary
-            WHERE user_id=? {lang_clause}
-            ORDER BY last_practiced DESC
-            LIMIT ?
-        """, params + [limit])
-
-        rows = cursor.fetchall()
-        conn.close()
-        return [
-            {
-                'word': r[0],
-                'language': r[1],
-                'first_seen': r[2],
-                'frequency': r[3],
-                'mastery_level': r[4],
-                'correct_attempts': r[5],
-                'incorrect_attempts': r[6]
-            } for r in rows
-        ]
+        return storage.vocabulary.recent(user_id, language, limit)
     
-    def is_word_in_offline_vocab(self, word, language):
-        if language not in self.offline_vocab: return False
-        for level_words in self.offline_vocab[language].values():
-            if word in level_words: return True
-        return False
+    def is_word_in_offline_vocab(self, word, language, fuzzy=False):
+        return offline_vocab.contains(word, language, fuzzy=fuzzy)
     
-    def extract_words(self, text):
-        words = re.findall(r'\b[a-zA-Z\u0900-\u097F\u00C0-\u017F]+\b', text.lower())
-        stop_words = {'a', 'an', 'the', 'is', 'are', 'was', 'were', 'i', 'you', 'he', 'she', 'it'}
-        return [word for word in words if len(word) > 2 and word not in stop_words]
+    def extract_words(self, text, language='en'):
+        """Vocabulary words of a transcript: stop words dropped, multiword entries kept whole"""
+        return tokenizer.content_words(text, language)
     
     def get_personalized_lesson(self, user_id, language):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT current_level, total_xp, sections_completed FROM user_progress WHERE user_id=? AND language=?",
-            (user_id, language)
-        )
-        progress = cursor.fetchone()
+        progress = storage.progress.get(user_id, language)
+        level = progress[1] if progress else 'beginner'
         
-        if not progress:
-            level = 'beginner'
-        else:
-            level, xp, sections = progress
-        
-        cursor.execute("""
-            SELECT word, mastery_level 
-            FROM vocabulary 
-            WHERE user_id=? AND language=? AND mastery_level < 3
-            ORDER BY frequency DESC
-            LIMIT 10
-        """, (user_id, language))
-        weak_words = cursor.fetchall()
+        # Words whose next review is due, most overdue first
+        weak_words = [(c['word'], c['mastery_level']) for c in review_scheduler.due_cards(user_id, language, limit=10)]
         
-        cursor.execute(
-            "SELECT content FROM lessons WHERE language=? AND level=? LIMIT 1",
-            (language, level)
-        )
-        lesson_data = cursor.fetchone()
-        conn.close()
+        lesson_data = storage.lessons.content(language, level)
         
         if lesson_data:
-            lesson_content = json.loads(lesson_data[0])
+            lesson_content = json.loads(lesson_data)
             if weak_words:
                 lesson_content['focus_words'] = [word[0] for word in weak_words[:5]]
             return lesson_content
@@ -248,106 +118,118 @@ class AdaptiveChatbot:
         return lesson
     
     def record_performance(self, user_id, language, word, lesson_type, response_time, is_correct, difficulty_level):
-        conn = self.get_connection()
-        conn.execute("""
-            INSERT INTO performance_analytics 
-            (user_id, language, word, lesson_type, response_time, is_correct, timestamp, difficulty_level)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (user_id, language, word, lesson_type, response_time, is_correct, datetime.now(), difficulty_level))
-        
-        if word:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT correct_attempts, incorrect_attempts, mastery_level FROM vocabulary WHERE user_id=? AND word=? AND language=?",
-                (user_id, word, language)
-            )
-            result = cursor.fetchone()
-            if result:
-                correct, incorrect, mastery = result
-                if is_correct:
-                    correct += 1
-                    if correct > 0 and correct / (correct + incorrect) > 0.8: mastery = min(5, mastery + 1)
-                else:
-                    incorrect += 1
-                    if incorrect > correct: mastery = max(0, mastery - 1)
-                
-                conn.execute(
-                    "UPDATE vocabulary SET correct_attempts=?, incorrect_attempts=?, mastery_level=? WHERE user_id=? AND word=? AND language=?",
-                    (correct, incorrect, mastery, user_id, word, language)
-                )
-        conn.commit()
-        conn.close()
-        self.update_user_progress(user_id, language, 10 if is_correct else 2)
+        self.record_performance_batch(user_id, language, [{
+            'word': word,
+            'lesson_type': lesson_type,
+            'response_time': response_time,
+            'is_correct': is_correct,
+            'difficulty_level': difficulty_level
+        }])
     
-    def update_user_progress(self, user_id, language, xp_earned):
-        conn = self.get_connection()
-        today = datetime.now().date()
-        cursor = conn.cursor()
-        cursor.execute("SELECT total_xp, current_level, streak_days, last_activity FROM user_progress WHERE user_id=? AND language=?", (user_id, language))
-        result = cursor.fetchone()
+    def record_performance_batch(self, user_id, language, events, lesson_type='review'):
+        """
+        Ingest a list of answer events (quiz/flashcard answers) in one transaction:
+        analytics rows and vocabulary review state are written with executemany and
+        XP/streak is updated once for the batch (or buffered, with PROGRESS_COALESCE_SEC
+        set, in which case the returned XP lags by up to that long). Returns the
+        scheduler result plus 'xp_earned' and the user's refreshed stats for the language.
+        """
+        with storage.store.transaction() as cursor:
+            result = review_scheduler.submit_reviews(user_id, language, events, lesson_type=lesson_type, cursor=cursor)
+            xp = 10 * result['correct'] + 2 * (result['answered'] - result['correct'])
+            if xp:
+                progress_service.add_xp(user_id, language, xp, cursor=cursor)
         
-        if result:
-            total_xp, current_level, streak_days, last_activity = result
-            new_xp = total_xp + xp_earned
-            if last_activity:
-                last_date = datetime.strptime(last_activity, '%Y-%m-%d').date() if isinstance(last_activity, str) else last_activity
-                if today - last_date == timedelta(days=1): streak_days += 1
-                elif today - last_date > timedelta(days=1): streak_days = 1
-            else: streak_days = 1
-            
-            new_level = self.calculate_level(new_xp)
-            conn.execute("UPDATE user_progress SET total_xp=?, current_level=?, streak_days=?, last_activity=? WHERE user_id=? AND language=?", 
-                         (new_xp, new_level, streak_days, today, user_id, language))
-        else:
-            conn.execute("INSERT INTO user_progress (user_id, language, total_xp, current_level, streak_days, last_activity) VALUES (?, ?, ?, 'beginner', 1, ?)", 
-                         (user_id, language, xp_earned, today))
-        conn.commit()
-        conn.close()
+        with self.stats_cache_lock:
+            self.stats_cache.pop(user_id, None)
+        result['xp_earned'] = xp
+        result['stats'] = self.get_dashboard_stats(user_id).get(language)
+        return result
+    
+    def update_user_progress(self, user_id, language, xp_earned, cursor=None):
+        """Add XP and advance the streak in one atomic upsert (see progress_service)"""
+        progress_service.apply_xp(user_id, language, xp_earned, cursor=cursor)
     
     def calculate_level(self, xp):
-        if xp < 100: return 'beginner'
-        elif xp < 500: return 'intermediate'
-        elif xp < 1500: return 'advanced'
-        return 'proficient'
+        return level_for_xp(xp)
     
     def get_user_stats(self, user_id, language=None):
-        conn = self.get_connection()
-        cursor = conn.cursor()
         stats = {}
         if language:
-            cursor.execute("SELECT total_xp, current_level, streak_days FROM user_progress WHERE user_id=? AND language=?", (user_id, language))
-            progress = cursor.fetchone()
-            cursor.execute("SELECT COUNT(*) FROM vocabulary WHERE user_id=? AND language=?", (user_id, language))
-            vocab_count = cursor.fetchone()[0]
+            progress = storage.progress.get(user_id, language)
+            vocab_count = storage.vocabulary.count(user_id, language)
             stats[language] = {'progress': progress, 'vocabulary_size': vocab_count, 'level': progress[1] if progress else 'beginner'}
         else:
-            cursor.execute("SELECT language, total_xp, current_level, streak_days FROM user_progress WHERE user_id=?", (user_id,))
-            for r in cursor.fetchall():
+            for r in storage.progress.all(user_id):
                 stats[r[0]] = {'xp': r[1], 'level': r[2], 'streak': r[3]}
-        conn.close()
         return stats
     
-    def update_session_stats(self, user_id, language, new_words_count):
-        conn = self.get_connection()
+    def get_dashboard_stats(self, user_id):
+        """
+        Per-language stats plus overall totals, read from the materialized
+        user_stats table and cached briefly in memory for polling clients.
+        """
+        now = time.time()
+        with self.stats_cache_lock:
+            cached = self.stats_cache.get(user_id)
+            if cached and now - cached[0] < self.stats_cache_ttl:
+                return cached[1]
+        
+        stats = {}
+        for lang, xp, level, streak, vocab_count, oov_count, transcript_count in storage.stats.by_language(user_id):
+            stats[lang] = {
+                'xp': xp or 0,
+                'level': level or 'beginner',
+                'streak': streak or 0,
+                'vocabulary_size': vocab_count or 0,
+                'oov_count': oov_count or 0,
+                'transcripts': transcript_count or 0
+            }
+        
+        per_lang = list(stats.values())
+        stats['total_xp'] = sum(s['xp'] for s in per_lang)
+        stats['current_streak'] = max((s['streak'] for s in per_lang), default=0)
+        stats['total_words'] = sum(s['vocabulary_size'] for s in per_lang)
+        stats['total_oov_words'] = sum(s['oov_count'] for s in per_lang)
+        stats['total_transcripts'] = sum(s['transcripts'] for s in per_lang)
+        
+        with self.stats_cache_lock:
+            self.stats_cache[user_id] = (now, stats)
+        return stats
+    
+    def get_daily_stats(self, user_id, language=None, days=30):
+        """
+        Daily time series for the last `days` days (oldest first, missing days
+        zero-filled), read from the daily_stats rollup rather than the raw log.
+        Without a language, all languages are summed per day.
+        """
         today = datetime.now().date()
-        cursor = conn.cursor()
-        cursor.execute("SELECT words_learned FROM learning_sessions WHERE user_id=? AND language=? AND session_date=?", (user_id, language, today))
-        if cursor.fetchone():
-            conn.execute("UPDATE learning_sessions SET words_learned=words_learned+? WHERE user_id=? AND language=? AND session_date=?", (new_words_count, user_id, language, today))
-        else:
-            conn.execute("INSERT INTO learning_sessions (user_id, language, session_date, words_learned) VALUES (?, ?, ?, ?)", (user_id, language, today, new_words_count))
-        conn.commit()
-        conn.close()
+        start = today - timedelta(days=days - 1)
+        rows = storage.stats.daily(user_id, start.isoformat(), language)
+        
+        series = []
+        for offset in range(days):
+            day = (start + timedelta(days=offset)).isoformat()
+            attempts, correct, rt_total, rt_count, learned = rows.get(day, (0, 0, 0, 0, 0))
+            series.append({
+                'date': day,
+                'attempts': attempts,
+                'correct': correct,
+                'accuracy': round(correct / attempts, 3) if attempts else None,
+                'mean_response_time': round(rt_total / rt_count, 2) if rt_count else None,
+                'words_learned': learned
+            })
+        return series
+    
+    def update_session_stats(self, user_id, language, new_words_count):
+        storage.progress.log_words_learned(user_id, language, datetime.now().date().isoformat(), new_words_count)
     
     def get_daily_challenge(self, user_id, language):
         # Simplified logic
         return {'type': 'daily_vocabulary', 'title': 'Learn 3 new words', 'target': 3, 'xp_reward': 30}
     
     def clear_all_adaptive_data(self):
-        conn = self.get_connection()
-        for table in ['vocabulary', 'oov_words', 'learning_sessions', 'user_progress', 'performance_analytics']:
-            try: conn.execute(f"DELETE FROM {table}")
-            except: pass
-        conn.commit()
-        conn.close()
+        for table in ['vocabulary', 'oov_words', 'learning_sessions', 'user_progress', 'performance_analytics', 'daily_stats']:
+            try: storage.store.execute(f"DELETE FROM {table}")
+            except Exception: pass
         return True
\ No newline at end of file
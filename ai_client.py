@@ -0,0 +1,212 @@
+"""
+AI Client for LinguaVoice
+Single entry point for all generative model calls. Adds a global concurrency
+limit, per-call deadlines and retry with backoff on rate limits, so a slow or
+throttled model call can't tie up a Flask worker indefinitely.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Optional
+from config import AI_BACKEND, AI_MAX_CONCURRENCY, AI_TIMEOUT, AI_MAX_RETRIES
+
+
+class AIClientError(Exception):
+    """Base error for AI client failures"""
+
+
+class AITimeoutError(AIClientError):
+    """The call did not finish before its deadline"""
+
+
+class AIUnavailableError(AIClientError):
+    """No model backend is configured"""
+
+
+RATE_LIMIT_ERRORS = {'ResourceExhausted', 'TooManyRequests', 'ServiceUnavailable'}
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """True for 429/503 style errors that are worth retrying"""
+    if type(error).__name__ in RATE_LIMIT_ERRORS:
+        return True
+    if getattr(error, 'code', None) in (429, 503):
+        return True
+    return '429' in str(error)
+
+
+class GeminiBackend:
+    """Calls the shared GeminiWordService model"""
+
+    def _model(self):
+        import gemini_service
+        if gemini_service.gemini_service is None:
+            raise AIUnavailableError("Gemini service is not initialized")
+        return gemini_service.gemini_service.model
+
+    def generate(self, prompt: str, generation_config=None) -> str:
+        model = self._model()
+        if generation_config is not None:
+            response = model.generate_content(prompt, generation_config=generation_config)
+        else:
+            response = model.generate_content(prompt)
+        return response.text if response else ''
+
+    def stream(self, prompt: str, generation_config=None):
+        model = self._model()
+        if generation_config is not None:
+            response = model.generate_content(prompt, generation_config=generation_config, stream=True)
+        else:
+            response = model.generate_content(prompt, stream=True)
+        for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+
+class FakeBackend:
+    """
+    Local backend that never touches the network. Used for tests and offline
+    development (AI_BACKEND=fake). Pass `handler` to control the replies.
+    """
+
+    def __init__(self, handler: Optional[Callable] = None, delay: float = 0.0):
+        self.handler = handler
+        self.delay = delay
+        self.calls = []
+
+    def generate(self, prompt: str, generation_config=None) -> str:
+        self.calls.append(prompt)
+        if self.delay:
+            time.sleep(self.delay)
+        if self.handler:
+            return self.handler(prompt, generation_config)
+
+        mime_type = None
+        if isinstance(generation_config, dict):
+            mime_type = generation_config.get('response_mime_type')
+        else:
+            mime_type = getattr(generation_config, 'response_mime_type', None)
+        if mime_type == 'application/json':
+            return '{}'
+        return "This is a reply from the local fake AI backend."
+
+    def stream(self, prompt: str, generation_config=None):
+        text = self.generate(prompt, generation_config)
+        for word in text.split(' '):
+            yield word + ' '
+
+
+class AIClient:
+    """Bounded, deadline-aware wrapper around a model backend"""
+
+    def __init__(self, backend=None, max_concurrency=4, default_timeout=15.0,
+                 max_retries=2, backoff_base=0.5):
+        self.backend = backend or GeminiBackend()
+        self.default_timeout = default_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.semaphore = threading.BoundedSemaphore(max_concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="ai-client")
+
+    def generate(self, prompt: str, generation_config=None, timeout: Optional[float] = None) -> str:
+        """
+        Run a single generation and return the response text.
+
+        Raises AITimeoutError if no answer arrives within `timeout` seconds
+        (including time spent waiting for a free slot and retry backoff).
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        attempt = 0
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.semaphore.acquire(timeout=remaining):
+                raise AITimeoutError(f"No AI slot free within {timeout:.1f}s")
+
+            # The slot is released when the backend call really finishes, so a
+            # call that outlives its deadline still counts against the limit
+            future = self.executor.submit(self.backend.generate, prompt, generation_config)
+            future.add_done_callback(lambda f: self.semaphore.release())
+
+            try:
+                return future.result(timeout=max(deadline - time.monotonic(), 0))
+            except FutureTimeoutError:
+                raise AITimeoutError(f"AI call exceeded {timeout:.1f}s deadline")
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_base * (2 ** attempt)
+                if time.monotonic() + delay >= deadline:
+                    raise
+                print(f"[AI_CLIENT] Rate limited ({type(e).__name__}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                attempt += 1
+
+    def stream(self, prompt: str, generation_config=None, timeout: Optional[float] = None):
+        """
+        Yield response text chunks as the backend produces them.
+
+        `timeout` bounds the whole response; AITimeoutError is raised from the
+        generator if the next chunk doesn't arrive before the deadline. Rate
+        limits are not retried here, since chunks may already have been sent.
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        if not self.semaphore.acquire(timeout=timeout):
+            raise AITimeoutError(f"No AI slot free within {timeout:.1f}s")
+
+        chunks = queue.Queue()
+        cancelled = threading.Event()
+        done = object()
+
+        def produce():
+            try:
+                for chunk in self.backend.stream(prompt, generation_config):
+                    if cancelled.is_set():
+                        break
+                    chunks.put(chunk)
+            except Exception as e:
+                chunks.put(e)
+            finally:
+                chunks.put(done)
+
+        future = self.executor.submit(produce)
+        future.add_done_callback(lambda f: self.semaphore.release())
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = chunks.get(timeout=max(remaining, 0))
+                except queue.Empty:
+                    raise AITimeoutError(f"AI stream exceeded {timeout:.1f}s deadline")
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Stop the producer early if the consumer went away (e.g. client disconnect)
+            cancelled.set()
+
+    def set_backend(self, backend):
+        """Swap the backend (e.g. FakeBackend in tests)"""
+        self.backend = backend
+
+
+def _default_backend():
+    if AI_BACKEND == 'fake':
+        print("[AI_CLIENT] Using fake local backend")
+        return FakeBackend()
+    return GeminiBackend()
+
+
+# Global instance
+ai_client = AIClient(
+    backend=_default_backend(),
+    max_concurrency=AI_MAX_CONCURRENCY,
+    default_timeout=AI_TIMEOUT,
+    max_retries=AI_MAX_RETRIES
+)
@@ -1,10 +1,48 @@
 """
 AI Tutor Chat API using Gemini 2.5 Flash
 """
-from gemini_service import gemini_service
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from ai_client import ai_client
+from quiz_cache import quiz_cache
+from config import QUIZ_MODEL_TIMEOUT
+
+# Background quiz generation, so a slow model call can't hold the request open
+_quiz_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="quiz-gen")
+_quiz_pending = {}
+_quiz_pending_lock = threading.Lock()
+
+TUTOR_FALLBACK_REPLY = "Hey! I'm having a little glitch in my system. Let's try again in a moment, friend!"
 
 def get_ai_tutor_response(message, base_language, target_language, history):
     """Get AI tutor response using Gemini"""
+    prompt = _build_tutor_prompt(message, base_language, target_language, history)
+
+    try:
+        response_text = ai_client.generate(prompt, timeout=20)
+        if response_text:
+            return response_text.strip()
+    except Exception as e:
+        print(f"[AI_TUTOR] Error: {e}")
+    
+    return TUTOR_FALLBACK_REPLY
+
+def stream_ai_tutor_response(message, base_language, target_language, history):
+    """Yield the AI tutor response in chunks as Gemini produces them"""
+    prompt = _build_tutor_prompt(message, base_language, target_language, history)
+    sent_any = False
+
+    try:
+        for chunk in ai_client.stream(prompt, timeout=30):
+            sent_any = True
+            yield chunk
+    except Exception as e:
+        print(f"[AI_TUTOR] Stream error: {e}")
+        if not sent_any:
+            yield TUTOR_FALLBACK_REPLY
+
+def _build_tutor_prompt(message, base_language, target_language, history):
+    """Build the tutor prompt from the student's message and recent history"""
     
     language_names = {
         'en': 'English',
@@ -38,15 +76,7 @@ Previous conversation:
 Friend's message: {message}
 
 Respond as a warm, interactive friend. Keep it natural and engaging."""
-
-    try:
-        response = gemini_service.model.generate_content(prompt)
-        if response and response.text:
-            return response.text.strip()
-    except Exception as e:
-        print(f"[AI_TUTOR] Error: {e}")
-    
-    return "Hey! I'm having a little glitch in my system. Let's try again in a moment, friend!"
+    return prompt
 
 def get_note_translation(text, target_language):
     """Translate a recorded note into English and provide explanation"""
@@ -64,12 +94,12 @@ Return JSON format:
 }}"""
 
     try:
-        response = gemini_service.model.generate_content(
+        response_text = ai_client.generate(
             prompt,
             generation_config={"response_mime_type": "application/json"}
         )
-        if response and response.text:
-            text_res = response.text.strip()
+        if response_text:
+            text_res = response_text.strip()
             if text_res.startswith('```json'): text_res = text_res[7:]
             if text_res.endswith('```'): text_res = text_res[:-3]
             
@@ -114,12 +144,12 @@ Example for Spanish:
 }}"""
 
     try:
-        response = gemini_service.model.generate_content(
+        response_text = ai_client.generate(
             prompt,
             generation_config={"response_mime_type": "application/json"}
         )
-        if response and response.text:
-            text = response.text.strip()
+        if response_text:
+            text = response_text.strip()
             if text.startswith('```json'):
                 text = text[7:]
             if text.startswith('```'):
@@ -172,6 +202,53 @@ def check_pronunciation(expected, actual, language):
 
 def generate_quiz_questions(level_id, tier='beginner', target_language='es', words=None):
     """Generate 5 quiz questions for a specific level using Gemini"""
+    questions = _generate_model_quiz(level_id, tier, target_language, words)
+    if questions:
+        return questions
+    
+    # Fallback Procedural
+    return get_fallback_quiz(level_id, target_language, words)
+
+def get_level_quiz_questions(level_id, tier='beginner', target_language='es', words=None, timeout=QUIZ_MODEL_TIMEOUT):
+    """
+    Get quiz questions for a level, reusing previously generated questions
+    for the same word set. If Gemini doesn't answer within `timeout` seconds
+    the deterministic fallback quiz is served, and the model's questions are
+    cached for the next load once they arrive.
+    """
+    key = quiz_cache.make_key(level_id, target_language, words)
+    cached = quiz_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    with _quiz_pending_lock:
+        future = _quiz_pending.get(key)
+        started = future is None
+        if started:
+            future = _quiz_executor.submit(_generate_model_quiz, level_id, tier, target_language, words)
+            _quiz_pending[key] = future
+    if started:
+        future.add_done_callback(lambda f, key=key: _store_generated_quiz(key, f))
+    
+    try:
+        questions = future.result(timeout=timeout)
+    except FutureTimeoutError:
+        print(f"[QUIZ_GEN] Model slow for level {level_id}, serving fallback quiz")
+        questions = None
+    
+    if questions:
+        return questions
+    return get_fallback_quiz(level_id, target_language, words)
+
+def _store_generated_quiz(key, future):
+    """Cache model-generated questions when a background generation finishes"""
+    with _quiz_pending_lock:
+        _quiz_pending.pop(key, None)
+    if future.exception() is None and future.result():
+        quiz_cache.set(key, future.result())
+
+def _generate_model_quiz(level_id, tier='beginner', target_language='es', words=None):
+    """Ask Gemini for 5 quiz questions. Returns None if generation fails."""
     
     language_names = {
         'en': 'English',
@@ -231,12 +308,12 @@ Return ONLY a JSON array:
         prompt = prompts.get(tier, prompts['beginner'])
 
     try:
-        response = gemini_service.model.generate_content(
+        response_text = ai_client.generate(
             prompt,
             generation_config={"response_mime_type": "application/json"}
         )
-        if response and response.text:
-            text = response.text.strip()
+        if response_text:
+            text = response_text.strip()
             if text.startswith('```json'):
                 text = text[7:]
             if text.startswith('```'):
@@ -254,8 +331,7 @@ Return ONLY a JSON array:
     except Exception as e:
         print(f"[QUIZ_GEN] Error: {e}")
     
-    # Fallback Procedural
-    return get_fallback_quiz(level_id, target_language, words)
+    return None
 
 def get_fallback_quiz(level_id, lang, words=None):
     """Generate deterministic fallback quiz"""
@@ -265,7 +341,9 @@ def get_fallback_quiz(level_id, lang, words=None):
         questions = []
         all_meanings = [w.get('meaning', 'Unknown') for w in words]
         
+        # Seeded so the same level/word set always produces the same quiz
         import random
+        rng = random.Random(f"{level_id}:{lang}:{','.join(w.get('word', '') for w in words)}")
         
         for w in words:
             word_str = w.get('word', '')
@@ -276,9 +354,9 @@ def get_fallback_quiz(level_id, lang, words=None):
             if len(distractors) < 3:
                 distractors += ["Option A", "Option B", "Option C"] # Ensure enough
             
-            random.shuffle(distractors)
+            rng.shuffle(distractors)
             opts = [correct_meaning] + distractors[:3]
-            random.shuffle(opts)
+            rng.shuffle(opts)
             
             questions.append({
                 "type": "multiple_choice", 
@@ -158,8 +158,20 @@ class APIService:
             print(f"[API_SERVICE] Error fetching rhymes for {word}: {e}")
             return []
     
-    def get_word_suggestions(self, prefix: str, max_results: int = 10) -> List[str]:
-        """Get word suggestions based on prefix - for autocomplete"""
+    def get_word_suggestions(self, prefix: str, max_results: int = 10, language: str = 'en') -> List[str]:
+        """
+        Get word suggestions based on prefix - for autocomplete.
+        Served from the offline dictionary index; Datamuse is only asked for
+        English prefixes the offline dictionary has nothing for.
+        """
+        try:
+            from offline_dictionary import offline_dict
+            suggestions = offline_dict.prefix_search(prefix, language, limit=max_results)
+            if suggestions or language != 'en':
+                return suggestions
+        except Exception as e:
+            print(f"[API_SERVICE] Offline suggestions error for {prefix}: {e}")
+        
         if not self.is_online():
             return []
         
@@ -255,6 +267,7 @@ class APIService:
         """
         Get comprehensive word information combining multiple APIs
         Priority: Gemini API > Free Dictionary API > Offline Dictionary > Fallback
+        (only the offline dictionary when there is no connection)
         """
         result = {
             'word': word,
@@ -270,7 +283,7 @@ class APIService:
         }
         
         if not self.is_online():
-            return result
+            return self._offline_word_info(result)
         
         # Try Gemini API first (best for all languages)
         try:
@@ -302,18 +315,21 @@ class APIService:
                 result['source'] = 'dictionary_api'
                 return result
         
-        # Try offline dictionary for Spanish and Hindi
-        if language in ['es', 'hi']:
-            try:
-                from offline_dictionary import offline_dict
-                offline_result = offline_dict.get_definition(word, language)
-                if offline_result:
-                    result['definition'] = offline_result['definition']
-                    result['source'] = 'offline_dictionary'
-                    print(f"[API_SERVICE] Got meaning from offline dict for {word} ({language})")
-                    return result
-            except Exception as e:
-                print(f"[API_SERVICE] Offline dict error: {e}")
+        return self._offline_word_info(result)
+    
+    def _offline_word_info(self, result: Dict) -> Dict:
+        """Fill in a get_enhanced_word_info result from the offline dictionary, or a fallback message"""
+        word, language = result['word'], result['language']
+        try:
+            from offline_dictionary import offline_dict
+            offline_result = offline_dict.get_definition(word, language)
+            if offline_result:
+                result['definition'] = offline_result['definition']
+                result['source'] = 'offline_dictionary'
+                print(f"[API_SERVICE] Got meaning from offline dict for {word} ({language})")
+                return result
+        except Exception as e:
+            print(f"[API_SERVICE] Offline dict error: {e}")
         
         # Final fallback message
         fallback_messages = {
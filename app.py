@@ -1,8 +1,8 @@
-from flask import Flask, render_template, jsonify, request, redirect, session, url_for, flash
+from flask import Flask, render_template, jsonify, request, redirect, session, url_for, flash, Response, stream_with_context
+import json
 import os
-import transcriber
+import hashlib
 import threading
-import sqlite3
 import random
 from database_manager import db
 from adaptive_chatbot import AdaptiveChatbot
@@ -10,6 +10,11 @@ from word_validator import WordValidator
 from language_detector import OfflineLanguageDetector
 from conversation_engine import conversation_engine
 from api_service import api_service
+from session_store import session_store
+from transcriber_client import transcriber_client as transcriber
+from offline_vocab import offline_vocab
+from review_scheduler import review_scheduler
+import storage
 
 # Initialize Gemini Service
 try:
@@ -27,7 +32,6 @@ app.secret_key = os.environ.get("FLASK_SECRET_KEY", "super_secret_key_linguavoic
 chatbot = AdaptiveChatbot()
 word_validator = WordValidator()
 lang_detector = OfflineLanguageDetector()
-transcriber.start_transcriber()
 
 def get_current_user_id():
     return session.get("user_id")
@@ -35,6 +39,18 @@ def get_current_user_id():
 def is_logged_in():
     return "user_id" in session
 
+def get_store_id():
+    """Id of this browser session's server-side store (created on first use)"""
+    if "store_id" not in session:
+        session["store_id"] = session_store.new_session_id()
+    return session["store_id"]
+
+def set_level_words(level_id, words):
+    session_store.set(get_store_id(), f'level_{level_id}_words', words)
+
+def get_level_words(level_id):
+    return session_store.get(session.get("store_id"), f'level_{level_id}_words')
+
 # --- Routes: Auth ---
 @app.route("/login", methods=["GET", "POST"])
 def login():
@@ -66,24 +82,24 @@ def signup():
 
 @app.route("/logout")
 def logout():
+    session_store.clear(session.get("store_id"))
     session.clear()
     transcriber.set_active_user(None)
     return redirect("/login")
 
 @app.route("/health")
 def health_check():
-    health = {"status": "ok", "database": "unknown", "db_path": db.db_name}
+    health = {"status": "ok", "database": "unknown", "db_path": db.db_name, "storage": storage.store.backend.describe()}
     try:
-        conn = db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = [row[0] for row in cursor.fetchall()]
+        if storage.store.backend.dialect == 'sqlite':
+            health["tables"] = [row[0] for row in storage.store.query("SELECT name FROM sqlite_master WHERE type='table'")]
+        else:
+            storage.store.query_one("SELECT 1")
         health["database"] = "connected"
-        health["tables"] = tables
-        conn.close()
     except Exception as e:
         health["status"] = "error"
         health["database"] = f"error: {str(e)}"
+    health["transcriber"] = transcriber.status()
     return jsonify(health)
 
 # --- Routes: Main App ---
@@ -115,18 +131,8 @@ def tutor_page():
     user_name = session.get("user_name", "User")
     user_id = get_current_user_id()
     
-    # Get target language
-    conn = db.get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT target_language FROM users WHERE id=?", (user_id,))
-    row = cursor.fetchone()
-    target_language = row[0] if row and row[0] else 'es'
-    
-    # Get current level to fetch appropriate content
-    cursor.execute("SELECT level_id FROM user_completed_levels WHERE user_id=? AND passed=1", (user_id,))
-    completed = [r[0] for r in cursor.fetchall()]
-    current_level = max(completed) + 1 if completed else 1
-    conn.close()
+    target_language = storage.users.target_language(user_id, default='es')
+    current_level = storage.levels.current_level(user_id)
     
     return render_template("tutor.html", user_name=user_name, target_language=target_language, current_level=current_level)
 
@@ -137,18 +143,13 @@ def get_tutor_content():
     user_id = get_current_user_id()
     level_id = int(request.args.get('level', 1))
     
-    conn = db.get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT target_language FROM users WHERE id=?", (user_id,))
-    row = cursor.fetchone()
-    target_language = row[0] if row and row[0] else 'es'
-    conn.close()
+    target_language = storage.users.target_language(user_id, default='es')
     
     from level_generator import level_generator
     words = level_generator.generate_level_content(level_id, target_language)
     
-    # Store in session for quiz consistency if they switch to quiz mode in tutor
-    session[f'level_{level_id}_words'] = words
+    # Store server-side for quiz consistency if they switch to quiz mode in tutor
+    set_level_words(level_id, words)
     
     return jsonify({"words": words, "level": level_id})
 
@@ -163,33 +164,14 @@ def learning_path_page():
     user_name = session.get("user_name", "User")
     user_id = get_current_user_id()
     
-    # Fetch progress from DB
-    conn = db.get_connection()
-    cursor = conn.cursor()
-    
-    # Table creation moved to database_manager.py
-
-    
-    # Fetch completed levels
-    cursor.execute("SELECT level_id FROM user_completed_levels WHERE user_id=? AND passed=1", (user_id,))
-    completed_levels = [row[0] for row in cursor.fetchall()]
-    
-    # Fetch target language
-    cursor.execute("SELECT target_language FROM users WHERE id=?", (user_id,))
-    row = cursor.fetchone()
-    target_language = row[0] if row else None
+    completed_levels = storage.levels.completed(user_id)
+    target_language = storage.users.target_language(user_id)
     
     # If not set, check if we can infer from user_progress (legacy)
     if not target_language:
-        cursor.execute("SELECT language FROM user_progress WHERE user_id=? ORDER BY last_activity DESC LIMIT 1", (user_id,))
-        row = cursor.fetchone()
-        if row:
-             target_language = row[0]
-             # Backfill
-             cursor.execute("UPDATE users SET target_language=? WHERE id=?", (target_language, user_id))
-             conn.commit()
-
-    conn.close()
+        target_language = storage.progress.latest_language(user_id)
+        if target_language:
+            storage.users.set_target_language(user_id, target_language)  # Backfill
     
     # Determine current level (max completed + 1)
     current_level = max(completed_levels) + 1 if completed_levels else 1
@@ -207,15 +189,11 @@ def set_target_language():
         return jsonify({"error": "No language provided"}), 400
         
     user_id = get_current_user_id()
-    conn = db.get_connection()
     try:
-        conn.execute("UPDATE users SET target_language=? WHERE id=?", (lang, user_id))
-        conn.commit()
+        storage.users.set_target_language(user_id, lang)
     except Exception as e:
         print(f"[API] Error setting language: {e}")
         return jsonify({"error": str(e)}), 500
-    finally:
-        conn.close()
         
     return jsonify({"success": True})
 
@@ -226,19 +204,14 @@ def level_flashcards(level_id):
     user_id = get_current_user_id()
     
     # Get user's target language
-    conn = db.get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT target_language FROM users WHERE id=?", (user_id,))
-    row = cursor.fetchone()
-    target_language = row[0] if row and row[0] else 'es' # Default to Spanish
-    conn.close()
+    target_language = storage.users.target_language(user_id, default='es') # Default to Spanish
     
     # Generate words for this level
     from level_generator import level_generator
     words = level_generator.generate_level_content(level_id, target_language)
     
-    # Store words in session for quiz consistency
-    session[f'level_{level_id}_words'] = words
+    # Store words server-side for quiz consistency
+    set_level_words(level_id, words)
     
     print(f"[DEBUG] Level {level_id} words ({target_language}): {words}")
     
@@ -271,12 +244,7 @@ def notes_page():
     
     target_language = 'es'
     if user_id:
-        conn = db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT target_language FROM users WHERE id=?", (user_id,))
-        row = cursor.fetchone()
-        target_language = row[0] if row and row[0] else 'es'
-        conn.close()
+        target_language = storage.users.target_language(user_id, default='es')
     
     return render_template("notes.html", target_language=target_language, is_public=is_public)
 
@@ -305,16 +273,8 @@ def test_page():
     current_level = 1
     
     if user_id:
-        conn = db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT target_language FROM users WHERE id=?", (user_id,))
-        row = cursor.fetchone()
-        target_language = row[0] if row and row[0] else 'es'
-        
-        cursor.execute("SELECT level_id FROM user_completed_levels WHERE user_id=? AND passed=1", (user_id,))
-        completed = [r[0] for r in cursor.fetchall()]
-        current_level = max(completed) + 1 if completed else 1
-        conn.close()
+        target_language = storage.users.target_language(user_id, default='es')
+        current_level = storage.levels.current_level(user_id)
     
     return render_template("test.html", user_name=user_name, target_language=target_language, current_level=current_level, is_public=is_public)
 
@@ -357,17 +317,7 @@ def save_level_progress():
     passed = data.get('passed')
     
     try:
-        conn = db.get_connection()
-        cursor = conn.cursor()
-        
-        # Insert or replace execution
-        cursor.execute("""
-            INSERT OR REPLACE INTO user_completed_levels (user_id, level_id, xp_earned, score, passed)
-            VALUES (?, ?, ?, ?, ?)
-        """, (user_id, level_id, xp_earned, score, passed))
-        
-        conn.commit()
-        conn.close()
+        storage.levels.save(user_id, level_id, xp_earned, score, passed)
         
         if level_id == 100 and passed:
             return jsonify({"success": True, "certificate": True, "redirect": "/certificate"})
@@ -402,16 +352,8 @@ def update_all_meanings():
         return jsonify({"error": "Not logged in"}), 401
     
     try:
-        conn = sqlite3.connect('lingua_voice.db')
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT word, language, meaning 
-            FROM vocabulary 
-            WHERE user_name = ?
-        """, (session.get('user_name'),))
-        
-        words = cursor.fetchall()
+        user_id = get_current_user_id()
+        words = storage.vocabulary.entries(user_id)
         updated_count = 0
         
         for word, language, current_meaning in words:
@@ -423,32 +365,34 @@ def update_all_meanings():
             new_meaning = word_validator.get_word_meaning(word, language)
             
             if new_meaning:
-                cursor.execute("""
-                    UPDATE vocabulary 
-                    SET meaning = ? 
-                    WHERE user_name = ? AND word = ? AND language = ?
-                """, (new_meaning, session.get('user_name'), word, language))
+                storage.vocabulary.set_meaning(user_id, word, language, new_meaning)
                 updated_count += 1
                 print(f"[API] ✓ {word}: {new_meaning[:50]}...")
         
-        conn.commit()
-        conn.close()
-        
         return jsonify({"success": True, "updated": updated_count, "total": len(words)})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route("/api/get_transcripts")
-
 def get_transcripts():
+    """
+    Recent transcripts, newest first. Query params:
+      since_id  - only transcripts newer than this id (oldest first), for delta polling
+      before_id - page further back in history from this id
+      limit     - page size (default 50, max 200)
+    """
     user_id = get_current_user_id()
     if not user_id: return jsonify([])
     
-    conn = db.get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT timestamp, language, text, audio_file FROM transcripts WHERE user_id=? ORDER BY id DESC LIMIT 50", (user_id,))
-    data = [{"timestamp": r[0], "language": r[1], "text": r[2], "audio_file": r[3]} for r in cursor.fetchall()]
-    conn.close()
+    since_id = request.args.get('since_id', type=int)
+    before_id = request.args.get('before_id', type=int)
+    limit = max(1, min(request.args.get('limit', 50, type=int), 200))
+    
+    # Idle delta polls: the transcriber worker knows nothing newer was saved, skip the DB
+    if since_id is not None and not transcriber.has_newer(user_id, since_id):
+        return jsonify([])
+    
+    data = storage.transcripts.page(user_id, since_id=since_id, before_id=before_id, limit=limit)
     return jsonify(data)
 
 @app.route("/api/start_recording", methods=["POST"])
@@ -466,8 +410,10 @@ def start_recording():
         lang = data.get('language')
         if lang in ['en', 'es', 'hi']:
             transcriber.set_active_language(lang)
+    if data and 'multi_language' in data:
+        transcriber.set_multi_language(data.get('multi_language'))
             
-    return jsonify({"success": True})
+    return jsonify({"success": True, "multi_language": transcriber.multi_language_enabled})
 
 @app.route("/api/set_language", methods=["POST"])
 def set_language():
@@ -499,9 +445,7 @@ def save_manual_transcript():
         if not text:
             return jsonify({"error": "No text provided"}), 400
             
-        # Use existing logic
-        transcriber.set_active_user(user_id)
-        transcriber.save_transcript(text, language, audio_path="manual_entry")
+        transcriber.save_transcript(user_id, text, language, audio_path="manual_entry")
         
         return jsonify({"success": True})
     except Exception as e:
@@ -515,18 +459,8 @@ def get_live_transcripts():
     if not user_id: return jsonify([])
     
     try:
-        conn = db.get_connection()
-        cursor = conn.cursor()
         # Fetch transcripts from the last 10 seconds (allow some buffer)
-        cursor.execute("""
-            SELECT text, language, timestamp 
-            FROM transcripts 
-            WHERE user_id=? AND timestamp >= datetime('now', '-10 seconds', 'localtime')
-            ORDER BY timestamp ASC
-        """, (user_id,))
-        
-        data = [{"text": r[0], "language": r[1], "id": str(r[2])} for r in cursor.fetchall()]
-        conn.close()
+        data = storage.transcripts.recent(user_id, seconds=10)
         return jsonify({"transcripts": data})
     except Exception as e:
         print(f"[API] Error fetching live transcripts: {e}")
@@ -536,7 +470,7 @@ def get_live_transcripts():
 def get_stats():
     user_id = get_current_user_id()
     if not user_id: return jsonify({})
-    stats = chatbot.get_user_stats(user_id)
+    stats = chatbot.get_dashboard_stats(user_id)
     return jsonify({"stats": stats})
 
 @app.route("/api/validate_word_manual")
@@ -549,19 +483,51 @@ def validate_manual():
         return jsonify(res)
     return jsonify({"error": "Missing params"})
 
+def vocabulary_response(user_id):
+    """
+    Serve a user's words as a JSON list. Supports `limit` + `cursor` keyset
+    paging (next page cursor in the X-Next-Cursor header), `fields` projection,
+    `lang` filtering, and ETag revalidation against the user's vocabulary version.
+    """
+    version = word_validator.get_vocabulary_version(user_id)
+    query_hash = hashlib.md5(request.query_string).hexdigest()[:12]
+    etag = f"vocab-{user_id}-{version}-{query_hash}"
+    
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        fields = request.args.get('fields')
+        try:
+            limit = request.args.get('limit', type=int)
+            words, next_cursor = word_validator.get_user_words_page(
+                user_id,
+                language=request.args.get('lang'),
+                limit=max(1, min(limit, 500)) if limit is not None else None,
+                cursor=request.args.get('cursor'),
+                fields=fields.split(',') if fields else None
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        response = jsonify(words)
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+    
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
 @app.route("/api/get_my_spoken_words")
 def get_my_spoken_words():
     user_id = get_current_user_id()
     if not user_id: return jsonify([])
-    words = word_validator.get_user_words(user_id)
-    return jsonify(words)
+    return vocabulary_response(user_id)
 
 @app.route("/api/get_vocabulary_bank_full")
 def get_vocab_bank_full():
     user_id = get_current_user_id()
     if not user_id: return jsonify([])
-    words = word_validator.get_user_words(user_id)
-    return jsonify(words)
+    return vocabulary_response(user_id)
 
 @app.route("/api/get_oov_words")
 def get_oov_words_route():
@@ -569,6 +535,78 @@ def get_oov_words_route():
     if not user_id: return jsonify([])
     oov_words = chatbot.get_oov_words(user_id)
     return jsonify(oov_words)
+
+@app.route("/api/analytics/timeseries")
+def analytics_timeseries():
+    """Daily attempts, accuracy, mean response time and words learned (from rollups)"""
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Not logged in"}), 401
+    days = max(1, min(request.args.get("days", 30, type=int), 366))
+    series = chatbot.get_daily_stats(user_id, language=request.args.get("lang"), days=days)
+    return jsonify({"series": series})
+
+@app.route("/api/reviews/due")
+def get_due_reviews():
+    """Next vocabulary cards due for review (spaced repetition queue)"""
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Not logged in"}), 401
+    language = request.args.get("lang", "en")
+    limit = min(request.args.get("limit", 20, type=int), 200)
+    return jsonify({
+        "cards": review_scheduler.due_cards(user_id, language, limit=limit),
+        "due_count": review_scheduler.due_count(user_id, language)
+    })
+
+@app.route("/api/reviews", methods=["POST"])
+def submit_reviews():
+    """
+    Submit a batch of review answers:
+    {"language": "es", "reviews": [{"word": "hola", "is_correct": true, "response_time": 2.1}, ...]}
+    ('quality' 0-5 may be sent instead of is_correct/response_time).
+    """
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Not logged in"}), 401
+    data = request.get_json() or {}
+    reviews = data.get("reviews")
+    if not isinstance(reviews, list) or not reviews or not all(isinstance(r, dict) for r in reviews):
+        return jsonify({"error": "No reviews provided"}), 400
+    if len(reviews) > 1000:
+        return jsonify({"error": "Too many reviews in one batch (max 1000)"}), 400
+    
+    try:
+        result = chatbot.record_performance_batch(user_id, data.get("language", "en"), reviews,
+                                                  lesson_type=data.get("lesson_type", "review"))
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": f"Invalid review: {e}"}), 400
+    return jsonify({"success": True, **result})
+
+@app.route("/api/performance/batch", methods=["POST"])
+def record_performance_batch():
+    """
+    Ingest quiz/flashcard answers in one request:
+    {"language": "es", "events": [{"word": "hola", "lesson_type": "quiz", "is_correct": true,
+                                   "response_time": 2.1, "difficulty_level": "beginner"}, ...]}
+    Returns the updated review state, XP earned and the refreshed stats.
+    """
+    user_id = get_current_user_id()
+    if not user_id:
+        return jsonify({"error": "Not logged in"}), 401
+    data = request.get_json() or {}
+    events = data.get("events")
+    if not isinstance(events, list) or not events or not all(isinstance(e, dict) for e in events):
+        return jsonify({"error": "No events provided"}), 400
+    if len(events) > 1000:
+        return jsonify({"error": "Too many events in one batch (max 1000)"}), 400
+    
+    try:
+        result = chatbot.record_performance_batch(user_id, data.get("language", "en"), events,
+                                                  lesson_type=data.get("lesson_type", "quiz"))
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": f"Invalid event: {e}"}), 400
+    return jsonify({"success": True, **result})
 @app.route("/validate_word")
 def validate_word_route():
     user_id = get_current_user_id()
@@ -595,21 +633,12 @@ def auto_gen_vocab():
     lang = request.args.get('lang', 'en')
     
     # Get user's existing vocabulary to avoid duplicates
-    conn = db.get_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT word FROM vocabulary WHERE user_id=?", (user_id,))
-    existing_words = set(row[0].lower() for row in cursor.fetchall())
-    conn.close()
-    
-    # Load offline vocabulary for the language
-    offline_vocab = chatbot.load_offline_vocab(lang)
-    if not offline_vocab:
-        return jsonify([])
+    existing_words = set(w.lower() for w in storage.vocabulary.words(user_id))
     
-    # Collect all words from all levels
-    all_words = []
-    for level, words in offline_vocab.items():
-        all_words.extend(words)
+    # All offline vocabulary words for the language (shared index, loaded once)
+    all_words = offline_vocab.all_words(lang)
+    if not all_words:
+        return jsonify([])
     
     # Filter out words user already has
     available_words = [w for w in all_words if w.lower() not in existing_words]
@@ -660,6 +689,33 @@ def ai_tutor_chat():
     except Exception as e:
         print(f"[API] AI Tutor error: {e}")
         return jsonify({"error": str(e)}), 500
+@app.route("/api/ai_tutor_chat/stream", methods=["POST"])
+def ai_tutor_chat_stream():
+    """AI Tutor chat endpoint that streams the reply as Server-Sent Events"""
+    if not is_logged_in():
+        return jsonify({"error": "Not logged in"}), 401
+    
+    data = request.get_json() or {}
+    message = data.get('message')
+    base_language = data.get('base_language')
+    target_language = data.get('target_language')
+    history = data.get('history', [])
+    
+    from ai_tutor_service import stream_ai_tutor_response
+    
+    def generate():
+        reply = ""
+        for chunk in stream_ai_tutor_response(message, base_language, target_language, history):
+            reply += chunk
+            yield f"data: {json.dumps({'chunk': chunk})}\n\n"
+        yield f"event: done\ndata: {json.dumps({'reply': reply.strip()})}\n\n"
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.route("/api/ai_voice_phrase", methods=["POST"])
 def ai_voice_phrase():
     """Get a practice phrase from AI"""
@@ -710,24 +766,19 @@ def get_level_quiz():
         user_id = get_current_user_id()
         
         # Get target language
-        conn = db.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT target_language FROM users WHERE id=?", (user_id,))
-        row = cursor.fetchone()
-        target_language = row[0] if row and row[0] else 'es'
-        conn.close()
+        target_language = storage.users.target_language(user_id, default='es')
         
         from level_generator import level_generator
-        from ai_tutor_service import generate_quiz_questions
+        from ai_tutor_service import get_level_quiz_questions
         
-        # Try to get words from session to ensure quiz matches flashcards
-        words = session.get(f'level_{level_id}_words')
+        # Try to get this session's level words to ensure quiz matches flashcards
+        words = get_level_words(level_id)
         
         # Get level metadata
         metadata = level_generator.get_level_metadata(level_id)
         
-        # Generate questions using Gemini
-        questions = generate_quiz_questions(level_id, metadata['tier'], target_language, words)
+        # Generate questions using Gemini (cached per level word set)
+        questions = get_level_quiz_questions(level_id, metadata['tier'], target_language, words)
         
         return jsonify({"questions": questions})
     except Exception as e:
@@ -777,6 +828,21 @@ def get_similar_words():
     similar = api_service.get_similar_words(word, max_results=10)
     return jsonify({"similar_words": similar})
 
+@app.route("/api/word_suggestions")
+def word_suggestions():
+    """Autocomplete words from the offline dictionary"""
+    from api_service import api_service
+    
+    prefix = request.args.get("prefix", "")
+    language = request.args.get("lang", "en")
+    limit = min(request.args.get("limit", 10, type=int), 50)
+    
+    if not prefix:
+        return jsonify({"suggestions": []})
+    
+    suggestions = api_service.get_word_suggestions(prefix, max_results=limit, language=language)
+    return jsonify({"suggestions": suggestions})
+
 @app.route("/api/chat_response", methods=["POST"])
 def chat_response():
     """Get AI response for the Tutor"""
@@ -791,10 +857,17 @@ def chat_response():
     return jsonify(result)
 
 # --- Audio Serving ---
-from flask import send_from_directory
+from flask import send_from_directory, abort
+from clip_store import clip_store
 @app.route('/audio_clips/<path:filename>')
 def serve_audio(filename):
-    return send_from_directory('audio_clips', filename)
+    if filename.endswith('.lvc'):
+        # Built-in codec clips are decoded to WAV for the browser
+        try:
+            return Response(clip_store.read_wav(filename), mimetype='audio/wav')
+        except (OSError, ValueError):
+            abort(404)
+    return send_from_directory(clip_store.root, filename)
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000, debug=True, use_reloader=True)
@@ -0,0 +1,222 @@
+"""
+Audio Buffers for the LinguaVoice transcriber
+Preallocated structures for the capture path: a bounded block queue filled by
+the sounddevice callback, and a ring buffer holding the most recent audio that
+the VAD, clip saver and recognizer read through memoryview slices.
+"""
+import threading
+from bisect import bisect_right
+
+
+class BlockQueue:
+    """
+    Fixed number of preallocated block slots, filled by the audio callback.
+
+    When the consumer falls behind and every slot is full, `policy` decides
+    what is lost: 'drop_oldest' overwrites the oldest unread block,
+    'drop_newest' discards the incoming one. Either way memory stays bounded
+    and the drop is counted.
+    """
+
+    def __init__(self, block_bytes, slots=32, policy='drop_oldest'):
+        if policy not in ('drop_oldest', 'drop_newest'):
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        self.block_bytes = block_bytes
+        self.policy = policy
+        self.slots = [bytearray(block_bytes) for _ in range(slots)]
+        self.lengths = [0] * slots
+        self.cond = threading.Condition()
+        self.reset()
+
+    def reset(self):
+        with self.cond:
+            self.head = 0
+            self.count = 0
+            self.closed = False
+            self.dropped_blocks = 0
+            self.max_depth = 0
+
+    @property
+    def capacity(self):
+        # One slot is always left for the block the consumer is working on
+        return len(self.slots) - 1
+
+    def put(self, data):
+        """Copy a block into the next free slot. Returns False if it was dropped."""
+        n = len(data)
+        if n > self.block_bytes:
+            raise ValueError(f"Block of {n} bytes exceeds slot size {self.block_bytes}")
+
+        with self.cond:
+            if self.count >= self.capacity:
+                self.dropped_blocks += 1
+                if self.policy == 'drop_newest':
+                    return False
+                dropped = self.head
+                self.head = (self.head + 1) % len(self.slots)
+                self.count -= 1
+                # The next write index is the spare slot, whose buffer the
+                # consumer may still be reading: reuse the dropped block's
+                # buffer there, and the consumer's buffer becomes the spare
+                index = (self.head + self.count) % len(self.slots)
+                self.slots[index], self.slots[dropped] = self.slots[dropped], self.slots[index]
+
+            index = (self.head + self.count) % len(self.slots)
+            memoryview(self.slots[index])[:n] = data
+            self.lengths[index] = n
+            self.count += 1
+            self.max_depth = max(self.max_depth, self.count)
+            self.cond.notify()
+            return True
+
+    def get(self, timeout=None):
+        """
+        Return the next block as a memoryview, or None if closed/timed out.
+        The view is only valid until the following get() call.
+        """
+        with self.cond:
+            if not self.cond.wait_for(lambda: self.count > 0 or self.closed, timeout):
+                return None
+            if self.count == 0:
+                return None
+            index = self.head
+            self.head = (self.head + 1) % len(self.slots)
+            self.count -= 1
+            return memoryview(self.slots[index])[:self.lengths[index]]
+
+    def close(self):
+        """Wake up the consumer; get() returns None from now on once drained"""
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+    def stats(self):
+        with self.cond:
+            return {
+                'depth': self.count,
+                'max_depth': self.max_depth,
+                'capacity': self.capacity,
+                'dropped_blocks': self.dropped_blocks,
+                'policy': self.policy
+            }
+
+
+class AudioRingBuffer:
+    """
+    Preallocated ring of the most recent `capacity` bytes of audio.
+
+    Positions are absolute byte offsets since the buffer was created, so
+    readers can keep references like "the chunk starting at byte N" and
+    check whether it is still retained.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.buffer = bytearray(capacity)
+        self.view = memoryview(self.buffer)
+        self.write_pos = 0
+
+    @property
+    def start_pos(self):
+        """Oldest absolute position still held in the buffer"""
+        return max(0, self.write_pos - self.capacity)
+
+    def append(self, data):
+        n = len(data)
+        if n > self.capacity:
+            data = memoryview(data)[n - self.capacity:]
+            self.write_pos += n - self.capacity
+            n = self.capacity
+
+        offset = self.write_pos % self.capacity
+        first = min(n, self.capacity - offset)
+        self.view[offset:offset + first] = data[:first]
+        if first < n:
+            self.view[:n - first] = data[first:]
+        self.write_pos += n
+
+    def slice(self, start, end):
+        """
+        Audio between absolute positions [start, end). Returns a zero-copy
+        memoryview when the range is contiguous in the ring, otherwise bytes.
+        Raises ValueError if the range has already been overwritten.
+        """
+        if start < self.start_pos or end > self.write_pos or start > end:
+            raise ValueError(f"Range [{start}, {end}) not in buffer [{self.start_pos}, {self.write_pos})")
+        a = start % self.capacity
+        b = a + (end - start)
+        if b <= self.capacity:
+            return self.view[a:b]
+        return bytes(self.view[a:]) + bytes(self.view[:b - self.capacity])
+
+
+class RecognizerClock:
+    """
+    Maps a recognizer's stream time to absolute ring positions.
+
+    Vosk word timings count seconds of audio the recognizer has been fed.
+    Feeding pauses while another language is active, so every contiguous run
+    of fed audio is recorded as a (fed_offset, ring_pos) segment.
+    """
+
+    def __init__(self, bytes_per_sec, max_segments=256):
+        self.bytes_per_sec = bytes_per_sec
+        self.max_segments = max_segments
+        self.fed = 0
+        self.offsets = []    # fed byte offset where each segment starts
+        self.positions = []  # ring position of that same byte
+
+    def feed(self, ring_pos, n):
+        """Record that the n bytes at ring_pos were passed to the recognizer"""
+        if not self.offsets or self.positions[-1] + (self.fed - self.offsets[-1]) != ring_pos:
+            self.offsets.append(self.fed)
+            self.positions.append(ring_pos)
+            if len(self.offsets) > self.max_segments:
+                del self.offsets[0], self.positions[0]
+        self.fed += n
+
+    def position(self, seconds):
+        """Absolute ring position of a recognizer timestamp (sample aligned)"""
+        offset = int(seconds * self.bytes_per_sec) & ~1
+        i = bisect_right(self.offsets, offset) - 1
+        if i < 0:
+            raise ValueError(f"Stream time {seconds:.2f}s is older than the tracked segments")
+        return self.positions[i] + offset - self.offsets[i]
+
+
+class SpeechSegmenter:
+    """
+    Energy-gated speech segmentation over absolute ring positions.
+
+    push() is called once per captured block with its RMS energy and returns
+    (start, end) when a segment closes: after `hangover` bytes of silence, or
+    once it reaches `max_bytes`. Silence outside segments costs nothing.
+    """
+
+    def __init__(self, threshold, pre_roll, hangover, max_bytes):
+        self.threshold = threshold
+        self.pre_roll = pre_roll
+        self.hangover = hangover
+        self.max_bytes = max_bytes
+        self.reset()
+
+    def reset(self):
+        self.start = None
+        self.silence = 0
+
+    def push(self, pos, n, rms):
+        end = pos + n
+        if rms >= self.threshold:
+            if self.start is None:
+                self.start = max(pos - self.pre_roll, 0)
+            self.silence = 0
+        elif self.start is None:
+            return None
+        else:
+            self.silence += n
+
+        if self.silence >= self.hangover or end - self.start >= self.max_bytes:
+            start = self.start
+            self.reset()
+            return start, end
+        return None
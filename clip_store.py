@@ -0,0 +1,190 @@
+"""
+Audio Clip Store for LinguaVoice
+Saves recorded clips compressed (FLAC when soundfile is installed, otherwise a
+small built-in lossless codec), sharded by user and date with collision-free
+names, and enforces age/size retention with a background sweeper.
+"""
+import io
+import os
+import struct
+import threading
+import time
+import uuid
+import wave
+import zlib
+from array import array
+from config import CLIP_MAX_AGE_DAYS, CLIP_MAX_TOTAL_MB, CLIP_SWEEP_INTERVAL
+
+try:
+    import numpy as np
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+SAMPLE_RATE = 16000
+
+# Built-in codec: magic, sample rate, sample count, then zlib-compressed
+# first-order sample deltas split into low/high byte planes
+LVC_MAGIC = b'LVC1'
+LVC_HEADER = struct.Struct('<4sII')
+
+
+def encode_lvc(pcm: bytes, sample_rate: int = SAMPLE_RATE) -> bytes:
+    """Losslessly compress 16-bit mono PCM"""
+    samples = array('h')
+    samples.frombytes(pcm[:len(pcm) - len(pcm) % 2])
+    low = bytearray(len(samples))
+    high = bytearray(len(samples))
+    prev = 0
+    for i, s in enumerate(samples):
+        d = (s - prev) & 0xFFFF
+        low[i] = d & 0xFF
+        high[i] = d >> 8
+        prev = s
+    header = LVC_HEADER.pack(LVC_MAGIC, sample_rate, len(samples))
+    return header + zlib.compress(bytes(low) + bytes(high), 6)
+
+
+def decode_lvc(data: bytes):
+    """Return (pcm_bytes, sample_rate) from an encode_lvc payload"""
+    magic, sample_rate, count = LVC_HEADER.unpack_from(data)
+    if magic != LVC_MAGIC:
+        raise ValueError("Not an LVC clip")
+    planes = zlib.decompress(data[LVC_HEADER.size:])
+    low, high = planes[:count], planes[count:]
+    samples = array('h', bytes(2 * count))
+    prev = 0
+    for i in range(count):
+        prev = (prev + (low[i] | (high[i] << 8))) & 0xFFFF
+        samples[i] = prev - 0x10000 if prev & 0x8000 else prev
+    return samples.tobytes(), sample_rate
+
+
+def pcm_to_wav(pcm: bytes, sample_rate: int = SAMPLE_RATE) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm)
+    return buf.getvalue()
+
+
+class ClipStore:
+    """Compressed, sharded audio clip storage with retention"""
+
+    def __init__(self, root="audio_clips", max_age_days=30, max_total_mb=1024, sweep_interval=3600):
+        self.root = root
+        self.max_age_seconds = max_age_days * 86400
+        self.max_total_bytes = max_total_mb * 1024 * 1024
+        self.sweep_interval = sweep_interval
+        self.extension = '.flac' if sf is not None else '.lvc'
+        self.on_evict = None  # Optional callback(list_of_paths) after clips are deleted
+        self.sweeper_thread = None
+        self.stop_event = threading.Event()
+        os.makedirs(self.root, exist_ok=True)
+
+    def save(self, pcm: bytes, user_id=None, lang="rec", sample_rate: int = SAMPLE_RATE) -> str:
+        """Encode and store a clip; returns its path (relative, '/'-separated)"""
+        day = time.strftime("%Y%m%d")
+        shard = os.path.join(self.root, str(user_id) if user_id is not None else "anon", day)
+        os.makedirs(shard, exist_ok=True)
+
+        filename = f"{lang}_{time.strftime('%H%M%S')}_{uuid.uuid4().hex[:12]}{self.extension}"
+        filepath = os.path.join(shard, filename)
+        tmp_path = filepath + ".tmp"
+
+        if self.extension == '.flac':
+            samples = np.frombuffer(pcm, dtype='<i2')
+            sf.write(tmp_path, samples, sample_rate, format='FLAC', subtype='PCM_16')
+        else:
+            with open(tmp_path, "wb") as f:
+                f.write(encode_lvc(pcm, sample_rate))
+        os.replace(tmp_path, filepath)
+
+        return filepath.replace(os.sep, '/')
+
+    def resolve(self, relative_path: str) -> str:
+        """Absolute file path for a path under the store root (rejects traversal)"""
+        root = os.path.abspath(self.root)
+        path = os.path.abspath(os.path.join(root, relative_path))
+        if not path.startswith(root + os.sep):
+            raise ValueError("Path outside clip store")
+        return path
+
+    def read_wav(self, relative_path: str) -> bytes:
+        """Decode a built-in codec clip to WAV bytes for playback"""
+        with open(self.resolve(relative_path), "rb") as f:
+            pcm, sample_rate = decode_lvc(f.read())
+        return pcm_to_wav(pcm, sample_rate)
+
+    # --- Retention ---
+
+    def sweep(self):
+        """Delete clips older than the max age, then oldest clips until under the size cap"""
+        now = time.time()
+        clips = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                clips.append((st.st_mtime, st.st_size, path))
+
+        clips.sort()
+        total = sum(size for _, size, _ in clips)
+        removed = []
+        for mtime, size, path in clips:
+            if now - mtime <= self.max_age_seconds and total <= self.max_total_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed.append(path.replace(os.sep, '/'))
+
+        self._remove_empty_dirs()
+        if removed:
+            print(f"[CLIP_STORE] Retention removed {len(removed)} clips ({total / 1048576:.1f} MB kept)", flush=True)
+            if self.on_evict:
+                try:
+                    self.on_evict(removed)
+                except Exception as e:
+                    print(f"[CLIP_STORE] Evict callback error: {e}", flush=True)
+        return removed
+
+    def _remove_empty_dirs(self):
+        for dirpath, _, _ in os.walk(self.root, topdown=False):
+            if dirpath != self.root and not os.listdir(dirpath):
+                try:
+                    os.rmdir(dirpath)
+                except OSError:
+                    pass
+
+    def _sweep_loop(self):
+        while not self.stop_event.wait(self.sweep_interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"[CLIP_STORE] Sweep error: {e}", flush=True)
+
+    def start_sweeper(self):
+        if self.sweeper_thread and self.sweeper_thread.is_alive():
+            return
+        self.stop_event.clear()
+        self.sweeper_thread = threading.Thread(target=self._sweep_loop, daemon=True)
+        self.sweeper_thread.start()
+
+    def stop_sweeper(self):
+        self.stop_event.set()
+
+
+# Global instance
+clip_store = ClipStore(
+    max_age_days=CLIP_MAX_AGE_DAYS,
+    max_total_mb=CLIP_MAX_TOTAL_MB,
+    sweep_interval=CLIP_SWEEP_INTERVAL
+)
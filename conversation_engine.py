@@ -4,6 +4,16 @@ Handles rule-based chat interactions, grammar checking, and language practice lo
 """
 import random
 from api_service import api_service
+from intent_matcher import IntentMatcher
+
+# Pattern category -> response key, in priority order (first match wins)
+INTENT_RESPONSES = [
+    ('greetings', 'greeting'),
+    ('how_are_you', 'how_are_you'),
+    ('introductions', 'intro'),
+    ('help', 'help'),
+    ('goodbye', 'goodbye'),
+]
 
 class ConversationEngine:
     def __init__(self):
@@ -58,6 +68,19 @@ class ConversationEngine:
                 'fallback': ["Yeh dilchasp hai! Aur batayein.", "Samjha. Kya aap vistār mein bata sakte hain?", "Bahut badhiya! Ise kisi aur tarah se kahne ki koshish karein.", "Main sun raha hoon."]
             }
         }
+        
+        # Compile one intent matcher per language up front
+        self.matchers = {
+            lang: IntentMatcher((category, lang_patterns.get(category, [])) for category, _ in INTENT_RESPONSES)
+            for lang, lang_patterns in self.patterns.items()
+        }
+    
+    def add_patterns(self, language: str, category: str, phrases):
+        """Register extra phrases for an intent category in one language"""
+        self.patterns.setdefault(language, {}).setdefault(category, []).extend(phrases)
+        if language not in self.matchers:
+            self.matchers[language] = IntentMatcher()
+        self.matchers[language].add_intent(category, phrases)
 
     def get_response(self, user_text: str, language: str = 'en') -> dict:
         """
@@ -85,23 +108,13 @@ class ConversationEngine:
                 }
 
         # 2. Determine Intent & Response
-        text_lower = user_text.lower()
-        response_text = ""
-        
-        lang_patterns = self.patterns[language]
-        lang_responses = self.responses[language]
+        # Languages registered only through add_patterns answer from the English table
+        lang_responses = self.responses.get(language, self.responses['en'])
+        intent = self.matchers[language].match(user_text)
+        response_key = dict(INTENT_RESPONSES).get(intent, intent)
         
-        # Check patterns
-        if any(p in text_lower for p in lang_patterns.get('greetings', [])):
-            response_text = random.choice(lang_responses['greeting'])
-        elif any(p in text_lower for p in lang_patterns.get('how_are_you', [])):
-            response_text = random.choice(lang_responses['how_are_you'])
-        elif any(p in text_lower for p in lang_patterns.get('introductions', [])):
-            response_text = random.choice(lang_responses['intro'])
-        elif any(p in text_lower for p in lang_patterns.get('help', [])):
-            response_text = random.choice(lang_responses['help'])
-        elif any(p in text_lower for p in lang_patterns.get('goodbye', [])):
-            response_text = random.choice(lang_responses['goodbye'])
+        if response_key in lang_responses:
+            response_text = random.choice(lang_responses[response_key])
         else:
             # Fallback for general conversation
             response_text = random.choice(lang_responses['fallback'])
@@ -42,9 +42,18 @@ class DatabaseManager:
                 language TEXT,
                 text TEXT,
                 audio_file TEXT,
+                audio_start_ms INTEGER,
+                audio_end_ms INTEGER,
                 FOREIGN KEY (user_id) REFERENCES users (id)
             )
         """)
+        # Utterance span on the capture timeline (ms of audio captured since the
+        # transcriber started, i.e. ring buffer positions) of the saved clip
+        self._ensure_column(cursor, "transcripts", "audio_start_ms", "INTEGER")
+        self._ensure_column(cursor, "transcripts", "audio_end_ms", "INTEGER")
+
+        # Delta sync / history paging of a user's transcripts
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_transcripts_user_id ON transcripts (user_id, id)")
 
         # 3. Vocabulary / Words Table (Consolidates validated_words & user_vocabulary)
         cursor.execute("""
@@ -62,10 +71,23 @@ class DatabaseManager:
                 source_context TEXT,
                 correct_attempts INTEGER DEFAULT 0,
                 incorrect_attempts INTEGER DEFAULT 0,
+                ease_factor REAL DEFAULT 2.5,
+                interval_days REAL DEFAULT 0,
+                repetitions INTEGER DEFAULT 0,
+                lapses INTEGER DEFAULT 0,
+                due_at TEXT,
                 FOREIGN KEY (user_id) REFERENCES users (id),
                 UNIQUE(user_id, word, language)
             )
         """)
+        # SM-2 review state (see review_scheduler.py); new words are due immediately
+        self._ensure_column(cursor, "vocabulary", "ease_factor", "REAL DEFAULT 2.5")
+        self._ensure_column(cursor, "vocabulary", "interval_days", "REAL DEFAULT 0")
+        self._ensure_column(cursor, "vocabulary", "repetitions", "INTEGER DEFAULT 0")
+        self._ensure_column(cursor, "vocabulary", "lapses", "INTEGER DEFAULT 0")
+        self._ensure_column(cursor, "vocabulary", "due_at", "TEXT")
+        cursor.execute("UPDATE vocabulary SET due_at=COALESCE(first_seen, CURRENT_TIMESTAMP) WHERE due_at IS NULL")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_vocabulary_due ON vocabulary (user_id, language, due_at)")
 
     # ... (existing imports will be handled by context if I don't touch them, but since I need 'json', checking the top is better. The tool replaces blocks by line numbers)
 
@@ -156,6 +178,85 @@ class DatabaseManager:
             )
         """)
         
+        # 9. Server-side session values (large blobs kept out of the cookie session)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS session_blobs (
+                session_id TEXT,
+                name TEXT,
+                data TEXT,
+                updated_at REAL,
+                PRIMARY KEY (session_id, name)
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_session_blobs_updated ON session_blobs (updated_at)")
+        
+        # 10. Per-user vocabulary version, bumped by triggers on every vocabulary
+        # write so API clients can revalidate (ETag) without re-reading rows
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS vocabulary_versions (
+                user_id INTEGER PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        for event, row in (('INSERT', 'NEW'), ('UPDATE', 'NEW'), ('DELETE', 'OLD')):
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_vocabulary_version_{event.lower()}
+                AFTER {event} ON vocabulary
+                BEGIN
+                    INSERT INTO vocabulary_versions (user_id, version) VALUES ({row}.user_id, 1)
+                    ON CONFLICT(user_id) DO UPDATE SET version = version + 1;
+                END
+            """)
+        
+        # Keyset pagination over a user's words, most recently practiced first
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_vocabulary_user_recent
+            ON vocabulary (user_id, COALESCE(last_practiced, ''), id)
+        """)
+        
+        # 11. Materialized per-user/language stats for dashboard polling. Kept up
+        # to date by triggers, i.e. inside the same transaction as the write.
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='user_stats'")
+        stats_is_new = cursor.fetchone() is None
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS user_stats (
+                user_id INTEGER,
+                language TEXT,
+                total_xp INTEGER DEFAULT 0,
+                current_level TEXT DEFAULT 'beginner',
+                streak_days INTEGER DEFAULT 0,
+                vocabulary_count INTEGER DEFAULT 0,
+                oov_count INTEGER DEFAULT 0,
+                transcript_count INTEGER DEFAULT 0,
+                PRIMARY KEY (user_id, language)
+            )
+        """)
+        self._create_stats_triggers(cursor)
+        if stats_is_new:
+            self._backfill_user_stats(cursor)
+        
+        # 12. Daily per-user/language rollups for analytics time series. Sums
+        # rather than averages, so days combine into any range; maintained by
+        # triggers on performance_analytics and vocabulary inserts.
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='daily_stats'")
+        daily_is_new = cursor.fetchone() is None
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS daily_stats (
+                user_id INTEGER NOT NULL,
+                language TEXT NOT NULL,
+                day TEXT NOT NULL,
+                attempts INTEGER DEFAULT 0,
+                correct INTEGER DEFAULT 0,
+                response_time_total REAL DEFAULT 0,
+                response_time_count INTEGER DEFAULT 0,
+                words_learned INTEGER DEFAULT 0,
+                PRIMARY KEY (user_id, language, day)
+            ) WITHOUT ROWID
+        """)
+        self._create_daily_stats_triggers(cursor)
+        if daily_is_new:
+            self._backfill_daily_stats(cursor)
+        
         # Populate initial lessons if empty
         cursor.execute("SELECT COUNT(*) FROM lessons")
         if cursor.fetchone()[0] == 0:
@@ -196,51 +297,138 @@ class DatabaseManager:
         conn.commit()
         conn.close()
 
+    def _ensure_column(self, cursor, table, column, decl):
+        """Add a column to a table created by an older version of the schema"""
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in [row[1] for row in cursor.fetchall()]:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+    def _create_stats_triggers(self, cursor):
+        """Triggers that keep user_stats counters in step with their source tables"""
+        def bump(row, column, delta):
+            return f"""
+                INSERT INTO user_stats (user_id, language, {column}) VALUES ({row}.user_id, {row}.language, {max(delta, 0)})
+                ON CONFLICT(user_id, language) DO UPDATE SET {column} = {column} + ({delta});
+            """
+        
+        counters = [('vocabulary', 'vocabulary_count'), ('oov_words', 'oov_count'), ('transcripts', 'transcript_count')]
+        for table, column in counters:
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_stats_insert AFTER INSERT ON {table}
+                WHEN NEW.user_id IS NOT NULL
+                BEGIN {bump('NEW', column, 1)} END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_stats_delete AFTER DELETE ON {table}
+                WHEN OLD.user_id IS NOT NULL
+                BEGIN {bump('OLD', column, -1)} END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_stats_move AFTER UPDATE OF user_id, language ON {table}
+                WHEN NEW.user_id IS NOT NULL AND OLD.user_id IS NOT NULL
+                BEGIN {bump('OLD', column, -1)} {bump('NEW', column, 1)} END
+            """)
+        
+        for event in ('INSERT', 'UPDATE'):
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_user_progress_stats_{event.lower()} AFTER {event} ON user_progress
+                WHEN NEW.user_id IS NOT NULL
+                BEGIN
+                    INSERT INTO user_stats (user_id, language, total_xp, current_level, streak_days)
+                    VALUES (NEW.user_id, NEW.language, NEW.total_xp, NEW.current_level, NEW.streak_days)
+                    ON CONFLICT(user_id, language) DO UPDATE SET
+                        total_xp = excluded.total_xp,
+                        current_level = excluded.current_level,
+                        streak_days = excluded.streak_days;
+                END
+            """)
+        # Progress reset (e.g. clear_all_adaptive_data): back to a fresh learner
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_user_progress_stats_delete AFTER DELETE ON user_progress
+            WHEN OLD.user_id IS NOT NULL
+            BEGIN
+                UPDATE user_stats SET total_xp = 0, current_level = 'beginner', streak_days = 0
+                WHERE user_id = OLD.user_id AND language = OLD.language;
+            END
+        """)
+
+    def _backfill_user_stats(self, cursor):
+        """Populate user_stats from existing rows (run once when the table is created)"""
+        for table, column in [('vocabulary', 'vocabulary_count'), ('oov_words', 'oov_count'), ('transcripts', 'transcript_count')]:
+            cursor.execute(f"""
+                INSERT INTO user_stats (user_id, language, {column})
+                SELECT user_id, language, COUNT(*) FROM {table}
+                WHERE user_id IS NOT NULL GROUP BY user_id, language
+                ON CONFLICT(user_id, language) DO UPDATE SET {column} = excluded.{column}
+            """)
+        cursor.execute("""
+            INSERT INTO user_stats (user_id, language, total_xp, current_level, streak_days)
+            SELECT user_id, language, total_xp, current_level, streak_days FROM user_progress
+            WHERE user_id IS NOT NULL
+            ON CONFLICT(user_id, language) DO UPDATE SET
+                total_xp = excluded.total_xp,
+                current_level = excluded.current_level,
+                streak_days = excluded.streak_days
+        """)
+
+    def _create_daily_stats_triggers(self, cursor):
+        """Triggers that fold each answer and each new word into its day's daily_stats row"""
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_performance_daily_stats AFTER INSERT ON performance_analytics
+            WHEN NEW.user_id IS NOT NULL AND NEW.language IS NOT NULL
+            BEGIN
+                INSERT INTO daily_stats (user_id, language, day, attempts, correct, response_time_total, response_time_count)
+                VALUES (NEW.user_id, NEW.language, COALESCE(date(NEW.timestamp), date('now', 'localtime')), 1, COALESCE(NEW.is_correct, 0) != 0,
+                        COALESCE(NEW.response_time, 0), NEW.response_time IS NOT NULL)
+                ON CONFLICT(user_id, language, day) DO UPDATE SET
+                    attempts = attempts + 1,
+                    correct = correct + excluded.correct,
+                    response_time_total = response_time_total + excluded.response_time_total,
+                    response_time_count = response_time_count + excluded.response_time_count;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_vocabulary_daily_stats AFTER INSERT ON vocabulary
+            WHEN NEW.user_id IS NOT NULL AND NEW.language IS NOT NULL
+            BEGIN
+                INSERT INTO daily_stats (user_id, language, day, words_learned)
+                VALUES (NEW.user_id, NEW.language, COALESCE(date(NEW.first_seen), date('now', 'localtime')), 1)
+                ON CONFLICT(user_id, language, day) DO UPDATE SET words_learned = words_learned + 1;
+            END
+        """)
+
+    def _backfill_daily_stats(self, cursor):
+        """Populate daily_stats from the existing raw log (run once when the table is created)"""
+        cursor.execute("""
+            INSERT INTO daily_stats (user_id, language, day, attempts, correct, response_time_total, response_time_count)
+            SELECT user_id, language, date(timestamp), COUNT(*), SUM(COALESCE(is_correct, 0) != 0),
+                   COALESCE(SUM(response_time), 0), COUNT(response_time)
+            FROM performance_analytics
+            WHERE user_id IS NOT NULL AND language IS NOT NULL AND date(timestamp) IS NOT NULL
+            GROUP BY user_id, language, date(timestamp)
+        """)
+        cursor.execute("""
+            INSERT INTO daily_stats (user_id, language, day, words_learned)
+            SELECT user_id, language, date(first_seen), COUNT(*) FROM vocabulary
+            WHERE user_id IS NOT NULL AND language IS NOT NULL AND date(first_seen) IS NOT NULL
+            GROUP BY user_id, language, date(first_seen)
+            ON CONFLICT(user_id, language, day) DO UPDATE SET words_learned = excluded.words_learned
+        """)
+
     # --- User Management Methods ---
     def register_user(self, email, password, name, target_language="es"):
-        conn = self.get_connection()
-        try:
-            password_hash = generate_password_hash(password)
-            conn.execute("INSERT INTO users (email, password_hash, name, target_language) VALUES (?, ?, ?, ?)", 
-                         (email, password_hash, name, target_language))
-            conn.commit()
-            return True
-        except sqlite3.IntegrityError:
-            return False
-        finally:
-            conn.close()
+        from storage import users
+        return users.create(email, generate_password_hash(password), name, target_language) is not None
 
     def login_user(self, email, password):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        # Add target_language to selection
-        try:
-            cursor.execute("SELECT id, password_hash, name, target_language FROM users WHERE email=?", (email,))
-        except:
-            # Fallback if column doesn't exist yet (migration)
-            cursor.execute("SELECT id, password_hash, name FROM users WHERE email=?", (email,))
-            
-        user = cursor.fetchone()
-        conn.close()
-        
-        if user and check_password_hash(user[1], password):
-            lang = user[3] if len(user) > 3 else None
-            return {"id": user[0], "name": user[2], "email": email, "target_language": lang}
+        from storage import users
+        user = users.by_email(email)
+        if user and check_password_hash(user.pop("password_hash"), password):
+            return user
         return None
 
     def get_user_by_id(self, user_id):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT id, name, email, target_language FROM users WHERE id=?", (user_id,))
-        except:
-             cursor.execute("SELECT id, name, email FROM users WHERE id=?", (user_id,))
-             
-        user = cursor.fetchone()
-        conn.close()
-        if user:
-            lang = user[3] if len(user) > 3 else None
-            return {"id": user[0], "name": user[1], "email": user[2], "target_language": lang}
-        return None
+        from storage import users
+        return users.by_id(user_id)
 
 db = DatabaseManager()
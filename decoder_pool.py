@@ -0,0 +1,371 @@
+"""
+Decoder Pool for LinguaVoice
+Runs Vosk decoding in DECODER_PROCESSES child processes, each loading the
+models once, so the transcriber worker can use every core instead of one
+interpreter.
+
+Audio streams belong to sessions, and every stream of a session is decoded
+by the same process, where its recognizer state lives. A new session goes
+to the process with the lowest load: its real-time factor (decode seconds
+per second of audio) times the work already assigned to it. When a process
+dies or hangs its sessions move to the others. The audio of each stream's
+unfinished utterance is replayed into a fresh recognizer, with word timings
+shifted back onto the stream's timeline, and the process is restarted in
+the background.
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import Connection
+from config import DECODER_PROCESSES, DECODER_TIMEOUT, DECODER_FEED_TIMEOUT
+
+SAMPLE_RATE = 16000
+BYTES_PER_SEC = SAMPLE_RATE * 2
+MAX_REPLAY_SEC = 30      # audio kept per stream for replay after a migration
+RTF_SMOOTHING = 0.2      # weight of the newest measurement in the running RTF
+INITIAL_RTF = 0.1        # assumed until a process has decoded something
+LOAD_TIMEOUT = 300       # seconds a new process may take to load its models
+RESTART_BACKOFF_SEC = 5
+
+
+class DecoderDied(Exception):
+    pass
+
+
+def _shift_timings(result, offset_sec):
+    if offset_sec:
+        for word in result.get("result") or []:
+            word["start"] += offset_sec
+            word["end"] += offset_sec
+    return result
+
+
+def decoder_main(conn, model_paths):
+    """Child process: load the models once, then answer requests until the parent goes away"""
+    import vosk
+    models = {}
+    for lang, path in model_paths.items():
+        if not os.path.exists(path):
+            print(f"[DECODER] Warning: Model directory not found for {lang}: {path}", flush=True)
+            continue
+        models[lang] = vosk.Model(path)
+    conn.send(sorted(models))
+
+    streams = {}  # (session_id, lang) -> (recognizer, timing offset in seconds)
+    while True:
+        try:
+            op, *args = conn.recv()
+        except (EOFError, OSError):
+            return
+        started = time.perf_counter()
+        try:
+            result = None
+            if op == 'feed':
+                session_id, lang, pcm, offset_sec = args
+                if (session_id, lang) not in streams:
+                    rec = vosk.KaldiRecognizer(models[lang], SAMPLE_RATE)
+                    rec.SetWords(True)
+                    streams[(session_id, lang)] = (rec, offset_sec)
+                rec, offset_sec = streams[(session_id, lang)]
+                if rec.AcceptWaveform(pcm):
+                    result = _shift_timings(json.loads(rec.Result()), offset_sec)
+            elif op == 'decode':
+                lang, pcm = args
+                rec = vosk.KaldiRecognizer(models[lang], SAMPLE_RATE)
+                rec.SetWords(True)
+                rec.AcceptWaveform(pcm)
+                result = json.loads(rec.FinalResult())
+            elif op == 'close':
+                session_id, = args
+                for key in [k for k in streams if k[0] == session_id]:
+                    del streams[key]
+            else:
+                raise ValueError(f"Unknown decoder op: {op}")
+            reply = (True, result)
+        except Exception as e:
+            reply = (False, str(e))
+        conn.send(reply + (time.perf_counter() - started,))
+
+
+class DecoderProcess:
+    """Parent-side handle of one decoder process"""
+
+    def __init__(self, index):
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.languages = []
+        self.lock = threading.Lock()  # one request at a time per process
+        self.alive = False
+        self.restarting = False
+        self.generation = 0           # bumped on every (re)start: recognizer state is gone
+        self.restarts = 0
+        self.sessions = set()
+        self.in_flight = 0
+        self.rtf = INITIAL_RTF
+
+    def load(self):
+        return (len(self.sessions) + self.in_flight + 1) * self.rtf
+
+    def start(self, model_paths):
+        parent_sock, child_sock = socket.socketpair()
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), str(child_sock.fileno()), json.dumps(model_paths)],
+            pass_fds=[child_sock.fileno()]
+        )
+        child_sock.close()
+        conn = Connection(parent_sock.detach())
+        try:
+            if not conn.poll(LOAD_TIMEOUT):
+                raise TimeoutError(f"models not loaded within {LOAD_TIMEOUT}s")
+            languages = conn.recv()
+        except (EOFError, OSError) as e:
+            conn.close()
+            self.process.kill()
+            raise DecoderDied(f"decoder-{self.index} failed to start: {e}") from e
+        with self.lock:
+            self.conn, self.languages = conn, languages
+            self.generation += 1
+            self.rtf = INITIAL_RTF
+        print(f"[DECODER] decoder-{self.index} ready (pid {self.process.pid}, models: {', '.join(languages) or 'none'})", flush=True)
+
+    def stop(self):
+        with self.lock:
+            self.alive = False
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+            if self.process is not None and self.process.poll() is None:
+                self.process.kill()
+                self.process.wait()
+
+    def request(self, message, audio_bytes, timeout):
+        """Send one request and wait for its reply; raises DecoderDied if the process is gone or hung"""
+        with self.lock:
+            if not self.alive:
+                raise DecoderDied(f"decoder-{self.index} is down")
+            try:
+                self.conn.send(message)
+                if not self.conn.poll(timeout):
+                    raise TimeoutError(f"no reply within {timeout}s")
+                ok, result, elapsed = self.conn.recv()
+            except (EOFError, OSError) as e:  # includes TimeoutError and BrokenPipeError
+                self.alive = False
+                raise DecoderDied(f"decoder-{self.index}: {e}") from e
+        if audio_bytes:
+            rtf = elapsed / (audio_bytes / BYTES_PER_SEC)
+            self.rtf += RTF_SMOOTHING * (rtf - self.rtf)
+        if not ok:
+            raise RuntimeError(result)
+        return result
+
+
+class StreamState:
+    """Parent-side bookkeeping of one (session, language) stream"""
+
+    def __init__(self):
+        self.fed = 0               # bytes of audio in the stream so far
+        self.pending = bytearray() # audio since the last final result, for replay
+        self.holder = None         # (process, generation) holding the recognizer
+
+
+class DecoderPool:
+    """Session-sticky, RTF-balanced pool of decoder processes"""
+
+    def __init__(self, size=DECODER_PROCESSES, timeout=DECODER_TIMEOUT, feed_timeout=DECODER_FEED_TIMEOUT):
+        self.size = size
+        self.timeout = timeout            # whole segments, replays, session close
+        self.feed_timeout = feed_timeout  # one captured block, on the capture thread
+        self.model_paths = {}
+        self.workers = []
+        self.assignments = {}  # session_id -> DecoderProcess
+        self.streams = {}      # (session_id, lang) -> StreamState
+        self.lock = threading.Lock()
+        self.migrations = 0
+
+    @property
+    def languages(self):
+        return sorted({lang for w in self.workers if w.alive for lang in w.languages})
+
+    def start(self, model_paths):
+        """Start every decoder process and wait until they have loaded the models"""
+        if self.workers:
+            return
+        self.model_paths = dict(model_paths)
+        self.workers = [DecoderProcess(i) for i in range(self.size)]
+        print(f"[DECODER] Starting {self.size} decoder processes...", flush=True)
+        threads = [threading.Thread(target=self._start_worker, args=(w,), daemon=True) for w in self.workers]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def _start_worker(self, worker):
+        try:
+            worker.start(self.model_paths)
+            self._started(worker)
+        except Exception as e:
+            print(f"[DECODER] {e}", flush=True)
+            self._lost(worker, e)
+
+    def stop(self):
+        for worker in self.workers:
+            worker.restarting = True  # no restarts while shutting down
+            worker.stop()
+
+    def _assign(self, session_id):
+        """Process for a session (caller holds the lock): sticky while alive, else the least loaded"""
+        worker = self.assignments.get(session_id)
+        if worker is not None and worker.alive:
+            return worker
+        live = [w for w in self.workers if w.alive]
+        if not live:
+            return None
+        worker = min(live, key=lambda w: w.load())
+        worker.sessions.add(session_id)
+        self.assignments[session_id] = worker
+        return worker
+
+    def _lost(self, worker, error):
+        """Take a dead process out of rotation, free its sessions and restart it in the background"""
+        with self.lock:
+            worker.alive = False
+            if worker.restarting:
+                return
+            worker.restarting = True
+            sessions = list(worker.sessions)
+            worker.sessions.clear()
+            for session_id in sessions:
+                if self.assignments.get(session_id) is worker:
+                    del self.assignments[session_id]
+            self.migrations += len(sessions)
+        print(f"[DECODER] decoder-{worker.index} lost ({error}); migrating {len(sessions)} session(s)", flush=True)
+        threading.Thread(target=self._restart, args=(worker,), daemon=True).start()
+
+    def _started(self, worker, restarted=False):
+        """Put a started process into rotation; from here on its death triggers another restart"""
+        with self.lock:
+            worker.alive = True
+            worker.restarting = False
+            if restarted:
+                worker.restarts += 1
+
+    def _restart(self, worker):
+        worker.stop()
+        while True:
+            try:
+                worker.start(self.model_paths)
+                break
+            except Exception as e:
+                print(f"[DECODER] Restart failed: {e}; retrying in {RESTART_BACKOFF_SEC}s", flush=True)
+                time.sleep(RESTART_BACKOFF_SEC)
+        self._started(worker, restarted=True)
+
+    def feed(self, session_id, lang, pcm):
+        """
+        Feed the next audio of a session's `lang` stream. Returns the final
+        Vosk result when an utterance ends, else None (also when no decoder
+        is available; the audio is kept for replay).
+        """
+        key = (session_id, lang)
+        with self.lock:
+            stream = self.streams.setdefault(key, StreamState())
+            stream.fed += len(pcm)
+            stream.pending += pcm
+            excess = len(stream.pending) - MAX_REPLAY_SEC * BYTES_PER_SEC
+            if excess > 0:
+                del stream.pending[:excess]
+
+        for attempt in range(2):  # one migration per call
+            with self.lock:
+                worker = self._assign(session_id)
+                if worker is None:
+                    return None
+                holder = (worker, worker.generation)
+                if stream.holder == holder:
+                    payload, offset_sec = pcm, 0.0
+                    timeout = self.feed_timeout
+                else:
+                    # New or migrated stream: rebuild the recognizer from the unfinished utterance
+                    payload = bytes(stream.pending)
+                    offset_sec = (stream.fed - len(payload)) / BYTES_PER_SEC
+                    # Up to MAX_REPLAY_SEC of audio: allow for decoding it, not just one block
+                    timeout = self.timeout + len(payload) / BYTES_PER_SEC
+                    if stream.holder is not None:
+                        print(f"[DECODER] Replaying {len(payload) / BYTES_PER_SEC:.1f}s of {session_id}/{lang} on decoder-{worker.index}", flush=True)
+                worker.in_flight += 1
+            try:
+                result = worker.request(('feed', session_id, lang, payload, offset_sec), len(payload), timeout)
+            except DecoderDied as e:
+                self._lost(worker, e)
+                continue
+            finally:
+                with self.lock:
+                    worker.in_flight -= 1
+            with self.lock:
+                stream.holder = holder
+                if result is not None:
+                    stream.pending.clear()
+            return result
+        return None
+
+    def decode(self, lang, pcm):
+        """Decode a whole segment on the least loaded process (no session state)"""
+        for attempt in range(2):
+            with self.lock:
+                live = [w for w in self.workers if w.alive]
+                if not live:
+                    break
+                worker = min(live, key=lambda w: w.load())
+                worker.in_flight += 1
+            try:
+                return worker.request(('decode', lang, pcm), len(pcm), self.timeout)
+            except DecoderDied as e:
+                self._lost(worker, e)
+            finally:
+                with self.lock:
+                    worker.in_flight -= 1
+        raise RuntimeError("No decoder process available")
+
+    def end_session(self, session_id):
+        """Forget a session and drop its recognizers"""
+        with self.lock:
+            worker = self.assignments.pop(session_id, None)
+            for key in [k for k in self.streams if k[0] == session_id]:
+                del self.streams[key]
+            if worker is not None:
+                worker.sessions.discard(session_id)
+        if worker is not None and worker.alive:
+            try:
+                worker.request(('close', session_id), 0, self.timeout)
+            except DecoderDied as e:
+                self._lost(worker, e)
+
+    def stats(self):
+        """Per-process load and health, for monitoring"""
+        with self.lock:
+            return {
+                'processes': [{
+                    'index': w.index,
+                    'pid': w.process.pid if w.process else None,
+                    'alive': w.alive,
+                    'rtf': round(w.rtf, 3),
+                    'sessions': len(w.sessions),
+                    'in_flight': w.in_flight,
+                    'restarts': w.restarts
+                } for w in self.workers],
+                'sessions': len(self.assignments),
+                'migrations': self.migrations
+            }
+
+
+# Global instance
+decoder_pool = DecoderPool()
+
+if __name__ == "__main__":
+    # Decoder process entry point: python decoder_pool.py <connection fd> <model paths JSON>
+    decoder_main(Connection(int(sys.argv[1])), json.loads(sys.argv[2]))
@@ -0,0 +1,184 @@
+"""
+Fuzzy Word Index for LinguaVoice
+SymSpell-style symmetric-delete index: every word is stored under the strings
+obtained by deleting up to `max_distance` characters from its prefix, so the
+nearest known spellings of a misheard word are found with a handful of dict
+lookups and a few bounded edit-distance checks, without touching the network.
+"""
+import re
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent
+    transpositions). Returns max_distance + 1 as soon as the distance is
+    known to exceed max_distance.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous2 is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+_DOUBLED_RE = re.compile(r'(.)\1+')
+
+
+def romanized_hindi_key(word: str) -> str:
+    """
+    Collapse common romanization variants of Hindi words before comparing:
+    w/v, ee/i, oo/u and doubled letters (dhanyawad = dhanyavaad, paani = pani).
+    """
+    key = word.lower()
+    if not key.isascii():
+        return key  # Devanagari spelling, nothing to collapse
+    key = key.replace('w', 'v').replace('ee', 'i').replace('oo', 'u')
+    return _DOUBLED_RE.sub(r'\1', key)
+
+
+class SymSpellIndex:
+    """Symmetric-delete index over one lexicon"""
+
+    def __init__(self, words: Iterable[str] = (), max_distance: int = 2, prefix_length: int = 7,
+                 normalize: Optional[Callable[[str], str]] = None):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.normalize = normalize or str.lower
+        self.forms: Dict[str, List[str]] = {}   # normalized key -> original words
+        self.deletes: Dict[str, List[str]] = {} # delete string -> normalized keys
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        return len(self.forms)
+
+    def __contains__(self, word):
+        return self.normalize(word) in self.forms
+
+    def _deletes(self, key: str) -> Set[str]:
+        """key's prefix plus every string made by deleting up to max_distance characters from it"""
+        prefix = key[:self.prefix_length]
+        result = {prefix}
+        frontier = [prefix]
+        for _ in range(self.max_distance):
+            next_frontier = []
+            for s in frontier:
+                for i in range(len(s)):
+                    d = s[:i] + s[i + 1:]
+                    if d not in result:
+                        result.add(d)
+                        next_frontier.append(d)
+            frontier = next_frontier
+        return result
+
+    def add(self, word: str):
+        key = self.normalize(word.strip())
+        if not key:
+            return
+        originals = self.forms.get(key)
+        if originals is not None:
+            if word not in originals:
+                originals.append(word)
+            return
+        self.forms[key] = [word]
+        for d in self._deletes(key):
+            self.deletes.setdefault(d, []).append(key)
+
+    def lookup(self, term: str, max_distance: Optional[int] = None, limit: int = 3) -> List[Tuple[str, int]]:
+        """
+        Known words within max_distance edits of term, nearest first, as
+        [(word, distance)]. An exact match is returned alone.
+        """
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        key = self.normalize(term.strip())
+        if not key:
+            return []
+        if key in self.forms:
+            return [(w, 0) for w in self.forms[key]][:limit]
+
+        checked = set()
+        matches = []
+        for d in self._deletes(key):
+            for candidate in self.deletes.get(d, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                distance = edit_distance(key, candidate, max_distance)
+                if distance <= max_distance:
+                    matches.extend((w, distance) for w in self.forms[candidate])
+
+        matches.sort(key=lambda m: (m[1], m[0]))
+        return matches[:limit]
+
+
+def fuzzy_distance_for(word: str) -> int:
+    """Edit budget for a word: none for very short words, where a near-miss is usually another word"""
+    if len(word) <= 3:
+        return 0
+    return 1 if len(word) <= 5 else 2
+
+
+class FuzzyIndexCache:
+    """Per-language SymSpell indexes, built lazily on first use"""
+
+    def __init__(self, load_words: Callable[[str], Iterable[str]]):
+        self.load_words = load_words
+        self.indexes: Dict[str, SymSpellIndex] = {}
+        self.lock = threading.Lock()
+
+    def get(self, language: str) -> SymSpellIndex:
+        index = self.indexes.get(language)
+        if index is None:
+            with self.lock:
+                index = self.indexes.get(language)
+                if index is None:
+                    normalize = romanized_hindi_key if language == 'hi' else None
+                    index = SymSpellIndex(self.load_words(language), normalize=normalize)
+                    self.indexes[language] = index
+        return index
+
+    def nearest(self, word: str, language: str) -> Optional[Tuple[str, int]]:
+        """Closest known form of word within its edit budget, or None"""
+        budget = fuzzy_distance_for(word)
+        matches = self.get(language).lookup(word, max_distance=budget, limit=1)
+        return matches[0] if matches else None
+
+    def variant_of(self, word: str, language: str) -> Optional[Tuple[str, int]]:
+        """
+        The one known word a single edit (or a romanization variant) away
+        from an unknown word, as (word, distance). None when the word is
+        known, too short for an edit budget, or near more than one word: only
+        unambiguous near-misses are safe to resolve without asking anyone.
+        """
+        if fuzzy_distance_for(word) < 1:
+            return None
+        matches = self.get(language).lookup(word, max_distance=1, limit=2)
+        if len(matches) != 1 or matches[0][0] == word:
+            return None
+        return matches[0]
+
+    def invalidate(self, language: Optional[str] = None):
+        with self.lock:
+            if language is None:
+                self.indexes.clear()
+            else:
+                self.indexes.pop(language, None)
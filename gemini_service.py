@@ -5,6 +5,7 @@ Uses Google's Gemini AI for comprehensive word information in multiple languages
 import google.generativeai as genai
 from typing import Dict, Optional
 import json
+from ai_client import ai_client
 
 class GeminiWordService:
     """Service to get word meanings using Gemini API"""
@@ -54,7 +55,7 @@ Format as JSON:
             print(f"[GEMINI] Requesting meaning for: {word} ({lang_name})")
             
             # Use the API correctly
-            response = self.model.generate_content(
+            response_text = ai_client.generate(
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     temperature=0.3,
@@ -62,12 +63,12 @@ Format as JSON:
                 )
             )
             
-            if not response or not response.text:
+            if not response_text:
                 print(f"[GEMINI] No response for {word}")
                 return None
             
             # Clean the response text
-            text = response.text.strip()
+            text = response_text.strip()
             print(f"[GEMINI] Raw response: {text[:150]}...")
             
             # Remove markdown code blocks if present
@@ -143,10 +144,10 @@ Format as JSON:
             - Answer NO if it's gibberish, random characters, or not a word
             """
             
-            response = self.model.generate_content(prompt)
+            response_text = ai_client.generate(prompt, timeout=8)
             
-            if response and response.text:
-                answer = response.text.strip().upper()
+            if response_text:
+                answer = response_text.strip().upper()
                 return 'YES' in answer
             
             return False
@@ -0,0 +1,96 @@
+"""
+Intent Matcher for LinguaVoice
+Compiles every phrase of every intent into a single trie-shaped regex with word
+boundaries, so a message is classified in one pass instead of one substring
+scan per phrase.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def normalize_phrase(text: str) -> str:
+    """Lowercase and collapse whitespace so phrases and matches compare equal"""
+    return ' '.join(text.lower().split())
+
+
+class IntentMatcher:
+    """
+    Matches text against phrase lists for many intents at once.
+
+    Intents are given in priority order (first = highest). If a phrase is
+    listed under several intents, the higher-priority intent owns it.
+    """
+
+    def __init__(self, intents: Iterable[Tuple[str, Iterable[str]]] = ()):
+        self.intent_phrases: Dict[str, List[str]] = {}
+        self.priority: Dict[str, int] = {}
+        self.phrase_intent: Dict[str, str] = {}
+        self.regex = None
+        for intent, phrases in intents:
+            self._add(intent, phrases)
+        self.compile()
+
+    def _add(self, intent: str, phrases: Iterable[str]):
+        if intent not in self.priority:
+            self.priority[intent] = len(self.intent_phrases)
+            self.intent_phrases[intent] = []
+        for phrase in phrases:
+            key = normalize_phrase(phrase)
+            if not key:
+                continue
+            self.intent_phrases[intent].append(key)
+            owner = self.phrase_intent.get(key)
+            if owner is None or self.priority[intent] < self.priority[owner]:
+                self.phrase_intent[key] = intent
+
+    def add_intent(self, intent: str, phrases: Iterable[str]):
+        """Add phrases to an intent (new intents get the lowest priority) and recompile"""
+        self._add(intent, phrases)
+        self.compile()
+
+    def compile(self):
+        """Build the combined regex from the current phrase set"""
+        if not self.phrase_intent:
+            self.regex = None
+            return
+
+        # Build a character trie so shared prefixes are only tried once
+        trie: Dict = {}
+        for phrase in self.phrase_intent:
+            node = trie
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[''] = True
+
+        body = self._trie_to_regex(trie)
+        self.regex = re.compile(r'(?<!\w)(' + body + r')(?!\w)')
+
+    def _trie_to_regex(self, node: Dict) -> str:
+        is_end = '' in node
+        branches = []
+        for char in sorted(k for k in node if k):
+            # Any whitespace run in the input matches a single space in a phrase
+            token = r'\s+' if char == ' ' else re.escape(char)
+            branches.append(token + self._trie_to_regex(node[char]))
+
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if is_end:
+            # Greedy optional: prefer the longer phrase, fall back to this one
+            return '(?:' + body + ')?'
+        return body
+
+    def match(self, text: str) -> Optional[str]:
+        """Return the highest-priority intent found in text, or None"""
+        if not self.regex or not text:
+            return None
+
+        best = None
+        for m in self.regex.finditer(text.lower()):
+            intent = self.phrase_intent[normalize_phrase(m.group(1))]
+            if best is None or self.priority[intent] < self.priority[best]:
+                best = intent
+                if self.priority[best] == 0:
+                    break
+        return best
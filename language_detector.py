@@ -1,39 +1,262 @@
+"""
+Offline Language Detector for LinguaVoice
+Character-trigram language identification. Smoothed log-probabilities for
+every (trigram, language) pair are packed into one float array, so a text is
+scored for all languages in a single pass over its trigrams (per-word sums are
+cached, since utterances repeat the same words), and the scores are turned
+into calibrated confidences with a temperature fitted on held-out text.
+"""
+import json
+import math
+import os
 import re
-from collections import Counter
+from array import array
+from operator import itemgetter
+
+LANGUAGES = ('en', 'es', 'hi')
+DICT_DIR = os.path.join(os.path.dirname(__file__), 'dictionaries')
+
+# Latin letters (incl. accented) and Devanagari letters/marks; digits, danda
+# and punctuation split words
+NON_WORD_RE = re.compile('[^a-zà-öø-ÿऀ-ॣ०-ॿ]+')
+CLEAN_RE = re.compile('[a-zà-öø-ÿऀ-ॣ०-ॿ ]*')
+
+SMOOTHING = 0.5       # add-k smoothing of trigram counts
+MIN_CONFIDENCE = 0.5  # below this, detect_language answers 'unknown'
+WORD_CACHE_SIZE = 50000
+
+
+def split_words(text):
+    """Lowercase words, with digits and punctuation treated as separators"""
+    text = text.lower()
+    # Recognizer output is normally already clean; only rewrite it if not
+    if not CLEAN_RE.fullmatch(text):
+        text = NON_WORD_RE.sub(' ', text)
+    return text.split()
+
+
+def word_trigrams(word):
+    """Character trigrams of a word padded with a space on each side"""
+    padded = f" {word} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+class TrigramModel:
+    """
+    Packed trigram log-probability table.
+
+    `weights` is column-major: the log-probabilities of language i occupy
+    weights[i * rows : (i + 1) * rows], with one extra final row shared by all
+    trigrams that were never seen in training.
+    """
+
+    def __init__(self, languages, index, weights, temperature=1.0):
+        self.languages = tuple(languages)
+        self.index = index  # trigram -> row
+        self.rows = len(index) + 1
+        self.unseen_row = len(index)
+        self.weights = weights
+        self.temperature = temperature
+        view = memoryview(weights)
+        self.columns = [view[i * self.rows:(i + 1) * self.rows] for i in range(len(self.languages))]
+        self.word_cache = {}  # word -> per-language log-probability
+
+    @classmethod
+    def fit(cls, samples, smoothing=SMOOTHING, temperature=1.0):
+        """Count trigrams in {lang: [texts]} and build the packed table"""
+        languages = tuple(samples)
+        counts = {lang: {} for lang in languages}
+        index = {}
+        for lang, texts in samples.items():
+            lang_counts = counts[lang]
+            for text in texts:
+                for word in split_words(text):
+                    for trigram in word_trigrams(word):
+                        lang_counts[trigram] = lang_counts.get(trigram, 0) + 1
+                        index.setdefault(trigram, len(index))
+
+        rows = len(index) + 1
+        weights = array('f', bytes(4 * rows * len(languages)))
+        for i, lang in enumerate(languages):
+            lang_counts = counts[lang]
+            denominator = math.log(sum(lang_counts.values()) + smoothing * rows)
+            base = i * rows
+            unseen = math.log(smoothing) - denominator
+            for row in range(rows):
+                weights[base + row] = unseen
+            for trigram, count in lang_counts.items():
+                weights[base + index[trigram]] = math.log(count + smoothing) - denominator
+        return cls(languages, index, weights, temperature)
+
+    @classmethod
+    def train(cls, samples, holdout_every=5):
+        """
+        Fit the temperature on every `holdout_every`-th text (model trained on
+        the rest), then train the final model on all texts.
+        """
+        train, held_out = {}, []
+        for lang, texts in samples.items():
+            train[lang] = [t for i, t in enumerate(texts) if i % holdout_every]
+            held_out.extend((lang, t) for i, t in enumerate(texts) if i % holdout_every == 0)
+        temperature = cls.fit(train).fit_temperature(held_out)
+        model = cls.fit(samples, temperature=temperature)
+        for texts in samples.values():
+            model.warm_cache(texts)
+        return model
+
+    def word_scores(self, word):
+        """Log-probability of one word's trigrams under each language"""
+        index_get = self.index.get
+        rows = [index_get(t, self.unseen_row) for t in word_trigrams(word)]
+        if len(rows) == 1:
+            scores = tuple(column[rows[0]] for column in self.columns)
+        else:
+            gather = itemgetter(*rows)
+            scores = tuple(sum(gather(column)) for column in self.columns)
+        if len(self.word_cache) >= WORD_CACHE_SIZE:
+            self.word_cache.clear()
+        self.word_cache[word] = scores
+        return scores
+
+    def warm_cache(self, texts):
+        """Precompute the scores of every word in texts (e.g. the training vocabulary)"""
+        for text in texts:
+            for word in split_words(text):
+                if word not in self.word_cache:
+                    self.word_scores(word)
+
+    def log_likelihoods(self, text):
+        """Total log-probability of the text's trigrams under each language"""
+        words = split_words(text)
+        if not words:
+            return None
+        cache_get = self.word_cache.get
+        vectors = [cache_get(word) or self.word_scores(word) for word in words]
+        return [sum(column) for column in zip(*vectors)]
+
+    def softmax(self, totals, temperature):
+        top = max(totals)
+        exps = [math.exp((t - top) * temperature) for t in totals]
+        norm = sum(exps)
+        return [e / norm for e in exps]
+
+    def fit_temperature(self, labelled):
+        """Temperature minimising the log-loss of [(lang, text)] pairs"""
+        scored = []
+        for lang, text in labelled:
+            totals = self.log_likelihoods(text)
+            if totals is not None:
+                scored.append((self.languages.index(lang), totals))
+        if not scored:
+            return 1.0
+
+        best_temperature, best_loss = 1.0, None
+        for step in range(-40, 11):
+            temperature = 10 ** (step / 10)
+            loss = -sum(math.log(max(self.softmax(totals, temperature)[i], 1e-12)) for i, totals in scored)
+            if best_loss is None or loss < best_loss:
+                best_temperature, best_loss = temperature, loss
+        return best_temperature
+
+    def confidences(self, text):
+        """Calibrated probability per language (all 0.0 when the text has no letters)"""
+        totals = self.log_likelihoods(text)
+        if totals is None:
+            return {lang: 0.0 for lang in self.languages}
+        return dict(zip(self.languages, self.softmax(totals, self.temperature)))
+
+
+def load_training_samples(dict_dir=DICT_DIR):
+    """Corpus sentences plus the bundled dictionaries, grouped by language"""
+    samples = {lang: [] for lang in LANGUAGES}
+    try:
+        with open(os.path.join(dict_dir, 'langid_corpus.json'), 'r', encoding='utf-8') as f:
+            for lang, sentences in json.load(f).items():
+                samples.setdefault(lang, []).extend(sentences)
+    except Exception as e:
+        print(f"[LANG_DETECT] Error loading corpus: {e}")
+
+    # Spanish entries are Spanish throughout; Hindi entries have romanized
+    # keys, so only their Devanagari definitions are used
+    for filename, lang, use_keys in (('spanish_dict.json', 'es', True), ('hindi_dict.json', 'hi', False)):
+        try:
+            with open(os.path.join(dict_dir, filename), 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except Exception as e:
+            print(f"[LANG_DETECT] Error loading {filename}: {e}")
+            continue
+        for word, definition in entries.items():
+            if use_keys:
+                samples[lang].append(word)
+            samples[lang].append(definition)
+    return samples
+
+
+_default_model = None
+
+
+def get_default_model():
+    """Model trained from the bundled data, built once per process"""
+    global _default_model
+    if _default_model is None:
+        _default_model = TrigramModel.train(load_training_samples())
+        print(f"[LANG_DETECT] Trigram model ready ({_default_model.rows} trigrams, "
+              f"{len(_default_model.word_cache)} cached words, temperature {_default_model.temperature:.3f})")
+    return _default_model
+
 
 class OfflineLanguageDetector:
-    def __init__(self):
-        # Language patterns for basic detection
-        self.patterns = {
-            'en': {
-                'chars': set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'),
-                'common_words': {'the', 'and', 'is', 'in', 'to', 'of', 'a', 'that', 'it', 'with', 'for', 'as', 'was', 'on', 'are', 'you', 'this', 'be', 'at', 'have'}
-            },
-            'es': {
-                'chars': set('abcdefghijklmnopqrstuvwxyzáéíóúüñABCDEFGHIJKLMNOPQRSTUVWXYZÁÉÍÓÚÜÑ'),
-                'common_words': {'el', 'la', 'de', 'que', 'y', 'a', 'en', 'un', 'es', 'se', 'no', 'te', 'lo', 'le', 'da', 'su', 'por', 'son', 'con', 'para'}
-            },
-            'hi': {
-                'chars': set('अआइईउऊऋएऐओऔकखगघङचछजझञटठडढणतथदधनपफबभमयरलवशषसहक्षत्रज्ञ'),
-                'common_words': {'है', 'का', 'की', 'के', 'में', 'से', 'को', 'और', 'यह', 'वह', 'पर', 'एक', 'हो', 'गया', 'था', 'कि', 'जो', 'तो', 'ही', 'या'}
-            }
-        }
-    
-    def detect_language(self, text):
-        if not text.strip():
-            return 'unknown'
-        
-        scores = {'en': 0, 'es': 0, 'hi': 0}
-        words = text.lower().split()
-        
-        # Character-based scoring
-        for lang, data in self.patterns.items():
-            char_score = sum(1 for char in text if char in data['chars'])
-            scores[lang] += char_score / len(text) * 50
-            
-            # Word-based scoring
-            word_score = sum(1 for word in words if word in data['common_words'])
-            scores[lang] += word_score / len(words) * 50 if words else 0
-        
+    def __init__(self, model=None):
+        self.model = model or get_default_model()
+
+    def score_languages(self, text):
+        """Calibrated confidence (0-1, summing to 1) for each language"""
+        return self.model.confidences(text)
+
+    def detect_with_confidence(self, text):
+        """Most likely language and its confidence; ('unknown', 0.0) if unsure"""
+        scores = self.score_languages(text)
         detected = max(scores, key=scores.get)
-        return detected if scores[detected] > 10 else 'unknown'
\ No newline at end of file
+        if scores[detected] < MIN_CONFIDENCE:
+            return 'unknown', scores[detected]
+        return detected, scores[detected]
+
+    def detect_language(self, text):
+        return self.detect_with_confidence(text)[0]
+
+
+if __name__ == '__main__':
+    # Micro-benchmark: accuracy and per-call latency on utterance-like text
+    # that is not part of the training data
+    import timeit
+
+    EVAL = [
+        ('en', 'i want to learn spanish'), ('en', 'where is the library'),
+        ('en', 'the cat is sleeping on the sofa'), ('en', 'see you later'),
+        ('en', 'my mother cooks dinner'), ('en', 'thank you'),
+        ('es', 'quiero aprender inglés'), ('es', 'dónde está la biblioteca'),
+        ('es', 'el gato duerme en el sofá'), ('es', 'hasta luego'),
+        ('es', 'mi madre cocina la cena'), ('es', 'gracias amigo'),
+        ('hi', 'मैं अंग्रेज़ी सीखना चाहता हूँ'), ('hi', 'पुस्तकालय कहाँ है'),
+        ('hi', 'बिल्ली सोफ़े पर सो रही है'), ('hi', 'फिर मिलेंगे'),
+        ('hi', 'मेरी माँ खाना बनाती है'), ('hi', 'शुक्रिया दोस्त'),
+    ]
+    detector = OfflineLanguageDetector()
+    correct = 0
+    for expected, text in EVAL:
+        detected, confidence = detector.detect_with_confidence(text)
+        correct += detected == expected
+        print(f"  {expected} -> {detected} ({confidence:.2f})  {text}")
+    print(f"Accuracy: {correct}/{len(EVAL)}")
+
+    runs = 2000
+    texts = [t for _, t in EVAL]
+    elapsed = timeit.timeit(lambda: [detector.detect_language(t) for t in texts], number=runs)
+    print(f"detect_language (word cache warm): {elapsed / (runs * len(texts)) * 1e6:.1f} us/call")
+
+    def cold():
+        for t in texts:
+            detector.model.word_cache.clear()
+            detector.detect_language(t)
+    elapsed = timeit.timeit(cold, number=runs)
+    print(f"detect_language (every word unseen): {elapsed / (runs * len(texts)) * 1e6:.1f} us/call")
@@ -2,7 +2,7 @@
 Learning Level Generator for 100-Level Progressive System
 Generates difficulty-appropriate content using Gemini AI
 """
-from gemini_service import gemini_service
+from ai_client import ai_client
 import json
 
 class LevelGenerator:
@@ -43,10 +43,10 @@ class LevelGenerator:
             
             final_prompt = prompts[tier] + f" Make them different from previous levels. Focus on {variation} vocabulary."
             
-            response = gemini_service.model.generate_content(final_prompt)
-            if response and response.text:
+            response_text = ai_client.generate(final_prompt)
+            if response_text:
                 # Clean response
-                text = response.text.strip()
+                text = response_text.strip()
                 if text.startswith('```json'):
                     text = text[7:]
                 if text.startswith('```'):
@@ -1,5242 +0,0 @@
--- LinguaVoice MySQL Migration Dump
-SET FOREIGN_KEY_CHECKS = 0;
-
-DROP TABLE IF EXISTS `users`;
-CREATE TABLE `users` (
-  `id` INT NOT NULL AUTO_INCREMENT,
-  `email` TEXT NOT NULL,
-  `password_hash` TEXT NOT NULL,
-  `name` TEXT,
-  `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP,
-  `target_language` TEXT DEFAULT NULL,
-  PRIMARY KEY (`id`)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-
-INSERT INTO `users` (`id`, `email`, `password_hash`, `name`, `created_at`, `target_language`) VALUES 
-(1, 'Varshivarshith77@gmail.com', 'scrypt:32768:8:1$pePW2jeOFFZ1W4GL$b7a22524f17c1ba29469fc879743956c50362022ad040a799e90636aac1e0e19986af8c108edeed4e938388fb3fbcaeba63380a30f906d2941bce0651b025fbf', 'Rallabandi Varshith', '2026-01-06 14:31:30', 'es'),
-(2, 'varshithrallabandi31@gmail.com', 'scrypt:32768:8:1$v4i2b5d5thoKYOrt$a4de1585d25f667f148a4d8df19963c1276f91197a8c8aaa42d4322cf3dddf01fe62f15ad42a0c2cc7acf935c74f0acb1eedf2c752a2741c135817c541ee584b', 'varshith', '2026-01-21 06:25:39', NULL),
-(3, 'admin@test.com', 'scrypt:32768:8:1$jkK7PEq8tzrnecHv$2f711f4562ee85883d3e8b81e67dd05864374968227bbfaffd335db1339d6cccbe963240f82212490ec98abb4d4bdeed1cba3fb1905e2cbb3365e84fba46543f', 'Test Admin', '2026-01-21 06:26:02', NULL),
-(4, 'vars@gmail.com', 'scrypt:32768:8:1$ZqgF8jvER6u1p6xc$81f520a2f44f8fbc7085928e8c1f4cc95c66475800e6f6c88eac750e7d3e5ff27eda077d5478bc63c5dc4ea554f60f05de2de087c270b1b94258a91e4fb3a8bd', 'Rallabandi Varshith', '2026-01-22 05:42:19', NULL),
-(5, 'paardhivreddy22@gmail.com', 'scrypt:32768:8:1$MfHSeQuUqTILGXmU$c8e9a0146926259fd6599172faffb51d2ac1684c0ffc2ae86ae8a5c5c1a1fcc9e10905de5bcff88c6cd94a11231d2f4a6ad351e975714e5d8487ed22000bcea8', 'paardhu', '2026-02-03 08:14:37', NULL),
-(6, 'test_1770108275@example.com', 'scrypt:32768:8:1$O7IOxZhRBkfFi10F$e894a52ee0bc780381985b77a816bf3c5e7f089cf5b2a6f33ddb91ed2c7a920aa57d6a0f703d7d4d814ccfaefb016c55ef498df6a7bfa0659e3b45078222dc0a', 'Test User', '2026-02-03 08:44:35', NULL),
-(7, 'test_1770108663@example.com', 'scrypt:32768:8:1$XQpL79gY78svQw1q$dd7b72cfca798d201b522589b21724be2e619c9ad7d7f83c201d27cc1930a45de7e5396ec668ff2d18d02f3e856ba8876347eaa8d95f3fd19c0cd398b6eafed9', 'Test User', '2026-02-03 08:51:03', NULL);
-
-DROP TABLE IF EXISTS `transcripts`;
-CREATE TABLE `transcripts` (
-  `id` INT NOT NULL AUTO_INCREMENT,
-  `user_id` INT,
-  `timestamp` TEXT,
-  `language` TEXT,
-  `text` TEXT,
-  `audio_file` TEXT,
-  PRIMARY KEY (`id`)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-
-INSERT INTO `transcripts` (`id`, `user_id`, `timestamp`, `language`, `text`, `audio_file`) VALUES 
-(1, 1, '2026-01-06 20:36:46', 'es', 'mira por donde hasta la barba', 'audio_clips\rec_20260106_203646.wav'),
-(2, 1, '2026-01-06 20:36:58', 'hi', 'सरोकारी में आरोपित एक स्कूल में था कि पर किसी दिखेगा', 'audio_clips\rec_20260106_203651.wav'),
-(3, 1, '2026-01-06 20:37:00', 'en', 'it is out have him as a week at school in a unanimous you could have a message me public school', 'audio_clips\rec_20260106_203658.wav'),
-(4, 1, '2026-01-06 20:37:01', 'es', 'una noche lucharemos para suele denominar así que te da miedo o algo más meses de julio', 'audio_clips\rec_20260106_203658.wav'),
-(5, 1, '2026-01-06 20:37:04', 'hi', 'भी हो लेकिन विभाग श्री गिर्राज', 'audio_clips\rec_20260106_203703.wav'),
-(6, 1, '2026-01-06 20:37:09', 'en', 'pets are given and i guess is as he he kisses', 'audio_clips\rec_20260106_203703.wav'),
-(7, 1, '2026-01-06 20:37:09', 'es', 'pista adivina qué es eso que siempre llevaba de que se es', 'audio_clips\rec_20260106_203703.wav'),
-(8, 1, '2026-01-06 20:37:09', 'hi', 'सब्जेक्ट जब हमारे किसी', 'audio_clips\rec_20260106_203703.wav'),
-(9, 1, '2026-01-06 20:37:12', 'es', 'porque por un bosque', 'audio_clips\rec_20260106_203709.wav'),
-(10, 1, '2026-01-06 20:37:14', 'en', 'the most important in his comedy', 'audio_clips\rec_20260106_203709.wav'),
-(11, 1, '2026-01-06 20:37:15', 'hi', 'के जिम्मा विस्तृत होती थी उसका मुझे', 'audio_clips\rec_20260106_203714.wav'),
-(12, 1, '2026-01-06 20:37:24', 'en', 'in the modern do not going to need him or the report or the area hominem what about it', 'audio_clips\rec_20260106_203719.wav'),
-(13, 1, '2026-01-06 20:37:25', 'hi', 'कोई भी नियम आदमी को लेकर इसको दिनों एरिया कुछ अन्य', 'audio_clips\rec_20260106_203719.wav'),
-(14, 1, '2026-01-06 20:37:25', 'es', 'armando martínez vega con iremos cuatro y cuatro valkiria por tu culpa vergüenza', 'audio_clips\rec_20260106_203725.wav'),
-(15, 1, '2026-01-06 20:37:28', 'en', 'it''s not', 'audio_clips\rec_20260106_203725.wav'),
-(16, 1, '2026-01-06 20:37:31', 'en', 'don''t knock on wood', 'audio_clips\rec_20260106_203730.wav'),
-(17, 1, '2026-01-06 20:37:34', 'hi', 'किन्तु अभी कुछ दिन वार्ता का काम होता', 'audio_clips\rec_20260106_203730.wav'),
-(18, 1, '2026-01-06 20:37:40', 'es', 'y con tus amigos tan guapa como participar en tu tiene convirtió guasón de zabala', 'audio_clips\rec_20260106_203735.wav'),
-(19, 1, '2026-01-06 20:37:41', 'en', 'to piggyback tonight as get into the there wasn''t a good either', 'audio_clips\rec_20260106_203735.wav'),
-(20, 1, '2026-01-06 20:37:50', 'es', 'allí llévense son duro pagarlo negro en agregan malignos pardo guarda invite', 'audio_clips\rec_20260106_203746.wav'),
-(21, 1, '2026-01-06 20:37:55', 'hi', 'मिट्टी के तवे पर सिमट गई बीस समूह को बधाई बधाई बधाई बधाई बनती थी', 'audio_clips\rec_20260106_203752.wav'),
-(22, 1, '2026-01-06 20:37:55', 'es', 'al igual que', 'audio_clips\rec_20260106_203752.wav'),
-(23, 1, '2026-01-06 20:37:56', 'en', 'uses some little bottle of water on any neither party getting i''m a little wonder what i did it was he would i be the money went into the much activity', 'audio_clips\rec_20260106_203752.wav'),
-(24, 1, '2026-01-06 20:37:59', 'es', 'tiros más legarda de oro no', 'audio_clips\rec_20260106_203758.wav'),
-(25, 1, '2026-01-06 20:38:02', 'en', 'you got it on it are you think an awesome', 'audio_clips\rec_20260106_203758.wav'),
-(26, 1, '2026-01-06 20:38:03', 'es', 'lo has invertido', 'audio_clips\rec_20260106_203758.wav'),
-(27, 1, '2026-01-06 20:38:05', 'en', 'it''s funny because was', 'audio_clips\rec_20260106_203803.wav'),
-(28, 1, '2026-01-06 20:38:06', 'es', 'hace un partido', 'audio_clips\rec_20260106_203803.wav'),
-(29, 1, '2026-01-06 20:38:07', 'en', 'he added', 'audio_clips\rec_20260106_203807.wav'),
-(30, 1, '2026-01-06 20:38:11', 'en', 'doesn''t the movement', 'audio_clips\rec_20260106_203811.wav'),
-(31, 1, '2026-01-06 20:38:13', 'hi', 'लोग व्यक्त करे', 'audio_clips\rec_20260106_203811.wav'),
-(32, 1, '2026-01-06 20:38:16', 'en', 'getting pennies on and the communities', 'audio_clips\rec_20260106_203816.wav'),
-(33, 1, '2026-01-06 20:38:20', 'en', 'that on the nigger', 'audio_clips\rec_20260106_203816.wav'),
-(34, 1, '2026-01-06 20:38:22', 'hi', 'उन्होंने पर बगैर थोड़ा ठंडा पानी भरने वाली', 'audio_clips\rec_20260106_203821.wav'),
-(35, 1, '2026-01-06 20:38:24', 'hi', 'एक हुए थे', 'audio_clips\rec_20260106_203821.wav'),
-(36, 1, '2026-01-06 20:38:27', 'es', 'por donde has abandonado', 'audio_clips\rec_20260106_203824.wav'),
-(37, 1, '2026-01-06 20:38:28', 'hi', 'और बढ़ चला', 'audio_clips\rec_20260106_203824.wav'),
-(38, 1, '2026-01-06 20:38:33', 'hi', 'मात्र कुछ पुलिस जिसे रोका जा थे', 'audio_clips\rec_20260106_203829.wav'),
-(39, 1, '2026-01-06 20:38:33', 'en', 'somebody set up a message', 'audio_clips\rec_20260106_203833.wav'),
-(40, 1, '2026-01-06 20:38:35', 'hi', 'आरोपी', 'audio_clips\rec_20260106_203833.wav'),
-(41, 1, '2026-01-06 20:38:39', 'en', 'oh gotcha', 'audio_clips\rec_20260106_203837.wav'),
-(42, 1, '2026-01-06 20:38:45', 'es', 'sí eso debería', 'audio_clips\rec_20260106_203841.wav'),
-(43, 1, '2026-01-06 20:38:46', 'en', 'and it', 'audio_clips\rec_20260106_203846.wav'),
-(44, 1, '2026-01-06 20:38:51', 'en', 'even the pentagon', 'audio_clips\rec_20260106_203851.wav'),
-(45, 1, '2026-01-06 20:38:51', 'es', 'yo solo conozco y me da mucha pena', 'audio_clips\rec_20260106_203851.wav'),
-(46, 1, '2026-01-06 20:38:59', 'en', 'museums act as i sit on my face', 'audio_clips\rec_20260106_203856.wav'),
-(47, 1, '2026-01-06 20:39:00', 'es', 'sigüenza estabilizar el interesado', 'audio_clips\rec_20260106_203856.wav'),
-(48, 1, '2026-01-06 20:39:09', 'en', 'he decided to him and he saw on anymore', 'audio_clips\rec_20260106_203907.wav'),
-(49, 1, '2026-01-06 20:39:10', 'es', 'así ha sido eso ha dicho hizo', 'audio_clips\rec_20260106_203907.wav'),
-(50, 1, '2026-01-06 20:39:13', 'en', 'the', 'audio_clips\rec_20260106_203912.wav'),
-(51, 1, '2026-01-06 20:39:15', 'hi', 'कुछ बीसीएम उसने ऐसा कोई फाइल फोटो वीडियो रिलीज अनुष्ठानों और सी खासी घर की सारी जब तो इलाज में इस और रिमोट समझ नहीं आते ही था को सारे पहनती हूं', 'audio_clips\rec_20260106_203912.wav'),
-(52, 1, '2026-01-06 20:39:19', 'es', 'acusaré ante obras y mi piano violín chino', 'audio_clips\rec_20260106_203918.wav'),
-(53, 1, '2026-01-06 20:39:20', 'en', 'you can do not man', 'audio_clips\rec_20260106_203918.wav'),
-(54, 1, '2026-01-06 20:39:21', 'hi', 'इटली में पेड़ों के बीच जीना चाहता डबल मीनिंग नहीं चला', 'audio_clips\rec_20260106_203918.wav'),
-(55, 1, '2026-01-06 20:39:25', 'en', 'has happened to me i did', 'audio_clips\rec_20260106_203923.wav'),
-(56, 1, '2026-01-06 20:39:27', 'hi', 'जब कोई दूसरा चारा मध्यम और', 'audio_clips\rec_20260106_203923.wav'),
-(57, 1, '2026-01-06 20:39:27', 'es', 'cualquier a institución echado mandemos', 'audio_clips\rec_20260106_203923.wav'),
-(58, 1, '2026-01-06 20:39:32', 'en', 'the cited news channels and', 'audio_clips\rec_20260106_203932.wav'),
-(59, 1, '2026-01-06 20:39:37', 'es', 'mundos sin y usted no tiene un pretexto nada', 'audio_clips\rec_20260106_203937.wav'),
-(60, 1, '2026-01-06 20:39:43', 'en', 'is this don''t know why he wouldn''t i it has anything except that can', 'audio_clips\rec_20260106_203942.wav'),
-(61, 1, '2026-01-06 20:39:44', 'es', 'de ellas en un resaltar', 'audio_clips\rec_20260106_203942.wav'),
-(62, 1, '2026-01-06 20:39:44', 'hi', 'शब्दार्थ', 'audio_clips\rec_20260106_203942.wav'),
-(63, 1, '2026-01-06 20:39:55', 'hi', 'लेकिन से ऐसे ऐसे में दृष्टिगत दुष्कर्म का शिकार है', 'audio_clips\rec_20260106_203949.wav'),
-(64, 1, '2026-01-06 20:39:56', 'es', 'entonces tienes suerte se dan la sensación de su rubor', 'audio_clips\rec_20260106_203955.wav'),
-(65, 1, '2026-01-06 20:40:01', 'en', 'second plastered on and and it just doesn''t matter is is springboard business tax money could buy nine the news has nothing to be he just a million that', 'audio_clips\rec_20260106_204000.wav'),
-(66, 1, '2026-01-06 20:40:02', 'hi', 'कृष्ण मलिक तक यूजर्स ने जिस मिली', 'audio_clips\rec_20260106_204000.wav'),
-(67, 1, '2026-01-06 20:40:06', 'es', 'buena onda un máquinas de molienda que tienes coches', 'audio_clips\rec_20260106_204005.wav'),
-(68, 1, '2026-01-06 20:40:10', 'hi', 'अगर कुछ एकनाथ शिंदे सिटी से कुछ', 'audio_clips\rec_20260106_204009.wav'),
-(69, 1, '2026-01-06 20:40:11', 'en', 'which is a pursuing the cities or the computer at the just', 'audio_clips\rec_20260106_204009.wav'),
-(70, 1, '2026-01-06 20:40:15', 'hi', 'बीजेपी का मार्ग प्रशस्त रांची स्थित', 'audio_clips\rec_20260106_204013.wav'),
-(71, 1, '2026-01-06 20:40:16', 'es', 'tengan en el presente en sus necesidades', 'audio_clips\rec_20260106_204013.wav'),
-(72, 1, '2026-01-06 20:40:24', 'es', 'este cambios de pacto', 'audio_clips\rec_20260106_204017.wav'),
-(73, 1, '2026-01-06 20:40:26', 'hi', 'विशिष्ट में पैंतीस फीसदी और', 'audio_clips\rec_20260106_204024.wav'),
-(74, 1, '2026-01-06 20:40:30', 'es', 'si la empresa este pies', 'audio_clips\rec_20260106_204028.wav'),
-(75, 1, '2026-01-06 20:40:36', 'hi', 'सिस्टम एनपीएस में कुछ वर्षों में', 'audio_clips\rec_20260106_204034.wav'),
-(76, 1, '2026-01-06 20:40:37', 'en', 'my sister and his head office and anger focusing on this is than the bad news conference the johnson will soon as the assessing the emphasis to masters and an option of leaving this don''t let it be awesome because of news', 'audio_clips\rec_20260106_204034.wav'),
-(77, 1, '2026-01-06 20:40:41', 'hi', 'मुस्लिम लेने का जश्न होगा', 'audio_clips\rec_20260106_204039.wav'),
-(78, 1, '2026-01-06 20:40:47', 'es', 'no fechas cuando ochenta y siete ciudad de empleo', 'audio_clips\rec_20260106_204045.wav'),
-(79, 1, '2026-01-06 20:40:48', 'en', 'just imagine that she shake this know enough to states and build a new put an approaching', 'audio_clips\rec_20260106_204045.wav'),
-(80, 1, '2026-01-06 20:40:49', 'hi', 'कुछ देर शाम में पहुंची', 'audio_clips\rec_20260106_204045.wav'),
-(81, 1, '2026-01-06 20:40:56', 'es', 'ser color de sangre', 'audio_clips\rec_20260106_204049.wav'),
-(82, 1, '2026-01-06 20:40:57', 'en', 'cited news ten will cuddle and single about him', 'audio_clips\rec_20260106_204057.wav'),
-(83, 1, '2026-01-06 20:41:03', 'hi', 'वीडियो रिकॉर्ड करने में काफी रुचि से शो में हैं', 'audio_clips\rec_20260106_204103.wav'),
-(84, 1, '2026-01-06 20:41:07', 'en', 'can''t wait to see geomapping would be able to think i was going to sleep', 'audio_clips\rec_20260106_204103.wav'),
-(85, 1, '2026-01-06 20:41:12', 'es', 'galeno encimeras echen si son los que sufren los clientes de su cámara', 'audio_clips\rec_20260106_204108.wav'),
-(86, 1, '2026-01-06 20:41:12', 'hi', 'उसके कुछ भी नहीं सोचा', 'audio_clips\rec_20260106_204108.wav'),
-(87, 1, '2026-01-06 20:41:14', 'en', 'finally have such a lot of a partner said he has been going again', 'audio_clips\rec_20260106_204113.wav'),
-(88, 1, '2026-01-06 20:41:21', 'hi', 'होना के लिए अपनी', 'audio_clips\rec_20260106_204118.wav'),
-(89, 1, '2026-01-06 20:41:22', 'en', 'and the live on me he openings couldn''t use it', 'audio_clips\rec_20260106_204118.wav'),
-(90, 1, '2026-01-06 20:41:22', 'es', 'por eso ponemos fueran', 'audio_clips\rec_20260106_204118.wav'),
-(91, 1, '2026-01-06 20:41:27', 'es', 'discúlpenme sonrisa', 'audio_clips\rec_20260106_204123.wav'),
-(92, 1, '2026-01-06 20:41:29', 'hi', 'उनसे सकता था लेकिन कुछ सेकंड', 'audio_clips\rec_20260106_204128.wav'),
-(93, 1, '2026-01-06 20:41:29', 'en', 'except that he didn''t do anything to do so can we can now', 'audio_clips\rec_20260106_204128.wav'),
-(94, 1, '2026-01-06 20:41:33', 'en', 'i find it''s an epidemic that', 'audio_clips\rec_20260106_204130.wav'),
-(95, 1, '2026-01-06 20:41:34', 'es', 'para negado', 'audio_clips\rec_20260106_204130.wav'),
-(96, 1, '2026-01-06 20:41:37', 'hi', 'फोन को पता नहीं चला जाए', 'audio_clips\rec_20260106_204134.wav'),
-(97, 1, '2026-01-06 20:41:39', 'es', 'la población a irán al mes empezamos', 'audio_clips\rec_20260106_204134.wav'),
-(98, 1, '2026-01-06 20:41:44', 'en', 'peter and have one some of my name and i think of a tenant about forty seven hundred and eighty i''m just into', 'audio_clips\rec_20260106_204143.wav'),
-(99, 1, '2026-01-06 20:41:45', 'hi', 'व्यक्तिगत चैनल को भारत आने के कारण है', 'audio_clips\rec_20260106_204143.wav'),
-(100, 1, '2026-01-06 20:41:46', 'es', 'en anduvo fogones tapar al mes echar', 'audio_clips\rec_20260106_204143.wav'),
-(101, 1, '2026-01-06 20:41:55', 'en', 'for reading up i never wanted our time it''s not up', 'audio_clips\rec_20260106_204153.wav'),
-(102, 1, '2026-01-06 20:42:04', 'hi', 'मदीना को आप सुपर सुपर डीलक्स राजा बिस्तर को एक ने के जिस अनुसार निस्तारण न दे', 'audio_clips\rec_20260106_204158.wav'),
-(103, 1, '2026-01-06 20:42:04', 'en', 'everybody and he can i just signed a fan of idiot', 'audio_clips\rec_20260106_204204.wav'),
-(104, 1, '2026-01-06 20:42:15', 'hi', 'बाइबिल चैनल को उनके मोबाइल फोन भी स्कूल कर ली थी', 'audio_clips\rec_20260106_204214.wav'),
-(105, 1, '2026-01-06 20:42:20', 'en', 'hmm wanted to buy my lot more drilling and form of these gonna be to anything wasted time at ways to we did he put his name', 'audio_clips\rec_20260106_204218.wav'),
-(106, 1, '2026-01-06 20:42:21', 'es', 'charla manden al súper súper bética balance la mantiene está tan conjunta en un harían ni que fuera del pie estamos a endesa ganar un que tienen más grande del convento un baile en la muerte en el le fueron diez qne al decir cuestionar ventana finalmente un disco', 'audio_clips\rec_20260106_204218.wav'),
-(107, 1, '2026-01-06 20:42:21', 'hi', 'सिंगर में चाइना पॉलिसी कमेटी दे दी', 'audio_clips\rec_20260106_204218.wav'),
-(108, 1, '2026-01-06 20:42:27', 'en', 'una pizza', 'audio_clips\rec_20260106_204224.wav'),
-(109, 1, '2026-01-06 20:42:27', 'hi', 'सोनम कपूर ने फोड़े परीक्षण', 'audio_clips\rec_20260106_204224.wav'),
-(110, 1, '2026-01-06 20:42:39', 'en', 'and among many', 'audio_clips\rec_20260106_204236.wav'),
-(111, 1, '2026-01-06 20:42:43', 'en', 'there is no', 'audio_clips\rec_20260106_204240.wav'),
-(112, 1, '2026-01-06 20:42:46', 'hi', 'ट्रेडिशनल एशियन पेंट्स सिनेमा शूटिंग में', 'audio_clips\rec_20260106_204245.wav'),
-(113, 1, '2026-01-06 20:42:48', 'en', 'in many chasing in the going to be now', 'audio_clips\rec_20260106_204248.wav'),
-(114, 1, '2026-01-06 20:42:52', 'hi', 'इंटरनेट मीडिया इंटरनेट में लिप्त था', 'audio_clips\rec_20260106_204248.wav'),
-(115, 1, '2026-01-06 20:42:56', 'en', 'meme believe in a paper i mean the and couldn''t handle', 'audio_clips\rec_20260106_204252.wav'),
-(116, 1, '2026-01-06 20:43:01', 'hi', 'हिंदी दैनिक अनुच्छेदों का किसी रिश्तेदार या नहीं', 'audio_clips\rec_20260106_204258.wav'),
-(117, 1, '2026-01-06 20:43:01', 'en', 'a percentage of the edge mean', 'audio_clips\rec_20260106_204258.wav'),
-(118, 1, '2026-01-06 20:43:04', 'en', 'yang man', 'audio_clips\rec_20260106_204302.wav'),
-(119, 1, '2026-01-06 20:43:04', 'hi', 'दिया में', 'audio_clips\rec_20260106_204302.wav'),
-(120, 1, '2026-01-06 20:43:06', 'en', 'and i am i', 'audio_clips\rec_20260106_204306.wav'),
-(121, 1, '2026-01-06 20:43:09', 'en', 'you know', 'audio_clips\rec_20260106_204309.wav'),
-(122, 1, '2026-01-06 20:43:12', 'en', 'i am an innocent', 'audio_clips\rec_20260106_204309.wav'),
-(123, 1, '2026-01-06 20:43:14', 'en', 'each my be independent', 'audio_clips\rec_20260106_204313.wav'),
-(124, 1, '2026-01-06 20:43:15', 'hi', 'ही जब', 'audio_clips\rec_20260106_204313.wav'),
-(125, 1, '2026-01-06 20:43:22', 'en', 'oh and remember and i can show', 'audio_clips\rec_20260106_204322.wav'),
-(126, 1, '2026-01-06 20:43:27', 'en', 'when i miss them', 'audio_clips\rec_20260106_204325.wav'),
-(127, 1, '2026-01-06 20:43:29', 'es', 'y ahora', 'audio_clips\rec_20260106_204325.wav'),
-(128, 1, '2026-01-06 20:43:34', 'en', 'i think my only wish', 'audio_clips\rec_20260106_204333.wav'),
-(129, 1, '2026-01-06 20:43:36', 'hi', 'भारत में के को अपने प्रशिक्षण में बस', 'audio_clips\rec_20260106_204333.wav'),
-(130, 1, '2026-01-06 20:43:37', 'en', 'your honor', 'audio_clips\rec_20260106_204337.wav'),
-(131, 1, '2026-01-06 20:43:54', 'en', 'he was', 'audio_clips\rec_20260106_204352.wav'),
-(132, 1, '2026-01-06 20:44:06', 'hi', 'इंडियन मुजाहिदीन', 'audio_clips\rec_20260106_204404.wav'),
-(133, 1, '2026-01-06 20:44:08', 'en', 'yeah', 'audio_clips\rec_20260106_204407.wav'),
-(134, 1, '2026-01-06 20:44:09', 'hi', 'क्या होगा', 'audio_clips\rec_20260106_204407.wav'),
-(135, 1, '2026-01-06 20:44:14', 'es', 'película y', 'audio_clips\rec_20260106_204411.wav'),
-(136, 1, '2026-01-07 11:16:18', 'en', 'when when it', 'audio_clips\rec_20260107_111614.wav'),
-(137, 1, '2026-01-07 11:16:18', 'es', 'bueno por teléfono panteón amagando bueno con una mochila tenía la una teléfono parece', 'audio_clips\rec_20260107_111614.wav'),
-(138, 1, '2026-01-07 11:17:48', 'en', 'but', 'audio_clips\rec_20260107_111748.wav'),
-(139, 1, '2026-01-07 11:18:12', 'hi', 'था', 'audio_clips\rec_20260107_111810.wav'),
-(140, 1, '2026-01-09 22:25:00', 'en', 'huh', 'audio_clips\rec_20260109_222457.wav'),
-(141, 1, '2026-01-09 22:25:20', 'en', 'huh', 'audio_clips\rec_20260109_222518.wav'),
-(142, 1, '2026-01-09 22:25:40', 'en', 'huh', 'audio_clips\rec_20260109_222539.wav'),
-(143, 1, '2026-01-09 22:26:01', 'en', 'huh', 'audio_clips\rec_20260109_222600.wav'),
-(144, 1, '2026-01-09 22:26:21', 'en', 'huh', 'audio_clips\rec_20260109_222621.wav'),
-(145, 1, '2026-01-09 22:26:41', 'en', 'huh', 'audio_clips\rec_20260109_222639.wav'),
-(146, 1, '2026-01-09 22:27:02', 'en', 'huh', 'audio_clips\rec_20260109_222700.wav'),
-(147, 1, '2026-01-09 22:27:22', 'en', 'huh', 'audio_clips\rec_20260109_222721.wav'),
-(148, 1, '2026-01-09 22:27:43', 'en', 'huh', 'audio_clips\rec_20260109_222742.wav'),
-(149, 1, '2026-01-09 22:28:03', 'en', 'huh', 'audio_clips\rec_20260109_222803.wav'),
-(150, 1, '2026-01-09 22:28:23', 'en', 'huh', 'audio_clips\rec_20260109_222821.wav'),
-(151, 1, '2026-01-09 22:28:44', 'en', 'huh', 'audio_clips\rec_20260109_222842.wav'),
-(152, 1, '2026-01-09 22:29:04', 'en', 'huh', 'audio_clips\rec_20260109_222903.wav'),
-(153, 1, '2026-01-09 22:29:25', 'en', 'huh', 'audio_clips\rec_20260109_222924.wav'),
-(154, 1, '2026-01-09 22:29:45', 'en', 'huh', 'audio_clips\rec_20260109_222945.wav'),
-(155, 1, '2026-01-09 22:30:05', 'en', 'huh', 'audio_clips\rec_20260109_223003.wav'),
-(156, 1, '2026-01-09 22:30:26', 'en', 'huh', 'audio_clips\rec_20260109_223024.wav'),
-(157, 1, '2026-01-09 22:30:46', 'en', 'huh', 'audio_clips\rec_20260109_223045.wav'),
-(158, 1, '2026-01-21 11:52:21', 'en', 'huh', 'audio_clips\rec_20260121_115218.wav'),
-(159, 1, '2026-01-21 11:52:41', 'en', 'huh', 'audio_clips\rec_20260121_115239.wav'),
-(160, 1, '2026-01-21 11:53:01', 'en', 'huh', 'audio_clips\rec_20260121_115300.wav'),
-(161, 1, '2026-01-21 11:53:22', 'en', 'huh', 'audio_clips\rec_20260121_115321.wav'),
-(162, 1, '2026-01-21 11:53:42', 'en', 'huh', 'audio_clips\rec_20260121_115342.wav'),
-(163, 3, '2026-01-21 11:58:28', 'en', 'huh', 'audio_clips\rec_20260121_115826.wav'),
-(164, 3, '2026-01-21 11:58:49', 'en', 'huh', 'audio_clips\rec_20260121_115847.wav'),
-(165, 3, '2026-01-21 11:59:09', 'en', 'huh', 'audio_clips\rec_20260121_115908.wav'),
-(166, 3, '2026-01-21 11:59:29', 'en', 'huh', 'audio_clips\rec_20260121_115929.wav'),
-(167, 3, '2026-01-21 11:59:50', 'en', 'huh', 'audio_clips\rec_20260121_115950.wav'),
-(168, 3, '2026-01-21 12:00:10', 'en', 'huh', 'audio_clips\rec_20260121_120008.wav'),
-(169, 3, '2026-01-21 12:00:30', 'en', 'huh', 'audio_clips\rec_20260121_120029.wav'),
-(170, 3, '2026-01-21 12:00:51', 'en', 'huh', 'audio_clips\rec_20260121_120050.wav'),
-(171, 1, '2026-01-21 12:53:53', 'en', 'huh', 'audio_clips\rec_20260121_125351.wav'),
-(172, 1, '2026-01-21 12:54:14', 'en', 'huh', 'audio_clips\rec_20260121_125412.wav'),
-(173, 1, '2026-01-21 12:54:34', 'en', 'huh', 'audio_clips\rec_20260121_125433.wav'),
-(174, 1, '2026-01-21 12:54:54', 'en', 'huh', 'audio_clips\rec_20260121_125454.wav'),
-(175, 1, '2026-01-21 12:55:15', 'en', 'huh', 'audio_clips\rec_20260121_125515.wav'),
-(176, 1, '2026-01-21 12:55:35', 'en', 'huh', 'audio_clips\rec_20260121_125533.wav'),
-(177, 1, '2026-01-21 12:55:55', 'en', 'huh', 'audio_clips\rec_20260121_125554.wav'),
-(178, 1, '2026-01-21 12:56:16', 'en', 'huh', 'audio_clips\rec_20260121_125615.wav'),
-(179, 1, '2026-01-21 12:56:36', 'en', 'huh', 'audio_clips\rec_20260121_125636.wav'),
-(180, 1, '2026-01-21 12:56:57', 'en', 'huh', 'audio_clips\rec_20260121_125657.wav'),
-(181, 1, '2026-01-21 12:57:17', 'en', 'huh', 'audio_clips\rec_20260121_125715.wav'),
-(182, 1, '2026-01-21 12:57:37', 'en', 'huh', 'audio_clips\rec_20260121_125736.wav'),
-(183, 1, '2026-01-21 12:57:58', 'en', 'huh', 'audio_clips\rec_20260121_125757.wav'),
-(184, 1, '2026-01-21 12:58:18', 'en', 'huh', 'audio_clips\rec_20260121_125818.wav'),
-(185, 1, '2026-01-21 12:58:39', 'en', 'huh', 'audio_clips\rec_20260121_125839.wav'),
-(186, 1, '2026-01-21 12:58:59', 'en', 'huh', 'audio_clips\rec_20260121_125857.wav'),
-(187, 1, '2026-01-21 12:59:19', 'en', 'huh', 'audio_clips\rec_20260121_125918.wav'),
-(188, 1, '2026-01-21 12:59:40', 'en', 'huh', 'audio_clips\rec_20260121_125939.wav'),
-(189, 1, '2026-01-21 13:03:47', 'en', 'huh', 'audio_clips\rec_20260121_130345.wav'),
-(190, 1, '2026-01-21 13:04:07', 'en', 'huh', 'audio_clips\rec_20260121_130406.wav'),
-(191, 1, '2026-01-21 13:04:27', 'en', 'huh', 'audio_clips\rec_20260121_130427.wav'),
-(192, 1, '2026-01-21 13:04:48', 'en', 'huh', 'audio_clips\rec_20260121_130448.wav'),
-(193, 1, '2026-01-21 13:05:08', 'en', 'huh', 'audio_clips\rec_20260121_130506.wav'),
-(194, 1, '2026-01-21 13:05:28', 'en', 'huh', 'audio_clips\rec_20260121_130527.wav'),
-(195, 1, '2026-01-21 13:05:49', 'en', 'huh', 'audio_clips\rec_20260121_130548.wav'),
-(196, 1, '2026-01-21 13:06:09', 'en', 'huh', 'audio_clips\rec_20260121_130609.wav'),
-(197, 1, '2026-01-21 13:06:29', 'en', 'huh', 'audio_clips\rec_20260121_130627.wav'),
-(198, 1, '2026-01-21 13:06:50', 'en', 'huh', 'audio_clips\rec_20260121_130648.wav'),
-(199, 1, '2026-01-21 13:07:10', 'en', 'huh', 'audio_clips\rec_20260121_130709.wav'),
-(200, 1, '2026-01-21 13:07:31', 'en', 'huh', 'audio_clips\rec_20260121_130730.wav'),
-(201, 1, '2026-01-21 13:07:51', 'en', 'huh', 'audio_clips\rec_20260121_130751.wav'),
-(202, 1, '2026-01-21 13:08:11', 'en', 'huh', 'audio_clips\rec_20260121_130809.wav'),
-(203, 1, '2026-01-21 13:08:32', 'en', 'huh', 'audio_clips\rec_20260121_130830.wav'),
-(204, 1, '2026-01-21 13:08:52', 'en', 'huh', 'audio_clips\rec_20260121_130851.wav'),
-(205, 1, '2026-01-21 13:09:13', 'en', 'huh', 'audio_clips\rec_20260121_130912.wav'),
-(206, 1, '2026-01-21 13:09:33', 'en', 'huh', 'audio_clips\rec_20260121_130933.wav'),
-(207, 1, '2026-01-21 13:09:53', 'en', 'huh', 'audio_clips\rec_20260121_130951.wav'),
-(208, 1, '2026-01-21 13:13:35', 'en', 'huh', 'audio_clips\rec_20260121_131333.wav'),
-(209, 1, '2026-01-21 13:13:55', 'en', 'huh', 'audio_clips\rec_20260121_131354.wav'),
-(210, 1, '2026-01-21 13:14:15', 'en', 'huh', 'audio_clips\rec_20260121_131415.wav'),
-(211, 1, '2026-01-21 13:14:36', 'en', 'huh', 'audio_clips\rec_20260121_131436.wav'),
-(212, 1, '2026-01-21 13:14:56', 'en', 'huh', 'audio_clips\rec_20260121_131454.wav'),
-(213, 1, '2026-01-21 13:15:16', 'en', 'huh', 'audio_clips\rec_20260121_131515.wav'),
-(214, 1, '2026-01-21 13:15:37', 'en', 'huh', 'audio_clips\rec_20260121_131536.wav'),
-(215, 1, '2026-01-21 13:15:57', 'en', 'huh', 'audio_clips\rec_20260121_131557.wav'),
-(216, 1, '2026-01-21 13:16:18', 'en', 'huh', 'audio_clips\rec_20260121_131618.wav'),
-(217, 1, '2026-01-21 13:16:38', 'en', 'huh', 'audio_clips\rec_20260121_131636.wav'),
-(218, 1, '2026-01-21 13:16:58', 'en', 'huh', 'audio_clips\rec_20260121_131657.wav'),
-(219, 1, '2026-01-21 13:17:19', 'en', 'huh', 'audio_clips\rec_20260121_131718.wav'),
-(220, 1, '2026-01-21 13:17:39', 'en', 'huh', 'audio_clips\rec_20260121_131739.wav'),
-(221, 1, '2026-01-21 13:18:00', 'en', 'huh', 'audio_clips\rec_20260121_131800.wav'),
-(222, 1, '2026-01-21 13:18:20', 'en', 'huh', 'audio_clips\rec_20260121_131818.wav'),
-(223, 1, '2026-01-21 13:18:40', 'en', 'huh', 'audio_clips\rec_20260121_131839.wav'),
-(224, 1, '2026-01-21 13:19:01', 'en', 'huh', 'audio_clips\rec_20260121_131900.wav'),
-(225, 1, '2026-01-21 13:19:21', 'en', 'huh', 'audio_clips\rec_20260121_131921.wav'),
-(226, 1, '2026-01-21 13:19:42', 'en', 'huh', 'audio_clips\rec_20260121_131942.wav'),
-(227, 1, '2026-01-21 13:20:02', 'en', 'huh', 'audio_clips\rec_20260121_132000.wav'),
-(228, 1, '2026-01-21 13:23:33', 'en', 'huh', 'audio_clips\rec_20260121_132333.wav'),
-(229, 1, '2026-01-21 13:23:54', 'en', 'huh', 'audio_clips\rec_20260121_132354.wav'),
-(230, 1, '2026-01-21 13:24:14', 'en', 'huh', 'audio_clips\rec_20260121_132412.wav'),
-(231, 1, '2026-01-21 13:24:34', 'en', 'huh', 'audio_clips\rec_20260121_132433.wav'),
-(232, 1, '2026-01-21 13:24:54', 'en', 'huh', 'audio_clips\rec_20260121_132454.wav'),
-(233, 1, '2026-01-21 13:25:15', 'en', 'huh', 'audio_clips\rec_20260121_132515.wav'),
-(234, 1, '2026-01-21 13:25:35', 'en', 'huh', 'audio_clips\rec_20260121_132533.wav'),
-(235, 1, '2026-01-21 13:25:55', 'en', 'huh', 'audio_clips\rec_20260121_132554.wav'),
-(236, 1, '2026-01-21 13:26:16', 'en', 'huh', 'audio_clips\rec_20260121_132615.wav'),
-(237, 1, '2026-01-21 13:26:36', 'en', 'huh', 'audio_clips\rec_20260121_132636.wav'),
-(238, 1, '2026-01-21 13:26:57', 'en', 'huh', 'audio_clips\rec_20260121_132657.wav'),
-(239, 1, '2026-01-21 13:27:17', 'en', 'huh', 'audio_clips\rec_20260121_132715.wav'),
-(240, 1, '2026-01-21 13:27:37', 'en', 'huh', 'audio_clips\rec_20260121_132736.wav'),
-(241, 1, '2026-01-21 13:27:58', 'en', 'huh', 'audio_clips\rec_20260121_132757.wav'),
-(242, 1, '2026-01-21 13:28:18', 'en', 'huh', 'audio_clips\rec_20260121_132818.wav'),
-(243, 1, '2026-01-21 13:28:39', 'en', 'huh', 'audio_clips\rec_20260121_132839.wav'),
-(244, 1, '2026-01-21 13:28:59', 'en', 'huh', 'audio_clips\rec_20260121_132857.wav'),
-(245, 1, '2026-01-21 13:29:19', 'en', 'huh', 'audio_clips\rec_20260121_132918.wav'),
-(246, 1, '2026-01-21 13:29:40', 'en', 'huh', 'audio_clips\rec_20260121_132939.wav'),
-(247, 1, '2026-01-21 13:30:00', 'en', 'huh', 'audio_clips\rec_20260121_133000.wav'),
-(248, 1, '2026-01-21 13:30:21', 'en', 'huh', 'audio_clips\rec_20260121_133021.wav'),
-(249, 1, '2026-01-21 13:34:28', 'en', 'huh', 'audio_clips\rec_20260121_133427.wav'),
-(250, 1, '2026-01-21 13:34:48', 'en', 'huh', 'audio_clips\rec_20260121_133448.wav'),
-(251, 1, '2026-01-21 13:35:08', 'en', 'huh', 'audio_clips\rec_20260121_133506.wav'),
-(252, 1, '2026-01-21 13:35:29', 'en', 'huh', 'audio_clips\rec_20260121_133527.wav'),
-(253, 1, '2026-01-21 13:35:49', 'en', 'huh', 'audio_clips\rec_20260121_133548.wav'),
-(254, 1, '2026-01-21 13:36:09', 'en', 'huh', 'audio_clips\rec_20260121_133609.wav'),
-(255, 1, '2026-01-21 13:36:30', 'en', 'huh', 'audio_clips\rec_20260121_133630.wav'),
-(256, 1, '2026-01-21 13:36:50', 'en', 'huh', 'audio_clips\rec_20260121_133648.wav'),
-(257, 1, '2026-01-21 13:37:10', 'en', 'huh', 'audio_clips\rec_20260121_133709.wav'),
-(258, 1, '2026-01-21 13:37:31', 'en', 'huh', 'audio_clips\rec_20260121_133730.wav'),
-(259, 1, '2026-01-21 13:37:51', 'en', 'huh', 'audio_clips\rec_20260121_133751.wav'),
-(260, 1, '2026-01-21 13:38:12', 'en', 'huh', 'audio_clips\rec_20260121_133812.wav'),
-(261, 1, '2026-01-21 13:38:32', 'en', 'huh', 'audio_clips\rec_20260121_133830.wav'),
-(262, 1, '2026-01-21 13:38:52', 'en', 'huh', 'audio_clips\rec_20260121_133851.wav'),
-(263, 1, '2026-01-21 13:39:13', 'en', 'huh', 'audio_clips\rec_20260121_133912.wav'),
-(264, 1, '2026-01-21 13:39:33', 'en', 'huh', 'audio_clips\rec_20260121_133933.wav'),
-(265, 1, '2026-01-21 13:39:54', 'en', 'huh', 'audio_clips\rec_20260121_133954.wav'),
-(266, 1, '2026-01-21 13:40:14', 'en', 'huh', 'audio_clips\rec_20260121_134012.wav'),
-(267, 1, '2026-01-21 13:40:34', 'en', 'huh', 'audio_clips\rec_20260121_134033.wav'),
-(268, 1, '2026-01-21 13:43:24', 'en', 'huh', 'audio_clips\rec_20260121_134324.wav'),
-(269, 1, '2026-01-21 13:43:44', 'en', 'huh', 'audio_clips\rec_20260121_134342.wav'),
-(270, 1, '2026-01-21 13:44:05', 'en', 'huh', 'audio_clips\rec_20260121_134403.wav'),
-(271, 1, '2026-01-21 13:44:25', 'en', 'huh', 'audio_clips\rec_20260121_134424.wav'),
-(272, 1, '2026-01-21 13:44:45', 'en', 'huh', 'audio_clips\rec_20260121_134445.wav'),
-(273, 1, '2026-01-21 13:45:06', 'en', 'huh', 'audio_clips\rec_20260121_134506.wav'),
-(274, 1, '2026-01-21 13:45:26', 'en', 'huh', 'audio_clips\rec_20260121_134524.wav'),
-(275, 1, '2026-01-21 13:45:47', 'en', 'huh', 'audio_clips\rec_20260121_134545.wav'),
-(276, 1, '2026-01-21 13:46:07', 'en', 'huh', 'audio_clips\rec_20260121_134606.wav'),
-(277, 1, '2026-01-21 13:46:27', 'en', 'huh', 'audio_clips\rec_20260121_134627.wav'),
-(278, 1, '2026-01-21 13:46:48', 'en', 'huh', 'audio_clips\rec_20260121_134648.wav'),
-(279, 1, '2026-01-21 13:47:08', 'en', 'huh', 'audio_clips\rec_20260121_134706.wav'),
-(280, 1, '2026-01-21 13:47:29', 'en', 'huh', 'audio_clips\rec_20260121_134727.wav'),
-(281, 1, '2026-01-21 13:47:49', 'en', 'huh', 'audio_clips\rec_20260121_134748.wav'),
-(282, 1, '2026-01-21 13:48:09', 'en', 'huh', 'audio_clips\rec_20260121_134809.wav'),
-(283, 1, '2026-01-21 13:48:30', 'en', 'huh', 'audio_clips\rec_20260121_134830.wav'),
-(284, 1, '2026-01-21 13:48:50', 'en', 'huh', 'audio_clips\rec_20260121_134848.wav'),
-(285, 1, '2026-01-21 13:49:11', 'en', 'huh', 'audio_clips\rec_20260121_134909.wav'),
-(286, 1, '2026-01-21 13:49:31', 'en', 'huh', 'audio_clips\rec_20260121_134930.wav'),
-(287, 1, '2026-01-21 13:49:54', 'en', 'huh', 'audio_clips\rec_20260121_134954.wav'),
-(288, 1, '2026-01-21 13:50:15', 'en', 'huh', 'audio_clips\rec_20260121_135015.wav'),
-(289, 1, '2026-01-21 13:50:35', 'en', 'huh', 'audio_clips\rec_20260121_135033.wav'),
-(290, 1, '2026-01-21 13:50:56', 'en', 'huh', 'audio_clips\rec_20260121_135054.wav'),
-(291, 1, '2026-01-21 13:54:32', 'en', 'huh', 'audio_clips\rec_20260121_135430.wav'),
-(292, 1, '2026-01-21 13:54:53', 'en', 'huh', 'audio_clips\rec_20260121_135451.wav'),
-(293, 1, '2026-01-21 13:55:13', 'en', 'huh', 'audio_clips\rec_20260121_135512.wav'),
-(294, 1, '2026-01-21 13:55:33', 'en', 'huh', 'audio_clips\rec_20260121_135533.wav'),
-(295, 1, '2026-01-21 13:55:54', 'en', 'huh', 'audio_clips\rec_20260121_135554.wav'),
-(296, 1, '2026-01-21 13:56:14', 'en', 'huh', 'audio_clips\rec_20260121_135612.wav'),
-(297, 1, '2026-01-21 13:56:35', 'en', 'huh', 'audio_clips\rec_20260121_135633.wav'),
-(298, 1, '2026-01-21 13:56:55', 'en', 'huh', 'audio_clips\rec_20260121_135654.wav'),
-(299, 1, '2026-01-21 13:57:15', 'en', 'huh', 'audio_clips\rec_20260121_135715.wav'),
-(300, 1, '2026-01-21 13:57:36', 'en', 'huh', 'audio_clips\rec_20260121_135736.wav'),
-(301, 1, '2026-01-21 13:57:56', 'en', 'huh', 'audio_clips\rec_20260121_135754.wav'),
-(302, 1, '2026-01-21 13:58:17', 'en', 'huh', 'audio_clips\rec_20260121_135815.wav'),
-(303, 1, '2026-01-21 13:58:37', 'en', 'huh', 'audio_clips\rec_20260121_135836.wav'),
-(304, 1, '2026-01-21 13:58:57', 'en', 'huh', 'audio_clips\rec_20260121_135857.wav'),
-(305, 1, '2026-01-21 13:59:18', 'en', 'huh', 'audio_clips\rec_20260121_135918.wav'),
-(306, 1, '2026-01-21 13:59:38', 'en', 'huh', 'audio_clips\rec_20260121_135936.wav'),
-(307, 1, '2026-01-21 13:59:59', 'en', 'huh', 'audio_clips\rec_20260121_135957.wav'),
-(308, 1, '2026-01-21 14:00:19', 'en', 'huh', 'audio_clips\rec_20260121_140018.wav'),
-(309, 1, '2026-01-21 14:00:39', 'en', 'huh', 'audio_clips\rec_20260121_140039.wav'),
-(310, 1, '2026-01-21 14:01:00', 'en', 'huh', 'audio_clips\rec_20260121_140100.wav'),
-(311, 1, '2026-01-21 14:03:55', 'en', 'huh', 'audio_clips\rec_20260121_140354.wav'),
-(312, 1, '2026-01-21 14:04:15', 'en', 'huh', 'audio_clips\rec_20260121_140415.wav'),
-(313, 1, '2026-01-21 14:04:35', 'en', 'huh', 'audio_clips\rec_20260121_140433.wav'),
-(314, 1, '2026-01-21 14:04:56', 'en', 'huh', 'audio_clips\rec_20260121_140454.wav'),
-(315, 1, '2026-01-21 14:05:16', 'en', 'huh', 'audio_clips\rec_20260121_140515.wav'),
-(316, 1, '2026-01-21 14:05:36', 'en', 'huh', 'audio_clips\rec_20260121_140536.wav'),
-(317, 1, '2026-01-21 14:05:57', 'en', 'huh', 'audio_clips\rec_20260121_140557.wav'),
-(318, 1, '2026-01-21 14:06:17', 'en', 'huh', 'audio_clips\rec_20260121_140615.wav'),
-(319, 1, '2026-01-21 14:06:37', 'en', 'huh', 'audio_clips\rec_20260121_140636.wav'),
-(320, 1, '2026-01-21 14:06:58', 'en', 'huh', 'audio_clips\rec_20260121_140657.wav'),
-(321, 1, '2026-01-21 14:07:18', 'en', 'huh', 'audio_clips\rec_20260121_140718.wav'),
-(322, 1, '2026-01-21 14:07:39', 'en', 'huh', 'audio_clips\rec_20260121_140739.wav'),
-(323, 1, '2026-01-21 14:07:59', 'en', 'huh', 'audio_clips\rec_20260121_140757.wav'),
-(324, 1, '2026-01-21 14:08:19', 'en', 'huh', 'audio_clips\rec_20260121_140818.wav'),
-(325, 1, '2026-01-21 14:08:40', 'en', 'huh', 'audio_clips\rec_20260121_140839.wav'),
-(326, 1, '2026-01-21 14:09:00', 'en', 'huh', 'audio_clips\rec_20260121_140900.wav'),
-(327, 1, '2026-01-21 14:09:21', 'en', 'huh', 'audio_clips\rec_20260121_140921.wav'),
-(328, 1, '2026-01-21 14:09:41', 'en', 'huh', 'audio_clips\rec_20260121_140939.wav'),
-(329, 1, '2026-01-21 14:10:01', 'en', 'huh', 'audio_clips\rec_20260121_141000.wav'),
-(330, 1, '2026-01-21 14:10:22', 'en', 'huh', 'audio_clips\rec_20260121_141021.wav'),
-(331, 1, '2026-01-21 14:10:42', 'en', 'huh', 'audio_clips\rec_20260121_141042.wav'),
-(332, 1, '2026-01-21 14:11:03', 'en', 'huh', 'audio_clips\rec_20260121_141103.wav'),
-(333, 1, '2026-01-21 14:13:58', 'en', 'huh', 'audio_clips\rec_20260121_141357.wav'),
-(334, 1, '2026-01-21 14:14:18', 'en', 'huh', 'audio_clips\rec_20260121_141418.wav'),
-(335, 1, '2026-01-21 14:14:38', 'en', 'huh', 'audio_clips\rec_20260121_141436.wav'),
-(336, 1, '2026-01-21 14:14:59', 'en', 'huh', 'audio_clips\rec_20260121_141457.wav'),
-(337, 1, '2026-01-21 14:15:19', 'en', 'huh', 'audio_clips\rec_20260121_141518.wav'),
-(338, 1, '2026-01-21 14:15:39', 'en', 'huh', 'audio_clips\rec_20260121_141539.wav'),
-(339, 1, '2026-01-21 14:16:00', 'en', 'huh', 'audio_clips\rec_20260121_141600.wav'),
-(340, 1, '2026-01-21 14:16:20', 'en', 'huh', 'audio_clips\rec_20260121_141618.wav'),
-(341, 1, '2026-01-21 14:16:40', 'en', 'huh', 'audio_clips\rec_20260121_141639.wav'),
-(342, 1, '2026-01-21 14:17:01', 'en', 'huh', 'audio_clips\rec_20260121_141700.wav'),
-(343, 1, '2026-01-21 14:17:21', 'en', 'huh', 'audio_clips\rec_20260121_141721.wav'),
-(344, 1, '2026-01-21 14:17:42', 'en', 'huh', 'audio_clips\rec_20260121_141742.wav'),
-(345, 1, '2026-01-21 14:18:02', 'en', 'huh', 'audio_clips\rec_20260121_141800.wav'),
-(346, 1, '2026-01-21 14:18:22', 'en', 'huh', 'audio_clips\rec_20260121_141821.wav'),
-(347, 1, '2026-01-21 14:18:43', 'en', 'huh', 'audio_clips\rec_20260121_141842.wav'),
-(348, 1, '2026-01-21 14:19:03', 'en', 'huh', 'audio_clips\rec_20260121_141903.wav'),
-(349, 1, '2026-01-21 14:19:24', 'en', 'huh', 'audio_clips\rec_20260121_141924.wav'),
-(350, 1, '2026-01-21 14:19:44', 'en', 'huh', 'audio_clips\rec_20260121_141942.wav'),
-(351, 1, '2026-01-21 14:20:04', 'en', 'huh', 'audio_clips\rec_20260121_142003.wav'),
-(352, 1, '2026-01-21 14:20:25', 'en', 'huh', 'audio_clips\rec_20260121_142024.wav'),
-(353, 1, '2026-01-21 14:20:45', 'en', 'huh', 'audio_clips\rec_20260121_142045.wav'),
-(354, 1, '2026-01-21 14:21:06', 'en', 'huh', 'audio_clips\rec_20260121_142106.wav'),
-(355, 1, '2026-01-21 14:24:16', 'en', 'huh', 'audio_clips\rec_20260121_142415.wav'),
-(356, 1, '2026-01-21 14:24:37', 'en', 'huh', 'audio_clips\rec_20260121_142436.wav'),
-(357, 1, '2026-01-21 14:24:57', 'en', 'huh', 'audio_clips\rec_20260121_142457.wav'),
-(358, 1, '2026-01-21 14:25:17', 'en', 'huh', 'audio_clips\rec_20260121_142515.wav'),
-(359, 1, '2026-01-21 14:25:38', 'en', 'huh', 'audio_clips\rec_20260121_142536.wav'),
-(360, 1, '2026-01-21 14:25:58', 'en', 'huh', 'audio_clips\rec_20260121_142557.wav'),
-(361, 1, '2026-01-21 14:26:18', 'en', 'huh', 'audio_clips\rec_20260121_142618.wav'),
-(362, 1, '2026-01-21 14:26:39', 'en', 'huh', 'audio_clips\rec_20260121_142639.wav'),
-(363, 1, '2026-01-21 14:26:59', 'en', 'huh', 'audio_clips\rec_20260121_142657.wav'),
-(364, 1, '2026-01-21 14:27:19', 'en', 'huh', 'audio_clips\rec_20260121_142718.wav'),
-(365, 1, '2026-01-21 14:27:40', 'en', 'huh', 'audio_clips\rec_20260121_142739.wav'),
-(366, 1, '2026-01-21 14:28:00', 'en', 'huh', 'audio_clips\rec_20260121_142800.wav'),
-(367, 1, '2026-01-21 14:28:21', 'en', 'huh', 'audio_clips\rec_20260121_142821.wav'),
-(368, 1, '2026-01-21 14:28:41', 'en', 'huh', 'audio_clips\rec_20260121_142839.wav'),
-(369, 1, '2026-01-21 14:29:01', 'en', 'huh', 'audio_clips\rec_20260121_142900.wav'),
-(370, 1, '2026-01-21 14:29:22', 'en', 'huh', 'audio_clips\rec_20260121_142921.wav'),
-(371, 1, '2026-01-21 14:29:42', 'en', 'huh', 'audio_clips\rec_20260121_142942.wav'),
-(372, 1, '2026-01-21 14:30:03', 'en', 'huh', 'audio_clips\rec_20260121_143003.wav'),
-(373, 1, '2026-01-21 14:30:23', 'en', 'huh', 'audio_clips\rec_20260121_143021.wav'),
-(374, 1, '2026-01-21 14:30:43', 'en', 'huh', 'audio_clips\rec_20260121_143042.wav'),
-(375, 1, '2026-01-21 14:31:04', 'en', 'huh', 'audio_clips\rec_20260121_143103.wav'),
-(376, 1, '2026-01-21 14:31:24', 'en', 'huh', 'audio_clips\rec_20260121_143124.wav'),
-(377, 1, '2026-01-21 14:35:16', 'en', 'huh', 'audio_clips\rec_20260121_143515.wav'),
-(378, 1, '2026-01-21 14:35:37', 'en', 'huh', 'audio_clips\rec_20260121_143536.wav'),
-(379, 1, '2026-01-21 14:35:57', 'en', 'huh', 'audio_clips\rec_20260121_143557.wav'),
-(380, 1, '2026-01-21 14:36:17', 'en', 'huh', 'audio_clips\rec_20260121_143615.wav'),
-(381, 1, '2026-01-21 14:36:38', 'en', 'huh', 'audio_clips\rec_20260121_143636.wav'),
-(382, 1, '2026-01-21 14:36:58', 'en', 'huh', 'audio_clips\rec_20260121_143657.wav'),
-(383, 1, '2026-01-21 14:37:19', 'en', 'huh', 'audio_clips\rec_20260121_143718.wav'),
-(384, 1, '2026-01-21 14:37:39', 'en', 'huh', 'audio_clips\rec_20260121_143739.wav'),
-(385, 1, '2026-01-21 14:37:59', 'en', 'huh', 'audio_clips\rec_20260121_143757.wav'),
-(386, 1, '2026-01-21 14:38:20', 'en', 'huh', 'audio_clips\rec_20260121_143818.wav'),
-(387, 1, '2026-01-21 14:38:40', 'en', 'huh', 'audio_clips\rec_20260121_143839.wav'),
-(388, 1, '2026-01-21 14:39:01', 'en', 'huh', 'audio_clips\rec_20260121_143900.wav'),
-(389, 1, '2026-01-21 14:39:21', 'en', 'huh', 'audio_clips\rec_20260121_143921.wav'),
-(390, 1, '2026-01-21 14:39:41', 'en', 'huh', 'audio_clips\rec_20260121_143939.wav'),
-(391, 1, '2026-01-21 14:40:02', 'en', 'huh', 'audio_clips\rec_20260121_144000.wav'),
-(392, 1, '2026-01-21 14:40:22', 'en', 'huh', 'audio_clips\rec_20260121_144021.wav'),
-(393, 1, '2026-01-21 14:40:43', 'en', 'huh', 'audio_clips\rec_20260121_144042.wav'),
-(394, 1, '2026-01-21 14:41:03', 'en', 'huh', 'audio_clips\rec_20260121_144103.wav'),
-(395, 1, '2026-01-21 14:41:23', 'en', 'huh', 'audio_clips\rec_20260121_144121.wav'),
-(396, 1, '2026-01-21 14:41:44', 'en', 'huh', 'audio_clips\rec_20260121_144142.wav'),
-(397, 1, '2026-01-21 14:44:54', 'en', 'huh', 'audio_clips\rec_20260121_144454.wav'),
-(398, 1, '2026-01-21 14:45:15', 'en', 'huh', 'audio_clips\rec_20260121_144515.wav'),
-(399, 1, '2026-01-21 14:45:35', 'en', 'huh', 'audio_clips\rec_20260121_144533.wav'),
-(400, 1, '2026-01-21 14:45:55', 'en', 'huh', 'audio_clips\rec_20260121_144554.wav'),
-(401, 1, '2026-01-21 14:46:16', 'en', 'huh', 'audio_clips\rec_20260121_144615.wav'),
-(402, 1, '2026-01-21 14:46:36', 'en', 'huh', 'audio_clips\rec_20260121_144636.wav'),
-(403, 1, '2026-01-21 14:46:56', 'en', 'huh', 'audio_clips\rec_20260121_144654.wav'),
-(404, 1, '2026-01-21 14:47:17', 'en', 'huh', 'audio_clips\rec_20260121_144715.wav'),
-(405, 1, '2026-01-21 14:47:37', 'en', 'huh', 'audio_clips\rec_20260121_144736.wav'),
-(406, 1, '2026-01-21 14:47:57', 'en', 'huh', 'audio_clips\rec_20260121_144757.wav'),
-(407, 1, '2026-01-21 14:48:18', 'en', 'huh', 'audio_clips\rec_20260121_144818.wav'),
-(408, 1, '2026-01-21 14:48:38', 'en', 'huh', 'audio_clips\rec_20260121_144836.wav'),
-(409, 1, '2026-01-21 14:48:59', 'en', 'huh', 'audio_clips\rec_20260121_144857.wav'),
-(410, 1, '2026-01-21 14:49:19', 'en', 'huh', 'audio_clips\rec_20260121_144918.wav'),
-(411, 1, '2026-01-21 14:49:41', 'en', 'huh', 'audio_clips\rec_20260121_144941.wav'),
-(412, 1, '2026-01-21 14:50:02', 'en', 'huh', 'audio_clips\rec_20260121_145002.wav'),
-(413, 1, '2026-01-21 14:50:22', 'en', 'huh', 'audio_clips\rec_20260121_145020.wav'),
-(414, 1, '2026-01-21 14:50:43', 'en', 'huh', 'audio_clips\rec_20260121_145041.wav'),
-(415, 5, '2026-02-03 13:44:52', 'en', 'time', 'audio_clips\rec_20260203_134451.wav'),
-(416, 5, '2026-02-03 13:44:58', 'en', 'know', 'audio_clips\rec_20260203_134457.wav'),
-(417, 5, '2026-02-03 13:45:03', 'en', 'guy', 'audio_clips\rec_20260203_134500.wav'),
-(418, 5, '2026-02-03 13:45:08', 'en', 'but', 'audio_clips\rec_20260203_134506.wav'),
-(419, 5, '2026-02-03 13:45:10', 'hi', 'भला', 'audio_clips\rec_20260203_134509.wav'),
-(420, 5, '2026-02-03 13:45:18', 'en', 'gasoline', 'audio_clips\rec_20260203_134515.wav'),
-(421, 5, '2026-02-03 13:45:18', 'hi', 'क्या', 'audio_clips\rec_20260203_134518.wav'),
-(422, 5, '2026-02-03 13:45:23', 'en', 'life', 'audio_clips\rec_20260203_134521.wav'),
-(423, 5, '2026-02-03 13:45:28', 'en', 'really', 'audio_clips\rec_20260203_134527.wav'),
-(424, 5, '2026-02-03 13:45:45', 'en', 'hello how do you do', 'audio_clips\rec_20260203_134542.wav'),
-(425, 5, '2026-02-03 13:45:45', 'hi', 'वीडियो', 'audio_clips\rec_20260203_134542.wav'),
-(426, 5, '2026-02-03 13:46:01', 'en', 'hello how do you do', 'audio_clips\rec_20260203_134600.wav'),
-(427, 5, '2026-02-03 13:46:01', 'hi', 'सऊदी', 'audio_clips\rec_20260203_134600.wav'),
-(428, 5, '2026-02-03 13:46:28', 'en', 'because it was', 'audio_clips\rec_20260203_134627.wav'),
-(429, 5, '2026-02-03 13:46:32', 'en', 'hello', 'audio_clips\rec_20260203_134630.wav'),
-(430, 5, '2026-02-03 13:46:35', 'en', 'how do you do and i''m in', 'audio_clips\rec_20260203_134633.wav'),
-(431, 5, '2026-02-03 13:46:37', 'hi', 'हमने', 'audio_clips\rec_20260203_134636.wav'),
-(432, 5, '2026-02-03 13:46:40', 'en', 'i''m reading', 'audio_clips\rec_20260203_134639.wav'),
-(433, 5, '2026-02-03 13:46:41', 'hi', 'विभिन्न', 'audio_clips\rec_20260203_134639.wav'),
-(434, 5, '2026-02-03 13:46:43', 'en', 'to get us', 'audio_clips\rec_20260203_134642.wav'),
-(435, 5, '2026-02-03 13:46:44', 'es', 'que', 'audio_clips\rec_20260203_134642.wav'),
-(436, 5, '2026-02-03 13:46:46', 'es', 'los noventa y tres', 'audio_clips\rec_20260203_134645.wav'),
-(437, 5, '2026-02-03 13:46:47', 'hi', 'हो रहा हैं', 'audio_clips\rec_20260203_134645.wav'),
-(438, 5, '2026-02-03 13:46:48', 'en', 'i am monday don''t want to get under your bed anyway', 'audio_clips\rec_20260203_134645.wav'),
-(439, 5, '2026-02-03 13:46:48', 'hi', 'ट्रिब्यूनल', 'audio_clips\rec_20260203_134645.wav'),
-(440, 5, '2026-02-03 13:46:49', 'en', 'another', 'audio_clips\rec_20260203_134649.wav'),
-(441, 5, '2026-02-03 13:46:51', 'es', 'en este mercado', 'audio_clips\rec_20260203_134649.wav'),
-(442, 5, '2026-02-03 13:46:53', 'en', 'shipping a', 'audio_clips\rec_20260203_134651.wav'),
-(443, 5, '2026-02-03 13:46:56', 'en', 'you know', 'audio_clips\rec_20260203_134654.wav'),
-(444, 5, '2026-02-03 13:46:59', 'en', 'you know lot heading', 'audio_clips\rec_20260203_134657.wav'),
-(445, 5, '2026-02-03 13:46:59', 'es', 'la navarra haré', 'audio_clips\rec_20260203_134657.wav'),
-(446, 5, '2026-02-03 13:46:59', 'hi', 'हेलेन हमारा अरे', 'audio_clips\rec_20260203_134657.wav'),
-(447, 5, '2026-02-03 13:47:02', 'en', 'the company of', 'audio_clips\rec_20260203_134700.wav'),
-(448, 5, '2026-02-03 13:47:02', 'es', 'este compañía', 'audio_clips\rec_20260203_134700.wav'),
-(449, 5, '2026-02-03 13:47:05', 'hi', 'अन्य और', 'audio_clips\rec_20260203_134703.wav'),
-(450, 5, '2026-02-03 13:47:05', 'en', 'or neighbor', 'audio_clips\rec_20260203_134703.wav'),
-(451, 5, '2026-02-03 13:47:15', 'en', 'what tomatoes', 'audio_clips\rec_20260203_134712.wav'),
-(452, 5, '2026-02-03 13:47:15', 'es', 'por ganaderos', 'audio_clips\rec_20260203_134712.wav'),
-(453, 5, '2026-02-03 13:47:17', 'en', 'it would work', 'audio_clips\rec_20260203_134715.wav'),
-(454, 5, '2026-02-03 13:47:20', 'hi', 'हरी खाद भी बन रहा है', 'audio_clips\rec_20260203_134718.wav'),
-(455, 5, '2026-02-03 13:47:22', 'en', 'real are you happy birthday to you get older', 'audio_clips\rec_20260203_134721.wav'),
-(456, 5, '2026-02-03 13:47:25', 'en', 'good added it is', 'audio_clips\rec_20260203_134724.wav'),
-(457, 5, '2026-02-03 13:47:26', 'hi', 'हम अड़े रहे', 'audio_clips\rec_20260203_134724.wav'),
-(458, 5, '2026-02-03 13:47:28', 'en', 'you''re going to be happy', 'audio_clips\rec_20260203_134727.wav'),
-(459, 5, '2026-02-03 13:47:29', 'hi', 'हैप्पी बर्थडे पार्टी है', 'audio_clips\rec_20260203_134727.wav'),
-(460, 5, '2026-02-03 13:47:30', 'en', 'the the garden', 'audio_clips\rec_20260203_134730.wav'),
-(461, 5, '2026-02-03 13:47:31', 'hi', 'कार्ड', 'audio_clips\rec_20260203_134730.wav'),
-(462, 5, '2026-02-03 13:47:33', 'es', 'de cada vez que alma', 'audio_clips\rec_20260203_134730.wav'),
-(463, 5, '2026-02-03 13:47:34', 'en', 'zapata good skill aardman', 'audio_clips\rec_20260203_134733.wav'),
-(464, 5, '2026-02-03 13:47:37', 'es', 'armonía mental de mis en estrellas', 'audio_clips\rec_20260203_134736.wav'),
-(465, 5, '2026-02-03 13:47:39', 'hi', 'आठ में मंत्रालय ने भी परेशान पार्टी रहेगा', 'audio_clips\rec_20260203_134736.wav'),
-(466, 5, '2026-02-03 13:47:40', 'es', 'era el mar', 'audio_clips\rec_20260203_134739.wav'),
-(467, 5, '2026-02-03 13:47:41', 'en', 'adamant that have any the antisocial good our data but if i did at it if i''m at a', 'audio_clips\rec_20260203_134739.wav'),
-(468, 5, '2026-02-03 13:47:42', 'hi', 'भारतीय रेलवे पाटील रह रहे हैं', 'audio_clips\rec_20260203_134739.wav'),
-(469, 5, '2026-02-03 13:47:43', 'en', 'the', 'audio_clips\rec_20260203_134742.wav'),
-(470, 5, '2026-02-03 13:47:43', 'es', 'era haréis en de', 'audio_clips\rec_20260203_134742.wav'),
-(471, 5, '2026-02-03 13:47:48', 'es', 'a eso de verdad en existen', 'audio_clips\rec_20260203_134746.wav'),
-(472, 5, '2026-02-03 13:47:49', 'hi', 'आए दिन पहले हैं', 'audio_clips\rec_20260203_134746.wav'),
-(473, 5, '2026-02-03 13:47:49', 'en', 'i spent another with the an existing but i think it''s buildings', 'audio_clips\rec_20260203_134746.wav'),
-(474, 5, '2026-02-03 13:47:54', 'en', 'oh school', 'audio_clips\rec_20260203_134751.wav'),
-(475, 5, '2026-02-03 13:47:58', 'hi', 'और उसको', 'audio_clips\rec_20260203_134757.wav'),
-(476, 5, '2026-02-03 13:48:00', 'en', 'gossip lose understood', 'audio_clips\rec_20260203_134757.wav'),
-(477, 5, '2026-02-03 13:48:00', 'es', 'casa en donde se', 'audio_clips\rec_20260203_134800.wav'),
-(478, 5, '2026-02-03 13:48:01', 'hi', 'साउंड', 'audio_clips\rec_20260203_134800.wav'),
-(479, 5, '2026-02-03 13:48:12', 'en', 'a difference', 'audio_clips\rec_20260203_134812.wav'),
-(480, 5, '2026-02-03 13:48:12', 'hi', 'जैसे', 'audio_clips\rec_20260203_134812.wav'),
-(481, 5, '2026-02-03 13:48:16', 'en', 'gasol', 'audio_clips\rec_20260203_134815.wav'),
-(482, 5, '2026-02-03 13:48:16', 'hi', 'कैसा', 'audio_clips\rec_20260203_134815.wav'),
-(483, 5, '2026-02-03 13:48:20', 'es', 'casi no anexo', 'audio_clips\rec_20260203_134818.wav'),
-(484, 5, '2026-02-03 13:48:21', 'en', 'next on my', 'audio_clips\rec_20260203_134821.wav'),
-(485, 5, '2026-02-03 13:48:22', 'hi', 'नेक्स्ट नेक्स्ट', 'audio_clips\rec_20260203_134821.wav'),
-(486, 5, '2026-02-03 13:48:23', 'en', 'the', 'audio_clips\rec_20260203_134821.wav'),
-(487, 5, '2026-02-03 13:48:24', 'es', 'suerte y', 'audio_clips\rec_20260203_134821.wav'),
-(488, 5, '2026-02-03 13:48:27', 'hi', 'क्या था', 'audio_clips\rec_20260203_134824.wav'),
-(489, 5, '2026-02-03 13:48:28', 'en', 'because the is to lessons', 'audio_clips\rec_20260203_134827.wav'),
-(490, 5, '2026-02-03 13:48:29', 'en', 'my begun', 'audio_clips\rec_20260203_134827.wav'),
-(491, 5, '2026-02-03 13:48:30', 'hi', 'पाई गई देगी', 'audio_clips\rec_20260203_134827.wav'),
-(492, 5, '2026-02-03 13:48:30', 'es', 'las ahí', 'audio_clips\rec_20260203_134827.wav'),
-(493, 5, '2026-02-03 13:48:34', 'hi', 'पुरानी में छोड़ा', 'audio_clips\rec_20260203_134833.wav'),
-(494, 5, '2026-02-03 13:48:34', 'en', 'said i grew up around human him to learn and understand', 'audio_clips\rec_20260203_134833.wav'),
-(495, 5, '2026-02-03 13:48:35', 'es', 'cosa otro animal se hubieran en españa', 'audio_clips\rec_20260203_134833.wav'),
-(496, 5, '2026-02-03 13:48:39', 'en', 'what they see an interesting i do', 'audio_clips\rec_20260203_134836.wav'),
-(497, 5, '2026-02-03 13:48:39', 'hi', 'सिंह ने टेस्टिंग नाडु', 'audio_clips\rec_20260203_134836.wav'),
-(498, 5, '2026-02-03 13:48:41', 'en', 'the examiner', 'audio_clips\rec_20260203_134839.wav'),
-(499, 5, '2026-02-03 13:48:41', 'hi', 'फिक्स है', 'audio_clips\rec_20260203_134839.wav'),
-(500, 5, '2026-02-03 13:48:46', 'en', 'jupiter', 'audio_clips\rec_20260203_134845.wav'),
-(501, 5, '2026-02-03 13:48:49', 'en', 'the last more than six minutes and', 'audio_clips\rec_20260203_134848.wav'),
-(502, 5, '2026-02-03 13:48:49', 'es', 'mueren se columnas', 'audio_clips\rec_20260203_134848.wav'),
-(503, 5, '2026-02-03 13:48:51', 'en', 'was panicking', 'audio_clips\rec_20260203_134851.wav'),
-(504, 5, '2026-02-03 13:48:52', 'hi', 'आसमानी सिकुड़ने वास्तविक', 'audio_clips\rec_20260203_134851.wav'),
-(505, 5, '2026-02-03 13:48:58', 'hi', 'हूं', 'audio_clips\rec_20260203_134857.wav'),
-(506, 5, '2026-02-03 13:49:01', 'en', 'him', 'audio_clips\rec_20260203_134900.wav'),
-(507, 5, '2026-02-03 13:49:04', 'hi', 'चंडीगढ़ पुलिस एक सौ', 'audio_clips\rec_20260203_134903.wav'),
-(508, 5, '2026-02-03 13:49:04', 'en', 'accent allowed to go to picture please excited', 'audio_clips\rec_20260203_134903.wav'),
-(509, 5, '2026-02-03 13:49:06', 'en', 'that the there', 'audio_clips\rec_20260203_134906.wav'),
-(510, 5, '2026-02-03 14:07:45', 'es', 'la y', 'audio_clips\rec_20260203_140741.wav'),
-(511, 5, '2026-02-03 14:07:45', 'hi', 'आग लग गई', 'audio_clips\rec_20260203_140741.wav'),
-(512, 5, '2026-02-03 14:07:47', 'en', 'how can i', 'audio_clips\rec_20260203_140745.wav'),
-(513, 5, '2026-02-03 14:07:49', 'hi', 'में', 'audio_clips\rec_20260203_140747.wav'),
-(514, 5, '2026-02-03 14:07:56', 'en', 'can make a new years now', 'audio_clips\rec_20260203_140756.wav'),
-(515, 5, '2026-02-03 14:07:58', 'en', 'hello', 'audio_clips\rec_20260203_140756.wav'),
-(516, 5, '2026-02-03 14:08:01', 'hi', 'हेलो दिल्ली', 'audio_clips\rec_20260203_140759.wav'),
-(517, 5, '2026-02-03 14:08:02', 'en', 'oh yeah', 'audio_clips\rec_20260203_140759.wav'),
-(518, 5, '2026-02-03 14:08:09', 'en', 'my head ahead of us do you understand what i''m talking about', 'audio_clips\rec_20260203_140805.wav'),
-(519, 5, '2026-02-03 14:08:10', 'es', 'murió andersen morán', 'audio_clips\rec_20260203_140809.wav'),
-(520, 5, '2026-02-03 14:08:10', 'hi', 'फिर भी काफी दबाव में है', 'audio_clips\rec_20260203_140809.wav'),
-(521, 5, '2026-02-03 14:08:13', 'en', 'i''m in here', 'audio_clips\rec_20260203_140811.wav'),
-(522, 5, '2026-02-03 14:08:14', 'hi', 'आने दिया', 'audio_clips\rec_20260203_140811.wav'),
-(523, 5, '2026-02-03 14:08:15', 'es', 'quiñones', 'audio_clips\rec_20260203_140814.wav'),
-(524, 5, '2026-02-03 14:08:16', 'en', 'can you understand what i''m talking about them going to hurt you', 'audio_clips\rec_20260203_140814.wav'),
-(525, 5, '2026-02-03 14:08:19', 'hi', 'रहा था', 'audio_clips\rec_20260203_140817.wav'),
-(526, 5, '2026-02-03 14:08:20', 'es', 'y barco', 'audio_clips\rec_20260203_140817.wav'),
-(527, 5, '2026-02-03 14:08:21', 'en', 'that i said oh yeah', 'audio_clips\rec_20260203_140820.wav'),
-(528, 5, '2026-02-03 14:08:23', 'en', 'it is', 'audio_clips\rec_20260203_140820.wav'),
-(529, 5, '2026-02-03 14:08:27', 'en', 'taste', 'audio_clips\rec_20260203_140826.wav'),
-(530, 5, '2026-02-03 14:08:29', 'en', 'eleven i feel angry', 'audio_clips\rec_20260203_140829.wav'),
-(531, 5, '2026-02-03 14:08:30', 'es', 'la más', 'audio_clips\rec_20260203_140829.wav'),
-(532, 5, '2026-02-03 14:08:32', 'hi', 'करना होगा', 'audio_clips\rec_20260203_140829.wav'),
-(533, 5, '2026-02-03 14:08:32', 'en', 'i need', 'audio_clips\rec_20260203_140832.wav'),
-(534, 5, '2026-02-03 14:08:36', 'es', 'bañera', 'audio_clips\rec_20260203_140835.wav'),
-(535, 5, '2026-02-03 14:08:37', 'hi', 'बेईमानी', 'audio_clips\rec_20260203_140835.wav'),
-(536, 5, '2026-02-03 14:08:37', 'en', 'i wasn''t world', 'audio_clips\rec_20260203_140835.wav'),
-(537, 5, '2026-02-03 14:08:42', 'en', 'four hundred', 'audio_clips\rec_20260203_140841.wav'),
-(538, 5, '2026-02-03 14:08:48', 'en', 'i''ve never actually been', 'audio_clips\rec_20260203_140847.wav'),
-(539, 5, '2026-02-03 14:08:51', 'en', 'close together', 'audio_clips\rec_20260203_140850.wav'),
-(540, 5, '2026-02-03 14:08:53', 'en', 'it made', 'audio_clips\rec_20260203_140850.wav'),
-(541, 5, '2026-02-03 14:08:53', 'hi', 'में', 'audio_clips\rec_20260203_140850.wav'),
-(542, 5, '2026-02-03 14:08:58', 'hi', 'वंदे मातरम', 'audio_clips\rec_20260203_140856.wav'),
-(543, 5, '2026-02-03 14:08:59', 'en', 'really popular noise', 'audio_clips\rec_20260203_140856.wav'),
-(544, 5, '2026-02-03 14:08:59', 'hi', 'रोहित है', 'audio_clips\rec_20260203_140859.wav'),
-(545, 5, '2026-02-03 14:09:01', 'en', 'the money', 'audio_clips\rec_20260203_140859.wav'),
-(546, 5, '2026-02-03 14:09:04', 'en', 'recently he didn''t he didn''t hello', 'audio_clips\rec_20260203_140902.wav'),
-(547, 5, '2026-02-03 14:09:04', 'hi', 'इसमें आया', 'audio_clips\rec_20260203_140902.wav'),
-(548, 5, '2026-02-03 14:09:08', 'hi', 'मन में', 'audio_clips\rec_20260203_140905.wav'),
-(549, 5, '2026-02-03 14:09:10', 'en', 'what i mean who wouldn''t have been missing from is no i didn''t want to retain the', 'audio_clips\rec_20260203_140908.wav'),
-(550, 5, '2026-02-03 14:09:11', 'es', 'no es noche género', 'audio_clips\rec_20260203_140908.wav'),
-(551, 5, '2026-02-03 14:09:13', 'hi', 'ने हुआ', 'audio_clips\rec_20260203_140911.wav'),
-(552, 5, '2026-02-03 14:09:18', 'hi', 'आजकल हर घर में', 'audio_clips\rec_20260203_140918.wav'),
-(553, 5, '2026-02-03 14:09:19', 'en', 'how dare they are better than mine', 'audio_clips\rec_20260203_140918.wav'),
-(554, 5, '2026-02-03 14:09:23', 'en', 'let us know what''s going on', 'audio_clips\rec_20260203_140923.wav'),
-(555, 5, '2026-02-03 14:09:24', 'es', 'por qué no', 'audio_clips\rec_20260203_140923.wav'),
-(556, 5, '2026-02-03 14:09:26', 'en', 'i know what we have my that', 'audio_clips\rec_20260203_140926.wav'),
-(557, 5, '2026-02-03 14:09:33', 'en', 'okay to get people', 'audio_clips\rec_20260203_140932.wav'),
-(558, 5, '2026-02-03 14:09:33', 'hi', 'रात तीव्र पड़ा', 'audio_clips\rec_20260203_140932.wav'),
-(559, 5, '2026-02-03 14:09:38', 'en', 'yeah', 'audio_clips\rec_20260203_140935.wav'),
-(560, 5, '2026-02-03 14:09:42', 'en', 'the good', 'audio_clips\rec_20260203_140941.wav'),
-(561, 5, '2026-02-03 14:09:44', 'es', 'de qué', 'audio_clips\rec_20260203_140941.wav'),
-(562, 5, '2026-02-03 14:09:54', 'en', 'oh boy', 'audio_clips\rec_20260203_140953.wav'),
-(563, 5, '2026-02-03 14:09:54', 'hi', 'आजमगढ़', 'audio_clips\rec_20260203_140953.wav'),
-(564, 5, '2026-02-03 14:09:54', 'es', 'su libertad', 'audio_clips\rec_20260203_140953.wav'),
-(565, 5, '2026-02-03 14:09:58', 'en', 'i''m a going next', 'audio_clips\rec_20260203_140956.wav'),
-(566, 5, '2026-02-03 14:09:59', 'hi', 'होगा', 'audio_clips\rec_20260203_140956.wav'),
-(567, 5, '2026-02-03 14:10:00', 'en', 'i think it up', 'audio_clips\rec_20260203_140959.wav'),
-(568, 5, '2026-02-03 14:10:04', 'hi', 'आप हमारे था', 'audio_clips\rec_20260203_141002.wav'),
-(569, 5, '2026-02-03 14:10:16', 'en', 'linda lovelace', 'audio_clips\rec_20260203_141014.wav'),
-(570, 5, '2026-02-03 14:10:17', 'hi', 'क्या है', 'audio_clips\rec_20260203_141014.wav'),
-(571, 5, '2026-02-03 14:10:21', 'en', 'sort thing', 'audio_clips\rec_20260203_141020.wav'),
-(572, 5, '2026-02-03 14:10:27', 'en', 'there are there like that', 'audio_clips\rec_20260203_141027.wav'),
-(573, 5, '2026-02-03 14:10:28', 'hi', 'निर्भर है', 'audio_clips\rec_20260203_141027.wav'),
-(574, 5, '2026-02-03 14:10:29', 'en', 'the main story', 'audio_clips\rec_20260203_141027.wav'),
-(575, 5, '2026-02-03 14:10:30', 'en', 'you know', 'audio_clips\rec_20260203_141029.wav'),
-(576, 5, '2026-02-03 14:10:32', 'hi', 'बावन', 'audio_clips\rec_20260203_141029.wav'),
-(577, 5, '2026-02-03 14:10:34', 'en', 'unless you''re pulling that', 'audio_clips\rec_20260203_141032.wav'),
-(578, 5, '2026-02-03 14:10:39', 'en', 'you know by new planet', 'audio_clips\rec_20260203_141038.wav'),
-(579, 5, '2026-02-03 14:10:39', 'hi', 'हिना पायनियर प्लैनेट था', 'audio_clips\rec_20260203_141038.wav'),
-(580, 5, '2026-02-03 14:10:42', 'hi', 'चलो आती है', 'audio_clips\rec_20260203_141041.wav'),
-(581, 5, '2026-02-03 14:10:42', 'en', 'you cedillo land is we get there', 'audio_clips\rec_20260203_141041.wav'),
-(582, 5, '2026-02-03 14:10:46', 'en', 'future lower nineties and farming in the world', 'audio_clips\rec_20260203_141044.wav'),
-(583, 5, '2026-02-03 14:10:46', 'es', 'dólares en familia', 'audio_clips\rec_20260203_141044.wav'),
-(584, 5, '2026-02-03 14:10:47', 'hi', 'अभिनेता अमित है', 'audio_clips\rec_20260203_141047.wav'),
-(585, 5, '2026-02-03 14:10:48', 'es', 'habita en', 'audio_clips\rec_20260203_141047.wav'),
-(586, 5, '2026-02-03 14:10:51', 'en', 'we ended up that much damage than good', 'audio_clips\rec_20260203_141050.wav'),
-(587, 5, '2026-02-03 14:10:51', 'hi', 'इंडिया इंडियन', 'audio_clips\rec_20260203_141050.wav'),
-(588, 5, '2026-02-03 14:10:53', 'en', 'you know that injuries', 'audio_clips\rec_20260203_141050.wav'),
-(589, 5, '2026-02-03 14:10:53', 'hi', 'उन्होंने इंश्योरेंस', 'audio_clips\rec_20260203_141053.wav'),
-(590, 5, '2026-02-03 14:10:56', 'es', 'centro de cádiz', 'audio_clips\rec_20260203_141053.wav'),
-(591, 5, '2026-02-03 14:10:56', 'hi', 'करें', 'audio_clips\rec_20260203_141053.wav'),
-(592, 5, '2026-02-03 14:10:58', 'en', 'any children', 'audio_clips\rec_20260203_141056.wav'),
-(593, 5, '2026-02-03 14:11:00', 'en', 'i mean i''m acting like', 'audio_clips\rec_20260203_141059.wav'),
-(594, 5, '2026-02-03 14:11:01', 'hi', 'में में रहा है', 'audio_clips\rec_20260203_141059.wav'),
-(595, 5, '2026-02-03 14:11:02', 'en', 'deposited in life', 'audio_clips\rec_20260203_141059.wav'),
-(596, 5, '2026-02-03 14:11:02', 'es', 'no hay', 'audio_clips\rec_20260203_141102.wav'),
-(597, 5, '2026-02-03 14:11:05', 'en', 'nice group or not', 'audio_clips\rec_20260203_141105.wav'),
-(598, 5, '2026-02-03 14:11:05', 'hi', 'बड़ा रूप', 'audio_clips\rec_20260203_141105.wav'),
-(599, 5, '2026-02-03 14:11:06', 'es', 'mováis rocola', 'audio_clips\rec_20260203_141105.wav'),
-(600, 6, '2026-02-03 14:14:35', 'en', 'Hello world testing', 'manual_entry'),
-(601, 6, '2026-02-03 14:14:54', 'en', 'images', 'audio_clips\rec_20260203_141453.wav'),
-(602, 6, '2026-02-03 14:14:56', 'en', 'quick the country', 'audio_clips\rec_20260203_141453.wav'),
-(603, 6, '2026-02-03 14:14:56', 'es', 'la oferta', 'audio_clips\rec_20260203_141453.wav'),
-(604, 6, '2026-02-03 14:15:02', 'es', 'este mangueras así', 'audio_clips\rec_20260203_141459.wav'),
-(605, 6, '2026-02-03 14:15:03', 'en', 'i''m that new to this get us to the hundred to the', 'audio_clips\rec_20260203_141459.wav'),
-(606, 6, '2026-02-03 14:15:04', 'hi', 'घटना हम', 'audio_clips\rec_20260203_141503.wav'),
-(607, 6, '2026-02-03 14:15:09', 'hi', 'क्षेत्र में', 'audio_clips\rec_20260203_141508.wav'),
-(608, 6, '2026-02-03 14:15:11', 'en', 'children i choose to a bitch with', 'audio_clips\rec_20260203_141511.wav'),
-(609, 6, '2026-02-03 14:15:13', 'en', 'much', 'audio_clips\rec_20260203_141511.wav'),
-(610, 6, '2026-02-03 14:15:16', 'en', 'another know', 'audio_clips\rec_20260203_141514.wav'),
-(611, 6, '2026-02-03 14:15:19', 'en', 'mm and eleven', 'audio_clips\rec_20260203_141517.wav'),
-(612, 6, '2026-02-03 14:15:20', 'es', 'a lo menos y la habana', 'audio_clips\rec_20260203_141517.wav'),
-(613, 6, '2026-02-03 14:15:20', 'hi', 'लगाना लगाना', 'audio_clips\rec_20260203_141517.wav'),
-(614, 6, '2026-02-03 14:15:23', 'es', 'en gareca rana', 'audio_clips\rec_20260203_141523.wav'),
-(615, 6, '2026-02-03 14:15:24', 'en', 'in the gonna get around it alone', 'audio_clips\rec_20260203_141523.wav'),
-(616, 6, '2026-02-03 14:15:25', 'hi', 'कर रहा है', 'audio_clips\rec_20260203_141523.wav'),
-(617, 6, '2026-02-03 14:15:28', 'en', 'name relationship', 'audio_clips\rec_20260203_141526.wav'),
-(618, 6, '2026-02-03 14:15:38', 'en', 'in have plans and', 'audio_clips\rec_20260203_141538.wav'),
-(619, 6, '2026-02-03 14:15:39', 'es', 'en la enseñar', 'audio_clips\rec_20260203_141538.wav'),
-(620, 6, '2026-02-03 14:15:41', 'en', 'the you know', 'audio_clips\rec_20260203_141541.wav'),
-(621, 6, '2026-02-03 14:15:41', 'hi', 'सभी प्लांट से है', 'audio_clips\rec_20260203_141541.wav'),
-(622, 6, '2026-02-03 14:15:47', 'hi', 'हनुमानगढ़', 'audio_clips\rec_20260203_141544.wav'),
-(623, 6, '2026-02-03 14:15:50', 'es', 'en el', 'audio_clips\rec_20260203_141547.wav'),
-(624, 6, '2026-02-03 14:15:51', 'en', 'not identity', 'audio_clips\rec_20260203_141550.wav'),
-(625, 6, '2026-02-03 14:15:55', 'en', 'you be a bit of going up', 'audio_clips\rec_20260203_141553.wav'),
-(626, 6, '2026-02-03 14:15:55', 'es', 'y bien vera', 'audio_clips\rec_20260203_141553.wav'),
-(627, 6, '2026-02-03 14:15:56', 'hi', 'ईवीएम में हो', 'audio_clips\rec_20260203_141553.wav'),
-(628, 6, '2026-02-03 14:15:57', 'en', 'the open up', 'audio_clips\rec_20260203_141556.wav'),
-(629, 6, '2026-02-03 14:16:00', 'es', 'digo que no', 'audio_clips\rec_20260203_141559.wav'),
-(630, 6, '2026-02-03 14:16:02', 'en', 'okay', 'audio_clips\rec_20260203_141559.wav'),
-(631, 6, '2026-02-03 14:16:05', 'en', 'with two million', 'audio_clips\rec_20260203_141602.wav'),
-(632, 6, '2026-02-03 14:16:05', 'hi', 'उनसे पहले', 'audio_clips\rec_20260203_141602.wav'),
-(633, 6, '2026-02-03 14:16:20', 'en', 'right', 'audio_clips\rec_20260203_141617.wav'),
-(634, 6, '2026-02-03 14:16:21', 'en', 'never know', 'audio_clips\rec_20260203_141620.wav'),
-(635, 6, '2026-02-03 14:16:26', 'en', 'the i don''t know', 'audio_clips\rec_20260203_141623.wav'),
-(636, 6, '2026-02-03 14:16:29', 'es', 'va lo juro', 'audio_clips\rec_20260203_141626.wav'),
-(637, 6, '2026-02-03 14:16:30', 'en', 'that guy who looks riley they''ve', 'audio_clips\rec_20260203_141629.wav'),
-(638, 6, '2026-02-03 14:16:30', 'hi', 'नुकसान झाले', 'audio_clips\rec_20260203_141629.wav'),
-(639, 6, '2026-02-03 14:16:36', 'en', 'i know taxes', 'audio_clips\rec_20260203_141635.wav'),
-(640, 6, '2026-02-03 14:16:36', 'es', 'aló', 'audio_clips\rec_20260203_141635.wav'),
-(641, 6, '2026-02-03 14:16:40', 'es', 'accept ocho muy instale en google', 'audio_clips\rec_20260203_141638.wav'),
-(642, 6, '2026-02-03 14:16:40', 'en', 'accept the road actually pretty stunning google', 'audio_clips\rec_20260203_141638.wav'),
-(643, 6, '2026-02-03 14:16:40', 'hi', 'हेलो एक्सप्लोरर हिंदुस्तानी गूगल', 'audio_clips\rec_20260203_141638.wav'),
-(644, 6, '2026-02-03 14:16:51', 'hi', 'डिप्रेशन फैसले बेहतर प्रत्येक', 'audio_clips\rec_20260203_141650.wav'),
-(645, 6, '2026-02-03 14:16:51', 'es', 'banda y presencia verter partido gobernante', 'audio_clips\rec_20260203_141650.wav'),
-(646, 6, '2026-02-03 14:16:51', 'en', 'move on military depression faced with that but the and their lives to', 'audio_clips\rec_20260203_141650.wav'),
-(647, 6, '2026-02-03 14:16:54', 'es', 'andar que venden english', 'audio_clips\rec_20260203_141653.wav'),
-(648, 6, '2026-02-03 14:16:56', 'hi', 'अंदर विदित रहे कि से बिछिया', 'audio_clips\rec_20260203_141653.wav'),
-(649, 6, '2026-02-03 14:16:56', 'en', 'and then a game and that i''m going to put a piece make is a big to and lawyer', 'audio_clips\rec_20260203_141656.wav'),
-(650, 6, '2026-02-03 14:16:58', 'en', 'in your body', 'audio_clips\rec_20260203_141656.wav'),
-(651, 6, '2026-02-03 14:16:59', 'es', 'veintiséis dolor menor nivel primario', 'audio_clips\rec_20260203_141656.wav'),
-(652, 6, '2026-02-03 14:17:07', 'en', 'mugabe''s game in a new and', 'audio_clips\rec_20260203_141707.wav'),
-(653, 6, '2026-02-03 14:17:09', 'hi', 'नहीं है', 'audio_clips\rec_20260203_141707.wav'),
-(654, 6, '2026-02-03 14:17:09', 'en', 'it is that lot', 'audio_clips\rec_20260203_141709.wav'),
-(655, 6, '2026-02-03 14:17:10', 'es', 'la vida', 'audio_clips\rec_20260203_141709.wav'),
-(656, 6, '2026-02-03 14:17:11', 'en', 'later on', 'audio_clips\rec_20260203_141709.wav'),
-(657, 6, '2026-02-03 14:17:12', 'hi', 'नए है', 'audio_clips\rec_20260203_141711.wav'),
-(658, 6, '2026-02-03 14:17:19', 'en', 'i''ve been even today', 'audio_clips\rec_20260203_141717.wav'),
-(659, 6, '2026-02-03 14:17:23', 'hi', 'उन्होंने था', 'audio_clips\rec_20260203_141720.wav'),
-(660, 6, '2026-02-03 14:17:24', 'en', 'the year', 'audio_clips\rec_20260203_141723.wav'),
-(661, 6, '2026-02-03 14:17:27', 'en', 'they', 'audio_clips\rec_20260203_141726.wav'),
-(662, 7, '2026-02-03 14:21:03', 'en', 'Hello world testing', 'manual_entry'),
-(663, 7, '2026-02-03 14:21:04', 'en', 'yes it', 'audio_clips\rec_20260203_142103.wav'),
-(664, 7, '2026-02-03 14:21:05', 'hi', 'आगे', 'audio_clips\rec_20260203_142103.wav'),
-(665, 7, '2026-02-03 14:21:07', 'hi', 'उनके पुलिस', 'audio_clips\rec_20260203_142106.wav'),
-(666, 7, '2026-02-03 14:21:08', 'es', 'oye y', 'audio_clips\rec_20260203_142106.wav'),
-(667, 7, '2026-02-03 14:21:09', 'en', 'oh yeah how could he have a good has', 'audio_clips\rec_20260203_142109.wav'),
-(668, 7, '2026-02-03 14:21:10', 'hi', 'खैर', 'audio_clips\rec_20260203_142109.wav'),
-(669, 7, '2026-02-03 14:21:12', 'en', 'way you''re going to be televised', 'audio_clips\rec_20260203_142112.wav'),
-(670, 7, '2026-02-03 14:21:17', 'hi', 'बिल्कुल भी से सलामी ली', 'audio_clips\rec_20260203_142115.wav'),
-(671, 7, '2026-02-03 14:21:17', 'en', 'i don''t really business or lot of eating these a living', 'audio_clips\rec_20260203_142115.wav'),
-(672, 7, '2026-02-03 14:21:22', 'en', 'i didn''t really love liability', 'audio_clips\rec_20260203_142121.wav'),
-(673, 7, '2026-02-03 14:21:22', 'hi', 'अरे लाल रहा गई थी', 'audio_clips\rec_20260203_142121.wav'),
-(674, 7, '2026-02-03 14:21:23', 'es', 'haré y la nube que', 'audio_clips\rec_20260203_142121.wav'),
-(675, 7, '2026-02-03 14:21:26', 'es', 'más', 'audio_clips\rec_20260203_142124.wav'),
-(676, 7, '2026-02-03 14:21:27', 'en', 'oh my god i', 'audio_clips\rec_20260203_142127.wav'),
-(677, 7, '2026-02-03 14:21:27', 'hi', 'मां है', 'audio_clips\rec_20260203_142127.wav'),
-(678, 7, '2026-02-03 14:21:28', 'en', 'asked', 'audio_clips\rec_20260203_142127.wav'),
-(679, 7, '2026-02-03 14:21:31', 'en', 'and i''m most likely so pretty', 'audio_clips\rec_20260203_142130.wav'),
-(680, 7, '2026-02-03 14:21:32', 'hi', 'माटी सुप्रीम लाल व', 'audio_clips\rec_20260203_142130.wav'),
-(681, 7, '2026-02-03 14:21:32', 'en', 'daddy gotten hooked', 'audio_clips\rec_20260203_142130.wav'),
-(682, 7, '2026-02-03 14:21:33', 'es', 'habló mal y supremo algo', 'audio_clips\rec_20260203_142133.wav'),
-(683, 7, '2026-02-03 14:21:39', 'en', 'i do it unless you really are', 'audio_clips\rec_20260203_142139.wav'),
-(684, 7, '2026-02-03 14:21:42', 'hi', 'उत्तर', 'audio_clips\rec_20260203_142139.wav'),
-(685, 5, '2026-02-03 14:54:02', 'en', 'we tend to them', 'audio_clips\rec_20260203_145400.wav'),
-(686, 5, '2026-02-03 14:54:10', 'hi', 'आहे', 'audio_clips\rec_20260203_145409.wav'),
-(687, 5, '2026-02-03 14:54:18', 'en', 'i don''t know what you know', 'audio_clips\rec_20260203_145418.wav'),
-(688, 5, '2026-02-03 14:54:18', 'es', 'el agua', 'audio_clips\rec_20260203_145418.wav'),
-(689, 5, '2026-02-03 14:54:19', 'en', 'i know', 'audio_clips\rec_20260203_145418.wav'),
-(690, 5, '2026-02-03 14:54:20', 'es', 'ay sí', 'audio_clips\rec_20260203_145418.wav'),
-(691, 5, '2026-02-03 14:54:22', 'en', 'even be extremely flat', 'audio_clips\rec_20260203_145421.wav'),
-(692, 5, '2026-02-03 14:54:25', 'es', 'de es', 'audio_clips\rec_20260203_145424.wav'),
-(693, 5, '2026-02-03 14:54:25', 'en', 'this isn''t it', 'audio_clips\rec_20260203_145424.wav'),
-(694, 5, '2026-02-03 14:54:30', 'en', 'the it', 'audio_clips\rec_20260203_145430.wav'),
-(695, 5, '2026-02-03 14:54:31', 'hi', 'लिया', 'audio_clips\rec_20260203_145430.wav'),
-(696, 5, '2026-02-03 14:54:36', 'es', 'es era el dio al golpe clear barcelona donaire', 'audio_clips\rec_20260203_145436.wav'),
-(697, 5, '2026-02-03 14:54:37', 'hi', 'अंतिम यू वॉन्ट टू एयर मार्शल होने देना है', 'audio_clips\rec_20260203_145436.wav'),
-(698, 5, '2026-02-03 14:54:37', 'en', 'let these didn''t you come on won''t be clear batasuna did a good', 'audio_clips\rec_20260203_145436.wav'),
-(699, 5, '2026-02-03 14:54:40', 'en', 'that putting up', 'audio_clips\rec_20260203_145439.wav'),
-(700, 5, '2026-02-03 14:54:40', 'hi', 'पड़ेगा', 'audio_clips\rec_20260203_145439.wav'),
-(701, 5, '2026-02-03 14:54:45', 'en', 'are you already', 'audio_clips\rec_20260203_145445.wav'),
-(702, 5, '2026-02-03 14:54:46', 'hi', 'हरे हरे हरे', 'audio_clips\rec_20260203_145445.wav'),
-(703, 5, '2026-02-03 14:54:48', 'en', 'read know the', 'audio_clips\rec_20260203_145448.wav'),
-(704, 5, '2026-02-03 14:54:49', 'hi', 'बनाई हुई', 'audio_clips\rec_20260203_145448.wav'),
-(705, 5, '2026-02-03 14:54:54', 'hi', 'आ रहा रहा', 'audio_clips\rec_20260203_145451.wav'),
-(706, 5, '2026-02-03 14:54:54', 'en', 'why they could not hot enough mark', 'audio_clips\rec_20260203_145454.wav'),
-(707, 5, '2026-02-03 14:54:59', 'en', 'a discount hurry and', 'audio_clips\rec_20260203_145457.wav'),
-(708, 5, '2026-02-03 14:54:59', 'es', 'área', 'audio_clips\rec_20260203_145457.wav'),
-(709, 5, '2026-02-03 14:54:59', 'hi', 'हरे हरे राम', 'audio_clips\rec_20260203_145457.wav'),
-(710, 5, '2026-02-03 14:55:07', 'en', 'men on i''m here so he need', 'audio_clips\rec_20260203_145506.wav'),
-(711, 5, '2026-02-03 14:55:07', 'hi', 'मेरा नाम है सोहिनी', 'audio_clips\rec_20260203_145506.wav'),
-(712, 5, '2026-02-03 14:55:07', 'es', 'no era nada es sony', 'audio_clips\rec_20260203_145506.wav'),
-(713, 5, '2026-02-03 14:55:17', 'en', 'alex', 'audio_clips\rec_20260203_145515.wav'),
-(714, 5, '2026-02-03 14:55:20', 'en', 'i''m a good', 'audio_clips\rec_20260203_145518.wav'),
-(715, 5, '2026-02-03 14:55:20', 'hi', 'उनको', 'audio_clips\rec_20260203_145518.wav'),
-(716, 5, '2026-02-03 14:55:25', 'hi', 'गया', 'audio_clips\rec_20260203_145524.wav'),
-(717, 5, '2026-02-03 14:55:28', 'en', 'monday', 'audio_clips\rec_20260203_145527.wav'),
-(718, 5, '2026-02-03 14:55:28', 'es', 'hay que ocupan de', 'audio_clips\rec_20260203_145527.wav'),
-(719, 5, '2026-02-03 14:55:29', 'hi', 'तुकोगंज', 'audio_clips\rec_20260203_145527.wav'),
-(720, 5, '2026-02-03 14:55:33', 'en', 'now', 'audio_clips\rec_20260203_145533.wav'),
-(721, 5, '2026-02-03 14:55:38', 'en', 'the', 'audio_clips\rec_20260203_145536.wav'),
-(722, 5, '2026-02-03 14:55:43', 'en', 'i''m going to do', 'audio_clips\rec_20260203_145542.wav'),
-(723, 5, '2026-02-03 14:55:47', 'en', 'i met on on his or honey', 'audio_clips\rec_20260203_145545.wav'),
-(724, 5, '2026-02-03 14:55:47', 'hi', 'मेरा नाम है सो भी नहीं', 'audio_clips\rec_20260203_145545.wav'),
-(725, 5, '2026-02-03 14:55:54', 'es', 'hay metodologías adiós', 'audio_clips\rec_20260203_145554.wav'),
-(726, 5, '2026-02-03 14:55:58', 'en', 'i met on his hermione', 'audio_clips\rec_20260203_145554.wav'),
-(727, 5, '2026-02-03 14:55:58', 'hi', 'आई है स्थानीय', 'audio_clips\rec_20260203_145554.wav'),
-(728, 5, '2026-02-03 14:56:08', 'en', 'i would either', 'audio_clips\rec_20260203_145606.wav'),
-(729, 5, '2026-02-03 14:56:09', 'hi', 'गया', 'audio_clips\rec_20260203_145606.wav'),
-(730, 5, '2026-02-03 14:56:11', 'en', 'what i''m going', 'audio_clips\rec_20260203_145609.wav'),
-(731, 5, '2026-02-03 14:56:12', 'en', 'he he', 'audio_clips\rec_20260203_145612.wav'),
-(732, 5, '2026-02-03 14:56:13', 'es', 'para ir', 'audio_clips\rec_20260203_145612.wav'),
-(733, 5, '2026-02-03 14:56:14', 'hi', 'बराबरी पर रहा', 'audio_clips\rec_20260203_145612.wav'),
-(734, 5, '2026-02-03 14:56:18', 'es', 'que escaramuza entró', 'audio_clips\rec_20260203_145615.wav'),
-(735, 5, '2026-02-03 14:56:18', 'en', 'and we just got on you please', 'audio_clips\rec_20260203_145615.wav'),
-(736, 5, '2026-02-03 14:56:20', 'hi', 'इस कारण क्राइम फ्री हेल्पलाइन', 'audio_clips\rec_20260203_145618.wav'),
-(737, 5, '2026-02-03 14:56:23', 'en', 'really', 'audio_clips\rec_20260203_145621.wav'),
-(738, 5, '2026-02-03 14:56:25', 'en', 'my do that', 'audio_clips\rec_20260203_145624.wav'),
-(739, 5, '2026-02-03 14:56:25', 'es', 'aunque de gracias', 'audio_clips\rec_20260203_145624.wav'),
-(740, 5, '2026-02-03 14:56:26', 'hi', 'माहिती दिली', 'audio_clips\rec_20260203_145624.wav'),
-(741, 5, '2026-02-03 14:56:30', 'en', 'really', 'audio_clips\rec_20260203_145627.wav'),
-(742, 5, '2026-02-03 14:56:32', 'hi', 'इराक में विराट', 'audio_clips\rec_20260203_145630.wav'),
-(743, 5, '2026-02-03 14:56:33', 'en', 'you legal under sit out there might not make', 'audio_clips\rec_20260203_145630.wav'),
-(744, 5, '2026-02-03 14:56:33', 'es', 'irá libro andros senador un email admeto', 'audio_clips\rec_20260203_145630.wav'),
-(745, 5, '2026-02-03 14:56:34', 'hi', 'पायलट ने तोड़ा', 'audio_clips\rec_20260203_145633.wav'),
-(746, 5, '2026-02-03 14:56:35', 'en', 'logic up now', 'audio_clips\rec_20260203_145633.wav'),
-(747, 5, '2026-02-03 14:56:36', 'hi', 'अपने', 'audio_clips\rec_20260203_145633.wav'),
-(748, 5, '2026-02-03 14:56:38', 'es', 'sus versos de', 'audio_clips\rec_20260203_145636.wav'),
-(749, 5, '2026-02-03 14:56:38', 'en', 'you stop to they a difference', 'audio_clips\rec_20260203_145636.wav'),
-(750, 5, '2026-02-03 14:56:44', 'en', 'nine', 'audio_clips\rec_20260203_145642.wav'),
-(751, 5, '2026-02-03 14:56:51', 'hi', 'होनी की', 'audio_clips\rec_20260203_145648.wav'),
-(752, 5, '2026-02-03 14:56:52', 'es', 'axilares ganar y china', 'audio_clips\rec_20260203_145651.wav'),
-(753, 5, '2026-02-03 14:56:52', 'en', 'actually going to fanatical nice nicotine', 'audio_clips\rec_20260203_145651.wav'),
-(754, 5, '2026-02-03 14:56:53', 'hi', 'खेल', 'audio_clips\rec_20260203_145651.wav'),
-(755, 5, '2026-02-03 14:56:58', 'en', 'other', 'audio_clips\rec_20260203_145657.wav'),
-(756, 5, '2026-02-03 14:57:01', 'hi', 'देखा करें', 'audio_clips\rec_20260203_145701.wav'),
-(757, 5, '2026-02-03 14:57:03', 'en', 'today', 'audio_clips\rec_20260203_145701.wav'),
-(758, 5, '2026-02-03 14:57:04', 'es', 'adecuado para ti', 'audio_clips\rec_20260203_145703.wav'),
-(759, 5, '2026-02-03 14:57:22', 'hi', 'पूर्व', 'audio_clips\rec_20260203_145721.wav'),
-(760, 5, '2026-02-03 14:57:22', 'en', 'rather than', 'audio_clips\rec_20260203_145721.wav'),
-(761, 5, '2026-02-03 14:57:27', 'en', 'gosh', 'audio_clips\rec_20260203_145727.wav'),
-(762, 5, '2026-02-03 14:57:37', 'en', 'yeah', 'audio_clips\rec_20260203_145736.wav'),
-(763, 5, '2026-02-03 14:57:40', 'en', 'it''s', 'audio_clips\rec_20260203_145739.wav'),
-(764, 5, '2026-02-03 14:57:49', 'en', 'yeah', 'audio_clips\rec_20260203_145748.wav'),
-(765, 5, '2026-02-03 14:57:53', 'hi', 'ऑफलाइन', 'audio_clips\rec_20260203_145751.wav'),
-(766, 5, '2026-02-03 14:57:55', 'en', 'the', 'audio_clips\rec_20260203_145754.wav'),
-(767, 5, '2026-02-03 14:57:59', 'hi', 'आई आई', 'audio_clips\rec_20260203_145757.wav'),
-(768, 5, '2026-02-03 14:57:59', 'en', 'i wouldn''t really', 'audio_clips\rec_20260203_145757.wav'),
-(769, 5, '2026-02-03 14:58:01', 'en', 'i want', 'audio_clips\rec_20260203_145800.wav'),
-(770, 5, '2026-02-03 14:58:05', 'en', 'mama my list audition bummer', 'audio_clips\rec_20260203_145803.wav'),
-(771, 5, '2026-02-03 14:58:05', 'es', 'baba males falleció', 'audio_clips\rec_20260203_145803.wav'),
-(772, 5, '2026-02-03 14:58:05', 'hi', 'आभा वाली साजिशन बावन', 'audio_clips\rec_20260203_145803.wav'),
-(773, 5, '2026-02-03 14:58:12', 'en', 'men on on his you', 'audio_clips\rec_20260203_145809.wav'),
-(774, 5, '2026-02-03 14:58:12', 'hi', 'मेरा नाम है सोहिनी', 'audio_clips\rec_20260203_145809.wav'),
-(775, 5, '2026-02-03 14:58:12', 'es', 'me aeronaves holguín', 'audio_clips\rec_20260203_145812.wav'),
-(776, 5, '2026-02-03 14:58:17', 'en', 'yeah', 'audio_clips\rec_20260203_145815.wav'),
-(777, 5, '2026-02-03 14:58:18', 'hi', 'इतना ही नहीं गया', 'audio_clips\rec_20260203_145815.wav'),
-(778, 5, '2026-02-03 14:58:19', 'en', 'he lives', 'audio_clips\rec_20260203_145818.wav'),
-(779, 5, '2026-02-03 14:58:20', 'es', 'ana maría', 'audio_clips\rec_20260203_145818.wav'),
-(780, 5, '2026-02-03 14:58:24', 'hi', 'रहेंगे जब तक पहुंच गया', 'audio_clips\rec_20260203_145821.wav'),
-(781, 5, '2026-02-03 14:58:25', 'en', 'i the', 'audio_clips\rec_20260203_145825.wav'),
-(782, 5, '2026-02-03 14:58:26', 'es', 'aquí', 'audio_clips\rec_20260203_145825.wav'),
-(783, 5, '2026-02-03 14:58:28', 'en', 'making the mailbox', 'audio_clips\rec_20260203_145827.wav'),
-(784, 5, '2026-02-03 14:58:28', 'hi', 'वे हिंदी में बात करना', 'audio_clips\rec_20260203_145827.wav'),
-(785, 5, '2026-02-03 14:58:33', 'en', 'this column hello much yeah', 'audio_clips\rec_20260203_145833.wav'),
-(786, 5, '2026-02-03 14:58:34', 'es', 'es como magia', 'audio_clips\rec_20260203_145833.wav'),
-(787, 5, '2026-02-03 14:58:34', 'hi', 'इस कौम यह समस्या', 'audio_clips\rec_20260203_145833.wav'),
-(788, 5, '2026-02-03 14:58:38', 'en', 'oh no those that is a llama', 'audio_clips\rec_20260203_145836.wav'),
-(789, 5, '2026-02-03 14:58:39', 'hi', 'पीरियड्स आना मतली', 'audio_clips\rec_20260203_145836.wav'),
-(790, 5, '2026-02-03 14:58:49', 'en', 'what do what do', 'audio_clips\rec_20260203_145848.wav'),
-(791, 5, '2026-02-03 14:58:50', 'es', 'el water', 'audio_clips\rec_20260203_145848.wav'),
-(792, 5, '2026-02-03 14:58:51', 'hi', 'मुर्गा किया', 'audio_clips\rec_20260203_145848.wav'),
-(793, 5, '2026-02-03 14:58:57', 'en', 'my name is so union and i''m a boy', 'audio_clips\rec_20260203_145854.wav'),
-(794, 5, '2026-02-03 14:58:57', 'hi', 'महीने में सौ भी नहीं आना होगा', 'audio_clips\rec_20260203_145854.wav'),
-(795, 5, '2026-02-03 14:58:58', 'es', 'mhm eso genera no me voy', 'audio_clips\rec_20260203_145857.wav'),
-(796, 5, '2026-02-03 14:59:02', 'en', 'and look like', 'audio_clips\rec_20260203_145900.wav'),
-(797, 5, '2026-02-03 14:59:02', 'hi', 'लिखने फ्यूचर', 'audio_clips\rec_20260203_145900.wav'),
-(798, 5, '2026-02-03 14:59:05', 'en', 'israeli me', 'audio_clips\rec_20260203_145903.wav'),
-(799, 5, '2026-02-03 14:59:05', 'hi', 'अंग्रेजी नहीं करती है', 'audio_clips\rec_20260203_145903.wav'),
-(800, 5, '2026-02-03 14:59:07', 'es', 'aquí de trece', 'audio_clips\rec_20260203_145906.wav'),
-(801, 5, '2026-02-03 14:59:10', 'en', 'it has husband and wounded it is when i have a jolly', 'audio_clips\rec_20260203_145910.wav'),
-(802, 5, '2026-02-03 14:59:11', 'hi', 'वित्त और झाले नाही', 'audio_clips\rec_20260203_145910.wav'),
-(803, 5, '2026-02-03 14:59:14', 'en', 'you know', 'audio_clips\rec_20260203_145912.wav'),
-(804, 5, '2026-02-03 14:59:15', 'hi', 'अंकल', 'audio_clips\rec_20260203_145912.wav'),
-(805, 5, '2026-02-03 14:59:17', 'en', 'i love the security guard see', 'audio_clips\rec_20260203_145915.wav'),
-(806, 5, '2026-02-03 14:59:18', 'hi', 'सिक्योरिटी गार्ड से', 'audio_clips\rec_20260203_145915.wav'),
-(807, 5, '2026-02-03 14:59:18', 'es', 'a el hambre se quiere te gálvez', 'audio_clips\rec_20260203_145915.wav'),
-(808, 5, '2026-02-03 14:59:32', 'en', 'good', 'audio_clips\rec_20260203_145930.wav'),
-(809, 5, '2026-02-03 14:59:37', 'en', 'when we when', 'audio_clips\rec_20260203_145936.wav'),
-(810, 5, '2026-02-03 14:59:37', 'es', 'orgánico', 'audio_clips\rec_20260203_145936.wav'),
-(811, 5, '2026-02-03 14:59:44', 'hi', 'आने वाला है', 'audio_clips\rec_20260203_145942.wav'),
-(812, 5, '2026-02-03 14:59:46', 'es', 'británico', 'audio_clips\rec_20260203_145945.wav'),
-(813, 5, '2026-02-03 14:59:47', 'hi', 'डोंगरगढ़ करने और है', 'audio_clips\rec_20260203_145945.wav'),
-(814, 5, '2026-02-03 14:59:47', 'en', 'i wonder what i mean we''re going to for that okay', 'audio_clips\rec_20260203_145945.wav'),
-(815, 5, '2026-02-03 14:59:49', 'en', 'it was', 'audio_clips\rec_20260203_145948.wav'),
-(816, 5, '2026-02-03 14:59:50', 'hi', 'उन्हें', 'audio_clips\rec_20260203_145948.wav'),
-(817, 5, '2026-02-03 14:59:55', 'en', 'lol', 'audio_clips\rec_20260203_145954.wav'),
-(818, 5, '2026-02-03 15:00:00', 'en', 'brought everything', 'audio_clips\rec_20260203_145957.wav'),
-(819, 5, '2026-02-03 15:00:05', 'en', 'eighteen', 'audio_clips\rec_20260203_150003.wav'),
-(820, 5, '2026-02-03 15:00:16', 'en', 'gothic', 'audio_clips\rec_20260203_150015.wav'),
-(821, 5, '2026-02-03 15:00:16', 'hi', 'कहते हैं', 'audio_clips\rec_20260203_150015.wav'),
-(822, 5, '2026-02-03 15:00:18', 'en', 'so you could it was', 'audio_clips\rec_20260203_150018.wav'),
-(823, 5, '2026-02-03 15:00:19', 'hi', 'स्वयं को की रिक्वेस्ट', 'audio_clips\rec_20260203_150018.wav'),
-(824, 5, '2026-02-03 15:00:20', 'es', 'soy jericó del sur', 'audio_clips\rec_20260203_150018.wav'),
-(825, 5, '2026-02-03 15:00:21', 'en', 'within a company', 'audio_clips\rec_20260203_150018.wav'),
-(826, 5, '2026-02-03 15:00:25', 'en', 'three months including undergo rockefeller plaza', 'audio_clips\rec_20260203_150024.wav'),
-(827, 5, '2026-02-03 15:00:26', 'es', 'bueno critican largaba batata la', 'audio_clips\rec_20260203_150024.wav'),
-(828, 5, '2026-02-03 15:00:26', 'hi', 'मनुष्य की घंटी घनघना बताता रहा था', 'audio_clips\rec_20260203_150024.wav'),
-(829, 5, '2026-02-03 15:00:31', 'en', 'yeah', 'audio_clips\rec_20260203_150030.wav'),
-(830, 5, '2026-02-03 15:00:48', 'hi', 'चार विदेशी बाद', 'audio_clips\rec_20260203_150045.wav'),
-(831, 5, '2026-02-03 15:00:53', 'en', 'the bachelor come under attack', 'audio_clips\rec_20260203_150051.wav'),
-(832, 5, '2026-02-03 15:00:54', 'hi', 'आलोक तोमर', 'audio_clips\rec_20260203_150051.wav'),
-(833, 5, '2026-02-03 15:00:55', 'en', 'yeah', 'audio_clips\rec_20260203_150054.wav'),
-(834, 5, '2026-02-03 15:00:59', 'en', 'you know', 'audio_clips\rec_20260203_150057.wav'),
-(835, 5, '2026-02-03 15:00:59', 'hi', 'यह में', 'audio_clips\rec_20260203_150057.wav'),
-(836, 5, '2026-02-03 15:01:03', 'es', 'sayal y le en el mundo', 'audio_clips\rec_20260203_150100.wav'),
-(837, 5, '2026-02-03 15:01:03', 'hi', 'रूसा शाली समय एल्यूमीनियम को है', 'audio_clips\rec_20260203_150100.wav'),
-(838, 5, '2026-02-03 15:01:03', 'en', 'essentially let us and like the little unemployment', 'audio_clips\rec_20260203_150100.wav'),
-(839, 5, '2026-02-03 15:01:05', 'en', 'and now', 'audio_clips\rec_20260203_150104.wav'),
-(840, 5, '2026-02-03 15:01:08', 'en', 'certainly', 'audio_clips\rec_20260203_150106.wav'),
-(841, 5, '2026-02-03 15:01:13', 'en', 'don''t', 'audio_clips\rec_20260203_150112.wav'),
-(842, 5, '2026-02-03 15:01:15', 'en', 'what''s going on', 'audio_clips\rec_20260203_150115.wav'),
-(843, 5, '2026-02-03 15:01:16', 'es', 'o sea canadá', 'audio_clips\rec_20260203_150115.wav'),
-(844, 5, '2026-02-03 15:01:16', 'hi', 'उत्तराखंड आखिर थे', 'audio_clips\rec_20260203_150115.wav'),
-(845, 5, '2026-02-03 15:01:21', 'en', 'the only ones', 'audio_clips\rec_20260203_150118.wav'),
-(846, 5, '2026-02-03 15:01:21', 'hi', 'लेकिन है', 'audio_clips\rec_20260203_150118.wav'),
-(847, 5, '2026-02-03 15:01:24', 'en', 'oh good i''m wondering', 'audio_clips\rec_20260203_150121.wav'),
-(848, 5, '2026-02-03 15:01:26', 'hi', 'रोल', 'audio_clips\rec_20260203_150124.wav'),
-(849, 5, '2026-02-03 15:01:26', 'en', 'i know it', 'audio_clips\rec_20260203_150124.wav'),
-(850, 5, '2026-02-03 15:01:30', 'en', 'this was another', 'audio_clips\rec_20260203_150130.wav'),
-(851, 5, '2026-02-03 15:01:31', 'hi', 'कुछ दिनों बाद', 'audio_clips\rec_20260203_150130.wav'),
-(852, 5, '2026-02-03 15:01:36', 'en', 'but when lot', 'audio_clips\rec_20260203_150133.wav'),
-(853, 5, '2026-02-03 15:01:40', 'es', 'es una explica', 'audio_clips\rec_20260203_150139.wav'),
-(854, 5, '2026-02-03 15:01:40', 'hi', 'इसके अलावा नक्सली', 'audio_clips\rec_20260203_150139.wav'),
-(855, 5, '2026-02-03 15:01:40', 'en', 'it''s going to let this actually could you', 'audio_clips\rec_20260203_150139.wav'),
-(856, 5, '2026-02-03 15:01:45', 'en', 'yeah', 'audio_clips\rec_20260203_150145.wav'),
-(857, 5, '2026-02-03 15:02:01', 'en', 'okay', 'audio_clips\rec_20260203_150200.wav'),
-(858, 5, '2026-02-03 15:02:05', 'hi', 'में', 'audio_clips\rec_20260203_150203.wav'),
-(859, 5, '2026-02-03 15:02:06', 'en', 'really', 'audio_clips\rec_20260203_150203.wav'),
-(860, 5, '2026-02-03 15:02:08', 'en', 'a lot of unit', 'audio_clips\rec_20260203_150206.wav'),
-(861, 5, '2026-02-03 15:02:09', 'hi', 'गया और उन्हें', 'audio_clips\rec_20260203_150206.wav'),
-(862, 5, '2026-02-03 15:02:12', 'en', 'you know why', 'audio_clips\rec_20260203_150209.wav'),
-(863, 5, '2026-02-03 15:02:16', 'en', 'hello', 'audio_clips\rec_20260203_150215.wav'),
-(864, 5, '2026-02-03 15:02:41', 'en', 'and', 'audio_clips\rec_20260203_150239.wav'),
-(865, 5, '2026-02-03 15:02:45', 'en', 'the do so', 'audio_clips\rec_20260203_150245.wav'),
-(866, 5, '2026-02-03 15:02:55', 'hi', 'सो या', 'audio_clips\rec_20260203_150254.wav'),
-(867, 5, '2026-02-03 15:02:56', 'en', 'smoke was recording', 'audio_clips\rec_20260203_150254.wav'),
-(868, 5, '2026-02-03 15:03:01', 'hi', 'इसकी प्रॉसेस शुरू करनी होगी', 'audio_clips\rec_20260203_150301.wav'),
-(869, 5, '2026-02-03 15:03:02', 'en', 'the vicinity projects we basically how do you want to be implement', 'audio_clips\rec_20260203_150301.wav'),
-(870, 5, '2026-02-03 15:03:02', 'es', 'que su visita le obligó al implemente', 'audio_clips\rec_20260203_150301.wav'),
-(871, 5, '2026-02-03 15:03:06', 'hi', 'में', 'audio_clips\rec_20260203_150303.wav'),
-(872, 5, '2026-02-03 15:03:14', 'hi', 'में', 'audio_clips\rec_20260203_150309.wav'),
-(873, 5, '2026-02-03 15:03:17', 'en', 'i make while i your stocks', 'audio_clips\rec_20260203_150315.wav'),
-(874, 5, '2026-02-03 15:03:18', 'hi', 'आईआईटी और स्पॉट्स', 'audio_clips\rec_20260203_150315.wav'),
-(875, 5, '2026-02-03 15:03:19', 'en', 'and stuff', 'audio_clips\rec_20260203_150318.wav'),
-(876, 5, '2026-02-03 15:03:20', 'hi', 'खिलाड़ी', 'audio_clips\rec_20260203_150318.wav'),
-(877, 5, '2026-02-03 15:03:24', 'hi', 'ट्रेडिंग शुल्क परीक्षण लगी', 'audio_clips\rec_20260203_150321.wav'),
-(878, 5, '2026-02-03 15:03:26', 'en', 'libertarian don''t know about election how do you want to capability wanted to green vegetable matter', 'audio_clips\rec_20260203_150324.wav'),
-(879, 5, '2026-02-03 15:03:26', 'es', 'va creando nuevos el diccionario bribón siento pilas iguales en fin textualmente', 'audio_clips\rec_20260203_150324.wav'),
-(880, 5, '2026-02-03 15:03:29', 'hi', 'करेंगे', 'audio_clips\rec_20260203_150327.wav'),
-(881, 5, '2026-02-03 15:03:31', 'en', 'yeah', 'audio_clips\rec_20260203_150330.wav'),
-(882, 5, '2026-02-03 15:03:41', 'hi', 'खरीदा', 'audio_clips\rec_20260203_150339.wav'),
-(883, 5, '2026-02-03 15:03:52', 'hi', 'अडूसा', 'audio_clips\rec_20260203_150348.wav'),
-(884, 5, '2026-02-03 15:03:52', 'en', 'yeah i do getting it', 'audio_clips\rec_20260203_150352.wav'),
-(885, 5, '2026-02-03 15:03:54', 'en', 'know like zero the', 'audio_clips\rec_20260203_150352.wav'),
-(886, 5, '2026-02-03 15:03:54', 'es', 'la dijeron', 'audio_clips\rec_20260203_150352.wav'),
-(887, 5, '2026-02-03 15:03:55', 'hi', 'लेकिन की जरूरत है', 'audio_clips\rec_20260203_150354.wav'),
-(888, 5, '2026-02-03 15:03:56', 'en', 'his apartment building', 'audio_clips\rec_20260203_150354.wav'),
-(889, 5, '2026-02-03 15:04:04', 'es', 'es evidente', 'audio_clips\rec_20260203_150403.wav'),
-(890, 5, '2026-02-03 15:04:05', 'hi', 'सारी बातें', 'audio_clips\rec_20260203_150403.wav'),
-(891, 5, '2026-02-03 15:04:05', 'en', 'lil kim', 'audio_clips\rec_20260203_150403.wav'),
-(892, 5, '2026-02-03 15:04:11', 'en', 'i didn''t get to see a lot', 'audio_clips\rec_20260203_150409.wav'),
-(893, 5, '2026-02-03 15:04:12', 'hi', 'अधिकांश अरुण होगा', 'audio_clips\rec_20260203_150409.wav'),
-(894, 5, '2026-02-03 15:04:17', 'en', 'obviously', 'audio_clips\rec_20260203_150415.wav'),
-(895, 5, '2026-02-03 15:04:17', 'es', 'okay sí', 'audio_clips\rec_20260203_150415.wav'),
-(896, 5, '2026-02-03 15:04:17', 'hi', 'फैसला', 'audio_clips\rec_20260203_150415.wav'),
-(897, 5, '2026-02-03 15:04:21', 'hi', 'यह रहता है', 'audio_clips\rec_20260203_150418.wav'),
-(898, 5, '2026-02-03 15:04:22', 'en', 'the address', 'audio_clips\rec_20260203_150422.wav'),
-(899, 5, '2026-02-03 15:04:22', 'es', 'y estas', 'audio_clips\rec_20260203_150422.wav'),
-(900, 5, '2026-02-03 15:04:23', 'en', 'how can i guess', 'audio_clips\rec_20260203_150422.wav'),
-(901, 5, '2026-02-03 15:04:24', 'hi', 'खेल', 'audio_clips\rec_20260203_150422.wav'),
-(902, 5, '2026-02-03 15:04:29', 'en', 'what', 'audio_clips\rec_20260203_150427.wav'),
-(903, 5, '2026-02-03 15:04:39', 'hi', 'बड़े भी', 'audio_clips\rec_20260203_150436.wav'),
-(904, 5, '2026-02-03 15:04:39', 'en', 'are there any', 'audio_clips\rec_20260203_150439.wav'),
-(905, 5, '2026-02-03 15:04:50', 'es', 'y una empresa', 'audio_clips\rec_20260203_150448.wav'),
-(906, 5, '2026-02-03 15:04:50', 'en', 'he learned', 'audio_clips\rec_20260203_150448.wav'),
-(907, 5, '2026-02-03 15:04:51', 'hi', 'इंग्लैंड का', 'audio_clips\rec_20260203_150448.wav'),
-(908, 5, '2026-02-03 15:04:56', 'hi', 'सोचिए', 'audio_clips\rec_20260203_150454.wav'),
-(909, 5, '2026-02-03 15:05:09', 'en', 'i know', 'audio_clips\rec_20260203_150509.wav'),
-(910, 5, '2026-02-03 15:05:10', 'es', 'y lo que', 'audio_clips\rec_20260203_150509.wav'),
-(911, 5, '2026-02-03 15:05:12', 'hi', 'लगाया', 'audio_clips\rec_20260203_150509.wav'),
-(912, 5, '2026-02-03 15:05:15', 'en', 'right now', 'audio_clips\rec_20260203_150512.wav'),
-(913, 5, '2026-02-03 15:05:15', 'es', 'además', 'audio_clips\rec_20260203_150512.wav'),
-(914, 5, '2026-02-03 15:05:19', 'en', 'and then', 'audio_clips\rec_20260203_150518.wav'),
-(915, 5, '2026-02-03 15:05:20', 'es', 'también', 'audio_clips\rec_20260203_150518.wav'),
-(916, 5, '2026-02-03 15:05:22', 'hi', 'रहने लगे', 'audio_clips\rec_20260203_150521.wav'),
-(917, 5, '2026-02-03 15:05:25', 'en', 'area', 'audio_clips\rec_20260203_150524.wav'),
-(918, 5, '2026-02-03 15:05:27', 'hi', 'फिल्म', 'audio_clips\rec_20260203_150524.wav'),
-(919, 5, '2026-02-03 15:05:30', 'en', 'i believe that', 'audio_clips\rec_20260203_150527.wav'),
-(920, 5, '2026-02-03 15:05:31', 'es', 'la empresa', 'audio_clips\rec_20260203_150530.wav'),
-(921, 5, '2026-02-03 15:05:32', 'hi', 'ने बड़ी', 'audio_clips\rec_20260203_150530.wav'),
-(922, 5, '2026-02-03 15:05:34', 'en', 'ready', 'audio_clips\rec_20260203_150533.wav'),
-(923, 5, '2026-02-03 15:05:37', 'hi', 'हमारी कमर कसे', 'audio_clips\rec_20260203_150536.wav'),
-(924, 5, '2026-02-03 15:05:40', 'en', 'my to come up with running', 'audio_clips\rec_20260203_150539.wav'),
-(925, 5, '2026-02-03 15:05:50', 'en', 'amazing', 'audio_clips\rec_20260203_150548.wav'),
-(926, 5, '2026-02-03 15:05:51', 'hi', 'इस नहीं सुना', 'audio_clips\rec_20260203_150548.wav'),
-(927, 5, '2026-02-03 15:05:56', 'en', 'god', 'audio_clips\rec_20260203_150554.wav'),
-(928, 5, '2026-02-03 15:06:01', 'hi', 'ऐसे', 'audio_clips\rec_20260203_150600.wav'),
-(929, 5, '2026-02-03 15:06:02', 'en', 'a good', 'audio_clips\rec_20260203_150600.wav'),
-(930, 5, '2026-02-03 15:06:11', 'en', 'the', 'audio_clips\rec_20260203_150609.wav'),
-(931, 5, '2026-02-03 15:06:17', 'en', 'was', 'audio_clips\rec_20260203_150615.wav'),
-(932, 5, '2026-02-03 15:06:22', 'en', 'i''m kidding', 'audio_clips\rec_20260203_150621.wav'),
-(933, 5, '2026-02-03 15:06:24', 'en', 'yes sir', 'audio_clips\rec_20260203_150621.wav'),
-(934, 5, '2026-02-03 15:06:25', 'es', 'y eso', 'audio_clips\rec_20260203_150624.wav'),
-(935, 5, '2026-02-03 15:06:25', 'hi', 'यशवंत सिन्हा', 'audio_clips\rec_20260203_150624.wav'),
-(936, 5, '2026-02-03 15:06:25', 'en', 'thirty', 'audio_clips\rec_20260203_150624.wav'),
-(937, 5, '2026-02-03 15:06:47', 'en', 'help', 'audio_clips\rec_20260203_150645.wav'),
-(938, 5, '2026-02-03 15:06:52', 'en', 'i commend', 'audio_clips\rec_20260203_150651.wav'),
-(939, 5, '2026-02-03 15:06:56', 'hi', 'पंहुचा', 'audio_clips\rec_20260203_150654.wav'),
-(940, 5, '2026-02-03 15:06:58', 'en', 'yeah', 'audio_clips\rec_20260203_150657.wav'),
-(941, 5, '2026-02-03 15:07:03', 'en', 'you know', 'audio_clips\rec_20260203_150700.wav'),
-(942, 5, '2026-02-03 15:07:08', 'en', 'they''ve got two or three', 'audio_clips\rec_20260203_150706.wav'),
-(943, 5, '2026-02-03 15:07:09', 'hi', 'रोशन', 'audio_clips\rec_20260203_150706.wav'),
-(944, 5, '2026-02-03 15:07:12', 'es', 'el blog', 'audio_clips\rec_20260203_150709.wav'),
-(945, 5, '2026-02-03 15:07:13', 'en', 'the group', 'audio_clips\rec_20260203_150712.wav'),
-(946, 5, '2026-02-03 15:07:13', 'hi', 'गुरु', 'audio_clips\rec_20260203_150712.wav'),
-(947, 5, '2026-02-03 15:07:16', 'en', 'hm revenue', 'audio_clips\rec_20260203_150715.wav'),
-(948, 5, '2026-02-03 15:07:19', 'en', 'life', 'audio_clips\rec_20260203_150718.wav'),
-(949, 5, '2026-02-03 15:07:20', 'hi', 'नई असलियत रुधिर', 'audio_clips\rec_20260203_150718.wav'),
-(950, 5, '2026-02-03 15:07:20', 'en', 'read this plan', 'audio_clips\rec_20260203_150718.wav'),
-(951, 5, '2026-02-03 15:07:21', 'es', 'la cruz', 'audio_clips\rec_20260203_150718.wav'),
-(952, 5, '2026-02-03 15:07:23', 'hi', 'कुछ बयान करना चाहते हैं', 'audio_clips\rec_20260203_150721.wav'),
-(953, 5, '2026-02-03 15:07:26', 'en', 'if we''re going over to the neighbors', 'audio_clips\rec_20260203_150724.wav'),
-(954, 5, '2026-02-03 15:07:33', 'en', 'awesome', 'audio_clips\rec_20260203_150730.wav'),
-(955, 5, '2026-02-03 15:07:33', 'es', 'así', 'audio_clips\rec_20260203_150730.wav'),
-(956, 5, '2026-02-03 15:07:33', 'hi', 'मुसाफिर', 'audio_clips\rec_20260203_150730.wav'),
-(957, 5, '2026-02-03 15:07:38', 'hi', 'बीबीसी लिंक', 'audio_clips\rec_20260203_150736.wav'),
-(958, 5, '2026-02-03 15:07:40', 'en', 'i''m gonna', 'audio_clips\rec_20260203_150739.wav'),
-(959, 5, '2026-02-03 15:07:44', 'hi', 'मतलब है', 'audio_clips\rec_20260203_150742.wav'),
-(960, 5, '2026-02-03 15:07:56', 'en', 'facebook', 'audio_clips\rec_20260203_150754.wav'),
-(961, 5, '2026-02-03 15:08:04', 'hi', 'लेकिन उन्हें', 'audio_clips\rec_20260203_150803.wav'),
-(962, 5, '2026-02-03 15:08:06', 'en', 'what', 'audio_clips\rec_20260203_150803.wav'),
-(963, 5, '2026-02-03 15:08:10', 'hi', 'अखबार का मानना है', 'audio_clips\rec_20260203_150809.wav'),
-(964, 5, '2026-02-03 15:08:11', 'en', 'my mother', 'audio_clips\rec_20260203_150809.wav'),
-(965, 5, '2026-02-03 15:08:13', 'en', 'i''m the one', 'audio_clips\rec_20260203_150812.wav'),
-(966, 5, '2026-02-03 15:08:14', 'hi', 'अनुमान है', 'audio_clips\rec_20260203_150812.wav'),
-(967, 5, '2026-02-03 15:08:14', 'es', 'no hay', 'audio_clips\rec_20260203_150812.wav'),
-(968, 5, '2026-02-03 15:08:19', 'hi', 'अरे', 'audio_clips\rec_20260203_150818.wav'),
-(969, 5, '2026-02-03 15:08:21', 'en', 'also i''m with you', 'audio_clips\rec_20260203_150818.wav'),
-(970, 5, '2026-02-03 15:08:22', 'hi', 'गांधीजी ने हाथ उठाकर', 'audio_clips\rec_20260203_150818.wav'),
-(971, 5, '2026-02-03 15:08:24', 'es', 'la luz diurna', 'audio_clips\rec_20260203_150822.wav'),
-(972, 5, '2026-02-03 15:08:26', 'en', 'their community', 'audio_clips\rec_20260203_150824.wav'),
-(973, 5, '2026-02-03 15:08:26', 'hi', 'निर्मल', 'audio_clips\rec_20260203_150824.wav'),
-(974, 5, '2026-02-03 15:08:28', 'hi', 'आजकल', 'audio_clips\rec_20260203_150827.wav'),
-(975, 5, '2026-02-03 15:08:34', 'hi', 'सुंदर और वाले', 'audio_clips\rec_20260203_150833.wav'),
-(976, 5, '2026-02-03 15:08:39', 'hi', 'शिकार है', 'audio_clips\rec_20260203_150836.wav'),
-(977, 5, '2026-02-03 15:08:46', 'en', 'well', 'audio_clips\rec_20260203_150845.wav'),
-(978, 5, '2026-02-03 15:08:50', 'hi', 'दुखी', 'audio_clips\rec_20260203_150848.wav'),
-(979, 5, '2026-02-03 15:08:51', 'en', 'to be cool', 'audio_clips\rec_20260203_150851.wav'),
-(980, 5, '2026-02-03 15:08:55', 'hi', 'बढ़िया', 'audio_clips\rec_20260203_150854.wav'),
-(981, 5, '2026-02-03 15:08:55', 'es', 'martín', 'audio_clips\rec_20260203_150854.wav'),
-(982, 5, '2026-02-03 15:09:02', 'en', 'i iceland', 'audio_clips\rec_20260203_150900.wav'),
-(983, 5, '2026-02-03 15:09:03', 'hi', 'आइसलैंड', 'audio_clips\rec_20260203_150900.wav'),
-(984, 5, '2026-02-03 15:09:05', 'es', 'así', 'audio_clips\rec_20260203_150903.wav'),
-(985, 5, '2026-02-03 15:09:24', 'hi', 'माइकल', 'audio_clips\rec_20260203_150921.wav'),
-(986, 5, '2026-02-03 15:09:29', 'hi', 'छोड़ दो', 'audio_clips\rec_20260203_150927.wav'),
-(987, 5, '2026-02-03 15:09:43', 'en', 'cause', 'audio_clips\rec_20260203_150942.wav'),
-(988, 5, '2026-02-03 15:09:46', 'en', 'a nice taste', 'audio_clips\rec_20260203_150945.wav'),
-(989, 5, '2026-02-03 15:09:50', 'hi', 'कभी', 'audio_clips\rec_20260203_150948.wav'),
-(990, 5, '2026-02-03 15:10:03', 'hi', 'गाय संतुष्ट नहीं लगे', 'audio_clips\rec_20260203_151000.wav'),
-(991, 5, '2026-02-03 15:10:05', 'en', 'so where do you guys i just need to like to start were doing list', 'audio_clips\rec_20260203_151003.wav'),
-(992, 5, '2026-02-03 15:10:05', 'es', 'liga es sánchez hábito lector verla en', 'audio_clips\rec_20260203_151003.wav'),
-(993, 5, '2026-02-03 15:10:05', 'hi', 'वर्ल्डवाइड बॉक्स', 'audio_clips\rec_20260203_151003.wav'),
-(994, 5, '2026-02-03 15:10:15', 'hi', 'वाली डीमैट अकाउंट है', 'audio_clips\rec_20260203_151012.wav'),
-(995, 5, '2026-02-03 15:10:15', 'en', 'already met a company i do have a demon', 'audio_clips\rec_20260203_151012.wav'),
-(996, 5, '2026-02-03 15:10:15', 'es', 'ah legítima te compartir ayuda', 'audio_clips\rec_20260203_151012.wav'),
-(997, 5, '2026-02-03 15:10:17', 'en', 'but don''t lick veteran list i just one', 'audio_clips\rec_20260203_151015.wav'),
-(998, 5, '2026-02-03 15:10:18', 'hi', 'बट वेल्ड हिंदुस्तान', 'audio_clips\rec_20260203_151015.wav'),
-(999, 5, '2026-02-03 15:30:58', 'en', 'can you understand what i''m pregnant transcribe', 'audio_clips\rec_20260203_153056.wav'),
-(1000, 5, '2026-02-03 15:30:59', 'en', 'at all', 'audio_clips\rec_20260203_153059.wav'),
-(1001, 5, '2026-02-03 15:31:02', 'en', 'clinton''s going to be', 'audio_clips\rec_20260203_153102.wav'),
-(1002, 5, '2026-02-03 15:31:06', 'en', 'the river', 'audio_clips\rec_20260203_153105.wav'),
-(1003, 5, '2026-02-03 15:31:08', 'en', 'people', 'audio_clips\rec_20260203_153105.wav'),
-(1004, 5, '2026-02-03 15:31:10', 'en', 'internship', 'audio_clips\rec_20260203_153108.wav'),
-(1005, 5, '2026-02-03 15:31:13', 'hi', 'हिन्दी में हुआ', 'audio_clips\rec_20260203_153111.wav'),
-(1006, 5, '2026-02-03 15:31:19', 'hi', 'इस मैच को', 'audio_clips\rec_20260203_153117.wav'),
-(1007, 5, '2026-02-03 15:31:24', 'hi', 'प्यासा लौट आया', 'audio_clips\rec_20260203_153123.wav'),
-(1008, 5, '2026-02-03 15:31:29', 'hi', 'एक है', 'audio_clips\rec_20260203_153126.wav'),
-(1009, 5, '2026-02-03 15:31:34', 'hi', 'श्रीनगर ने', 'audio_clips\rec_20260203_153132.wav'),
-(1010, 5, '2026-02-03 15:31:36', 'hi', 'लडका वाला', 'audio_clips\rec_20260203_153135.wav'),
-(1011, 5, '2026-02-03 15:31:41', 'hi', 'यहां', 'audio_clips\rec_20260203_153138.wav'),
-(1012, 5, '2026-02-03 15:33:19', 'hi', 'मेरा नाम के पाटील रेड्डी', 'audio_clips\rec_20260203_153319.wav'),
-(1013, 5, '2026-02-03 15:33:25', 'hi', 'हुआ रहा होगा', 'audio_clips\rec_20260203_153325.wav'),
-(1014, 5, '2026-02-03 15:33:34', 'hi', 'अभी रहता था', 'audio_clips\rec_20260203_153334.wav'),
-(1015, 5, '2026-02-03 15:33:39', 'es', 'por la situación', 'audio_clips\rec_20260203_153337.wav'),
-(1016, 5, '2026-02-03 15:33:54', 'es', 'más uno', 'audio_clips\rec_20260203_153352.wav'),
-(1017, 5, '2026-02-03 15:34:02', 'es', 'es alarmante', 'audio_clips\rec_20260203_153401.wav'),
-(1018, 5, '2026-02-03 15:34:08', 'es', 'la matriz aprehensión uno nuevo', 'audio_clips\rec_20260203_153407.wav'),
-(1019, 5, '2026-02-03 15:34:11', 'es', 'vale explica como de', 'audio_clips\rec_20260203_153410.wav'),
-(1020, 5, '2026-02-03 15:34:15', 'es', 'primera dama diseño más', 'audio_clips\rec_20260203_153413.wav'),
-(1021, 5, '2026-02-03 15:34:20', 'hi', 'भारत मेरा महान है', 'audio_clips\rec_20260203_153419.wav'),
-(1022, 5, '2026-02-03 15:34:22', 'hi', 'इंसान बहुत मारा है', 'audio_clips\rec_20260203_153422.wav'),
-(1023, 5, '2026-02-03 15:34:26', 'hi', 'भारत मेरा माहौल है', 'audio_clips\rec_20260203_153425.wav'),
-(1024, 5, '2026-02-03 15:34:30', 'hi', 'अब बुलबुले बुलबुले', 'audio_clips\rec_20260203_153428.wav'),
-(1025, 5, '2026-02-03 15:34:39', 'hi', 'अनूप मिश्रा और आलो आहे', 'audio_clips\rec_20260203_153437.wav'),
-(1026, 5, '2026-02-03 15:34:41', 'hi', 'क्या होगा', 'audio_clips\rec_20260203_153440.wav'),
-(1027, 5, '2026-02-03 15:34:47', 'hi', 'भी भी आए', 'audio_clips\rec_20260203_153446.wav'),
-(1028, 5, '2026-02-03 15:34:50', 'en', 'this argument my computer', 'audio_clips\rec_20260203_153449.wav'),
-(1029, 5, '2026-02-03 15:34:52', 'en', 'english', 'audio_clips\rec_20260203_153452.wav'),
-(1030, 5, '2026-02-03 15:34:56', 'en', 'tomorrow', 'audio_clips\rec_20260203_153455.wav'),
-(1031, 5, '2026-02-03 15:35:07', 'en', 'reply', 'audio_clips\rec_20260203_153507.wav'),
-(1032, 5, '2026-02-03 15:35:09', 'en', 'you were would be amazing', 'audio_clips\rec_20260203_153507.wav'),
-(1033, 5, '2026-02-03 15:35:12', 'en', 'i live without you', 'audio_clips\rec_20260203_153510.wav'),
-(1034, 5, '2026-02-03 15:35:14', 'en', 'yeah we''re going to the', 'audio_clips\rec_20260203_153513.wav'),
-(1035, 5, '2026-02-03 15:35:20', 'en', 'you know what the bomb exploded and', 'audio_clips\rec_20260203_153519.wav'),
-(1036, 5, '2026-02-03 15:35:25', 'en', 'really', 'audio_clips\rec_20260203_153525.wav'),
-(1037, 5, '2026-02-03 15:35:38', 'en', 'well', 'audio_clips\rec_20260203_153537.wav'),
-(1038, 5, '2026-02-03 15:35:40', 'en', 'the hands of handsome', 'audio_clips\rec_20260203_153540.wav'),
-(1039, 5, '2026-02-03 15:35:52', 'en', 'edited so popular that', 'audio_clips\rec_20260203_153552.wav'),
-(1040, 5, '2026-02-03 15:35:57', 'en', 'that would need to get in on current events i thought the', 'audio_clips\rec_20260203_153555.wav'),
-(1041, 5, '2026-02-03 15:36:14', 'en', 'hey i guess it worked or whatever', 'audio_clips\rec_20260203_153613.wav'),
-(1042, 5, '2026-02-03 15:36:19', 'en', 'happening', 'audio_clips\rec_20260203_153619.wav'),
-(1043, 5, '2026-02-03 15:36:24', 'en', 'yes', 'audio_clips\rec_20260203_153622.wav'),
-(1044, 5, '2026-02-03 15:36:53', 'en', 'this will never do', 'audio_clips\rec_20260203_153652.wav'),
-(1045, 5, '2026-02-03 15:37:07', 'en', 'how about', 'audio_clips\rec_20260203_153707.wav'),
-(1046, 5, '2026-02-03 15:37:14', 'en', 'human being would you there was one', 'audio_clips\rec_20260203_153713.wav'),
-(1047, 5, '2026-02-03 15:37:27', 'en', 'school', 'audio_clips\rec_20260203_153726.wav'),
-(1048, 5, '2026-02-03 15:38:21', 'en', 'the', 'audio_clips\rec_20260203_153820.wav'),
-(1049, 5, '2026-02-03 15:38:27', 'en', 'so any', 'audio_clips\rec_20260203_153826.wav'),
-(1050, 5, '2026-02-03 15:38:33', 'en', 'on hold', 'audio_clips\rec_20260203_153832.wav'),
-(1051, 5, '2026-02-03 15:38:43', 'en', 'like', 'audio_clips\rec_20260203_153841.wav'),
-(1052, 5, '2026-02-03 15:39:15', 'en', 'hello', 'audio_clips\rec_20260203_153914.wav'),
-(1053, 5, '2026-02-03 15:39:20', 'en', 'ago', 'audio_clips\rec_20260203_153920.wav'),
-(1054, 5, '2026-02-03 15:39:30', 'en', 'liberal muslims are going to work', 'audio_clips\rec_20260203_153929.wav'),
-(1055, 5, '2026-02-03 15:39:35', 'en', 'well that''s a new', 'audio_clips\rec_20260203_153932.wav'),
-(1056, 5, '2026-02-03 15:40:39', 'en', 'your herbal', 'audio_clips\rec_20260203_154038.wav'),
-(1057, 5, '2026-02-03 15:40:52', 'en', 'english to screen generally show you the demoting i got the plants going to be voting but i''m in i''m in every and already know idiotic from so the transcript is important because of how', 'audio_clips\rec_20260203_154050.wav'),
-(1058, 5, '2026-02-03 15:40:55', 'en', 'to jupiter an you', 'audio_clips\rec_20260203_154053.wav'),
-(1059, 5, '2026-02-03 15:41:08', 'en', 'yeah so the transcript but it just wasn''t sure if you''re facing with', 'audio_clips\rec_20260203_154108.wav'),
-(1060, 5, '2026-02-03 15:41:11', 'en', 'can', 'audio_clips\rec_20260203_154111.wav'),
-(1061, 5, '2026-02-03 15:41:16', 'en', 'hello', 'audio_clips\rec_20260203_154114.wav'),
-(1062, 5, '2026-02-03 15:41:19', 'en', 'on second', 'audio_clips\rec_20260203_154117.wav'),
-(1063, 5, '2026-02-03 15:41:38', 'en', 'i''m an article', 'audio_clips\rec_20260203_154138.wav'),
-(1064, 5, '2026-02-03 15:41:47', 'en', 'basically we''re having this problem with the transcript', 'audio_clips\rec_20260203_154147.wav'),
-(1065, 5, '2026-02-03 15:41:53', 'en', 'yeah so i think i fixed so we just and will see something like', 'audio_clips\rec_20260203_154153.wav'),
-(1066, 5, '2026-02-03 15:41:55', 'en', 'hey what''s up', 'audio_clips\rec_20260203_154153.wav'),
-(1067, 5, '2026-02-03 15:42:03', 'en', 'basically we''re having this problem with the transcript yeah so i think i fixed so we just and will see something like hey what''s up ', 'manual_entry'),
-(1068, 5, '2026-02-03 15:42:04', 'en', 'is it enough yeah i do this on a in spanish', 'audio_clips\rec_20260203_154202.wav'),
-(1069, 5, '2026-02-03 15:42:08', 'hi', 'आजकल इसलिए', 'audio_clips\rec_20260203_154205.wav'),
-(1070, 5, '2026-02-03 15:42:11', 'hi', 'मेरा नाम है', 'audio_clips\rec_20260203_154211.wav'),
-(1071, 5, '2026-02-03 15:42:13', 'hi', 'अजीब', 'audio_clips\rec_20260203_154211.wav'),
-(1072, 5, '2026-02-03 15:42:20', 'hi', 'या आंसू मेट्रो फार यू', 'audio_clips\rec_20260203_154217.wav'),
-(1073, 5, '2026-02-03 15:42:23', 'hi', 'खबरें भी आई सी यू', 'audio_clips\rec_20260203_154220.wav'),
-(1074, 5, '2026-02-03 15:42:30', 'hi', 'मॉडल वर्ग एसआईटी को सिंह अनिल तो पाइपलाइन भोजन फ्लोटिंग कुसुम रीजन सौ अट्ठावन मैन्युअली', 'audio_clips\rec_20260203_154229.wav'),
-(1075, 5, '2026-02-03 15:42:35', 'hi', 'इंस्टॉल उतरी पर बॉस का निर्णय लिमिटेड गई', 'audio_clips\rec_20260203_154232.wav'),
-(1076, 5, '2026-02-03 15:42:44', 'hi', 'अहम नोटिस शुभ विनय गोटू जो', 'audio_clips\rec_20260203_154241.wav'),
-(1077, 5, '2026-02-03 15:42:48', 'hi', 'अनशन हाउस कोर्ट ने कांग्रेस इस', 'audio_clips\rec_20260203_154247.wav'),
-(1078, 5, '2026-02-03 15:42:51', 'hi', 'सिंह का सर्वथा उदय कोटक एमेजॉन', 'audio_clips\rec_20260203_154250.wav'),
-(1079, 5, '2026-02-03 15:42:58', 'hi', 'एपिसोड में सबकुछ', 'audio_clips\rec_20260203_154256.wav'),
-(1080, 5, '2026-02-03 15:43:06', 'hi', 'ओवर में जश्न व', 'audio_clips\rec_20260203_154305.wav'),
-(1081, 5, '2026-02-03 15:43:15', 'hi', 'क्योंकि यह सब कुछ रिकॉर्ड टूटा', 'audio_clips\rec_20260203_154314.wav'),
-(1082, 5, '2026-02-03 15:43:22', 'hi', 'वे सब कुछ लिंक्स', 'audio_clips\rec_20260203_154320.wav'),
-(1083, 5, '2026-02-03 15:43:26', 'hi', 'रखना है', 'audio_clips\rec_20260203_154326.wav'),
-(1084, 5, '2026-02-03 15:43:29', 'hi', 'प्रैक्टिस आए', 'audio_clips\rec_20260203_154326.wav'),
-(1085, 5, '2026-02-03 15:43:35', 'hi', 'इन तस्वीरों कंपनी है', 'audio_clips\rec_20260203_154335.wav'),
-(1086, 5, '2026-02-03 15:43:42', 'hi', 'या स्टिंग होगी', 'audio_clips\rec_20260203_154341.wav'),
-(1087, 5, '2026-02-03 15:43:47', 'hi', 'अंधे जूस पी सिंह प्रदेश', 'audio_clips\rec_20260203_154344.wav'),
-(1088, 5, '2026-02-03 15:44:12', 'hi', 'गया', 'audio_clips\rec_20260203_154411.wav'),
-(1089, 5, '2026-02-03 15:44:18', 'hi', 'वर्ष', 'audio_clips\rec_20260203_154417.wav'),
-(1090, 5, '2026-02-03 15:44:20', 'hi', 'अरावली में', 'audio_clips\rec_20260203_154417.wav'),
-(1091, 5, '2026-02-03 15:44:33', 'hi', 'किन्तु', 'audio_clips\rec_20260203_154432.wav'),
-(1092, 5, '2026-02-03 15:44:38', 'hi', 'और है', 'audio_clips\rec_20260203_154435.wav'),
-(1093, 5, '2026-02-03 15:44:43', 'hi', 'दो एक', 'audio_clips\rec_20260203_154441.wav'),
-(1094, 5, '2026-02-03 15:44:48', 'hi', 'अन्ना', 'audio_clips\rec_20260203_154447.wav'),
-(1095, 5, '2026-02-03 15:45:14', 'hi', 'इसमें यूक्रेन इंप्लीमेंट सिंध प्रांत के ब्रिक्स', 'audio_clips\rec_20260203_154514.wav'),
-(1096, 5, '2026-02-03 15:45:21', 'hi', 'यह एक नकली में अक्सर', 'audio_clips\rec_20260203_154520.wav'),
-(1097, 5, '2026-02-03 15:45:26', 'hi', 'का ब्लड', 'audio_clips\rec_20260203_154523.wav'),
-(1098, 5, '2026-02-03 15:45:27', 'hi', 'दोनों', 'audio_clips\rec_20260203_154526.wav'),
-(1099, 5, '2026-02-03 15:45:31', 'hi', 'स्वामी ने', 'audio_clips\rec_20260203_154529.wav'),
-(1100, 5, '2026-02-03 15:45:32', 'hi', 'विधायक यूटर', 'audio_clips\rec_20260203_154529.wav'),
-(1101, 5, '2026-02-03 15:45:44', 'hi', 'नौ इंच है', 'audio_clips\rec_20260203_154544.wav'),
-(1102, 5, '2026-02-03 15:45:49', 'hi', 'आपको सिर्फ', 'audio_clips\rec_20260203_154547.wav'),
-(1103, 5, '2026-02-03 15:45:52', 'hi', 'रशिया', 'audio_clips\rec_20260203_154550.wav'),
-(1104, 5, '2026-02-03 15:45:54', 'hi', 'सियासी', 'audio_clips\rec_20260203_154553.wav'),
-(1105, 5, '2026-02-03 15:45:59', 'hi', 'रोहित सिंह के कुछ चुनौती', 'audio_clips\rec_20260203_154556.wav'),
-(1106, 5, '2026-02-03 15:46:05', 'hi', 'आवाजाही भी ट्राई टू समस्या हो गया है', 'audio_clips\rec_20260203_154602.wav'),
-(1107, 5, '2026-02-03 15:46:08', 'hi', 'इन लीटर विंसी वॉटर', 'audio_clips\rec_20260203_154605.wav'),
-(1108, 5, '2026-02-03 15:46:11', 'hi', 'जनपद इस प्रोजेक्ट', 'audio_clips\rec_20260203_154608.wav'),
-(1109, 5, '2026-02-03 15:46:16', 'hi', 'उच्च पदस्थ', 'audio_clips\rec_20260203_154614.wav'),
-(1110, 5, '2026-02-03 15:46:33', 'hi', 'फ्रांस के सिंगर ट्रांसफर संदर्भ अधिकांश ट्रांसफर वार्ता में', 'audio_clips\rec_20260203_154632.wav'),
-(1111, 5, '2026-02-03 15:46:37', 'hi', 'कुछ', 'audio_clips\rec_20260203_154635.wav'),
-(1112, 5, '2026-02-03 15:46:43', 'hi', 'अच्छी ली और युवा इस बुकिंग नहीं', 'audio_clips\rec_20260203_154641.wav'),
-(1113, 5, '2026-02-03 15:46:51', 'hi', 'नायब सिंह सैनी शुभ बट इफ यू वॉन्ट पिप्पलाद ने स्मॉल थिंग्स रहा है', 'audio_clips\rec_20260203_154650.wav'),
-(1114, 5, '2026-02-03 15:47:08', 'hi', 'उनकी एंड इफ इट पॉसिबल के गठित किताब रिपोर्ट की पुष्टि स्कोडा', 'audio_clips\rec_20260203_154708.wav'),
-(1115, 5, '2026-02-03 15:47:15', 'hi', 'कुछ खास लेटेस्ट रिपोर्ट', 'audio_clips\rec_20260203_154714.wav'),
-(1116, 5, '2026-02-03 15:47:20', 'hi', 'धीमी मिलकर', 'audio_clips\rec_20260203_154717.wav'),
-(1117, 5, '2026-02-03 17:33:54', 'en', 'q i read the know tried to work on the spot once', 'audio_clips\rec_20260203_173353.wav'),
-(1118, 5, '2026-02-03 17:34:02', 'en', 'could i have been i sure what''s working as of know you can like oh say something and despite this was gonna work', 'audio_clips\rec_20260203_173402.wav'),
-(1119, 5, '2026-02-03 17:34:09', 'en', 'once', 'audio_clips\rec_20260203_173408.wav'),
-(1120, 5, '2026-02-03 17:34:25', 'en', 'yeah sure that', 'audio_clips\rec_20260203_173423.wav'),
-(1121, 5, '2026-02-03 17:34:35', 'en', 'yeah okay so are the problem i fish was with the speaking to the', 'audio_clips\rec_20260203_173435.wav'),
-(1122, 5, '2026-02-03 17:34:39', 'en', 'once again', NULL),
-(1123, 5, '2026-02-03 17:34:46', 'en', 'yeah this it''s it seeing speech is not supported', 'audio_clips\rec_20260203_173444.wav'),
-(1124, 5, '2026-02-03 17:34:49', 'en', 'yup', 'audio_clips\rec_20260203_173447.wav'),
-(1125, 5, '2026-02-03 17:34:54', 'en', 'okay', 'audio_clips\rec_20260203_173453.wav'),
-(1126, 5, '2026-02-03 17:35:03', 'en', 'cool cool', 'audio_clips\rec_20260203_173502.wav'),
-(1127, 5, '2026-02-03 17:35:11', 'en', 'oh i heard of dirt out there was some what is so popular go over here i don''t know that it', 'audio_clips\rec_20260203_173511.wav'),
-(1128, 5, '2026-02-03 17:35:19', 'en', 'nice oil logo are you learning potter oh yeah', 'audio_clips\rec_20260203_173517.wav'),
-(1129, 5, '2026-02-03 17:35:24', 'en', 'this learning thought the i''ve we just need to add next about of over here that said', 'audio_clips\rec_20260203_173523.wav'),
-(1130, 5, '2026-02-03 17:35:33', 'en', 'if the click on it if it ripped the hard it still looking', 'audio_clips\rec_20260203_173532.wav'),
-(1131, 5, '2026-02-03 17:35:52', 'en', 'oh okay good', 'audio_clips\rec_20260203_173550.wav'),
-(1132, 5, '2026-02-03 17:35:58', 'en', 'i think i''ve already seen any be a key this because yeah germany so is to stop feeling', 'audio_clips\rec_20260203_173556.wav'),
-(1133, 5, '2026-02-03 17:36:13', 'en', 'okay or else i''ll try making some changes once i come back home is a cool than', 'audio_clips\rec_20260203_173611.wav'),
-(1134, 5, '2026-02-03 17:36:18', 'en', 'and if it''s if it''s working out i''ll try to i have you tried to connect again', 'audio_clips\rec_20260203_173617.wav'),
-(1135, 5, '2026-02-03 17:36:29', 'en', 'the nifty once higher elo work on it though once i''m done does not go the stash', 'audio_clips\rec_20260203_173629.wav'),
-(1136, 5, '2026-02-03 17:36:34', 'en', 'actually yeah so sad to say something new', 'audio_clips\rec_20260203_173632.wav'),
-(1137, 5, '2026-02-03 17:37:20', 'en', 'actually i got one predecessor me to do was his admit to let go what is a english like new two hundred rupees in one stock and try to understand how to market is working because he said that if i don''t have any prior knowledge on stocks so this is buffy he said if you want to understand the product you need to do with it', 'audio_clips\rec_20260203_173720.wav'),
-(1138, 5, '2026-02-03 17:37:33', 'en', 'yeah', 'audio_clips\rec_20260203_173732.wav'),
-(1139, 5, '2026-02-03 17:37:43', 'en', 'yeah yeah yeah that''s cool', 'audio_clips\rec_20260203_173741.wav'),
-(1140, 5, '2026-02-03 17:37:49', 'en', 'ando one mana cushion guys', 'audio_clips\rec_20260203_173747.wav'),
-(1141, 5, '2026-02-03 17:38:04', 'en', 'are there any more a major changes that should be added to this transcriber a project because i you know like on the with the health once we had to like fears the doctor financial proponent of that are there anything like this also for the soul or again', 'audio_clips\rec_20260203_173802.wav'),
-(1142, 5, '2026-02-03 17:38:17', 'en', 'okay so dead a school for adding more extra features right', 'audio_clips\rec_20260203_173817.wav'),
-(1143, 5, '2026-02-03 17:38:20', 'en', 'well in that environment', 'audio_clips\rec_20260203_173820.wav'),
-(1144, 5, '2026-02-03 17:38:35', 'en', 'oh okay pages and so good', 'audio_clips\rec_20260203_173835.wav'),
-(1145, 5, '2026-02-03 17:38:41', 'en', 'oh good', 'audio_clips\rec_20260203_173841.wav'),
-(1146, 5, '2026-02-03 17:38:47', 'en', 'and then i''ll take my new from london will try to connect ones i come back', 'audio_clips\rec_20260203_173847.wav'),
-(1147, 5, '2026-02-03 17:38:51', 'en', 'alright by guns', 'audio_clips\rec_20260203_173850.wav'),
-(1148, 5, '2026-02-03 20:21:41', 'en', 'he neither are there are done', 'audio_clips\rec_20260203_202139.wav'),
-(1149, 5, '2026-02-03 20:23:13', 'en', 'yeah', 'audio_clips\rec_20260203_202312.wav'),
-(1150, 5, '2026-02-03 20:23:18', 'en', 'only', 'audio_clips\rec_20260203_202318.wav'),
-(1151, 5, '2026-02-04 10:31:35', 'en', 'issue', 'audio_clips\rec_20260204_103133.wav'),
-(1152, 5, '2026-02-04 10:31:36', 'en', 'probably', 'audio_clips\rec_20260204_103136.wav'),
-(1153, 5, '2026-02-04 10:31:43', 'en', 'i''m the man', 'audio_clips\rec_20260204_103142.wav'),
-(1154, 5, '2026-02-04 10:31:48', 'en', 'the money is like he''s a fan boy', 'audio_clips\rec_20260204_103148.wav'),
-(1155, 5, '2026-02-04 10:31:51', 'en', 'grassroots', 'audio_clips\rec_20260204_103151.wav'),
-(1156, 5, '2026-02-04 10:31:55', 'en', 'grassy up the lack of support of them', 'audio_clips\rec_20260204_103154.wav'),
-(1157, 5, '2026-02-04 10:32:01', 'en', 'same man', 'audio_clips\rec_20260204_103200.wav'),
-(1158, 5, '2026-02-04 10:32:04', 'en', 'or family', 'audio_clips\rec_20260204_103203.wav'),
-(1159, 5, '2026-02-04 10:32:11', 'en', 'issue', 'audio_clips\rec_20260204_103209.wav'),
-(1160, 5, '2026-02-04 10:32:18', 'en', 'image of', 'audio_clips\rec_20260204_103215.wav'),
-(1161, 5, '2026-02-04 10:32:23', 'en', 'them', 'audio_clips\rec_20260204_103221.wav'),
-(1162, 5, '2026-02-04 10:32:33', 'en', 'no i haven''t declared it yeah', 'audio_clips\rec_20260204_103230.wav'),
-(1163, 5, '2026-02-04 10:32:43', 'en', 'yeah i do have a stable emotional arousal know why do i didn''t get it from office dust voters', 'audio_clips\rec_20260204_103239.wav'),
-(1164, 5, '2026-02-04 10:32:47', 'en', 'i did not to get an information', 'audio_clips\rec_20260204_103245.wav'),
-(1165, 5, '2026-02-04 10:32:55', 'en', 'good luck', 'audio_clips\rec_20260204_103254.wav'),
-(1166, 5, '2026-02-04 10:33:01', 'en', 'other multiplicity nearly it''s have', 'audio_clips\rec_20260204_103300.wav'),
-(1167, 5, '2026-02-04 10:33:04', 'en', 'great', 'audio_clips\rec_20260204_103303.wav'),
-(1168, 5, '2026-02-04 10:33:07', 'en', 'really play some things that i mean it''s sooner', 'audio_clips\rec_20260204_103306.wav'),
-(1169, 5, '2026-02-04 10:33:14', 'en', 'oh flu is everybody', 'audio_clips\rec_20260204_103312.wav'),
-(1170, 5, '2026-02-04 10:33:16', 'en', 'today it''s a novel', 'audio_clips\rec_20260204_103315.wav'),
-(1171, 5, '2026-02-04 10:33:21', 'en', 'right', 'audio_clips\rec_20260204_103321.wav'),
-(1172, 5, '2026-02-04 10:33:33', 'en', 'you can only own actually i did u s three own mistakes with them', 'audio_clips\rec_20260204_103333.wav'),
-(1173, 5, '2026-02-04 10:33:39', 'en', 'let me know a nice voice gets in the refused possible in the short', 'audio_clips\rec_20260204_103336.wav'),
-(1174, 5, '2026-02-04 10:33:40', 'en', 'that is a comedy', 'audio_clips\rec_20260204_103339.wav'),
-(1175, 5, '2026-02-04 10:33:47', 'en', 'okay good care so much approach', 'audio_clips\rec_20260204_103345.wav'),
-(1176, 5, '2026-02-04 10:33:49', 'en', 'only one hundred in malibu', 'audio_clips\rec_20260204_103348.wav'),
-(1177, 5, '2026-02-04 10:33:50', 'en', 'inmates', 'audio_clips\rec_20260204_103348.wav'),
-(1178, 5, '2026-02-04 10:34:04', 'en', 'yeah this year due to was actually working yesterday so do it wasn''t working so the thing is it''s only working with thinking it''s not working or to fire is my onto this process it''s only looking for members produce', 'audio_clips\rec_20260204_103403.wav'),
-(1179, 5, '2026-02-04 10:34:10', 'en', 'so the standard and smoking we just need to check the bills and and message', 'audio_clips\rec_20260204_103409.wav'),
-(1180, 5, '2026-02-04 10:34:12', 'en', 'that''s', 'audio_clips\rec_20260204_103409.wav'),
-(1181, 5, '2026-02-04 10:34:18', 'en', 'unmet comes to practice best the obvious to be aren''t working so be up to three', 'audio_clips\rec_20260204_103418.wav'),
-(1182, 5, '2026-02-04 10:34:20', 'en', 'that''s an update', 'audio_clips\rec_20260204_103418.wav'),
-(1183, 5, '2026-02-04 10:34:26', 'en', 'independent a lot of them in problem', 'audio_clips\rec_20260204_103424.wav'),
-(1184, 5, '2026-02-04 10:34:27', 'en', 'yeah', 'audio_clips\rec_20260204_103424.wav'),
-(1185, 5, '2026-02-04 10:34:37', 'en', 'if we''re going to do but off', 'audio_clips\rec_20260204_103436.wav'),
-(1186, 5, '2026-02-04 10:34:43', 'en', 'look at is it isn''t i mean and', 'audio_clips\rec_20260204_103442.wav'),
-(1187, 5, '2026-02-04 10:34:46', 'en', 'my pub', 'audio_clips\rec_20260204_103445.wav'),
-(1188, 5, '2026-02-04 10:34:56', 'en', 'recent', 'audio_clips\rec_20260204_103454.wav'),
-(1189, 5, '2026-02-04 10:34:59', 'en', 'the democrats', 'audio_clips\rec_20260204_103457.wav'),
-(1190, 5, '2026-02-04 10:35:14', 'en', 'last i just', 'audio_clips\rec_20260204_103512.wav'),
-(1191, 5, '2026-02-04 10:35:20', 'en', 'take', 'audio_clips\rec_20260204_103518.wav'),
-(1192, 5, '2026-02-04 10:35:31', 'en', 'oh my god', 'audio_clips\rec_20260204_103530.wav'),
-(1193, 5, '2026-02-04 10:35:36', 'en', 'i don''t think that was in economic', 'audio_clips\rec_20260204_103533.wav'),
-(1194, 5, '2026-02-04 10:35:42', 'en', 'i know', 'audio_clips\rec_20260204_103539.wav'),
-(1195, 5, '2026-02-04 10:35:47', 'en', 'the', 'audio_clips\rec_20260204_103545.wav'),
-(1196, 5, '2026-02-04 10:35:51', 'en', 'okay', 'audio_clips\rec_20260204_103548.wav'),
-(1197, 5, '2026-02-04 10:35:56', 'en', 'because', 'audio_clips\rec_20260204_103554.wav'),
-(1198, 5, '2026-02-04 10:36:01', 'en', 'yeah', 'audio_clips\rec_20260204_103600.wav'),
-(1199, 5, '2026-02-04 10:36:04', 'en', 'remember a trap', 'audio_clips\rec_20260204_103603.wav'),
-(1200, 5, '2026-02-04 10:36:11', 'en', 'should be recruited by going to like oh my gosh', 'audio_clips\rec_20260204_103609.wav'),
-(1201, 5, '2026-02-04 10:36:15', 'en', 'i also have on patio', 'audio_clips\rec_20260204_103612.wav'),
-(1202, 5, '2026-02-04 10:36:18', 'en', 'yeah', 'audio_clips\rec_20260204_103618.wav'),
-(1203, 5, '2026-02-04 10:36:21', 'en', 'the be paid that', 'audio_clips\rec_20260204_103618.wav'),
-(1204, 5, '2026-02-04 10:36:29', 'en', 'good lax', 'audio_clips\rec_20260204_103627.wav'),
-(1205, 5, '2026-02-04 10:36:34', 'en', 'hello', 'audio_clips\rec_20260204_103633.wav'),
-(1206, 5, '2026-02-04 10:36:37', 'en', 'he might have never had', 'audio_clips\rec_20260204_103636.wav'),
-(1207, 5, '2026-02-04 10:36:48', 'en', 'my grandmother', 'audio_clips\rec_20260204_103645.wav'),
-(1208, 5, '2026-02-04 10:36:53', 'en', 'not only that fewer workers', 'audio_clips\rec_20260204_103651.wav'),
-(1209, 5, '2026-02-04 10:36:58', 'en', 'right i wasn''t always the back to do something about the war and he became', 'audio_clips\rec_20260204_103657.wav'),
-(1210, 5, '2026-02-04 10:37:00', 'en', 'or as you are', 'audio_clips\rec_20260204_103657.wav'),
-(1211, 5, '2026-02-04 10:37:01', 'en', 'lot of people''s', 'audio_clips\rec_20260204_103700.wav'),
-(1212, 5, '2026-02-04 10:37:05', 'en', 'had a lot of ice', 'audio_clips\rec_20260204_103703.wav'),
-(1213, 5, '2026-02-04 10:37:07', 'en', 'if you have', 'audio_clips\rec_20260204_103707.wav'),
-(1214, 5, '2026-02-04 10:37:12', 'en', 'good', 'audio_clips\rec_20260204_103709.wav'),
-(1215, 5, '2026-02-04 10:37:17', 'en', 'in two hours', 'audio_clips\rec_20260204_103715.wav'),
-(1216, 5, '2026-02-04 10:37:23', 'en', 'he was', 'audio_clips\rec_20260204_103721.wav'),
-(1217, 5, '2026-02-04 10:37:30', 'en', 'the', 'audio_clips\rec_20260204_103730.wav'),
-(1218, 5, '2026-02-04 10:37:40', 'en', 'true', 'audio_clips\rec_20260204_103739.wav'),
-(1219, 5, '2026-02-04 10:37:45', 'en', 'i mean', 'audio_clips\rec_20260204_103745.wav'),
-(1220, 5, '2026-02-04 10:37:50', 'en', 'oh yeah thanks', 'audio_clips\rec_20260204_103748.wav'),
-(1221, 5, '2026-02-04 10:37:55', 'en', 'like this', 'audio_clips\rec_20260204_103754.wav'),
-(1222, 5, '2026-02-04 10:37:57', 'en', 'thing', 'audio_clips\rec_20260204_103754.wav'),
-(1223, 5, '2026-02-04 10:38:02', 'en', 'media i''m okay with images', 'audio_clips\rec_20260204_103800.wav'),
-(1224, 5, '2026-02-04 10:38:05', 'en', 'glad i was', 'audio_clips\rec_20260204_103803.wav'),
-(1225, 5, '2026-02-04 10:38:07', 'en', 'now this economy', 'audio_clips\rec_20260204_103806.wav'),
-(1226, 5, '2026-02-04 10:38:09', 'en', 'he be like', 'audio_clips\rec_20260204_103806.wav'),
-(1227, 5, '2026-02-04 10:38:14', 'en', 'the', 'audio_clips\rec_20260204_103812.wav'),
-(1228, 5, '2026-02-04 10:38:20', 'en', 'if it doesn''t get images', 'audio_clips\rec_20260204_103818.wav'),
-(1229, 5, '2026-02-04 10:38:22', 'en', 'obama as it', 'audio_clips\rec_20260204_103821.wav'),
-(1230, 5, '2026-02-04 10:38:27', 'en', 'good a lot', 'audio_clips\rec_20260204_103824.wav'),
-(1231, 5, '2026-02-04 10:38:48', 'en', 'israel', 'audio_clips\rec_20260204_103845.wav'),
-(1232, 5, '2026-02-04 10:38:51', 'en', 'another person on person', 'audio_clips\rec_20260204_103848.wav'),
-(1233, 5, '2026-02-04 10:38:57', 'en', 'is he your them', 'audio_clips\rec_20260204_103854.wav'),
-(1234, 5, '2026-02-04 10:39:01', 'en', 'actually to party', 'audio_clips\rec_20260204_103900.wav'),
-(1235, 5, '2026-02-04 10:39:08', 'en', 'i''m not really sure bet on it', 'audio_clips\rec_20260204_103906.wav'),
-(1236, 5, '2026-02-04 10:39:11', 'en', 'yes my up around the modern day', 'audio_clips\rec_20260204_103909.wav'),
-(1237, 5, '2026-02-04 10:39:13', 'en', 'putting something', 'audio_clips\rec_20260204_103912.wav'),
-(1238, 5, '2026-02-04 10:39:26', 'en', 'enough', 'audio_clips\rec_20260204_103924.wav'),
-(1239, 5, '2026-02-04 10:39:28', 'en', 'i believe it', 'audio_clips\rec_20260204_103927.wav'),
-(1240, 5, '2026-02-04 10:39:44', 'en', 'united states autograph', 'audio_clips\rec_20260204_103942.wav'),
-(1241, 5, '2026-02-04 10:39:50', 'en', 'hi melanie', 'audio_clips\rec_20260204_103948.wav'),
-(1242, 5, '2026-02-04 10:39:56', 'en', 'added', 'audio_clips\rec_20260204_103954.wav'),
-(1243, 5, '2026-02-04 10:39:58', 'en', 'distorted islam', 'audio_clips\rec_20260204_103957.wav'),
-(1244, 5, '2026-02-04 10:40:04', 'en', 'the', 'audio_clips\rec_20260204_104003.wav'),
-(1245, 5, '2026-02-04 10:40:08', 'en', 'my back there', 'audio_clips\rec_20260204_104006.wav'),
-(1246, 5, '2026-02-04 10:40:19', 'en', 'wow', 'audio_clips\rec_20260204_104018.wav'),
-(1247, 5, '2026-02-04 10:40:21', 'en', 'i know', 'audio_clips\rec_20260204_104018.wav'),
-(1248, 5, '2026-02-04 10:40:38', 'en', 'no actually we do we do need your help and i have no idea and fifty', 'audio_clips\rec_20260204_104037.wav'),
-(1249, 5, '2026-02-04 10:40:43', 'en', 'god', 'audio_clips\rec_20260204_104042.wav'),
-(1250, 5, '2026-02-04 10:41:14', 'en', 'this', 'audio_clips\rec_20260204_104112.wav'),
-(1251, 5, '2026-02-04 10:41:16', 'en', 'yeah', 'audio_clips\rec_20260204_104115.wav'),
-(1252, 5, '2026-02-04 10:41:22', 'en', 'or know that many essential that one thing is i don''t know how to this one like grabs', 'audio_clips\rec_20260204_104121.wav'),
-(1253, 5, '2026-02-04 10:41:28', 'en', 'really think about it', 'audio_clips\rec_20260204_104127.wav'),
-(1254, 5, '2026-02-04 10:41:29', 'en', 'million much', 'audio_clips\rec_20260204_104127.wav'),
-(1255, 5, '2026-02-04 10:41:40', 'en', 'a friend and by change who i can do it that''s not a shop i don''t know how to implement the functional it because', 'audio_clips\rec_20260204_104139.wav'),
-(1256, 5, '2026-02-04 10:41:45', 'en', 'top five hundred talk speller of the of a linux and the only pick which dogs', 'audio_clips\rec_20260204_104145.wav'),
-(1257, 5, '2026-02-04 10:41:55', 'en', 'this it', 'audio_clips\rec_20260204_104154.wav'),
-(1258, 5, '2026-02-04 10:42:00', 'en', 'insane', 'audio_clips\rec_20260204_104200.wav'),
-(1259, 5, '2026-02-04 10:42:11', 'en', 'exactly that''s my shoe i don''t even know what''s the meaning of what you''re you matter', 'audio_clips\rec_20260204_104209.wav'),
-(1260, 5, '2026-02-04 10:42:16', 'en', 'the', 'audio_clips\rec_20260204_104215.wav'),
-(1261, 5, '2026-02-04 10:42:19', 'en', 'and i''m not', 'audio_clips\rec_20260204_104218.wav'),
-(1262, 5, '2026-02-04 10:42:25', 'en', 'yeah', 'audio_clips\rec_20260204_104224.wav'),
-(1263, 5, '2026-02-04 10:42:31', 'en', 'the', 'audio_clips\rec_20260204_104227.wav'),
-(1264, 5, '2026-02-04 10:42:35', 'en', 'oh my buddha where', 'audio_clips\rec_20260204_104233.wav'),
-(1265, 5, '2026-02-04 10:42:40', 'en', 'pretty good', 'audio_clips\rec_20260204_104239.wav'),
-(1266, 5, '2026-02-04 10:42:50', 'en', 'and', 'audio_clips\rec_20260204_104248.wav'),
-(1267, 5, '2026-02-04 10:42:52', 'en', 'i live in', 'audio_clips\rec_20260204_104251.wav'),
-(1268, 5, '2026-02-04 10:43:10', 'en', 'he was never in sydney''s this', 'audio_clips\rec_20260204_104309.wav'),
-(1269, 5, '2026-02-04 10:43:15', 'en', 'yeah', 'audio_clips\rec_20260204_104312.wav'),
-(1270, 5, '2026-02-04 10:43:24', 'en', 'that''s', 'audio_clips\rec_20260204_104321.wav'),
-(1271, 5, '2026-02-04 10:43:39', 'en', 'radio', 'audio_clips\rec_20260204_104336.wav'),
-(1272, 5, '2026-02-04 10:43:49', 'en', 'this', 'audio_clips\rec_20260204_104349.wav'),
-(1273, 5, '2026-02-04 10:44:01', 'en', 'i can''t that', 'audio_clips\rec_20260204_104400.wav'),
-(1274, 5, '2026-02-04 10:44:06', 'en', 'make', 'audio_clips\rec_20260204_104406.wav'),
-(1275, 5, '2026-02-04 10:45:39', 'en', 'i''m not religious', 'audio_clips\rec_20260204_104536.wav'),
-(1276, 5, '2026-02-04 10:45:43', 'en', 'it''s possible', 'audio_clips\rec_20260204_104542.wav'),
-(1277, 5, '2026-02-04 10:45:49', 'en', 'aha', 'audio_clips\rec_20260204_104548.wav'),
-(1278, 5, '2026-02-04 10:46:05', 'en', 'it''s way for example let''s say that us', 'audio_clips\rec_20260204_104603.wav'),
-(1279, 5, '2026-02-04 10:46:14', 'en', 'said', 'audio_clips\rec_20260204_104612.wav'),
-(1280, 5, '2026-02-04 10:46:17', 'en', 'demographics', 'audio_clips\rec_20260204_104615.wav'),
-(1281, 5, '2026-02-04 10:46:27', 'en', 'right', 'audio_clips\rec_20260204_104624.wav'),
-(1282, 5, '2026-02-04 10:46:38', 'en', 'he''s like', 'audio_clips\rec_20260204_104636.wav'),
-(1283, 5, '2026-02-04 10:46:57', 'en', 'lot of i guess not', 'audio_clips\rec_20260204_104657.wav'),
-(1284, 5, '2026-02-04 10:47:00', 'en', 'get outta here', 'audio_clips\rec_20260204_104700.wav'),
-(1285, 5, '2026-02-04 10:47:03', 'en', 'there''s gotta be kidding me', 'audio_clips\rec_20260204_104700.wav'),
-(1286, 5, '2026-02-04 10:47:06', 'en', 'obviously i believe that', 'audio_clips\rec_20260204_104706.wav'),
-(1287, 5, '2026-02-04 10:47:12', 'en', 'yeah', 'audio_clips\rec_20260204_104709.wav'),
-(1288, 5, '2026-02-04 10:47:18', 'en', 'it''s', 'audio_clips\rec_20260204_104718.wav'),
-(1289, 5, '2026-02-04 10:47:34', 'en', 'yeah', 'audio_clips\rec_20260204_104733.wav'),
-(1290, 5, '2026-02-04 10:47:44', 'en', 'try', 'audio_clips\rec_20260204_104742.wav'),
-(1291, 5, '2026-02-04 10:47:54', 'en', 'the', 'audio_clips\rec_20260204_104754.wav'),
-(1292, 5, '2026-02-04 10:47:59', 'en', 'i think', 'audio_clips\rec_20260204_104757.wav'),
-(1293, 5, '2026-02-04 10:48:09', 'en', 'how much', 'audio_clips\rec_20260204_104806.wav'),
-(1294, 5, '2026-02-04 10:48:19', 'en', 'didn''t', 'audio_clips\rec_20260204_104818.wav'),
-(1295, 5, '2026-02-04 10:48:24', 'en', 'a clue', 'audio_clips\rec_20260204_104824.wav'),
-(1296, 5, '2026-02-04 10:48:30', 'en', 'not good', 'audio_clips\rec_20260204_104827.wav'),
-(1297, 5, '2026-02-04 10:48:48', 'en', 'was', 'audio_clips\rec_20260204_104845.wav'),
-(1298, 5, '2026-02-04 10:48:53', 'en', 'five years', 'audio_clips\rec_20260204_104851.wav'),
-(1299, 5, '2026-02-04 10:49:05', 'en', 'software us', 'audio_clips\rec_20260204_104903.wav'),
-(1300, 5, '2026-02-04 10:49:10', 'en', 'now', 'audio_clips\rec_20260204_104909.wav'),
-(1301, 5, '2026-02-04 10:49:25', 'en', 'really', 'audio_clips\rec_20260204_104924.wav'),
-(1302, 5, '2026-02-04 10:49:41', 'en', 'yeah', 'audio_clips\rec_20260204_104939.wav'),
-(1303, 5, '2026-02-04 10:49:46', 'en', 'good', 'audio_clips\rec_20260204_104945.wav'),
-(1304, 5, '2026-02-04 10:50:01', 'en', 'now', 'audio_clips\rec_20260204_105000.wav'),
-(1305, 5, '2026-02-04 10:50:33', 'en', 'right', 'audio_clips\rec_20260204_105033.wav'),
-(1306, 5, '2026-02-04 10:50:48', 'en', 'yeah', 'audio_clips\rec_20260204_105048.wav'),
-(1307, 5, '2026-02-04 10:50:53', 'en', 'yeah', 'audio_clips\rec_20260204_105051.wav'),
-(1308, 5, '2026-02-04 10:50:58', 'en', 'gonna lie', 'audio_clips\rec_20260204_105057.wav'),
-(1309, 5, '2026-02-04 10:51:03', 'en', 'no i think we''re going to yeah', 'audio_clips\rec_20260204_105101.wav'),
-(1310, 5, '2026-02-04 10:51:04', 'en', 'you know', 'audio_clips\rec_20260204_105103.wav'),
-(1311, 5, '2026-02-04 10:51:09', 'en', 'the school', 'audio_clips\rec_20260204_105109.wav'),
-(1312, 5, '2026-02-04 10:51:19', 'en', 'really', 'audio_clips\rec_20260204_105118.wav'),
-(1313, 5, '2026-02-04 10:51:40', 'en', 'can', 'audio_clips\rec_20260204_105139.wav'),
-(1314, 5, '2026-02-04 10:51:50', 'en', 'right', 'audio_clips\rec_20260204_105148.wav'),
-(1315, 5, '2026-02-04 10:51:55', 'en', 'i think', 'audio_clips\rec_20260204_105154.wav'),
-(1316, 5, '2026-02-04 10:52:00', 'en', 'yeah sure', 'audio_clips\rec_20260204_105200.wav'),
-(1317, 5, '2026-02-04 10:52:03', 'en', 'he said that you want to know', 'audio_clips\rec_20260204_105200.wav'),
-(1318, 5, '2026-02-04 10:52:08', 'en', 'because', 'audio_clips\rec_20260204_105206.wav'),
-(1319, 5, '2026-02-04 10:52:13', 'en', 'the modem and', 'audio_clips\rec_20260204_105212.wav'),
-(1320, 5, '2026-02-04 10:52:19', 'en', 'know ago', 'audio_clips\rec_20260204_105218.wav'),
-(1321, 5, '2026-02-04 10:52:23', 'en', 'don''t like shit', 'audio_clips\rec_20260204_105221.wav'),
-(1322, 5, '2026-02-04 10:52:25', 'en', 'what''s next', 'audio_clips\rec_20260204_105224.wav'),
-(1323, 5, '2026-02-04 10:52:41', 'en', 'you know', 'audio_clips\rec_20260204_105239.wav'),
-(1324, 5, '2026-02-04 10:52:49', 'en', 'yeah i''m do we know', 'audio_clips\rec_20260204_105248.wav'),
-(1325, 5, '2026-02-04 10:52:59', 'en', 'what am i supposed to be exactly i''m supposed to create a python script that will be reunited thing all the meals to the network', 'audio_clips\rec_20260204_105257.wav'),
-(1326, 5, '2026-02-04 10:53:07', 'en', 'okay', 'audio_clips\rec_20260204_105306.wav'),
-(1327, 5, '2026-02-04 10:53:12', 'en', 'boy', 'audio_clips\rec_20260204_105312.wav'),
-(1328, 5, '2026-02-04 10:53:22', 'en', 'already', 'audio_clips\rec_20260204_105321.wav'),
-(1329, 5, '2026-02-04 10:53:28', 'en', 'pinterest', 'audio_clips\rec_20260204_105327.wav'),
-(1330, 5, '2026-02-04 10:53:32', 'en', 'move on', 'audio_clips\rec_20260204_105330.wav'),
-(1331, 5, '2026-02-04 10:53:34', 'en', 'actually i do', 'audio_clips\rec_20260204_105333.wav'),
-(1332, 5, '2026-02-04 10:53:39', 'en', 'look', 'audio_clips\rec_20260204_105336.wav'),
-(1333, 5, '2026-02-04 10:53:44', 'en', 'normally', 'audio_clips\rec_20260204_105342.wav'),
-(1334, 5, '2026-02-04 10:53:48', 'en', 'miles reply', 'audio_clips\rec_20260204_105345.wav'),
-(1335, 5, '2026-02-04 10:53:51', 'en', 'i never used my it''s before', 'audio_clips\rec_20260204_105348.wav'),
-(1336, 5, '2026-02-04 10:53:55', 'en', 'usually i would be bloated worse i am never heard of modern life', 'audio_clips\rec_20260204_105354.wav'),
-(1337, 5, '2026-02-04 10:54:04', 'en', 'yeah next yes', 'audio_clips\rec_20260204_105403.wav'),
-(1338, 5, '2026-02-04 10:54:22', 'en', 'yeah you suppose this new york', 'audio_clips\rec_20260204_105421.wav'),
-(1339, 5, '2026-02-04 10:54:38', 'en', 'yeah two minutes', 'audio_clips\rec_20260204_105436.wav'),
-(1340, 5, '2026-02-04 10:54:43', 'en', 'yeah', 'audio_clips\rec_20260204_105442.wav'),
-(1341, 5, '2026-02-04 10:55:35', 'en', 'yeah', 'audio_clips\rec_20260204_105533.wav'),
-(1342, 5, '2026-02-04 10:56:12', 'en', 'i think seattle means customer relation relations manager', 'audio_clips\rec_20260204_105609.wav'),
-(1343, 5, '2026-02-04 10:56:29', 'en', 'one of them', 'audio_clips\rec_20260204_105627.wav'),
-(1344, 5, '2026-02-04 10:56:40', 'en', 'really', 'audio_clips\rec_20260204_105639.wav'),
-(1345, 1, '2026-02-11 10:09:30', 'en', 'huh', NULL),
-(1346, 1, '2026-02-11 10:09:50', 'en', 'huh', NULL),
-(1347, 1, '2026-02-11 10:10:10', 'en', 'huh', NULL),
-(1348, 1, '2026-02-11 10:10:31', 'en', 'huh', NULL),
-(1349, 1, '2026-02-11 10:10:52', 'en', 'huh', NULL),
-(1350, 1, '2026-02-11 10:11:12', 'en', 'huh', NULL),
-(1351, 1, '2026-02-11 10:11:32', 'en', 'huh', NULL),
-(1352, 1, '2026-02-11 10:11:52', 'en', 'huh', NULL),
-(1353, 1, '2026-02-11 10:12:13', 'en', 'huh', NULL),
-(1354, 1, '2026-02-11 10:12:33', 'en', 'huh', NULL),
-(1355, 1, '2026-02-11 10:12:54', 'en', 'huh', NULL),
-(1356, 1, '2026-02-11 10:13:15', 'en', 'huh', NULL),
-(1357, 1, '2026-02-11 10:13:34', 'en', 'huh', NULL),
-(1358, 1, '2026-02-11 10:13:55', 'en', 'huh', NULL),
-(1359, 1, '2026-02-11 10:14:15', 'en', 'huh', NULL),
-(1360, 1, '2026-02-11 10:14:36', 'en', 'huh', NULL),
-(1361, 1, '2026-02-11 10:14:56', 'en', 'huh', NULL),
-(1362, 1, '2026-02-11 10:15:16', 'en', 'huh', NULL),
-(1363, 1, '2026-02-11 10:15:37', 'en', 'huh', NULL),
-(1364, 1, '2026-02-11 10:15:57', 'en', 'huh', NULL);
-
-DROP TABLE IF EXISTS `vocabulary`;
-CREATE TABLE `vocabulary` (
-  `id` INT NOT NULL AUTO_INCREMENT,
-  `user_id` INT,
-  `word` TEXT,
-  `language` TEXT,
-  `meaning` TEXT,
-  `is_valid` INT DEFAULT 0,
-  `mastery_level` INT DEFAULT 0,
-  `first_seen` DATETIME DEFAULT CURRENT_TIMESTAMP,
-  `last_practiced` DATETIME,
-  `frequency` INT DEFAULT 1,
-  `source_context` TEXT,
-  `correct_attempts` INT DEFAULT 0,
-  `incorrect_attempts` INT DEFAULT 0,
-  PRIMARY KEY (`id`)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-
-INSERT INTO `vocabulary` (`id`, `user_id`, `word`, `language`, `meaning`, `is_valid`, `mastery_level`, `first_seen`, `last_practiced`, `frequency`, `source_context`, `correct_attempts`, `incorrect_attempts`) VALUES 
-(1, 1, 'please', 'en', 'To make happy or satisfy; to give pleasure to.', 1, 0, '2026-01-06 20:22:23', '2026-01-06 20:22:23', 1, NULL, 0, 0),
-(2, 1, 'sophisticated', 'en', 'To make less natural or innocent.', 1, 0, '2026-01-06 20:22:43', '2026-01-06 20:22:43', 1, NULL, 0, 0),
-(3, 1, 'available', 'en', 'Such as one may avail oneself of; capable of being used for the accomplishment of a purpose.', 1, 0, '2026-01-06 20:22:45', '2026-01-06 20:22:45', 1, NULL, 0, 0),
-(4, 1, 'house', 'en', 'A structure built or serving as an abode of human beings.', 1, 0, '2026-01-06 20:22:47', '2026-01-06 20:22:47', 1, NULL, 0, 0),
-(5, 1, 'water', 'en', 'A substance (of molecular formula H₂O) found at room temperature and pressure as a clear liquid; it is present naturally as rain, and found in rivers, lakes and seas; its solid form is ice and its gaseous form is steam.', 1, 0, '2026-01-06 20:22:50', '2026-01-06', 2, NULL, 0, 0),
-(6, 1, 'necessary', 'en', '(usually with the definite article) A place to do the "necessary" business of urination and defecation: an outhouse or lavatory.', 1, 0, '2026-01-06 20:22:52', '2026-01-06 20:22:52', 1, NULL, 0, 0),
-(7, 1, 'important', 'en', 'Having relevant and crucial value.', 1, 0, '2026-01-06 20:22:54', '2026-01-06', 2, NULL, 0, 0),
-(8, 1, 'no', 'en', 'A negating expression; an answer that shows disagreement or disapproval', 1, 0, '2026-01-06 20:22:55', '2026-01-06 20:22:55', 1, NULL, 0, 0),
-(9, 1, 'hello', 'en', '"Hello!" or an equivalent greeting.', 1, 0, '2026-01-06 20:22:58', '2026-01-06 20:22:58', 1, NULL, 0, 0),
-(10, 1, 'food', 'en', 'Any solid substance that can be consumed by living organisms, especially by eating, in order to sustain life.', 1, 0, '2026-01-06 20:23:00', '2026-01-06 20:23:00', 1, NULL, 0, 0),
-(11, 1, 'beautiful', 'en', 'Someone who is beautiful. Can be used as a term of address.', 1, 0, '2026-01-06 20:23:01', '2026-01-06 20:23:01', 1, NULL, 0, 0),
-(12, 1, 'yes', 'en', 'An affirmative expression; an answer that shows agreement or acceptance.', 1, 0, '2026-01-06 20:23:03', '2026-01-06 20:23:03', 1, NULL, 0, 0),
-(13, 1, 'possible', 'en', 'A possible one.', 1, 0, '2026-01-06 20:23:05', '2026-01-06 20:23:05', 1, NULL, 0, 0),
-(14, 1, 'magnificent', 'en', 'Grand, elegant or splendid in appearance.', 1, 0, '2026-01-06 20:23:07', '2026-01-06 20:23:07', 1, NULL, 0, 0),
-(15, 1, 'comprehensive', 'en', 'A comprehensive school.', 1, 0, '2026-01-06 20:23:09', '2026-01-06 20:23:09', 1, NULL, 0, 0),
-(16, 1, 'different', 'en', 'The different ideal.', 1, 0, '2026-01-06 20:23:11', '2026-01-06 20:23:11', 1, NULL, 0, 0),
-(17, 1, 'goodbye', 'en', 'An utterance of goodbye, the wishing of farewell to someone.', 1, 0, '2026-01-06 20:23:13', '2026-01-06 20:23:13', 1, NULL, 0, 0),
-(18, 1, 'extraordinary', 'en', 'Anything that goes beyond what is ordinary.', 1, 0, '2026-01-06 20:23:15', '2026-01-06 20:23:15', 1, NULL, 0, 0),
-(19, 1, 'thank', 'en', 'An expression of appreciation; a thought.', 1, 0, '2026-01-06 20:23:19', '2026-01-06 20:23:19', 1, NULL, 0, 0),
-(20, 1, 'family', 'en', 'A group of people who are closely related to one another (by blood, marriage or adoption); kin; for example, a set of parents and their children; an immediate family.', 1, 0, '2026-01-06 20:23:21', '2026-01-06 20:23:21', 1, NULL, 0, 0),
-(21, 1, 'tremendous', 'en', 'Awe-inspiring; terrific.', 1, 0, '2026-01-06 20:23:23', '2026-01-06 20:23:23', 1, NULL, 0, 0),
-(22, 1, 'mira', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:36:49', 1, NULL, 0, 0),
-(23, 1, 'por', 'es', '', 0, 0, '2026-01-06', '2026-01-07', 6, NULL, 0, 0),
-(24, 1, 'donde', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(25, 1, 'hasta', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:36:48', 1, NULL, 0, 0),
-(26, 1, 'barba', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:36:48', 1, NULL, 0, 0),
-(27, 1, 'सरोकार', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:01', 1, NULL, 0, 0),
-(28, 1, 'आरोपित', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:00', 1, NULL, 0, 0),
-(29, 1, 'स्कूल', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(30, 1, 'किस', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(31, 1, 'दिखेग', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:01', 1, NULL, 0, 0),
-(32, 1, 'out', 'en', 'A means of exit, escape, reprieve, etc.', 1, 0, '2026-01-06', '2026-01-06 20:37:03', 1, NULL, 0, 0),
-(33, 1, 'have', 'en', 'A wealthy or privileged person.', 1, 0, '2026-01-06', '2026-01-06', 4, NULL, 0, 0),
-(34, 1, 'him', 'en', 'Honorific alternative letter-case form of him, sometimes used when referring to God or another important figure who is understood from context.', 1, 0, '2026-01-06', '2026-01-06', 4, NULL, 0, 0),
-(35, 1, 'week', 'en', 'Any period of seven consecutive days.', 1, 0, '2026-01-06', '2026-01-06 20:37:04', 1, NULL, 0, 0),
-(36, 1, 'school', 'en', '(collective) A group of fish or a group of marine mammals such as porpoises, dolphins, or whales.', 1, 0, '2026-01-06', '2026-01-06 20:37:03', 2, NULL, 0, 0),
-(37, 1, 'unanimous', 'en', 'Based on unanimity, assent or agreement.', 1, 0, '2026-01-06', '2026-01-06 20:37:04', 1, NULL, 0, 0),
-(38, 1, 'could', 'en', '(auxiliary verb, defective) To know how to; to be able to.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(39, 1, 'message', 'en', 'A communication, or what is communicated; any concept or information conveyed.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(40, 1, 'public', 'en', 'The people in general, regardless of membership of any particular group.', 1, 0, '2026-01-06', '2026-01-06 20:37:04', 1, NULL, 0, 0),
-(41, 1, 'una', 'es', '', 0, 0, '2026-01-06', '2026-01-07', 3, NULL, 0, 0),
-(42, 1, 'noche', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:03', 1, NULL, 0, 0),
-(43, 1, 'lucharemos', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:03', 1, NULL, 0, 0),
-(44, 1, 'para', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(45, 1, 'suele', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:05', 1, NULL, 0, 0),
-(46, 1, 'denominar', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:03', 1, NULL, 0, 0),
-(47, 1, 'así', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(48, 1, 'que', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 8, NULL, 0, 0),
-(49, 1, 'miedo', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:04', 1, NULL, 0, 0),
-(50, 1, 'algo', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:03', 1, NULL, 0, 0),
-(51, 1, 'más', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(52, 1, 'meses', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:03', 1, NULL, 0, 0),
-(53, 1, 'julio', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:05', 1, NULL, 0, 0),
-(54, 1, 'लेकिन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(55, 1, 'विभाग', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:07', 1, NULL, 0, 0),
-(56, 1, 'श्र', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:07', 1, NULL, 0, 0),
-(57, 1, 'गिर्राज', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:08', 1, NULL, 0, 0),
-(58, 1, 'pets', 'en', 'An animal kept as a companion.', 1, 0, '2026-01-06', '2026-01-06 20:37:11', 1, NULL, 0, 0),
-(59, 1, 'given', 'en', '(ditransitive) To move, shift, provide something abstract or concrete to someone or something or somewhere.', 1, 0, '2026-01-06', '2026-01-06 20:37:12', 1, NULL, 0, 0),
-(60, 1, 'and', 'en', 'In rhythm, the second half of a divided beat.', 1, 0, '2026-01-06', '2026-01-06', 23, NULL, 0, 0),
-(61, 1, 'guess', 'en', 'To reach a partly (or totally) unqualified conclusion.', 1, 0, '2026-01-06', '2026-01-06 20:37:12', 1, NULL, 0, 0),
-(62, 1, 'kisses', 'en', 'To touch with the lips or press the lips against, usually to show love or affection or passion, or as part of a greeting.', 1, 0, '2026-01-06', '2026-01-06 20:37:12', 1, NULL, 0, 0),
-(63, 1, 'pista', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:11', 1, NULL, 0, 0),
-(64, 1, 'adivina', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:11', 1, NULL, 0, 0),
-(65, 1, 'qué', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:12', 1, NULL, 0, 0),
-(66, 1, 'eso', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 4, NULL, 0, 0),
-(67, 1, 'siempre', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:11', 1, NULL, 0, 0),
-(68, 1, 'llevaba', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:12', 1, NULL, 0, 0),
-(69, 1, 'सब्जेक्ट', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:12', 1, NULL, 0, 0),
-(70, 1, 'हमार', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:11', 1, NULL, 0, 0),
-(71, 1, 'porque', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:15', 1, NULL, 0, 0),
-(72, 1, 'bosque', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:14', 1, NULL, 0, 0),
-(73, 1, 'most', 'en', 'The greatest amount.', 1, 0, '2026-01-06', '2026-01-06 20:37:18', 1, NULL, 0, 0),
-(74, 1, 'his', 'en', 'Honorific alternative letter-case form of his, sometimes used when referring to God or another important figure who is understood from context.', 1, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(75, 1, 'comedy', 'en', 'A choric song of celebration or revel, especially in Ancient Greece.', 1, 0, '2026-01-06', '2026-01-06 20:37:18', 1, NULL, 0, 0),
-(76, 1, 'जिम्म', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:17', 1, NULL, 0, 0),
-(77, 1, 'विस्तृत', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:17', 1, NULL, 0, 0),
-(78, 1, 'होत', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(79, 1, 'उसक', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(80, 1, 'मुझ', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:17', 1, NULL, 0, 0),
-(81, 1, 'modern', 'en', 'Someone who lives in modern times.', 1, 0, '2026-01-06', '2026-01-06 20:37:27', 1, NULL, 0, 0),
-(82, 1, 'not', 'en', 'A unary operation on logical values that changes true to false, and false to true.', 1, 0, '2026-01-06', '2026-01-06', 4, NULL, 0, 0),
-(83, 1, 'going', 'en', 'To move:', 1, 0, '2026-01-06', '2026-01-06', 4, NULL, 0, 0),
-(84, 1, 'need', 'en', 'A requirement for something; something needed.', 1, 0, '2026-01-06', '2026-01-06 20:37:27', 1, NULL, 0, 0),
-(85, 1, 'report', 'en', 'A piece of information describing, or an account of certain events given or presented to someone, with the most common adpositions being by (referring to creator of the report) and on (referring to the subject).', 1, 0, '2026-01-06', '2026-01-06 20:37:28', 1, NULL, 0, 0),
-(86, 1, 'area', 'en', 'A measure of the extent of a surface; it is measured in square units.', 1, 0, '2026-01-06', '2026-01-06 20:37:26', 1, NULL, 0, 0),
-(87, 1, 'hominem', 'en', '', 0, 0, '2026-01-06', '2026-01-06 20:37:27', 1, NULL, 0, 0),
-(88, 1, 'what', 'en', '(Singlish) Used to contradict an underlying assumption held by the interlocutor.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(89, 1, 'about', 'en', 'Moving around; astir.', 1, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(90, 1, 'कोई', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(91, 1, 'नियम', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:27', 1, NULL, 0, 0),
-(92, 1, 'आदम', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:28', 1, NULL, 0, 0),
-(93, 1, 'लेकर', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:27', 1, NULL, 0, 0),
-(94, 1, 'इसक', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:27', 1, NULL, 0, 0),
-(95, 1, 'दिन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(96, 1, 'एरिय', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:28', 1, NULL, 0, 0),
-(97, 1, 'कुछ', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 10, NULL, 0, 0),
-(98, 1, 'अन्य', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:27', 1, NULL, 0, 0),
-(99, 1, 'armando', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:28', 1, NULL, 0, 0),
-(100, 1, 'martínez', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:27', 1, NULL, 0, 0),
-(101, 1, 'vega', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:27', 1, NULL, 0, 0),
-(102, 1, 'con', 'es', '', 0, 0, '2026-01-06', '2026-01-07 12:05:11', 3, NULL, 0, 0),
-(103, 1, 'iremos', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:27', 1, NULL, 0, 0),
-(104, 1, 'cuatro', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:28', 2, NULL, 0, 0),
-(105, 1, 'valkiria', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:29', 1, NULL, 0, 0),
-(106, 1, 'culpa', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:27', 1, NULL, 0, 0),
-(107, 1, 'vergüenza', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:28', 1, NULL, 0, 0),
-(108, 1, 'don', 'en', 'A university professor, particularly one at Oxford or Cambridge.', 1, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(109, 1, 'knock', 'en', 'Sudden fatigue as a result of glycogen depletion from not having taken in enough nutrition.', 1, 0, '2026-01-06', '2026-01-06 20:37:34', 1, NULL, 0, 0),
-(110, 1, 'wood', 'en', 'The substance making up the central part of the trunk and branches of a tree. Used as a material for construction, to manufacture various items, etc. or as fuel.', 1, 0, '2026-01-06', '2026-01-06 20:37:34', 1, NULL, 0, 0),
-(111, 1, 'किन्त', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:37', 1, NULL, 0, 0),
-(112, 1, 'वार्त', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:38', 1, NULL, 0, 0),
-(113, 1, 'काम', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:37', 1, NULL, 0, 0),
-(114, 1, 'tus', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:42', 1, NULL, 0, 0),
-(115, 1, 'amigos', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:42', 1, NULL, 0, 0),
-(116, 1, 'tan', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(117, 1, 'guapa', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:43', 1, NULL, 0, 0),
-(118, 1, 'como', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:42', 1, NULL, 0, 0),
-(119, 1, 'participar', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:43', 1, NULL, 0, 0),
-(120, 1, 'tiene', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(121, 1, 'convirtió', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:42', 1, NULL, 0, 0),
-(122, 1, 'guasón', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:43', 1, NULL, 0, 0),
-(123, 1, 'zabala', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:42', 1, NULL, 0, 0),
-(124, 1, 'piggyback', 'en', 'A ride on somebody''s back or shoulders.', 1, 0, '2026-01-06', '2026-01-06 20:37:44', 1, NULL, 0, 0),
-(125, 1, 'tonight', 'en', 'The nighttime of the current day or date; this night.', 1, 0, '2026-01-06', '2026-01-06 20:37:43', 1, NULL, 0, 0),
-(126, 1, 'get', 'en', 'Offspring.', 1, 0, '2026-01-06', '2026-01-06 20:37:43', 1, NULL, 0, 0),
-(127, 1, 'into', 'en', 'To or towards the inside of.', 1, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(128, 1, 'there', 'en', 'That place.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(129, 1, 'wasn', 'en', '', 0, 0, '2026-01-06', '2026-01-06 20:37:46', 1, NULL, 0, 0),
-(130, 1, 'good', 'en', '(of people)', 1, 0, '2026-01-06', '2026-01-06 20:37:44', 1, NULL, 0, 0),
-(131, 1, 'either', 'en', '(after a negative) As well.', 1, 0, '2026-01-06', '2026-01-06 20:37:43', 1, NULL, 0, 0),
-(132, 1, 'allí', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:53', 1, NULL, 0, 0),
-(133, 1, 'llévense', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:54', 1, NULL, 0, 0),
-(134, 1, 'son', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(135, 1, 'duro', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:53', 1, NULL, 0, 0),
-(136, 1, 'pagarlo', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:53', 1, NULL, 0, 0),
-(137, 1, 'negro', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:53', 1, NULL, 0, 0),
-(138, 1, 'agregan', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:53', 1, NULL, 0, 0),
-(139, 1, 'malignos', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:53', 1, NULL, 0, 0),
-(140, 1, 'pardo', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:54', 1, NULL, 0, 0),
-(141, 1, 'guarda', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:53', 1, NULL, 0, 0),
-(142, 1, 'invite', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:53', 1, NULL, 0, 0),
-(143, 1, 'मिट्ट', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:57', 1, NULL, 0, 0),
-(144, 1, 'सिमट', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:57', 1, NULL, 0, 0),
-(145, 1, 'बीस', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:57', 1, NULL, 0, 0),
-(146, 1, 'समूह', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:58', 1, NULL, 0, 0),
-(147, 1, 'बधाई', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:57', 4, NULL, 0, 0),
-(148, 1, 'बनत', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:37:58', 1, NULL, 0, 0),
-(149, 1, 'igual', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:37:57', 1, NULL, 0, 0),
-(150, 1, 'uses', 'en', 'The act of using.', 1, 0, '2026-01-06', '2026-01-06 20:37:59', 1, NULL, 0, 0),
-(151, 1, 'some', 'en', 'Of a measurement: approximately, roughly.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(152, 1, 'little', 'en', 'A small amount.', 1, 0, '2026-01-06', '2026-01-06 20:38:00', 2, NULL, 0, 0),
-(153, 1, 'bottle', 'en', 'A container, typically made of glass or plastic and having a tapered neck, used primarily for holding liquids.', 1, 0, '2026-01-06', '2026-01-06 20:38:00', 1, NULL, 0, 0),
-(154, 1, 'any', 'en', 'To even the slightest extent, at all.', 1, 0, '2026-01-06', '2026-01-06 20:37:59', 1, NULL, 0, 0),
-(155, 1, 'neither', 'en', 'Similarly not.', 1, 0, '2026-01-06', '2026-01-06 20:37:59', 1, NULL, 0, 0),
-(156, 1, 'party', 'en', 'A person or group of people constituting a particular side in a contract or legal action.', 1, 0, '2026-01-06', '2026-01-06 20:38:00', 1, NULL, 0, 0),
-(157, 1, 'getting', 'en', '(ditransitive) To obtain; to acquire.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(158, 1, 'wonder', 'en', 'Something that causes amazement or awe; a marvel.', 1, 0, '2026-01-06', '2026-01-06 20:37:59', 1, NULL, 0, 0),
-(159, 1, 'did', 'en', '(auxiliary) A syntactic marker.', 1, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(160, 1, 'would', 'en', 'Something that would happen, or would be the case, under different circumstances; a potentiality.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(161, 1, 'money', 'en', 'A legally or socially binding conceptual contract of entitlement to wealth, void of intrinsic value, payable for all debts and taxes, and regulated in supply.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(162, 1, 'went', 'en', 'To move:', 1, 0, '2026-01-06', '2026-01-06 20:37:59', 1, NULL, 0, 0),
-(163, 1, 'much', 'en', 'Large, great.', 1, 0, '2026-01-06', '2026-01-06 20:37:59', 1, NULL, 0, 0),
-(164, 1, 'activity', 'en', 'The state or quality of being active; activeness.', 1, 0, '2026-01-06', '2026-01-06 20:38:00', 1, NULL, 0, 0),
-(165, 1, 'tiros', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:38:02', 1, NULL, 0, 0),
-(166, 1, 'legarda', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:38:02', 1, NULL, 0, 0),
-(167, 1, 'oro', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:38:01', 1, NULL, 0, 0),
-(168, 1, 'got', 'en', '(ditransitive) To obtain; to acquire.', 1, 0, '2026-01-06', '2026-01-06 20:38:05', 1, NULL, 0, 0),
-(169, 1, 'think', 'en', 'An act of thinking; consideration (of something).', 1, 0, '2026-01-06', '2026-01-06', 4, NULL, 0, 0),
-(170, 1, 'awesome', 'en', 'Short for awesomeness: the quality, state, or essence of being awesome.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(171, 1, 'has', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(172, 1, 'invertido', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:38:05', 1, NULL, 0, 0),
-(173, 1, 'funny', 'en', 'A joke.', 1, 0, '2026-01-06', '2026-01-06 20:38:08', 1, NULL, 0, 0),
-(174, 1, 'because', 'en', 'For the reason (that).', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(175, 1, 'hace', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:38:08', 1, NULL, 0, 0),
-(176, 1, 'partido', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:38:08', 1, NULL, 0, 0),
-(177, 1, 'added', 'en', 'To join or unite (e.g. one thing to another, or as several particulars) so as to increase the number, augment the quantity or enlarge the magnitude, or so as to form into one aggregate.', 1, 0, '2026-01-06', '2026-01-06 20:38:12', 1, NULL, 0, 0),
-(178, 1, 'doesn', 'en', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(179, 1, 'movement', 'en', 'Physical motion between points in space.', 1, 0, '2026-01-06', '2026-01-06 20:38:15', 1, NULL, 0, 0),
-(180, 1, 'लोग', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:15', 1, NULL, 0, 0),
-(181, 1, 'व्यक्त', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:16', 1, NULL, 0, 0),
-(182, 1, 'pennies', 'en', 'In the United Kingdom and Ireland, a copper coin worth 1/240 of a pound sterling or Irish pound before decimalisation. Abbreviation: d.', 1, 0, '2026-01-06', '2026-01-06 20:38:19', 1, NULL, 0, 0),
-(183, 1, 'communities', 'en', 'A group sharing a common understanding, and often the same language, law, manners, and/or tradition.', 1, 0, '2026-01-06', '2026-01-06 20:38:19', 1, NULL, 0, 0),
-(184, 1, 'that', 'en', 'Something being indicated that is there; one of those.', 1, 0, '2026-01-06', '2026-01-06', 6, NULL, 0, 0),
-(185, 1, 'nigger', 'en', '(see usage notes) A black person; a person of black African descent.', 1, 0, '2026-01-06', '2026-01-06 20:38:24', 1, NULL, 0, 0),
-(186, 1, 'उन्होंन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:25', 1, NULL, 0, 0),
-(187, 1, 'बगैर', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:24', 1, NULL, 0, 0),
-(188, 1, 'थोड', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:24', 1, NULL, 0, 0),
-(189, 1, 'ठंड', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:24', 1, NULL, 0, 0),
-(190, 1, 'पान', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:23', 1, NULL, 0, 0),
-(191, 1, 'भरन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:24', 1, NULL, 0, 0),
-(192, 1, 'वाल', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:24', 1, NULL, 0, 0),
-(193, 1, 'हुए', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:27', 1, NULL, 0, 0),
-(194, 1, 'abandonado', 'es', 'Definición pendiente...', 1, 0, '2026-01-06', '2026-01-24 13:42:37', 1, NULL, 0, 0),
-(195, 1, 'मात्र', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:35', 1, NULL, 0, 0),
-(196, 1, 'पुलिस', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:35', 1, NULL, 0, 0),
-(197, 1, 'जिस', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(198, 1, 'रोक', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:35', 1, NULL, 0, 0),
-(199, 1, 'somebody', 'en', 'A recognised or important person, a celebrity.', 1, 0, '2026-01-06', '2026-01-06 20:38:37', 1, NULL, 0, 0),
-(200, 1, 'set', 'en', 'To put (something) down, to rest.', 1, 0, '2026-01-06', '2026-01-06 20:38:36', 1, NULL, 0, 0),
-(201, 1, 'आरोप', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:38:37', 1, NULL, 0, 0),
-(202, 1, 'gotcha', 'en', 'A potential problem or source of trouble.', 1, 0, '2026-01-06', '2026-01-06 20:38:43', 1, NULL, 0, 0),
-(203, 1, 'debería', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:38:47', 1, NULL, 0, 0),
-(204, 1, 'even', 'en', '(diminutive) An even number.', 1, 0, '2026-01-06', '2026-01-06 20:38:53', 1, NULL, 0, 0),
-(205, 1, 'pentagon', 'en', 'A polygon with five sides and five angles.', 1, 0, '2026-01-06', '2026-01-06 20:38:55', 1, NULL, 0, 0),
-(206, 1, 'solo', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:38:53', 1, NULL, 0, 0),
-(207, 1, 'conozco', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:38:54', 1, NULL, 0, 0),
-(208, 1, 'mucha', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:38:54', 1, NULL, 0, 0),
-(209, 1, 'pena', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:38:53', 1, NULL, 0, 0),
-(210, 1, 'museums', 'en', 'A building or institution dedicated to the acquisition, conservation, study, exhibition, and educational interpretation of objects having scientific, historical, cultural or artistic value.', 1, 0, '2026-01-06', '2026-01-06 20:39:02', 1, NULL, 0, 0),
-(211, 1, 'act', 'en', 'Something done, a deed.', 1, 0, '2026-01-06', '2026-01-06 20:39:02', 1, NULL, 0, 0),
-(212, 1, 'sit', 'en', 'Subsidence of the roof of a coal mine.', 1, 0, '2026-01-06', '2026-01-06 20:39:02', 1, NULL, 0, 0),
-(213, 1, 'face', 'en', 'The front part of the head of a human or other animal, featuring the eyes, nose and mouth, and the surrounding area.', 1, 0, '2026-01-06', '2026-01-06 20:39:03', 1, NULL, 0, 0),
-(214, 1, 'sigüenza', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:02', 1, NULL, 0, 0),
-(215, 1, 'estabilizar', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:02', 1, NULL, 0, 0),
-(216, 1, 'interesado', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:02', 1, NULL, 0, 0),
-(217, 1, 'decided', 'en', 'To resolve (a contest, problem, dispute, etc.); to choose, determine, or settle', 1, 0, '2026-01-06', '2026-01-06 20:39:12', 1, NULL, 0, 0),
-(218, 1, 'saw', 'en', 'A tool with a toothed blade used for cutting hard substances, in particular wood or metal', 1, 0, '2026-01-06', '2026-01-06 20:39:14', 1, NULL, 0, 0),
-(219, 1, 'anymore', 'en', '(in negative or interrogative constructions) From a given time onwards; longer, again.', 1, 0, '2026-01-06', '2026-01-06 20:39:13', 1, NULL, 0, 0),
-(220, 1, 'sido', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:12', 1, NULL, 0, 0),
-(221, 1, 'dicho', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:12', 1, NULL, 0, 0),
-(222, 1, 'hizo', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:13', 1, NULL, 0, 0),
-(223, 1, 'बीसीएम', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:19', 1, NULL, 0, 0),
-(224, 1, 'उसन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:18', 1, NULL, 0, 0),
-(225, 1, 'फाइल', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:17', 1, NULL, 0, 0),
-(226, 1, 'फोट', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:17', 1, NULL, 0, 0),
-(227, 1, 'वीडिय', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(228, 1, 'रिलीज', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:18', 1, NULL, 0, 0),
-(229, 1, 'अनुष्ठान', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:18', 1, NULL, 0, 0),
-(230, 1, 'खास', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:17', 1, NULL, 0, 0),
-(231, 1, 'सार', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:18', 2, NULL, 0, 0),
-(232, 1, 'इलाज', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:18', 1, NULL, 0, 0),
-(233, 1, 'रिमोट', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:17', 1, NULL, 0, 0),
-(234, 1, 'समझ', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:18', 1, NULL, 0, 0),
-(235, 1, 'पहनत', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:18', 1, NULL, 0, 0),
-(236, 1, 'acusaré', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:22', 1, NULL, 0, 0),
-(237, 1, 'ante', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:21', 1, NULL, 0, 0),
-(238, 1, 'obras', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:21', 1, NULL, 0, 0),
-(239, 1, 'piano', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:21', 1, NULL, 0, 0),
-(240, 1, 'violín', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:21', 1, NULL, 0, 0),
-(241, 1, 'chino', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:21', 1, NULL, 0, 0),
-(242, 1, 'can', 'en', '(auxiliary verb, defective) To know how to; to be able to.', 1, 0, '2026-01-06', '2026-01-06', 7, NULL, 0, 0),
-(243, 1, 'man', 'en', 'An adult male human.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(244, 1, 'इटल', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:23', 1, NULL, 0, 0),
-(245, 1, 'पेड', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:23', 1, NULL, 0, 0),
-(246, 1, 'बीच', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:23', 1, NULL, 0, 0),
-(247, 1, 'जीन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:23', 1, NULL, 0, 0),
-(248, 1, 'चाहत', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:23', 1, NULL, 0, 0),
-(249, 1, 'डबल', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:23', 1, NULL, 0, 0),
-(250, 1, 'मीनिंग', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:23', 1, NULL, 0, 0),
-(251, 1, 'has', 'en', 'To possess, own.', 1, 0, '2026-01-06', '2026-01-06', 4, NULL, 0, 0),
-(252, 1, 'happened', 'en', 'To occur or take place.', 1, 0, '2026-01-06', '2026-01-06 20:39:27', 1, NULL, 0, 0),
-(253, 1, 'दूसर', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:29', 1, NULL, 0, 0),
-(254, 1, 'चार', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:29', 1, NULL, 0, 0),
-(255, 1, 'मध्यम', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:29', 1, NULL, 0, 0),
-(256, 1, 'cualquier', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:30', 1, NULL, 0, 0),
-(257, 1, 'institución', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:31', 1, NULL, 0, 0),
-(258, 1, 'echado', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:30', 1, NULL, 0, 0),
-(259, 1, 'mandemos', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:31', 1, NULL, 0, 0),
-(260, 1, 'cited', 'en', 'To quote; to repeat, as a passage from a book, or the words of another.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(261, 1, 'news', 'en', 'New information of interest.', 1, 0, '2026-01-06', '2026-01-06', 5, NULL, 0, 0),
-(262, 1, 'channels', 'en', 'The physical confine of a river or slough, consisting of a bed and banks.', 1, 0, '2026-01-06', '2026-01-06 20:39:35', 1, NULL, 0, 0),
-(263, 1, 'mundos', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:39', 1, NULL, 0, 0),
-(264, 1, 'sin', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:39', 1, NULL, 0, 0),
-(265, 1, 'usted', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:40', 1, NULL, 0, 0),
-(266, 1, 'pretexto', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:39', 1, NULL, 0, 0),
-(267, 1, 'nada', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:39', 1, NULL, 0, 0),
-(268, 1, 'this', 'en', 'Something being indicated that is here; one of these.', 1, 0, '2026-01-06', '2026-01-06', 4, NULL, 0, 0),
-(269, 1, 'know', 'en', 'Knowledge; the state of knowing.', 1, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(270, 1, 'why', 'en', 'Reason', 1, 0, '2026-01-06', '2026-01-06 20:39:47', 1, NULL, 0, 0),
-(271, 1, 'wouldn', 'en', '', 0, 0, '2026-01-06', '2026-01-06 20:39:47', 1, NULL, 0, 0),
-(272, 1, 'anything', 'en', 'Someone or something of importance.', 1, 0, '2026-01-06', '2026-01-06', 3, NULL, 0, 0),
-(273, 1, 'except', 'en', 'To exclude; to specify as being an exception.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(274, 1, 'ellas', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:46', 1, NULL, 0, 0),
-(275, 1, 'resaltar', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:46', 1, NULL, 0, 0),
-(276, 1, 'शब्दार्थ', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:47', 1, NULL, 0, 0),
-(277, 1, 'दृष्टिगत', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:58', 1, NULL, 0, 0),
-(278, 1, 'दुष्कर्म', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:57', 1, NULL, 0, 0),
-(279, 1, 'शिकार', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:39:58', 1, NULL, 0, 0),
-(280, 1, 'entonces', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:59', 1, NULL, 0, 0),
-(281, 1, 'tienes', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(282, 1, 'suerte', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:59', 1, NULL, 0, 0),
-(283, 1, 'dan', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:00', 1, NULL, 0, 0),
-(284, 1, 'sensación', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:00', 1, NULL, 0, 0),
-(285, 1, 'rubor', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:39:59', 1, NULL, 0, 0),
-(286, 1, 'second', 'en', 'Something that is number two in a series.', 1, 0, '2026-01-06', '2026-01-06 20:40:04', 1, NULL, 0, 0),
-(287, 1, 'plastered', 'en', 'To cover or coat something with plaster; to render.', 1, 0, '2026-01-06', '2026-01-06 20:40:05', 1, NULL, 0, 0),
-(288, 1, 'just', 'en', 'Factually right, correct; factual.', 1, 0, '2026-01-06', '2026-01-06', 6, NULL, 0, 0),
-(289, 1, 'matter', 'en', 'Substance, material.', 1, 0, '2026-01-06', '2026-01-06 20:40:05', 1, NULL, 0, 0),
-(290, 1, 'springboard', 'en', 'A diving board consisting of a flexible, springy, cantilevered platform, used for diving into water.', 1, 0, '2026-01-06', '2026-01-06 20:40:06', 1, NULL, 0, 0),
-(291, 1, 'business', 'en', 'A specific commercial enterprise or establishment.', 1, 0, '2026-01-06', '2026-01-06 20:40:05', 1, NULL, 0, 0),
-(292, 1, 'tax', 'en', 'Money paid to the government other than for transaction-specific goods and services.', 1, 0, '2026-01-06', '2026-01-06 20:40:04', 1, NULL, 0, 0),
-(293, 1, 'buy', 'en', 'Something which is bought; a purchase.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(294, 1, 'nine', 'en', 'The digit or figure 9.', 1, 0, '2026-01-06', '2026-01-06 20:40:05', 1, NULL, 0, 0),
-(295, 1, 'nothing', 'en', 'Something trifling, or of no consequence or importance.', 1, 0, '2026-01-06', '2026-01-06 20:40:05', 1, NULL, 0, 0),
-(296, 1, 'million', 'en', '(long and short scales) The cardinal number 1,000,000: 106; a thousand thousand.', 1, 0, '2026-01-06', '2026-01-06 20:40:05', 1, NULL, 0, 0),
-(297, 1, 'कृष्ण', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:05', 1, NULL, 0, 0),
-(298, 1, 'मलिक', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:05', 1, NULL, 0, 0),
-(299, 1, 'यूजर्स', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:05', 1, NULL, 0, 0),
-(300, 1, 'मिल', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:05', 1, NULL, 0, 0),
-(301, 1, 'buena', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:08', 1, NULL, 0, 0),
-(302, 1, 'onda', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:08', 1, NULL, 0, 0),
-(303, 1, 'máquinas', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:08', 1, NULL, 0, 0),
-(304, 1, 'molienda', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:08', 1, NULL, 0, 0),
-(305, 1, 'coches', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:08', 1, NULL, 0, 0),
-(306, 1, 'अगर', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:13', 1, NULL, 0, 0),
-(307, 1, 'एकनाथ', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:13', 1, NULL, 0, 0),
-(308, 1, 'शिंद', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:12', 1, NULL, 0, 0),
-(309, 1, 'सिट', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:13', 1, NULL, 0, 0),
-(310, 1, 'which', 'en', '(interrogative) What one or ones (of those mentioned or implied).', 1, 0, '2026-01-06', '2026-01-06 20:40:14', 1, NULL, 0, 0),
-(311, 1, 'pursuing', 'en', 'To follow urgently, originally with intent to capture or harm; to chase.', 1, 0, '2026-01-06', '2026-01-06 20:40:14', 1, NULL, 0, 0),
-(312, 1, 'cities', 'en', 'A large settlement, bigger than a town; sometimes with a specific legal definition, depending on the place.', 1, 0, '2026-01-06', '2026-01-06 20:40:13', 1, NULL, 0, 0),
-(313, 1, 'computer', 'en', 'A person employed to perform computations; one who computes.', 1, 0, '2026-01-06', '2026-01-06 20:40:14', 1, NULL, 0, 0),
-(314, 1, 'बीजेप', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:18', 1, NULL, 0, 0),
-(315, 1, 'मार्ग', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:18', 1, NULL, 0, 0),
-(316, 1, 'प्रशस्त', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:18', 1, NULL, 0, 0),
-(317, 1, 'रांच', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:18', 1, NULL, 0, 0),
-(318, 1, 'स्थित', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:17', 1, NULL, 0, 0),
-(319, 1, 'tengan', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:19', 1, NULL, 0, 0),
-(320, 1, 'presente', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:20', 1, NULL, 0, 0),
-(321, 1, 'sus', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:18', 1, NULL, 0, 0),
-(322, 1, 'necesidades', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:18', 1, NULL, 0, 0),
-(323, 1, 'este', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(324, 1, 'cambios', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:26', 1, NULL, 0, 0),
-(325, 1, 'pacto', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:26', 1, NULL, 0, 0),
-(326, 1, 'विशिष्ट', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:29', 1, NULL, 0, 0),
-(327, 1, 'पैंतीस', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:29', 1, NULL, 0, 0),
-(328, 1, 'फीसद', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:29', 1, NULL, 0, 0),
-(329, 1, 'empresa', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:32', 1, NULL, 0, 0),
-(330, 1, 'pies', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:32', 1, NULL, 0, 0),
-(331, 1, 'सिस्टम', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:39', 1, NULL, 0, 0),
-(332, 1, 'एनपीएस', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:40', 1, NULL, 0, 0),
-(333, 1, 'वर्ष', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:39', 1, NULL, 0, 0),
-(334, 1, 'sister', 'en', 'A daughter of the same parents as another person; a female sibling.', 1, 0, '2026-01-06', '2026-01-06 20:40:40', 1, NULL, 0, 0),
-(335, 1, 'head', 'en', 'The part of the body of an animal or human which contains the brain, mouth and main sense organs.', 1, 0, '2026-01-06', '2026-01-06 20:40:40', 1, NULL, 0, 0),
-(336, 1, 'office', 'en', 'A ceremonial duty or service, particularly:', 1, 0, '2026-01-06', '2026-01-06 20:40:40', 1, NULL, 0, 0),
-(337, 1, 'anger', 'en', 'A strong feeling of displeasure, hostility or antagonism towards someone or something, usually combined with an urge to harm.', 1, 0, '2026-01-06', '2026-01-06 20:40:41', 1, NULL, 0, 0),
-(338, 1, 'focusing', 'en', '(followed by on or upon) To concentrate one''s attention.', 1, 0, '2026-01-06', '2026-01-06 20:40:41', 1, NULL, 0, 0),
-(339, 1, 'than', 'en', 'At that time; then.', 1, 0, '2026-01-06', '2026-01-06 20:40:39', 1, NULL, 0, 0),
-(340, 1, 'bad', 'en', 'Error, mistake.', 1, 0, '2026-01-06', '2026-01-06 20:40:40', 1, NULL, 0, 0),
-(341, 1, 'conference', 'en', 'The act of consulting together formally; serious conversation or discussion; interchange of views.', 1, 0, '2026-01-06', '2026-01-06 20:40:39', 1, NULL, 0, 0),
-(342, 1, 'johnson', 'en', 'Penis.', 1, 0, '2026-01-06', '2026-01-06 20:40:40', 1, NULL, 0, 0),
-(343, 1, 'will', 'en', '(now uncommon or literary) To wish, desire (something).', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(344, 1, 'soon', 'en', 'Short in length of time from the present.', 1, 0, '2026-01-06', '2026-01-06 20:40:40', 1, NULL, 0, 0),
-(345, 1, 'assessing', 'en', 'To determine, estimate or judge the value of; to evaluate', 1, 0, '2026-01-06', '2026-01-06 20:40:41', 1, NULL, 0, 0),
-(346, 1, 'emphasis', 'en', 'Special weight or forcefulness given to something considered important.', 1, 0, '2026-01-06', '2026-01-06 20:40:41', 1, NULL, 0, 0),
-(347, 1, 'masters', 'en', 'Someone who has control over something or someone.', 1, 0, '2026-01-06', '2026-01-06 20:40:40', 1, NULL, 0, 0),
-(348, 1, 'option', 'en', 'One of a set of choices that can be made.', 1, 0, '2026-01-06', '2026-01-06 20:40:39', 1, NULL, 0, 0),
-(349, 1, 'leaving', 'en', 'To have a consequence or remnant.', 1, 0, '2026-01-06', '2026-01-06 20:40:39', 1, NULL, 0, 0),
-(350, 1, 'let', 'en', 'The allowing of possession of a property etc. in exchange for rent.', 1, 0, '2026-01-06', '2026-01-06 20:40:39', 1, NULL, 0, 0),
-(351, 1, 'मुस्लिम', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:50', 1, NULL, 0, 0),
-(352, 1, 'लेन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:44', 1, NULL, 0, 0),
-(353, 1, 'जश्न', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:43', 1, NULL, 0, 0),
-(354, 1, 'होग', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(355, 1, 'fechas', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:49', 1, NULL, 0, 0),
-(356, 1, 'cuando', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:49', 1, NULL, 0, 0),
-(357, 1, 'ochenta', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:49', 1, NULL, 0, 0),
-(358, 1, 'siete', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:49', 1, NULL, 0, 0),
-(359, 1, 'ciudad', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:49', 1, NULL, 0, 0),
-(360, 1, 'empleo', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:49', 1, NULL, 0, 0),
-(361, 1, 'imagine', 'en', 'A short fanfic or prompt placing a reader insert in a novel scenario with a character or celebrity.', 1, 0, '2026-01-06', '2026-01-06 20:40:51', 1, NULL, 0, 0),
-(362, 1, 'shake', 'en', 'The act of shaking or being shaken; tremulous or back-and-forth motion.', 1, 0, '2026-01-06', '2026-01-06 20:40:53', 1, NULL, 0, 0),
-(363, 1, 'enough', 'en', 'Sufficiently.', 1, 0, '2026-01-06', '2026-01-06 20:40:51', 1, NULL, 0, 0),
-(364, 1, 'states', 'en', 'A condition; a set of circumstances applying at any given time.', 1, 0, '2026-01-06', '2026-01-06 20:40:52', 1, NULL, 0, 0),
-(365, 1, 'build', 'en', 'The physique of a human body; constitution or structure of a human body.', 1, 0, '2026-01-06', '2026-01-06 20:40:52', 1, NULL, 0, 0),
-(366, 1, 'new', 'en', 'Things that are new.', 1, 0, '2026-01-06', '2026-01-06 20:40:52', 1, NULL, 0, 0),
-(367, 1, 'put', 'en', 'A right to sell something at a predetermined price.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(368, 1, 'approaching', 'en', 'To come or go near, in place or time; to draw nigh; to advance nearer.', 1, 0, '2026-01-06', '2026-01-06 20:40:52', 1, NULL, 0, 0),
-(369, 1, 'देर', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:52', 1, NULL, 0, 0),
-(370, 1, 'शाम', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:51', 1, NULL, 0, 0),
-(371, 1, 'पहुंच', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:40:52', 1, NULL, 0, 0),
-(372, 1, 'ser', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:58', 1, NULL, 0, 0),
-(373, 1, 'color', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:59', 1, NULL, 0, 0),
-(374, 1, 'sangre', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:40:58', 1, NULL, 0, 0),
-(375, 1, 'ten', 'en', 'A set or group with ten elements.', 1, 0, '2026-01-06', '2026-01-06 20:41:01', 1, NULL, 0, 0),
-(376, 1, 'cuddle', 'en', 'A snuggle; an affectionate embrace, often given to family members and close friends.', 1, 0, '2026-01-06', '2026-01-06 20:41:01', 1, NULL, 0, 0),
-(377, 1, 'single', 'en', 'A 45 RPM vinyl record with one song on side A and one on side B.', 1, 0, '2026-01-06', '2026-01-06 20:41:01', 1, NULL, 0, 0),
-(378, 1, 'रिकॉर्ड', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:07', 1, NULL, 0, 0),
-(379, 1, 'करन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:06', 1, NULL, 0, 0),
-(380, 1, 'काफ', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:06', 1, NULL, 0, 0),
-(381, 1, 'रुच', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:06', 1, NULL, 0, 0),
-(382, 1, 'wait', 'en', 'A delay.', 1, 0, '2026-01-06', '2026-01-06 20:41:10', 1, NULL, 0, 0),
-(383, 1, 'see', 'en', '(stative) To perceive or detect with the eyes, or as if by sight.', 1, 0, '2026-01-06', '2026-01-06 20:41:10', 1, NULL, 0, 0),
-(384, 1, 'geomapping', 'en', '', 0, 0, '2026-01-06', '2026-01-06 20:41:11', 1, NULL, 0, 0),
-(385, 1, 'able', 'en', 'Easy to use.', 1, 0, '2026-01-06', '2026-01-06 20:41:11', 1, NULL, 0, 0),
-(386, 1, 'sleep', 'en', 'To rest in a state of reduced consciousness.', 1, 0, '2026-01-06', '2026-01-06 20:41:12', 1, NULL, 0, 0),
-(387, 1, 'galeno', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:15', 1, NULL, 0, 0),
-(388, 1, 'encimeras', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:14', 1, NULL, 0, 0),
-(389, 1, 'echen', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:14', 1, NULL, 0, 0),
-(390, 1, 'los', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:14', 2, NULL, 0, 0),
-(391, 1, 'sufren', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:14', 1, NULL, 0, 0),
-(392, 1, 'clientes', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:14', 1, NULL, 0, 0),
-(393, 1, 'cámara', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:14', 1, NULL, 0, 0),
-(394, 1, 'सोच', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:15', 1, NULL, 0, 0),
-(395, 1, 'finally', 'en', 'At the end or conclusion; ultimately.', 1, 0, '2026-01-06', '2026-01-06 20:41:17', 1, NULL, 0, 0),
-(396, 1, 'such', 'en', 'Something being indicated that is similar to something else.', 1, 0, '2026-01-06', '2026-01-06 20:41:18', 1, NULL, 0, 0),
-(397, 1, 'lot', 'en', 'A large quantity or number; a great deal.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(398, 1, 'partner', 'en', 'Someone who is associated with another in a common activity or interest.', 1, 0, '2026-01-06', '2026-01-06 20:41:18', 1, NULL, 0, 0),
-(399, 1, 'said', 'en', 'Mentioned earlier; aforesaid.', 1, 0, '2026-01-06', '2026-01-06 20:41:17', 1, NULL, 0, 0),
-(400, 1, 'been', 'en', 'A flying insect, of the clade Anthophila within the hymenopteran superfamily Apoidea, known for its organised societies (though only a minority have them), for collecting pollen and (in some species) producing wax and honey.', 1, 0, '2026-01-06', '2026-01-06 20:41:17', 1, NULL, 0, 0),
-(401, 1, 'again', 'en', 'Another time; once more.', 1, 0, '2026-01-06', '2026-01-06 20:41:18', 1, NULL, 0, 0),
-(402, 1, 'होन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:24', 1, NULL, 0, 0),
-(403, 1, 'लिए', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:25', 1, NULL, 0, 0),
-(404, 1, 'अपन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(405, 1, 'live', 'en', 'To be alive; to have life.', 1, 0, '2026-01-06', '2026-01-06 20:41:25', 1, NULL, 0, 0),
-(406, 1, 'openings', 'en', 'An act or instance of making or becoming open.', 1, 0, '2026-01-06', '2026-01-06 20:41:26', 1, NULL, 0, 0),
-(407, 1, 'couldn', 'en', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(408, 1, 'use', 'en', 'The act of using.', 1, 0, '2026-01-06', '2026-01-06 20:41:25', 1, NULL, 0, 0),
-(409, 1, 'ponemos', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:24', 1, NULL, 0, 0),
-(410, 1, 'fueran', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:25', 1, NULL, 0, 0),
-(411, 1, 'discúlpenme', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:29', 1, NULL, 0, 0),
-(412, 1, 'sonrisa', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:29', 1, NULL, 0, 0),
-(413, 1, 'उनस', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:32', 1, NULL, 0, 0),
-(414, 1, 'सकत', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:32', 1, NULL, 0, 0),
-(415, 1, 'सेकंड', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:31', 1, NULL, 0, 0),
-(416, 1, 'didn', 'en', '', 0, 0, '2026-01-06', '2026-01-06 20:41:32', 1, NULL, 0, 0),
-(417, 1, 'now', 'en', 'The present time.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(418, 1, 'find', 'en', 'Anything that is found (usually valuable), as objects on an archeological site or a person with talent.', 1, 0, '2026-01-06', '2026-01-06 20:41:35', 1, NULL, 0, 0),
-(419, 1, 'epidemic', 'en', 'A widespread disease that affects many individuals in a population.', 1, 0, '2026-01-06', '2026-01-06 20:41:36', 1, NULL, 0, 0),
-(420, 1, 'negado', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:36', 1, NULL, 0, 0),
-(421, 1, 'फोन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(422, 1, 'जाए', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:40', 1, NULL, 0, 0),
-(423, 1, 'población', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:41', 1, NULL, 0, 0),
-(424, 1, 'irán', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:42', 1, NULL, 0, 0),
-(425, 1, 'mes', 'es', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(426, 1, 'empezamos', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:41', 1, NULL, 0, 0),
-(427, 1, 'peter', 'en', 'The penis.', 1, 0, '2026-01-06', '2026-01-06 20:41:48', 1, NULL, 0, 0),
-(428, 1, 'one', 'en', 'The digit or figure 1.', 1, 0, '2026-01-06', '2026-01-06 20:41:47', 1, NULL, 0, 0),
-(429, 1, 'name', 'en', 'Any nounal word or phrase which indicates a particular person, place, class, or thing.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(430, 1, 'tenant', 'en', 'One who pays a fee (rent) in return for the use of land, buildings, or other property owned by others.', 1, 0, '2026-01-06', '2026-01-06 20:41:48', 1, NULL, 0, 0),
-(431, 1, 'forty', 'en', 'A bottle of beer containing forty fluid ounces.', 1, 0, '2026-01-06', '2026-01-06 20:41:47', 1, NULL, 0, 0),
-(432, 1, 'seven', 'en', 'The digit/figure 7 or an occurrence thereof.', 1, 0, '2026-01-06', '2026-01-06 20:41:47', 1, NULL, 0, 0),
-(433, 1, 'hundred', 'en', 'A hundred-dollar bill, or any other note denominated 100 (e.g. a hundred euros).', 1, 0, '2026-01-06', '2026-01-06 20:41:48', 1, NULL, 0, 0),
-(434, 1, 'eighty', 'en', 'The cardinal number occurring after seventy-nine and before eighty-one, represented in Roman numerals as LXXX and in Arabic numerals as 80.', 1, 0, '2026-01-06', '2026-01-06 20:41:47', 1, NULL, 0, 0),
-(435, 1, 'व्यक्तिगत', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:48', 1, NULL, 0, 0),
-(436, 1, 'चैनल', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(437, 1, 'भारत', 'hi', '', 0, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(438, 1, 'कारण', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:41:48', 1, NULL, 0, 0),
-(439, 1, 'anduvo', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:49', 1, NULL, 0, 0),
-(440, 1, 'fogones', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:49', 1, NULL, 0, 0),
-(441, 1, 'tapar', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:49', 1, NULL, 0, 0),
-(442, 1, 'echar', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:41:49', 1, NULL, 0, 0),
-(443, 1, 'for', 'en', '', 0, 0, '2026-01-06', '2026-01-06 20:41:59', 1, NULL, 0, 0),
-(444, 1, 'reading', 'en', 'To look at and interpret letters or other information that is written.', 1, 0, '2026-01-06', '2026-01-06 20:41:57', 1, NULL, 0, 0),
-(445, 1, 'never', 'en', 'At no time; on no occasion; in no circumstance.', 1, 0, '2026-01-06', '2026-01-06 20:41:58', 1, NULL, 0, 0),
-(446, 1, 'wanted', 'en', 'To wish for or desire (something); to feel a need or desire for; to crave or demand.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(447, 1, 'our', 'en', 'Definition pending...', 1, 0, '2026-01-06', '2026-01-24 16:25:31', 1, NULL, 0, 0),
-(448, 1, 'time', 'en', 'The inevitable progression into the future with the passing of present and past events.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(449, 1, 'मदीन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:06', 1, NULL, 0, 0),
-(450, 1, 'सुपर', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:06', 2, NULL, 0, 0),
-(451, 1, 'डीलक्स', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:06', 1, NULL, 0, 0),
-(452, 1, 'राज', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:06', 1, NULL, 0, 0),
-(453, 1, 'बिस्तर', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:06', 1, NULL, 0, 0),
-(454, 1, 'अनुसार', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:06', 1, NULL, 0, 0),
-(455, 1, 'निस्तारण', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:06', 1, NULL, 0, 0),
-(456, 1, 'everybody', 'en', 'All people.', 1, 0, '2026-01-06', '2026-01-06 20:42:08', 1, NULL, 0, 0),
-(457, 1, 'signed', 'en', 'To make a mark', 1, 0, '2026-01-06', '2026-01-06 20:42:07', 1, NULL, 0, 0),
-(458, 1, 'fan', 'en', 'A hand-held device consisting of concertinaed material, or slats of material, gathered together at one end, that may be opened out into the shape of a sector of a circle and waved back and forth in order to move air towards oneself and cool oneself.', 1, 0, '2026-01-06', '2026-01-06 20:42:07', 1, NULL, 0, 0),
-(459, 1, 'idiot', 'en', 'A person of low general intelligence.', 1, 0, '2026-01-06', '2026-01-06 20:42:07', 1, NULL, 0, 0),
-(460, 1, 'बाइबिल', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:17', 1, NULL, 0, 0),
-(461, 1, 'उनक', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:18', 1, NULL, 0, 0),
-(462, 1, 'मोबाइल', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:17', 1, NULL, 0, 0),
-(463, 1, 'hmm', 'en', 'To make a thoughtful humming noise.', 1, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(464, 1, 'more', 'en', 'To a greater degree or extent.', 1, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(465, 1, 'drilling', 'en', 'To create (a hole) by removing material with a drill (tool).', 1, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(466, 1, 'form', 'en', '(heading, physical) To do with shape.', 1, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(467, 1, 'these', 'en', 'The thing, item, etc. being indicated.', 1, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(468, 1, 'gonna', 'en', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(469, 1, 'wasted', 'en', 'To devastate, destroy', 1, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(470, 1, 'ways', 'en', '(heading) To do with a place or places.', 1, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(471, 1, 'charla', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(472, 1, 'manden', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(473, 1, 'súper', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:24', 2, NULL, 0, 0),
-(474, 1, 'bética', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(475, 1, 'balance', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(476, 1, 'mantiene', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(477, 1, 'está', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(478, 1, 'conjunta', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(479, 1, 'harían', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(480, 1, 'fuera', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(481, 1, 'del', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 2, NULL, 0, 0),
-(482, 1, 'pie', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(483, 1, 'estamos', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:22', 1, NULL, 0, 0),
-(484, 1, 'endesa', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(485, 1, 'ganar', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(486, 1, 'tienen', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(487, 1, 'grande', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(488, 1, 'convento', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:22', 1, NULL, 0, 0),
-(489, 1, 'baile', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(490, 1, 'muerte', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(491, 1, 'fueron', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(492, 1, 'diez', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(493, 1, 'qne', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(494, 1, 'decir', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(495, 1, 'cuestionar', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(496, 1, 'ventana', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(497, 1, 'finalmente', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(498, 1, 'disco', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(499, 1, 'सिंगर', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:23', 1, NULL, 0, 0),
-(500, 1, 'चाइन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(501, 1, 'पॉलिस', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(502, 1, 'कमेट', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:24', 1, NULL, 0, 0),
-(503, 1, 'una', 'en', '', 0, 0, '2026-01-06', '2026-01-06 20:42:30', 1, NULL, 0, 0),
-(504, 1, 'pizza', 'en', 'A baked Italian dish of a thinly rolled bread dough crust typically topped before baking with tomato sauce, cheese and other ingredients such as meat, vegetables or fruit', 1, 0, '2026-01-06', '2026-01-06 20:42:31', 1, NULL, 0, 0),
-(505, 1, 'सोनम', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:30', 1, NULL, 0, 0),
-(506, 1, 'कपूर', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:29', 1, NULL, 0, 0),
-(507, 1, 'फोड', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:29', 1, NULL, 0, 0),
-(508, 1, 'परीक्षण', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:31', 1, NULL, 0, 0),
-(509, 1, 'among', 'en', 'Denotes a mingling or intermixing with distinct or separable objects. (See Usage Note at amidst.)', 1, 0, '2026-01-06', '2026-01-06 20:42:42', 1, NULL, 0, 0),
-(510, 1, 'many', 'en', 'A multitude; a great aggregate; a mass of people; the generality; the common herd.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(511, 1, 'ट्रेडिशनल', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:49', 1, NULL, 0, 0),
-(512, 1, 'एशियन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:48', 1, NULL, 0, 0),
-(513, 1, 'पेंट्स', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:48', 1, NULL, 0, 0),
-(514, 1, 'सिनेम', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:48', 1, NULL, 0, 0),
-(515, 1, 'शूटिंग', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:48', 1, NULL, 0, 0),
-(516, 1, 'chasing', 'en', 'To pursue.', 1, 0, '2026-01-06', '2026-01-06 20:42:52', 1, NULL, 0, 0),
-(517, 1, 'इंटरनेट', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:54', 2, NULL, 0, 0),
-(518, 1, 'मीडिय', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:54', 1, NULL, 0, 0),
-(519, 1, 'लिप्त', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:42:54', 1, NULL, 0, 0),
-(520, 1, 'meme', 'en', 'Any unit of cultural information, such as a practice or idea, that is transmitted verbally or by repeated action from one mind to another in a comparable way to the transmission of genes.', 1, 0, '2026-01-06', '2026-01-06 20:43:00', 1, NULL, 0, 0),
-(521, 1, 'believe', 'en', 'To accept as true, particularly without absolute certainty (i.e., as opposed to knowing)', 1, 0, '2026-01-06', '2026-01-06 20:43:00', 1, NULL, 0, 0),
-(522, 1, 'paper', 'en', 'A sheet material used for writing on or printing on (or as a non-waterproof container), usually made by draining cellulose fibres from a suspension in water.', 1, 0, '2026-01-06', '2026-01-06 20:43:00', 1, NULL, 0, 0),
-(523, 1, 'mean', 'en', 'To lament.', 1, 0, '2026-01-06', '2026-01-06', 2, NULL, 0, 0),
-(524, 1, 'handle', 'en', 'The part of an object which is (designed to be) held in the hand when used or moved.', 1, 0, '2026-01-06', '2026-01-06 20:43:00', 1, NULL, 0, 0),
-(525, 1, 'हिंद', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:43:03', 1, NULL, 0, 0),
-(526, 1, 'दैनिक', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:43:04', 1, NULL, 0, 0),
-(527, 1, 'अनुच्छेद', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:43:04', 1, NULL, 0, 0),
-(528, 1, 'रिश्तेदार', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:43:03', 1, NULL, 0, 0),
-(529, 1, 'percentage', 'en', 'The amount, number or rate of something, regarded as part of a total of 100; a part of a whole.', 1, 0, '2026-01-06', '2026-01-06 20:43:04', 1, NULL, 0, 0),
-(530, 1, 'edge', 'en', 'The boundary line of a surface.', 1, 0, '2026-01-06', '2026-01-06 20:43:04', 1, NULL, 0, 0),
-(531, 1, 'yang', 'en', 'A principle in Chinese and related East Asian philosophies associated with bright, hot, masculine, etc. elements of the natural world.', 1, 0, '2026-01-06', '2026-01-06 20:43:07', 1, NULL, 0, 0),
-(532, 1, 'दिय', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:43:07', 1, NULL, 0, 0),
-(533, 1, 'innocent', 'en', 'One who is innocent, especially a young child.', 1, 0, '2026-01-06', '2026-01-06 20:43:15', 1, NULL, 0, 0),
-(534, 1, 'each', 'en', '(operations) An individual item: the least quantitative unit in a grouping.', 1, 0, '2026-01-06', '2026-01-06 20:43:17', 1, NULL, 0, 0),
-(535, 1, 'independent', 'en', 'A candidate or voter not affiliated with any political party, a freethinker, free of a party platform.', 1, 0, '2026-01-06', '2026-01-06 20:43:17', 1, NULL, 0, 0),
-(536, 1, 'remember', 'en', 'To recall from one''s memory; to have an image in one''s memory.', 1, 0, '2026-01-06', '2026-01-06 20:43:26', 1, NULL, 0, 0),
-(537, 1, 'show', 'en', 'A play, dance, or other entertainment.', 1, 0, '2026-01-06', '2026-01-06 20:43:25', 1, NULL, 0, 0),
-(538, 1, 'when', 'en', 'The time at which something happens.', 1, 0, '2026-01-06', '2026-01-07', 3, NULL, 0, 0),
-(539, 1, 'miss', 'en', 'A failure to hit.', 1, 0, '2026-01-06', '2026-01-06 20:43:30', 1, NULL, 0, 0),
-(540, 1, 'them', 'en', '(plural) Those ones.', 1, 0, '2026-01-06', '2026-01-06 20:43:31', 1, NULL, 0, 0),
-(541, 1, 'ahora', 'es', '', 0, 0, '2026-01-06', '2026-01-06 20:43:31', 1, NULL, 0, 0),
-(542, 1, 'only', 'en', 'An only child.', 1, 0, '2026-01-06', '2026-01-06 20:43:37', 1, NULL, 0, 0),
-(543, 1, 'wish', 'en', 'A desire, hope, or longing for something or for something to happen.', 1, 0, '2026-01-06', '2026-01-06 20:43:37', 1, NULL, 0, 0),
-(544, 1, 'प्रशिक्षण', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:43:38', 1, NULL, 0, 0),
-(545, 1, 'your', 'en', '', 0, 0, '2026-01-06', '2026-01-07 12:05:56', 1, NULL, 0, 0),
-(546, 1, 'honor', 'en', 'Recognition of importance or value; respect; veneration (of someone, usually for being morally upright or successful)', 1, 0, '2026-01-06', '2026-01-06 20:43:40', 1, NULL, 0, 0),
-(547, 1, 'इंडियन', 'hi', '', 0, 0, '2026-01-06', '2026-01-07 12:05:50', 1, NULL, 0, 0),
-(548, 1, 'मुजाहिदीन', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:44:08', 1, NULL, 0, 0),
-(549, 1, 'yeah', 'en', 'Expressing joy, celebration, glee, etc.', 1, 0, '2026-01-06', '2026-01-06 20:44:11', 1, NULL, 0, 0),
-(550, 1, 'क्य', 'hi', '', 0, 0, '2026-01-06', '2026-01-06 20:44:12', 1, NULL, 0, 0),
-(551, 1, 'asadharan', 'hi', '', 0, 0, '2026-01-06 20:44:12', '2026-01-06 20:44:12', 1, NULL, 0, 0),
-(552, 1, 'alvida', 'hi', '', 0, 0, '2026-01-06 20:44:13', '2026-01-06 20:44:13', 1, NULL, 0, 0),
-(553, 1, 'película', 'es', NULL, 0, 0, '2026-01-06', '2026-01-06', 1, NULL, 0, 0),
-(554, 1, 'nahin', 'hi', '', 0, 0, '2026-01-06 20:44:14', '2026-01-06 20:44:14', 1, NULL, 0, 0),
-(555, 1, 'bueno', 'es', '', 0, 0, '2026-01-07', '2026-01-07 12:05:15', 2, NULL, 0, 0),
-(556, 1, 'teléfono', 'es', '', 0, 0, '2026-01-07', '2026-01-07 12:05:26', 2, NULL, 0, 0),
-(557, 1, 'panteón', 'es', '', 0, 0, '2026-01-07', '2026-01-07 12:05:36', 1, NULL, 0, 0),
-(558, 1, 'amagando', 'es', 'Definición pendiente...', 1, 0, '2026-01-07', '2026-01-24 13:42:18', 1, NULL, 0, 0),
-(559, 1, 'mochila', 'es', '', 0, 0, '2026-01-07', '2026-01-07 12:05:40', 1, NULL, 0, 0),
-(560, 1, 'tenía', 'es', '', 0, 0, '2026-01-07', '2026-01-07 12:05:21', 1, NULL, 0, 0),
-(561, 1, 'parece', 'es', '', 0, 0, '2026-01-07', '2026-01-07 12:05:31', 1, NULL, 0, 0),
-(562, 1, 'parivar', 'hi', '', 0, 0, '2026-01-07 11:16:53', '2026-01-07 12:06:00', 1, NULL, 0, 0),
-(563, 1, 'dhanyawad', 'hi', 'Hindi word meaning: thanks friends', 1, 0, '2026-01-07 11:16:55', '2026-01-07 12:14:21', 1, NULL, 0, 0),
-(564, 1, 'shानदार', 'hi', '', 0, 0, '2026-01-07 11:16:56', '2026-01-07 12:06:11', 1, NULL, 0, 0),
-(565, 1, 'adiós', 'es', 'Adiós is a Spanish interjection used to express farewell or goodbye when parting from someone. | Example: Adiós, nos vemos mañana en la oficina. | Synonyms: hasta luego, hasta pronto, chao', 1, 0, '2026-01-07 11:16:57', '2026-01-27 12:44:09', 1, NULL, 0, 0),
-(566, 1, 'hermoso', 'es', 'Definición pendiente...', 1, 0, '2026-01-07 11:16:58', '2026-01-24 09:45:32', 1, NULL, 0, 0),
-(567, 1, 'magnífico', 'es', 'Definición pendiente...', 1, 0, '2026-01-07 11:17:00', '2026-01-24 09:45:44', 1, NULL, 0, 0),
-(568, 1, 'no', 'es', '', 0, 0, '2026-01-07 11:17:04', '2026-01-24 09:34:40', 1, NULL, 0, 0),
-(569, 1, 'diferente', 'es', 'Spanish word meaning: source.', 1, 0, '2026-01-07 11:17:05', '2026-01-07 12:14:44', 1, NULL, 0, 0),
-(570, 1, 'familia', 'es', 'Spanish word meaning: family', 1, 0, '2026-01-07 11:17:06', '2026-01-07 12:14:38', 1, NULL, 0, 0),
-(571, 1, 'necesario', 'es', 'Something that is required, essential, or cannot be done without. | Example: Es necesario beber agua para mantenerse hidratado. | Synonyms: esencial, indispensable, fundamental', 1, 0, '2026-01-07 11:17:07', '2026-01-27 12:44:28', 1, NULL, 0, 0),
-(572, 1, 'agua', 'es', 'Spanish word meaning: Water', 1, 0, '2026-01-07 11:17:08', '2026-01-07 12:14:48', 1, NULL, 0, 0),
-(573, 1, 'posible', 'es', 'Definición pendiente...', 1, 0, '2026-01-07 11:17:09', '2026-01-24 09:46:07', 1, NULL, 0, 0),
-(574, 1, 'casa', 'es', '', 0, 0, '2026-01-07 11:17:11', '2026-01-24 09:43:50', 1, NULL, 0, 0),
-(575, 1, 'sí', 'es', 'Definición pendiente...', 1, 0, '2026-01-07 11:17:17', '2026-01-24 09:45:55', 1, NULL, 0, 0),
-(576, 1, 'sofisticado', 'es', 'Spanish word meaning: sophisticated', 1, 0, '2026-01-07 11:17:18', '2026-01-07 12:14:32', 1, NULL, 0, 0),
-(577, 1, 'gracias', 'es', 'It is a Spanish expression used to convey gratitude or thanks. | Example: Gracias por tu ayuda. | Synonyms: Thank you, much obliged, appreciation', 1, 0, '2026-01-07 11:17:22', '2026-01-27 12:44:23', 1, NULL, 0, 0),
-(578, 1, 'por favor', 'es', 'Definición pendiente...', 1, 0, '2026-01-07 11:17:25', '2026-01-24 09:45:50', 1, NULL, 0, 0),
-(579, 1, 'comprensivo', 'es', 'Definición pendiente...', 1, 0, '2026-01-07 11:17:34', '2026-01-24 09:46:01', 1, NULL, 0, 0),
-(580, 1, 'disponible', 'es', '', 0, 0, '2026-01-07 11:17:46', '2026-01-24 09:44:07', 1, NULL, 0, 0),
-(581, 1, 'but', 'en', 'An instance or example of using the word "but".', 1, 0, '2026-01-07', '2026-01-07 11:17:52', 1, NULL, 0, 0),
-(582, 1, 'extraordinario', 'es', 'Definición pendiente...', 1, 0, '2026-01-07 11:18:08', '2026-01-24 09:46:13', 1, NULL, 0, 0),
-(583, 1, 'importante', 'es', 'Definición pendiente...', 1, 0, '2026-01-07 11:28:32', '2026-01-24 09:46:19', 1, NULL, 0, 0),
-(584, 1, 'hola', 'es', 'Definición pendiente...', 1, 0, '2026-01-07 11:28:34', '2026-01-24 09:45:39', 1, NULL, 0, 0),
-(585, 1, 'comida', 'es', 'Definición pendiente...', 1, 0, '2026-01-07 11:30:54', '2026-01-24 09:46:25', 1, NULL, 0, 0),
-(586, 1, 'tremendo', 'es', 'Spanish word meaning: tremendous….', 1, 0, '2026-01-07 11:30:55', '2026-01-09 22:24:43', 1, NULL, 0, 0),
-(587, 1, 'vyapak', 'hi', '', 0, 0, '2026-01-09 22:23:37', '2026-01-09 22:24:29', 1, NULL, 0, 0),
-(588, 1, 'huh', 'en', '(with falling pitch) used to express amusement or subtle surprise.', 1, 0, '2026-01-09', '2026-02-11', 287, NULL, 0, 0),
-(589, 3, 'huh', 'en', '(/hʌ/) (with falling pitch) used to express amusement or subtle surprise. | Example: Huh! I''m sure I locked it when I left.', 1, 0, '2026-01-21', '2026-01-21', 8, NULL, 0, 0),
-(590, 1, 'ghar', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:26:26', '2026-01-24 16:26:26', 1, NULL, 0, 0),
-(591, 1, 'uplabdh', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:26:30', '2026-01-24 16:26:30', 1, NULL, 0, 0),
-(592, 1, 'sundar', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:26:35', '2026-01-24 16:26:35', 1, NULL, 0, 0),
-(593, 1, 'pariskhrit', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:26:40', '2026-01-24 16:26:40', 1, NULL, 0, 0),
-(594, 1, 'bhayanak', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:26:45', '2026-01-24 16:26:45', 1, NULL, 0, 0),
-(595, 1, 'haan', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:26:50', '2026-01-24 16:26:50', 1, NULL, 0, 0),
-(596, 1, 'alag', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:26:55', '2026-01-24 16:26:55', 1, NULL, 0, 0),
-(597, 1, 'namaste', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:27:00', '2026-01-24 16:27:00', 1, NULL, 0, 0),
-(598, 1, 'kripaya', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:27:04', '2026-01-24 16:27:04', 1, NULL, 0, 0),
-(599, 1, 'paani', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:27:08', '2026-01-24 16:27:08', 1, NULL, 0, 0),
-(600, 1, 'sambhav', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:27:13', '2026-01-24 16:27:13', 1, NULL, 0, 0),
-(601, 1, 'aavashyak', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:27:18', '2026-01-24 16:27:18', 1, NULL, 0, 0),
-(602, 1, 'mahattvapurna', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:27:23', '2026-01-24 16:27:23', 1, NULL, 0, 0),
-(603, 1, 'khana', 'hi', 'Arth uplabdh nahi hai...', 1, 0, '2026-01-24 16:27:27', '2026-01-24 16:27:27', 1, NULL, 0, 0),
-(604, 5, 'time', 'en', '(/tɑem/) The inevitable progression into the future with the passing of present and past events. | Example: Time stops for nobody.   the ebb and flow of time', 1, 0, '2026-02-03', '2026-02-03 13:45:01', 1, NULL, 0, 0),
-(605, 5, 'know', 'en', '(/nəʊ/) Knowledge; the state of knowing. | Example: He knew something terrible was going to happen.', 1, 0, '2026-02-03', '2026-02-04', 39, NULL, 0, 0),
-(606, 5, 'guy', 'en', '(/ɡaɪ/) An effigy of a man burned on a bonfire on the anniversary of the Gunpowder Plot (5th November). | Example: The dog''s left foreleg was broken, poor little guy.', 1, 0, '2026-02-03', '2026-02-03 13:45:11', 1, NULL, 0, 0),
-(607, 5, 'but', 'en', 'An instance or example of using the word "but". | Example: It has to be done – no ifs or buts.', 1, 0, '2026-02-03', '2026-02-04', 8, NULL, 0, 0),
-(608, 5, 'gasoline', 'en', '(/ˈɡæs.ə.lin/) A flammable liquid consisting of a mixture of refined petroleum hydrocarbons, mainly used as a motor fuel; petrol. | Example: The refinery produces a wide range of gasolines.', 1, 0, '2026-02-03', '2026-02-03 13:45:25', 1, NULL, 0, 0),
-(609, 5, 'क्य', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 4, NULL, 0, 0),
-(610, 5, 'life', 'en', '(/laɪf/) The state of organisms preceding their death, characterized by biological processes such as metabolism and reproduction and distinguishing them from inanimate objects; the state of being alive and living. | Example: Having experienced both, the vampire decided that he preferred (un)death to life.  He gave up on life.', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(611, 5, 'really', 'en', '(/ˈɹɪəli/) In a way or manner that is real, not unreal. | Example: "He really is a true friend." / "Really? What makes you so sure?"', 1, 0, '2026-02-03', '2026-02-04', 13, NULL, 0, 0),
-(612, 5, 'hello', 'en', '"Hello!" or an equivalent greeting. | Example: Hello, everyone.', 1, 0, '2026-02-03', '2026-02-04', 10, NULL, 0, 0),
-(613, 5, 'how', 'en', '(/hæŏ/) The means by which something is accomplished. | Example: I am not interested in the why, but in the how.', 1, 0, '2026-02-03', '2026-02-04', 14, NULL, 0, 0),
-(614, 5, 'वीडिय', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:45:51', 1, NULL, 0, 0),
-(615, 5, 'सऊद', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:46:07', 1, NULL, 0, 0),
-(616, 5, 'because', 'en', '(/bɪˈkɒz/) For the reason (that). | Example: My life is ruined because of you!', 1, 0, '2026-02-03', '2026-02-04', 9, NULL, 0, 0),
-(617, 5, 'and', 'en', 'In rhythm, the second half of a divided beat.', 1, 0, '2026-02-03', '2026-02-04', 35, NULL, 0, 0),
-(618, 5, 'हमन', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:46:42', 1, NULL, 0, 0),
-(619, 5, 'reading', 'en', '(/ˈɹidiŋ/) To look at and interpret letters or other information that is written. | Example: Have you read this book? | Synonyms: read aloud, read out, read out loud, speak, receive, understand, scan, make out', 1, 0, '2026-02-03', '2026-02-03 13:46:48', 1, NULL, 0, 0),
-(620, 5, 'विभिन्न', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:46:46', 1, NULL, 0, 0),
-(621, 5, 'get', 'en', '(/ɡɛt/) Offspring. | Example: I''m going to get a computer tomorrow from the discount store.', 1, 0, '2026-02-03', '2026-02-04', 11, NULL, 0, 0),
-(622, 5, 'que', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03', 6, NULL, 0, 0),
-(623, 5, 'los', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:46:52', 1, NULL, 0, 0),
-(624, 5, 'noventa', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:46:52', 1, NULL, 0, 0),
-(625, 5, 'tres', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:46:52', 1, NULL, 0, 0),
-(626, 5, 'monday', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(627, 5, 'don', 'en', '(/dɒn/) A university professor, particularly one at Oxford or Cambridge.', 1, 0, '2026-02-03', '2026-02-04', 12, NULL, 0, 0),
-(628, 5, 'want', 'en', '(/wɔnt/) A desire, wish, longing.', 1, 0, '2026-02-03', '2026-02-04', 7, NULL, 0, 0),
-(629, 5, 'under', 'en', '(/ˈʊndə/) Being lower; being beneath something. | Example: Ensure the patient is sufficiently under.', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(630, 5, 'your', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-04', 5, NULL, 0, 0),
-(631, 5, 'bed', 'en', '(/bed/) A piece of furniture, usually flat and soft, on which to rest or sleep. | Example: My cat often sleeps on my bed.
-I keep a glass of water next to my bed when I sleep.', 1, 0, '2026-02-03', '2026-02-03 13:46:55', 1, NULL, 0, 0),
-(632, 5, 'anyway', 'en', '(/ˈɛniweɪ/) Regardless; anyhow. | Example: He didn''t enjoy washing his car, but it was so dirty that he did it anyway.', 1, 0, '2026-02-03', '2026-02-03 13:46:57', 1, NULL, 0, 0),
-(633, 5, 'ट्रिब्यूनल', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:46:54', 1, NULL, 0, 0),
-(634, 5, 'another', 'en', 'An additional one of the same kind. | Example: There is one sterling and here is another', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(635, 5, 'este', 'es', NULL, 0, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(636, 5, 'mercado', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:46:56', 1, NULL, 0, 0),
-(637, 5, 'shipping', 'en', '(/ˈʃɪpɪŋ/) The transportation of goods. | Example: The shipping'' is included in the quoted price.', 1, 0, '2026-02-03', '2026-02-03 13:47:00', 1, NULL, 0, 0),
-(638, 5, 'lot', 'en', '(/lɒt/) A large quantity or number; a great deal. | Example: lots of people think so | Synonyms: fortune, parcel, collection, crowd, mass', 1, 0, '2026-02-03', '2026-02-04', 9, NULL, 0, 0),
-(639, 5, 'heading', 'en', '([ˈhɛɾ.ɪŋ]) To be in command of. (See also head up.) | Example: Who heads the board of trustees?', 1, 0, '2026-02-03', '2026-02-03 13:47:07', 1, NULL, 0, 0),
-(640, 5, 'navarra', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:05', 1, NULL, 0, 0),
-(641, 5, 'haré', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:04', 1, NULL, 0, 0),
-(642, 5, 'हेलेन', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:05', 1, NULL, 0, 0),
-(643, 5, 'हमार', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(644, 5, 'company', 'en', '(/ˈkʌmp(ə)ni/) A team; a group of people who work together professionally. | Example: Keep the house clean; I have company coming.', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(645, 5, 'compañía', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:06', 1, NULL, 0, 0),
-(646, 5, 'अन्य', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:09', 1, NULL, 0, 0),
-(647, 5, 'neighbor', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 13:47:11', 1, NULL, 0, 0),
-(648, 5, 'what', 'en', '(/wɔt/) (Singlish) Used to contradict an underlying assumption held by the interlocutor. | Example: The market will calculate these higher risks in their funding costs what might result in higher lending rates.', 1, 0, '2026-02-03', '2026-02-04', 26, NULL, 0, 0),
-(649, 5, 'tomatoes', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 13:47:23', 1, NULL, 0, 0),
-(650, 5, 'por', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(651, 5, 'ganaderos', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:21', 1, NULL, 0, 0),
-(652, 5, 'would', 'en', '(/wʊd/) Something that would happen, or would be the case, under different circumstances; a potentiality.', 1, 0, '2026-02-03', '2026-02-04', 6, NULL, 0, 0),
-(653, 5, 'work', 'en', '', 0, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(654, 5, 'खाद', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:24', 1, NULL, 0, 0),
-(655, 5, 'real', 'en', '(/ɹiːl/) A commodity; see realty.', 1, 0, '2026-02-03', '2026-02-03 13:47:30', 1, NULL, 0, 0),
-(656, 5, 'happy', 'en', 'A happy event, thing, person, etc. | Example: Music makes me feel happy.', 1, 0, '2026-02-03', '2026-02-03 13:47:28', 2, NULL, 0, 0),
-(657, 5, 'birthday', 'en', '(/ˈbɜːθ.deɪ/) The anniversary of the day on which someone is born.', 1, 0, '2026-02-03', '2026-02-03 13:47:29', 1, NULL, 0, 0),
-(658, 5, 'older', 'en', '(/ˈəʊldə/) Of an object, concept, relationship, etc., having existed for a relatively long period of time. | Example: an old abandoned building;  an old friend', 1, 0, '2026-02-03', '2026-02-03 13:47:29', 1, NULL, 0, 0),
-(659, 5, 'good', 'en', '(/ɡʊ(d)/) (of people) | Example: The soup is good and hot.', 1, 0, '2026-02-03', '2026-02-04', 21, NULL, 0, 0),
-(660, 5, 'added', 'en', '([ˈad.əd]) To join or unite (e.g. one thing to another, or as several particulars) so as to increase the number, augment the quantity or enlarge the magnitude, or so as to form into one aggregate. | Example: to add numbers', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(661, 5, 'going', 'en', '(/ˈɡəʊɪŋ/) To move: | Example: The engine just won''t go anymore. | Synonyms: see, wend, work, date, become', 1, 0, '2026-02-03', '2026-02-04', 18, NULL, 0, 0),
-(662, 5, 'हैप्प', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:35', 1, NULL, 0, 0),
-(663, 5, 'बर्थड', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:35', 1, NULL, 0, 0),
-(664, 5, 'पार्ट', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(665, 5, 'garden', 'en', 'An outdoor area containing one or more types of plants, usually plants grown for food or ornamental purposes. | Example: a vegetable garden  a flower garden | Synonyms: farm, make garden', 1, 0, '2026-02-03', '2026-02-03 13:47:39', 1, NULL, 0, 0),
-(666, 5, 'कार्ड', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:36', 1, NULL, 0, 0),
-(667, 5, 'cada', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:38', 1, NULL, 0, 0),
-(668, 5, 'vez', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:37', 1, NULL, 0, 0),
-(669, 5, 'alma', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:38', 1, NULL, 0, 0),
-(670, 5, 'zapata', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 13:47:42', 1, NULL, 0, 0),
-(671, 5, 'skill', 'en', '(/skɪl/) Capacity to do something well; technique, ability. Skills are usually acquired or learned, as opposed to abilities, which are often thought of as innate. | Synonyms: talent, ability', 1, 0, '2026-02-03', '2026-02-03 13:47:39', 1, NULL, 0, 0),
-(672, 5, 'aardman', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 13:47:41', 1, NULL, 0, 0),
-(673, 5, 'armonía', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:43', 1, NULL, 0, 0),
-(674, 5, 'mental', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:44', 1, NULL, 0, 0),
-(675, 5, 'mis', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:44', 1, NULL, 0, 0),
-(676, 5, 'estrellas', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:43', 1, NULL, 0, 0),
-(677, 5, 'मंत्रालय', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:45', 1, NULL, 0, 0),
-(678, 5, 'परेशान', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:44', 1, NULL, 0, 0),
-(679, 5, 'रहेग', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:45', 1, NULL, 0, 0),
-(680, 5, 'era', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03', 4, NULL, 0, 0),
-(681, 5, 'mar', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:46', 1, NULL, 0, 0),
-(682, 5, 'adamant', 'en', '(/ˈæ.də.mænt/) An imaginary rock or mineral of impenetrable hardness; a name given to the diamond and other substances of extreme hardness.', 1, 0, '2026-02-03', '2026-02-03 13:47:51', 1, NULL, 0, 0),
-(683, 5, 'that', 'en', '(/ˈðæt/) Something being indicated that is there; one of those. | Example: "The ribbon was that thin." "I disagree, I say it was not that thin, it was thicker... or maybe thinner..." | Synonyms: so', 1, 0, '2026-02-03', '2026-02-04', 41, NULL, 0, 0),
-(684, 5, 'have', 'en', 'A wealthy or privileged person. | Example: I have a house and a car.', 1, 0, '2026-02-03', '2026-02-04', 14, NULL, 0, 0),
-(685, 5, 'any', 'en', '(/ˈæni/) To even the slightest extent, at all. | Example: I will not remain here any longer.', 1, 0, '2026-02-03', '2026-02-03', 7, NULL, 0, 0),
-(686, 5, 'antisocial', 'en', '(/ˌæntaɪˈsoʊʃəl/) An antisocial individual.', 1, 0, '2026-02-03', '2026-02-03 13:47:50', 1, NULL, 0, 0),
-(687, 5, 'our', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 13:47:50', 1, NULL, 0, 0),
-(688, 5, 'data', 'en', '(/ˈdaetə/) (plural: data) A measurement of something on a scale understood by both the recorder (a person or device) and the reader (another person or device). The scale is arbitrarily defined, such as from 1 to 10 by ones, 1 to 100 by 0.1, or simply true or false, on or off, yes, no, or maybe, etc.', 1, 0, '2026-02-03', '2026-02-03 13:47:50', 1, NULL, 0, 0),
-(689, 5, 'did', 'en', '(/dɪd/) (auxiliary) A syntactic marker. | Example: All you ever do is surf the Internet. What will you do this afternoon? | Synonyms: scam, defraud, go to bed with, functionate, murder', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(690, 5, 'भारतीय', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:48', 1, NULL, 0, 0),
-(691, 5, 'रेलव', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:47', 1, NULL, 0, 0),
-(692, 5, 'पाटील', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(693, 5, 'haréis', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:48', 1, NULL, 0, 0),
-(694, 5, 'eso', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(695, 5, 'verdad', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:53', 1, NULL, 0, 0),
-(696, 5, 'existen', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:47:53', 1, NULL, 0, 0),
-(697, 5, 'दिन', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(698, 5, 'पहल', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:47:54', 1, NULL, 0, 0),
-(699, 5, 'spent', 'en', '(/ˈspɛnt/) To pay out (money). | Example: He spends far more on gambling than he does on living proper.', 1, 0, '2026-02-03', '2026-02-03 13:47:56', 1, NULL, 0, 0),
-(700, 5, 'with', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-04', 12, NULL, 0, 0),
-(701, 5, 'existing', 'en', '(/ɪɡˈzɪstɪŋ/) (stative) to be; have existence; have being or reality', 1, 0, '2026-02-03', '2026-02-03 13:47:57', 1, NULL, 0, 0),
-(702, 5, 'think', 'en', '(/θɪŋk/) An act of thinking; consideration (of something). | Example: I''ll have a think about that and let you know.', 1, 0, '2026-02-03', '2026-02-04', 11, NULL, 0, 0),
-(703, 5, 'buildings', 'en', '(/ˈbɪldɪŋz/) The act or process by which something is built; construction. | Example: The building of the bridge will be completed in a couple of weeks. | Synonyms: edifice, construction', 1, 0, '2026-02-03', '2026-02-03 13:47:56', 1, NULL, 0, 0),
-(704, 5, 'school', 'en', '(/skuːl/) (collective) A group of fish or a group of marine mammals such as porpoises, dolphins, or whales. | Example: The divers encountered a huge school of mackerel.', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(705, 5, 'उसक', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:04', 1, NULL, 0, 0),
-(706, 5, 'gossip', 'en', '(/ˈɡɒs.ɪp/) Someone who likes to talk about other people''s private or personal business. | Example: Be careful what you say to him: he’s a bit of a gossip. | Synonyms: blab, scuttlebutt, sponsor, hearsay, busybody', 1, 0, '2026-02-03', '2026-02-03 13:48:08', 1, NULL, 0, 0),
-(707, 5, 'lose', 'en', '(/luːz/) To cause (something) to cease to be in one''s possession or capability due to unfortunate or unknown circumstances, events or reasons. | Example: He lost his hearing in the explosion.', 1, 0, '2026-02-03', '2026-02-03 13:48:06', 1, NULL, 0, 0),
-(708, 5, 'understood', 'en', '(/ʌndəɹˈstʊd/) To grasp a concept fully and thoroughly, especially (of words, statements, art, etc.) to be aware of the meaning of and (of people) to be aware of the intent of. | Example: I''m sorry. I don''t understand.', 1, 0, '2026-02-03', '2026-02-03 13:48:09', 1, NULL, 0, 0),
-(709, 5, 'casa', 'es', 'Sustantivo. Edificio para habitar. Ejemplo: Mi casa es grande.', 1, 0, '2026-02-03', '2026-02-03 13:48:05', 1, NULL, 0, 0),
-(710, 5, 'donde', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:06', 1, NULL, 0, 0),
-(711, 5, 'साउंड', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:06', 1, NULL, 0, 0),
-(712, 5, 'difference', 'en', '(/ˈdɪfəɹən(t)s/) The quality of being different. | Example: You need to learn to be more tolerant of difference.', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(713, 5, 'जैस', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:17', 1, NULL, 0, 0),
-(714, 5, 'gasol', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 13:48:26', 1, NULL, 0, 0),
-(715, 5, 'कैस', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:22', 1, NULL, 0, 0),
-(716, 5, 'casi', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:26', 1, NULL, 0, 0),
-(717, 5, 'anexo', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:25', 1, NULL, 0, 0),
-(718, 5, 'next', 'en', '(/nɛkst/) The one that follows after this one. | Example: Next, please, don''t hold up the queue!', 1, 0, '2026-02-03', '2026-02-04', 5, NULL, 0, 0),
-(719, 5, 'नेक्स्ट', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:27', 2, NULL, 0, 0),
-(720, 5, 'suerte', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:30', 1, NULL, 0, 0),
-(721, 5, 'lessons', 'en', '(/ˈlɛsn̩z/) A section of learning or teaching into which a wider learning content is divided. | Example: In our school a typical working week consists of around twenty lessons and ten hours of related laboratory work.', 1, 0, '2026-02-03', '2026-02-03 13:48:36', 1, NULL, 0, 0),
-(722, 5, 'begun', 'en', '(/bɪˈɡʌn/) To start, to initiate or take the first step into something. | Example: I began playing the piano at the age of five.   Now that everyone is here, we should begin the presentation.', 1, 0, '2026-02-03', '2026-02-03 13:48:37', 1, NULL, 0, 0),
-(723, 5, 'पाई', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:35', 1, NULL, 0, 0),
-(724, 5, 'देग', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:34', 1, NULL, 0, 0),
-(725, 5, 'las', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:34', 1, NULL, 0, 0),
-(726, 5, 'ahí', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:36', 1, NULL, 0, 0),
-(727, 5, 'पुरान', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:40', 1, NULL, 0, 0),
-(728, 5, 'छोड', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(729, 5, 'said', 'en', '(/sɛd/) Mentioned earlier; aforesaid. | Example: The said party has denied the charges.', 1, 0, '2026-02-03', '2026-02-04', 7, NULL, 0, 0),
-(730, 5, 'grew', 'en', '(/ɡɹuː/) To become larger, to increase in magnitude. | Example: Children grow quickly.', 1, 0, '2026-02-03', '2026-02-03 13:48:42', 1, NULL, 0, 0),
-(731, 5, 'around', 'en', '(/əˈɹaʊnd/) (with the verb "to be") Present in the vicinity. | Example: Is Clare around today?', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(732, 5, 'human', 'en', '(/ˈhjuː.mən/) A human being, whether man, woman or child. | Example: Humans share common ancestors with other apes. | Synonyms: human being, man', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(733, 5, 'him', 'en', '(/əm/) Honorific alternative letter-case form of him, sometimes used when referring to God or another important figure who is understood from context. | Example: I think this bird is a him, but it may be a her.', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(734, 5, 'learn', 'en', '(/lɜːn/) The act of learning something | Example: learn from one''s mistakes', 1, 0, '2026-02-03', '2026-02-03 13:48:43', 1, NULL, 0, 0),
-(735, 5, 'understand', 'en', '(/ˌɞndəɹˈstand/) To grasp a concept fully and thoroughly, especially (of words, statements, art, etc.) to be aware of the meaning of and (of people) to be aware of the intent of. | Example: I''m sorry. I don''t understand.', 1, 0, '2026-02-03', '2026-02-03', 6, NULL, 0, 0),
-(736, 5, 'cosa', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:41', 1, NULL, 0, 0),
-(737, 5, 'otro', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:41', 1, NULL, 0, 0),
-(738, 5, 'animal', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:41', 1, NULL, 0, 0),
-(739, 5, 'hubieran', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:41', 1, NULL, 0, 0),
-(740, 5, 'españa', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:41', 1, NULL, 0, 0),
-(741, 5, 'they', 'en', '(/ðeɪ/) (the third-person plural) A group of people, animals, plants or objects previously mentioned. | Example: Dogs may bark if they want to be fed.', 1, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(742, 5, 'see', 'en', '(/siː/) (stative) To perceive or detect with the eyes, or as if by sight. | Example: 1999 saw the release of many great films. | Synonyms: well, behold, look, so', 1, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(743, 5, 'interesting', 'en', '(/ˈɪnt(ə)ɹɛstɪŋ/) To engage the attention of; to awaken interest in; to excite emotion or passion in, in behalf of a person or thing. | Example: Action films don''t really interest me.', 1, 0, '2026-02-03', '2026-02-03 13:48:47', 1, NULL, 0, 0),
-(744, 5, 'सिंह', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 6, NULL, 0, 0),
-(745, 5, 'टेस्टिंग', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:44', 1, NULL, 0, 0),
-(746, 5, 'नाड', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:44', 1, NULL, 0, 0),
-(747, 5, 'examiner', 'en', '(/əɡˈzæmɪnɚ/) A person who investigates someone or something.', 1, 0, '2026-02-03', '2026-02-03 13:48:49', 1, NULL, 0, 0),
-(748, 5, 'फिक्स', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:46', 1, NULL, 0, 0),
-(749, 5, 'jupiter', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(750, 5, 'last', 'en', '(/last/) Final, ultimate, coming after all others of its kind. | Example: “Eyes Wide Shut” was the last film to be directed by Stanley Kubrick.', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(751, 5, 'more', 'en', '(/ˈmɔː/) To a greater degree or extent. | Example: I could no more climb that than fly!', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(752, 5, 'than', 'en', 'At that time; then. | Example: A player than whom none is more skillful.', 1, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(753, 5, 'six', 'en', 'The digit or figure 6. | Example: cover my six', 1, 0, '2026-02-03', '2026-02-03 13:48:56', 1, NULL, 0, 0),
-(754, 5, 'minutes', 'en', '(/ˈmɪnɪts/) A unit of time equal to sixty seconds (one-sixtieth of an hour). | Example: You have twenty minutes to complete the test. | Synonyms: mo, minute of arc, second, sec, jiffy', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(755, 5, 'mueren', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:54', 1, NULL, 0, 0),
-(756, 5, 'columnas', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 13:48:55', 1, NULL, 0, 0),
-(757, 5, 'panicking', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 13:48:59', 1, NULL, 0, 0),
-(758, 5, 'आसमान', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:58', 1, NULL, 0, 0),
-(759, 5, 'सिकुड़न', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:57', 1, NULL, 0, 0),
-(760, 5, 'वास्तविक', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 13:48:58', 1, NULL, 0, 0),
-(761, 5, 'चंडीगढ', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(762, 5, 'पुलिस', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(763, 5, 'accent', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(764, 5, 'allowed', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(765, 5, 'picture', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(766, 5, 'please', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(767, 5, 'excited', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(768, 5, 'there', 'en', NULL, 0, 0, '2026-02-03', '2026-02-04', 13, NULL, 0, 0),
-(769, 5, 'can', 'en', '(/ˈkæn/) (auxiliary verb, defective) To know how to; to be able to. | Example: She can speak English, French, and German.   I can play football.   Can you remember your fifth birthday? | Synonyms: be able to, grok, ken, cognize, may', 1, 0, '2026-02-03', '2026-02-04', 11, NULL, 0, 0),
-(770, 5, 'make', 'en', '(/meɪk/) Brand or kind; model. | Example: What make of car do you drive? | Synonyms: render', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(771, 5, 'new', 'en', '(/njʉː/) Things that are new. | Example: Out with the old, in with the new. | Synonyms: new', 1, 0, '2026-02-03', '2026-02-04', 7, NULL, 0, 0),
-(772, 5, 'years', 'en', '(/ji.ə(ɹ)z/) A solar year, the time it takes the Earth to complete one revolution of the Sun (between 365.24 and 365.26 days depending on the point of reference). | Example: we moved to this town a year ago;  I quit smoking exactly one year ago', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(773, 5, 'now', 'en', '(/naʊ/) The present time. | Example: Now is the right time. | Synonyms: here and now', 1, 0, '2026-02-03', '2026-02-04', 8, NULL, 0, 0),
-(774, 5, 'हेल', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:08:06', 1, NULL, 0, 0),
-(775, 5, 'दिल्ल', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:08:06', 1, NULL, 0, 0),
-(776, 5, 'yeah', 'en', '(/ˈjæ.ə/) Expressing joy, celebration, glee, etc. | Example: Yeah! We did it!', 1, 0, '2026-02-03', '2026-02-04', 52, NULL, 0, 0),
-(777, 5, 'head', 'en', '(/hɛd/) The part of the body of an animal or human which contains the brain, mouth and main sense organs. | Example: Be careful when you pet that dog on the head; it may bite.', 1, 0, '2026-02-03', '2026-02-03 14:08:15', 1, NULL, 0, 0),
-(778, 5, 'ahead', 'en', '(/əˈhɛd/) In or to the front; in advance; onward. | Example: Just ahead you can see the cliffs.', 1, 0, '2026-02-03', '2026-02-03 14:08:18', 1, NULL, 0, 0),
-(779, 5, 'talking', 'en', '(/tɑkɪŋ/) The action of the verb talk.', 1, 0, '2026-02-03', '2026-02-03 14:08:16', 2, NULL, 0, 0),
-(780, 5, 'about', 'en', '', 0, 0, '2026-02-03', '2026-02-04', 7, NULL, 0, 0),
-(781, 5, 'murió', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:08:15', 1, NULL, 0, 0),
-(782, 5, 'andersen', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:08:15', 1, NULL, 0, 0),
-(783, 5, 'morán', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:08:14', 1, NULL, 0, 0),
-(784, 5, 'फिर', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:08:15', 1, NULL, 0, 0),
-(785, 5, 'काफ', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:08:15', 1, NULL, 0, 0),
-(786, 5, 'दबाव', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:08:15', 1, NULL, 0, 0),
-(787, 5, 'here', 'en', '(/hiːɹ/) (abstract) This place; this location. | Example: An Alzheimer patient''s here may in his mind be anywhere he called home in the time he presently re-lives. | Synonyms: right here', 1, 0, '2026-02-03', '2026-02-04', 5, NULL, 0, 0),
-(788, 5, 'दिय', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:08:19', 1, NULL, 0, 0),
-(789, 5, 'quiñones', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:08:20', 1, NULL, 0, 0),
-(790, 5, 'them', 'en', '(plural) Those ones.', 1, 0, '2026-02-03', '2026-02-04', 8, NULL, 0, 0),
-(791, 5, 'hurt', 'en', '(/hɜːt/) An emotional or psychological humiliation or bad experience. | Example: how to overcome old hurts of the past', 1, 0, '2026-02-03', '2026-02-03 14:08:23', 1, NULL, 0, 0),
-(792, 5, 'barco', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:08:26', 1, NULL, 0, 0),
-(793, 5, 'taste', 'en', '(/teɪst/) One of the sensations produced by the tongue in response to certain chemicals; the quality of giving this sensation. | Example: He had a strange taste in his mouth.', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(794, 5, 'eleven', 'en', 'A cricket team of eleven players. Hence first eleven - the team of best cricket players (at a school), second eleven - the "B" team, etc. | Example: A: SUM1 Hl3p ME im alwyz L0ziN!!?!', 1, 0, '2026-02-03', '2026-02-03 14:08:37', 1, NULL, 0, 0),
-(795, 5, 'feel', 'en', '(/fiːl/) A quality of an object experienced by touch. | Example: Bark has a rough feel.', 1, 0, '2026-02-03', '2026-02-03 14:08:38', 1, NULL, 0, 0),
-(796, 5, 'angry', 'en', '(/ˈæŋ.ɡɹi/) Displaying or feeling anger. | Example: An angry mob started looting the warehouse.', 1, 0, '2026-02-03', '2026-02-03 14:08:38', 1, NULL, 0, 0),
-(797, 5, 'más', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(798, 5, 'करन', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(799, 5, 'होग', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 8, NULL, 0, 0),
-(800, 5, 'need', 'en', '(/niːd/) A requirement for something; something needed. | Example: I''ve always tried to have few needs beyond food, clothing and shelter.', 1, 0, '2026-02-03', '2026-02-04', 8, NULL, 0, 0),
-(801, 5, 'bañera', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:08:41', 1, NULL, 0, 0),
-(802, 5, 'बेईमान', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:08:43', 1, NULL, 0, 0),
-(803, 5, 'wasn', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(804, 5, 'world', 'en', '(/wɝld/) (with "the") Human collective existence; existence in general. | Example: There will always be lovers, till the world’s end.', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(805, 5, 'four', 'en', '(/foː/) The digit or figure 4; an occurrence thereof. | Example: Do you have any more fours? I want to make this a little taller.', 1, 0, '2026-02-03', '2026-02-03 14:08:50', 1, NULL, 0, 0),
-(806, 5, 'hundred', 'en', '(/ˈhʌndɚd/) A hundred-dollar bill, or any other note denominated 100 (e.g. a hundred euros). | Example: He made a hundred in the historic match.', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(807, 5, 'never', 'en', '(/ˈnɛv.ə(ɹ)/) At no time; on no occasion; in no circumstance. | Example: I finally finished, and I never want to do that again.', 1, 0, '2026-02-03', '2026-02-04', 6, NULL, 0, 0),
-(808, 5, 'actually', 'en', '(/-ɪ/) (modal) In act or in fact; really; in truth; positively. | Example: Actually, I had nothing to do with that incident.', 1, 0, '2026-02-03', '2026-02-04', 10, NULL, 0, 0),
-(809, 5, 'been', 'en', '(/biːn/) A flying insect, of the clade Anthophila within the hymenopteran superfamily Apoidea, known for its organised societies (though only a minority have them), for collecting pollen and (in some species) producing wax and honey.', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(810, 5, 'close', 'en', '(/kləʊz/) An end or conclusion. | Example: We owe them our thanks for bringing the project to a successful close.', 1, 0, '2026-02-03', '2026-02-03 14:08:58', 1, NULL, 0, 0),
-(811, 5, 'together', 'en', '(/təˈɡɛð.ə(ɹ)/) Coherent; well organized. | Example: He''s really together.', 1, 0, '2026-02-03', '2026-02-03 14:08:59', 1, NULL, 0, 0),
-(812, 5, 'made', 'en', '(/meɪd/) A grub or maggot.', 1, 0, '2026-02-03', '2026-02-03 14:09:01', 1, NULL, 0, 0),
-(813, 5, 'वंद', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:09:03', 1, NULL, 0, 0),
-(814, 5, 'मातरम', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:09:04', 1, NULL, 0, 0),
-(815, 5, 'popular', 'en', '(/ˈpɒpjʊlə/) A person who is popular, especially at a school.', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(816, 5, 'noise', 'en', '(/nɔɪz/) Various sounds, usually unwanted or unpleasant. | Example: He knew that it was trash day, when the garbage collectors made all the noise.', 1, 0, '2026-02-03', '2026-02-03 14:09:05', 1, NULL, 0, 0),
-(817, 5, 'रोहित', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(818, 5, 'money', 'en', '(/ˈmʌni/) A legally or socially binding conceptual contract of entitlement to wealth, void of intrinsic value, payable for all debts and taxes, and regulated in supply. | Example: Before colonial times cowry shells imported from Mauritius were used as money in Western Africa.', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(819, 5, 'recently', 'en', '(/ˈɹiːsəntli/) In the recent past | Example: a recently published book | Synonyms: freshly, lately, newly', 1, 0, '2026-02-03', '2026-02-03 14:09:11', 1, NULL, 0, 0),
-(820, 5, 'didn', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-04', 7, NULL, 0, 0),
-(821, 5, 'इसम', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(822, 5, 'mean', 'en', '(/miːn/) To lament. | Example: Does she really mean what she said to him last night?', 1, 0, '2026-02-03', '2026-02-04', 6, NULL, 0, 0),
-(823, 5, 'who', 'en', '', 0, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(824, 5, 'wouldn', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(825, 5, 'missing', 'en', '(/ˈmɪsɪŋ/) To fail to hit. | Example: I missed the target. | Synonyms: lost, absent', 1, 0, '2026-02-03', '2026-02-03 14:09:17', 1, NULL, 0, 0),
-(826, 5, 'from', 'en', '(/fɹɒm/) Used to indicate source or provenance. | Example: I got a letter from my brother.', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(827, 5, 'retain', 'en', '(/ɹɪˈteɪn/) To keep in possession or use.', 1, 0, '2026-02-03', '2026-02-03 14:09:19', 1, NULL, 0, 0),
-(828, 5, 'noche', 'es', 'Sustantivo. Tiempo en que falta la luz del sol. Ejemplo: Buenas noches.', 1, 0, '2026-02-03', '2026-02-03 14:09:16', 1, NULL, 0, 0),
-(829, 5, 'género', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:09:16', 1, NULL, 0, 0),
-(830, 5, 'हुआ', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(831, 5, 'आजकल', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(832, 5, 'dare', 'en', '(/dɛə(ɹ)/) A challenge to prove courage. | Example: I wouldn''t dare argue with my boss.', 1, 0, '2026-02-03', '2026-02-03 14:09:28', 1, NULL, 0, 0),
-(833, 5, 'better', 'en', '([ˈbeɾə]) An entity, usually animate, deemed superior to another; one who has a claim to precedence; a superior. | Example: He quickly found Ali his better in the ring.', 1, 0, '2026-02-03', '2026-02-03 14:09:26', 1, NULL, 0, 0),
-(834, 5, 'mine', 'en', '(/maɪn/) My; belonging to me; that which belongs to me.', 1, 0, '2026-02-03', '2026-02-03 14:09:26', 1, NULL, 0, 0),
-(835, 5, 'let', 'en', '(/lɛt/) The allowing of possession of a property etc. in exchange for rent. | Example: After he knocked for hours, I decided to let him come in.', 1, 0, '2026-02-03', '2026-02-04', 7, NULL, 0, 0),
-(836, 5, 'qué', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(837, 5, 'okay', 'en', '(/ˌəˈkæɪ/) Endorsement; approval. | Example: We can start as soon as we get the OK. | Synonyms: now, k, okeh, okey, m''kay', 1, 0, '2026-02-03', '2026-02-04', 13, NULL, 0, 0),
-(838, 5, 'people', 'en', '(/ˈpiːpəl/) Used as plural of person; a body of human beings considered generally or collectively; a group of two or more persons. | Example: There were so many people at the restaurant last night. | Synonyms: groupies, folks, kin, leod, collective', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(839, 5, 'रात', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:09:38', 1, NULL, 0, 0),
-(840, 5, 'तीव्र', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:09:39', 1, NULL, 0, 0),
-(841, 5, 'boy', 'en', '(/bɔːə/) A young male. | Example: Kate is dating a boy named Jim.', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(842, 5, 'आजमगढ', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:09:59', 1, NULL, 0, 0),
-(843, 5, 'libertad', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:09:59', 1, NULL, 0, 0),
-(844, 5, 'linda', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 14:10:25', 1, NULL, 0, 0),
-(845, 5, 'lovelace', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 14:10:25', 1, NULL, 0, 0),
-(846, 5, 'sort', 'en', 'A general type.', 1, 0, '2026-02-03', '2026-02-03 14:10:29', 1, NULL, 0, 0),
-(847, 5, 'thing', 'en', '(/θɪŋ/) That which is considered to exist as a separate entity, object, quality or concept. | Example: Bacon pie? Is that a thing?', 1, 0, '2026-02-03', '2026-02-04', 5, NULL, 0, 0),
-(848, 5, 'like', 'en', '(/laɪk/) (usually in the plural) Something that a person likes (prefers). | Example: Tell me your likes and dislikes. | Synonyms: enjoy, favorite, fancy, preference, love', 1, 0, '2026-02-03', '2026-02-04', 21, NULL, 0, 0),
-(849, 5, 'निर्भर', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:10:32', 1, NULL, 0, 0),
-(850, 5, 'main', 'en', 'Short for mainline. | Example: He mains the same character as me in that game. | Synonyms: largest', 1, 0, '2026-02-03', '2026-02-03 14:10:38', 1, NULL, 0, 0),
-(851, 5, 'story', 'en', '(/ˈstɔː.ɹi/) A sequence of real or fictional events; or, an account of such a sequence. | Example: The book tells the story of two roommates.', 1, 0, '2026-02-03', '2026-02-03 14:10:37', 1, NULL, 0, 0),
-(852, 5, 'बावन', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(853, 5, 'unless', 'en', '(/ənˈlɛs/) Except on a specified condition; if not. | Example: I’m leaving unless I get a pay rise (AmE: raise).', 1, 0, '2026-02-03', '2026-02-03 14:10:43', 1, NULL, 0, 0),
-(854, 5, 'pulling', 'en', '(/ˈpʊlɪŋ/) To apply a force to (an object) so that it comes toward the person or thing applying the force. | Example: When I give the signal, pull the rope.', 1, 0, '2026-02-03', '2026-02-03 14:10:42', 1, NULL, 0, 0),
-(855, 5, 'planet', 'en', '(/ˈplænət/) Each of the seven major bodies which move relative to the fixed stars in the night sky—the Moon, Mercury, Venus, the Sun, Mars, Jupiter and Saturn.', 1, 0, '2026-02-03', '2026-02-03 14:10:47', 1, NULL, 0, 0),
-(856, 5, 'हिन', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:10:45', 1, NULL, 0, 0),
-(857, 5, 'पायनियर', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:10:45', 1, NULL, 0, 0),
-(858, 5, 'प्लैनेट', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:10:46', 1, NULL, 0, 0),
-(859, 5, 'cedillo', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(860, 5, 'land', 'en', '(/lænd/) The part of Earth which is not covered by oceans or other bodies of water. | Example: Most insects live on land.', 1, 0, '2026-02-03', '2026-02-03 14:10:52', 1, NULL, 0, 0),
-(861, 5, 'future', 'en', '(/ˈfjuːt͡ʃə/) The time ahead; those moments yet to be experienced. | Example: There is no future in dwelling on the past.', 1, 0, '2026-02-03', '2026-02-03 14:10:55', 1, NULL, 0, 0),
-(862, 5, 'lower', 'en', '(/ˈləʊə/) Situated close to, or even below, the ground or another normal reference plane; not high or lofty. | Example: a low wall  a low shelf', 1, 0, '2026-02-03', '2026-02-03 14:10:55', 1, NULL, 0, 0),
-(863, 5, 'nineties', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 14:10:56', 1, NULL, 0, 0),
-(864, 5, 'farming', 'en', '(/ˈfɑːmɪŋ/) To work on a farm, especially in the growing and harvesting of crops. | Example: to farm the taxes', 1, 0, '2026-02-03', '2026-02-03 14:10:54', 1, NULL, 0, 0),
-(865, 5, 'dólares', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:10:53', 1, NULL, 0, 0),
-(866, 5, 'familia', 'es', 'Sustantivo. Grupo de personas emparentadas. Ejemplo: Mi familia es grande.', 1, 0, '2026-02-03', '2026-02-03 14:10:52', 1, NULL, 0, 0),
-(867, 5, 'अभिनेत', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:10:54', 1, NULL, 0, 0),
-(868, 5, 'अमित', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:10:53', 1, NULL, 0, 0),
-(869, 5, 'habita', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:10:54', 1, NULL, 0, 0),
-(870, 5, 'ended', 'en', '(/ˈɛndɪd/) To come to an end | Example: Is this movie never going to end?', 1, 0, '2026-02-03', '2026-02-03 14:10:58', 1, NULL, 0, 0),
-(871, 5, 'much', 'en', '(/mʌt͡ʃ/) Large, great. | Example: He is much fatter than I remember him.', 1, 0, '2026-02-03', '2026-02-04', 5, NULL, 0, 0),
-(872, 5, 'damage', 'en', '(/ˈdæmɪdʒ/) Injury or harm; the condition or measure of something not being intact. | Example: The storm did a lot of damage to the area.', 1, 0, '2026-02-03', '2026-02-03 14:10:58', 1, NULL, 0, 0),
-(873, 5, 'इंडिय', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:10:57', 1, NULL, 0, 0),
-(874, 5, 'इंडियन', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:10:57', 1, NULL, 0, 0),
-(875, 5, 'injuries', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 14:11:00', 1, NULL, 0, 0),
-(876, 5, 'उन्होंन', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:10:58', 1, NULL, 0, 0),
-(877, 5, 'इंश्योरेंस', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:10:59', 1, NULL, 0, 0),
-(878, 5, 'centro', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:11:02', 1, NULL, 0, 0),
-(879, 5, 'cádiz', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:11:01', 1, NULL, 0, 0),
-(880, 5, 'children', 'en', '([ˈt͡ʃʊld̠ɹ̠ ̝ʷən]) A person who has not yet reached adulthood, whether natural (puberty), cultural (initiation), or legal (majority) | Example: Go easy on him: he is but a child.', 1, 0, '2026-02-03', '2026-02-03 14:11:06', 1, NULL, 0, 0),
-(881, 5, 'acting', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(882, 5, 'deposited', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(883, 5, 'hay', 'es', NULL, 0, 0, '2026-02-03', '2026-02-03', 4, NULL, 0, 0),
-(884, 5, 'nice', 'en', NULL, 0, 0, '2026-02-03', '2026-02-04', 5, NULL, 0, 0),
-(885, 5, 'group', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(886, 5, 'not', 'en', NULL, 0, 0, '2026-02-03', '2026-02-04', 14, NULL, 0, 0),
-(887, 5, 'रूप', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(888, 5, 'mováis', 'es', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(889, 5, 'rocola', 'es', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(890, 6, 'hello', 'en', '"Hello!" or an equivalent greeting. | Example: Hello, everyone.', 1, 0, '2026-02-03', '2026-02-03 14:14:45', 1, NULL, 0, 0),
-(891, 6, 'world', 'en', '(/wɝld/) (with "the") Human collective existence; existence in general. | Example: There will always be lovers, till the world’s end.', 1, 0, '2026-02-03', '2026-02-03 14:14:45', 1, NULL, 0, 0),
-(892, 6, 'testing', 'en', '(/ˈtɛstɪŋ/) To challenge. | Example: Climbing the mountain tested our stamina.', 1, 0, '2026-02-03', '2026-02-03 14:14:44', 1, NULL, 0, 0),
-(893, 6, 'images', 'en', '(/ˈɪmɪd͡ʒɪz/) An optical or other representation of a real object; a graphic; a picture. | Example: The Bible forbids the worship of graven images.', 1, 0, '2026-02-03', '2026-02-03 14:15:02', 1, NULL, 0, 0),
-(894, 6, 'quick', 'en', '(/kwɪk/) Raw or sensitive flesh, especially that underneath finger and toe nails.', 1, 0, '2026-02-03', '2026-02-03 14:15:04', 1, NULL, 0, 0),
-(895, 6, 'country', 'en', '(/ˈkɐntɹi/) (chiefly British) An area of land; a district, region.', 1, 0, '2026-02-03', '2026-02-03 14:15:03', 1, NULL, 0, 0),
-(896, 6, 'oferta', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:15:02', 1, NULL, 0, 0),
-(897, 6, 'este', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:15:08', 1, NULL, 0, 0),
-(898, 6, 'mangueras', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:15:07', 1, NULL, 0, 0),
-(899, 6, 'así', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:15:08', 1, NULL, 0, 0),
-(900, 6, 'that', 'en', '(/ˈðæt/) Something being indicated that is there; one of those. | Example: "The ribbon was that thin." "I disagree, I say it was not that thin, it was thicker... or maybe thinner..." | Synonyms: so', 1, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(901, 6, 'new', 'en', '(/njʉː/) Things that are new. | Example: Out with the old, in with the new. | Synonyms: new', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(902, 6, 'this', 'en', '(/ðəs/) Something being indicated that is here; one of these. | Example: Do we need this many recommendations?', 1, 0, '2026-02-03', '2026-02-03 14:15:11', 1, NULL, 0, 0),
-(903, 6, 'get', 'en', '(/ɡɛt/) Offspring. | Example: I''m going to get a computer tomorrow from the discount store.', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(904, 6, 'hundred', 'en', '(/ˈhʌndɚd/) A hundred-dollar bill, or any other note denominated 100 (e.g. a hundred euros). | Example: He made a hundred in the historic match.', 1, 0, '2026-02-03', '2026-02-03 14:15:10', 1, NULL, 0, 0),
-(905, 6, 'घटन', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:15:09', 1, NULL, 0, 0),
-(906, 6, 'क्षेत्र', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:15:14', 1, NULL, 0, 0),
-(907, 6, 'children', 'en', '([ˈt͡ʃʊld̠ɹ̠ ̝ʷən]) A person who has not yet reached adulthood, whether natural (puberty), cultural (initiation), or legal (majority) | Example: Go easy on him: he is but a child.', 1, 0, '2026-02-03', '2026-02-03 14:15:19', 1, NULL, 0, 0),
-(908, 6, 'choose', 'en', '(/t͡ʃuːz/) To pick; to make the choice of; to select. | Example: I chose a nice ripe apple from the fruit bowl.', 1, 0, '2026-02-03', '2026-02-03 14:15:20', 1, NULL, 0, 0),
-(909, 6, 'bitch', 'en', '(/bɪt͡s/) (dog-breeding) A female dog or other canine, particularly a recent mother. | Example: My bitch just had puppies; they''re so cute!', 1, 0, '2026-02-03', '2026-02-03 14:15:19', 1, NULL, 0, 0),
-(910, 6, 'with', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(911, 6, 'much', 'en', '(/mʌt͡ʃ/) Large, great. | Example: He is much fatter than I remember him.', 1, 0, '2026-02-03', '2026-02-03 14:15:20', 1, NULL, 0, 0),
-(912, 6, 'another', 'en', 'An additional one of the same kind. | Example: There is one sterling and here is another', 1, 0, '2026-02-03', '2026-02-03 14:15:24', 1, NULL, 0, 0),
-(913, 6, 'know', 'en', '(/nəʊ/) Knowledge; the state of knowing. | Example: He knew something terrible was going to happen.', 1, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(914, 6, 'and', 'en', 'In rhythm, the second half of a divided beat.', 1, 0, '2026-02-03', '2026-02-03', 7, NULL, 0, 0),
-(915, 6, 'eleven', 'en', 'A cricket team of eleven players. Hence first eleven - the team of best cricket players (at a school), second eleven - the "B" team, etc. | Example: A: SUM1 Hl3p ME im alwyz L0ziN!!?!', 1, 0, '2026-02-03', '2026-02-03 14:15:26', 1, NULL, 0, 0),
-(916, 6, 'menos', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:15:25', 1, NULL, 0, 0),
-(917, 6, 'habana', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:15:24', 1, NULL, 0, 0),
-(918, 6, 'लगान', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:15:24', 2, NULL, 0, 0),
-(919, 6, 'gareca', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:15:28', 1, NULL, 0, 0),
-(920, 6, 'rana', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:15:29', 1, NULL, 0, 0),
-(921, 6, 'gonna', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 14:15:32', 1, NULL, 0, 0),
-(922, 6, 'around', 'en', '(/əˈɹaʊnd/) (with the verb "to be") Present in the vicinity. | Example: Is Clare around today?', 1, 0, '2026-02-03', '2026-02-03 14:15:31', 1, NULL, 0, 0),
-(923, 6, 'alone', 'en', '(/əˈləʊn/) By oneself, solitary. | Example: I can''t ask for help because I am alone. | Synonyms: on one''s lonesome, by one''s lonesome, singlehandedly, solely, singlehanded', 1, 0, '2026-02-03', '2026-02-03 14:15:32', 1, NULL, 0, 0),
-(924, 6, 'name', 'en', '(/neɪm/) Any nounal word or phrase which indicates a particular person, place, class, or thing. | Example: I''ve never liked the name my parents gave me so I changed it at the age of twenty. | Synonyms: proper name', 1, 0, '2026-02-03', '2026-02-03 14:15:36', 1, NULL, 0, 0),
-(925, 6, 'relationship', 'en', '(/ɹɪˈleɪʃ(ə)nʃɪp/) Connection or association; the condition of being related. | Example: They have been in a relationship for ten years, but have never married.', 1, 0, '2026-02-03', '2026-02-03 14:15:36', 1, NULL, 0, 0),
-(926, 6, 'have', 'en', 'A wealthy or privileged person. | Example: I have a house and a car.', 1, 0, '2026-02-03', '2026-02-03 14:15:47', 1, NULL, 0, 0),
-(927, 6, 'plans', 'en', '(/plænz/) A drawing showing technical details of a building, machine, etc., with unwanted details omitted, and often using symbols rather than detailed drawing to represent doors, valves, etc. | Example: The plans for many important buildings were once publicly available. | Synonyms: floor plan', 1, 0, '2026-02-03', '2026-02-03 14:15:46', 1, NULL, 0, 0),
-(928, 6, 'enseñar', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:15:44', 1, NULL, 0, 0),
-(929, 6, 'प्लांट', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:15:47', 1, NULL, 0, 0),
-(930, 6, 'हनुमानगढ', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:15:53', 1, NULL, 0, 0),
-(931, 6, 'not', 'en', '(/nɒt/) A unary operation on logical values that changes true to false, and false to true. | Example: Did you take out the trash? No, I did not.', 1, 0, '2026-02-03', '2026-02-03 14:15:59', 1, NULL, 0, 0),
-(932, 6, 'identity', 'en', '(/aɪˈdɛntəti/) Sameness, identicalness; the quality or fact of (several specified things) being the same. | Example: I''ve been through so many changes, I have no sense of identity.', 1, 0, '2026-02-03', '2026-02-03 14:15:59', 1, NULL, 0, 0),
-(933, 6, 'bit', 'en', '(/bɪt/) A piece of metal placed in a horse''s mouth and connected to the reins to direct the animal. | Example: A horse hates having a bit put in its mouth.', 1, 0, '2026-02-03', '2026-02-03 14:16:02', 1, NULL, 0, 0),
-(934, 6, 'going', 'en', '(/ˈɡəʊɪŋ/) To move: | Example: The engine just won''t go anymore. | Synonyms: tread, go out (with), fare, draw, move', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(935, 6, 'bien', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:00', 1, NULL, 0, 0),
-(936, 6, 'vera', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:00', 1, NULL, 0, 0),
-(937, 6, 'ईवीएम', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:01', 1, NULL, 0, 0),
-(938, 6, 'open', 'en', 'Not closed | Example: an open hand; an open flower', 1, 0, '2026-02-03', '2026-02-03 14:16:04', 1, NULL, 0, 0),
-(939, 6, 'digo', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:06', 1, NULL, 0, 0),
-(940, 6, 'que', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(941, 6, 'okay', 'en', '(/ˌəˈkæɪ/) Endorsement; approval. | Example: We can start as soon as we get the OK. | Synonyms: okey, k, now, all right, okey-dokey', 1, 0, '2026-02-03', '2026-02-03 14:16:10', 1, NULL, 0, 0),
-(942, 6, 'two', 'en', '(/tuː/) The digit/figure 2. | Example: The number 2202 contains three twos.', 1, 0, '2026-02-03', '2026-02-03 14:16:13', 1, NULL, 0, 0),
-(943, 6, 'million', 'en', '(/ˈmɪljən/) (long and short scales) The cardinal number 1,000,000: 106; a thousand thousand. | Example: I can think of millions of reasons not to go.', 1, 0, '2026-02-03', '2026-02-03 14:16:13', 1, NULL, 0, 0),
-(944, 6, 'उनस', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:11', 1, NULL, 0, 0),
-(945, 6, 'पहल', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:11', 1, NULL, 0, 0),
-(946, 6, 'right', 'en', 'Straight, not bent. | Example: a right line', 1, 0, '2026-02-03', '2026-02-03 14:16:28', 1, NULL, 0, 0),
-(947, 6, 'never', 'en', '(/ˈnɛv.ə(ɹ)/) At no time; on no occasion; in no circumstance. | Example: I finally finished, and I never want to do that again.', 1, 0, '2026-02-03', '2026-02-03 14:16:29', 1, NULL, 0, 0),
-(948, 6, 'don', 'en', '(/dɒn/) A university professor, particularly one at Oxford or Cambridge.', 1, 0, '2026-02-03', '2026-02-03 14:16:33', 1, NULL, 0, 0),
-(949, 6, 'juro', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:34', 1, NULL, 0, 0),
-(950, 6, 'guy', 'en', '(/ɡaɪ/) An effigy of a man burned on a bonfire on the anniversary of the Gunpowder Plot (5th November). | Example: The dog''s left foreleg was broken, poor little guy.', 1, 0, '2026-02-03', '2026-02-03 14:16:37', 1, NULL, 0, 0),
-(951, 6, 'who', 'en', '(/huː/) A person under discussion; a question of which person. | Example: I don''t know who it is. (indirect question)', 1, 0, '2026-02-03', '2026-02-03 14:16:37', 1, NULL, 0, 0),
-(952, 6, 'looks', 'en', '(/lʊks/) One''s appearance or attractiveness. | Example: His charm and good looks accounted for much of his popularity in the polls.', 1, 0, '2026-02-03', '2026-02-03 14:16:37', 1, NULL, 0, 0),
-(953, 6, 'riley', 'en', '(/ˈɹaɪli/) Angry, upset.', 1, 0, '2026-02-03', '2026-02-03 14:16:36', 1, NULL, 0, 0),
-(954, 6, 'they', 'en', '(/ðeɪ/) (the third-person plural) A group of people, animals, plants or objects previously mentioned. | Example: Dogs may bark if they want to be fed.', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(955, 6, 'नुकसान', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:36', 1, NULL, 0, 0),
-(956, 6, 'झाल', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:35', 1, NULL, 0, 0),
-(957, 6, 'taxes', 'en', '(/ˈtæksɪz/) Money paid to the government other than for transaction-specific goods and services. | Example: a heavy tax on time or health | Synonyms: custom, impost, assessment, levy, toll', 1, 0, '2026-02-03', '2026-02-03 14:16:46', 1, NULL, 0, 0),
-(958, 6, 'aló', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:42', 1, NULL, 0, 0),
-(959, 6, 'accept', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:45', 1, NULL, 0, 0),
-(960, 6, 'ocho', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:45', 1, NULL, 0, 0),
-(961, 6, 'muy', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:45', 1, NULL, 0, 0),
-(962, 6, 'instale', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:46', 1, NULL, 0, 0),
-(963, 6, 'google', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:45', 1, NULL, 0, 0),
-(964, 6, 'accept', 'en', '(/ækˈsɛpt/) To receive, especially with a consent, with favour, or with approval. | Example: The Boy Scouts were going to accept him as a member.', 1, 0, '2026-02-03', '2026-02-03 14:16:48', 1, NULL, 0, 0),
-(965, 6, 'road', 'en', '(/ɹəʊd/) A way used for travelling between places, originally one wide enough to allow foot passengers and horses to travel, now (US) usually one surfaced with asphalt or concrete and designed to accommodate many vehicles travelling in both directions. In the UK both senses are heard: a country road is the same as a country lane. | Example: We travelled to the seaside by road.', 1, 0, '2026-02-03', '2026-02-03 14:16:48', 1, NULL, 0, 0),
-(966, 6, 'actually', 'en', '(/-ɪ/) (modal) In act or in fact; really; in truth; positively. | Example: Actually, I had nothing to do with that incident.', 1, 0, '2026-02-03', '2026-02-03 14:16:48', 1, NULL, 0, 0),
-(967, 6, 'pretty', 'en', '(/ˈpɹɪti/) A pretty person; a term of address to a pretty person. | Example: We''ll stop at the knife store and look at the sharp pretties.', 1, 0, '2026-02-03', '2026-02-03 14:16:48', 1, NULL, 0, 0),
-(968, 6, 'stunning', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 14:16:49', 1, NULL, 0, 0),
-(969, 6, 'google', 'en', '(/ˈɡuːɡəl/) To deliver googlies.', 1, 0, '2026-02-03', '2026-02-03 14:16:48', 1, NULL, 0, 0),
-(970, 6, 'हेल', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:46', 1, NULL, 0, 0),
-(971, 6, 'एक्सप्लोरर', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:46', 1, NULL, 0, 0),
-(972, 6, 'हिंदुस्तान', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:47', 1, NULL, 0, 0),
-(973, 6, 'गूगल', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:46', 1, NULL, 0, 0),
-(974, 6, 'डिप्रेशन', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:58', 1, NULL, 0, 0),
-(975, 6, 'फैसल', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:56', 1, NULL, 0, 0),
-(976, 6, 'बेहतर', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:56', 1, NULL, 0, 0),
-(977, 6, 'प्रत्येक', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:16:56', 1, NULL, 0, 0),
-(978, 6, 'banda', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:56', 1, NULL, 0, 0),
-(979, 6, 'presencia', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:58', 1, NULL, 0, 0),
-(980, 6, 'verter', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:59', 1, NULL, 0, 0),
-(981, 6, 'partido', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:59', 1, NULL, 0, 0),
-(982, 6, 'gobernante', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:16:58', 1, NULL, 0, 0),
-(983, 6, 'move', 'en', '(/muːv/) The act of moving; a movement. | Example: A slight move of the tiller, and the boat will go off course. | Synonyms: play, get moving, affect, trouble, stir', 1, 0, '2026-02-03', '2026-02-03 14:17:02', 1, NULL, 0, 0),
-(984, 6, 'military', 'en', '(/ˈmɪl.ɪ.tɹi/) Armed forces. | Example: He spent six years in the military.', 1, 0, '2026-02-03', '2026-02-03 14:17:01', 1, NULL, 0, 0),
-(985, 6, 'depression', 'en', '(/dɪˈpɹɛʃən/) In psychotherapy and psychiatry, a state of mind producing serious, long-term lowering of enjoyment of life or inability to visualize a happy future. | Example: I used to suffer from depression, but now I''m mostly content with my life.', 1, 0, '2026-02-03', '2026-02-03 14:17:00', 1, NULL, 0, 0),
-(986, 6, 'faced', 'en', '(/feɪst/) (of a person or animal) To position oneself or itself so as to have one''s face closest to (something). | Example: Face the sun.', 1, 0, '2026-02-03', '2026-02-03 14:17:02', 1, NULL, 0, 0),
-(987, 6, 'but', 'en', 'An instance or example of using the word "but". | Example: It has to be done – no ifs or buts.', 1, 0, '2026-02-03', '2026-02-03 14:17:01', 1, NULL, 0, 0),
-(988, 6, 'their', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 14:17:00', 1, NULL, 0, 0),
-(989, 6, 'lives', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 14:17:01', 1, NULL, 0, 0),
-(990, 6, 'andar', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:17:03', 1, NULL, 0, 0),
-(991, 6, 'venden', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:17:04', 1, NULL, 0, 0),
-(992, 6, 'english', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:17:03', 1, NULL, 0, 0),
-(993, 6, 'अंदर', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:17:07', 1, NULL, 0, 0),
-(994, 6, 'विदित', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:17:06', 1, NULL, 0, 0),
-(995, 6, 'बिछिय', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:17:04', 1, NULL, 0, 0),
-(996, 6, 'then', 'en', '(/ðen/) Used in comparisons, to introduce the basis of comparison. | Example: she''s taller than I am;  she found his advice more witty than helpful;  we have less work today than we had yesterday;  We had no choice than to return home', 1, 0, '2026-02-03', '2026-02-03 14:17:08', 1, NULL, 0, 0),
-(997, 6, 'game', 'en', '(/ɡeɪm/) A playful or competitive activity. | Example: He''s in the securities game somehow.', 1, 0, '2026-02-03', '2026-02-03 14:17:08', 2, NULL, 0, 0),
-(998, 6, 'put', 'en', '(/pʊt/) A right to sell something at a predetermined price. | Example: He bought a January ''08 put for Procter and Gamble at 80 to hedge his bet.', 1, 0, '2026-02-03', '2026-02-03 14:17:12', 1, NULL, 0, 0),
-(999, 6, 'piece', 'en', '(/piːs/) A part of a larger whole, usually in such a form that it is able to be separated from other parts. | Example: I’d like another piece of pie.', 1, 0, '2026-02-03', '2026-02-03 14:17:08', 1, NULL, 0, 0),
-(1000, 6, 'make', 'en', '(/meɪk/) Brand or kind; model. | Example: What make of car do you drive? | Synonyms: render', 1, 0, '2026-02-03', '2026-02-03 14:17:08', 1, NULL, 0, 0),
-(1001, 6, 'big', 'en', '(/bɪɡ/) Someone or something that is large in stature | Synonyms: paramount, well liked, heavy, weighty, plus-size', 1, 0, '2026-02-03', '2026-02-03 14:17:07', 1, NULL, 0, 0),
-(1002, 6, 'lawyer', 'en', '(/ˈlɔɪ.ə(ɹ)/) A professional person qualified (as by a law degree or bar exam) and authorized to practice law, i.e. represent parties in lawsuits or trials and give legal advice. | Example: A lawyer''s time and advice are his stock in trade. - aphorism often credited to Abraham Lincoln, but without attestation', 1, 0, '2026-02-03', '2026-02-03 14:17:07', 1, NULL, 0, 0),
-(1003, 6, 'your', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 14:17:09', 1, NULL, 0, 0),
-(1004, 6, 'body', 'en', '(/ˈbɒdi/) Physical frame. | Example: a nonpareil face on an agate body', 1, 0, '2026-02-03', '2026-02-03 14:17:10', 1, NULL, 0, 0),
-(1005, 6, 'veintiséis', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:17:10', 1, NULL, 0, 0),
-(1006, 6, 'dolor', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:17:10', 1, NULL, 0, 0),
-(1007, 6, 'menor', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:17:07', 1, NULL, 0, 0),
-(1008, 6, 'nivel', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:17:10', 1, NULL, 0, 0),
-(1009, 6, 'primario', 'es', 'Definición pendiente...', 1, 0, '2026-02-03', '2026-02-03 14:17:07', 1, NULL, 0, 0),
-(1010, 6, 'mugabe', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 14:17:16', 1, NULL, 0, 0),
-(1011, 6, 'lot', 'en', '(/lɒt/) A large quantity or number; a great deal. | Example: lots of people think so | Synonyms: destiny, parcel, load, allotment, set', 1, 0, '2026-02-03', '2026-02-03 14:17:18', 1, NULL, 0, 0),
-(1012, 6, 'vida', 'es', 'Sustantivo. Existencia. Ejemplo: La vida es bella.', 1, 0, '2026-02-03', '2026-02-03 14:17:16', 1, NULL, 0, 0),
-(1013, 6, 'later', 'en', '(/ˈleɪtə/) Near the end of a period of time. | Example: It was late in the evening when we finally arrived.', 1, 0, '2026-02-03', '2026-02-03 14:17:20', 1, NULL, 0, 0),
-(1014, 6, 'been', 'en', '(/biːn/) A flying insect, of the clade Anthophila within the hymenopteran superfamily Apoidea, known for its organised societies (though only a minority have them), for collecting pollen and (in some species) producing wax and honey.', 1, 0, '2026-02-03', '2026-02-03 14:17:27', 1, NULL, 0, 0),
-(1015, 6, 'even', 'en', '(/ˈiːvən/) (diminutive) An even number. | Example: So let''s see. There are two evens here and three odds.', 1, 0, '2026-02-03', '2026-02-03 14:17:26', 1, NULL, 0, 0),
-(1016, 6, 'today', 'en', '(/təˈdeɪ/) A current day or date. | Example: Today is the day we''ll fix this once and for all. | Synonyms: current day, this day', 1, 0, '2026-02-03', '2026-02-03 14:17:27', 1, NULL, 0, 0),
-(1017, 6, 'उन्होंन', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 14:17:27', 1, NULL, 0, 0),
-(1018, 6, 'year', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1019, 7, 'hello', 'en', 'Hello is a common greeting used to initiate a conversation, acknowledge someone''s presence, or express surprise. | Example: Hello, it''s good to see you again! | Synonyms: Hi, Greetings, Hey', 1, 0, '2026-02-03', '2026-02-03 14:21:10', 1, NULL, 0, 0),
-(1020, 7, 'world', 'en', 'The Earth, its inhabitants, and all things upon it, or a particular part or aspect of human existence. | Example: She dreamed of traveling to every corner of the world. | Synonyms: Earth, globe, universe', 1, 0, '2026-02-03', '2026-02-03 14:21:10', 1, NULL, 0, 0),
-(1021, 7, 'testing', 'en', 'Testing is the systematic process of evaluating a product, system, or hypothesis to determine its quality, performance, or reliability under specified conditions. | Example: The rigorous testing of the new vaccine ensured its safety and efficacy before public distribution. | Synonyms: evaluation, examination, assessment', 1, 0, '2026-02-03', '2026-02-03 14:21:11', 1, NULL, 0, 0),
-(1022, 7, 'yes', 'en', 'Yes is an affirmation or an expression of agreement, consent, or positive response. | Example: Yes, I would love to join you for dinner. | Synonyms: agreed, affirmative, indeed', 1, 0, '2026-02-03', '2026-02-03 14:21:11', 1, NULL, 0, 0),
-(1023, 7, 'उनक', 'hi', 'यह एक हिंदी शब्द है जो किसी तीसरे व्यक्ति या व्यक्तियों के समूह के स्वामित्व या संबंध को दर्शाता है, जिसका अर्थ ''उनका'' (their) या ''उनका'' (his/her, आदरपूर्वक) होता है। | Example: यह उनका घर है। (This is their house / This is his/her house - respectful.) | Synonyms: उसका, इनका', 1, 0, '2026-02-03', '2026-02-03 14:21:20', 1, NULL, 0, 0),
-(1024, 7, 'पुलिस', 'hi', 'पुलिस एक सरकारी संगठन है जो कानून और व्यवस्था बनाए रखने, अपराधों को रोकने और उनका पता लगाने, तथा नागरिकों की सुरक्षा सुनिश्चित करने के लिए जिम्मेदार है। | Example: पुलिस ने तुरंत घटनास्थल पर पहुँचकर स्थिति को नियंत्रित किया। | Synonyms: आरक्षी, रक्षक', 1, 0, '2026-02-03', '2026-02-03 14:21:18', 1, NULL, 0, 0),
-(1025, 7, 'oye', 'es', 'Oye is an informal Spanish interjection used to get someone''s attention or to express mild surprise, translating to ''hey,'' ''listen,'' or ''hear me.'' | Example: ¡Oye, necesito tu ayuda con esto! | Synonyms: ¡Eh!, ¡Escucha!, ¡Mira!', 1, 0, '2026-02-03', '2026-02-03 14:21:16', 1, NULL, 0, 0),
-(1026, 7, 'yeah', 'en', 'An informal way of saying "yes" or expressing agreement, affirmation, or acknowledgment. | Example: Yeah, I think that''s a great idea! | Synonyms: yes, agreed, uh-huh', 1, 0, '2026-02-03', '2026-02-03 14:21:17', 1, NULL, 0, 0),
-(1027, 7, 'how', 'en', 'How is an adverb used to inquire about the manner, means, extent, or condition of something. | Example: How did you manage to finish the project so quickly? | Synonyms: in what way, by what means, to what extent', 1, 0, '2026-02-03', '2026-02-03 14:21:17', 1, NULL, 0, 0),
-(1028, 7, 'could', 'en', 'Could is the past tense of ''can,'' used to express past ability, possibility, or to make a polite request. | Example: When I was younger, I could stay up all night without getting tired. | Synonyms: might, able to', 1, 0, '2026-02-03', '2026-02-03 14:21:18', 1, NULL, 0, 0),
-(1029, 7, 'have', 'en', 'To possess, own, or hold something, or to experience a particular state, quality, or action. | Example: I have a meeting scheduled for tomorrow morning. | Synonyms: possess, own, hold', 1, 0, '2026-02-03', '2026-02-03 14:21:17', 1, NULL, 0, 0),
-(1030, 7, 'good', 'en', 'Having the required qualities, of a high standard, or morally right. | Example: He did a good job on the project. | Synonyms: excellent, fine, satisfactory', 1, 0, '2026-02-03', '2026-02-03 14:21:17', 1, NULL, 0, 0),
-(1031, 7, 'has', 'en', 'Has is the third-person singular present tense form of the verb ''to have,'' indicating possession, an attribute, or an experience. | Example: She has a new car. | Synonyms: possesses, owns, includes', 1, 0, '2026-02-03', '2026-02-03 14:21:16', 1, NULL, 0, 0),
-(1032, 7, 'खैर', 'hi', 'The Hindi word ''खैर'' refers to well-being, welfare, or safety, and is also commonly used as an interjection meaning ''anyway'' or ''nevertheless''. | Example: खैर, अब हम आगे बढ़ते हैं। (Anyway, let''s move on now.) | Synonyms: भलाई, कुशल, फिर भी', 1, 0, '2026-02-03', '2026-02-03 14:21:22', 1, NULL, 0, 0),
-(1033, 7, 'way', 'en', 'A method, manner, or path for doing something or going somewhere. | Example: Could you show me the way to the nearest train station? | Synonyms: method, manner, path', 1, 0, '2026-02-03', '2026-02-03 14:21:20', 1, NULL, 0, 0),
-(1034, 7, 'going', 'en', 'The present participle of ''go,'' indicating the act of moving, traveling, or progressing from one place or state to another. | Example: We are going to the beach this weekend for a vacation. | Synonyms: traveling, moving, proceeding', 1, 0, '2026-02-03', '2026-02-03 14:21:21', 1, NULL, 0, 0),
-(1035, 7, 'televised', 'en', 'To be televised means to be broadcast or transmitted via television. | Example: The championship game was televised live to millions of fans worldwide. | Synonyms: broadcast, aired, transmitted', 1, 0, '2026-02-03', '2026-02-03 14:21:20', 1, NULL, 0, 0),
-(1036, 7, 'बिल्कुल', 'hi', 'The Hindi word ''बिल्कुल'' means completely, absolutely, entirely, or exactly. | Example: यह बिल्कुल सही है। (This is absolutely correct.) | Synonyms: पूर्णतः, पूरी तरह से, एकदम', 1, 0, '2026-02-03', '2026-02-03 14:21:25', 1, NULL, 0, 0),
-(1037, 7, 'सलाम', 'hi', 'सलाम एक अभिवादन या सम्मान प्रकट करने का शब्द या संकेत है। | Example: उसने कमरे में दाखिल होते ही सबको सलाम किया। | Synonyms: अभिवादन, नमस्कार, आदाब', 1, 0, '2026-02-03', '2026-02-03 14:21:26', 1, NULL, 0, 0),
-(1038, 7, 'don', 'en', 'To put on an item of clothing or an accessory. | Example: Before stepping out into the chilly morning, she decided to don her heavy winter coat. | Synonyms: put on, wear, dress in', 1, 0, '2026-02-03', '2026-02-03 14:21:27', 1, NULL, 0, 0),
-(1039, 7, 'really', 'en', 'Used to emphasize a statement or question, or to mean in truth or actually. | Example: I really enjoyed the concert last night. | Synonyms: truly, actually, genuinely', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1040, 7, 'business', 'en', 'Business refers to the activity of making, buying, or selling goods or services in exchange for money, or an organization that does this. | Example: She decided to start her own business selling handmade jewelry online. | Synonyms: enterprise, company, commerce', 1, 0, '2026-02-03', '2026-02-03 14:21:25', 1, NULL, 0, 0),
-(1041, 7, 'lot', 'en', 'A lot is a specific parcel of land. | Example: They plan to build a new house on that empty lot. | Synonyms: plot, parcel, tract', 1, 0, '2026-02-03', '2026-02-03 14:21:29', 1, NULL, 0, 0),
-(1042, 7, 'eating', 'en', 'Eating is the act of consuming food by taking it into the mouth, chewing, and swallowing it. | Example: Eating fresh vegetables daily contributes to a healthy lifestyle. | Synonyms: consuming, ingesting, devouring', 1, 0, '2026-02-03', '2026-02-03 14:21:25', 1, NULL, 0, 0),
-(1043, 7, 'these', 'en', 'Referring to people, animals, or things that are close to the speaker or have just been mentioned. | Example: These books on the table are mine. | Synonyms: these ones, the ones here', 1, 0, '2026-02-03', '2026-02-03 14:21:25', 1, NULL, 0, 0),
-(1044, 7, 'living', 'en', 'Currently possessing life; not dead or inanimate. | Example: The scientist studied the unique adaptations of living creatures in extreme environments. | Synonyms: alive, animate, breathing', 1, 0, '2026-02-03', '2026-02-03 14:21:28', 1, NULL, 0, 0),
-(1045, 7, 'didn', 'en', 'The word "didn" is not a standard English word; it is most likely a typo for "didn''t," which is a contraction of "did not," used to express the past negative form of a verb. | Example: She didn''t realize how much time had passed. | Synonyms: did not, failed to', 1, 0, '2026-02-03', '2026-02-03 14:21:37', 1, NULL, 0, 0),
-(1046, 7, 'love', 'en', 'A profound and intense feeling of affection, care, and strong liking for another person or thing. | Example: Their love for each other grew stronger with each passing year. | Synonyms: affection, adoration, fondness', 1, 0, '2026-02-03', '2026-02-03 14:21:30', 1, NULL, 0, 0),
-(1047, 7, 'liability', 'en', 'A state of being responsible for something, especially by law, or a debt or obligation. | Example: The company''s financial statements showed significant liabilities, including loans and outstanding payments. | Synonyms: debt, obligation, burden', 1, 0, '2026-02-03', '2026-02-03 14:21:31', 1, NULL, 0, 0),
-(1048, 7, 'लाल', 'hi', 'लाल एक रंग है जो रक्त या आग के रंग जैसा होता है। | Example: यह एक लाल सेब है। | Synonyms: सुर्ख, रक्तवर्ण, लोहित', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1049, 7, 'haré', 'es', 'Haré is the first-person singular future tense conjugation of the Spanish verb "hacer," meaning "I will do" or "I will make." | Example: Mañana haré la cena para toda la familia. | Synonyms: realizaré, ejecutaré', 1, 0, '2026-02-03', '2026-02-03 14:21:31', 1, NULL, 0, 0),
-(1050, 7, 'nube', 'es', 'Una masa visible de vapor de agua condensado que flota en la atmósfera, generalmente a gran altura sobre el suelo. | Example: Las nubes se movían lentamente por el cielo azul. | Synonyms: nubarrón, niebla, celaje', 1, 0, '2026-02-03', '2026-02-03 14:21:31', 1, NULL, 0, 0),
-(1051, 7, 'que', 'es', 'Que is a highly versatile Spanish word primarily used as a relative pronoun or conjunction, meaning "that," "which," or "who," connecting clauses or introducing subordinate clauses. | Example: La película que vimos anoche fue excelente. | Synonyms: El cual, Quien', 1, 0, '2026-02-03', '2026-02-03 14:21:35', 1, NULL, 0, 0),
-(1052, 7, 'más', 'es', 'Más is a Spanish adverb that primarily means "more" or "most," used to indicate a greater quantity, degree, or comparison. | Example: Necesito más tiempo para terminar el proyecto. | Synonyms: además, extra', 1, 0, '2026-02-03', '2026-02-03 14:21:36', 1, NULL, 0, 0),
-(1053, 7, 'god', 'en', 'A supernatural being, often conceived as immortal, sacred, and having divine powers, worshipped as the creator and ruler of the universe or a specific domain. | Example: Many ancient cultures worshipped a pantheon of gods and goddesses. | Synonyms: deity, divine being, supreme being', 1, 0, '2026-02-03', '2026-02-03 14:21:35', 1, NULL, 0, 0),
-(1054, 7, 'asked', 'en', 'To put a question to someone, or to request something from them. | Example: The student asked the teacher for clarification on the assignment. | Synonyms: inquired, questioned, requested', 1, 0, '2026-02-03', '2026-02-03 14:21:36', 1, NULL, 0, 0),
-(1055, 7, 'and', 'en', 'And is a conjunction used to connect two or more words, phrases, or clauses, indicating addition, a sequence, or a consequence. | Example: He went to the store and bought some milk. | Synonyms: plus, as well as', 1, 0, '2026-02-03', '2026-02-03 14:21:38', 1, NULL, 0, 0),
-(1056, 7, 'most', 'en', 'Referring to the greatest quantity, amount, or degree of something. | Example: Most students passed the exam with flying colors. | Synonyms: majority, greatest, nearly all', 1, 0, '2026-02-03', '2026-02-03 14:21:39', 1, NULL, 0, 0),
-(1057, 7, 'likely', 'en', 'Likely describes something that is probable or expected to happen, be true, or be the case. | Example: It is likely to rain later this afternoon, so you should bring an umbrella. | Synonyms: probable, expected, possible', 1, 0, '2026-02-03', '2026-02-03 14:21:40', 1, NULL, 0, 0),
-(1058, 7, 'pretty', 'en', 'Pleasing or attractive in a delicate or charming way, often implying a moderate degree of beauty. | Example: She wore a pretty dress to the party. | Synonyms: attractive, lovely, charming', 1, 0, '2026-02-03', '2026-02-03 14:21:39', 1, NULL, 0, 0),
-(1059, 7, 'माट', 'hi', 'माट एक बड़ा मिट्टी का बर्तन है जिसका उपयोग पानी या अनाज रखने के लिए किया जाता है। | Example: गर्मी में माट का पानी बहुत ठंडा रहता है। (In summer, the water from the earthen pot remains very cold.) | Synonyms: घड़ा, मटका, कुंभ', 1, 0, '2026-02-03', '2026-02-03 14:21:40', 1, NULL, 0, 0),
-(1060, 7, 'सुप्रीम', 'hi', 'सुप्रीम का अर्थ है सर्वोच्च या सबसे उच्च पद पर स्थित, जिसके ऊपर कोई नहीं। | Example: भारत का सुप्रीम कोर्ट देश की सर्वोच्च न्यायिक संस्था है। | Synonyms: सर्वोच्च, उच्चतम, सर्वोपरि', 1, 0, '2026-02-03', '2026-02-03 14:21:40', 1, NULL, 0, 0),
-(1061, 7, 'daddy', 'en', 'A familiar, affectionate, or informal term for one''s father. | Example: The child excitedly pointed to her daddy in the crowd. | Synonyms: father, papa, pop', 1, 0, '2026-02-03', '2026-02-03 14:21:39', 1, NULL, 0, 0),
-(1062, 7, 'gotten', 'en', 'Gotten is the past participle of the verb ''get,'' primarily used in American English to indicate having acquired, received, or reached a particular state or place. | Example: He had gotten much better at playing the guitar after months of practice. | Synonyms: acquired, obtained, received', 1, 0, '2026-02-03', '2026-02-03 14:21:39', 1, NULL, 0, 0),
-(1063, 7, 'hooked', 'en', 'Strongly addicted to or captivated by something, often to the point of obsession. | Example: After reading the first chapter, he was completely hooked on the mystery novel. | Synonyms: addicted, captivated, obsessed', 1, 0, '2026-02-03', '2026-02-03 14:21:40', 1, NULL, 0, 0),
-(1064, 7, 'habló', 'es', 'Habló is the third-person singular preterite form of the verb ''hablar,'' meaning ''he, she, or formal ''you'' spoke.'' | Example: Ella habló con su madre por teléfono anoche. | Synonyms: conversó, dijo, platicó', 1, 0, '2026-02-03', '2026-02-03 14:21:41', 1, NULL, 0, 0),
-(1065, 7, 'mal', 'es', 'Mal refers to evil, harm, or a negative condition, often implying something morally wrong or detrimental. | Example: El mal que causó a la comunidad fue inmenso. | Synonyms: daño, perjuicio, infortunio', 1, 0, '2026-02-03', '2026-02-03 14:21:43', 1, NULL, 0, 0),
-(1066, 7, 'supremo', 'es', 'Supremo describes something that is highest in rank, authority, power, or quality, representing the ultimate or most excellent degree. | Example: La Corte Suprema es la máxima autoridad judicial del país. | Synonyms: máximo, superior, principal', 1, 0, '2026-02-03', '2026-02-03 14:21:41', 1, NULL, 0, 0),
-(1067, 7, 'algo', 'es', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1068, 7, 'unless', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1069, 7, 'उत्तर', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1070, 5, 'tend', 'en', 'To be disposed or inclined to act or behave in a particular way, or to care for and look after someone or something. | Example: He tends to get nervous before big presentations. | Synonyms: incline, lean, care for', 1, 0, '2026-02-03', '2026-02-03 14:54:14', 1, NULL, 0, 0),
-(1071, 5, 'agua', 'es', 'Agua is a common, essential liquid that is colorless, odorless, and tasteless, forming the basis of all known life and covering much of the Earth''s surface. | Example: Por favor, sírveme un vaso de agua fría. | Synonyms: líquido, H2O', 1, 0, '2026-02-03', '2026-02-03 14:54:27', 1, NULL, 0, 0),
-(1072, 5, 'even', 'en', 'Having a flat and smooth surface; without bumps or irregularities. | Example: The carpenter ensured the tabletop was perfectly even before applying the varnish. | Synonyms: flat, smooth, level', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1073, 5, 'extremely', 'en', 'Extremely means to a very great degree or extent; exceedingly. | Example: The exam was extremely difficult, requiring hours of study. | Synonyms: very, exceedingly, immensely', 1, 0, '2026-02-03', '2026-02-03 14:54:30', 1, NULL, 0, 0),
-(1074, 5, 'flat', 'en', 'Having a smooth, even surface without significant slopes or depressions. | Example: The artist used a flat brush to apply an even coat of paint. | Synonyms: level, even, smooth', 1, 0, '2026-02-03', '2026-02-03 14:54:30', 1, NULL, 0, 0),
-(1075, 5, 'this', 'en', 'Used to refer to a specific person, thing, idea, or situation that is close at hand, currently present, or has just been mentioned. | Example: This is the book I was telling you about. | Synonyms: this one, the present, the aforementioned', 1, 0, '2026-02-03', '2026-02-04', 27, NULL, 0, 0),
-(1076, 5, 'isn', 'en', 'Isn is not a recognized standalone English word, but is frequently a typographical error for "isn''t," the contraction of "is not." | Example: The query for ''isn'' often indicates a misspelling of ''isn''t'' in common English usage. | Synonyms: misspelling, typographical error', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1077, 5, 'लिय', 'hi', 'लिय (लिया) शब्द ''लेना'' क्रिया का भूतकालिक कृदंत रूप है, जिसका अर्थ है ''लिया गया'' या ''प्राप्त किया गया'' (The word ''liya'' is the masculine singular past participle form of the verb ''lena'' (to take), signifying that something has been taken or received). | Example: मैंने यह किताब ले लिया। (I took this book.) | Synonyms: प्राप्त किया, ग्रहण किया, उठा लिया', 1, 0, '2026-02-03', '2026-02-03 14:54:42', 1, NULL, 0, 0),
-(1078, 5, 'dio', 'es', 'Dio is the past tense third-person singular conjugation of the Spanish verb "dar," meaning "he/she/it gave" or "you (formal singular) gave." | Example: Ella le dio un libro a su amigo. | Synonyms: entregó, ofreció, concedió', 1, 0, '2026-02-03', '2026-02-03 14:54:45', 1, NULL, 0, 0),
-(1079, 5, 'golpe', 'es', 'A sudden forceful hit or blow, often with a hand or an object, or a sudden, often violent, political takeover. | Example: El boxeador le dio un golpe certero a su oponente. | Synonyms: porrazo, impacto, choque', 1, 0, '2026-02-03', '2026-02-03 14:54:47', 1, NULL, 0, 0),
-(1080, 5, 'clear', 'es', 'The Spanish word "claro" refers to something that is easy to see, understand, or perceive without obstruction or ambiguity. | Example: La explicación del profesor fue muy clara y todos la entendieron. | Synonyms: transparente, evidente, nítido', 1, 0, '2026-02-03', '2026-02-03 14:54:46', 1, NULL, 0, 0),
-(1081, 5, 'barcelona', 'es', 'Barcelona is a major city in Spain, the capital of Catalonia, renowned for its unique architecture, vibrant culture, and Mediterranean coastline. | Example: Cada año, millones de turistas visitan Barcelona para admirar la Sagrada Familia y pasear por Las Ramblas. | Synonyms: Ciudad Condal, Barna', 1, 0, '2026-02-03', '2026-02-03 14:54:48', 1, NULL, 0, 0),
-(1082, 5, 'donaire', 'es', 'Donaire refers to the grace, elegance, and charm in a person''s movement, manner, or speech. | Example: La bailarina ejecutó los pasos con gran donaire y fluidez. | Synonyms: gracia, elegancia, garbo', 1, 0, '2026-02-03', '2026-02-03 14:54:46', 1, NULL, 0, 0),
-(1083, 5, 'अंतिम', 'hi', 'किसी क्रम या प्रक्रिया का सबसे आखिरी या समाप्त होने वाला भाग। | Example: यह इस किताब का अंतिम अध्याय है। | Synonyms: आखिरी, समाप्त, चरम', 1, 0, '2026-02-03', '2026-02-03 14:54:48', 1, NULL, 0, 0),
-(1084, 5, 'वॉन्ट', 'hi', 'किसी चीज़ की इच्छा या ज़रूरत होना। | Example: मुझे एक नई कार वॉन्ट है। | Synonyms: चाहना, इच्छा करना, ज़रूरत होना', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1085, 5, 'एयर', 'hi', 'एयर का अर्थ है वह अदृश्य गैसीय मिश्रण जो पृथ्वी के वायुमंडल का निर्माण करता है और जिसमें हम साँस लेते हैं। | Example: हमें साँस लेने के लिए स्वच्छ एयर की आवश्यकता होती है। | Synonyms: वायु, हवा, पवन', 1, 0, '2026-02-03', '2026-02-03 14:54:45', 1, NULL, 0, 0),
-(1086, 5, 'मार्शल', 'hi', 'मार्शल एक उच्च पदस्थ सैन्य या पुलिस अधिकारी होता है जो व्यवस्था बनाए रखने या किसी विशेष कार्य का संचालन करने का कार्य करता है। | Example: परेड का नेतृत्व एक अनुभवी मार्शल ने किया। | Synonyms: सेनापति, अधिकारी, नायक', 1, 0, '2026-02-03', '2026-02-03 14:54:47', 1, NULL, 0, 0),
-(1087, 5, 'होन', 'hi', 'होन उस घटना या स्थिति को संदर्भित करता है जो निश्चित रूप से घटित होने वाली हो, अर्थात् भाग्य या नियति। | Example: होन को कोई टाल नहीं सकता, जो होना है वह होकर रहेगा। | Synonyms: भाग्य, नियति, तकदीर', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1088, 5, 'देन', 'hi', 'देन का अर्थ है किसी के द्वारा दिया गया कुछ, जैसे योगदान, उपहार, या किसी का ऋण। | Example: यह इमारत हमारे पूर्वजों की देन है। | Synonyms: योगदान, उपहार, विरासत', 1, 0, '2026-02-03', '2026-02-03 14:54:48', 1, NULL, 0, 0),
-(1089, 5, 'these', 'en', 'These is a word used to refer to multiple specific items or people that are near the speaker or have just been mentioned. | Example: These are the books I need for my class tomorrow. | Synonyms: such, the current ones, the aforementioned', 1, 0, '2026-02-03', '2026-02-03 14:54:53', 1, NULL, 0, 0),
-(1090, 5, 'come', 'en', 'To move or travel toward a speaker or a specified place or point. | Example: Please come to the meeting on time. | Synonyms: arrive, approach, advance', 1, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(1091, 5, 'won', 'en', 'Won is the past tense and past participle of the verb ''win,'' meaning to achieve victory or success in a contest, game, or struggle. | Example: Our team won the national championship last year. | Synonyms: triumphed, prevailed, succeeded', 1, 0, '2026-02-03', '2026-02-03 14:54:46', 1, NULL, 0, 0),
-(1092, 5, 'clear', 'en', 'To be free from ambiguity, obstruction, or doubt, making it easy to see, hear, or understand. | Example: The sky was perfectly clear, offering an unobstructed view of the stars. | Synonyms: obvious, apparent, distinct', 1, 0, '2026-02-03', '2026-02-03 14:54:46', 1, NULL, 0, 0),
-(1093, 5, 'batasuna', 'en', '', 0, 0, '2026-02-03', '2026-02-03 14:54:44', 1, NULL, 0, 0),
-(1094, 5, 'putting', 'en', 'The act of placing something in a particular position or state, or the action of moving something to a specific location. | Example: The careful putting of each piece into the puzzle ensured its completion. | Synonyms: placing, positioning, setting', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1095, 5, 'पड़ेग', 'hi', 'पड़ेगा'' भविष्य में किसी कार्य की अनिवार्यता या आवश्यकता को दर्शाता है, जिसका अर्थ ''करना होगा'' या ''होगा'' होता है। | Example: मुझे कल दिल्ली जाना पड़ेगा। (I will have to go to Delhi tomorrow.) | Synonyms: करना होगा, आवश्यक होगा, होगा', 1, 0, '2026-02-03', '2026-02-03 14:54:50', 1, NULL, 0, 0),
-(1096, 5, 'already', 'en', 'Already indicates that an action or event has occurred before a particular time, or sooner than expected. | Example: When I called, she had already left for work. | Synonyms: previously, before, by now', 1, 0, '2026-02-03', '2026-02-04', 5, NULL, 0, 0),
-(1097, 5, 'read', 'en', 'To look at and comprehend the meaning of written or printed matter by interpreting its characters or symbols. | Example: She loves to read a good novel before bed. | Synonyms: peruse, scan, decipher', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1098, 5, 'बनाई', 'hi', 'बनाई क्रिया ''बनाना'' का भूतकाल, स्त्रीलिंग रूप है, जिसका अर्थ है ''बनाया गया'' या ''रचित किया गया''। | Example: मेरी माँ ने मेरे लिए स्वादिष्ट मिठाई बनाई। | Synonyms: निर्मित की, तैयार की, रची', 1, 0, '2026-02-03', '2026-02-03 14:55:01', 1, NULL, 0, 0),
-(1099, 5, 'हुई', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 14:54:56', 1, NULL, 0, 0),
-(1100, 5, 'why', 'en', 'Why is an interrogative adverb used to ask for the reason, cause, or purpose of something. | Example: Why did you decide to learn a new language? | Synonyms: for what reason, how come', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(1101, 5, 'could', 'en', 'Could is a modal verb used to express past ability, possibility, permission, or to make a polite request or suggestion. | Example: She could play the piano beautifully when she was younger. | Synonyms: might, would, was able to', 1, 0, '2026-02-03', '2026-02-03', 4, NULL, 0, 0),
-(1102, 5, 'hot', 'en', 'Having a high temperature or a sensation of great warmth. | Example: Be careful, the stove is still hot from cooking dinner. | Synonyms: burning, scorching, fiery', 1, 0, '2026-02-03', '2026-02-03 14:55:02', 1, NULL, 0, 0),
-(1103, 5, 'enough', 'en', 'As much or as many as required or desired. | Example: Do we have enough food for everyone coming to the party? | Synonyms: sufficient, adequate, ample', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(1104, 5, 'mark', 'en', 'To make a visible impression, sign, or trace on a surface, or to indicate or designate something. | Example: Please mark your answers clearly on the test paper. | Synonyms: indicate, label, designate', 1, 0, '2026-02-03', '2026-02-03 14:55:03', 1, NULL, 0, 0),
-(1105, 5, 'discount', 'en', 'A deduction from the usual cost of something, typically given for prompt payment or to a special group. | Example: The department store offered a 15% discount on all winter coats. | Synonyms: reduction, markdown, rebate', 1, 0, '2026-02-03', '2026-02-03 14:55:07', 1, NULL, 0, 0),
-(1106, 5, 'hurry', 'en', 'To move or act with great speed, or to cause someone or something to do so. | Example: We need to hurry if we want to catch the last bus. | Synonyms: rush, hasten, speed', 1, 0, '2026-02-03', '2026-02-03 14:55:06', 1, NULL, 0, 0),
-(1107, 5, 'área', 'es', 'Una extensión de espacio o superficie, a menudo con límites definidos o características particulares. | Example: El área de juegos para niños está en el centro del parque. | Synonyms: zona, región, superficie', 1, 0, '2026-02-03', '2026-02-03 14:55:06', 1, NULL, 0, 0),
-(1108, 5, 'राम', 'hi', 'राम (Rām) is a revered deity in Hinduism, considered the seventh avatar of Vishnu and the central figure of the epic Ramayana, symbolizing righteousness, virtue, and ideal kingship. | Example: भगवान राम अयोध्या के राजा थे। (Bhagwan Ram Ayodhya ke raja the.) | Synonyms: रघुनाथ (Raghunath), दशरथनंदन (Dasharathanandan), सीतापति (Sitapati)', 1, 0, '2026-02-03', '2026-02-03 14:55:07', 1, NULL, 0, 0),
-(1109, 5, 'men', 'en', 'Adult human males, typically referring to individuals of the male sex who have reached maturity. | Example: The men in the village worked together to build the new community center. | Synonyms: males, gentlemen, guys', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1110, 5, 'मेर', 'hi', 'मेर किसी वस्तु का केंद्रीय या सर्वोच्च भाग होता है, विशेषकर पौराणिक मेरु पर्वत। | Example: प्राचीन ग्रंथों में मेरु पर्वत को देवताओं का निवास स्थान बताया गया है। | Synonyms: पर्वत, शिखर, चोटी', 1, 0, '2026-02-03', '2026-02-03', 7, NULL, 0, 0),
-(1111, 5, 'नाम', 'hi', 'किसी व्यक्ति, वस्तु, स्थान या विचार को पहचानने के लिए प्रयुक्त शब्द। | Example: आपका नाम क्या है? | Synonyms: संज्ञा, अभिधान, पहचान', 1, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(1112, 5, 'सोहिन', 'hi', 'सोहिन का अर्थ है सुंदर, आकर्षक या शोभायमान, जो किसी व्यक्ति या वस्तु की सुंदरता को बढ़ाता है। | Example: यह पोशाक उस पर बहुत सोहिन लग रही है। | Synonyms: सुंदर, आकर्षक, शोभायमान', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1113, 5, 'nada', 'es', 'Nada is a Spanish word meaning ''nothing'' or ''not anything''. | Example: No hay nada en la nevera. | Synonyms: ninguna cosa, cero', 1, 0, '2026-02-03', '2026-02-03 14:55:15', 1, NULL, 0, 0),
-(1114, 5, 'sony', 'es', 'Sony es una empresa multinacional japonesa conocida por fabricar productos electrónicos y de entretenimiento. | Example: Compré un nuevo televisor Sony con tecnología 4K. | Synonyms: marca, compañía, fabricante', 1, 0, '2026-02-03', '2026-02-03 14:55:15', 1, NULL, 0, 0),
-(1115, 5, 'alex', 'en', 'Alex is a common given name, frequently used as a diminutive form of Alexander or Alexandra. | Example: Alex decided to go for a run in the park this morning. | Synonyms: Alexander, Alexandra, Alexis', 1, 0, '2026-02-03', '2026-02-03 14:55:29', 1, NULL, 0, 0),
-(1116, 5, 'उनक', 'hi', 'उनक is a Hindi word meaning ''their'', ''his'', or ''her'' (formal/plural), indicating possession or relation of a third person or group of people. | Example: उनका घर बहुत सुंदर है। (Their house is very beautiful.) | Synonyms: उनका, उनकी, उनके', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1117, 5, 'ocupan', 'es', 'Ocupan is the third-person plural present indicative form of the verb ''ocupar,'' meaning ''they occupy,'' ''they take up space,'' or ''they fill.'' | Example: Los estudiantes ocupan los asientos delanteros en la clase. | Synonyms: llenan, toman, habitan', 1, 0, '2026-02-03', '2026-02-03 14:55:38', 1, NULL, 0, 0),
-(1118, 5, 'तुकोगंज', 'hi', 'तुकोगंज भारत के मध्य प्रदेश राज्य के इंदौर शहर में स्थित एक प्रसिद्ध क्षेत्र या इलाका है। | Example: तुकोगंज अपने ऐतिहासिक महत्व और व्यावसायिक गतिविधियों के लिए जाना जाता है। | Synonyms: क्षेत्र, इलाका, मोहल्ला', 1, 0, '2026-02-03', '2026-02-03 14:55:37', 1, NULL, 0, 0),
-(1119, 5, 'met', 'en', 'Met is the past tense and past participle of the verb ''to meet'', signifying the act of encountering, coming into contact with, or fulfilling something in the past. | Example: We met for the first time at the conference last year. | Synonyms: encountered, convened, gathered', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1120, 5, 'his', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(1121, 5, 'honey', 'en', 'A sweet, sticky, yellowish-brown fluid produced by bees from the nectar of flowers, stored by them as food. | Example: She stirred a spoonful of honey into her tea. | Synonyms: nectar, sweetener', 1, 0, '2026-02-03', '2026-02-03 14:55:57', 1, NULL, 0, 0),
-(1122, 5, 'metodologías', 'es', 'Metodologías refers to the plural of ''metodología'', meaning the systems of methods and principles used in a particular field of study or activity. | Example: Las nuevas metodologías de investigación permiten analizar grandes volúmenes de datos con mayor precisión. | Synonyms: métodos, técnicas, enfoques', 1, 0, '2026-02-03', '2026-02-03 14:56:02', 1, NULL, 0, 0),
-(1123, 5, 'adiós', 'es', 'Adiós is a Spanish interjection used to express farewell or goodbye. | Example: Ella dijo adiós antes de irse de viaje. | Synonyms: Hasta luego, Chao, Hasta la vista', 1, 0, '2026-02-03', '2026-02-03 14:56:02', 1, NULL, 0, 0),
-(1124, 5, 'hermione', 'en', 'A person, typically a young woman, characterized by exceptional intelligence, studiousness, and a logical, often rule-abiding, disposition. | Example: With her nose always in a book and her quick answers, she was often called a Hermione by her classmates. | Synonyms: intellectual, scholar, bookworm', 1, 0, '2026-02-03', '2026-02-03 14:56:12', 1, NULL, 0, 0),
-(1125, 5, 'स्थानीय', 'hi', 'किसी विशेष स्थान या क्षेत्र से संबंधित। | Example: हमें स्थानीय उत्पादों का समर्थन करना चाहिए। | Synonyms: क्षेत्रीय, प्रादेशिक', 1, 0, '2026-02-03', '2026-02-03 14:56:06', 1, NULL, 0, 0),
-(1126, 5, 'either', 'en', 'Used to present a choice between two or more options, or to indicate that a negative statement also applies to something else. | Example: You can either come with us or stay home. | Synonyms: one or the other, any one', 1, 0, '2026-02-03', '2026-02-03 14:56:21', 1, NULL, 0, 0),
-(1127, 5, 'para', 'es', 'Para is a Spanish preposition primarily used to indicate purpose, destination, recipient, deadline, comparison, or opinion. | Example: Necesito dinero para comprar comida. | Synonyms: a, hacia', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1128, 5, 'बराबर', 'hi', 'The Hindi word "बराबर" means equal in measure, quantity, or status, or level and even, and can also denote something happening continuously or constantly. | Example: दोनों भाइयों को संपत्ति का बराबर हिस्सा मिला। (Both brothers received an equal share of the property.) | Synonyms: समान (samaan), एक जैसा (ek jaisa), लगातार (lagatar)', 1, 0, '2026-02-03', '2026-02-03 14:56:25', 1, NULL, 0, 0),
-(1129, 5, 'escaramuza', 'es', 'Una escaramuza es un enfrentamiento breve y de poca importancia entre pequeños grupos de combatientes o contendientes. | Example: La patrulla de reconocimiento tuvo una escaramuza con las fuerzas enemigas en la frontera. | Synonyms: refriega, enfrentamiento, choque', 1, 0, '2026-02-03', '2026-02-03 14:56:26', 1, NULL, 0, 0),
-(1130, 5, 'entró', 'es', 'Entró is the third-person singular preterite (past tense) form of the verb ''entrar,'' meaning ''he/she/it entered'' or ''he/she/it came in.'' | Example: Ella entró en la habitación sin hacer ruido. | Synonyms: accedió, ingresó', 1, 0, '2026-02-03', '2026-02-03 14:56:26', 1, NULL, 0, 0),
-(1131, 5, 'just', 'en', 'Just means precisely, exactly, or only, often indicating something happened very recently. | Example: I just saw him leave a moment ago. | Synonyms: exactly, merely, recently', 1, 0, '2026-02-03', '2026-02-04', 9, NULL, 0, 0),
-(1132, 5, 'got', 'en', 'Got is the past tense and past participle of the verb ''get,'' often indicating acquisition, reception, understanding, or a state of being. | Example: She got a new job last week. | Synonyms: obtained, received, understood', 1, 0, '2026-02-03', '2026-02-03', 4, NULL, 0, 0),
-(1133, 5, 'कारण', 'hi', 'कारण का अर्थ है किसी घटना, परिणाम या स्थिति को जन्म देने वाली वजह या हेतु। | Example: इस समस्या का मुख्य कारण जानकारी की कमी है। | Synonyms: वजह, हेतु, मूल', 1, 0, '2026-02-03', '2026-02-03 14:56:28', 1, NULL, 0, 0),
-(1134, 5, 'क्राइम', 'hi', 'क्राइम का अर्थ है कोई ऐसा कार्य जो कानून के विरुद्ध हो और जिसके लिए दंड का प्रावधान हो। | Example: पुलिस ने शहर में बढ़ते क्राइम को रोकने के लिए सख्त कदम उठाए हैं। | Synonyms: अपराध, जुर्म, गुनाह', 1, 0, '2026-02-03', '2026-02-03 14:56:28', 1, NULL, 0, 0),
-(1135, 5, 'फ्र', 'hi', 'The Hindi character combination ''फ्र'' (fra) represents a conjunct consonant formed by ''फ'' (pha) and ''र'' (ra), and is not a standalone word with an independent meaning. | Example: It is commonly found at the beginning of loanwords like ''फ़्रांस'' (France) and ''फ़्रिज'' (fridge).', 1, 0, '2026-02-03', '2026-02-03 14:56:35', 1, NULL, 0, 0),
-(1136, 5, 'हेल्पलाइन', 'hi', 'हेल्पलाइन एक ऐसी टेलीफोन सेवा है जो लोगों को किसी विशेष समस्या या जानकारी के लिए सहायता प्रदान करती है। | Example: यदि आपको कोई आपातकालीन सहायता चाहिए, तो आप हेल्पलाइन नंबर पर संपर्क कर सकते हैं। | Synonyms: सहायता सेवा, मदद केंद्र', 1, 0, '2026-02-03', '2026-02-03 14:56:29', 1, NULL, 0, 0),
-(1137, 5, 'aunque', 'es', 'Aunque is a Spanish conjunction used to introduce a concession, a contrast, or a condition that does not prevent an action or situation. | Example: Aunque estaba cansado, terminó todo su trabajo. | Synonyms: a pesar de que, si bien, aun cuando', 1, 0, '2026-02-03', '2026-02-03 14:56:33', 1, NULL, 0, 0),
-(1138, 5, 'gracias', 'es', 'Gracias is a Spanish interjection used to express gratitude or thankfulness. | Example: Gracias por tu ayuda. | Synonyms: Muchas gracias, Mil gracias', 1, 0, '2026-02-03', '2026-02-03 14:56:35', 1, NULL, 0, 0),
-(1139, 5, 'माहित', 'hi', 'माहित का अर्थ है किसी जानकारी या तथ्य से अवगत होना या ज्ञात होना। | Example: क्या आपको यह बात माहित है? (Are you aware of this matter?) | Synonyms: ज्ञात, विदित, अवगत', 1, 0, '2026-02-03', '2026-02-03 14:56:34', 1, NULL, 0, 0),
-(1140, 5, 'दिल', 'hi', 'दिल शरीर का वह अंग है जो रक्त पंप करता है, और यह भावनाओं तथा संवेदनाओं का केंद्र भी माना जाता है। | Example: मेरा दिल बहुत खुश है। | Synonyms: हृदय, मन, कलेजा', 1, 0, '2026-02-03', '2026-02-03 14:56:35', 1, NULL, 0, 0),
-(1141, 5, 'इराक', 'hi', 'इराक पश्चिमी एशिया में स्थित एक देश है जिसकी राजधानी बगदाद है। | Example: इराक में मेसोपोटामिया की प्राचीन सभ्यता विकसित हुई थी।', 1, 0, '2026-02-03', '2026-02-03 14:56:41', 1, NULL, 0, 0),
-(1142, 5, 'विराट', 'hi', 'विराट का अर्थ है बहुत बड़ा, विशाल, या अत्यंत विस्तृत। | Example: हिमालय की विराट चोटियाँ दूर से ही दिखाई देती हैं। | Synonyms: विशाल, बहुत बड़ा, भीमकाय', 1, 0, '2026-02-03', '2026-02-03 14:56:40', 1, NULL, 0, 0),
-(1143, 5, 'legal', 'en', 'Permitted by law or relating to the law. | Example: It is legal to drive a car once you have obtained a valid license. | Synonyms: lawful, legitimate, permissible', 1, 0, '2026-02-03', '2026-02-03 14:56:40', 1, NULL, 0, 0),
-(1144, 5, 'sit', 'en', 'To rest one''s body on a surface, typically with the upper body upright and the weight supported by the buttocks. | Example: Please sit down and make yourself comfortable. | Synonyms: perch, rest, be seated', 1, 0, '2026-02-03', '2026-02-03 14:56:41', 1, NULL, 0, 0),
-(1145, 5, 'out', 'en', 'Away from the inside or center; moving or situated away from a particular place or position. | Example: Please take the trash out to the curb. | Synonyms: outside, away, forth', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1146, 5, 'might', 'en', 'Might is a modal verb used to express possibility, a less certain probability, or as the past tense of "may." | Example: It might rain later this afternoon, so take an umbrella. | Synonyms: may, could', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1147, 5, 'irá', 'es', 'Irá is the third-person singular future indicative form of the Spanish verb "ir" (to go), meaning "he/she/it will go" or "you (formal) will go." | Example: Él irá a la escuela mañana. | Synonyms: se dirigirá, acudirá', 1, 0, '2026-02-03', '2026-02-03 14:56:43', 1, NULL, 0, 0),
-(1148, 5, 'libro', 'es', 'Un libro es una obra escrita o impresa que consiste en un conjunto de hojas de papel, pergamino u otro material, unidas por un lado y protegidas por una cubierta. | Example: Me gusta leer un buen libro antes de dormir. | Synonyms: volumen, tomo, obra', 1, 0, '2026-02-03', '2026-02-03 14:56:41', 1, NULL, 0, 0),
-(1149, 5, 'andros', 'es', 'Andros es una raíz de origen griego que significa ''hombre'' o ''masculino'', utilizada en la formación de palabras en español, especialmente en términos científicos y técnicos. | Example: La palabra ''andrógeno'' se forma a partir de la raíz griega ''andros'', que se refiere a características masculinas. | Synonyms: hombre, masculino, varón', 1, 0, '2026-02-03', '2026-02-03 14:56:44', 1, NULL, 0, 0),
-(1150, 5, 'senador', 'es', 'Un senador es un miembro de un senado, que es la cámara alta en muchos sistemas legislativos bicamerales. | Example: El senador votó a favor de la nueva ley de educación. | Synonyms: legislador, parlamentario, congresista', 1, 0, '2026-02-03', '2026-02-03 14:56:43', 1, NULL, 0, 0),
-(1151, 5, 'email', 'es', 'Un email es un mensaje electrónico enviado a través de internet o el sistema utilizado para enviar y recibir dichos mensajes. | Example: Te envié un email con los detalles de la reunión. | Synonyms: correo electrónico, e-mail, mensaje', 1, 0, '2026-02-03', '2026-02-03 14:56:42', 1, NULL, 0, 0),
-(1152, 5, 'admeto', 'es', 'Admeto es un nombre propio masculino de origen griego, célebre en la mitología como el rey de Feras, esposo de Alcestis, cuya historia se centra en el sacrificio de su esposa para salvarlo de la muerte. | Example: La tragedia griega ''Alcestis'' de Eurípides narra la historia de Admeto y el sacrificio de su esposa. | Synonyms: rey, personaje mitológico', 1, 0, '2026-02-03', '2026-02-03 14:56:49', 1, NULL, 0, 0),
-(1153, 5, 'पायलट', 'hi', 'पायलट वह व्यक्ति होता है जो विमान, हेलीकॉप्टर या किसी अन्य हवाई जहाज को उड़ाता है और नियंत्रित करता है। | Example: पायलट ने कुशलता से विमान को रनवे पर उतारा। | Synonyms: विमान चालक, हवाई जहाज़ चालक', 1, 0, '2026-02-03', '2026-02-03 14:56:42', 1, NULL, 0, 0),
-(1154, 5, 'तोड', 'hi', 'तोड (tod) refers to a solution, remedy, antidote, or a match/counterpart for something. | Example: इस समस्या का कोई तोड नहीं है। (There is no solution for this problem.) | Synonyms: समाधान (samaadhan), उपाय (upaay), काट (kaat)', 1, 0, '2026-02-03', '2026-02-03 14:56:47', 1, NULL, 0, 0),
-(1155, 5, 'logic', 'en', 'Logic is the systematic study of valid reasoning and the principles used to distinguish sound arguments from unsound ones. | Example: The scientist applied sound logic to interpret the experimental results. | Synonyms: reasoning, rationale, sense', 1, 0, '2026-02-03', '2026-02-03 14:56:42', 1, NULL, 0, 0),
-(1156, 5, 'अपन', 'hi', 'अपन is a colloquial or regional Hindi word used as a reflexive pronoun or possessive adjective, meaning ''one''s own'' or ''self''. | Example: अपन काम खुद करो। (Do your own work yourself.) | Synonyms: अपना, स्वयं, खुद', 1, 0, '2026-02-03', '2026-02-03 14:56:45', 1, NULL, 0, 0),
-(1157, 5, 'sus', 'es', 'Sus" is a Spanish possessive adjective used to indicate that something belongs to a third person (he, she, it, they) or a formal second person (you, singular or plural), translating to "his," "her," "its," "their," or "your" (formal). | Example: Los estudiantes trajeron sus libros a clase. | Synonyms: su, propio/a/os/as', 1, 0, '2026-02-03', '2026-02-03 14:57:00', 1, NULL, 0, 0),
-(1158, 5, 'versos', 'es', 'Versos refers to lines of poetry or song, typically characterized by rhythm, meter, or rhyme. | Example: Los versos de su nueva canción conmovieron a la audiencia. | Synonyms: poemas, estrofas, líneas', 1, 0, '2026-02-03', '2026-02-03 14:56:45', 1, NULL, 0, 0),
-(1159, 5, 'stop', 'en', 'To cease movement, activity, or progress, either temporarily or permanently. | Example: The train will stop at the next station to pick up passengers. | Synonyms: cease, halt, discontinue', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1160, 5, 'nine', 'en', 'The cardinal number that is one more than eight and one less than ten, represented by the numeral 9. | Example: The team won by a score of nine to three. | Synonyms: IX, ennead', 1, 0, '2026-02-03', '2026-02-03 14:56:53', 1, NULL, 0, 0),
-(1161, 5, 'axilares', 'es', 'Axilares refers to something related to or located in the armpit area. | Example: Las glándulas axilares son responsables de la transpiración en esa zona. | Synonyms: subaxilares, de la axila', 1, 0, '2026-02-03', '2026-02-03 14:57:02', 1, NULL, 0, 0),
-(1162, 5, 'ganar', 'es', 'To win, earn, or gain something, often through effort, competition, or work. | Example: El equipo espera ganar el partido de fútbol. | Synonyms: vencer, obtener', 1, 0, '2026-02-03', '2026-02-03 14:57:00', 1, NULL, 0, 0),
-(1163, 5, 'china', 'es', 'A small, smooth stone or pebble, often found in natural environments like beaches or riverbeds. | Example: Los niños recogían chinas de colores en la orilla del río. | Synonyms: guijarro, piedra pequeña, canto rodado', 1, 0, '2026-02-03', '2026-02-03 14:57:02', 1, NULL, 0, 0),
-(1164, 5, 'fanatical', 'en', 'Characterized by extreme and uncritical enthusiasm or zeal, often to an excessive or unreasonable degree, especially in religious or political matters. | Example: His fanatical support for the obscure political party alienated many of his friends. | Synonyms: zealous, obsessive, fervent', 1, 0, '2026-02-03', '2026-02-03 14:56:59', 1, NULL, 0, 0),
-(1165, 5, 'nicotine', 'en', 'Nicotine is a highly addictive, toxic alkaloid found in tobacco plants, responsible for the stimulating and habit-forming effects of tobacco products. | Example: The patch helps smokers gradually reduce their dependence on nicotine. | Synonyms: tobacco alkaloid, cigarette chemical', 1, 0, '2026-02-03', '2026-02-03 14:57:00', 1, NULL, 0, 0),
-(1166, 5, 'खेल', 'hi', 'खेल refers to an activity, often recreational or competitive, engaged in for enjoyment, such as a game, sport, or play. | Example: मेरा पसंदीदा खेल फुटबॉल है। (My favorite sport is football.) | Synonyms: क्रीड़ा, मनोरंजन', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1167, 5, 'other', 'en', 'Referring to a person or thing that is different from one already mentioned or known. | Example: Do you have any other questions for me? | Synonyms: different, alternative, additional', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1168, 5, 'देख', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 14:57:06', 1, NULL, 0, 0),
-(1169, 5, 'today', 'en', 'Today refers to the current day, the present day, or the day that is happening now. | Example: I have a very busy schedule today. | Synonyms: this day, the present', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1170, 5, 'adecuado', 'es', 'Adecuado describes something that is suitable, appropriate, or fitting for a particular purpose, situation, or requirement. | Example: El tamaño de la silla es adecuado para el escritorio. | Synonyms: apropiado, conveniente, idóneo', 1, 0, '2026-02-03', '2026-02-03 14:57:10', 1, NULL, 0, 0),
-(1171, 5, 'पूर्व', 'hi', 'पूर्व का अर्थ है वह दिशा जहाँ से सूर्य उगता है, या किसी घटना या समय से पहले का। | Example: सूर्य पूर्व दिशा से उगता है। | Synonyms: प्राची, भूतपूर्व, पिछला', 1, 0, '2026-02-03', '2026-02-03 14:57:34', 1, NULL, 0, 0),
-(1172, 5, 'rather', 'en', 'To a significant or noticeable extent, or as a preferred alternative. | Example: It''s rather cold outside today, so you should wear a warm coat. | Synonyms: quite, fairly, preferably', 1, 0, '2026-02-03', '2026-02-03 14:57:30', 1, NULL, 0, 0),
-(1173, 5, 'gosh', 'en', 'Gosh is an exclamation used to express surprise, mild shock, or other strong feelings, often as a euphemism for ''God''. | Example: Oh gosh, I completely forgot to pick up the dry cleaning! | Synonyms: goodness, wow, oh dear', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1174, 5, 'ऑफलाइन', 'hi', 'ऑफलाइन का अर्थ है इंटरनेट या किसी नेटवर्क से जुड़ा न होना, या बिना किसी सक्रिय कनेक्शन के स्वतंत्र रूप से काम करना। | Example: आप इस ऐप का उपयोग ऑफलाइन भी कर सकते हैं। | Synonyms: नेटवर्क से कटा हुआ, इंटरनेट रहित', 1, 0, '2026-02-03', '2026-02-03 14:58:03', 1, NULL, 0, 0),
-(1175, 5, 'mama', 'en', 'Mama is an informal and often affectionate term for one''s mother, typically used by young children. | Example: The toddler pointed to her mother and happily exclaimed, "Mama!" | Synonyms: mother, mom, mommy', 1, 0, '2026-02-03', '2026-02-03 14:58:13', 1, NULL, 0, 0),
-(1176, 5, 'list', 'en', 'A series of items, names, or numbers written or printed consecutively, typically for a specific purpose. | Example: Please check the guest list to ensure everyone is accounted for. | Synonyms: catalog, inventory, register', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1177, 5, 'audition', 'en', 'To audition is to perform a trial piece to demonstrate one''s ability or suitability for a role, position, or group. | Example: She decided to audition for the lead role in the school play. | Synonyms: tryout, screen test, test', 1, 0, '2026-02-03', '2026-02-03 14:58:15', 1, NULL, 0, 0),
-(1178, 5, 'bummer', 'en', 'A bummer is a situation or event that is disappointing, unpleasant, or inconvenient. | Example: It was a real bummer when our flight got canceled due to the storm. | Synonyms: disappointment, letdown, shame', 1, 0, '2026-02-03', '2026-02-03 14:58:13', 1, NULL, 0, 0),
-(1179, 5, 'baba', 'es', 'Baba refers to the viscous, watery fluid, often mixed with air bubbles, that flows involuntarily from the mouth, especially of babies or animals. | Example: El bebé dejó un charco de baba en su babero mientras dormía. | Synonyms: saliva, babaza', 1, 0, '2026-02-03', '2026-02-03 14:58:14', 1, NULL, 0, 0),
-(1180, 5, 'males', 'es', 'Males refers to various forms of evil, harm, illnesses, or troubles. | Example: La sociedad debe combatir los males que afectan a sus ciudadanos. | Synonyms: enfermedades, dolencias, problemas', 1, 0, '2026-02-03', '2026-02-03 14:58:14', 1, NULL, 0, 0),
-(1181, 5, 'falleció', 'es', 'Falleció is the past tense (preterite) third-person singular form of the verb ''fallecer,'' meaning ''passed away'' or ''died.'' | Example: Su perro falleció después de una larga enfermedad. | Synonyms: murió, expiró, pereció', 1, 0, '2026-02-03', '2026-02-03 14:58:13', 1, NULL, 0, 0),
-(1182, 5, 'वाल', 'hi', 'वाल एक प्रत्यय है जिसका उपयोग किसी व्यक्ति या वस्तु की विशेषता, संबंध या कार्य को दर्शाने के लिए किया जाता है। | Example: सब्जीवाला ताज़ी सब्जियां बेच रहा है। | Synonyms: -दार, -ई', 1, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(1183, 5, 'साजिशन', 'hi', 'साजिशन का अर्थ है किसी कार्य को गुप्त योजना बनाकर, जानबूझकर और अक्सर किसी को हानि पहुँचाने के इरादे से करना। | Example: पुलिस ने बताया कि यह हत्या साजिशन की गई थी। | Synonyms: षड्यंत्रपूर्वक, कपटपूर्वक, धोखे से', 1, 0, '2026-02-03', '2026-02-03 14:58:16', 1, NULL, 0, 0),
-(1184, 5, 'aeronaves', 'es', 'Vehicles capable of flight, such as airplanes, helicopters, or gliders, designed to travel through the air. | Example: Las aeronaves de carga transportan mercancías a destinos lejanos. | Synonyms: aviones, aparatos voladores, naves aéreas', 1, 0, '2026-02-03', '2026-02-03 14:58:20', 1, NULL, 0, 0),
-(1185, 5, 'holguín', 'es', 'A holguín is an adjective or noun referring to a person who is idle or enjoys being at leisure. | Example: Mi hermano es un holguín, siempre prefiere descansar a trabajar. | Synonyms: holgazán, perezoso, vago', 1, 0, '2026-02-03', '2026-02-03 14:58:24', 1, NULL, 0, 0),
-(1186, 5, 'इतन', 'hi', 'इतना (Itna) शब्द का अर्थ है ''इस मात्रा या इस हद तक''। | Example: मुझे इतना काम नहीं करना है। | Synonyms: उतना, बहुत, काफ़ी', 1, 0, '2026-02-03', '2026-02-03 14:58:31', 1, NULL, 0, 0),
-(1187, 5, 'lives', 'en', 'The plural form of ''life,'' referring to the state of being alive, or the period during which a person or animal exists. | Example: The novel explored the intertwined lives of three generations of women. | Synonyms: existences, beings, durations', 1, 0, '2026-02-03', '2026-02-03 14:58:29', 1, NULL, 0, 0),
-(1188, 5, 'ana', 'es', 'A common Spanish female given name, equivalent to Anne or Anna in English. | Example: Ana es la hermana mayor de Pedro. | Synonyms: Anna, Anita', 1, 0, '2026-02-03', '2026-02-03 14:58:33', 1, NULL, 0, 0),
-(1189, 5, 'maría', 'es', 'María is a colloquial Spanish term for a marijuana cigarette. | Example: Después de la fiesta, se fumaron una maría en el balcón. | Synonyms: porro, canuto, joint', 1, 0, '2026-02-03', '2026-02-03 14:58:31', 1, NULL, 0, 0),
-(1190, 5, 'रहेंग', 'hi', 'रहेंग का अर्थ है ''रहेंगे'' या ''निवास करेंगे'', जो भविष्य में किसी स्थान पर ठहरने या किसी स्थिति में बने रहने को दर्शाता है। | Example: हम कल दिल्ली में रहेंगे। | Synonyms: निवास करेंगे, ठहरेंगे', 1, 0, '2026-02-03', '2026-02-03 14:58:34', 1, NULL, 0, 0),
-(1191, 5, 'पहुंच', 'hi', 'पहुंच (Pahunch) refers to the ability to reach, access, or have influence over a place, person, or thing. | Example: शहर के बाहरी इलाकों तक सार्वजनिक परिवहन की अच्छी पहुंच है। (Public transport has good reach/access to the city''s outer areas.) | Synonyms: अभिगम, रसाई, संपर्क', 1, 0, '2026-02-03', '2026-02-03 14:58:33', 1, NULL, 0, 0),
-(1192, 5, 'aquí', 'es', 'Aquí is a Spanish adverb used to indicate the location of something or someone in the immediate vicinity of the speaker. | Example: Ven aquí, por favor. | Synonyms: acá, en este lugar', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1193, 5, 'making', 'en', 'The process or act of creating, producing, or constructing something. | Example: The making of the documentary involved extensive research and interviews. | Synonyms: creation, production, manufacturing', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1194, 5, 'mailbox', 'en', 'A mailbox is a private or public box into which mail is delivered or from which it is collected. | Example: I checked the mailbox, but there was no mail for me today. | Synonyms: letterbox, postbox, mail drop', 1, 0, '2026-02-03', '2026-02-03 14:58:35', 1, NULL, 0, 0),
-(1195, 5, 'हिंद', 'hi', 'हिंद भारत का एक प्राचीन और काव्यात्मक नाम है। | Example: प्राचीन काल में भारत को ''हिंद'' नाम से भी जाना जाता था। | Synonyms: भारत, इंडिया, हिंदुस्तान', 1, 0, '2026-02-03', '2026-02-03 14:58:36', 1, NULL, 0, 0),
-(1196, 5, 'बात', 'hi', 'बात refers to a word, statement, conversation, or a matter/topic of discussion. | Example: यह एक महत्वपूर्ण बात है। (This is an important matter.) | Synonyms: कथन, वचन, विषय', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1197, 5, 'column', 'en', 'A vertical structure, typically cylindrical or rectangular, used as a support or for decoration, or a vertical division of a page, table, or list. | Example: The ancient Roman ruins featured several impressive marble columns still standing after centuries. | Synonyms: pillar, post, support', 1, 0, '2026-02-03', '2026-02-03 14:58:41', 1, NULL, 0, 0),
-(1198, 5, 'como', 'es', 'Como is a versatile Spanish word used to express comparison, manner, or cause, commonly translated as "as," "like," or "how." | Example: Ella canta como un ángel. | Synonyms: tal como, igual que, puesto que', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1199, 5, 'magia', 'es', 'Magia is the art or practice of using supernatural powers, spells, or rituals to influence events, or an enchanting quality that captivates and delights. | Example: Los niños estaban fascinados con la magia del mago en el escenario. | Synonyms: encanto, hechicería, ilusionismo', 1, 0, '2026-02-03', '2026-02-03 14:58:43', 1, NULL, 0, 0),
-(1200, 5, 'कौम', 'hi', 'कौम refers to a large group of people united by common descent, history, culture, or language, often forming a nation or a distinct community. | Example: गांधीजी ने अपनी कौम को स्वतंत्रता के लिए एकजुट किया। (Gandhiji united his nation/people for independence.) | Synonyms: राष्ट्र (Rashtra - Nation), जाति (Jaati - Race, Community), समुदाय (Samudaay - Community)', 1, 0, '2026-02-03', '2026-02-03 14:58:43', 1, NULL, 0, 0),
-(1201, 5, 'समस्य', 'hi', 'समस्या एक ऐसी स्थिति या प्रश्न है जिसका समाधान या उत्तर खोजना होता है। | Example: हमें इस समस्या का समाधान जल्द से जल्द खोजना होगा। | Synonyms: मुश्किल, कठिनाई, अड़चन', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1202, 5, 'those', 'en', 'Referring to specific people or things that are distant from the speaker or listener, or that have been previously mentioned. | Example: Those books on the top shelf are mine. | Synonyms: the ones, the aforementioned', 1, 0, '2026-02-03', '2026-02-03 14:58:50', 1, NULL, 0, 0),
-(1203, 5, 'llama', 'en', 'A domesticated South American camelid, known for its wool and its use as a pack animal. | Example: The llama carried the heavy supplies up the mountain trail with ease. | Synonyms: camelid, alpaca', 1, 0, '2026-02-03', '2026-02-03 14:58:46', 1, NULL, 0, 0),
-(1204, 5, 'पीरियड्स', 'hi', 'पीरियड्स महिलाओं में होने वाली मासिक धर्म की प्रक्रिया को कहते हैं, जिसमें गर्भाशय से रक्त और ऊतक योनि के माध्यम से बाहर निकलते हैं। | Example: पीरियड्स के दौरान कई महिलाओं को पेट में दर्द का अनुभव होता है। | Synonyms: मासिक धर्म, रजोधर्म, माहवारी', 1, 0, '2026-02-03', '2026-02-03 14:58:47', 1, NULL, 0, 0),
-(1205, 5, 'मतल', 'hi', 'The Hindi word "मतलब" (matlab) refers to the meaning, purpose, or significance of something. | Example: इस वाक्य का क्या मतलब है? | Synonyms: अर्थ, तात्पर्य, प्रयोजन', 1, 0, '2026-02-03', '2026-02-03 14:58:47', 1, NULL, 0, 0),
-(1206, 5, 'water', 'es', 'Agua is the Spanish word for the essential, clear, tasteless liquid that is vital for all known forms of life and covers most of the Earth''s surface. | Example: Por favor, dame un vaso de agua. | Synonyms: líquido, H2O, fluido', 1, 0, '2026-02-03', '2026-02-03 14:59:01', 1, NULL, 0, 0),
-(1207, 5, 'मुर्ग', 'hi', 'मुर्ग (Murg) refers to a domestic fowl, specifically a male chicken or rooster, often raised for its meat and eggs. | Example: मुर्ग सुबह बांग देता है। | Synonyms: मुर्गा, कुक्कुट, ताम्रचूड़', 1, 0, '2026-02-03', '2026-02-03 14:58:59', 1, NULL, 0, 0),
-(1208, 5, 'किय', 'hi', 'किय" is an archaic or less common variant of ''किया'', which is the past tense form of the verb ''करना'' (to do), meaning ''did'' or ''done''. | Example: उसने अपना काम किया। (Usne apna kaam kiya.) - He did his work. | Synonyms: किया, करा, कर चुका', 1, 0, '2026-02-03', '2026-02-03 14:59:05', 1, NULL, 0, 0),
-(1209, 5, 'name', 'en', 'A word or term by which a person, animal, place, or thing is known, addressed, or referred to. | Example: Please write your full name on the application form. | Synonyms: appellation, designation, title', 1, 0, '2026-02-03', '2026-02-03 14:59:07', 1, NULL, 0, 0),
-(1210, 5, 'union', 'en', 'A union is the act of joining two or more things together, or the state of being joined, often forming a single entity or group. | Example: The workers formed a union to negotiate for better wages and working conditions. | Synonyms: alliance, association, merger', 1, 0, '2026-02-03', '2026-02-03 14:59:05', 1, NULL, 0, 0),
-(1211, 5, 'महीन', 'hi', 'महीन का अर्थ है बहुत पतला, बारीक या सूक्ष्म। | Example: उसने कपड़े पर महीन कढ़ाई की। | Synonyms: बारीक, पतला, सूक्ष्म', 1, 0, '2026-02-03', '2026-02-03 14:59:04', 1, NULL, 0, 0),
-(1212, 5, 'mhm', 'es', 'An interjection used to express agreement, understanding, or acknowledgment, often in a casual or non-committal way. | Example: —¿Quieres un poco más de café? —Mhm, por favor. | Synonyms: sí, claro, entiendo', 1, 0, '2026-02-03', '2026-02-03 14:59:06', 1, NULL, 0, 0),
-(1213, 5, 'genera', 'es', 'The Spanish word "genera" means "produces," "generates," or "creates," referring to the action of bringing something into existence or causing it to happen. | Example: El sol genera energía para la Tierra. | Synonyms: produce, crea, origina', 1, 0, '2026-02-03', '2026-02-03 14:59:06', 1, NULL, 0, 0),
-(1214, 5, 'voy', 'es', 'Voy is the first-person singular present indicative form of the Spanish verb ''ir,'' meaning ''I go'' or ''I am going.'' | Example: Voy a la escuela todos los días. | Synonyms: me dirijo, salgo', 1, 0, '2026-02-03', '2026-02-03 14:59:06', 1, NULL, 0, 0),
-(1215, 5, 'look', 'en', 'To direct one''s eyes in a particular direction or at something in order to see. | Example: Please look at the camera and smile. | Synonyms: gaze, observe, view', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(1216, 5, 'लिखन', 'hi', 'लिखन का अर्थ है लिखने की क्रिया या लेखन कार्य। | Example: लिखन एक कला है। | Synonyms: लेखन, लिखाई', 1, 0, '2026-02-03', '2026-02-03 14:59:10', 1, NULL, 0, 0),
-(1217, 5, 'फ्यूचर', 'hi', 'वह समय जो अभी आया नहीं है और आने वाला है। | Example: हमें अपने फ्यूचर के लिए अच्छी योजना बनानी चाहिए। | Synonyms: भविष्य, आने वाला समय, अनागत', 1, 0, '2026-02-03', '2026-02-03 14:59:10', 1, NULL, 0, 0),
-(1218, 5, 'israeli', 'en', 'A person who is a native or citizen of Israel. | Example: An Israeli shared insights into the country''s vibrant culture. | Synonyms: citizen of Israel, resident of Israel', 1, 0, '2026-02-03', '2026-02-03 14:59:14', 1, NULL, 0, 0),
-(1219, 5, 'अंग्रेज', 'hi', 'अंग्रेज शब्द का अर्थ इंग्लैंड का निवासी या ब्रिटिश व्यक्ति है। | Example: अंग्रेजों ने भारत पर लगभग दो सौ साल तक शासन किया। | Synonyms: ब्रिटिश, इंग्लिश', 1, 0, '2026-02-03', '2026-02-03 14:59:14', 1, NULL, 0, 0),
-(1220, 5, 'करत', 'hi', 'करत क्रिया ''करना'' का एक रूप है जो किसी कार्य के जारी होने या करने वाले व्यक्ति को इंगित करता है। | Example: करत करत अभ्यास के जड़मति होत सुजान। | Synonyms: करते हुए, करता हुआ, करने वाला', 1, 0, '2026-02-03', '2026-02-03 14:59:16', 1, NULL, 0, 0),
-(1221, 5, 'trece', 'es', 'Trece es el número cardinal que representa la cantidad de doce más uno, o el que sigue al doce y precede al catorce. | Example: Hay trece sillas alrededor de la mesa para la cena. | Synonyms: número trece, el trece', 1, 0, '2026-02-03', '2026-02-03 14:59:21', 1, NULL, 0, 0),
-(1222, 5, 'has', 'en', 'Has" is the third-person singular present tense form of the verb "to have," used to indicate possession, a characteristic, or an experience. | Example: He has a new car and a great sense of humor. | Synonyms: possesses, owns, holds', 1, 0, '2026-02-03', '2026-02-03 14:59:20', 1, NULL, 0, 0),
-(1223, 5, 'husband', 'en', 'A husband is a married man, especially in relation to his wife. | Example: Her husband helped her carry the groceries into the house. | Synonyms: spouse, partner, consort', 1, 0, '2026-02-03', '2026-02-03 14:59:18', 1, NULL, 0, 0),
-(1224, 5, 'wounded', 'en', 'Suffering an injury, typically a physical one caused by an external force or weapon. | Example: The wounded bird struggled to fly after its wing was broken. | Synonyms: injured, hurt, maimed', 1, 0, '2026-02-03', '2026-02-03 14:59:18', 1, NULL, 0, 0),
-(1225, 5, 'when', 'en', 'Used to introduce a subordinate clause indicating the time or occasion at which something happens. | Example: I will call you when I arrive at the station. | Synonyms: while, as, at the time that', 1, 0, '2026-02-03', '2026-02-03', 4, NULL, 0, 0),
-(1226, 5, 'jolly', 'en', 'Full of high spirits and good humor; cheerful and lively. | Example: The children were in a jolly mood as they opened their presents on Christmas morning. | Synonyms: cheerful, merry, jovial', 1, 0, '2026-02-03', '2026-02-03 14:59:18', 1, NULL, 0, 0),
-(1227, 5, 'वित्त', 'hi', 'वित्त का अर्थ धन और उसके प्रबंधन से संबंधित क्षेत्र है। | Example: सरकार ने नए वित्त वर्ष के लिए बजट पेश किया। | Synonyms: धन, अर्थ, पूंजी', 1, 0, '2026-02-03', '2026-02-03 14:59:20', 1, NULL, 0, 0),
-(1228, 5, 'झाल', 'hi', 'झाल एक धातु का बना वाद्य यंत्र है जिसे बजाने पर तेज़ और गूंजने वाली ध्वनि निकलती है। | Example: मंदिर में आरती के दौरान पुजारी ने झाल बजाई। | Synonyms: झाँझ, करताल', 1, 0, '2026-02-03', '2026-02-03 14:59:22', 1, NULL, 0, 0),
-(1229, 5, 'नाह', 'hi', 'नाह एक हिंदी शब्द है जिसका अर्थ स्वामी, प्रभु या पति होता है, जिसका प्रयोग अक्सर काव्य या आदरपूर्ण संदर्भ में किया जाता है। | Example: मीरा अपने गिरधर नाह की भक्ति में लीन थी। | Synonyms: स्वामी, पति, प्रभु', 1, 0, '2026-02-03', '2026-02-03 14:59:19', 1, NULL, 0, 0),
-(1230, 5, 'अंकल', 'hi', 'एक सम्मानजनक शब्द जिसका उपयोग किसी भी पुरुष के लिए किया जाता है जो उम्र में बड़ा हो, चाहे वह रिश्तेदार हो या न हो। | Example: अंकल, क्या आप मेरी मदद कर सकते हैं? | Synonyms: चाचा, मामा, ताऊ', 1, 0, '2026-02-03', '2026-02-03 14:59:23', 1, NULL, 0, 0),
-(1231, 5, 'love', 'en', 'A profound and intense affectionate concern for another person, a thing, or an idea, often accompanied by strong feelings of attraction, care, and desire for their well-being. | Example: Their love for each other grew stronger with each passing year. | Synonyms: affection, devotion, fondness', 1, 0, '2026-02-03', '2026-02-03 14:59:26', 1, NULL, 0, 0),
-(1232, 5, 'security', 'en', 'Security is the state of being free from danger or threat, or the measures taken to ensure such a state. | Example: The company implemented new security protocols to protect its data. | Synonyms: safety, protection, safeguard', 1, 0, '2026-02-03', '2026-02-03 14:59:26', 1, NULL, 0, 0),
-(1233, 5, 'guard', 'en', 'To watch over and protect someone or something from danger, harm, or loss. | Example: The security team was instructed to guard the entrance throughout the night. | Synonyms: protect, defend, safeguard', 1, 0, '2026-02-03', '2026-02-03 14:59:26', 1, NULL, 0, 0),
-(1234, 5, 'सिक्योरिट', 'hi', 'सिक्योरिट का अर्थ है किसी व्यक्ति, वस्तु या स्थान को खतरे या नुकसान से बचाने की स्थिति या उपाय। | Example: हवाई अड्डे पर यात्रियों की सिक्योरिट बहुत महत्वपूर्ण होती है। | Synonyms: सुरक्षा, रक्षा, हिफाजत', 1, 0, '2026-02-03', '2026-02-03 14:59:26', 1, NULL, 0, 0),
-(1235, 5, 'गार्ड', 'hi', 'गार्ड वह व्यक्ति होता है जो किसी स्थान, व्यक्ति या वस्तु की सुरक्षा करता है। | Example: बैंक के बाहर एक गार्ड खड़ा था। | Synonyms: रक्षक, चौकीदार, सुरक्षाकर्मी', 1, 0, '2026-02-03', '2026-02-03 14:59:26', 1, NULL, 0, 0),
-(1236, 5, 'hambre', 'es', 'The sensation or discomfort caused by the need for food. | Example: Después de correr, siempre tengo mucha hambre. | Synonyms: apetito, inanición', 1, 0, '2026-02-03', '2026-02-03 14:59:30', 1, NULL, 0, 0),
-(1237, 5, 'quiere', 'es', 'Quiere is the third-person singular present indicative form of the verb ''querer,'' meaning ''he/she/it wants'' or ''he/she/it loves.'' | Example: Mi hermana quiere un helado de chocolate. | Synonyms: desea, anhela, ama', 1, 0, '2026-02-03', '2026-02-03 14:59:26', 1, NULL, 0, 0),
-(1238, 5, 'gálvez', 'es', 'Gálvez es un apellido de origen español. | Example: Bernardo de Gálvez fue una figura clave en la Guerra de Independencia de los Estados Unidos. | Synonyms: apellido, nombre de familia', 1, 0, '2026-02-03', '2026-02-03 14:59:31', 1, NULL, 0, 0),
-(1239, 5, 'orgánico', 'es', 'Se refiere a algo que proviene de seres vivos o que ha sido producido sin el uso de productos químicos artificiales, pesticidas o fertilizantes sintéticos. | Example: Prefiero comprar alimentos orgánicos para una dieta más saludable. | Synonyms: natural, ecológico, biológico', 1, 0, '2026-02-03', '2026-02-03 14:59:45', 1, NULL, 0, 0),
-(1240, 5, 'británico', 'es', 'Británico se refiere a algo o alguien originario o relacionado con Gran Bretaña o el Reino Unido. | Example: La cultura británica es muy rica y diversa. | Synonyms: inglés, anglosajón', 1, 0, '2026-02-03', '2026-02-03 14:59:56', 1, NULL, 0, 0),
-(1241, 5, 'डोंगरगढ', 'hi', 'डोंगरगढ छत्तीसगढ़ राज्य में स्थित एक प्रसिद्ध तीर्थस्थल और पहाड़ी पर बसा शहर है। | Example: मैं पिछले साल डोंगरगढ में माँ बम्लेश्वरी देवी के दर्शन करने गया था। | Synonyms: तीर्थ नगरी, पहाड़ी नगर', 1, 0, '2026-02-03', '2026-02-03 14:59:56', 1, NULL, 0, 0),
-(1242, 5, 'wonder', 'en', 'To feel a sense of awe, admiration, or surprise, or to ponder something with curiosity or doubt. | Example: I often wonder about the vastness of the universe and our place within it. | Synonyms: marvel, ponder, question', 1, 0, '2026-02-03', '2026-02-03 14:59:57', 1, NULL, 0, 0),
-(1243, 5, 'for', 'en', 'For is a preposition used to indicate purpose, recipient, duration, or reason. | Example: She bought a present for her friend. | Synonyms: to, on behalf of, in favor of', 1, 0, '2026-02-03', '2026-02-04', 5, NULL, 0, 0),
-(1244, 5, 'उन्ह', 'hi', 'उन्ह आदरणीय तृतीय-पुरुष सर्वनाम का तिर्यक मूल रूप है, जिसका प्रयोग परसर्गों के साथ ''उनको'' (them/him/her) या ''उन्होंने'' (they/he/she did) जैसे अर्थों में किया जाता है। | Example: उन्होंने कल मुझे बुलाया था। | Synonyms: उन, उन्हें, वे', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1245, 5, 'lol', 'en', 'Lol is an acronym for ''laughing out loud,'' used as an interjection to express amusement or to lighten the tone in text-based communication. | Example: I just read your message, lol, that''s hilarious! | Synonyms: haha, ROFL, LMAO', 1, 0, '2026-02-03', '2026-02-03 15:00:03', 1, NULL, 0, 0),
-(1246, 5, 'brought', 'en', 'Brought is the past tense and past participle of ''bring,'' meaning to have carried or conveyed someone or something to a particular place or person. | Example: He brought a bouquet of flowers for his mother. | Synonyms: carried, fetched, delivered', 1, 0, '2026-02-03', '2026-02-03 15:00:07', 1, NULL, 0, 0),
-(1247, 5, 'everything', 'en', 'All things without exception, or the whole of a particular set of things or circumstances. | Example: He lost everything he owned in the fire. | Synonyms: all, the whole lot, the entirety', 1, 0, '2026-02-03', '2026-02-03 15:00:08', 1, NULL, 0, 0),
-(1248, 5, 'eighteen', 'en', 'Eighteen is the cardinal number equivalent to the sum of seventeen and one, represented by the numeral 18. | Example: My daughter will turn eighteen next year and be eligible to vote. | Synonyms: 18, one dozen and six, a score minus two', 1, 0, '2026-02-03', '2026-02-03 15:00:13', 1, NULL, 0, 0),
-(1249, 5, 'gothic', 'en', 'Gothic describes a style of art, architecture, or literature characterized by darkness, mystery, and a medieval or macabre atmosphere. | Example: The ancient cathedral''s soaring arches and stained-glass windows were prime examples of Gothic architecture. | Synonyms: dark, medieval, eerie', 1, 0, '2026-02-03', '2026-02-03 15:00:23', 1, NULL, 0, 0),
-(1250, 5, 'कहत', 'hi', 'कहत शब्द का अर्थ ''कहना'' या ''बताते हुए'' होता है, जिसका प्रयोग अक्सर काव्य या पुरानी हिंदी में किया जाता है। | Example: कहत कबीर सुनो भाई साधो। | Synonyms: कहना, बताना, बोलना', 1, 0, '2026-02-03', '2026-02-03 15:00:27', 1, NULL, 0, 0),
-(1251, 5, 'स्वय', 'hi', 'स्वयं का अर्थ है ''खुद'' या ''अपने आप'', जो किसी व्यक्ति द्वारा किसी कार्य को बिना किसी की सहायता के करने को दर्शाता है। | Example: उसने अपना काम स्वयं किया। | Synonyms: खुद, अपने आप, स्वतः', 1, 0, '2026-02-03', '2026-02-03 15:00:28', 1, NULL, 0, 0),
-(1252, 5, 'रिक्वेस्ट', 'hi', 'किसी से कुछ करने या देने के लिए विनम्रतापूर्वक किया गया आग्रह या याचना। | Example: मैंने उससे मदद के लिए एक रिक्वेस्ट भेजी। | Synonyms: अनुरोध, निवेदन, प्रार्थना', 1, 0, '2026-02-03', '2026-02-03 15:00:27', 1, NULL, 0, 0),
-(1253, 5, 'soy', 'es', 'Soy is the first-person singular present indicative form of the Spanish verb "ser," meaning "I am." | Example: Yo soy estudiante. | Synonyms: existir, estar', 1, 0, '2026-02-03', '2026-02-03 15:00:36', 1, NULL, 0, 0),
-(1254, 5, 'jericó', 'es', 'Jericó (lowercase) is a colloquial term in Spanish used to describe a very old, dilapidated, or messy place, or a situation of great noise and confusion. | Example: Después de la fiesta, la casa era un jericó. | Synonyms: ruina, desorden, caos', 1, 0, '2026-02-03', '2026-02-03 15:00:31', 1, NULL, 0, 0),
-(1255, 5, 'del', 'es', 'Del is a mandatory contraction in Spanish formed by the preposition "de" (of/from) and the masculine singular definite article "el" (the), meaning "of the" or "from the." | Example: El libro del estudiante está en la mesa. | Synonyms: of the, from the', 1, 0, '2026-02-03', '2026-02-03 15:00:31', 1, NULL, 0, 0),
-(1256, 5, 'sur', 'es', 'The cardinal direction opposite to north, typically found at the bottom of maps. | Example: Viajamos hacia el sur para escapar del frío invernal. | Synonyms: meridión, austral', 1, 0, '2026-02-03', '2026-02-03 15:00:32', 1, NULL, 0, 0),
-(1257, 5, 'within', 'en', 'Within means inside the boundaries, limits, or scope of something, whether physical, temporal, or conceptual. | Example: Please submit your application within the specified timeframe. | Synonyms: inside, in, during', 1, 0, '2026-02-03', '2026-02-03 15:00:30', 1, NULL, 0, 0),
-(1258, 5, 'three', 'en', 'The cardinal number equivalent to the sum of two and one, representing a quantity of three units. | Example: She bought three books from the store. | Synonyms: trio, triplet, threesome', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(1259, 5, 'months', 'en', 'Months are the twelve principal divisions of the year, each typically lasting between 28 and 31 days. | Example: The new software update will be released in a few months. | Synonyms: periods, durations', 1, 0, '2026-02-03', '2026-02-03 15:00:35', 1, NULL, 0, 0),
-(1260, 5, 'including', 'en', 'Including means comprising or containing as part of a whole, often used to introduce items that are part of a larger group or set. | Example: The tour package covers several destinations, including Paris, Rome, and Berlin. | Synonyms: comprising, encompassing, containing', 1, 0, '2026-02-03', '2026-02-03 15:00:36', 1, NULL, 0, 0),
-(1261, 5, 'undergo', 'en', 'To experience or be subjected to something, often a change, process, or difficult situation. | Example: The patient will undergo a series of tests to determine the cause of the illness. | Synonyms: experience, endure, suffer', 1, 0, '2026-02-03', '2026-02-03 15:00:35', 1, NULL, 0, 0),
-(1262, 5, 'rockefeller', 'en', 'A Rockefeller is a member of an extremely wealthy and influential American family, particularly known for their oil industry fortune and philanthropic endeavors, or by extension, any person of immense wealth. | Example: With his vast business empire, he was considered a Rockefeller of his generation. | Synonyms: magnate, tycoon, plutocrat', 1, 0, '2026-02-03', '2026-02-03 15:00:35', 1, NULL, 0, 0),
-(1263, 5, 'plaza', 'en', 'A plaza is an open public space or square in a city or town, often surrounded by buildings and used for gatherings or commerce. | Example: Families gathered in the central plaza to enjoy the outdoor concert and evening market. | Synonyms: square, piazza, courtyard', 1, 0, '2026-02-03', '2026-02-03 15:00:34', 1, NULL, 0, 0),
-(1264, 5, 'bueno', 'es', 'Bueno is a Spanish adjective meaning good, fine, or well, often used to describe quality, condition, or moral character. | Example: La comida en este restaurante es muy buena. | Synonyms: excelente, agradable, amable', 1, 0, '2026-02-03', '2026-02-03 15:00:35', 1, NULL, 0, 0),
-(1265, 5, 'critican', 'es', 'Critican means ''they criticize'' or ''you all criticize'' (formal plural), referring to the act of finding fault with someone or something. | Example: Los vecinos critican el ruido excesivo de la fiesta. | Synonyms: censuran, reprochan, desaprueban', 1, 0, '2026-02-03', '2026-02-03 15:00:35', 1, NULL, 0, 0),
-(1266, 5, 'largaba', 'es', 'Largaba is the imperfect past tense of the verb ''largar,'' meaning ''was letting go,'' ''was releasing,'' ''was throwing,'' or ''was uttering'' depending on the context. | Example: El orador largaba un discurso apasionado frente a la multitud. | Synonyms: soltaba, lanzaba, emitía', 1, 0, '2026-02-03', '2026-02-03 15:00:35', 1, NULL, 0, 0),
-(1267, 5, 'batata', 'es', 'La batata es un tubérculo comestible de sabor dulce, también conocido como boniato o camote. | Example: Para la cena, preparé unas batatas asadas con un toque de canela. | Synonyms: boniato, camote, papa dulce', 1, 0, '2026-02-03', '2026-02-03 15:00:35', 1, NULL, 0, 0),
-(1268, 5, 'मनुष्य', 'hi', 'मनुष्य धरती पर रहने वाला एक बुद्धिमान सामाजिक प्राणी है। | Example: सभी मनुष्य समान हैं। | Synonyms: मानव, इंसान', 1, 0, '2026-02-03', '2026-02-03 15:00:36', 1, NULL, 0, 0),
-(1269, 5, 'घंट', 'hi', 'घंट (ghant) एक धातु से बनी खोखली वस्तु है जिसे बजाने पर ध्वनि उत्पन्न होती है, जिसका उपयोग प्रायः पूजा-पाठ या संकेत देने के लिए किया जाता है। | Example: प्राचीन मंदिर में घंट की ध्वनि दूर तक सुनाई देती थी। | Synonyms: घंटा, घंटी', 1, 0, '2026-02-03', '2026-02-03 15:00:46', 1, NULL, 0, 0),
-(1270, 5, 'घनघन', 'hi', 'The onomatopoeic word representing the loud, continuous, and resonant sound of bells ringing. | Example: मंदिर में घंटियाँ घनघन बज रही थीं। (Mandir mein ghantiyan ghan-ghan baj rahi thin.) - The bells in the temple were ringing ''ghan-ghan''. | Synonyms: झनझन, टुनटुन', 1, 0, '2026-02-03', '2026-02-03 15:00:39', 1, NULL, 0, 0),
-(1271, 5, 'बतात', 'hi', 'बतात एक प्रकार की भूमिगत सब्जी है जिसे आमतौर पर ''आलू'' भी कहा जाता है। | Example: मैंने बाजार से एक किलो बतात खरीदे। | Synonyms: आलू, कंद', 1, 0, '2026-02-03', '2026-02-03 15:00:36', 1, NULL, 0, 0),
-(1272, 5, 'चार', 'hi', 'चार एक संख्या है जो तीन के बाद आती है और चार इकाइयों की मात्रा को दर्शाती है। | Example: मेरे पास चार पेन हैं। | Synonyms: संख्या चार, अंक चार', 1, 0, '2026-02-03', '2026-02-03 15:01:00', 1, NULL, 0, 0),
-(1273, 5, 'विदेश', 'hi', 'विदेश refers to a foreign country or a place outside one''s own country. | Example: वह विदेश में पढ़ाई कर रहा है। (He is studying abroad/in a foreign country.) | Synonyms: परदेश, अन्य देश', 1, 0, '2026-02-03', '2026-02-03 15:00:57', 1, NULL, 0, 0),
-(1274, 5, 'बाद', 'hi', 'बाद का अर्थ है किसी घटना या समय के उपरांत या पश्चात्। | Example: बारिश रुकने के बाद हम बाहर गए। | Synonyms: पश्चात्, उपरांत, तत्पश्चात', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1275, 5, 'bachelor', 'en', 'An unmarried man, or a person who has received a first academic degree. | Example: After many years of enjoying his freedom, the confirmed bachelor finally decided to settle down. | Synonyms: single man, unmarried man, graduate', 1, 0, '2026-02-03', '2026-02-03 15:01:01', 1, NULL, 0, 0),
-(1276, 5, 'attack', 'en', 'To launch a violent assault or aggressive action against an enemy, opponent, or target. | Example: The lion decided to attack the weakest gazelle in the herd. | Synonyms: assault, charge, strike', 1, 0, '2026-02-03', '2026-02-03 15:01:00', 1, NULL, 0, 0),
-(1277, 5, 'आलोक', 'hi', 'आलोक का अर्थ है प्रकाश या चमक, जो किसी वस्तु को दृश्यमान बनाता है। | Example: सुबह के आलोक से कमरा भर गया। | Synonyms: प्रकाश, रोशनी, प्रभा', 1, 0, '2026-02-03', '2026-02-03 15:01:01', 1, NULL, 0, 0),
-(1278, 5, 'तोमर', 'hi', 'तोमर एक प्रसिद्ध राजपूत वंश है जिसने मध्यकालीन भारत में दिल्ली और उसके आसपास के क्षेत्रों पर शासन किया था। | Example: दिल्ली के लालकोट का निर्माण तोमर शासकों ने करवाया था। | Synonyms: राजपूत गोत्र, क्षत्रिय वंश', 1, 0, '2026-02-03', '2026-02-03 15:01:02', 1, NULL, 0, 0),
-(1279, 5, 'sayal', 'es', 'Sayal is a coarse, rough wool fabric, typically used for humble garments or sacks. | Example: Los monjes vestían túnicas de sayal para mostrar su humildad. | Synonyms: tela basta, estameña, paño rústico', 1, 0, '2026-02-03', '2026-02-03 15:01:12', 1, NULL, 0, 0),
-(1280, 5, 'mundo', 'es', 'Mundo refers to the Earth, its inhabitants, and all things upon it, or more broadly, the universe. | Example: Viajó por todo el mundo para conocer diferentes culturas. | Synonyms: orbe, tierra, universo', 1, 0, '2026-02-03', '2026-02-03 15:01:10', 1, NULL, 0, 0),
-(1281, 5, 'रूस', 'hi', 'रूस पूर्वी यूरोप और उत्तरी एशिया में स्थित एक विशाल देश है। | Example: रूस क्षेत्रफल की दृष्टि से दुनिया का सबसे बड़ा देश है। | Synonyms: रूसी संघ, रूसिया', 1, 0, '2026-02-03', '2026-02-03 15:01:18', 1, NULL, 0, 0),
-(1282, 5, 'शाल', 'hi', 'A shawl is a large piece of cloth, often made of wool or other warm material, worn over the shoulders or head for warmth or as a fashion accessory. | Example: ठंड से बचने के लिए उसने एक मोटी शाल ओढ़ी। | Synonyms: दुपट्टा, ओढ़नी, लोई', 1, 0, '2026-02-03', '2026-02-03 15:01:14', 1, NULL, 0, 0),
-(1283, 5, 'समय', 'hi', 'वह अवधि जिसमें घटनाएँ घटित होती हैं और जिसे मापा जा सकता है। | Example: समय बहुत कीमती है, इसे बर्बाद मत करो। | Synonyms: वक्त, काल', 1, 0, '2026-02-03', '2026-02-03 15:01:12', 1, NULL, 0, 0),
-(1284, 5, 'एल्यूमीनियम', 'hi', 'एल्यूमीनियम एक हल्की, चांदी जैसी सफेद धातु है जो जंग प्रतिरोधी होती है और बिजली तथा गर्मी की अच्छी सुचालक है। | Example: एल्यूमीनियम का उपयोग हवाई जहाज, बर्तन और पैकेजिंग सामग्री बनाने में होता है। | Synonyms: हल्की धातु, चांदी जैसी धातु', 1, 0, '2026-02-03', '2026-02-03 15:01:12', 1, NULL, 0, 0),
-(1285, 5, 'essentially', 'en', 'Essentially means in its fundamental nature or most important respects, without considering minor details or variations. | Example: Essentially, the two proposals are the same, just worded differently. | Synonyms: basically, fundamentally, virtually', 1, 0, '2026-02-03', '2026-02-03 15:01:11', 1, NULL, 0, 0),
-(1286, 5, 'little', 'en', 'Little refers to something that is small in size, amount, or degree. | Example: The little girl carefully held the tiny kitten in her arms. | Synonyms: small, tiny, petite', 1, 0, '2026-02-03', '2026-02-03 15:01:12', 1, NULL, 0, 0),
-(1287, 5, 'unemployment', 'en', 'The state of being without a paid job but available for and seeking work. | Example: The country''s unemployment rate rose sharply last quarter, causing concern among economists. | Synonyms: joblessness, idleness, worklessness', 1, 0, '2026-02-03', '2026-02-03 15:01:11', 1, NULL, 0, 0),
-(1288, 5, 'certainly', 'en', 'Certainly means without doubt, beyond question, or in a definite manner. | Example: She will certainly be at the meeting tomorrow morning. | Synonyms: definitely, surely, undoubtedly', 1, 0, '2026-02-03', '2026-02-03 15:01:15', 1, NULL, 0, 0),
-(1289, 5, 'sea', 'es', 'Mar es una gran extensión de agua salada que cubre gran parte de la superficie terrestre, a menudo conectada a un océano. | Example: Nos encanta nadar en el mar durante el verano. | Synonyms: océano, piélago, aguas', 1, 0, '2026-02-03', '2026-02-03 15:01:30', 1, NULL, 0, 0),
-(1290, 5, 'canadá', 'es', 'Canadá es un país soberano de América del Norte, conocido por su vasta geografía, multiculturalismo y bilingüismo (inglés y francés). | Example: La capital de Canadá es Ottawa y es el segundo país más grande del mundo por superficie total. | Synonyms: el país de la hoja de arce, la nación del norte, el Gran Norte Blanco', 1, 0, '2026-02-03', '2026-02-03 15:01:26', 1, NULL, 0, 0),
-(1291, 5, 'उत्तराखंड', 'hi', 'उत्तराखंड भारत के उत्तरी भाग में स्थित एक हिमालयी राज्य है जो अपनी प्राकृतिक सुंदरता और तीर्थ स्थलों के लिए प्रसिद्ध है। | Example: उत्तराखंड को ''देवभूमि'' के नाम से भी जाना जाता है। | Synonyms: उत्तरांचल, देवभूमि', 1, 0, '2026-02-03', '2026-02-03 15:01:24', 1, NULL, 0, 0),
-(1292, 5, 'आखिर', 'hi', 'आखिर का अर्थ है ''अंततः'', ''आखिरकार'', या ''परिणामस्वरूप'', जो किसी घटना के अंत या अंतिम निष्कर्ष को दर्शाता है। | Example: बहुत देर इंतज़ार करने के बाद, आखिर वह आ ही गया। | Synonyms: आखिरकार, अंततः, अंत में', 1, 0, '2026-02-03', '2026-02-03 15:01:24', 1, NULL, 0, 0),
-(1293, 5, 'only', 'en', 'Only means solely, exclusively, or no more than a specified amount or number. | Example: I only have five dollars left. | Synonyms: just, solely, exclusively', 1, 0, '2026-02-03', '2026-02-04', 8, NULL, 0, 0),
-(1294, 5, 'ones', 'en', 'Ones is a pronoun used as the plural form of ''one'' to refer to people or things previously mentioned or understood in a general sense. | Example: These old books are falling apart; I need to get new ones. | Synonyms: individuals, items, people', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1295, 5, 'लेकिन', 'hi', 'यह एक संयोजक शब्द है जिसका उपयोग दो विपरीत या भिन्न विचारों या वाक्यों को जोड़ने के लिए किया जाता है, जो ''परंतु'' या ''मगर'' के समान अर्थ रखता है। | Example: मैं उससे मिलना चाहता था, लेकिन वह घर पर नहीं था। | Synonyms: परंतु, किंतु, मगर', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1296, 5, 'wondering', 'en', 'The act of thinking about something with curiosity, doubt, or a desire to know more. | Example: He spent the evening wondering if he had made the right decision. | Synonyms: pondering, musing, speculating', 1, 0, '2026-02-03', '2026-02-03 15:01:31', 1, NULL, 0, 0),
-(1297, 5, 'रोल', 'hi', 'किसी व्यक्ति या वस्तु द्वारा निभाई जाने वाली भूमिका या कार्य। | Example: फिल्म में उसका रोल बहुत महत्वपूर्ण था। | Synonyms: भूमिका, किरदार, कार्य', 1, 0, '2026-02-03', '2026-02-03 15:01:33', 1, NULL, 0, 0),
-(1298, 5, 'कुछ', 'hi', 'यह अनिश्चित मात्रा, संख्या, या वस्तु को दर्शाने वाला शब्द है। | Example: मुझे कुछ पानी चाहिए। | Synonyms: थोड़ा, कोई, कुछ-कुछ', 1, 0, '2026-02-03', '2026-02-03', 7, NULL, 0, 0),
-(1299, 5, 'una', 'es', '', 0, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1300, 5, 'explica', 'es', '', 0, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1301, 5, 'इसक', 'hi', '', 0, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1302, 5, 'अलाव', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:01:44', 1, NULL, 0, 0),
-(1303, 5, 'नक्सल', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:01:44', 1, NULL, 0, 0),
-(1304, 5, 'unit', 'en', 'A single, distinct, and identifiable entity, item, or quantity considered as a whole and forming part of a larger system or group. | Example: The kilogram is a standard unit of mass in the metric system. | Synonyms: component, element, item', 1, 0, '2026-02-03', '2026-02-03 15:02:16', 1, NULL, 0, 0),
-(1305, 5, 'smoke', 'en', 'Smoke is the visible gaseous product of burning material, typically consisting of fine particles suspended in air. | Example: A thick column of smoke billowed from the factory chimney. | Synonyms: fumes, haze, vapor', 1, 0, '2026-02-03', '2026-02-03 15:03:06', 1, NULL, 0, 0),
-(1306, 5, 'recording', 'en', 'A recording is a piece of media, such as audio, video, or data, that has been captured and stored for later playback or reference. | Example: The detective played the security camera recording to identify the suspect. | Synonyms: audio, track, record', 1, 0, '2026-02-03', '2026-02-03 15:03:05', 1, NULL, 0, 0),
-(1307, 5, 'प्रॉसेस', 'hi', 'प्रॉसेस का अर्थ है किसी कार्य को पूरा करने के लिए अपनाई जाने वाली व्यवस्थित विधि या चरणों की श्रृंखला। | Example: इस काम को पूरा करने के लिए एक लंबी प्रॉसेस से गुजरना होगा। | Synonyms: प्रक्रिया, कार्यविधि, प्रणाली', 1, 0, '2026-02-03', '2026-02-03 15:03:09', 1, NULL, 0, 0),
-(1308, 5, 'शुर', 'hi', 'शुर एक ऐसा व्यक्ति होता है जो युद्ध या किसी कठिन परिस्थिति में अत्यधिक साहस और बहादुरी दिखाता है, अक्सर एक योद्धा या नायक के रूप में। | Example: प्राचीन काल में, शुर अपनी मातृभूमि की रक्षा के लिए युद्ध के मैदान में लड़ते थे। | Synonyms: वीर, योद्धा, बहादुर', 1, 0, '2026-02-03', '2026-02-03 15:03:09', 1, NULL, 0, 0),
-(1309, 5, 'vicinity', 'en', 'Vicinity refers to the area near or surrounding a particular place. | Example: There are several excellent coffee shops in the vicinity of the university campus. | Synonyms: proximity, neighborhood, area', 1, 0, '2026-02-03', '2026-02-03 15:03:09', 1, NULL, 0, 0),
-(1310, 5, 'projects', 'en', 'Projects are planned undertakings or tasks, often involving a group of people and resources, designed to achieve a particular aim. | Example: The company launched several new projects this quarter, focusing on sustainable energy solutions. | Synonyms: undertakings, ventures, assignments', 1, 0, '2026-02-03', '2026-02-03 15:03:10', 1, NULL, 0, 0),
-(1311, 5, 'basically', 'en', 'Used to indicate that one is stating the most important or fundamental point of something, often in a simplified way. | Example: Basically, the new policy means we''ll all be working from home more often. | Synonyms: essentially, fundamentally, primarily', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1312, 5, 'implement', 'en', 'To put a decision, plan, or agreement into effect. | Example: The team worked diligently to implement the new software system across all departments. | Synonyms: execute, carry out, apply', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1313, 5, 'visita', 'es', 'The act of going to see someone or somewhere, or a person who comes to see someone. | Example: Mi abuela nos hizo una visita inesperada. (My grandmother paid us an unexpected visit.) | Synonyms: encuentro, reunión, visitante', 1, 0, '2026-02-03', '2026-02-03 15:03:13', 1, NULL, 0, 0),
-(1314, 5, 'obligó', 'es', 'Obligó is the third-person singular preterite indicative form of the verb ''obligar,'' meaning ''he/she/it forced, compelled, or obliged.'' | Example: El gobierno lo obligó a cerrar su negocio. | Synonyms: forzó, compelió, impuso', 1, 0, '2026-02-03', '2026-02-03 15:03:10', 1, NULL, 0, 0),
-(1315, 5, 'implemente', 'es', 'Implemente is a conjugated form of the verb "implementar" (to implement), used to express a formal command ("implement!") or a subjunctive action ("that I/he/she/you implement"). | Example: Espero que implemente las nuevas medidas pronto. | Synonyms: ejecute, realice, ponga en práctica', 1, 0, '2026-02-03', '2026-02-03 15:03:12', 1, NULL, 0, 0),
-(1316, 5, 'while', 'en', 'During the time that something else is happening, or at the same time as. | Example: She listened to music while she worked on her project. | Synonyms: during, meanwhile', 1, 0, '2026-02-03', '2026-02-03 15:03:26', 1, NULL, 0, 0),
-(1317, 5, 'stocks', 'en', 'Stocks are shares of ownership in a company, representing a claim on the company''s assets and earnings. | Example: She decided to invest in technology stocks, hoping for long-term growth. | Synonyms: shares, equities, securities', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1318, 5, 'आईआईट', 'hi', 'आईआईट भारत के प्रमुख सार्वजनिक तकनीकी विश्वविद्यालयों का एक समूह है जो इंजीनियरिंग और प्रौद्योगिकी के क्षेत्र में उच्च शिक्षा प्रदान करते हैं। | Example: मेरा सपना है कि मैं आईआईट दिल्ली में इंजीनियरिंग की पढ़ाई करूँ। | Synonyms: भारतीय प्रौद्योगिकी संस्थान, प्रमुख इंजीनियरिंग संस्थान, तकनीकी विश्वविद्यालय', 1, 0, '2026-02-03', '2026-02-03 15:03:27', 1, NULL, 0, 0),
-(1319, 5, 'स्पॉट्स', 'hi', 'स्पॉट्स का अर्थ है किसी सतह पर छोटे, अलग-अलग निशान, धब्बे या विशिष्ट स्थान। | Example: त्वचा पर लाल स्पॉट्स एलर्जी का संकेत हो सकते हैं। | Synonyms: धब्बे, निशान, दाग', 1, 0, '2026-02-03', '2026-02-03 15:03:27', 1, NULL, 0, 0),
-(1320, 5, 'stuff', 'en', 'A general term for a collection of various unspecified items, things, or material. | Example: I need to organize all the stuff in my garage before winter. | Synonyms: things, items, belongings', 1, 0, '2026-02-03', '2026-02-03 15:03:29', 1, NULL, 0, 0),
-(1321, 5, 'खिलाड', 'hi', 'वह व्यक्ति जो किसी खेल, क्रीड़ा या प्रतियोगिता में भाग लेता है। | Example: भारतीय टीम में कई प्रतिभाशाली खिलाड़ी हैं। | Synonyms: प्रतियोगी, एथलीट', 1, 0, '2026-02-03', '2026-02-03 15:03:36', 1, NULL, 0, 0),
-(1322, 5, 'ट्रेडिंग', 'hi', 'ट्रेडिंग का अर्थ है वित्तीय बाजारों में लाभ कमाने के उद्देश्य से संपत्ति, जैसे शेयर, कमोडिटी या मुद्राएँ, खरीदना और बेचना। | Example: आजकल बहुत से युवा ऑनलाइन ट्रेडिंग में अपनी किस्मत आजमा रहे हैं। | Synonyms: व्यापार, लेन-देन, खरीद-फरोख्त', 1, 0, '2026-02-03', '2026-02-03 15:03:34', 1, NULL, 0, 0),
-(1323, 5, 'शुल्क', 'hi', 'शुल्क का अर्थ किसी सेवा या वस्तु के बदले में दी जाने वाली धनराशि है। | Example: कॉलेज में प्रवेश के लिए आपको आवेदन शुल्क जमा करना होगा। | Synonyms: फीस, दाम, प्रभार', 1, 0, '2026-02-03', '2026-02-03 15:03:35', 1, NULL, 0, 0),
-(1324, 5, 'परीक्षण', 'hi', 'परीक्षण का अर्थ है किसी वस्तु, व्यक्ति या विचार की गुणवत्ता, क्षमता या सत्यता की जाँच करने की प्रक्रिया। | Example: नई दवा के प्रभाव का परीक्षण प्रयोगशाला में किया गया। | Synonyms: जाँच, परीक्षा, आजमाइश', 1, 0, '2026-02-03', '2026-02-03 15:03:35', 1, NULL, 0, 0),
-(1325, 5, 'libertarian', 'en', 'A libertarian is a person who advocates for minimal state intervention in both economic and social affairs, emphasizing individual liberty, free markets, and limited government. | Example: The candidate, a staunch libertarian, argued for the complete deregulation of industries and a significant reduction in taxes. | Synonyms: individualist, free-market advocate, classical liberal', 1, 0, '2026-02-03', '2026-02-03 15:03:36', 1, NULL, 0, 0),
-(1326, 5, 'election', 'en', 'An election is a formal and organized process by which a population chooses an individual or multiple individuals to hold public office or to decide on a particular issue by casting votes. | Example: The upcoming election will determine the new mayor for the city. | Synonyms: vote, poll, ballot', 1, 0, '2026-02-03', '2026-02-03 15:03:35', 1, NULL, 0, 0),
-(1327, 5, 'capability', 'en', 'The power or ability to do something, or the extent of one''s capacity. | Example: The new fighter jet boasts impressive capability for stealth and speed. | Synonyms: ability, capacity, potential', 1, 0, '2026-02-03', '2026-02-03 15:03:34', 1, NULL, 0, 0),
-(1328, 5, 'wanted', 'en', 'Desired or sought after, often due to need, popularity, or a legal warrant. | Example: The police issued an alert for the wanted suspect. | Synonyms: desired, sought-after, in-demand', 1, 0, '2026-02-03', '2026-02-03 15:03:38', 1, NULL, 0, 0),
-(1329, 5, 'green', 'en', 'The color between blue and yellow in the spectrum, often associated with nature, growth, and freshness. | Example: The lush green grass covered the entire field. | Synonyms: verdant, emerald, lime', 1, 0, '2026-02-03', '2026-02-03 15:03:36', 1, NULL, 0, 0),
-(1330, 5, 'vegetable', 'en', 'A plant or part of a plant that is eaten as food, typically savory and often served with the main course of a meal. | Example: For a healthy diet, it''s important to eat a variety of colorful vegetables every day. | Synonyms: produce, greens, plant food', 1, 0, '2026-02-03', '2026-02-03 15:03:36', 1, NULL, 0, 0),
-(1331, 5, 'matter', 'en', 'To be of importance or significance. | Example: Your opinion truly matters to me. | Synonyms: count, signify, be important', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1332, 5, 'creando', 'es', 'Creando is the gerund form of the verb "crear," meaning "creating" or "making something new." | Example: Los niños están creando dibujos coloridos para la exposición escolar. | Synonyms: haciendo, produciendo, diseñando', 1, 0, '2026-02-03', '2026-02-03 15:03:36', 1, NULL, 0, 0),
-(1333, 5, 'nuevos', 'es', 'Nuevos is the masculine plural form of the Spanish adjective "nuevo," meaning "new" or "recent." | Example: Los estudiantes nuevos llegaron hoy a la escuela. | Synonyms: recientes, estrenados', 1, 0, '2026-02-03', '2026-02-03 15:03:36', 1, NULL, 0, 0),
-(1334, 5, 'diccionario', 'es', 'Un diccionario es un libro o recurso electrónico que recopila y define palabras de uno o más idiomas, generalmente en orden alfabético. | Example: Siempre tengo un diccionario a mano cuando leo un libro en otro idioma. | Synonyms: léxico, vocabulario', 1, 0, '2026-02-03', '2026-02-03 15:03:36', 1, NULL, 0, 0),
-(1335, 5, 'bribón', 'es', 'A "bribón" is a mischievous, roguish, or sometimes dishonest person, often with a clever or cunning nature. | Example: El niño es un bribón, siempre haciendo travesuras en el jardín. | Synonyms: pícaro, granuja, truhán', 1, 0, '2026-02-03', '2026-02-03 15:03:38', 1, NULL, 0, 0),
-(1336, 5, 'siento', 'es', 'Siento is the first-person singular present indicative form of the Spanish verb "sentir," translating to "I feel" or "I am sorry/regret." | Example: Siento mucho lo que pasó. | Synonyms: lamento, percibo, noto', 1, 0, '2026-02-03', '2026-02-03 15:03:37', 1, NULL, 0, 0),
-(1337, 5, 'pilas', 'es', 'Pilas is an informal interjection used to urge someone to be alert, pay attention, or act quickly. | Example: ¡Pilas con la tarea, que se entrega mañana! | Synonyms: ¡Atención!, ¡Cuidado!, ¡Apúrate!', 1, 0, '2026-02-03', '2026-02-03 15:03:37', 1, NULL, 0, 0),
-(1338, 5, 'iguales', 'es', 'Iguales describes two or more things that are identical or equivalent in quantity, quality, value, or status. | Example: Todas las piezas del rompecabezas deben ser iguales para encajar correctamente. | Synonyms: similares, idénticos, parecidos', 1, 0, '2026-02-03', '2026-02-03 15:03:36', 1, NULL, 0, 0),
-(1339, 5, 'fin', 'es', 'The Spanish word "fin" refers to the end, conclusion, or purpose of something. | Example: El fin de semana fue muy relajante. | Synonyms: final, término, conclusión', 1, 0, '2026-02-03', '2026-02-03 15:03:35', 1, NULL, 0, 0),
-(1340, 5, 'textualmente', 'es', 'Textualmente describes something that is reproduced or stated using the exact original words, without alteration or interpretation. | Example: El periodista citó textualmente las declaraciones del ministro. | Synonyms: literalmente, verbatim, al pie de la letra', 1, 0, '2026-02-03', '2026-02-03 15:03:36', 1, NULL, 0, 0),
-(1341, 5, 'करेंग', 'hi', 'करेंगे एक क्रिया है जिसका अर्थ है भविष्य में किसी कार्य को करना या संपन्न करना। | Example: हम कल इस परियोजना पर काम करेंगे। | Synonyms: निष्पादित करेंगे, संपन्न करेंगे', 1, 0, '2026-02-03', '2026-02-03 15:03:39', 1, NULL, 0, 0),
-(1342, 5, 'खरीद', 'hi', 'खरीद (kharīd) refers to the act or process of acquiring something in exchange for money or its equivalent. | Example: यह मेरी अब तक की सबसे अच्छी खरीद है। (This is my best purchase to date.) | Synonyms: क्रय, खरीददारी, मोल', 1, 0, '2026-02-03', '2026-02-03 15:03:49', 1, NULL, 0, 0),
-(1343, 5, 'अडूस', 'hi', 'अडूस एक औषधीय पौधा है जिसके पत्तों का उपयोग खांसी और श्वसन संबंधी समस्याओं के इलाज के लिए किया जाता है। | Example: दादी ने खांसी के लिए अडूस के पत्तों का काढ़ा बनाया। | Synonyms: वासा, अड़ूसा', 1, 0, '2026-02-03', '2026-02-03 15:04:00', 1, NULL, 0, 0),
-(1344, 5, 'getting', 'en', 'The action or process of acquiring, receiving, becoming, or moving into a specified state or condition. | Example: Getting enough rest is essential for good health. | Synonyms: acquiring, obtaining, receiving', 1, 0, '2026-02-03', '2026-02-03 15:04:00', 1, NULL, 0, 0),
-(1345, 5, 'zero', 'en', 'The numerical digit 0, representing an absence of quantity or magnitude. | Example: The score was zero to zero at halftime. | Synonyms: naught, nothing, nil', 1, 0, '2026-02-03', '2026-02-03 15:04:02', 1, NULL, 0, 0),
-(1346, 5, 'dijeron', 'es', 'Dijeron is the past tense, third-person plural form of the verb ''decir,'' meaning ''they said'' or ''they told.'' | Example: Ellos dijeron que llegarían tarde a la reunión. | Synonyms: expresaron, manifestaron, comunicaron', 1, 0, '2026-02-03', '2026-02-03 15:04:02', 1, NULL, 0, 0),
-(1347, 5, 'जरूरत', 'hi', 'जरूरत refers to a need, requirement, or necessity for something essential or important. | Example: मुझे पानी की जरूरत है। (Mujhe paani ki zaroorat hai.) - I need water. | Synonyms: आवश्यकता, अनिवार्यता, मांग', 1, 0, '2026-02-03', '2026-02-03 15:04:04', 1, NULL, 0, 0),
-(1348, 5, 'apartment', 'en', 'An apartment is a self-contained housing unit that occupies only part of a larger building, typically on a single floor. | Example: They are looking for a two-bedroom apartment to rent in the city center. | Synonyms: flat, condo, suite', 1, 0, '2026-02-03', '2026-02-03 15:04:04', 1, NULL, 0, 0),
-(1349, 5, 'building', 'en', 'A structure with a roof and walls, such as a house or factory, built for permanent use. | Example: The new office building has twenty floors and a modern design. | Synonyms: structure, edifice, construction', 1, 0, '2026-02-03', '2026-02-03 15:04:04', 1, NULL, 0, 0),
-(1350, 5, 'evidente', 'es', 'Evidente describes something that is clear, obvious, or easily perceived and understood without needing proof. | Example: Es evidente que el sol sale por el este cada mañana. | Synonyms: claro, obvio, manifiesto', 1, 0, '2026-02-03', '2026-02-03 15:04:11', 1, NULL, 0, 0),
-(1351, 5, 'सार', 'hi', 'सार का अर्थ है किसी चीज़ का मूल तत्व, निचोड़ या मुख्य भाग। | Example: इस कहानी का सार कुछ ही शब्दों में बताया जा सकता है। | Synonyms: निचोड़, तत्व, संक्षेप', 1, 0, '2026-02-03', '2026-02-03 15:04:13', 1, NULL, 0, 0),
-(1352, 5, 'lil', 'en', '"Lil" is an informal abbreviation of "little," meaning small in size, amount, or degree, or young. | Example: My lil brother just started kindergarten this year. | Synonyms: little, small, young', 1, 0, '2026-02-03', '2026-02-03 15:04:13', 1, NULL, 0, 0),
-(1353, 5, 'kim', 'en', 'Kim, also spelled gim, is a thin, edible seaweed, typically roasted and seasoned, that is a staple in Korean cuisine. | Example: For a quick snack, she often munched on crispy sheets of kim. | Synonyms: seaweed, laver', 1, 0, '2026-02-03', '2026-02-03 15:04:20', 1, NULL, 0, 0),
-(1354, 5, 'अधिकांश', 'hi', 'अधिकांश का अर्थ है किसी समूह या मात्रा का सबसे बड़ा हिस्सा या बहुमत। | Example: अधिकांश लोग इस बात से सहमत हैं कि शिक्षा बहुत महत्वपूर्ण है। | Synonyms: अधिकतर, ज्यादातर, बहुमत', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1355, 5, 'अरुण', 'hi', 'अरुण का अर्थ है सूर्योदय के समय आकाश में फैलने वाली लालिमा या स्वयं सूर्य। | Example: सुबह का अरुण क्षितिज पर अपनी छटा बिखेर रहा था। | Synonyms: सूर्य, प्रभात, भोर', 1, 0, '2026-02-03', '2026-02-03 15:04:22', 1, NULL, 0, 0),
-(1356, 5, 'obviously', 'en', 'In a way that is easily perceived, understood, or recognized; clearly and without doubt. | Example: She was obviously upset by the news, as tears welled up in her eyes. | Synonyms: clearly, evidently, plainly', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1357, 5, 'okay', 'es', 'A loanword from English, ''okay'' is used in Spanish to express agreement, affirmation, or to indicate that something is satisfactory or in good condition. | Example: Okay, nos vemos mañana a las diez. | Synonyms: Está bien, De acuerdo, Vale', 1, 0, '2026-02-03', '2026-02-03 15:04:26', 1, NULL, 0, 0),
-(1358, 5, 'फैसल', 'hi', 'फैसल एक अरबी मूल का पुरुष नाम है जिसका अर्थ ''न्याय करने वाला'', ''निर्णायक'' या ''सत्य और असत्य को अलग करने वाला'' होता है। | Example: मेरे एक मित्र का नाम फैसल है। | Synonyms: न्यायकर्ता, निर्णायक, मध्यस्थ', 1, 0, '2026-02-03', '2026-02-03 15:04:28', 1, NULL, 0, 0),
-(1359, 5, 'रहत', 'hi', 'रहत का अर्थ है किसी कष्ट, पीड़ा या तनाव से मिलने वाली शांति या आराम। | Example: दवा खाने के बाद दर्द में थोड़ी राहत महसूस हुई। | Synonyms: आराम, चैन, सुकून', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1360, 5, 'address', 'en', 'To direct speech or writing to someone, or to give attention to and deal with a problem or issue. | Example: The committee will address the budget deficit at their next meeting. | Synonyms: speak to, handle, tackle', 1, 0, '2026-02-03', '2026-02-03 15:04:31', 1, NULL, 0, 0),
-(1361, 5, 'estas', 'es', 'Estas is a Spanish demonstrative adjective and pronoun used to refer to multiple feminine nouns that are close to the speaker, meaning "these". | Example: Estas manzanas son rojas. | Synonyms: estos, esas, aquellas', 1, 0, '2026-02-03', '2026-02-03 15:04:38', 1, NULL, 0, 0),
-(1362, 5, 'guess', 'en', 'To form an opinion or estimate about something without sufficient information to be sure of being correct. | Example: I guess she will arrive around 3 PM, but I''m not certain. | Synonyms: estimate, surmise, conjecture', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(1363, 5, 'empresa', 'es', 'An organization or entity, typically commercial or industrial, engaged in economic activity with the aim of producing goods or services. | Example: Mi hermana fundó una empresa de diseño gráfico el año pasado. | Synonyms: negocio, compañía, firma', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1364, 5, 'learned', 'en', '', 0, 0, '2026-02-03', '2026-02-03 15:04:55', 1, NULL, 0, 0),
-(1365, 5, 'इंग्लैंड', 'hi', 'इंग्लैंड यूनाइटेड किंगडम का एक देश है जो ग्रेट ब्रिटेन द्वीप के दक्षिणी भाग में स्थित है। | Example: वह इंग्लैंड में अपनी पढ़ाई पूरी करने गया है। | Synonyms: यूनाइटेड किंगडम, ब्रिटेन', 1, 0, '2026-02-03', '2026-02-03 15:05:00', 1, NULL, 0, 0),
-(1366, 5, 'सोचिए', 'hi', 'सोचिए का अर्थ है किसी विषय पर विचार करने या मनन करने का विनम्र निर्देश देना। | Example: इस समस्या पर गंभीरता से सोचिए। | Synonyms: विचार करें, चिंतन करें, गौर करें', 1, 0, '2026-02-03', '2026-02-03 15:05:06', 1, NULL, 0, 0),
-(1367, 5, 'लगाय', 'hi', 'लगाय क्रिया ''लगाना'' का एक रूप है जिसका अर्थ है किसी वस्तु को कहीं रखना, चिपकाना, या किसी कार्य को आरंभ करना। | Example: उसने दीवार पर पोस्टर लगाय। | Synonyms: रखा, चिपकाया, स्थापित किया', 1, 0, '2026-02-03', '2026-02-03 15:05:27', 1, NULL, 0, 0),
-(1368, 5, 'right', 'en', 'Morally good, justified, or in accordance with what is true or factual. | Example: It is important to do the right thing, even when no one is watching. | Synonyms: correct, proper, just', 1, 0, '2026-02-03', '2026-02-04', 7, NULL, 0, 0),
-(1369, 5, 'además', 'es', 'The Spanish word "además" is an adverb used to introduce additional information, meaning "in addition," "besides," or "furthermore." | Example: Me gusta el café y, además, el té. | Synonyms: también, asimismo, aparte', 1, 0, '2026-02-03', '2026-02-03 15:05:24', 1, NULL, 0, 0),
-(1370, 5, 'then', 'en', 'Then refers to a particular time in the past or future, or indicates the next in a sequence of events or logical consequence. | Example: First, we''ll eat dinner, then we''ll watch a movie. | Synonyms: afterwards, next, subsequently', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1371, 5, 'también', 'es', 'También is a Spanish adverb used to express ''also,'' ''too,'' or ''as well,'' indicating that something applies in the same way or is included in addition. | Example: Yo también quiero ir al cine. | Synonyms: asimismo, además, igualmente', 1, 0, '2026-02-03', '2026-02-03 15:05:28', 1, NULL, 0, 0),
-(1372, 5, 'रहन', 'hi', 'रहन का अर्थ है किसी व्यक्ति के जीवन जीने का तरीका या उसकी जीवन शैली। | Example: उसकी रहन-सहन बहुत सादी है। | Synonyms: जीवन शैली, आचरण, चाल-चलन', 1, 0, '2026-02-03', '2026-02-03 15:05:32', 1, NULL, 0, 0),
-(1373, 5, 'area', 'en', 'Area refers to a particular extent or space, or the measure of a two-dimensional surface. | Example: The construction project will cover a large area of the city park. | Synonyms: region, zone, expanse', 1, 0, '2026-02-03', '2026-02-03 15:05:32', 1, NULL, 0, 0),
-(1374, 5, 'फिल्म', 'hi', 'फिल्म एक चलचित्र है जो कहानी या जानकारी को दृश्यों और ध्वनियों के माध्यम से प्रस्तुत करता है। | Example: मैंने कल रात एक बहुत अच्छी फिल्म देखी। | Synonyms: चलचित्र, सिनेमा, पिक्चर', 1, 0, '2026-02-03', '2026-02-03 15:05:36', 1, NULL, 0, 0),
-(1375, 5, 'believe', 'en', 'To accept something as true, real, or honest, often without absolute proof. | Example: I believe in the importance of honesty and hard work. | Synonyms: trust, accept, credit', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(1376, 5, 'ready', 'en', 'Fully prepared for an activity, event, or situation. | Example: The team was ready to start the game after their warm-up. | Synonyms: prepared, set, poised', 1, 0, '2026-02-03', '2026-02-03 15:05:42', 1, NULL, 0, 0),
-(1377, 5, 'कमर', 'hi', 'कमर शरीर का वह हिस्सा है जो पसलियों और कूल्हों के बीच होता है। | Example: उसने अपनी कमर पर हाथ रखा। | Synonyms: कटि, मध्यभाग', 1, 0, '2026-02-03', '2026-02-03 15:05:45', 1, NULL, 0, 0),
-(1378, 5, 'running', 'en', 'The action or sport of moving rapidly on foot, typically with both feet leaving the ground at some point during each stride. | Example: He found great joy in running through the park every sunrise. | Synonyms: jogging, sprinting, dashing', 1, 0, '2026-02-03', '2026-02-03 15:05:49', 1, NULL, 0, 0),
-(1379, 5, 'amazing', 'en', 'Causing great wonder, astonishment, or admiration; extremely impressive or surprising. | Example: The magician''s trick was truly amazing, leaving the audience speechless. | Synonyms: incredible, astonishing, wonderful', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1380, 5, 'सुन', 'hi', 'सुन का अर्थ है किसी ध्वनि या बात को कानों से ग्रहण करना। | Example: कृपया मेरी बात ध्यान से सुनो। | Synonyms: श्रवण करना, ध्यान से सुनना', 1, 0, '2026-02-03', '2026-02-03 15:06:00', 1, NULL, 0, 0),
-(1381, 5, 'god', 'en', 'The supreme being, creator, and ruler of the universe in monotheistic religions, or one of several deities worshipped in polytheistic religions. | Example: Many people believe that God is the ultimate source of love and wisdom. | Synonyms: deity, supreme being, creator', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(1382, 5, 'kidding', 'en', 'Kidding refers to the act of joking, teasing, or speaking in a non-serious manner, often to amuse or playfully deceive someone. | Example: I was just kidding when I said I ate all your cookies. | Synonyms: joking, teasing, fooling', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1383, 5, 'yes', 'en', NULL, 0, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(1384, 5, 'sir', 'en', 'Sir is a polite and respectful term used to address a man, especially one of higher status, or as a title for a knight or baronet. | Example: Excuse me, sir, could you please direct me to the nearest exit? | Synonyms: gentleman, mister', 1, 0, '2026-02-03', '2026-02-03 15:06:32', 1, NULL, 0, 0),
-(1385, 5, 'यशवंत', 'hi', 'यशवंत उस व्यक्ति को कहते हैं जिसने प्रसिद्धि, सफलता या गौरव प्राप्त किया हो। | Example: यशवंत खिलाड़ी ने अपने देश का नाम रोशन किया। | Synonyms: प्रसिद्ध, यशस्वी, विख्यात', 1, 0, '2026-02-03', '2026-02-03 15:06:33', 1, NULL, 0, 0),
-(1386, 5, 'सिन्ह', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:06:33', 1, NULL, 0, 0),
-(1387, 5, 'thirty', 'en', 'Thirty is the cardinal number that is equal to three times ten. | Example: There are thirty days in the month of April. | Synonyms: 30, three tens', 1, 0, '2026-02-03', '2026-02-03 15:06:35', 1, NULL, 0, 0),
-(1388, 5, 'help', 'en', 'To provide assistance or support to someone in need or to make it easier for something to happen. | Example: Please help me move this heavy table to the other room. | Synonyms: assist, aid, support', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1389, 5, 'commend', 'en', 'To praise someone or something formally or officially, often for an achievement or quality. | Example: The general commended the soldiers for their bravery and dedication during the mission. | Synonyms: praise, applaud, laud', 1, 0, '2026-02-03', '2026-02-03 15:06:59', 1, NULL, 0, 0),
-(1390, 5, 'पंहुच', 'hi', 'The ability to reach a place or person, or the influence one possesses. | Example: उसकी उच्च अधिकारियों तक अच्छी पंहुच है। (Uski uchch adhikariyon tak achchi pahunch hai.) - He has good access/influence with high officials. | Synonyms: अभिगम, प्रभाव, आगमन', 1, 0, '2026-02-03', '2026-02-03 15:07:07', 1, NULL, 0, 0),
-(1391, 5, 'two', 'en', 'Two is the cardinal number equivalent to the sum of one and one, representing a quantity of two units or items. | Example: She bought two tickets for the concert. | Synonyms: couple, pair, brace', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(1392, 5, 'रोशन', 'hi', 'रोशन का अर्थ है प्रकाशित, चमकीला या उज्ज्वल। | Example: आज चाँदनी रात में आसमान बहुत रोशन है। | Synonyms: प्रकाशित, चमकीला, उज्ज्वल', 1, 0, '2026-02-03', '2026-02-03 15:07:17', 1, NULL, 0, 0),
-(1393, 5, 'blog', 'es', 'Un sitio web donde se publican periódicamente artículos o entradas sobre un tema específico, generalmente en orden cronológico inverso. | Example: Me gusta leer blogs de cocina para encontrar nuevas recetas. | Synonyms: bitácora, diario digital, weblog', 1, 0, '2026-02-03', '2026-02-03 15:07:20', 1, NULL, 0, 0),
-(1394, 5, 'गुर', 'hi', 'गुर का अर्थ किसी कार्य को करने का रहस्य, तरीका, या विशेष कौशल है। | Example: उसे खाना बनाने के सारे गुर पता हैं। | Synonyms: रहस्य, तरीका, कौशल', 1, 0, '2026-02-03', '2026-02-03 15:07:23', 1, NULL, 0, 0),
-(1395, 5, 'revenue', 'en', 'Revenue is the total income generated by a company or organization from its normal business operations before any expenses are deducted. | Example: The company''s quarterly revenue exceeded expectations due to strong sales of its new product line. | Synonyms: income, earnings, proceeds', 1, 0, '2026-02-03', '2026-02-03 15:07:23', 1, NULL, 0, 0),
-(1396, 5, 'असलियत', 'hi', 'असलियत refers to the true state of things, the reality, or the genuineness of something. | Example: उसने मुझे असलियत बताई कि क्या हुआ था। (He told me the reality of what had happened.) | Synonyms: सच्चाई, वास्तविकता, हकीकत', 1, 0, '2026-02-03', '2026-02-03 15:07:28', 1, NULL, 0, 0),
-(1397, 5, 'रुधिर', 'hi', 'रुधिर शरीर में बहने वाला लाल तरल पदार्थ है जो ऑक्सीजन और पोषक तत्वों का परिवहन करता है। | Example: चोट लगने पर रुधिर बहने लगता है। | Synonyms: रक्त, खून, लहू', 1, 0, '2026-02-03', '2026-02-03 15:07:28', 1, NULL, 0, 0),
-(1398, 5, 'plan', 'en', 'A detailed proposal for doing or achieving something, often outlining a sequence of actions or a method. | Example: The architect presented a comprehensive plan for the new building. | Synonyms: scheme, strategy, blueprint', 1, 0, '2026-02-03', '2026-02-03 15:07:29', 1, NULL, 0, 0),
-(1399, 5, 'cruz', 'es', 'La palabra "cruz" se refiere a un símbolo u objeto formado por dos líneas o piezas que se intersectan, comúnmente usado como emblema religioso, especialmente en el cristianismo, o como una marca. | Example: La iglesia tenía una gran cruz de madera en su altar principal. | Synonyms: crucifijo, señal, intersección', 1, 0, '2026-02-03', '2026-02-03 15:07:29', 1, NULL, 0, 0),
-(1400, 5, 'बयान', 'hi', 'किसी बात को कहने या प्रकट करने की क्रिया या कही हुई बात। | Example: पुलिस ने चोर का बयान दर्ज किया। | Synonyms: कथन, वक्तव्य, इकरार', 1, 0, '2026-02-03', '2026-02-03 15:07:32', 1, NULL, 0, 0),
-(1401, 5, 'चाहत', 'hi', 'चाहत refers to a strong desire, longing, or affection for someone or something. | Example: उसकी चाहत थी कि वह एक सफल कलाकार बने। (His desire was to become a successful artist.) | Synonyms: इच्छा, अभिलाषा, प्रेम', 1, 0, '2026-02-03', '2026-02-03 15:07:31', 1, NULL, 0, 0),
-(1402, 5, 'over', 'en', 'Expressing position above or across something, often with movement. | Example: The plane flew over the city. | Synonyms: above, across, beyond', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1403, 5, 'neighbors', 'en', 'Neighbors are people who live next door to or very near one another. | Example: Our neighbors helped us find our lost dog. | Synonyms: residents, dwellers, community members', 1, 0, '2026-02-03', '2026-02-03 15:07:34', 1, NULL, 0, 0),
-(1404, 5, 'awesome', 'en', 'Inspiring an overwhelming feeling of admiration, awe, or wonder; extremely impressive or excellent. | Example: The view from the top of the mountain was absolutely awesome. | Synonyms: amazing, fantastic, incredible', 1, 0, '2026-02-03', '2026-02-03 15:07:42', 1, NULL, 0, 0),
-(1405, 5, 'así', 'es', 'Así is a Spanish adverb that indicates manner, consequence, or degree, meaning ''thus,'' ''so,'' ''like this/that,'' or ''in this/that way.'' | Example: Así se hace. | Synonyms: de esta manera, de ese modo, por lo tanto', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1406, 5, 'मुसाफिर', 'hi', 'मुसाफिर वह व्यक्ति है जो एक स्थान से दूसरे स्थान तक यात्रा कर रहा हो। | Example: ट्रेन में कई मुसाफिर अपनी मंजिल की ओर जा रहे थे। | Synonyms: यात्री, पथिक, राही', 1, 0, '2026-02-03', '2026-02-03 15:07:41', 1, NULL, 0, 0),
-(1407, 5, 'बीबीस', 'hi', 'बीबीस" शब्द मानक हिंदी में प्रचलित नहीं है; यदि यह "बीस" की गलत वर्तनी है, तो इसका अर्थ संख्या 20 है। | Example: मेरे पास बीस रुपये हैं। | Synonyms: बीस की संख्या, दो दहाई', 1, 0, '2026-02-03', '2026-02-03 15:07:54', 1, NULL, 0, 0),
-(1408, 5, 'लिंक', 'hi', 'लिंक एक डिजिटल कड़ी या संबंध है जो किसी वेबपेज, फ़ाइल या संसाधन तक पहुँचने का मार्ग प्रदान करता है। | Example: कृपया मुझे उस लेख का लिंक भेजें। | Synonyms: कड़ी, संबंध, जोड़', 1, 0, '2026-02-03', '2026-02-03 15:07:48', 1, NULL, 0, 0),
-(1409, 5, 'gonna', 'en', 'Gonna is an informal, colloquial contraction of the phrase ''going to'', used to indicate future action or intention. | Example: I''m gonna call you later to discuss the plans. | Synonyms: going to, will, intend to', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(1410, 5, 'मतलब', 'hi', 'मतलब refers to the significance, sense, or intention behind something, or one''s self-interest. | Example: इस शब्द का मतलब क्या है? | Synonyms: अर्थ, तात्पर्य, अभिप्राय', 1, 0, '2026-02-03', '2026-02-03 15:07:53', 1, NULL, 0, 0),
-(1411, 5, 'facebook', 'en', 'Facebook is a widely used social networking service that enables users to create profiles, share content, and connect with others online. | Example: She often checks Facebook to see updates from her family and friends. | Synonyms: social media platform, social network, online community', 1, 0, '2026-02-03', '2026-02-03 15:08:04', 1, NULL, 0, 0),
-(1412, 5, 'अखबार', 'hi', 'यह एक मुद्रित प्रकाशन है जो आमतौर पर दैनिक या साप्ताहिक रूप से समाचार, लेख और विज्ञापन प्रकाशित करता है। | Example: मैं हर सुबह चाय के साथ अखबार पढ़ना पसंद करता हूँ। | Synonyms: समाचार पत्र, दैनिक पत्र, खबरनामा', 1, 0, '2026-02-03', '2026-02-03 15:08:19', 1, NULL, 0, 0),
-(1413, 5, 'मानन', 'hi', 'मानन refers to the act of accepting, respecting, or believing something or someone. | Example: सत्य का मानन सदैव महत्वपूर्ण होता है। (The acceptance of truth is always important.) | Synonyms: स्वीकृति (Sweekriti), आदर (Aadar), विश्वास (Vishwas)', 1, 0, '2026-02-03', '2026-02-03 15:08:23', 1, NULL, 0, 0),
-(1414, 5, 'mother', 'en', 'A female parent of a child. | Example: My mother always encouraged me to follow my dreams. | Synonyms: mom, mama, matriarch', 1, 0, '2026-02-03', '2026-02-03 15:08:18', 1, NULL, 0, 0),
-(1415, 5, 'one', 'en', 'The cardinal number between zero and two, representing a single unit or individual. | Example: She bought one book from the store. | Synonyms: single, sole, a', 1, 0, '2026-02-03', '2026-02-04', 10, NULL, 0, 0),
-(1416, 5, 'अनुमान', 'hi', 'किसी बात या स्थिति के बारे में उपलब्ध जानकारी या अंतर्ज्ञान के आधार पर बिना पूर्ण निश्चितता के राय या निर्णय बनाना। | Example: मौसम विभाग ने आज बारिश का अनुमान लगाया है। | Synonyms: अंदाज़ा, कल्पना, भविष्यवाणी', 1, 0, '2026-02-03', '2026-02-03 15:08:22', 1, NULL, 0, 0),
-(1417, 5, 'also', 'en', 'Also is an adverb used to indicate that something is true or happening in addition to something else already mentioned. | Example: She is a talented singer, and she also plays the piano. | Synonyms: too, as well, in addition', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(1418, 5, 'गांधीज', 'hi', 'महात्मा गांधी को आदरपूर्वक संबोधित करने का एक तरीका। | Example: गांधीजी ने भारत को स्वतंत्रता दिलाने में महत्वपूर्ण भूमिका निभाई। | Synonyms: महात्मा गांधी, बापू, मोहनदास करमचंद गांधी', 1, 0, '2026-02-03', '2026-02-03 15:08:30', 1, NULL, 0, 0),
-(1419, 5, 'हाथ', 'hi', 'हाथ शरीर का वह अंग है जिसका उपयोग वस्तुओं को पकड़ने, छूने और काम करने के लिए किया जाता है। | Example: उसने अपने हाथ से गेंद पकड़ी। | Synonyms: कर, हस्त', 1, 0, '2026-02-03', '2026-02-03 15:08:30', 1, NULL, 0, 0),
-(1420, 5, 'उठाकर', 'hi', 'किसी वस्तु को नीचे से ऊपर की ओर ले जाने की क्रिया करके। | Example: उसने ज़मीन से पत्थर उठाकर फेंका। | Synonyms: लेकर, पकड़कर', 1, 0, '2026-02-03', '2026-02-03 15:08:32', 1, NULL, 0, 0),
-(1421, 5, 'luz', 'es', 'Luz refers to the natural agent that stimulates sight and makes things visible, or the emission of electromagnetic radiation. | Example: Por la mañana, la luz del sol entra por mi ventana. | Synonyms: claridad, luminosidad, resplandor', 1, 0, '2026-02-03', '2026-02-03 15:08:32', 1, NULL, 0, 0),
-(1422, 5, 'diurna', 'es', 'Diurna describes something that occurs, exists, or is active during the day, as opposed to at night. | Example: La actividad diurna de este animal es muy intensa. | Synonyms: del día, cotidiana', 1, 0, '2026-02-03', '2026-02-03 15:08:37', 1, NULL, 0, 0),
-(1423, 5, 'their', 'en', 'Belonging to or associated with the people or things previously mentioned or easily identified. | Example: The students submitted their assignments on time. | Synonyms: collective, joint', 1, 0, '2026-02-03', '2026-02-03 15:08:41', 1, NULL, 0, 0),
-(1424, 5, 'community', 'en', 'A group of people living in the same place or having a particular characteristic, interest, or feeling of unity in common. | Example: The local community worked together to clean up the park. | Synonyms: group, society, neighborhood', 1, 0, '2026-02-03', '2026-02-03 15:08:33', 1, NULL, 0, 0),
-(1425, 5, 'निर्मल', 'hi', 'निर्मल का अर्थ है जो स्वच्छ, शुद्ध, और दोषरहित हो। | Example: पहाड़ी झरने का पानी बहुत निर्मल था। | Synonyms: स्वच्छ, शुद्ध, पवित्र', 1, 0, '2026-02-03', '2026-02-03 15:08:34', 1, NULL, 0, 0),
-(1426, 5, 'सुंदर', 'hi', 'सुंदर का अर्थ है जो देखने में आकर्षक या मनमोहक हो। | Example: यह फूल बहुत सुंदर है। | Synonyms: खूबसूरत, मनमोहक, आकर्षक', 1, 0, '2026-02-03', '2026-02-03 15:08:43', 1, NULL, 0, 0),
-(1427, 5, 'शिकार', 'hi', 'शिकार का अर्थ है जानवरों का आखेट करना, वह जानवर जिसका आखेट किया गया हो (शिकार), या किसी घटना का पीड़ित व्यक्ति। | Example: शेर ने जंगल में हिरण का शिकार किया। | Synonyms: आखेट, पीड़ित', 1, 0, '2026-02-03', '2026-02-03 15:08:52', 1, NULL, 0, 0),
-(1428, 5, 'well', 'en', 'In a good, proper, or satisfactory manner. | Example: He plays the piano very well. | Synonyms: skillfully, competently, effectively', 1, 0, '2026-02-03', '2026-02-03', 4, NULL, 0, 0),
-(1429, 5, 'दुख', 'hi', 'मन में होने वाली पीड़ा, वेदना या अप्रसन्नता की भावना। | Example: उसे अपने मित्र के खो जाने का बहुत दुख हुआ। | Synonyms: पीड़ा, वेदना, शोक', 1, 0, '2026-02-03', '2026-02-03 15:08:58', 1, NULL, 0, 0),
-(1430, 5, 'cool', 'en', 'Fashionable, attractive, or impressive in a way that is generally admired. | Example: That new vintage leather jacket looks really cool on you. | Synonyms: stylish, trendy, awesome', 1, 0, '2026-02-03', '2026-02-03', 5, NULL, 0, 0),
-(1431, 5, 'बढ़िय', 'hi', 'यह शब्द किसी वस्तु, व्यक्ति या स्थिति की उच्च गुणवत्ता, उत्कृष्टता या संतोषजनक होने का बोध कराता है। | Example: आज मौसम बहुत बढ़िया है। | Synonyms: अच्छा, उत्तम, शानदार', 1, 0, '2026-02-03', '2026-02-03 15:09:02', 1, NULL, 0, 0),
-(1432, 5, 'martín', 'es', 'El martín es un ave acuática de plumaje brillante y pico largo, conocida por pescar en ríos y lagos. | Example: El martín se zambulló rápidamente en el agua para atrapar un pez. | Synonyms: martín pescador, alción, guardarríos', 1, 0, '2026-02-03', '2026-02-03 15:09:07', 1, NULL, 0, 0),
-(1433, 5, 'iceland', 'en', 'Iceland is a Nordic island nation in the North Atlantic Ocean, renowned for its dramatic volcanic landscapes, geysers, hot springs, and the Northern Lights. | Example: Many adventurers dream of visiting Iceland to hike its glaciers and witness its active volcanoes. | Synonyms: Republic of Iceland, The Land of Fire and Ice', 1, 0, '2026-02-03', '2026-02-03 15:09:12', 1, NULL, 0, 0),
-(1434, 5, 'आइसलैंड', 'hi', 'उत्तरी अटलांटिक महासागर में स्थित एक यूरोपीय द्वीप देश, जो अपने ज्वालामुखियों, गर्म झरनों, ग्लेशियरों और उत्तरी रोशनी के लिए प्रसिद्ध है। | Example: आइसलैंड अपनी अनूठी भूगर्भीय गतिविधियों और प्राकृतिक सुंदरता के लिए जाना जाता है। | Synonyms: आइसलैंड गणराज्य, Iceland', 1, 0, '2026-02-03', '2026-02-03 15:09:15', 1, NULL, 0, 0),
-(1435, 5, 'माइकल', 'hi', 'माइकल एक पुरुष का नाम है जो अक्सर पश्चिमी संस्कृतियों में पाया जाता है। | Example: माइकल जैक्सन एक प्रसिद्ध गायक थे। | Synonyms: माइक, जॉन, पीटर', 1, 0, '2026-02-03', '2026-02-03 15:09:39', 1, NULL, 0, 0),
-(1436, 5, 'cause', 'en', 'To make something happen or to be the reason for an event or action. | Example: The heavy rainfall caused widespread flooding in the region. | Synonyms: trigger, bring about, lead to', 1, 0, '2026-02-03', '2026-02-03 15:09:52', 1, NULL, 0, 0),
-(1437, 5, 'गाय', 'hi', 'गाय एक पालतू पशु है जो दूध देती है और हिंदू धर्म में पवित्र मानी जाती है। | Example: किसान अपनी गायों को चरा रहा है। | Synonyms: धेनु, गौ, सुरभि', 1, 0, '2026-02-03', '2026-02-03 15:10:12', 1, NULL, 0, 0),
-(1438, 5, 'संतुष्ट', 'hi', 'जो किसी बात से प्रसन्न या तृप्त हो। | Example: वह अपने काम से संतुष्ट है। | Synonyms: प्रसन्न, तृप्त, खुश', 1, 0, '2026-02-03', '2026-02-03 15:10:13', 1, NULL, 0, 0),
-(1439, 5, 'where', 'en', 'In or at what place or position. | Example: Where did you put the car keys? | Synonyms: location, place, position', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1440, 5, 'guys', 'en', 'An informal term used to refer to a group of people, often but not exclusively men, or sometimes to an individual. | Example: Hey guys, what are your plans for the weekend? | Synonyms: people, folks, everyone', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1441, 5, 'start', 'en', 'To begin an action, process, or journey. | Example: We need to start the project by next Monday. | Synonyms: begin, commence, initiate', 1, 0, '2026-02-03', '2026-02-03 15:10:14', 1, NULL, 0, 0),
-(1442, 5, 'doing', 'en', 'The act of performing an action or engaging in an activity. | Example: The doing of daily chores is essential for maintaining a tidy home. | Synonyms: action, activity, performance', 1, 0, '2026-02-03', '2026-02-03 15:10:16', 1, NULL, 0, 0),
-(1443, 5, 'liga', 'es', 'Liga refers to a union, alliance, or association, especially in sports, or a metal alloy. | Example: El equipo ganó el campeonato de la liga. | Synonyms: unión, alianza, asociación', 1, 0, '2026-02-03', '2026-02-03 15:10:16', 1, NULL, 0, 0),
-(1444, 5, 'sánchez', 'es', 'Sánchez is a common Spanish patronymic surname, meaning ''son of Sancho''. | Example: La señora Sánchez es mi nueva vecina. | Synonyms: García, Rodríguez, Fernández', 1, 0, '2026-02-03', '2026-02-03 15:10:15', 1, NULL, 0, 0),
-(1445, 5, 'hábito', 'es', 'Una costumbre o práctica que se realiza de manera frecuente y regular. | Example: Dejar de fumar fue un hábito difícil de romper para él. | Synonyms: costumbre, rutina, práctica', 1, 0, '2026-02-03', '2026-02-03 15:10:13', 1, NULL, 0, 0),
-(1446, 5, 'lector', 'es', 'A ''lector'' is a person who reads. | Example: El lector de la biblioteca pidió prestado el último best-seller. | Synonyms: leyente, aficionado a la lectura', 1, 0, '2026-02-03', '2026-02-03 15:10:14', 1, NULL, 0, 0),
-(1447, 5, 'verla', 'es', 'Verla is a Spanish verb phrase formed by the infinitive verb "ver" (to see) and the direct object pronoun "la" (her or it, feminine singular), meaning "to see her" or "to see it (feminine)". | Example: Necesito verla para hablar con ella sobre el proyecto. (I need to see her to talk to her about the project.) | Synonyms: observarla, mirarla', 1, 0, '2026-02-03', '2026-02-03 15:10:15', 1, NULL, 0, 0),
-(1448, 5, 'वर्ल्डवाइड', 'hi', 'वर्ल्डवाइड का अर्थ है जो पूरी दुनिया में फैला हुआ हो या जाना जाता हो। | Example: यह गाना वर्ल्डवाइड हिट हो गया है। | Synonyms: विश्वव्यापी, वैश्विक, अंतर्राष्ट्रीय', 1, 0, '2026-02-03', '2026-02-03 15:10:16', 1, NULL, 0, 0),
-(1449, 5, 'बॉक्स', 'hi', 'बॉक्स एक आयताकार या चौकोर पात्र होता है जिसका उपयोग वस्तुओं को रखने या ले जाने के लिए किया जाता है। | Example: उसने उपहार को एक सुंदर बॉक्स में पैक किया। | Synonyms: डिब्बा, पेटी, संदूक', 1, 0, '2026-02-03', '2026-02-03 15:10:15', 1, NULL, 0, 0),
-(1450, 5, 'डीमैट', 'hi', 'डीमैट एक प्रकार का खाता है जिसमें शेयर और अन्य प्रतिभूतियाँ भौतिक रूप के बजाय इलेक्ट्रॉनिक रूप में रखी जाती हैं। | Example: शेयर बाज़ार में निवेश करने के लिए डीमैट खाता खोलना अनिवार्य है। | Synonyms: डीमैट खाता, अभौतिकृत खाता, इलेक्ट्रॉनिक प्रतिभूति खाता', 1, 0, '2026-02-03', '2026-02-03 15:10:26', 1, NULL, 0, 0),
-(1451, 5, 'अकाउंट', 'hi', 'अकाउंट एक वित्तीय लेनदेन का रिकॉर्ड या किसी सेवा के लिए बनाया गया औपचारिक खाता होता है। | Example: मैंने बैंक में एक नया सेविंग अकाउंट खोला है। | Synonyms: खाता, लेखा', 1, 0, '2026-02-03', '2026-02-03 15:10:22', 1, NULL, 0, 0),
-(1452, 5, 'demon', 'en', 'A supernatural, evil spirit, often depicted as a tormentor or tempter. | Example: Many ancient myths feature heroes battling powerful demons. | Synonyms: devil, fiend, evil spirit', 1, 0, '2026-02-03', '2026-02-03 15:10:22', 1, NULL, 0, 0),
-(1453, 5, 'legítima', 'es', 'La legítima es la porción de una herencia que la ley reserva obligatoriamente a ciertos herederos, como los hijos, de la cual el testador no puede disponer libremente. | Example: En muchos sistemas legales, la legítima asegura que los descendientes reciban una parte mínima de la herencia. | Synonyms: herencia forzosa, cuota legal, reserva hereditaria', 1, 0, '2026-02-03', '2026-02-03 15:10:24', 1, NULL, 0, 0),
-(1454, 5, 'compartir', 'es', 'To share; to divide and distribute something among several people, or to have or use something in common with others. | Example: Me gusta compartir mis conocimientos con mis estudiantes. | Synonyms: distribuir, repartir, participar', 1, 0, '2026-02-03', '2026-02-03 15:10:22', 1, NULL, 0, 0),
-(1455, 5, 'ayuda', 'es', 'Ayuda refers to the act of providing assistance, support, or relief to someone in need. | Example: Necesito tu ayuda para terminar este proyecto a tiempo. | Synonyms: asistencia, apoyo, socorro', 1, 0, '2026-02-03', '2026-02-03 15:10:23', 1, NULL, 0, 0),
-(1456, 5, 'lick', 'en', 'To pass the tongue over something, often to taste, moisten, or clean it. | Example: The cat began to lick its fur clean after its meal. | Synonyms: lap, taste, flick', 1, 0, '2026-02-03', '2026-02-03 15:10:25', 1, NULL, 0, 0),
-(1457, 5, 'veteran', 'en', 'A person who has had long experience in a particular field, especially one who has served in the military. | Example: The veteran journalist had covered every major political event for the past three decades. | Synonyms: ex-serviceman, old hand, seasoned professional', 1, 0, '2026-02-03', '2026-02-03 15:10:25', 1, NULL, 0, 0),
-(1458, 5, 'वेल्ड', 'hi', 'वेल्ड का अर्थ है धातुओं को अत्यधिक गर्मी या दबाव से स्थायी रूप से जोड़ना। | Example: लोहे की दो चादरों को वेल्ड करके जोड़ा गया। | Synonyms: जोड़ना, टाँका लगाना', 1, 0, '2026-02-03', '2026-02-03 15:10:28', 1, NULL, 0, 0),
-(1459, 5, 'हिंदुस्तान', 'hi', 'हिंदुस्तान is a historical and poetic name often used to refer to India. | Example: हमारा हिंदुस्तान विविध संस्कृतियों का देश है। (Our Hindustan is a country of diverse cultures.) | Synonyms: भारत, इंडिया, भारतवर्ष', 1, 0, '2026-02-03', '2026-02-03 15:10:26', 1, NULL, 0, 0),
-(1460, 5, 'pregnant', 'en', 'Carrying a developing embryo or fetus within the body, typically referring to a female mammal. | Example: My sister announced she is pregnant with twins. | Synonyms: expecting, gravid, with child', 1, 0, '2026-02-03', '2026-02-03 15:31:07', 1, NULL, 0, 0),
-(1461, 5, 'transcribe', 'en', 'To write or type out something spoken, recorded, or written in another form. | Example: The medical assistant needed to transcribe the doctor''s dictated notes accurately. | Synonyms: write out, type out, document', 1, 0, '2026-02-03', '2026-02-03 15:31:06', 1, NULL, 0, 0),
-(1462, 5, 'all', 'en', 'Referring to the whole quantity, extent, or amount of a group or thing, without exception. | Example: All the students submitted their assignments on time. | Synonyms: every, whole, entire', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1463, 5, 'clinton', 'en', 'Clinton is a proper noun, primarily a surname of English origin, most famously associated with former U.S. President Bill Clinton and former First Lady, Senator, and Secretary of State Hillary Clinton. | Example: The Clinton Presidential Center is a popular tourist attraction in Little Rock, Arkansas. | Synonyms: surname, family name', 1, 0, '2026-02-03', '2026-02-03 15:31:17', 1, NULL, 0, 0),
-(1464, 5, 'river', 'en', 'A large natural stream of water flowing in a channel to the sea, a lake, or another river. | Example: The Nile River is the longest river in Africa. | Synonyms: stream, waterway, current', 1, 0, '2026-02-03', '2026-02-03 15:31:15', 1, NULL, 0, 0),
-(1465, 5, 'internship', 'en', 'An internship is a period of temporary work experience offered by an organization, often to students or recent graduates, to gain practical skills and knowledge in a particular field. | Example: She secured a competitive summer internship at a tech company, hoping to learn more about software development. | Synonyms: apprenticeship, traineeship, placement', 1, 0, '2026-02-03', '2026-02-03 15:31:17', 1, NULL, 0, 0),
-(1466, 5, 'हिन्द', 'hi', 'हिन्द भारत देश का एक प्राचीन और काव्यात्मक नाम है, जिसका अर्थ भारत या इंडिया है। | Example: प्राचीन काल में इस भूमि को हिन्द कहा जाता था। | Synonyms: भारत, इंडिया, हिंदुस्तान', 1, 0, '2026-02-03', '2026-02-03 15:31:23', 1, NULL, 0, 0),
-(1467, 5, 'मैच', 'hi', 'मैच एक खेल या प्रतियोगिता है जो दो व्यक्तियों या टीमों के बीच होती है। | Example: कल का क्रिकेट मैच बहुत रोमांचक था। | Synonyms: मुकाबला, प्रतियोगिता, खेल', 1, 0, '2026-02-03', '2026-02-03 15:31:28', 1, NULL, 0, 0),
-(1468, 5, 'प्यास', 'hi', 'पानी पीने की तीव्र इच्छा या आवश्यकता। | Example: मुझे बहुत प्यास लगी है, कृपया पानी दें। | Synonyms: तृषा, पिपासा', 1, 0, '2026-02-03', '2026-02-03 15:31:33', 1, NULL, 0, 0),
-(1469, 5, 'लौट', 'hi', 'लौट किसी स्थान या स्थिति से वापस आने की क्रिया को कहते हैं। | Example: उसकी लौट का सभी को बेसब्री से इंतज़ार था। | Synonyms: वापसी, प्रत्यागमन', 1, 0, '2026-02-03', '2026-02-03 15:31:35', 1, NULL, 0, 0),
-(1470, 5, 'श्रीनगर', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1471, 5, 'लडक', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1472, 5, 'रेड्ड', 'hi', 'रेड्ड एक रंग है जो रक्त, आग और कुछ फूलों का रंग होता है। | Example: उसने रेड्ड रंग की साड़ी पहनी थी। | Synonyms: लाल, सुर्ख, रक्तवर्ण', 1, 0, '2026-02-03', '2026-02-03 15:33:29', 1, NULL, 0, 0),
-(1473, 5, 'situación', 'es', 'Situación refers to a set of circumstances or the state of affairs at a particular time. | Example: La situación actual requiere una solución rápida. | Synonyms: circunstancia, estado', 1, 0, '2026-02-03', '2026-02-03 15:33:48', 1, NULL, 0, 0),
-(1474, 5, 'uno', 'es', 'Uno is the Spanish cardinal number representing a single unit, also used as an indefinite article or pronoun. | Example: Solo quiero uno de esos. | Synonyms: un, una, único', 1, 0, '2026-02-03', '2026-02-03 15:34:09', 2, NULL, 0, 0),
-(1475, 5, 'alarmante', 'es', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1476, 5, 'matriz', 'es', 'Matriz is a feminine noun referring to the uterus, or a structure, mold, or environment that serves as a base or origin for something. | Example: El embrión se desarrolla en la matriz. | Synonyms: útero, molde, origen', 1, 0, '2026-02-03', '2026-02-03 15:34:20', 1, NULL, 0, 0),
-(1477, 5, 'aprehensión', 'es', 'Sentimiento de inquietud o temor ante un posible suceso negativo. | Example: Sentía una gran aprehensión antes de recibir los resultados de la prueba. | Synonyms: inquietud, temor, ansiedad', 1, 0, '2026-02-03', '2026-02-03 15:34:19', 1, NULL, 0, 0),
-(1478, 5, 'nuevo', 'es', 'Nuevo describes something that has recently come into existence, is not old, or is different from what was before. | Example: Compré un coche nuevo el mes pasado. | Synonyms: fresco, reciente, moderno', 1, 0, '2026-02-03', '2026-02-03 15:34:16', 1, NULL, 0, 0),
-(1479, 5, 'vale', 'es', '''''Vale'''' is a common Spanish interjection used to express agreement, acceptance, or understanding, often translating to "okay," "alright," or "fine." | Example: Nos vemos a las cinco, ¿vale? | Synonyms: De acuerdo, Está bien, Bien', 1, 0, '2026-02-03', '2026-02-03 15:34:20', 1, NULL, 0, 0),
-(1480, 5, 'primera', 'es', 'The feminine singular form of ''first,'' indicating the initial position, rank, or occurrence in a sequence or series. | Example: Esta es la primera vez que viajo en avión. | Synonyms: inicial, principal, anterior', 1, 0, '2026-02-03', '2026-02-03 15:34:23', 1, NULL, 0, 0),
-(1481, 5, 'dama', 'es', 'Dama refers to a lady or woman, often implying elegance, nobility, or a specific social role. | Example: La dama del vestido rojo bailó con gracia en la fiesta. | Synonyms: mujer, señora, gentilmujer', 1, 0, '2026-02-03', '2026-02-03 15:34:24', 1, NULL, 0, 0),
-(1482, 5, 'diseño', 'es', 'The art or process of planning and creating something, especially its form and structure, often with an aesthetic or functional purpose. | Example: El diseño de este edificio es innovador y funcional. | Synonyms: plan, proyecto, estilo', 1, 0, '2026-02-03', '2026-02-03 15:34:25', 1, NULL, 0, 0),
-(1483, 5, 'भारत', 'hi', 'भारत (Bharat) is the official Hindi name for India, a country located in South Asia. | Example: भारत एक विशाल और विविधताओं से भरा देश है। (India is a vast country full of diversities.) | Synonyms: इंडिया, हिंदुस्तान, आर्यावर्त', 1, 0, '2026-02-03', '2026-02-03 15:34:28', 2, NULL, 0, 0),
-(1484, 5, 'महान', 'hi', 'महान शब्द का अर्थ है असाधारण रूप से बड़ा, उत्कृष्ट, या महत्वपूर्ण। | Example: महात्मा गांधी एक महान नेता थे। | Synonyms: उत्कृष्ट, विशाल, श्रेष्ठ', 1, 0, '2026-02-03', '2026-02-03 15:34:28', 1, NULL, 0, 0),
-(1485, 5, 'इंसान', 'hi', 'इंसान refers to a human being, a person, or mankind in general. | Example: हर इंसान को दूसरों के प्रति दयालु होना चाहिए। (Every human being should be kind towards others.) | Synonyms: मनुष्य, मानव, आदमी', 1, 0, '2026-02-03', '2026-02-03 15:34:31', 1, NULL, 0, 0),
-(1486, 5, 'बहुत', 'hi', 'बहुत का अर्थ है किसी वस्तु की मात्रा, संख्या या किसी गुण की तीव्रता का अधिक होना। | Example: आज बहुत गर्मी है। | Synonyms: अत्यधिक, ज़्यादा, काफ़ी', 1, 0, '2026-02-03', '2026-02-03 15:34:31', 1, NULL, 0, 0),
-(1487, 5, 'मार', 'hi', 'मार (maar) refers to the act of hitting, striking, or beating, often implying physical violence or a blow. | Example: उसे चोरों से बहुत मार पड़ी। (He received a lot of beating from the thieves.) | Synonyms: पिटाई (pitai), प्रहार (prahaar), चोट (chot)', 1, 0, '2026-02-03', '2026-02-03 15:34:31', 1, NULL, 0, 0),
-(1488, 5, 'माहौल', 'hi', 'माहौल refers to the general atmosphere, environment, or prevailing mood of a place or situation. | Example: The festive ''mahaul'' (atmosphere) made everyone happy. | Synonyms: atmosphere, environment, ambiance', 1, 0, '2026-02-03', '2026-02-03 15:34:34', 1, NULL, 0, 0),
-(1489, 5, 'बुलबुल', 'hi', 'बुलबुल एक छोटा, सुंदर और मधुर गाने वाला पक्षी है जो अक्सर बगीचों और झाड़ियों में पाया जाता है। | Example: सुबह-सुबह बगीचे में बुलबुल चहचहा रही थी। | Synonyms: श्यामा, कोयल', 1, 0, '2026-02-03', '2026-02-03 15:34:43', 2, NULL, 0, 0),
-(1490, 5, 'अनूप', 'hi', 'अनूप describes something that is unparalleled, unique, or matchless in its excellence or beauty. | Example: उसका सौंदर्य अनूप है। (Her beauty is unparalleled.) | Synonyms: अद्वितीय, अतुलनीय, बेजोड़', 1, 0, '2026-02-03', '2026-02-03 15:34:48', 1, NULL, 0, 0),
-(1491, 5, 'मिश्र', 'hi', 'मिश्र का अर्थ है दो या दो से अधिक चीज़ों का आपस में मिला हुआ या संयुक्त होना। | Example: यह एक मिश्र धातु है। | Synonyms: मिला हुआ, संयुक्त, संकर', 1, 0, '2026-02-03', '2026-02-03 15:34:49', 1, NULL, 0, 0),
-(1492, 5, 'argument', 'en', '', 0, 0, '2026-02-03', '2026-02-03 15:34:56', 1, NULL, 0, 0),
-(1493, 5, 'computer', 'en', 'An electronic device that stores and processes data, typically in binary form, according to instructions given to it in a variable program. | Example: I use my computer every day for work and entertainment. | Synonyms: PC, workstation, processor', 1, 0, '2026-02-03', '2026-02-03 15:34:59', 1, NULL, 0, 0),
-(1494, 5, 'english', 'en', 'Pertaining to England, its people, or its language. | Example: He enjoys a traditional English breakfast every Sunday. | Synonyms: British, Anglo', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1495, 5, 'tomorrow', 'en', 'The day after today. | Example: I have a big presentation tomorrow. | Synonyms: the next day, the following day', 1, 0, '2026-02-03', '2026-02-03 15:35:06', 1, NULL, 0, 0),
-(1496, 5, 'reply', 'en', 'To give an answer or response, either in speech or writing, to a question, statement, or action. | Example: Please reply to my message as soon as you receive it. | Synonyms: answer, respond, retort', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1497, 5, 'live', 'en', 'To be alive; to have life and experience it. | Example: Many people aspire to live a happy and fulfilling life. | Synonyms: exist, reside, survive', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1498, 5, 'without', 'en', 'Without indicates the absence, lack, or non-possession of something or someone. | Example: He cannot live without water for long. | Synonyms: lacking, minus, devoid of', 1, 0, '2026-02-03', '2026-02-03 15:35:20', 1, NULL, 0, 0),
-(1499, 5, 'bomb', 'en', 'An explosive device designed to cause damage or destruction upon detonation. | Example: The police safely detonated the unexploded bomb. | Synonyms: explosive, munition, device', 1, 0, '2026-02-03', '2026-02-03 15:35:29', 1, NULL, 0, 0),
-(1500, 5, 'exploded', 'en', 'To burst or shatter violently and noisily as a result of rapid internal expansion or pressure. | Example: The fireworks exploded in a spectacular display of light and sound. | Synonyms: burst, detonated, ruptured', 1, 0, '2026-02-03', '2026-02-03 15:35:29', 1, NULL, 0, 0),
-(1501, 5, 'hands', 'en', 'Hands are the multi-fingered extremities at the end of each arm, used for grasping, touching, and manipulating objects. | Example: She used her hands to carefully pick up the delicate vase. | Synonyms: mitts, paws', 1, 0, '2026-02-03', '2026-02-03 15:35:50', 1, NULL, 0, 0),
-(1502, 5, 'handsome', 'en', 'Having an attractive and often strong, classic, or dignified appearance, typically used to describe a man. | Example: He was a tall, handsome man with a kind smile. | Synonyms: attractive, good-looking, dashing', 1, 0, '2026-02-03', '2026-02-03 15:35:49', 1, NULL, 0, 0),
-(1503, 5, 'edited', 'en', 'Having been prepared for publication or presentation by correcting, revising, or adapting the content. | Example: The article was edited multiple times to ensure accuracy and clarity before it went to print. | Synonyms: revised, corrected, proofread', 1, 0, '2026-02-03', '2026-02-03 15:36:01', 1, NULL, 0, 0),
-(1504, 5, 'current', 'en', 'Happening or being used or done now; belonging to the present time. | Example: What is your current address? | Synonyms: present, existing, contemporary', 1, 0, '2026-02-03', '2026-02-03 15:36:06', 1, NULL, 0, 0),
-(1505, 5, 'events', 'en', 'Events are occurrences or happenings, especially those of some importance or significance. | Example: The recent series of events has led to significant changes in the company''s policy. | Synonyms: occurrences, happenings, incidents', 1, 0, '2026-02-03', '2026-02-03 15:36:06', 1, NULL, 0, 0),
-(1506, 5, 'thought', 'en', 'An idea or opinion produced by thinking, or the act or process of thinking itself. | Example: She shared her thoughts on the new project during the meeting. | Synonyms: idea, concept, reflection', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1507, 5, 'hey', 'en', 'An exclamation used to attract attention, express surprise, or ask for repetition. | Example: Hey, could you help me with this box? | Synonyms: hello, hi, yo', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1508, 5, 'worked', 'en', 'Performed a task, job, or function, or operated effectively. | Example: He worked tirelessly to finish the report before the deadline. | Synonyms: toiled, labored, operated', 1, 0, '2026-02-03', '2026-02-03 15:36:22', 1, NULL, 0, 0),
-(1509, 5, 'whatever', 'en', 'Used to refer to anything at all, or to express indifference or a dismissive attitude. | Example: He can say what he wants; whatever. | Synonyms: who cares, so what, it doesn''t matter', 1, 0, '2026-02-03', '2026-02-03 15:36:25', 1, NULL, 0, 0),
-(1510, 5, 'happening', 'en', 'A happening is an event or occurrence, especially one that is unplanned or unusual. | Example: The sudden power outage was an unexpected happening in the quiet town. | Synonyms: event, occurrence, incident', 1, 0, '2026-02-03', '2026-02-03 15:36:28', 1, NULL, 0, 0),
-(1511, 5, 'will', 'en', 'The mental faculty by which one deliberately chooses or decides upon a course of action, often implying strong determination or desire. | Example: Despite the setbacks, her will to succeed never wavered. | Synonyms: determination, resolve, volition', 1, 0, '2026-02-03', '2026-02-04', 5, NULL, 0, 0),
-(1512, 5, 'being', 'en', '', 0, 0, '2026-02-03', '2026-02-03 15:37:26', 1, NULL, 0, 0),
-(1513, 5, 'hold', 'en', 'To grasp, carry, or keep something in one''s hands or arms. | Example: Please hold this package for me while I open the door. | Synonyms: grasp, grip, retain', 1, 0, '2026-02-03', '2026-02-03 15:38:41', 1, NULL, 0, 0),
-(1514, 5, 'ago', 'en', 'Ago refers to a specific period of time that has passed before the present moment. | Example: She moved to this city five years ago. | Synonyms: before now, earlier', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1515, 5, 'liberal', 'en', 'Open to new ideas and willing to discard traditional values, often advocating for individual rights, civil liberties, and social progress. | Example: She holds liberal views on social issues, advocating for greater equality and individual freedoms. | Synonyms: progressive, tolerant, broad-minded', 1, 0, '2026-02-03', '2026-02-03 15:39:42', 1, NULL, 0, 0),
-(1516, 5, 'muslims', 'en', 'Muslims are adherents of Islam, a monotheistic religion founded by the Prophet Muhammad. | Example: Many Muslims gather for prayer at mosques around the world. | Synonyms: Islamic believers, followers of Islam, adherents of Islam', 1, 0, '2026-02-03', '2026-02-03 15:39:38', 1, NULL, 0, 0),
-(1517, 5, 'herbal', 'en', 'Relating to, derived from, or consisting of herbs. | Example: Many cultures have a long tradition of using herbal medicines for various ailments. | Synonyms: botanical, plant-based, natural', 1, 0, '2026-02-03', '2026-02-03 15:40:46', 1, NULL, 0, 0),
-(1518, 5, 'screen', 'en', 'A flat surface, typically electronic, on which images or data are displayed, or a protective or concealing partition. | Example: I spend too much time looking at a screen every day. | Synonyms: monitor, display, panel', 1, 0, '2026-02-03', '2026-02-03 15:41:03', 1, NULL, 0, 0),
-(1519, 5, 'generally', 'en', 'In most cases; usually. | Example: The weather in this region is generally mild during the autumn. | Synonyms: usually, commonly, typically', 1, 0, '2026-02-03', '2026-02-03 15:41:00', 1, NULL, 0, 0),
-(1520, 5, 'show', 'en', 'To make something visible, known, or apparent, or to present something for others to see. | Example: The tour guide will show us the ancient ruins. | Synonyms: display, exhibit, demonstrate', 1, 0, '2026-02-03', '2026-02-03 15:41:01', 1, NULL, 0, 0),
-(1521, 5, 'demoting', 'en', 'Demoting is the act of reducing someone to a lower rank, position, or status. | Example: The committee was considering demoting the captain after the team''s repeated losses. | Synonyms: downgrading, degrading, relegating', 1, 0, '2026-02-03', '2026-02-03 15:41:02', 1, NULL, 0, 0),
-(1522, 5, 'plants', 'en', 'Plants are living organisms that typically produce their own food through photosynthesis, have rigid cell walls, and lack the ability to move freely. | Example: Many different types of plants thrive in the rainforest, from towering trees to delicate ferns. | Synonyms: flora, vegetation, greenery', 1, 0, '2026-02-03', '2026-02-03 15:41:01', 1, NULL, 0, 0),
-(1523, 5, 'voting', 'en', 'Voting is the formal act of expressing a choice or opinion, typically in an election or a meeting, to select a candidate, proposition, or course of action. | Example: Many citizens believe that voting is a fundamental right and a civic duty. | Synonyms: election, ballot, polling', 1, 0, '2026-02-03', '2026-02-03 15:41:02', 1, NULL, 0, 0),
-(1524, 5, 'every', 'en', 'Referring to all the individual members of a group or series without exception. | Example: Every morning, I drink a cup of coffee. | Synonyms: each, all', 1, 0, '2026-02-03', '2026-02-03 15:41:02', 1, NULL, 0, 0),
-(1525, 5, 'idiotic', 'en', 'Extremely foolish or stupid, often to the point of being absurd or nonsensical. | Example: It was an idiotic idea to try and fix the complex machinery without reading the manual first. | Synonyms: stupid, foolish, senseless', 1, 0, '2026-02-03', '2026-02-03 15:41:02', 1, NULL, 0, 0),
-(1526, 5, 'transcript', 'en', 'A transcript is a written or typed record of spoken words, often from an audio recording, interview, or court proceeding. | Example: The student requested a transcript of their university grades to apply for a new program. | Synonyms: record, written account, log', 1, 0, '2026-02-03', '2026-02-03', 4, NULL, 0, 0),
-(1527, 5, 'important', 'en', 'Having great significance, value, or consequence; meriting serious attention. | Example: It is important to remember to lock the door before leaving the house. | Synonyms: significant, crucial, essential', 1, 0, '2026-02-03', '2026-02-03 15:41:02', 1, NULL, 0, 0),
-(1528, 5, 'sure', 'en', NULL, 0, 0, '2026-02-03', '2026-02-04', 5, NULL, 0, 0),
-(1529, 5, 'facing', 'en', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1530, 5, 'second', 'en', 'Coming immediately after the first in order, rank, or importance. | Example: He was the second person to cross the finish line. | Synonyms: next, subsequent, following', 1, 0, '2026-02-03', '2026-02-03 15:41:29', 1, NULL, 0, 0),
-(1531, 5, 'article', 'en', 'A non-fiction written composition, typically published in a newspaper, magazine, or online. | Example: The newspaper featured an in-depth article about the upcoming election. | Synonyms: essay, report, piece', 1, 0, '2026-02-03', '2026-02-03 15:41:49', 1, NULL, 0, 0),
-(1532, 5, 'having', 'en', 'Having is the present participle of ''to have,'' indicating the state of possessing, experiencing, or being characterized by something. | Example: Having a positive attitude can greatly improve your day. | Synonyms: possessing, owning, experiencing', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1533, 5, 'problem', 'en', 'A matter or situation regarded as unwelcome or harmful and needing to be dealt with and overcome. | Example: The team faced a significant problem when their main server crashed. | Synonyms: difficulty, challenge, issue', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(1534, 5, 'fixed', 'en', 'Not able to be moved, changed, or altered. | Example: The price of the concert ticket is fixed and will not fluctuate. | Synonyms: permanent, set, immobile', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1535, 5, 'something', 'en', 'An unspecified or unknown thing, item, or matter. | Example: There''s something important I need to tell you. | Synonyms: a thing, an object, an item', 1, 0, '2026-02-03', '2026-02-04', 6, NULL, 0, 0),
-(1536, 5, 'spanish', 'en', 'Of or relating to Spain, its people, or its language. | Example: The Spanish language is spoken by hundreds of millions of people worldwide. | Synonyms: Iberian, Castilian, Hispanic', 1, 0, '2026-02-03', '2026-02-03 15:42:13', 1, NULL, 0, 0),
-(1537, 5, 'इसलिए', 'hi', 'इसलिए एक संयोजक है जिसका उपयोग किसी बात का कारण या परिणाम बताने के लिए किया जाता है, जिसका अर्थ है ''इस कारण से'' या ''अतः''। | Example: बारिश हो रही थी, इसलिए हम घर पर रहे। | Synonyms: अतः, इस कारण, फलस्वरूप', 1, 0, '2026-02-03', '2026-02-03 15:42:18', 1, NULL, 0, 0),
-(1538, 5, 'अजीब', 'hi', 'जो सामान्य या अपेक्षित न हो, बल्कि विचित्र या अनोखा हो। | Example: आज मौसम बहुत अजीब है। | Synonyms: विचित्र, अनोखा, असामान्य', 1, 0, '2026-02-03', '2026-02-03 15:42:20', 1, NULL, 0, 0),
-(1539, 5, 'आंस', 'hi', 'आंस का अर्थ है किसी वस्तु या संपत्ति का एक हिस्सा या भाग। | Example: उसे अपने पिता की संपत्ति में बराबर का आंस मिला। | Synonyms: हिस्सा, भाग, अंश', 1, 0, '2026-02-03', '2026-02-03 15:42:27', 1, NULL, 0, 0),
-(1540, 5, 'मेट्र', 'hi', 'मेट्र लंबाई मापने की एक मानक इकाई है। | Example: इस दीवार की ऊँचाई तीन मेट्र है। | Synonyms: मीटर, मापक', 1, 0, '2026-02-03', '2026-02-03 15:42:34', 1, NULL, 0, 0),
-(1541, 5, 'फार', 'hi', 'फार का अर्थ है किसी वस्तु को बलपूर्वक चीरना या फाड़ना। | Example: उसने गुस्से में पत्र को फार दिया। | Synonyms: चीरना, फाड़ना, विदीर्ण करना', 1, 0, '2026-02-03', '2026-02-03 15:42:28', 1, NULL, 0, 0),
-(1542, 5, 'खबर', 'hi', 'खबर का अर्थ है किसी घटना, स्थिति या जानकारी की सूचना। | Example: मैंने आज सुबह की ताज़ा खबरें पढ़ीं। | Synonyms: समाचार, सूचना, जानकारी', 1, 0, '2026-02-03', '2026-02-03 15:42:31', 1, NULL, 0, 0),
-(1543, 5, 'मॉडल', 'hi', 'मॉडल (Model) refers to a representation of an object, system, or idea, a person employed to display clothes or products, or an exemplary standard for imitation. | Example: यह नया फोन मॉडल बहुत लोकप्रिय है। (This new phone model is very popular.) | Synonyms: नमूना, प्रारूप, आदर्श', 1, 0, '2026-02-03', '2026-02-03 15:42:42', 1, NULL, 0, 0),
-(1544, 5, 'वर्ग', 'hi', 'वर्ग (Varg) refers to a group, category, or class of people or things that share common characteristics, or it can denote a geometric square. | Example: शिक्षक ने छात्रों को छोटे-छोटे वर्गों में विभाजित किया। (The teacher divided the students into small groups.) | Synonyms: समूह, श्रेणी, दल', 1, 0, '2026-02-03', '2026-02-03 15:42:40', 1, NULL, 0, 0),
-(1545, 5, 'एसआईट', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:42:36', 1, NULL, 0, 0),
-(1546, 5, 'अनिल', 'hi', 'अनिल का अर्थ है वायु या हवा, जो प्राकृतिक रूप से चलती है। | Example: सुबह की ठंडी अनिल मन को शांति देती है। | Synonyms: वायु, हवा, पवन', 1, 0, '2026-02-03', '2026-02-03 15:42:40', 1, NULL, 0, 0),
-(1547, 5, 'पाइपलाइन', 'hi', 'एक नली-प्रणाली जिसका उपयोग तरल पदार्थ या गैस को लंबी दूरी तक ले जाने के लिए किया जाता है। | Example: सरकार ने ग्रामीण क्षेत्रों में स्वच्छ पानी की पाइपलाइन बिछाने की योजना बनाई है। | Synonyms: नली-प्रणाली, नलिका-तंत्र, पाइप-तंत्र', 1, 0, '2026-02-03', '2026-02-03 15:42:41', 1, NULL, 0, 0),
-(1548, 5, 'भोजन', 'hi', 'भोजन वह पदार्थ है जिसे खाकर शरीर को ऊर्जा और पोषण मिलता है। | Example: हमें स्वस्थ रहने के लिए पौष्टिक भोजन करना चाहिए। | Synonyms: खाना, आहार, खाद्य', 1, 0, '2026-02-03', '2026-02-03 15:42:40', 1, NULL, 0, 0),
-(1549, 5, 'फ्लोटिंग', 'hi', 'फ्लोटिंग" का अर्थ है जो पानी या हवा जैसे तरल या गैसीय माध्यम की सतह पर तैर रहा हो या बिना डूबे हुए हो। | Example: समुद्र में कई फ्लोटिंग रेस्टोरेंट हैं। | Synonyms: तैरता हुआ, उत्प्लावी', 1, 0, '2026-02-03', '2026-02-03 15:42:47', 1, NULL, 0, 0),
-(1550, 5, 'कुसुम', 'hi', 'कुसुम का अर्थ है किसी पौधे का वह रंगीन और सुगंधित भाग जिससे फल या बीज बनते हैं। | Example: बगीचे में लाल रंग के सुंदर कुसुम खिले थे। | Synonyms: फूल, पुष्प, सुमन', 1, 0, '2026-02-03', '2026-02-03 15:42:40', 1, NULL, 0, 0),
-(1551, 5, 'रीजन', 'hi', 'रीजन का अर्थ है किसी घटना, कार्य या निर्णय के पीछे का कारण या तर्क। | Example: उसने अपनी अनुपस्थिति का कोई ठोस रीजन नहीं बताया। | Synonyms: कारण, वजह, हेतु', 1, 0, '2026-02-03', '2026-02-03 15:42:40', 1, NULL, 0, 0),
-(1552, 5, 'अट्ठावन', 'hi', 'यह संख्या सत्तावन के बाद और उनसठ से पहले आती है, जिसे अंग्रेजी में ''fifty-eight'' कहते हैं। | Example: मेरी बहन की उम्र अट्ठावन साल है। | Synonyms: 58, अठ्ठावन', 1, 0, '2026-02-03', '2026-02-03 15:42:42', 1, NULL, 0, 0),
-(1553, 5, 'मैन्युअल', 'hi', 'मैन्युअल किसी उपकरण, मशीन या प्रक्रिया के उपयोग के लिए निर्देशों वाली पुस्तक को कहते हैं। | Example: नई कार खरीदने के बाद, मैंने उसका मैन्युअल ध्यान से पढ़ा ताकि सभी फीचर्स समझ सकूँ। | Synonyms: निर्देशिका, मार्गदर्शिका, हस्तपुस्तिका', 1, 0, '2026-02-03', '2026-02-03 15:42:41', 1, NULL, 0, 0),
-(1554, 5, 'इंस्टॉल', 'hi', 'इंस्टॉल का अर्थ है किसी सॉफ्टवेयर, उपकरण या प्रणाली को स्थापित करना ताकि वह उपयोग के लिए तैयार हो सके। | Example: मैंने अपने नए कंप्यूटर पर ऑपरेटिंग सिस्टम इंस्टॉल किया। | Synonyms: स्थापित करना, लगाना, संस्थापित करना', 1, 0, '2026-02-03', '2026-02-03 15:42:43', 1, NULL, 0, 0),
-(1555, 5, 'उतर', 'hi', 'उतर एक क्रिया है जिसका अर्थ है किसी ऊँची जगह से नीचे आना, किसी वाहन से नीचे उतरना, या किसी चीज़ का रंग फीका पड़ना। | Example: वह बस से नीचे उतर गया। | Synonyms: नीचे आना, अवतरित होना, फीका पड़ना', 1, 0, '2026-02-03', '2026-02-03 15:42:46', 1, NULL, 0, 0),
-(1556, 5, 'बॉस', 'hi', 'बॉस वह व्यक्ति होता है जो किसी संगठन या कार्यस्थल में कर्मचारियों का प्रभारी या प्रबंधक होता है। | Example: मेरे बॉस ने आज सुबह एक नई मीटिंग बुलाई है। | Synonyms: अधिकारी, प्रबंधक, मालिक', 1, 0, '2026-02-03', '2026-02-03 15:42:43', 1, NULL, 0, 0),
-(1557, 5, 'निर्णय', 'hi', 'निर्णय किसी स्थिति या समस्या के संबंध में सोच-विचार के बाद लिया गया अंतिम चुनाव या निष्कर्ष होता है। | Example: हमें इस मामले पर जल्द ही कोई निर्णय लेना होगा। | Synonyms: फ़ैसला, निष्कर्ष, संकल्प', 1, 0, '2026-02-03', '2026-02-03 15:42:44', 1, NULL, 0, 0),
-(1558, 5, 'लिमिटेड', 'hi', 'यह एक ऐसा शब्द है जिसका अर्थ है सीमित, प्रतिबंधित या जिसकी कोई सीमा निर्धारित हो। | Example: यह ऑफर केवल सीमित समय के लिए है। | Synonyms: सीमित, परिमित, प्रतिबंधित', 1, 0, '2026-02-03', '2026-02-03 15:42:44', 1, NULL, 0, 0),
-(1559, 5, 'अहम', 'hi', 'अहम का अर्थ है महत्वपूर्ण, आवश्यक या प्रमुख। | Example: यह हमारे भविष्य के लिए एक अहम फैसला है। | Synonyms: महत्वपूर्ण, आवश्यक, प्रमुख', 1, 0, '2026-02-03', '2026-02-03 15:42:52', 1, NULL, 0, 0),
-(1560, 5, 'नोटिस', 'hi', 'नोटिस एक औपचारिक सूचना या चेतावनी है जो किसी व्यक्ति या समूह को किसी विशेष बात की जानकारी देने के लिए दी जाती है। | Example: कंपनी ने सभी कर्मचारियों को नई नीति के बारे में नोटिस जारी किया। | Synonyms: सूचना, अधिसूचना, इत्तिला', 1, 0, '2026-02-03', '2026-02-03 15:42:55', 1, NULL, 0, 0),
-(1561, 5, 'शुभ', 'hi', 'शुभ का अर्थ है कुछ ऐसा जो अच्छा, मंगलकारी या भाग्यशाली हो। | Example: आज का दिन बहुत शुभ है। (Today is a very auspicious day.) | Synonyms: मंगल, कल्याणकारी, अच्छा', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1562, 5, 'विनय', 'hi', 'विनय का अर्थ है विनम्रता, शिष्टाचार और आदरपूर्ण व्यवहार। | Example: हमें हमेशा बड़ों के प्रति विनय भाव रखना चाहिए। | Synonyms: नम्रता, विनम्रता, शिष्टाचार', 1, 0, '2026-02-03', '2026-02-03 15:42:53', 1, NULL, 0, 0),
-(1563, 5, 'गोट', 'hi', 'गोट किसी बोर्ड खेल में इस्तेमाल होने वाला एक छोटा मोहरा या टुकड़ा होता है। | Example: उसने अपनी गोट आगे बढ़ाई और खेल जीत गया। | Synonyms: मोहरा, टुकड़ा', 1, 0, '2026-02-03', '2026-02-03 15:42:55', 1, NULL, 0, 0),
-(1564, 5, 'अनशन', 'hi', 'अनशन एक प्रकार का विरोध प्रदर्शन या तपस्या है जिसमें व्यक्ति भोजन का त्याग करता है। | Example: गांधीजी ने देश की आजादी के लिए कई बार अनशन किया था। | Synonyms: भूख हड़ताल, उपवास, व्रत', 1, 0, '2026-02-03', '2026-02-03 15:42:57', 1, NULL, 0, 0),
-(1565, 5, 'हाउस', 'hi', 'हाउस एक ऐसी इमारत या संरचना है जिसमें लोग रहते हैं, या यह किसी संगठन या व्यवसाय का मुख्यालय हो सकता है। | Example: मेरा नया हाउस शहर के केंद्र में है। | Synonyms: घर, मकान, आवास', 1, 0, '2026-02-03', '2026-02-03 15:42:57', 1, NULL, 0, 0),
-(1566, 5, 'कोर्ट', 'hi', 'कोर्ट वह स्थान है जहाँ कानूनी मामलों की सुनवाई होती है और न्याय प्रदान किया जाता है। | Example: आज मेरा भाई कोर्ट में गवाही देने गया है। | Synonyms: न्यायालय, अदालत, कचहरी', 1, 0, '2026-02-03', '2026-02-03 15:42:57', 1, NULL, 0, 0),
-(1567, 5, 'कांग्रेस', 'hi', 'भारत का एक प्रमुख राजनीतिक दल, जिसे भारतीय राष्ट्रीय कांग्रेस के नाम से जाना जाता है। | Example: कांग्रेस ने हाल ही में अपने नए अध्यक्ष का चुनाव किया। | Synonyms: सभा, सम्मेलन', 1, 0, '2026-02-03', '2026-02-03 15:43:03', 1, NULL, 0, 0),
-(1568, 5, 'सर्वथ', 'hi', 'सर्वथ का अर्थ है ''पूरी तरह से'', ''पूर्णतः'' या ''हर प्रकार से'' किसी बात या स्थिति का होना। | Example: यह बात सर्वथा असत्य है और इसमें कोई सच्चाई नहीं है। | Synonyms: पूर्णतः, बिलकुल, पूरी तरह से', 1, 0, '2026-02-03', '2026-02-03 15:42:59', 1, NULL, 0, 0),
-(1569, 5, 'उदय', 'hi', 'उदय का अर्थ है किसी वस्तु का ऊपर उठना, प्रकट होना या किसी नई स्थिति का आरंभ होना, जैसे सूर्य का क्षितिज से ऊपर आना। | Example: सूर्य का उदय होते ही चारों ओर प्रकाश फैल गया। | Synonyms: आरोहण, प्रादुर्भाव', 1, 0, '2026-02-03', '2026-02-03 15:43:02', 1, NULL, 0, 0),
-(1570, 5, 'कोटक', 'hi', 'कोटक एक भारतीय उपनाम है, जो अक्सर एक प्रसिद्ध वित्तीय सेवा समूह के नाम के रूप में भी प्रयोग होता है। | Example: उदय कोटक भारत के एक प्रसिद्ध बैंकर हैं। | Synonyms: उपनाम, कुलनाम', 1, 0, '2026-02-03', '2026-02-03 15:43:04', 1, NULL, 0, 0),
-(1571, 5, 'एमेजॉन', 'hi', 'एमेजॉन एक प्रसिद्ध अमेरिकी बहुराष्ट्रीय प्रौद्योगिकी कंपनी है जो ऑनलाइन खरीदारी, क्लाउड कंप्यूटिंग और डिजिटल स्ट्रीमिंग सेवाओं के लिए जानी जाती है। | Example: मैंने एमेजॉन से अपने घर के लिए कुछ सामान ऑर्डर किया। | Synonyms: ऑनलाइन शॉपिंग प्लेटफॉर्म, ई-कॉमर्स कंपनी, ऑनलाइन खुदरा विक्रेता', 1, 0, '2026-02-03', '2026-02-03 15:43:01', 1, NULL, 0, 0),
-(1572, 5, 'एपिसोड', 'hi', 'किसी धारावाहिक, रेडियो कार्यक्रम, पॉडकास्ट या वास्तविक जीवन की घटना का एक विशिष्ट भाग या खंड। | Example: मैंने कल रात इस नए शो का पहला एपिसोड देखा। | Synonyms: भाग, खंड, कड़ी', 1, 0, '2026-02-03', '2026-02-03 15:43:06', 1, NULL, 0, 0),
-(1573, 5, 'सबकुछ', 'hi', 'All things; everything. | Example: उसने अपना सबकुछ खो दिया। (He lost everything he had.) | Synonyms: हर चीज, समस्त, सारा', 1, 0, '2026-02-03', '2026-02-03 15:43:07', 1, NULL, 0, 0),
-(1574, 5, 'ओवर', 'hi', 'क्रिकेट में, ''ओवर'' एक गेंदबाज द्वारा फेंकी गई छह गेंदों का एक सेट होता है। | Example: इस ओवर में भारतीय टीम ने दस रन बनाए। | Synonyms: बारी, दौर', 1, 0, '2026-02-03', '2026-02-03 15:43:16', 1, NULL, 0, 0),
-(1575, 5, 'जश्न', 'hi', 'जश्न का अर्थ है किसी खुशी के अवसर पर मनाया जाने वाला उत्सव या समारोह। | Example: आज रात हम दोस्त के जन्मदिन का जश्न मनाएंगे। | Synonyms: उत्सव, समारोह, पर्व', 1, 0, '2026-02-03', '2026-02-03 15:43:15', 1, NULL, 0, 0),
-(1576, 5, 'क्योंक', 'hi', 'क्योंकि एक संयोजक शब्द है जिसका उपयोग किसी बात का कारण या वजह बताने के लिए किया जाता है। | Example: मैं स्कूल नहीं जा सका क्योंकि मैं बीमार था। | Synonyms: चूंकि, इस कारण से', 1, 0, '2026-02-03', '2026-02-03 15:43:25', 1, NULL, 0, 0),
-(1577, 5, 'रिकॉर्ड', 'hi', 'रिकॉर्ड किसी जानकारी, घटना, या उपलब्धि का लिखित, ऑडियो, वीडियो या अन्य रूप में सुरक्षित संग्रह है। (A record is a preserved collection of information, an event, or an achievement in written, audio, video, or other form.) | Example: उसने 100 मीटर दौड़ में नया विश्व रिकॉर्ड बनाया। (He set a new world record in the 100-meter race.) | Synonyms: अभिलेख, कीर्तिमान, दस्तावेज़', 1, 0, '2026-02-03', '2026-02-03 15:43:25', 1, NULL, 0, 0),
-(1578, 5, 'टूट', 'hi', 'टूट किसी वस्तु के खंडित होने, बिखरने या क्षतिग्रस्त होने की क्रिया या अवस्था को कहते हैं। | Example: पुरानी कुर्सी में टूट आ गई थी, जिससे वह बैठने लायक नहीं रही। | Synonyms: भंग, क्षति, दरार', 1, 0, '2026-02-03', '2026-02-03 15:43:25', 1, NULL, 0, 0),
-(1579, 5, 'लिंक्स', 'hi', 'लिंक्स इंटरनेट पर वेब पेजों या अन्य जानकारी को जोड़ने वाले संदर्भ या कड़ियाँ होती हैं। | Example: कृपया इस लेख से संबंधित सभी लिंक्स प्रदान करें। | Synonyms: कड़ियाँ, संबंध, जोड़', 1, 0, '2026-02-03', '2026-02-03 15:43:32', 1, NULL, 0, 0),
-(1580, 5, 'रखन', 'hi', 'रखन का अर्थ है किसी वस्तु या व्यक्ति की देखभाल, सुरक्षा या संरक्षण करना। | Example: बच्चों की रखन-देखन बहुत ज़रूरी है। | Synonyms: देखभाल, संरक्षण, सुरक्षा', 1, 0, '2026-02-03', '2026-02-03 15:43:37', 1, NULL, 0, 0),
-(1581, 5, 'प्रैक्टिस', 'hi', 'यह किसी कौशल या ज्ञान को बेहतर बनाने के लिए बार-बार किया जाने वाला अभ्यास या क्रिया है। | Example: रोजाना प्रैक्टिस करने से आप किसी भी काम में माहिर हो सकते हैं। | Synonyms: अभ्यास, रियाज़, मश्क', 1, 0, '2026-02-03', '2026-02-03 15:43:37', 1, NULL, 0, 0),
-(1582, 5, 'तस्वीर', 'hi', 'तस्वीर किसी व्यक्ति, वस्तु या दृश्य का एक दृश्य प्रतिनिधित्व या छवि है, जिसे अक्सर चित्रकला, फोटोग्राफी या रेखाचित्र के माध्यम से बनाया जाता है। | Example: दीवार पर एक खूबसूरत तस्वीर लटकी हुई थी। | Synonyms: चित्र, फोटो, छायाचित्र', 1, 0, '2026-02-03', '2026-02-03 15:43:44', 1, NULL, 0, 0),
-(1583, 5, 'कंपन', 'hi', 'कंपन किसी वस्तु या शरीर में होने वाली हल्की और तेज़ गति है। | Example: भूकंप के दौरान धरती में कंपन महसूस हुआ। | Synonyms: थरथराहट, स्पंदन, झटका', 1, 0, '2026-02-03', '2026-02-03 15:43:45', 1, NULL, 0, 0),
-(1584, 5, 'hola', 'es', 'Hola is a common Spanish interjection used as a general greeting. | Example: Hola, ¿cómo estás? | Synonyms: Saludos, Qué tal, Buenos días', 1, 0, '2026-02-03 15:43:36', '2026-02-03 15:43:36', 1, NULL, 0, 0),
-(1585, 5, 'स्टिंग', 'hi', 'यह एक गुप्त अभियान या ऑपरेशन है जो अक्सर पत्रकारों या कानून प्रवर्तन एजेंसियों द्वारा अवैध या अनैतिक गतिविधियों को उजागर करने के लिए किया जाता है। | Example: पुलिस ने ड्रग तस्करों को पकड़ने के लिए एक स्टिंग ऑपरेशन किया। | Synonyms: गुप्त अभियान, खुफिया जांच, छद्मवेशी अभियान', 1, 0, '2026-02-03', '2026-02-03 15:43:51', 1, NULL, 0, 0),
-(1586, 5, 'अंध', 'hi', 'अंध का अर्थ है देखने की क्षमता से रहित होना। | Example: वह जन्म से अंध है और ब्रेल लिपि का उपयोग करता है। | Synonyms: नेत्रहीन, दृष्टिहीन, चक्षुहीन', 1, 0, '2026-02-03', '2026-02-03 15:43:55', 1, NULL, 0, 0),
-(1587, 5, 'जूस', 'hi', 'जूस फलों या सब्जियों से निकाला गया तरल पदार्थ है जिसे आमतौर पर पिया जाता है। | Example: मुझे सुबह नाश्ते में संतरे का जूस पीना पसंद है। | Synonyms: रस, फलरस, पेय', 1, 0, '2026-02-03', '2026-02-03 15:43:56', 1, NULL, 0, 0),
-(1588, 5, 'प्रदेश', 'hi', 'A ''प्रदेश'' refers to a large geographical area or a political subdivision within a country, often equivalent to a state or province. | Example: उत्तर प्रदेश भारत का सबसे अधिक जनसंख्या वाला प्रदेश है। (Uttar Pradesh is the most populous state of India.) | Synonyms: राज्य, क्षेत्र, प्रांत', 1, 0, '2026-02-03', '2026-02-03 15:43:55', 1, NULL, 0, 0),
-(1589, 5, 'no', 'es', 'The Spanish word "no" is an adverb used to express negation, refusal, or disagreement, indicating the absence or contrary of something. | Example: No quiero ir a la fiesta. | Synonyms: de ninguna manera, jamás', 1, 0, '2026-02-03 15:43:53', '2026-02-03 15:43:53', 1, NULL, 0, 0),
-(1590, 5, 'disponible', 'es', 'Something that is at hand, accessible, or ready for use. | Example: El producto está disponible en varios colores. (The product is available in various colors.) | Synonyms: accesible, libre, utilizable', 1, 0, '2026-02-03 15:44:08', '2026-02-03 15:44:08', 1, NULL, 0, 0),
-(1591, 5, 'वर्ष', 'hi', 'वर्ष समय की वह अवधि है जिसमें बारह महीने होते हैं। | Example: भारत हर वर्ष 15 अगस्त को स्वतंत्रता दिवस मनाता है। | Synonyms: साल, बरस', 1, 0, '2026-02-03', '2026-02-03 15:44:26', 1, NULL, 0, 0),
-(1592, 5, 'अरावल', 'hi', 'किसी वस्तु का सबसे अगला या सामने वाला भाग। | Example: युद्ध में सेना का अरावल भाग सबसे पहले शत्रु से टकराया। | Synonyms: अग्रभाग, अगला हिस्सा, सामने वाला भाग', 1, 0, '2026-02-03', '2026-02-03 15:44:33', 1, NULL, 0, 0),
-(1593, 5, 'tremendo', 'es', 'Describes something of great magnitude, intensity, or significance, which can be remarkably good or remarkably bad. | Example: La fiesta fue un tremendo éxito. | Synonyms: enorme, terrible, impresionante', 1, 0, '2026-02-03 15:44:29', '2026-02-03 15:44:29', 1, NULL, 0, 0),
-(1594, 5, 'किन्त', 'hi', 'किन्त एक अव्यय है जिसका प्रयोग दो विरोधी या भिन्न विचारों को जोड़ने के लिए ''परंतु'' या ''लेकिन'' के अर्थ में किया जाता है। | Example: मैं उससे मिलना चाहता था, किन्त समय नहीं मिला। | Synonyms: परंतु, लेकिन, मगर', 1, 0, '2026-02-03', '2026-02-03 15:44:42', 1, NULL, 0, 0),
-(1595, 5, 'extraordinario', 'es', 'Extraordinario describes something that is beyond the usual or ordinary, often implying it is remarkable, exceptional, or unusual. | Example: Su actuación en el concierto fue extraordinaria. | Synonyms: excepcional, notable, sobresaliente', 1, 0, '2026-02-03 15:44:41', '2026-02-03 15:44:41', 1, NULL, 0, 0),
-(1596, 5, 'necesario', 'es', '', 0, 0, '2026-02-03 15:44:44', '2026-02-03 15:44:44', 1, NULL, 0, 0),
-(1597, 5, 'अन्न', 'hi', 'अन्न वह खाद्य पदार्थ है जो अनाज के रूप में होता है और मनुष्यों तथा पशुओं के पोषण का मुख्य स्रोत है। | Example: किसान खेतों में अन्न उगाते हैं ताकि सभी को भोजन मिल सके। | Synonyms: अनाज, खाद्य, भोजन', 1, 0, '2026-02-03', '2026-02-03 15:44:58', 1, NULL, 0, 0),
-(1598, 5, 'hermoso', 'es', 'Hermoso describes something or someone that is beautiful, lovely, or handsome, possessing qualities that give great pleasure to the senses or mind. | Example: El atardecer sobre el mar era realmente hermoso. | Synonyms: bello, lindo, guapo', 1, 0, '2026-02-03 15:44:50', '2026-02-03 15:44:50', 1, NULL, 0, 0),
-(1599, 5, 'sí', 'es', 'Sí is a Spanish word that primarily functions as an adverb meaning "yes," indicating affirmation or agreement. | Example: ¿Quieres ir al cine? Sí, me encantaría. | Synonyms: claro, efectivamente', 1, 0, '2026-02-03 15:44:56', '2026-02-03 15:44:56', 1, NULL, 0, 0),
-(1600, 5, 'importante', 'es', 'The Spanish word "importante" describes something that has great significance, value, or consequence. | Example: Es importante llegar a tiempo a la reunión. | Synonyms: relevante, significativo, crucial', 1, 0, '2026-02-03 15:45:01', '2026-02-03 15:45:01', 1, NULL, 0, 0),
-(1601, 5, 'magnífico', 'es', 'Magnífico describes something that is magnificent, splendid, or grand, often implying exceptional quality, beauty, or impressiveness. | Example: La vista desde la cima de la montaña era verdaderamente magnífica. | Synonyms: espléndido, excelente, grandioso', 1, 0, '2026-02-03 15:45:07', '2026-02-03 15:45:07', 1, NULL, 0, 0),
-(1602, 5, 'sofisticado', 'es', 'Sofisticado describes something or someone that is highly refined, complex, elegant, or advanced in taste, knowledge, or technology. | Example: El diseño del nuevo teléfono es muy sofisticado y moderno. | Synonyms: refinado, elegante, avanzado', 1, 0, '2026-02-03 15:45:13', '2026-02-03 15:45:13', 1, NULL, 0, 0),
-(1603, 5, 'यूक्रेन', 'hi', 'यूक्रेन पूर्वी यूरोप में स्थित एक देश है। | Example: यूक्रेन की राजधानी कीव है। | Synonyms: यूक्रेनी राष्ट्र, यूक्रेनी गणराज्य', 1, 0, '2026-02-03', '2026-02-03 15:45:27', 1, NULL, 0, 0),
-(1604, 5, 'इंप्लीमेंट', 'hi', 'इंप्लीमेंट का अर्थ है किसी योजना, नीति या निर्णय को व्यवहार में लाना या लागू करना। | Example: सरकार ने नई शिक्षा नीति को पूरे देश में इंप्लीमेंट करने का फैसला किया है। | Synonyms: लागू करना, कार्यान्वित करना, अमल में लाना', 1, 0, '2026-02-03', '2026-02-03 15:45:24', 1, NULL, 0, 0),
-(1605, 5, 'सिंध', 'hi', 'सिंध पाकिस्तान का एक प्रांत है, जो सिंधु नदी के नाम पर है और अपनी ऐतिहासिक तथा सांस्कृतिक विरासत के लिए जाना जाता है। | Example: सिंध प्रांत अपनी समृद्ध सूफी परंपराओं और प्राचीन स्थलों के लिए प्रसिद्ध है। | Synonyms: सिंधु प्रदेश, सिंधु क्षेत्र', 1, 0, '2026-02-03', '2026-02-03 15:45:24', 1, NULL, 0, 0),
-(1606, 5, 'प्रांत', 'hi', 'प्रांत किसी देश या क्षेत्र का एक बड़ा प्रशासनिक विभाग होता है। | Example: उत्तर प्रदेश भारत का सबसे अधिक जनसंख्या वाला प्रांत है। | Synonyms: राज्य, प्रदेश, सूबा', 1, 0, '2026-02-03', '2026-02-03 15:45:24', 1, NULL, 0, 0),
-(1607, 5, 'ब्रिक्स', 'hi', 'ब्रिक्स ब्राजील, रूस, भारत, चीन और दक्षिण अफ्रीका जैसे पांच प्रमुख उभरती अर्थव्यवस्थाओं के एक समूह का संक्षिप्त नाम है। | Example: ब्रिक्स देशों ने वैश्विक अर्थव्यवस्था में महत्वपूर्ण भूमिका निभाई है। | Synonyms: उभरती अर्थव्यवस्थाओं का समूह, पांच देशों का संगठन, आर्थिक सहयोग मंच', 1, 0, '2026-02-03', '2026-02-03 15:45:23', 1, NULL, 0, 0),
-(1608, 5, 'नकल', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:45:29', 1, NULL, 0, 0),
-(1609, 5, 'अक्सर', 'hi', 'अक्सर का अर्थ है किसी कार्य या घटना का बार-बार या नियमित रूप से घटित होना। | Example: वह अक्सर सुबह की सैर पर जाता है। | Synonyms: प्रायः, बार-बार, बहुधा', 1, 0, '2026-02-03', '2026-02-03 15:45:31', 1, NULL, 0, 0),
-(1610, 5, 'ब्लड', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1611, 5, 'दोन', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1612, 5, 'स्वाम', 'hi', 'स्वाम (Svām) शब्द का प्रयोग किसी मालिक, स्वामी, या गुरु को संदर्भित करने के लिए किया जाता है, विशेषकर पारंपरिक या आध्यात्मिक संदर्भों में। | Example: मंदिर के स्वाम ने भक्तों को उपदेश दिया। | Synonyms: मालिक, स्वामी, गुरु', 1, 0, '2026-02-03', '2026-02-03 15:45:48', 1, NULL, 0, 0),
-(1613, 5, 'विधायक', 'hi', 'विधायक वह व्यक्ति होता है जिसे जनता द्वारा राज्य विधान सभा में कानून बनाने और अपने क्षेत्र का प्रतिनिधित्व करने के लिए चुना जाता है। | Example: हमारे क्षेत्र के विधायक ने नई सड़क के निर्माण का वादा किया है। | Synonyms: विधान-मंडल सदस्य, जनप्रतिनिधि, कानून निर्माता', 1, 0, '2026-02-03', '2026-02-03 15:45:41', 1, NULL, 0, 0),
-(1614, 5, 'यूटर', 'hi', 'यूटर वह व्यक्ति होता है जो यूट्यूब प्लेटफॉर्म पर वीडियो बनाता और अपलोड करता है। | Example: आजकल कई यूटर अपनी रचनात्मकता से लाखों कमा रहे हैं। | Synonyms: यूट्यूब निर्माता, वीडियो निर्माता, कंटेंट क्रिएटर', 1, 0, '2026-02-03', '2026-02-03 15:45:40', 1, NULL, 0, 0),
-(1615, 5, 'इंच', 'hi', 'इंच लंबाई मापने की एक इकाई है जो एक फुट का बारहवाँ हिस्सा होती है। | Example: यह मेज़ दो इंच मोटी है। | Synonyms: अंगुल, इंची', 1, 0, '2026-02-03', '2026-02-03 15:45:57', 1, NULL, 0, 0),
-(1616, 5, 'आपक', 'hi', 'आपका (aapka) is a respectful possessive pronoun or adjective meaning ''your'' or ''yours''. | Example: आपका नाम क्या है? (What is your name?) | Synonyms: तुम्हारा (tumhara), तेरा (tera)', 1, 0, '2026-02-03', '2026-02-03 15:45:59', 1, NULL, 0, 0),
-(1617, 5, 'सिर्फ', 'hi', 'यह किसी चीज़ की सीमितता या विशिष्टता को व्यक्त करता है। | Example: मुझे सिर्फ पाँच मिनट लगेंगे। | Synonyms: केवल, मात्र', 1, 0, '2026-02-03', '2026-02-03 15:45:58', 1, NULL, 0, 0),
-(1618, 5, 'रशिय', 'hi', 'रशिय पूर्वी यूरोप और उत्तरी एशिया में फैला हुआ एक विशाल देश है। | Example: रशिय दुनिया के सबसे बड़े देशों में से एक है। | Synonyms: रूस, रूसी संघ', 1, 0, '2026-02-03', '2026-02-03 15:46:03', 1, NULL, 0, 0),
-(1619, 5, 'सियास', 'hi', 'सियास शब्द का प्रयोग शासन, प्रशासन या राजनीति से संबंधित गतिविधियों और प्रक्रियाओं को संदर्भित करने के लिए किया जाता है। | Example: किसी भी देश की सियास उसकी जनता के कल्याण पर केंद्रित होनी चाहिए। | Synonyms: राजनीति, शासन, प्रशासन', 1, 0, '2026-02-03', '2026-02-03 15:46:06', 1, NULL, 0, 0),
-(1620, 5, 'चुनौत', 'hi', 'किसी व्यक्ति या समूह को अपनी क्षमता या शक्ति सिद्ध करने के लिए दिया गया कठिन कार्य या स्थिति। | Example: पहाड़ों पर चढ़ना एक बड़ी शारीरिक चुनौती है। | Synonyms: ललकार, इम्तिहान, कठिनाई', 1, 0, '2026-02-03', '2026-02-03 15:46:09', 1, NULL, 0, 0),
-(1621, 5, 'आवाजाह', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:46:09', 1, NULL, 0, 0),
-(1622, 5, 'ट्राई', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:46:10', 1, NULL, 0, 0),
-(1623, 5, 'लीटर', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1624, 5, 'विंस', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1625, 5, 'वॉटर', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1626, 5, 'जनपद', 'hi', 'जनपद refers to an administrative district or a region within a state or country. | Example: प्रत्येक राज्य कई जनपदों में विभाजित होता है। (Each state is divided into several districts.) | Synonyms: ज़िला, क्षेत्र', 1, 0, '2026-02-03', '2026-02-03 15:46:24', 1, NULL, 0, 0),
-(1627, 5, 'प्रोजेक्ट', 'hi', 'प्रोजेक्ट एक विशेष उद्देश्य के लिए योजनाबद्ध तरीके से किया जाने वाला कार्य या उद्यम है। | Example: छात्रों को विज्ञान मेले के लिए एक नया प्रोजेक्ट बनाना है। | Synonyms: परियोजना, कार्य, योजना', 1, 0, '2026-02-03', '2026-02-03 15:46:24', 1, NULL, 0, 0),
-(1628, 5, 'उच्च', 'hi', 'उच्च का अर्थ है किसी वस्तु, स्थान, पद या ध्वनि का ऊँचा, श्रेष्ठ या श्रेष्ठतर होना। | Example: वह एक उच्च पद पर कार्यरत है। | Synonyms: ऊँचा, श्रेष्ठ, महान', 1, 0, '2026-02-03', '2026-02-03 15:46:26', 1, NULL, 0, 0),
-(1629, 5, 'पदस्थ', 'hi', 'किसी पद या ओहदे पर नियुक्त या कार्यरत व्यक्ति। | Example: वह एक उच्च पदस्थ अधिकारी है। | Synonyms: कार्यरत, सेवारत, नियुक्त', 1, 0, '2026-02-03', '2026-02-03 15:46:25', 1, NULL, 0, 0),
-(1630, 5, 'फ्रांस', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:46:40', 1, NULL, 0, 0),
-(1631, 5, 'सिंगर', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:46:40', 1, NULL, 0, 0),
-(1632, 5, 'ट्रांसफर', 'hi', 'किसी व्यक्ति या वस्तु को एक स्थान, पद या स्थिति से दूसरे स्थान, पद या स्थिति में भेजने या ले जाने की क्रिया। | Example: उसका ट्रांसफर दिल्ली से मुंबई हो गया है। | Synonyms: स्थानांतरण, बदली', 1, 0, '2026-02-03', '2026-02-03 15:46:45', 2, NULL, 0, 0),
-(1633, 5, 'संदर्भ', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:46:40', 1, NULL, 0, 0),
-(1634, 5, 'वार्त', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:46:40', 1, NULL, 0, 0),
-(1635, 5, 'अच्छ', 'hi', 'यह शब्द किसी वस्तु, व्यक्ति या स्थिति के सकारात्मक, उत्तम या संतोषजनक होने का वर्णन करता है। | Example: यह एक बहुत अच्छा विचार है। | Synonyms: उत्तम, श्रेष्ठ, बढ़िया', 1, 0, '2026-02-03', '2026-02-03 15:46:54', 1, NULL, 0, 0),
-(1636, 5, 'युव', 'hi', 'युव का अर्थ है युवावस्था में स्थित व्यक्ति या युवा पीढ़ी का सदस्य। | Example: युव पीढ़ी देश के विकास में महत्वपूर्ण भूमिका निभाती है। | Synonyms: युवा, तरुण, नवयुवक', 1, 0, '2026-02-03', '2026-02-03 15:46:52', 1, NULL, 0, 0),
-(1637, 5, 'बुकिंग', 'hi', 'बुकिंग किसी सेवा, स्थान या वस्तु को पहले से आरक्षित करने की प्रक्रिया है। | Example: मैंने अपनी छुट्टी के लिए होटल की बुकिंग कर ली है। | Synonyms: आरक्षण, रिजर्वेशन', 1, 0, '2026-02-03', '2026-02-03 15:46:51', 1, NULL, 0, 0),
-(1638, 5, 'नायब', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1639, 5, 'सैन', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1640, 5, 'पिप्पलाद', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1641, 5, 'स्मॉल', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1642, 5, 'थिंग्स', 'hi', NULL, 0, 0, '2026-02-03', '2026-02-03', 1, NULL, 0, 0),
-(1643, 5, 'एंड', 'hi', 'यह दो या दो से अधिक शब्दों, वाक्यांशों या वाक्यों को जोड़ने के लिए प्रयोग किया जाने वाला एक संयोजक है, जो उनके संयुक्त होने का संकेत देता है। | Example: राम एंड श्याम दोस्त हैं। | Synonyms: और, तथा', 1, 0, '2026-02-03', '2026-02-03 15:47:18', 1, NULL, 0, 0),
-(1644, 5, 'पॉसिबल', 'hi', 'कुछ ऐसा जो हो सकता है या जिसे किया जा सकता है। | Example: क्या यह काम आज पूरा करना पॉसिबल है? | Synonyms: संभव, मुमकिन, साध्य', 1, 0, '2026-02-03', '2026-02-03 15:47:18', 1, NULL, 0, 0),
-(1645, 5, 'गठित', 'hi', 'किसी समूह, संस्था या संरचना का निर्माण किया हुआ या बनाया गया। | Example: सरकार ने बाढ़ पीड़ितों की सहायता के लिए एक विशेष टीम गठित की है। | Synonyms: निर्मित, स्थापित, बनाया गया', 1, 0, '2026-02-03', '2026-02-03 15:47:19', 1, NULL, 0, 0),
-(1646, 5, 'किताब', 'hi', 'किताब लिखित या मुद्रित पन्नों का एक संग्रह है जिसे एक साथ बांधा जाता है। | Example: मुझे किताबें पढ़ना बहुत पसंद है। | Synonyms: पुस्तक, ग्रंथ', 1, 0, '2026-02-03', '2026-02-03 15:47:19', 1, NULL, 0, 0),
-(1647, 5, 'रिपोर्ट', 'hi', 'रिपोर्ट का अर्थ है किसी घटना, स्थिति या जाँच का लिखित या मौखिक विवरण प्रस्तुत करना। | Example: पुलिस ने घटना की पूरी रिपोर्ट तैयार की। | Synonyms: विवरण, प्रतिवेदन, जानकारी', 1, 0, '2026-02-03', '2026-02-03 15:47:18', 2, NULL, 0, 0),
-(1648, 5, 'पुष्ट', 'hi', 'पुष्ट का अर्थ है शारीरिक रूप से स्वस्थ, मजबूत और अच्छी तरह से पोषित, या किसी बात का प्रमाणित और दृढ़ होना। | Example: नियमित व्यायाम से उसका शरीर पुष्ट हो गया है। | Synonyms: मजबूत, स्वस्थ, हृष्ट-पुष्ट', 1, 0, '2026-02-03', '2026-02-03 15:47:18', 1, NULL, 0, 0),
-(1649, 5, 'स्कोड', 'hi', 'स्कोड शब्द आमतौर पर कंप्यूटर प्रोग्रामिंग में उपयोग किए जाने वाले निर्देशों के एक सेट या किसी विशेष प्रणाली के नियमों को दर्शाता है। | Example: डेवलपर ने वेबसाइट के लिए नया स्कोड लिखा। | Synonyms: कोड, निर्देश', 1, 0, '2026-02-03', '2026-02-03 15:47:20', 1, NULL, 0, 0),
-(1650, 5, 'खास', 'hi', 'Something that is special, particular, important, or specific. | Example: यह मेरे लिए बहुत खास दिन है। (This is a very special day for me.) | Synonyms: विशेष, महत्वपूर्ण, मुख्य', 1, 0, '2026-02-03', '2026-02-03 15:47:23', 1, NULL, 0, 0),
-(1651, 5, 'लेटेस्ट', 'hi', 'सबसे नया या हाल ही का। | Example: यह हमारे स्टोर में लेटेस्ट मोबाइल फोन है। | Synonyms: नवीनतम, ताज़ा, हाल ही का', 1, 0, '2026-02-03', '2026-02-03 15:47:22', 1, NULL, 0, 0),
-(1652, 5, 'धीम', 'hi', 'परिभाषा लंबित...', 1, 0, '2026-02-03', '2026-02-03 17:20:38', 1, NULL, 0, 0),
-(1653, 5, 'मिलकर', 'hi', '', 0, 0, '2026-02-03', '2026-02-03 15:47:26', 1, NULL, 0, 0),
-(1654, 5, 'tried', 'en', 'To have made an effort to do something, or to have tested the quality or suitability of something. | Example: She tried her best to finish the marathon despite the pain. | Synonyms: attempted, endeavored, tested', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1655, 5, 'spot', 'en', 'A particular place, point, or small mark. | Example: We found the perfect spot for our picnic. | Synonyms: location, place, site', 1, 0, '2026-02-03', '2026-02-03 17:34:01', 1, NULL, 0, 0),
-(1656, 5, 'once', 'en', 'On one occasion or at some point in the past. | Example: I only visited Paris once, but I loved it. | Synonyms: formerly, previously, before', 1, 0, '2026-02-03', '2026-02-03', 7, NULL, 0, 0),
-(1657, 5, 'working', 'en', 'Engaged in labor, functioning effectively, or currently in operation. | Example: The working parts of the machine require regular maintenance. | Synonyms: operating, functional, employed', 1, 0, '2026-02-03', '2026-02-04', 8, NULL, 0, 0),
-(1658, 5, 'say', 'en', 'To express something in words or communicate information. | Example: She wanted to say goodbye before leaving. | Synonyms: speak, utter, state', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(1659, 5, 'despite', 'en', 'Despite means without being affected by a particular factor or circumstance, or in spite of something. | Example: Despite the heavy traffic, she arrived at the meeting on time. | Synonyms: in spite of, notwithstanding, regardless of', 1, 0, '2026-02-03', '2026-02-03 17:34:09', 1, NULL, 0, 0),
-(1660, 5, 'fish', 'en', 'A cold-blooded vertebrate animal that lives in water, breathes with gills, and typically has fins and scales. | Example: We watched the colorful fish swim gracefully through the coral reef. | Synonyms: aquatic animal, marine creature, sea creature', 1, 0, '2026-02-03', '2026-02-03 17:34:42', 1, NULL, 0, 0),
-(1661, 5, 'speaking', 'en', 'The act or process of expressing thoughts, feelings, or information orally. | Example: Public speaking is a skill that many people find challenging. | Synonyms: talking, conversing, articulation', 1, 0, '2026-02-03', '2026-02-03 17:34:42', 1, NULL, 0, 0),
-(1662, 5, 'again', 'en', 'Once more; another time; anew. | Example: Could you please explain that concept again? | Synonyms: once more, anew, afresh', 1, 0, '2026-02-03', '2026-02-03', 3, NULL, 0, 0),
-(1663, 5, 'comida', 'es', 'Comida is a Spanish word that refers to any substance eaten for nourishment, or more commonly, a meal taken at a specific time of day. | Example: La comida está deliciosa. | Synonyms: alimento, plato, vianda', 1, 0, '2026-02-03 17:34:40', '2026-02-03 17:34:40', 1, NULL, 0, 0),
-(1664, 5, 'seeing', 'en', 'The faculty or act of perceiving with the eyes. | Example: His seeing improved significantly after the surgery. | Synonyms: vision, sight, perception', 1, 0, '2026-02-03', '2026-02-03 17:34:53', 1, NULL, 0, 0),
-(1665, 5, 'speech', 'en', 'The faculty or act of speaking, or a formal address delivered to an audience. | Example: The politician delivered a passionate speech about economic reform. | Synonyms: address, discourse, oration', 1, 0, '2026-02-03', '2026-02-03 17:34:52', 1, NULL, 0, 0),
-(1666, 5, 'supported', 'en', 'Given assistance, encouragement, or financial aid; or held up physically. | Example: She felt supported by her family throughout her challenging journey. | Synonyms: aided, assisted, backed', 1, 0, '2026-02-03', '2026-02-03 17:34:53', 1, NULL, 0, 0),
-(1667, 5, 'yup', 'en', 'Yup is an informal and often casual way of expressing agreement or affirmation. | Example: Yup, I''ll be there by five o''clock. | Synonyms: yes, yeah, affirmative', 1, 0, '2026-02-03', '2026-02-03 17:34:57', 1, NULL, 0, 0),
-(1668, 5, 'heard', 'en', 'The past tense and past participle of ''hear'', meaning to perceive a sound with the ear. | Example: She heard the distant church bells ringing. | Synonyms: perceived, detected', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1669, 5, 'dirt', 'en', 'Loose earth or soil, often considered unclean or unwanted. | Example: The gardener dug his hands into the dirt to plant the new sapling. | Synonyms: soil, earth, grime', 1, 0, '2026-02-03', '2026-02-03 17:35:17', 1, NULL, 0, 0),
-(1670, 5, 'some', 'en', 'Referring to an unspecified quantity or number, indicating more than none but not a large amount, or an unspecified individual or group. | Example: Could you please give me some sugar for my coffee? | Synonyms: a few, a little, certain', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(1671, 5, 'oil', 'en', 'Oil is a viscous liquid, typically derived from petroleum, plants, or animals, that is insoluble in water and used as a fuel, lubricant, or for cooking. | Example: She added a tablespoon of olive oil to the pan before frying the vegetables. | Synonyms: petroleum, lubricant, grease', 1, 0, '2026-02-03', '2026-02-03 17:35:25', 1, NULL, 0, 0),
-(1672, 5, 'logo', 'en', 'A distinctive graphic mark, emblem, or symbol used to identify a company, organization, product, or brand. | Example: The new startup spent months designing a unique logo to represent its innovative technology. | Synonyms: emblem, trademark, brand mark', 1, 0, '2026-02-03', '2026-02-03 17:35:25', 1, NULL, 0, 0),
-(1673, 5, 'learning', 'en', 'Learning is the process of acquiring new knowledge, skills, behaviors, or values through study, experience, or being taught. | Example: Her passion for learning led her to explore many different subjects. | Synonyms: education, study, acquisition', 1, 0, '2026-02-03', '2026-02-03 17:35:27', 2, NULL, 0, 0),
-(1674, 5, 'potter', 'en', 'A person whose profession is to make pottery, especially by hand on a potter''s wheel. | Example: The skilled potter carefully molded the clay into a delicate vase. | Synonyms: ceramist, artisan', 1, 0, '2026-02-03', '2026-02-03 17:35:28', 1, NULL, 0, 0),
-(1675, 5, 'add', 'en', 'To combine or join something to something else, increasing the number, size, or amount. | Example: Please add the new items to the shopping list. | Synonyms: include, combine, join', 1, 0, '2026-02-03', '2026-02-03 17:35:30', 1, NULL, 0, 0),
-(1676, 5, 'click', 'en', 'To make a short, sharp sound, often by pressing a button on a device, or to press such a button. | Example: She clicked the mouse to open the document. | Synonyms: press, tap, snap', 1, 0, '2026-02-03', '2026-02-03 17:35:42', 1, NULL, 0, 0),
-(1677, 5, 'ripped', 'en', 'Having very well-defined muscles and very low body fat, giving a sculpted appearance. | Example: After months of intense weightlifting and strict dieting, he was completely ripped for the competition. | Synonyms: muscular, chiseled, shredded', 1, 0, '2026-02-03', '2026-02-03 17:35:39', 1, NULL, 0, 0),
-(1678, 5, 'hard', 'en', 'Requiring a great deal of effort or endurance; difficult to do, understand, or deal with. | Example: Solving the complex math problem was very hard for the students. | Synonyms: difficult, tough, challenging', 1, 0, '2026-02-03', '2026-02-03 17:35:40', 1, NULL, 0, 0),
-(1679, 5, 'still', 'en', 'Continuing to be or happen up to the present moment, or not moving or making a sound. | Example: Despite the rain, he still decided to go for a walk. | Synonyms: yet, motionless, nevertheless', 1, 0, '2026-02-03', '2026-02-03 17:35:45', 1, NULL, 0, 0),
-(1680, 5, 'looking', 'en', 'The act of directing one''s eyes to see something or in a particular direction. | Example: He was looking for his lost keys all morning. | Synonyms: gazing, observing, watching', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1681, 5, 'seen', 'en', 'The past participle of ''see,'' meaning perceived or observed with the eyes, or understood. | Example: She had never seen such a beautiful sunset before. | Synonyms: observed, noticed, viewed', 1, 0, '2026-02-03', '2026-02-03 17:36:04', 1, NULL, 0, 0),
-(1682, 5, 'key', 'en', 'A crucial element, means, or device for understanding, solving, or achieving something. | Example: Understanding the customer''s needs is the key to successful marketing. | Synonyms: solution, answer, secret', 1, 0, '2026-02-03', '2026-02-03 17:36:07', 1, NULL, 0, 0),
-(1683, 5, 'germany', 'en', 'Germany is a country located in Central Europe, known for its rich history, culture, and economic influence. | Example: Many people enjoy visiting the historic cities and scenic landscapes of Germany. | Synonyms: Federal Republic of Germany, Deutschland', 1, 0, '2026-02-03', '2026-02-03 17:36:06', 1, NULL, 0, 0),
-(1684, 5, 'feeling', 'en', 'An emotional state or reaction, or a physical sensation experienced by a person. | Example: She had a strong feeling of happiness when she received the good news. | Synonyms: emotion, sensation, sentiment', 1, 0, '2026-02-03', '2026-02-03 17:36:05', 1, NULL, 0, 0),
-(1685, 5, 'else', 'en', 'In addition to what has been mentioned or specified; other. | Example: Is there anything else you would like to add? | Synonyms: other, additional, different', 1, 0, '2026-02-03', '2026-02-03 17:36:21', 1, NULL, 0, 0),
-(1686, 5, 'try', 'en', 'To make an effort or an attempt to do something. | Example: Please try to arrive on time for the meeting. | Synonyms: attempt, endeavor, strive', 1, 0, '2026-02-03', '2026-02-04', 5, NULL, 0, 0),
-(1687, 5, 'changes', 'en', 'Alterations or modifications that make something different from what it was. | Example: The recent changes to the software improved its overall performance. | Synonyms: modifications, alterations, adjustments', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1688, 5, 'back', 'en', 'The rear surface of the human body from the shoulders to the hips, or the corresponding part of an animal. | Example: She felt a sharp pain in her lower back after the fall. | Synonyms: spine, dorsum, posterior', 1, 0, '2026-02-03', '2026-02-04', 4, NULL, 0, 0),
-(1689, 5, 'home', 'en', 'The place where one lives permanently, especially as a member of a family or household. | Example: After a long day at work, all she wanted was to go home and relax. | Synonyms: house, residence, dwelling', 1, 0, '2026-02-03', '2026-02-03 17:36:19', 1, NULL, 0, 0),
-(1690, 5, 'connect', 'en', 'To bring together or establish a link between two or more things, often to create a relationship or make a circuit. | Example: The new fiber optic cable will connect the remote village to the internet. | Synonyms: link, join, unite', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1691, 5, 'nifty', 'en', 'Nifty describes something that is particularly good, clever, stylish, or effective. | Example: She came up with a nifty solution to fix the leaky faucet. | Synonyms: clever, stylish, handy', 1, 0, '2026-02-03', '2026-02-03 17:36:36', 1, NULL, 0, 0),
-(1692, 5, 'higher', 'en', 'At or to a more elevated position, level, or degree. | Example: The mountain peak was much higher than we anticipated. | Synonyms: elevated, superior, greater', 1, 0, '2026-02-03', '2026-02-03 17:36:36', 1, NULL, 0, 0),
-(1693, 5, 'elo', 'en', 'Elo is a method for calculating the relative skill levels of players in competitor-versus-competitor games, often used as a numerical rating system. | Example: After the recent chess tournament, his Elo rating significantly increased. | Synonyms: rating, ranking, score', 1, 0, '2026-02-03', '2026-02-03 17:36:37', 1, NULL, 0, 0),
-(1694, 5, 'though', 'en', 'Though is used to introduce a statement that contrasts with or qualifies something that has just been said. | Example: Though it was late, she decided to finish her work. | Synonyms: although, however, nevertheless', 1, 0, '2026-02-03', '2026-02-03 17:36:37', 1, NULL, 0, 0),
-(1695, 5, 'done', 'en', 'Completed, finished, or brought to an end. | Example: Are you done with your work for the day? | Synonyms: finished, completed, accomplished', 1, 0, '2026-02-03', '2026-02-03', 2, NULL, 0, 0),
-(1696, 5, 'does', 'en', 'The word ''does'' is the third-person singular present tense form of the verb ''to do,'' used to indicate an action, performance, or as an auxiliary verb to form questions and negative statements. | Example: She does her best work when she is focused. | Synonyms: performs, executes, accomplishes', 1, 0, '2026-02-03', '2026-02-03 17:36:39', 1, NULL, 0, 0),
-(1697, 5, 'stash', 'en', 'A secret or hidden store of something, often valuable or illicit. | Example: He kept a small stash of emergency cash hidden in his sock drawer. | Synonyms: cache, hoard, supply', 1, 0, '2026-02-03', '2026-02-03 17:36:36', 1, NULL, 0, 0),
-(1698, 5, 'sad', 'en', 'Experiencing or showing sorrow, unhappiness, or grief. | Example: He felt very sad after hearing the news of his friend''s departure. | Synonyms: unhappy, sorrowful, dejected', 1, 0, '2026-02-03', '2026-02-03 17:36:40', 1, NULL, 0, 0),
-(1699, 5, 'predecessor', 'en', 'A predecessor is a person or thing that held a position or existed before another. | Example: The new software version includes many improvements over its predecessor. | Synonyms: forerunner, antecedent, precursor', 1, 0, '2026-02-03', '2026-02-03 17:37:27', 1, NULL, 0, 0),
-(1700, 5, 'admit', 'en', 'To confess or acknowledge the truth of something, often reluctantly, or to allow entry or access. | Example: He had to admit that he had made a mistake during the presentation. | Synonyms: confess, acknowledge, allow', 1, 0, '2026-02-03', '2026-02-03 17:37:27', 1, NULL, 0, 0),
-(1701, 5, 'rupees', 'en', 'Rupees are the monetary units used in several countries, including India, Pakistan, Sri Lanka, Nepal, Mauritius, and Seychelles. | Example: He paid for the souvenirs with a handful of Indian rupees. | Synonyms: currency, money, funds', 1, 0, '2026-02-03', '2026-02-03 17:37:27', 1, NULL, 0, 0),
-(1702, 5, 'stock', 'en', 'A supply of goods or merchandise kept on hand by a business for sale or distribution. | Example: The grocery store had a large stock of fresh produce ready for customers. | Synonyms: inventory, merchandise, supply', 1, 0, '2026-02-03', '2026-02-03 17:37:28', 1, NULL, 0, 0),
-(1703, 5, 'market', 'en', 'A place or system where buyers and sellers interact to exchange goods, services, or information. | Example: The local farmers'' market offers fresh produce directly from the growers. | Synonyms: marketplace, bazaar, exchange', 1, 0, '2026-02-03', '2026-02-03 17:37:27', 1, NULL, 0, 0),
-(1704, 5, 'prior', 'en', 'Existing or happening before something else in time, order, or importance. | Example: You need to complete the prior task before you can start the next one. | Synonyms: previous, earlier, preceding', 1, 0, '2026-02-03', '2026-02-03 17:37:27', 1, NULL, 0, 0),
-(1705, 5, 'knowledge', 'en', 'The information, understanding, and skills acquired through experience or education. | Example: Her extensive knowledge of ancient civilizations made her an invaluable resource for the project. | Synonyms: understanding, information, expertise', 1, 0, '2026-02-03', '2026-02-03 17:37:28', 1, NULL, 0, 0),
-(1706, 5, 'buffy', 'en', 'Having a dull yellow or yellowish-brown color, often resembling the color of unbleached leather. | Example: The buffy plumage of the bird provided excellent camouflage against the dry grass. | Synonyms: yellowish, tawny, light brown', 1, 0, '2026-02-03', '2026-02-03 17:37:26', 1, NULL, 0, 0),
-(1707, 5, 'product', 'en', 'A product is an item or service that is produced and offered for sale, or a result obtained from a process or effort. | Example: The new software update is the latest product from the tech company. | Synonyms: output, result, commodity', 1, 0, '2026-02-03', '2026-02-03 17:37:28', 1, NULL, 0, 0),
-(1708, 5, 'ando', 'en', 'The term "ando" is not an English word; it is the first-person singular present indicative conjugation of the Spanish verb "andar", meaning "I walk" or "I am walking." | Example: In Spanish, the phrase "Yo ando por el parque" translates to "I walk through the park." | Synonyms: (no direct English synonyms), I walk, I am walking', 1, 0, '2026-02-03', '2026-02-03 17:37:58', 1, NULL, 0, 0),
-(1709, 5, 'mana', 'en', 'A supernatural power or life force that can be concentrated in objects or persons, often associated with spiritual energy or magical abilities in fantasy contexts. | Example: In many fantasy role-playing games, a wizard must consume mana to cast powerful spells. | Synonyms: energy, power, essence', 1, 0, '2026-02-03', '2026-02-03 17:37:57', 1, NULL, 0, 0),
-(1710, 5, 'cushion', 'en', 'A soft pad or pillow used for comfort, support, or protection. | Example: She leaned back against the plush cushion on the armchair. | Synonyms: pad, pillow, bolster', 1, 0, '2026-02-03', '2026-02-03 17:37:57', 1, NULL, 0, 0),
-(1711, 5, 'major', 'en', 'Major describes something that is very large or important in scope, extent, or effect. | Example: The company made a major investment in renewable energy. | Synonyms: important, significant, principal', 1, 0, '2026-02-03', '2026-02-03 17:38:11', 1, NULL, 0, 0),
-(1712, 5, 'should', 'en', 'Should is a modal verb used to indicate what is advisable, correct, or expected, or to express a recommendation or obligation. | Example: You should wear a coat; it''s cold outside. | Synonyms: ought to, supposed to', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1713, 5, 'transcriber', 'en', 'A transcriber is a person or device that converts spoken language or written text into another form, typically written or digital. | Example: The legal transcriber worked diligently to convert the audio recording of the court proceedings into a precise written document. | Synonyms: typist, copyist, scribe', 1, 0, '2026-02-03', '2026-02-03 17:38:11', 1, NULL, 0, 0),
-(1714, 5, 'project', 'en', 'A planned piece of work or an undertaking that has a specific aim and usually involves a team. | Example: The team successfully completed the complex software development project on time. | Synonyms: undertaking, task, assignment', 1, 0, '2026-02-03', '2026-02-03 17:38:13', 1, NULL, 0, 0),
-(1715, 5, 'health', 'en', 'The state of being free from illness or injury, encompassing physical, mental, and social well-being. | Example: Regular exercise and a balanced diet are crucial for maintaining good health. | Synonyms: well-being, fitness, wellness', 1, 0, '2026-02-03', '2026-02-03 17:38:14', 1, NULL, 0, 0),
-(1716, 5, 'had', 'en', 'Had is the past tense and past participle of the verb "to have," indicating possession, experience, or completion of an action. | Example: She had a wonderful dream last night. | Synonyms: possessed, experienced, consumed', 1, 0, '2026-02-03', '2026-02-04', 3, NULL, 0, 0),
-(1717, 5, 'fears', 'en', 'Fears are distressing emotions caused by the belief that someone or something is dangerous, likely to cause pain, or a threat. | Example: Despite his brave exterior, he harbored many secret fears about the future. | Synonyms: anxieties, phobias, dreads', 1, 0, '2026-02-03', '2026-02-03 17:38:12', 1, NULL, 0, 0),
-(1718, 5, 'doctor', 'en', 'A person who is qualified to practice medicine and treats people who are ill or injured. | Example: The doctor carefully examined the patient''s symptoms before making a diagnosis. | Synonyms: physician, medical practitioner, clinician', 1, 0, '2026-02-03', '2026-02-03 17:38:11', 1, NULL, 0, 0),
-(1719, 5, 'financial', 'en', 'Relating to finance, money, or the management of money and other assets. | Example: The company is seeking financial advice to improve its investment strategy. | Synonyms: monetary, economic, fiscal', 1, 0, '2026-02-03', '2026-02-03 17:38:11', 1, NULL, 0, 0),
-(1720, 5, 'proponent', 'en', 'A proponent is a person who advocates for or supports a theory, proposal, or course of action. | Example: She has always been a strong proponent of animal rights and environmental protection. | Synonyms: advocate, supporter, champion', 1, 0, '2026-02-03', '2026-02-03 17:38:11', 1, NULL, 0, 0),
-(1721, 5, 'anything', 'en', 'Anything refers to a thing of any kind, or something, no matter what it is. | Example: Do you need anything from the store? | Synonyms: something, whatever', 1, 0, '2026-02-03', '2026-02-03 17:38:13', 1, NULL, 0, 0),
-(1722, 5, 'soul', 'en', 'The spiritual or immaterial part of a human being, often regarded as immortal and distinct from the body. | Example: Many cultures believe the soul departs the body at the moment of death. | Synonyms: spirit, psyche, essence', 1, 0, '2026-02-03', '2026-02-03 17:38:12', 1, NULL, 0, 0),
-(1723, 5, 'dead', 'en', 'No longer living; having ceased to exist or function. | Example: The old tree stood dead and barren after the harsh winter. | Synonyms: lifeless, deceased, extinct', 1, 0, '2026-02-03', '2026-02-03 17:38:23', 1, NULL, 0, 0),
-(1724, 5, 'adding', 'en', 'The action or process of joining something to something else so as to increase the size, number, or amount. | Example: He is adding new features to the software update. | Synonyms: increasing, supplementing, including', 1, 0, '2026-02-03', '2026-02-03 17:38:27', 1, NULL, 0, 0),
-(1725, 5, 'extra', 'en', 'Beyond what is usual, necessary, or expected; additional. | Example: The hotel provided an extra blanket in the closet. | Synonyms: additional, supplementary, surplus', 1, 0, '2026-02-03', '2026-02-03 17:38:24', 1, NULL, 0, 0),
-(1726, 5, 'features', 'en', 'Distinctive attributes, qualities, or prominent parts of something. | Example: The new software update includes several exciting features, such as improved security and a redesigned user interface. | Synonyms: characteristics, attributes, qualities', 1, 0, '2026-02-03', '2026-02-03 17:38:25', 1, NULL, 0, 0),
-(1727, 5, 'environment', 'en', 'The surroundings or conditions in which a person, animal, or plant lives or operates. | Example: Protecting the natural environment is crucial for the health of all living things. | Synonyms: surroundings, habitat, setting', 1, 0, '2026-02-03', '2026-02-03 17:38:26', 1, NULL, 0, 0),
-(1728, 5, 'pages', 'en', 'Pages are the individual sheets of paper bound together to form a book, magazine, or document, often numbered and containing text or images. | Example: She carefully turned the pages of the ancient manuscript, fearing they might crumble. | Synonyms: sheets, leaves, folios', 1, 0, '2026-02-03', '2026-02-03 17:38:41', 1, NULL, 0, 0),
-(1729, 5, 'take', 'en', 'To lay hold of something with the hands, seize, or acquire possession of it. | Example: Please take your umbrella with you as it might rain later. | Synonyms: seize, obtain, grab', 1, 0, '2026-02-03', '2026-02-04', 2, NULL, 0, 0),
-(1730, 5, 'london', 'en', 'London is the capital and largest city of England and the United Kingdom, situated on the River Thames. | Example: She plans to travel to London next summer to explore its historic sites and vibrant culture. | Synonyms: The Big Smoke, UK capital', 1, 0, '2026-02-03', '2026-02-03 17:38:54', 1, NULL, 0, 0),
-(1731, 5, 'alright', 'en', 'Definition pending...', 1, 0, '2026-02-03', '2026-02-03 18:33:18', 1, NULL, 0, 0),
-(1732, 5, 'guns', 'en', '', 0, 0, '2026-02-03', '2026-02-03 18:33:17', 1, NULL, 0, 0),
-(1733, 5, 'neither', 'en', 'Used to indicate that a statement is not true of either of two people or things, or to introduce the first of two or more negative clauses. | Example: Neither of the options seemed appealing to him. | Synonyms: not either, nor', 1, 0, '2026-02-03', '2026-02-03 20:21:50', 1, NULL, 0, 0),
-(1734, 5, 'issue', 'en', 'An issue is a point or matter of discussion, debate, or dispute, often implying a problem or concern. | Example: The main issue discussed at the meeting was the budget deficit. | Synonyms: problem, topic, concern', 1, 0, '2026-02-04', '2026-02-04', 2, NULL, 0, 0),
-(1735, 5, 'probably', 'en', 'Probably indicates that something is very likely to happen or be true, though not absolutely certain. | Example: She will probably arrive late due to the traffic. | Synonyms: likely, most likely, presumably', 1, 0, '2026-02-04', '2026-02-04 10:31:43', 1, NULL, 0, 0),
-(1736, 5, 'man', 'en', 'An adult human male. | Example: The man helped the elderly woman cross the street. | Synonyms: male, gentleman, fellow', 1, 0, '2026-02-04', '2026-02-04', 2, NULL, 0, 0),
-(1737, 5, 'fan', 'en', 'A fan is an enthusiastic admirer or supporter of a person, group, sport, or artistic work. | Example: The pop star''s fans waited for hours to get a glimpse of her. | Synonyms: admirer, devotee, supporter', 1, 0, '2026-02-04', '2026-02-04 10:31:57', 1, NULL, 0, 0),
-(1738, 5, 'grassroots', 'en', 'Grassroots refers to the most basic level of an activity or organization, especially when it involves ordinary people rather than leaders or experts. | Example: The political campaign gained momentum through a strong grassroots movement of local volunteers. | Synonyms: local, popular, community-based', 1, 0, '2026-02-04', '2026-02-04 10:31:58', 1, NULL, 0, 0),
-(1739, 5, 'grassy', 'en', 'Covered with or resembling grass. | Example: The children enjoyed rolling down the grassy hill in the park. | Synonyms: verdant, herbaceous, turfy', 1, 0, '2026-02-04', '2026-02-04 10:32:02', 1, NULL, 0, 0),
-(1740, 5, 'lack', 'en', 'Lack refers to the absence or insufficiency of something needed or desired. | Example: There was a complete lack of communication between the two teams. | Synonyms: shortage, absence, deficiency', 1, 0, '2026-02-04', '2026-02-04 10:32:02', 1, NULL, 0, 0),
-(1741, 5, 'support', 'en', 'To provide assistance, encouragement, or a foundation for something or someone. | Example: The community rallied to support the local charity event. | Synonyms: aid, assist, uphold', 1, 0, '2026-02-04', '2026-02-04 10:32:03', 1, NULL, 0, 0),
-(1742, 5, 'same', 'en', 'Being identical, not different, or having all the same qualities or characteristics. | Example: My new phone looks exactly the same as my old one. | Synonyms: identical, alike, equivalent', 1, 0, '2026-02-04', '2026-02-04 10:32:07', 1, NULL, 0, 0),
-(1743, 5, 'family', 'en', 'A group of people related by blood, marriage, or adoption, often living together as a unit. | Example: Our family always enjoys spending time together during the holidays. | Synonyms: household, kin, relatives', 1, 0, '2026-02-04', '2026-02-04 10:32:09', 1, NULL, 0, 0),
-(1744, 5, 'image', 'en', 'An image is a visual representation of something, such as a person, object, or scene, often created by a camera, artist, or reflected light, or it can be a mental concept or impression. | Example: The satellite transmitted a clear image of the hurricane''s eye. | Synonyms: picture, photograph, likeness', 1, 0, '2026-02-04', '2026-02-04 10:32:24', 1, NULL, 0, 0),
-(1745, 5, 'haven', 'en', 'A place of safety or refuge, often a harbor or a secure retreat. | Example: The quiet library became a haven for students seeking to escape the noisy campus. | Synonyms: refuge, sanctuary, shelter', 1, 0, '2026-02-04', '2026-02-04 10:32:39', 1, NULL, 0, 0),
-(1746, 5, 'declared', 'en', 'To have stated something officially, publicly, or explicitly. | Example: The company declared its quarterly earnings to the shareholders. | Synonyms: announced, stated, proclaimed', 1, 0, '2026-02-04', '2026-02-04 10:32:39', 1, NULL, 0, 0),
-(1747, 5, 'stable', 'en', 'Not likely to change or fail; firmly fixed or established. | Example: The country''s economy has remained stable despite global challenges. | Synonyms: steady, firm, constant', 1, 0, '2026-02-04', '2026-02-04 10:32:50', 1, NULL, 0, 0),
-(1748, 5, 'emotional', 'en', 'Relating to, showing, or arousing strong feelings and intense emotions. | Example: The speaker delivered an emotional plea for help, moving many in the audience to tears. | Synonyms: sentimental, passionate, sensitive', 1, 0, '2026-02-04', '2026-02-04 10:32:51', 1, NULL, 0, 0),
-(1749, 5, 'arousal', 'en', 'The state of being stimulated or excited, either physically or mentally. | Example: The unexpected sound caused a sudden arousal in the otherwise quiet room. | Synonyms: stimulation, excitation, awakening', 1, 0, '2026-02-04', '2026-02-04 10:32:51', 1, NULL, 0, 0),
-(1750, 5, 'office', 'en', 'A room, set of rooms, or building used as a place for commercial, professional, or administrative work. | Example: She spends most of her day working in her office downtown. | Synonyms: workplace, study, bureau', 1, 0, '2026-02-04', '2026-02-04 10:32:51', 1, NULL, 0, 0),
-(1751, 5, 'dust', 'en', 'Fine, dry particles of matter, especially those found on surfaces or suspended in the air. | Example: A thick layer of dust had settled on the old furniture. | Synonyms: dirt, powder, particles', 1, 0, '2026-02-04', '2026-02-04 10:32:51', 1, NULL, 0, 0),
-(1752, 5, 'voters', 'en', 'Voters are individuals who are legally entitled to cast a ballot in an election or referendum. | Example: The candidates spent months campaigning to persuade undecided voters. | Synonyms: electorate, constituents, electors', 1, 0, '2026-02-04', '2026-02-04 10:32:50', 1, NULL, 0, 0),
-(1753, 5, 'information', 'en', 'Facts, data, or knowledge acquired through study, experience, or instruction. | Example: The news report provided important information about the upcoming election. | Synonyms: data, facts, knowledge', 1, 0, '2026-02-04', '2026-02-04 10:32:54', 1, NULL, 0, 0),
-(1754, 5, 'luck', 'en', 'Success or failure apparently brought by chance rather than through one''s own actions. | Example: She had good luck finding a parking spot right in front of the store. | Synonyms: fortune, chance', 1, 0, '2026-02-04', '2026-02-04 10:33:02', 1, NULL, 0, 0),
-(1755, 5, 'multiplicity', 'en', 'Multiplicity is the state of being numerous or diverse, or a large number or variety of something. | Example: The multiplicity of challenges facing the project required a diverse range of solutions. | Synonyms: variety, diversity, abundance', 1, 0, '2026-02-04', '2026-02-04 10:33:08', 1, NULL, 0, 0),
-(1756, 5, 'nearly', 'en', 'Nearly means very close to; almost, but not completely. | Example: The project is nearly complete, with only a few minor tasks remaining. | Synonyms: almost, practically, virtually', 1, 0, '2026-02-04', '2026-02-04 10:33:07', 1, NULL, 0, 0),
-(1757, 5, 'great', 'en', 'Of an extent, amount, or intensity considerably above the average, or of high quality, importance, or ability. | Example: The team showed great determination to win the championship. | Synonyms: excellent, superb, outstanding', 1, 0, '2026-02-04', '2026-02-04 10:33:10', 1, NULL, 0, 0),
-(1758, 5, 'play', 'en', 'To engage in an activity for enjoyment and recreation rather than for a serious or practical purpose. | Example: The children love to play in the park every afternoon. | Synonyms: frolic, amuse, sport', 1, 0, '2026-02-04', '2026-02-04 10:33:14', 1, NULL, 0, 0),
-(1759, 5, 'things', 'en', 'Objects, matters, or possessions of an unspecified nature. | Example: Please gather all your things before we leave for the airport. | Synonyms: items, objects, possessions', 1, 0, '2026-02-04', '2026-02-04 10:33:14', 1, NULL, 0, 0),
-(1760, 5, 'sooner', 'en', 'At an earlier time or more quickly than something else. | Example: I hope to hear back from you sooner rather than later. | Synonyms: earlier, quicker, before long', 1, 0, '2026-02-04', '2026-02-04 10:33:14', 1, NULL, 0, 0),
-(1761, 5, 'flu', 'en', 'Flu is a common, highly contagious viral infection that attacks the respiratory system, causing symptoms such as fever, body aches, chills, and fatigue. | Example: Many people get a flu shot annually to protect themselves from the virus. | Synonyms: influenza, grippe', 1, 0, '2026-02-04', '2026-02-04 10:33:21', 1, NULL, 0, 0),
-(1762, 5, 'everybody', 'en', 'Everybody refers to all people in a group or generally, without exception. | Example: Everybody needs to bring a valid ID to enter the building. | Synonyms: everyone, all, all people', 1, 0, '2026-02-04', '2026-02-04 10:33:20', 1, NULL, 0, 0),
-(1763, 5, 'novel', 'en', 'New and not resembling something formerly known or used; original and unusual. | Example: The scientist proposed a novel approach to solving the complex problem. | Synonyms: new, original, unique', 1, 0, '2026-02-04', '2026-02-04 10:33:25', 1, NULL, 0, 0),
-(1764, 5, 'own', 'en', 'To possess something as one''s property or to acknowledge responsibility for something. | Example: They hope to own their first home by next year. | Synonyms: possess, have, admit', 1, 0, '2026-02-04', '2026-02-04 10:33:40', 2, NULL, 0, 0),
-(1765, 5, 'mistakes', 'en', 'Actions or judgments that are incorrect, misguided, or deviate from what is right, proper, or accurate. | Example: It''s important to learn from your mistakes rather than dwelling on them. | Synonyms: errors, blunders, faults', 1, 0, '2026-02-04', '2026-02-04 10:33:40', 1, NULL, 0, 0),
-(1766, 5, 'voice', 'en', 'The sound produced in a person''s larynx and uttered through the mouth, as speech or song. | Example: Her clear voice carried across the auditorium, captivating the audience. | Synonyms: sound, utterance, speech', 1, 0, '2026-02-04', '2026-02-04 10:33:47', 1, NULL, 0, 0),
-(1767, 5, 'gets', 'en', 'To obtain, receive, or acquire something, often implying an action or process leading to possession or understanding. | Example: She always gets excited when it snows. | Synonyms: obtains, receives, acquires', 1, 0, '2026-02-04', '2026-02-04 10:33:47', 1, NULL, 0, 0),
-(1768, 5, 'refused', 'en', 'To refuse means to decline to do, accept, or give something. | Example: The company refused to negotiate with the striking workers. | Synonyms: declined, rejected, denied', 1, 0, '2026-02-04', '2026-02-04 10:33:47', 1, NULL, 0, 0),
-(1769, 5, 'possible', 'en', 'Capable of happening, existing, or being done; within the bounds of what can occur or be achieved. | Example: It is possible that we will finish the project ahead of schedule. | Synonyms: feasible, conceivable, achievable', 1, 0, '2026-02-04', '2026-02-04', 2, NULL, 0, 0),
-(1770, 5, 'short', 'en', 'Having a small extent from end to end, or not long in duration or physical dimension. | Example: The short path to the lake was much quicker than the long road. | Synonyms: brief, small, compact', 1, 0, '2026-02-04', '2026-02-04 10:33:48', 1, NULL, 0, 0),
-(1771, 5, 'comedy', 'en', 'Comedy is a type of entertainment, often a play, film, or stand-up act, designed to amuse and evoke laughter from an audience. | Example: The audience roared with laughter throughout the entire comedy show. | Synonyms: humor, farce, satire', 1, 0, '2026-02-04', '2026-02-04 10:33:48', 1, NULL, 0, 0),
-(1772, 5, 'care', 'en', 'Care is the diligent attention or concern given to the well-being, maintenance, or protection of someone or something. | Example: The elderly man required constant care after his surgery. | Synonyms: attention, concern, supervision', 1, 0, '2026-02-04', '2026-02-04 10:33:56', 1, NULL, 0, 0),
-(1773, 5, 'approach', 'en', 'To move closer to someone or something, or to begin to deal with a situation or problem. | Example: We need to approach this complex issue with a well-thought-out strategy. | Synonyms: advance, tackle, address', 1, 0, '2026-02-04', '2026-02-04 10:33:56', 1, NULL, 0, 0),
-(1774, 5, 'malibu', 'en', 'Malibu is a coastal city in Los Angeles County, California, renowned for its scenic beaches, upscale residences, and celebrity inhabitants. | Example: They enjoyed a beautiful sunset over the Pacific Ocean from their beachfront home in Malibu. | Synonyms: Coastal resort, Beach community, Affluent enclave', 1, 0, '2026-02-04', '2026-02-04 10:33:57', 1, NULL, 0, 0),
-(1775, 5, 'inmates', 'en', 'Individuals who are confined to an institution, such as a prison, mental hospital, or other residential facility. | Example: The new rehabilitation program aims to help inmates reintegrate into society after their release. | Synonyms: prisoners, convicts, detainees', 1, 0, '2026-02-04', '2026-02-04 10:33:57', 1, NULL, 0, 0),
-(1776, 5, 'year', 'en', 'A period of 365 or 366 days, divided into 12 months, starting from January 1st and ending on December 31st, or a period of 12 months from any specified date. | Example: We plan to travel to Europe next year. | Synonyms: annum, twelvemonth', 1, 0, '2026-02-04', '2026-02-04 10:34:13', 1, NULL, 0, 0),
-(1777, 5, 'due', 'en', 'Expected or required at a particular time, or owed as a debt or obligation. | Example: The library book is due back tomorrow. | Synonyms: expected, owing, payable', 1, 0, '2026-02-04', '2026-02-04 10:34:14', 1, NULL, 0, 0),
-(1778, 5, 'yesterday', 'en', 'The day immediately preceding the present day. | Example: Yesterday was a very productive day for me. | Synonyms: the day before, previous day', 1, 0, '2026-02-04', '2026-02-04 10:34:16', 1, NULL, 0, 0),
-(1779, 5, 'thinking', 'en', 'Thinking is the mental process of considering or reasoning about something, forming ideas, or making decisions. | Example: Critical thinking is essential for problem-solving and innovation. | Synonyms: thought, reasoning, deliberation', 1, 0, '2026-02-04', '2026-02-04 10:34:13', 1, NULL, 0, 0),
-(1780, 5, 'fire', 'en', 'Fire is the rapid combustion of a substance, producing heat, light, and often smoke and flame. | Example: The firefighters quickly extinguished the brush fire before it spread to the houses. | Synonyms: flame, blaze, inferno', 1, 0, '2026-02-04', '2026-02-04 10:34:13', 1, NULL, 0, 0),
-(1781, 5, 'onto', 'en', 'Moving to a position on the surface of something, or indicating a position on something. | Example: The child climbed onto the chair to reach the cookie jar. | Synonyms: upon, on top of, atop', 1, 0, '2026-02-04', '2026-02-04 10:34:12', 1, NULL, 0, 0),
-(1782, 5, 'process', 'en', 'A series of actions or steps taken in order to achieve a particular end. | Example: The entire manufacturing process was streamlined to improve efficiency. | Synonyms: procedure, method, operation', 1, 0, '2026-02-04', '2026-02-04 10:34:12', 1, NULL, 0, 0),
-(1783, 5, 'members', 'en', 'Individuals or entities that belong to a particular group, organization, or community. | Example: All members of the club are invited to attend the annual general meeting. | Synonyms: constituents, participants, associates', 1, 0, '2026-02-04', '2026-02-04 10:34:12', 1, NULL, 0, 0),
-(1784, 5, 'produce', 'en', 'To create, make, or bring forth something, often as a result of effort or a process. | Example: The company plans to produce a new line of eco-friendly products next quarter. | Synonyms: create, make, generate', 1, 0, '2026-02-04', '2026-02-04 10:34:12', 1, NULL, 0, 0),
-(1785, 5, 'standard', 'en', 'A level of quality, attainment, or measure used as a basis for comparison. | Example: The company aims to set a new standard for customer service in the industry. | Synonyms: benchmark, criterion, norm', 1, 0, '2026-02-04', '2026-02-04 10:34:18', 1, NULL, 0, 0),
-(1786, 5, 'smoking', 'en', 'The act or habit of inhaling and exhaling the smoke of burning plant material, typically tobacco, from a cigarette, cigar, or pipe. | Example: Smoking is strictly forbidden inside the restaurant. | Synonyms: puffing, tobacco use, lighting up', 1, 0, '2026-02-04', '2026-02-04 10:34:19', 1, NULL, 0, 0),
-(1787, 5, 'check', 'en', 'To examine something to ensure its accuracy, quality, or condition, or to stop or limit its progress. | Example: Please check your answers carefully before turning in the test. | Synonyms: verify, inspect, examine', 1, 0, '2026-02-04', '2026-02-04 10:34:19', 1, NULL, 0, 0),
-(1788, 5, 'bills', 'en', 'Bills are written statements of money owed for goods or services provided. | Example: I need to pay all my monthly bills before the due date. | Synonyms: invoices, statements, charges', 1, 0, '2026-02-04', '2026-02-04 10:34:20', 1, NULL, 0, 0),
-(1789, 5, 'message', 'en', 'A communication containing information, news, or a request, sent by one person or group to another. | Example: Please leave a message after the beep if I don''t answer. | Synonyms: communication, note, dispatch', 1, 0, '2026-02-04', '2026-02-04 10:34:17', 1, NULL, 0, 0),
-(1790, 5, 'unmet', 'en', 'Not satisfied, fulfilled, or achieved; remaining unaddressed or unresolved. | Example: The report highlighted the many unmet needs of the refugees, including shelter and medical care. | Synonyms: unfulfilled, unsatisfied, unaddressed', 1, 0, '2026-02-04', '2026-02-04 10:34:26', 1, NULL, 0, 0),
-(1791, 5, 'comes', 'en', 'Comes is the third-person singular simple present indicative form of the verb ''to come,'' meaning to move toward, arrive at, or reach a particular place, state, or result. | Example: The train comes to the station at 3 PM every day. | Synonyms: arrives, approaches, appears', 1, 0, '2026-02-04', '2026-02-04 10:34:26', 1, NULL, 0, 0),
-(1792, 5, 'practice', 'en', 'The repeated performance of an activity or skill to improve proficiency or maintain competence. | Example: Consistent practice is crucial for mastering a new language. | Synonyms: rehearsal, training, drill', 1, 0, '2026-02-04', '2026-02-04 10:34:26', 1, NULL, 0, 0),
-(1793, 5, 'best', 'en', 'Surpassing all others in excellence, quality, or suitability. | Example: She gave her best performance of the season. | Synonyms: finest, supreme, optimal', 1, 0, '2026-02-04', '2026-02-04 10:34:25', 1, NULL, 0, 0),
-(1794, 5, 'obvious', 'en', 'Easily seen, understood, or recognized; clear and evident. | Example: It was obvious from her expression that she was upset. | Synonyms: clear, evident, apparent', 1, 0, '2026-02-04', '2026-02-04 10:34:26', 1, NULL, 0, 0),
-(1795, 5, 'aren', 'en', 'A type of palm tree (Arenga pinnata) native to tropical Asia, valued for its sap which is used to produce sugar, vinegar, and alcoholic beverages. | Example: In some Southeast Asian countries, the aren palm is an important source of livelihood. | Synonyms: sugar palm, arenga palm, gomuti palm', 1, 0, '2026-02-04', '2026-02-04 10:34:31', 1, NULL, 0, 0),
-(1796, 5, 'update', 'en', 'To make something more modern or current, or to provide the latest information about it. | Example: Please update the software on your computer to the newest version. | Synonyms: refresh, modernize, amend', 1, 0, '2026-02-04', '2026-02-04 10:34:27', 1, NULL, 0, 0),
-(1797, 5, 'independent', 'en', 'Not relying on others for support, guidance, or control; self-governing and free. | Example: After graduating, she was determined to become financially independent. | Synonyms: self-reliant, autonomous, free', 1, 0, '2026-02-04', '2026-02-04 10:34:32', 1, NULL, 0, 0),
-(1798, 5, 'off', 'en', 'Away from a place or position, or indicating a state of being disconnected or not operating. | Example: Please turn the television off before you leave. | Synonyms: disconnected, away, inoperative', 1, 0, '2026-02-04', '2026-02-04 10:34:46', 1, NULL, 0, 0),
-(1799, 5, 'pub', 'en', 'A pub, short for public house, is an establishment licensed to sell alcoholic drinks for consumption on the premises, often serving as a social gathering place, particularly in the UK and Ireland. | Example: Let''s head to the pub for a pint after work. | Synonyms: bar, tavern, public house', 1, 0, '2026-02-04', '2026-02-04 10:34:52', 1, NULL, 0, 0),
-(1800, 5, 'recent', 'en', 'Having happened, been made, or appeared not long ago; belonging to a time immediately before the present. | Example: The recent changes in company policy have been met with mixed reactions. | Synonyms: new, fresh, current', 1, 0, '2026-02-04', '2026-02-04 10:35:02', 1, NULL, 0, 0),
-(1801, 5, 'democrats', 'en', 'Individuals who advocate for or are members of a democratic political party, often specifically referring to the Democratic Party in the United States. | Example: The democrats gathered for their annual convention to discuss policy changes. | Synonyms: liberals, progressives, leftists', 1, 0, '2026-02-04', '2026-02-04 10:35:06', 1, NULL, 0, 0),
-(1802, 5, 'economic', 'en', 'Relating to economics or the economy, especially concerning the production, distribution, and consumption of goods and services. | Example: The country is facing significant economic challenges due to the global recession. | Synonyms: financial, monetary, commercial', 1, 0, '2026-02-04', '2026-02-04 10:35:42', 1, NULL, 0, 0),
-(1803, 5, 'remember', 'en', 'To recall to one''s mind an event, fact, or person from the past. | Example: I always remember my grandmother''s birthday. | Synonyms: recall, recollect, retain', 1, 0, '2026-02-04', '2026-02-04 10:36:10', 1, NULL, 0, 0),
-(1804, 5, 'trap', 'en', 'A device or situation designed to catch or trick someone or something, often by luring them into a confined or dangerous position. | Example: The detective set a clever trap to catch the thief. | Synonyms: snare, pitfall, ambush', 1, 0, '2026-02-04', '2026-02-04 10:36:11', 1, NULL, 0, 0),
-(1805, 5, 'recruited', 'en', 'To have enlisted or enrolled someone, often for a job, an organization, or military service. | Example: The university successfully recruited many talented students for its new engineering program. | Synonyms: enlisted, hired, drafted', 1, 0, '2026-02-04', '2026-02-04 10:36:18', 1, NULL, 0, 0),
-(1806, 5, 'patio', 'en', 'A paved outdoor area, typically adjacent to a house, used for dining and recreation. | Example: We spent the evening relaxing on the patio, enjoying the cool breeze. | Synonyms: terrace, veranda, deck', 1, 0, '2026-02-04', '2026-02-04 10:36:21', 1, NULL, 0, 0),
-(1807, 5, 'paid', 'en', 'Paid refers to having given money in exchange for goods or services, or having received money for work performed. | Example: The subscription was paid for the entire year. | Synonyms: compensated, remunerated, settled', 1, 0, '2026-02-04', '2026-02-04 10:36:29', 1, NULL, 0, 0),
-(1808, 5, 'lax', 'en', 'Not sufficiently strict, severe, or careful. | Example: The company''s lax security measures led to a significant data breach. | Synonyms: careless, negligent, slack', 1, 0, '2026-02-04', '2026-02-04 10:36:36', 1, NULL, 0, 0),
-(1809, 5, 'grandmother', 'en', 'A grandmother is the mother of one''s father or mother. | Example: My grandmother always tells the most wonderful stories about her childhood. | Synonyms: grandma, granny, nana', 1, 0, '2026-02-04', '2026-02-04 10:36:56', 1, NULL, 0, 0),
-(1810, 5, 'fewer', 'en', 'Fewer is a determiner used to indicate a smaller number of countable items or individuals. | Example: There were fewer people at the concert this year compared to last year. | Synonyms: not as many, a smaller number of', 1, 0, '2026-02-04', '2026-02-04 10:37:00', 1, NULL, 0, 0),
-(1811, 5, 'workers', 'en', 'Individuals who perform tasks or labor, often in exchange for wages or a salary. | Example: The construction workers wore hard hats for safety on the job site. | Synonyms: employees, laborers, staff', 1, 0, '2026-02-04', '2026-02-04 10:36:59', 1, NULL, 0, 0),
-(1812, 5, 'always', 'en', 'Always means at all times, on every occasion, or without exception. | Example: She always remembers to lock the door before leaving the house. | Synonyms: forever, constantly, invariably', 1, 0, '2026-02-04', '2026-02-04 10:37:05', 1, NULL, 0, 0),
-(1813, 5, 'war', 'en', 'A state of armed conflict between different countries or different groups within a country, characterized by extreme aggression, destruction, and often loss of life. | Example: The two nations declared war on each other after years of escalating tensions. | Synonyms: conflict, combat, hostilities', 1, 0, '2026-02-04', '2026-02-04 10:37:04', 1, NULL, 0, 0),
-(1814, 5, 'became', 'en', 'Became is the past tense of ''become,'' meaning to come into existence as, or to undergo a change or development to a new state or condition. | Example: After years of hard work, he became a successful entrepreneur. | Synonyms: turned into, grew into', 1, 0, '2026-02-04', '2026-02-04 10:37:04', 1, NULL, 0, 0),
-(1815, 5, 'ice', 'en', 'Ice is water frozen into a solid, crystalline state, typically at or below 0°C (32°F). | Example: The children loved to skate on the smooth ice of the pond. | Synonyms: frost, glacier, rime', 1, 0, '2026-02-04', '2026-02-04 10:37:12', 1, NULL, 0, 0),
-(1816, 5, 'hours', 'en', 'Hours are units of time, each equal to sixty minutes, often used to denote a specific duration or a particular time of day. | Example: The project took many hours to complete, requiring dedication from the entire team. | Synonyms: time, duration, period', 1, 0, '2026-02-04', '2026-02-04 10:37:23', 1, NULL, 0, 0),
-(1817, 5, 'true', 'en', 'In accordance with fact or reality; not false. | Example: The detective confirmed that the witness''s statement was true. | Synonyms: accurate, correct, factual', 1, 0, '2026-02-04', '2026-02-04 10:37:46', 1, NULL, 0, 0),
-(1818, 5, 'thanks', 'en', 'An expression of gratitude or appreciation. | Example: Thanks for your kind words and support. | Synonyms: gratitude, appreciation, acknowledgment', 1, 0, '2026-02-04', '2026-02-04 10:37:56', 1, NULL, 0, 0),
-(1819, 5, 'media', 'en', 'The main means of mass communication, such as broadcasting, publishing, and the internet, regarded collectively. | Example: The news media reported extensively on the recent political developments. | Synonyms: press, journalism, broadcasting', 1, 0, '2026-02-04', '2026-02-04 10:38:08', 1, NULL, 0, 0),
-(1820, 5, 'images', 'en', 'Images are visual representations or reproductions of objects, people, or scenes, often created by photography, drawing, or digital means. | Example: The art exhibition featured a stunning collection of abstract images. | Synonyms: pictures, photos, visuals', 1, 0, '2026-02-04', '2026-02-04', 2, NULL, 0, 0),
-(1821, 5, 'glad', 'en', 'Feeling pleasure, joy, or contentment. | Example: I was so glad to hear the good news about your promotion. | Synonyms: happy, pleased, delighted', 1, 0, '2026-02-04', '2026-02-04 10:38:11', 1, NULL, 0, 0),
-(1822, 5, 'economy', 'en', 'The system by which goods and services are produced, distributed, and consumed within a particular country or region. | Example: The government is implementing new policies to stimulate the national economy. | Synonyms: financial system, economic system, fiscal system', 1, 0, '2026-02-04', '2026-02-04 10:38:13', 1, NULL, 0, 0),
-(1823, 5, 'doesn', 'en', 'Doesn''t is a contraction of "does not," used as the third-person singular present tense negative form of the verb "do." | Example: He doesn''t usually arrive this late for work. | Synonyms: does not, fails to', 1, 0, '2026-02-04', '2026-02-04 10:38:28', 1, NULL, 0, 0),
-(1824, 5, 'obama', 'en', 'Obama refers to Barack Obama, the 44th President of the United States, who served two terms from 2009 to 2017. | Example: Many remember Obama''s historic election in 2008. | Synonyms: President, Former US President', 1, 0, '2026-02-04', '2026-02-04 10:38:29', 1, NULL, 0, 0),
-(1825, 5, 'israel', 'en', 'Israel is a country in the Middle East, situated on the eastern shore of the Mediterranean Sea, recognized as the homeland of the Jewish people. | Example: Many tourists visit Israel to explore its ancient historical and religious sites. | Synonyms: The Holy Land, Zion', 1, 0, '2026-02-04', '2026-02-04 10:38:57', 1, NULL, 0, 0),
-(1826, 5, 'person', 'en', 'A human being, an individual with unique characteristics and identity. | Example: Each person in the room had a different perspective on the topic. | Synonyms: individual, human, being', 1, 0, '2026-02-04', '2026-02-04 10:38:57', 2, NULL, 0, 0),
-(1827, 5, 'party', 'en', 'A social gathering of people for entertainment, celebration, or a specific purpose. | Example: They threw a surprise party for their friend''s graduation. | Synonyms: celebration, gathering, get-together', 1, 0, '2026-02-04', '2026-02-04 10:39:09', 1, NULL, 0, 0),
-(1828, 5, 'bet', 'en', 'To risk money or something of value on the outcome of an event, such as a race or game, with the expectation of winning more if one''s prediction is correct. | Example: I bet $50 that our team would win the championship. | Synonyms: wager, gamble, stake', 1, 0, '2026-02-04', '2026-02-04 10:39:14', 1, NULL, 0, 0),
-(1829, 5, 'modern', 'en', 'Relating to the present or recent times, often characterized by a departure from traditional styles or methods. | Example: The museum features a fascinating collection of both ancient artifacts and modern art. | Synonyms: contemporary, current, new', 1, 0, '2026-02-04', '2026-02-04', 2, NULL, 0, 0),
-(1830, 5, 'day', 'en', 'The period of time from sunrise to sunset, when there is natural light, or a full cycle of twenty-four hours. | Example: We spent the entire day exploring the city. | Synonyms: daytime, daylight, 24 hours', 1, 0, '2026-02-04', '2026-02-04 10:39:20', 1, NULL, 0, 0),
-(1831, 5, 'united', 'en', 'Joined together as a whole, especially for a common purpose or by shared feelings. | Example: The community was united in its efforts to rebuild after the storm. | Synonyms: joined, combined, unified', 1, 0, '2026-02-04', '2026-02-04 10:39:52', 1, NULL, 0, 0),
-(1832, 5, 'states', 'en', 'To express something clearly and formally, either verbally or in writing. | Example: The company''s policy states that all employees must complete safety training annually. | Synonyms: declares, asserts, specifies', 1, 0, '2026-02-04', '2026-02-04 10:39:52', 1, NULL, 0, 0),
-(1833, 5, 'autograph', 'en', 'An autograph is a person''s handwritten signature, especially that of a celebrity, given as a souvenir or memento to an admirer. | Example: The young fan was thrilled to get the baseball player''s autograph on his jersey. | Synonyms: signature, inscription, John Hancock', 1, 0, '2026-02-04', '2026-02-04 10:39:51', 1, NULL, 0, 0),
-(1834, 5, 'melanie', 'en', 'Melanie is a female given name of Greek origin, derived from the Greek word ''melas'' meaning ''dark'' or ''black''. | Example: Melanie enjoys spending her weekends hiking in the mountains. | Synonyms: Not applicable, No direct synonyms for proper nouns', 1, 0, '2026-02-04', '2026-02-04 10:40:01', 1, NULL, 0, 0),
-(1835, 5, 'distorted', 'en', 'Altered from the true, natural, or original form, meaning, or appearance, often in a way that is misleading or unpleasant. | Example: The funhouse mirror created a distorted reflection of her face, making her look unusually tall and thin. | Synonyms: twisted, warped, misrepresented', 1, 0, '2026-02-04', '2026-02-04 10:40:06', 1, NULL, 0, 0),
-(1836, 5, 'islam', 'en', 'Islam is a monotheistic Abrahamic religion originating in the 7th century CE in the Arabian Peninsula, based on the teachings of the prophet Muhammad as revealed in the Quran. | Example: Millions of people around the world practice Islam, adhering to its principles and traditions. | Synonyms: Muslim faith, Islamic religion', 1, 0, '2026-02-04', '2026-02-04 10:40:06', 1, NULL, 0, 0),
-(1837, 5, 'wow', 'en', 'An exclamation used to express strong feelings of surprise, admiration, pleasure, or excitement. | Example: Wow, that was an incredible performance! | Synonyms: amazing, incredible, fantastic', 1, 0, '2026-02-04', '2026-02-04 10:40:26', 1, NULL, 0, 0),
-(1838, 5, 'idea', 'en', 'An idea is a thought, concept, or mental impression that exists in the mind, often representing a plan, suggestion, or understanding. | Example: She had a brilliant idea for the new marketing campaign. | Synonyms: thought, concept, notion', 1, 0, '2026-02-04', '2026-02-04 10:40:44', 1, NULL, 0, 0),
-(1839, 5, 'fifty', 'en', 'Fifty is the cardinal number equivalent to five times ten. | Example: The charity event managed to raise exactly fifty thousand dollars. | Synonyms: 50, half a hundred, L', 1, 0, '2026-02-04', '2026-02-04 10:40:46', 1, NULL, 0, 0),
-(1840, 5, 'many', 'en', 'Referring to a large indefinite number or amount of people or things. | Example: Many students applied for the scholarship this year. | Synonyms: numerous, abundant, plentiful', 1, 0, '2026-02-04', '2026-02-04 10:41:30', 1, NULL, 0, 0),
-(1841, 5, 'essential', 'en', 'Absolutely necessary or important. | Example: Clean water is essential for human health and survival. | Synonyms: crucial, vital, indispensable', 1, 0, '2026-02-04', '2026-02-04 10:41:29', 1, NULL, 0, 0),
-(1842, 5, 'grabs', 'en', 'To take hold of something quickly, suddenly, or forcefully. | Example: The squirrel quickly grabs the nut and scurries away. | Synonyms: seizes, snatches, grasps', 1, 0, '2026-02-04', '2026-02-04 10:41:29', 1, NULL, 0, 0),
-(1843, 5, 'million', 'en', 'A million is the cardinal number equivalent to one thousand times one thousand, represented numerically as 1,000,000. | Example: The charity raised over one million dollars for its cause last year. | Synonyms: one thousand thousands, 1,000,000', 1, 0, '2026-02-04', '2026-02-04 10:41:37', 1, NULL, 0, 0),
-(1844, 5, 'friend', 'en', 'A person with whom one has a bond of mutual affection, typically exclusive of sexual or familial relations. | Example: My best friend and I have known each other since kindergarten. | Synonyms: companion, pal, confidant', 1, 0, '2026-02-04', '2026-02-04 10:41:47', 1, NULL, 0, 0),
-(1845, 5, 'change', 'en', 'To make or become different, or to replace one thing with another. | Example: The seasons change from warm to cold throughout the year. | Synonyms: alter, modify, transform', 1, 0, '2026-02-04', '2026-02-04 10:41:47', 1, NULL, 0, 0),
-(1846, 5, 'shop', 'en', 'A place where goods or services are sold to customers. | Example: She works at a small gift shop in the city center. | Synonyms: store, boutique, market', 1, 0, '2026-02-04', '2026-02-04 10:41:50', 1, NULL, 0, 0),
-(1847, 5, 'functional', 'en', 'Able to operate or work effectively; designed to be practical and useful rather than decorative. | Example: The new software update made the application much more functional and user-friendly. | Synonyms: operational, working, practical', 1, 0, '2026-02-04', '2026-02-04 10:41:47', 1, NULL, 0, 0),
-(1848, 5, 'top', 'en', 'The highest or uppermost part or surface of something. | Example: He reached the top of the mountain after a long climb. | Synonyms: peak, summit, apex', 1, 0, '2026-02-04', '2026-02-04 10:41:52', 1, NULL, 0, 0),
-(1849, 5, 'five', 'en', 'The cardinal number that is one more than four. | Example: She counted five apples in the basket. | Synonyms: V, quintet', 1, 0, '2026-02-04', '2026-02-04', 2, NULL, 0, 0),
-(1850, 5, 'talk', 'en', 'To communicate by speaking words or to express thoughts and feelings orally. | Example: They talked for hours about their travel plans. | Synonyms: speak, converse, chat', 1, 0, '2026-02-04', '2026-02-04 10:41:52', 1, NULL, 0, 0),
-(1851, 5, 'speller', 'en', 'A person who spells words, especially in terms of their ability to do so correctly. | Example: The champion speller correctly identified every word in the final round. | Synonyms: orthographer, word-speller', 1, 0, '2026-02-04', '2026-02-04 10:41:53', 1, NULL, 0, 0),
-(1852, 5, 'linux', 'en', 'Linux is a family of open-source Unix-like operating systems based on the Linux kernel, widely used for servers, desktops, mobile devices, and embedded systems. | Example: Developers often prefer to work on Linux because of its powerful command-line interface and extensive open-source tools. | Synonyms: operating system, OS, Unix-like system', 1, 0, '2026-02-04', '2026-02-04 10:41:52', 1, NULL, 0, 0),
-(1853, 5, 'pick', 'en', 'To choose or select something or someone from a group of possibilities. | Example: She had to pick a dress for the party from many options. | Synonyms: choose, select, elect', 1, 0, '2026-02-04', '2026-02-04 10:41:53', 1, NULL, 0, 0),
-(1854, 5, 'which', 'en', 'Which is a pronoun or determiner used to ask about a choice from a group, or to introduce a clause that adds information about something already mentioned. | Example: Which book did you decide to read? | Synonyms: what, what kind of', 1, 0, '2026-02-04', '2026-02-04 10:41:55', 1, NULL, 0, 0),
-(1855, 5, 'dogs', 'en', 'Domesticated carnivorous mammals, typically having a long snout, an acute sense of smell, and a barking or howling voice, often kept as pets or for various working roles. | Example: The park was full of happy dogs playing fetch with their owners. | Synonyms: canines, hounds, pooches', 1, 0, '2026-02-04', '2026-02-04 10:41:53', 1, NULL, 0, 0),
-(1856, 5, 'insane', 'en', 'Suffering from a severe mental illness that impairs one''s ability to think, behave, or perceive reality rationally. | Example: His wild theories and erratic behavior made people wonder if he was going insane. | Synonyms: mad, crazy, deranged', 1, 0, '2026-02-04', '2026-02-04 10:42:08', 1, NULL, 0, 0),
-(1857, 5, 'exactly', 'en', 'Exactly means in a precise, accurate, or complete manner, without any deviation or approximation. | Example: The train arrived at exactly 3:15 PM, right on schedule. | Synonyms: precisely, accurately, just', 1, 0, '2026-02-04', '2026-02-04', 2, NULL, 0, 0),
-(1858, 5, 'shoe', 'en', 'A covering for the foot, typically made of leather or other durable material, with a sturdy sole and an upper part that encloses the foot. | Example: He tied the laces of his new shoe before going for a run. | Synonyms: footwear, slipper, boot', 1, 0, '2026-02-04', '2026-02-04 10:42:17', 1, NULL, 0, 0),
-(1859, 5, 'meaning', 'en', 'The idea, concept, or information that a word, phrase, symbol, or action is intended to convey or represent. | Example: The students struggled to understand the true meaning of the philosophical poem. | Synonyms: sense, significance, import', 1, 0, '2026-02-04', '2026-02-04 10:42:18', 1, NULL, 0, 0),
-(1860, 5, 'buddha', 'en', 'An enlightened being who has achieved perfect wisdom and compassion, especially referring to Siddhartha Gautama, the founder of Buddhism. | Example: Followers of Buddhism strive to understand the teachings of the Buddha to achieve their own enlightenment. | Synonyms: enlightened one, awakened one, spiritual teacher', 1, 0, '2026-02-04', '2026-02-04 10:42:42', 1, NULL, 0, 0),
-(1861, 5, 'pretty', 'en', 'Pleasing or attractive in a delicate, graceful, or charming way, often implying a less striking beauty. | Example: She looked very pretty in her new floral dress. | Synonyms: attractive, lovely, charming', 1, 0, '2026-02-04', '2026-02-04 10:42:47', 1, NULL, 0, 0),
-(1862, 5, 'sydney', 'en', 'The most populous city in Australia and the capital of New South Wales, known for its harbor, iconic opera house, and bridge. | Example: The Sydney Opera House is a world-renowned architectural masterpiece. | Synonyms: The Harbour City, Australia''s largest city', 1, 0, '2026-02-04', '2026-02-04 10:43:18', 1, NULL, 0, 0),
-(1863, 5, 'radio', 'en', 'A device that receives or transmits broadcast electromagnetic waves, typically used for communication or entertainment. | Example: She turned on the radio to catch the morning news. | Synonyms: receiver, wireless', 1, 0, '2026-02-04', '2026-02-04 10:43:46', 1, NULL, 0, 0),
-(1864, 5, 'religious', 'en', 'Pertaining to or exhibiting devotion to a system of faith and worship, or committed to the practice of religion. | Example: She is a very religious person who attends services every week and follows her faith''s teachings diligently. | Synonyms: pious, devout, spiritual', 1, 0, '2026-02-04', '2026-02-04 10:45:46', 1, NULL, 0, 0),
-(1865, 5, 'aha', 'en', 'An exclamation expressing sudden realization, recognition, or triumph. | Example: Aha! I knew you''d figure out the answer eventually. | Synonyms: eureka, bingo, oh!', 1, 0, '2026-02-04', '2026-02-04 10:45:54', 1, NULL, 0, 0),
-(1866, 5, 'way', 'en', 'A method, manner, or means of doing something, or a particular direction, path, or route. | Example: Could you show me the way to the nearest train station? | Synonyms: method, manner, route', 1, 0, '2026-02-04', '2026-02-04 10:46:12', 1, NULL, 0, 0),
-(1867, 5, 'example', 'en', 'An example is a thing characteristic of its kind or illustrating a general rule. | Example: The instructor provided a clear example to help the students understand the concept. | Synonyms: instance, sample, model', 1, 0, '2026-02-04', '2026-02-04 10:46:11', 1, NULL, 0, 0),
-(1868, 5, 'demographics', 'en', 'Demographics refers to the statistical data of a population, especially those showing average age, income, education, and other characteristics. | Example: The marketing team analyzed the demographics of the target audience to tailor their advertising campaign effectively. | Synonyms: population data, statistical data, population characteristics', 1, 0, '2026-02-04', '2026-02-04 10:46:23', 1, NULL, 0, 0),
-(1869, 5, 'outta', 'en', 'Outta is an informal contraction of the phrase "out of," used to express movement away from a place or source, or a lack of something. | Example: I''m trying to get outta this town before the storm hits. | Synonyms: out of, from, away from', 1, 0, '2026-02-04', '2026-02-04 10:47:08', 1, NULL, 0, 0),
-(1870, 5, 'gotta', 'en', 'Gotta is an informal contraction of "got to" or "have got to," used to express necessity or obligation. | Example: I gotta finish this report before I leave work today. | Synonyms: must, have to, need to', 1, 0, '2026-02-04', '2026-02-04 10:47:09', 1, NULL, 0, 0),
-(1871, 5, 'clue', 'en', 'A piece of evidence or information that helps to solve a problem, mystery, or crime. | Example: The detective followed every clue to unravel the complex case. | Synonyms: hint, lead, indication', 1, 0, '2026-02-04', '2026-02-04 10:48:31', 1, NULL, 0, 0),
-(1872, 5, 'software', 'en', 'Software refers to the set of instructions, data, or programs used to operate computers and execute specific tasks. | Example: The company released an update for its accounting software to fix several bugs. | Synonyms: programs, applications, code', 1, 0, '2026-02-04', '2026-02-04 10:49:11', 1, NULL, 0, 0),
-(1873, 5, 'lie', 'en', 'To make an intentionally false statement with the purpose of deceiving. | Example: It is never a good idea to lie to your parents about your grades. | Synonyms: deceive, fib, prevaricate', 1, 0, '2026-02-04', '2026-02-04 10:51:08', 1, NULL, 0, 0),
-(1874, 5, 'modem', 'en', 'A modem is a device that modulates and demodulates signals to encode and decode digital data for transmission over analog lines, such as telephone or cable lines. | Example: To get internet access, you typically need to connect your computer or router to a modem. | Synonyms: data pump, network device', 1, 0, '2026-02-04', '2026-02-04 10:52:21', 1, NULL, 0, 0),
-(1875, 5, 'shit', 'en', 'A vulgar term primarily referring to excrement, but also used to denote something of very poor quality, value, or an unfortunate situation. | Example: The whole project turned into a pile of shit. | Synonyms: excrement, rubbish, crap', 1, 0, '2026-02-04', '2026-02-04 10:52:35', 1, NULL, 0, 0),
-(1876, 5, 'supposed', 'en', 'Expected or required to do something, or generally believed to be true without conclusive proof. | Example: You are supposed to submit your report by the end of the day. | Synonyms: expected, obliged, meant', 1, 0, '2026-02-04', '2026-02-04 10:53:09', 2, NULL, 0, 0),
-(1877, 5, 'create', 'en', 'To bring something into existence, often with imagination or skill. | Example: The architect will create a groundbreaking design for the new city hall. | Synonyms: make, produce, invent', 1, 0, '2026-02-04', '2026-02-04 10:53:07', 1, NULL, 0, 0),
-(1878, 5, 'python', 'en', 'A large, nonvenomous constrictor snake native to tropical and subtropical regions of Africa and Asia, known for coiling around and suffocating its prey. | Example: The python silently slithered through the tall grass, hunting for its next meal. | Synonyms: boa, constrictor, serpent', 1, 0, '2026-02-04', '2026-02-04 10:53:07', 1, NULL, 0, 0),
-(1879, 5, 'script', 'en', 'A written text of a play, film, broadcast, or other performance, including dialogue and stage directions. | Example: The director made a few last-minute changes to the script before the final rehearsal. | Synonyms: screenplay, manuscript, text', 1, 0, '2026-02-04', '2026-02-04 10:53:08', 1, NULL, 0, 0),
-(1880, 5, 'reunited', 'en', 'To be brought or come together again after a period of separation. | Example: After years apart, the family was finally reunited for the holidays. | Synonyms: reconnected, reconciled, gathered again', 1, 0, '2026-02-04', '2026-02-04 10:53:08', 1, NULL, 0, 0),
-(1881, 5, 'meals', 'en', 'Meals are the food eaten or the occasions of eating food, typically at regular times during the day. | Example: Many cultures enjoy large family meals together on holidays. | Synonyms: repasts, dinners, feasts', 1, 0, '2026-02-04', '2026-02-04 10:53:07', 1, NULL, 0, 0),
-(1882, 5, 'network', 'en', 'A group or system of interconnected people or things. | Example: The company is building a new fiber optic network across the region. | Synonyms: system, web, grid', 1, 0, '2026-02-04', '2026-02-04 10:53:08', 1, NULL, 0, 0),
-(1883, 5, 'pinterest', 'en', 'Pinterest is a social media platform that enables users to discover, save, and share visual content, such as images and videos, onto personalized virtual collections called boards. | Example: She spent hours on Pinterest looking for wedding decoration ideas. | Synonyms: image-sharing site, visual discovery platform, online pinboard', 1, 0, '2026-02-04', '2026-02-04 10:53:39', 1, NULL, 0, 0),
-(1884, 5, 'move', 'en', 'To change position or cause something to change position. | Example: Please move the chair closer to the table. | Synonyms: shift, relocate, budge', 1, 0, '2026-02-04', '2026-02-04 10:53:39', 1, NULL, 0, 0),
-(1885, 5, 'normally', 'en', 'In the usual, standard, or expected way; under normal circumstances. | Example: She normally takes the bus to work, but today she drove. | Synonyms: usually, ordinarily, typically', 1, 0, '2026-02-04', '2026-02-04 10:53:51', 1, NULL, 0, 0),
-(1886, 5, 'miles', 'en', 'Miles are a plural unit of linear distance, commonly used in the United States and United Kingdom, with one mile equivalent to 5,280 feet or 1.609 kilometers. | Example: The journey covered hundreds of miles, taking us across several states. | Synonyms: distance, length, extent', 1, 0, '2026-02-04', '2026-02-04 10:53:56', 1, NULL, 0, 0),
-(1887, 5, 'used', 'en', 'Having been previously owned, employed, or utilized by someone else. | Example: She found a great deal on a used bicycle at the local market. | Synonyms: secondhand, pre-owned, worn', 1, 0, '2026-02-04', '2026-02-04 10:53:59', 1, NULL, 0, 0),
-(1888, 5, 'before', 'en', 'At an earlier time than, in front of, or preceding in order. | Example: Please submit your report before the deadline. | Synonyms: prior to, earlier than, ahead of', 1, 0, '2026-02-04', '2026-02-04 10:53:58', 1, NULL, 0, 0),
-(1889, 5, 'usually', 'en', 'Usually means in the way that is normal or general; most of the time. | Example: I usually drink coffee in the morning, but sometimes I prefer tea. | Synonyms: generally, commonly, ordinarily', 1, 0, '2026-02-04', '2026-02-04 10:54:03', 1, NULL, 0, 0),
-(1890, 5, 'bloated', 'en', 'Swollen with an excessive amount of fluid, gas, or content, often to an uncomfortable or inefficient degree. | Example: After eating too much rich food, she felt uncomfortably bloated and sluggish. | Synonyms: swollen, distended, puffy', 1, 0, '2026-02-04', '2026-02-04 10:54:03', 1, NULL, 0, 0),
-(1891, 5, 'worse', 'en', 'Of lower quality, more unpleasant, or more severe than something else; the comparative form of ''bad'' or ''ill''. | Example: Her condition grew worse after the second day, requiring more intensive care. | Synonyms: inferior, poorer, more severe', 1, 0, '2026-02-04', '2026-02-04 10:54:03', 1, NULL, 0, 0),
-(1892, 5, 'suppose', 'en', 'To assume that something is true or probable without proof or to consider something as a possibility. | Example: I suppose we should leave early to avoid traffic. | Synonyms: assume, presume, imagine', 1, 0, '2026-02-04', '2026-02-04 10:54:29', 1, NULL, 0, 0),
-(1893, 5, 'york', 'en', NULL, 0, 0, '2026-02-04', '2026-02-04', 1, NULL, 0, 0),
-(1894, 5, 'seattle', 'en', 'Seattle is a major port city on the West Coast of the United States, located in the state of Washington, known for its tech industry, coffee culture, and scenic natural surroundings. | Example: Many tech companies have their headquarters in Seattle, drawing a diverse workforce to the region. | Synonyms: Emerald City, Rain City, Jet City', 1, 0, '2026-02-04', '2026-02-04 10:56:20', 1, NULL, 0, 0),
-(1895, 5, 'means', 'en', 'A means is a method, instrument, or agency used to achieve a particular end or purpose. | Example: Education is often considered the most effective means to social mobility. | Synonyms: method, way, instrument', 1, 0, '2026-02-04', '2026-02-04 10:56:20', 1, NULL, 0, 0),
-(1896, 5, 'customer', 'en', 'A person or organization that purchases goods or services from a business or store. | Example: The new marketing campaign aims to attract more customers to the online shop. | Synonyms: client, patron, buyer', 1, 0, '2026-02-04', '2026-02-04 10:56:18', 1, NULL, 0, 0),
-(1897, 5, 'relation', 'en', 'A connection or association between two or more things, people, or ideas, or the way in which they are connected. | Example: The relation between a healthy diet and a long life is well-established. | Synonyms: connection, link, relationship', 1, 0, '2026-02-04', '2026-02-04 10:56:19', 1, NULL, 0, 0),
-(1898, 5, 'relations', 'en', 'Relations refers to the connections or interactions between people, groups, or things, or to the members of one''s family. | Example: The diplomatic relations between the two countries have been strained recently. | Synonyms: connections, ties, dealings', 1, 0, '2026-02-04', '2026-02-04 10:56:19', 1, NULL, 0, 0),
-(1899, 5, 'manager', 'en', 'A person responsible for controlling or administering all or part of a company, organization, or project. | Example: The new manager implemented several changes to improve team productivity. | Synonyms: director, supervisor, administrator', 1, 0, '2026-02-04', '2026-02-04 10:56:19', 1, NULL, 0, 0);
-
-DROP TABLE IF EXISTS `learning_sessions`;
-CREATE TABLE `learning_sessions` (
-  `id` INT NOT NULL AUTO_INCREMENT,
-  `user_id` INT,
-  `session_date` DATE,
-  `language` TEXT,
-  `words_learned` INT DEFAULT 0,
-  `xp_earned` INT DEFAULT 0,
-  `duration_seconds` INT DEFAULT 0,
-  PRIMARY KEY (`id`)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-
-INSERT INTO `learning_sessions` (`id`, `user_id`, `session_date`, `language`, `words_learned`, `xp_earned`, `duration_seconds`) VALUES 
-(1, 1, '2026-01-06', 'es', 172, 0, 0),
-(2, 1, '2026-01-06', 'hi', 154, 0, 0),
-(3, 1, '2026-01-06', 'en', 204, 0, 0),
-(4, 1, '2026-01-07', 'en', 1, 0, 0),
-(5, 1, '2026-01-07', 'es', 7, 0, 0),
-(6, 1, '2026-01-07', 'hi', 0, 0, 0),
-(7, 1, '2026-01-09', 'en', 1, 0, 0),
-(8, 1, '2026-01-21', 'en', 0, 0, 0),
-(9, 3, '2026-01-21', 'en', 1, 0, 0),
-(10, 5, '2026-02-03', 'en', 442, 0, 0),
-(11, 5, '2026-02-03', 'hi', 333, 0, 0),
-(12, 5, '2026-02-03', 'es', 163, 0, 0),
-(13, 6, '2026-02-03', 'en', 73, 0, 0),
-(14, 6, '2026-02-03', 'es', 34, 0, 0),
-(15, 6, '2026-02-03', 'hi', 22, 0, 0),
-(16, 7, '2026-02-03', 'en', 33, 0, 0),
-(17, 7, '2026-02-03', 'hi', 9, 0, 0),
-(18, 7, '2026-02-03', 'es', 9, 0, 0),
-(19, 5, '2026-02-04', 'en', 166, 0, 0),
-(20, 1, '2026-02-11', 'en', 0, 0, 0);
-
-DROP TABLE IF EXISTS `user_progress`;
-CREATE TABLE `user_progress` (
-  `id` INT NOT NULL AUTO_INCREMENT,
-  `user_id` INT,
-  `language` TEXT,
-  `total_xp` INT DEFAULT 0,
-  `current_level` TEXT DEFAULT 'Beginner',
-  `streak_days` INT DEFAULT 0,
-  `last_activity` DATE,
-  PRIMARY KEY (`id`)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-
-DROP TABLE IF EXISTS `lessons`;
-CREATE TABLE `lessons` (
-  `id` INT NOT NULL AUTO_INCREMENT,
-  `language` TEXT,
-  `level` TEXT,
-  `section` INT,
-  `lesson_type` TEXT,
-  `content` TEXT,
-  `difficulty_score` INT DEFAULT 1,
-  PRIMARY KEY (`id`)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-
-INSERT INTO `lessons` (`id`, `language`, `level`, `section`, `lesson_type`, `content`, `difficulty_score`) VALUES 
-(1, 'en', 'beginner', 1, 'vocabulary', '{"title": "Basic Greetings", "words": ["hello", "goodbye", "please", "thank you"], "exercises": [{"type": "match", "pairs": [["hello", "hola"], ["goodbye", "adi\u00f3s"]]}, {"type": "listen_repeat", "audio_prompts": ["hello", "goodbye"]}, {"type": "translate", "sentences": ["Hello, how are you?"]}]}', 1),
-(2, 'en', 'intermediate', 2, 'grammar', '{"title": "Present Perfect Tense", "concepts": ["have/has + past participle"], "examples": ["I have eaten", "She has worked"], "exercises": [{"type": "fill_blank", "sentence": "I ___ (eat) breakfast", "answer": "have eaten"}, {"type": "correct_mistake", "wrong": "I have ate", "correct": "I have eaten"}]}', 3),
-(3, 'es', 'beginner', 1, 'vocabulary', '{"title": "Saludos B\u00e1sicos", "words": ["hola", "adi\u00f3s", "por favor", "gracias"], "exercises": [{"type": "match", "pairs": [["hola", "hello"], ["adi\u00f3s", "goodbye"]]}, {"type": "pronunciation", "words": ["hola", "gracias"]}]}', 1);
-
-DROP TABLE IF EXISTS `oov_words`;
-CREATE TABLE `oov_words` (
-  `id` INT NOT NULL AUTO_INCREMENT,
-  `user_id` INT,
-  `word` TEXT,
-  `language` TEXT,
-  `first_seen` DATE,
-  `last_seen` DATE,
-  `occurrences` INT DEFAULT 1,
-  PRIMARY KEY (`id`)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-
-INSERT INTO `oov_words` (`id`, `user_id`, `word`, `language`, `first_seen`, `last_seen`, `occurrences`) VALUES 
-(1, 1, 'mira', 'es', '2026-01-06', '2026-01-06', 1),
-(2, 1, 'por', 'es', '2026-01-06', '2026-01-06', 1),
-(3, 1, 'donde', 'es', '2026-01-06', '2026-01-06', 1),
-(4, 1, 'hasta', 'es', '2026-01-06', '2026-01-06', 1),
-(5, 1, 'barba', 'es', '2026-01-06', '2026-01-06', 1),
-(6, 1, 'सरोकार', 'hi', '2026-01-06', '2026-01-06', 1),
-(7, 1, 'आरोपित', 'hi', '2026-01-06', '2026-01-06', 1),
-(8, 1, 'स्कूल', 'hi', '2026-01-06', '2026-01-06', 1),
-(9, 1, 'किस', 'hi', '2026-01-06', '2026-01-06', 1),
-(10, 1, 'दिखेग', 'hi', '2026-01-06', '2026-01-06', 1),
-(11, 1, 'out', 'en', '2026-01-06', '2026-01-06', 1),
-(12, 1, 'have', 'en', '2026-01-06', '2026-01-06', 1),
-(13, 1, 'him', 'en', '2026-01-06', '2026-01-06', 1),
-(14, 1, 'week', 'en', '2026-01-06', '2026-01-06', 1),
-(15, 1, 'school', 'en', '2026-01-06', '2026-01-06', 1),
-(16, 1, 'unanimous', 'en', '2026-01-06', '2026-01-06', 1),
-(17, 1, 'could', 'en', '2026-01-06', '2026-01-06', 1),
-(18, 1, 'message', 'en', '2026-01-06', '2026-01-06', 1),
-(19, 1, 'public', 'en', '2026-01-06', '2026-01-06', 1),
-(20, 1, 'una', 'es', '2026-01-06', '2026-01-06', 1),
-(21, 1, 'noche', 'es', '2026-01-06', '2026-01-06', 1),
-(22, 1, 'lucharemos', 'es', '2026-01-06', '2026-01-06', 1),
-(23, 1, 'para', 'es', '2026-01-06', '2026-01-06', 1),
-(24, 1, 'suele', 'es', '2026-01-06', '2026-01-06', 1),
-(25, 1, 'denominar', 'es', '2026-01-06', '2026-01-06', 1),
-(26, 1, 'así', 'es', '2026-01-06', '2026-01-06', 1),
-(27, 1, 'que', 'es', '2026-01-06', '2026-01-06', 1),
-(28, 1, 'miedo', 'es', '2026-01-06', '2026-01-06', 1),
-(29, 1, 'algo', 'es', '2026-01-06', '2026-01-06', 1),
-(30, 1, 'más', 'es', '2026-01-06', '2026-01-06', 1),
-(31, 1, 'meses', 'es', '2026-01-06', '2026-01-06', 1),
-(32, 1, 'julio', 'es', '2026-01-06', '2026-01-06', 1),
-(33, 1, 'लेकिन', 'hi', '2026-01-06', '2026-01-06', 1),
-(34, 1, 'विभाग', 'hi', '2026-01-06', '2026-01-06', 1),
-(35, 1, 'श्र', 'hi', '2026-01-06', '2026-01-06', 1),
-(36, 1, 'गिर्राज', 'hi', '2026-01-06', '2026-01-06', 1),
-(37, 1, 'pets', 'en', '2026-01-06', '2026-01-06', 1),
-(38, 1, 'given', 'en', '2026-01-06', '2026-01-06', 1),
-(39, 1, 'and', 'en', '2026-01-06', '2026-01-06', 1),
-(40, 1, 'guess', 'en', '2026-01-06', '2026-01-06', 1),
-(41, 1, 'kisses', 'en', '2026-01-06', '2026-01-06', 1),
-(42, 1, 'pista', 'es', '2026-01-06', '2026-01-06', 1),
-(43, 1, 'adivina', 'es', '2026-01-06', '2026-01-06', 1),
-(44, 1, 'qué', 'es', '2026-01-06', '2026-01-06', 1),
-(45, 1, 'eso', 'es', '2026-01-06', '2026-01-06', 1),
-(46, 1, 'siempre', 'es', '2026-01-06', '2026-01-06', 1),
-(47, 1, 'llevaba', 'es', '2026-01-06', '2026-01-06', 1),
-(48, 1, 'सब्जेक्ट', 'hi', '2026-01-06', '2026-01-06', 1),
-(49, 1, 'हमार', 'hi', '2026-01-06', '2026-01-06', 1),
-(50, 1, 'porque', 'es', '2026-01-06', '2026-01-06', 1),
-(51, 1, 'bosque', 'es', '2026-01-06', '2026-01-06', 1),
-(52, 1, 'most', 'en', '2026-01-06', '2026-01-06', 1),
-(53, 1, 'his', 'en', '2026-01-06', '2026-01-06', 1),
-(54, 1, 'comedy', 'en', '2026-01-06', '2026-01-06', 1),
-(55, 1, 'जिम्म', 'hi', '2026-01-06', '2026-01-06', 1),
-(56, 1, 'विस्तृत', 'hi', '2026-01-06', '2026-01-06', 1),
-(57, 1, 'होत', 'hi', '2026-01-06', '2026-01-06', 1),
-(58, 1, 'उसक', 'hi', '2026-01-06', '2026-01-06', 1),
-(59, 1, 'मुझ', 'hi', '2026-01-06', '2026-01-06', 1),
-(60, 1, 'modern', 'en', '2026-01-06', '2026-01-06', 1),
-(61, 1, 'not', 'en', '2026-01-06', '2026-01-06', 1),
-(62, 1, 'going', 'en', '2026-01-06', '2026-01-06', 1),
-(63, 1, 'need', 'en', '2026-01-06', '2026-01-06', 1),
-(64, 1, 'report', 'en', '2026-01-06', '2026-01-06', 1),
-(65, 1, 'area', 'en', '2026-01-06', '2026-01-06', 1),
-(66, 1, 'hominem', 'en', '2026-01-06', '2026-01-06', 1),
-(67, 1, 'what', 'en', '2026-01-06', '2026-01-06', 1),
-(68, 1, 'about', 'en', '2026-01-06', '2026-01-06', 1),
-(69, 1, 'कोई', 'hi', '2026-01-06', '2026-01-06', 1),
-(70, 1, 'नियम', 'hi', '2026-01-06', '2026-01-06', 1),
-(71, 1, 'आदम', 'hi', '2026-01-06', '2026-01-06', 1),
-(72, 1, 'लेकर', 'hi', '2026-01-06', '2026-01-06', 1),
-(73, 1, 'इसक', 'hi', '2026-01-06', '2026-01-06', 1),
-(74, 1, 'दिन', 'hi', '2026-01-06', '2026-01-06', 1),
-(75, 1, 'एरिय', 'hi', '2026-01-06', '2026-01-06', 1),
-(76, 1, 'कुछ', 'hi', '2026-01-06', '2026-01-06', 1),
-(77, 1, 'अन्य', 'hi', '2026-01-06', '2026-01-06', 1),
-(78, 1, 'armando', 'es', '2026-01-06', '2026-01-06', 1),
-(79, 1, 'martínez', 'es', '2026-01-06', '2026-01-06', 1),
-(80, 1, 'vega', 'es', '2026-01-06', '2026-01-06', 1),
-(81, 1, 'con', 'es', '2026-01-06', '2026-01-06', 1),
-(82, 1, 'iremos', 'es', '2026-01-06', '2026-01-06', 1),
-(83, 1, 'cuatro', 'es', '2026-01-06', '2026-01-06', 1),
-(84, 1, 'valkiria', 'es', '2026-01-06', '2026-01-06', 1),
-(85, 1, 'culpa', 'es', '2026-01-06', '2026-01-06', 1),
-(86, 1, 'vergüenza', 'es', '2026-01-06', '2026-01-06', 1),
-(87, 1, 'don', 'en', '2026-01-06', '2026-01-06', 1),
-(88, 1, 'knock', 'en', '2026-01-06', '2026-01-06', 1),
-(89, 1, 'wood', 'en', '2026-01-06', '2026-01-06', 1),
-(90, 1, 'किन्त', 'hi', '2026-01-06', '2026-01-06', 1),
-(91, 1, 'वार्त', 'hi', '2026-01-06', '2026-01-06', 1),
-(92, 1, 'काम', 'hi', '2026-01-06', '2026-01-06', 1),
-(93, 1, 'tus', 'es', '2026-01-06', '2026-01-06', 1),
-(94, 1, 'amigos', 'es', '2026-01-06', '2026-01-06', 1),
-(95, 1, 'tan', 'es', '2026-01-06', '2026-01-06', 1),
-(96, 1, 'guapa', 'es', '2026-01-06', '2026-01-06', 1),
-(97, 1, 'como', 'es', '2026-01-06', '2026-01-06', 1),
-(98, 1, 'participar', 'es', '2026-01-06', '2026-01-06', 1),
-(99, 1, 'tiene', 'es', '2026-01-06', '2026-01-06', 1),
-(100, 1, 'convirtió', 'es', '2026-01-06', '2026-01-06', 1),
-(101, 1, 'guasón', 'es', '2026-01-06', '2026-01-06', 1),
-(102, 1, 'zabala', 'es', '2026-01-06', '2026-01-06', 1),
-(103, 1, 'piggyback', 'en', '2026-01-06', '2026-01-06', 1),
-(104, 1, 'tonight', 'en', '2026-01-06', '2026-01-06', 1),
-(105, 1, 'get', 'en', '2026-01-06', '2026-01-06', 1),
-(106, 1, 'into', 'en', '2026-01-06', '2026-01-06', 1),
-(107, 1, 'there', 'en', '2026-01-06', '2026-01-06', 1),
-(108, 1, 'wasn', 'en', '2026-01-06', '2026-01-06', 1),
-(109, 1, 'good', 'en', '2026-01-06', '2026-01-06', 1),
-(110, 1, 'either', 'en', '2026-01-06', '2026-01-06', 1),
-(111, 1, 'allí', 'es', '2026-01-06', '2026-01-06', 1),
-(112, 1, 'llévense', 'es', '2026-01-06', '2026-01-06', 1),
-(113, 1, 'son', 'es', '2026-01-06', '2026-01-06', 1),
-(114, 1, 'duro', 'es', '2026-01-06', '2026-01-06', 1),
-(115, 1, 'pagarlo', 'es', '2026-01-06', '2026-01-06', 1),
-(116, 1, 'negro', 'es', '2026-01-06', '2026-01-06', 1),
-(117, 1, 'agregan', 'es', '2026-01-06', '2026-01-06', 1),
-(118, 1, 'malignos', 'es', '2026-01-06', '2026-01-06', 1),
-(119, 1, 'pardo', 'es', '2026-01-06', '2026-01-06', 1),
-(120, 1, 'guarda', 'es', '2026-01-06', '2026-01-06', 1),
-(121, 1, 'invite', 'es', '2026-01-06', '2026-01-06', 1),
-(122, 1, 'मिट्ट', 'hi', '2026-01-06', '2026-01-06', 1),
-(123, 1, 'सिमट', 'hi', '2026-01-06', '2026-01-06', 1),
-(124, 1, 'बीस', 'hi', '2026-01-06', '2026-01-06', 1),
-(125, 1, 'समूह', 'hi', '2026-01-06', '2026-01-06', 1),
-(126, 1, 'बधाई', 'hi', '2026-01-06', '2026-01-06', 1),
-(127, 1, 'बनत', 'hi', '2026-01-06', '2026-01-06', 1),
-(128, 1, 'igual', 'es', '2026-01-06', '2026-01-06', 1),
-(129, 1, 'uses', 'en', '2026-01-06', '2026-01-06', 1),
-(130, 1, 'some', 'en', '2026-01-06', '2026-01-06', 1),
-(131, 1, 'little', 'en', '2026-01-06', '2026-01-06', 1),
-(132, 1, 'bottle', 'en', '2026-01-06', '2026-01-06', 1),
-(133, 1, 'any', 'en', '2026-01-06', '2026-01-06', 1),
-(134, 1, 'neither', 'en', '2026-01-06', '2026-01-06', 1),
-(135, 1, 'party', 'en', '2026-01-06', '2026-01-06', 1),
-(136, 1, 'getting', 'en', '2026-01-06', '2026-01-06', 1),
-(137, 1, 'wonder', 'en', '2026-01-06', '2026-01-06', 1),
-(138, 1, 'did', 'en', '2026-01-06', '2026-01-06', 1),
-(139, 1, 'would', 'en', '2026-01-06', '2026-01-06', 1),
-(140, 1, 'money', 'en', '2026-01-06', '2026-01-06', 1),
-(141, 1, 'went', 'en', '2026-01-06', '2026-01-06', 1),
-(142, 1, 'much', 'en', '2026-01-06', '2026-01-06', 1),
-(143, 1, 'activity', 'en', '2026-01-06', '2026-01-06', 1),
-(144, 1, 'tiros', 'es', '2026-01-06', '2026-01-06', 1),
-(145, 1, 'legarda', 'es', '2026-01-06', '2026-01-06', 1),
-(146, 1, 'oro', 'es', '2026-01-06', '2026-01-06', 1),
-(147, 1, 'got', 'en', '2026-01-06', '2026-01-06', 1),
-(148, 1, 'think', 'en', '2026-01-06', '2026-01-06', 1),
-(149, 1, 'awesome', 'en', '2026-01-06', '2026-01-06', 1),
-(150, 1, 'has', 'es', '2026-01-06', '2026-01-06', 1),
-(151, 1, 'invertido', 'es', '2026-01-06', '2026-01-06', 1),
-(152, 1, 'funny', 'en', '2026-01-06', '2026-01-06', 1),
-(153, 1, 'because', 'en', '2026-01-06', '2026-01-06', 1),
-(154, 1, 'hace', 'es', '2026-01-06', '2026-01-06', 1),
-(155, 1, 'partido', 'es', '2026-01-06', '2026-01-06', 1),
-(156, 1, 'added', 'en', '2026-01-06', '2026-01-06', 1),
-(157, 1, 'doesn', 'en', '2026-01-06', '2026-01-06', 1),
-(158, 1, 'movement', 'en', '2026-01-06', '2026-01-06', 1),
-(159, 1, 'लोग', 'hi', '2026-01-06', '2026-01-06', 1),
-(160, 1, 'व्यक्त', 'hi', '2026-01-06', '2026-01-06', 1),
-(161, 1, 'pennies', 'en', '2026-01-06', '2026-01-06', 1),
-(162, 1, 'communities', 'en', '2026-01-06', '2026-01-06', 1),
-(163, 1, 'that', 'en', '2026-01-06', '2026-01-06', 1),
-(164, 1, 'nigger', 'en', '2026-01-06', '2026-01-06', 1),
-(165, 1, 'उन्होंन', 'hi', '2026-01-06', '2026-01-06', 1),
-(166, 1, 'बगैर', 'hi', '2026-01-06', '2026-01-06', 1),
-(167, 1, 'थोड', 'hi', '2026-01-06', '2026-01-06', 1),
-(168, 1, 'ठंड', 'hi', '2026-01-06', '2026-01-06', 1),
-(169, 1, 'पान', 'hi', '2026-01-06', '2026-01-06', 1),
-(170, 1, 'भरन', 'hi', '2026-01-06', '2026-01-06', 1),
-(171, 1, 'वाल', 'hi', '2026-01-06', '2026-01-06', 1),
-(172, 1, 'हुए', 'hi', '2026-01-06', '2026-01-06', 1),
-(173, 1, 'abandonado', 'es', '2026-01-06', '2026-01-06', 1),
-(174, 1, 'मात्र', 'hi', '2026-01-06', '2026-01-06', 1),
-(175, 1, 'पुलिस', 'hi', '2026-01-06', '2026-01-06', 1),
-(176, 1, 'जिस', 'hi', '2026-01-06', '2026-01-06', 1),
-(177, 1, 'रोक', 'hi', '2026-01-06', '2026-01-06', 1),
-(178, 1, 'somebody', 'en', '2026-01-06', '2026-01-06', 1),
-(179, 1, 'set', 'en', '2026-01-06', '2026-01-06', 1),
-(180, 1, 'आरोप', 'hi', '2026-01-06', '2026-01-06', 1),
-(181, 1, 'gotcha', 'en', '2026-01-06', '2026-01-06', 1),
-(182, 1, 'debería', 'es', '2026-01-06', '2026-01-06', 1),
-(183, 1, 'even', 'en', '2026-01-06', '2026-01-06', 1),
-(184, 1, 'pentagon', 'en', '2026-01-06', '2026-01-06', 1),
-(185, 1, 'solo', 'es', '2026-01-06', '2026-01-06', 1),
-(186, 1, 'conozco', 'es', '2026-01-06', '2026-01-06', 1),
-(187, 1, 'mucha', 'es', '2026-01-06', '2026-01-06', 1),
-(188, 1, 'pena', 'es', '2026-01-06', '2026-01-06', 1),
-(189, 1, 'museums', 'en', '2026-01-06', '2026-01-06', 1),
-(190, 1, 'act', 'en', '2026-01-06', '2026-01-06', 1),
-(191, 1, 'sit', 'en', '2026-01-06', '2026-01-06', 1),
-(192, 1, 'face', 'en', '2026-01-06', '2026-01-06', 1),
-(193, 1, 'sigüenza', 'es', '2026-01-06', '2026-01-06', 1),
-(194, 1, 'estabilizar', 'es', '2026-01-06', '2026-01-06', 1),
-(195, 1, 'interesado', 'es', '2026-01-06', '2026-01-06', 1),
-(196, 1, 'decided', 'en', '2026-01-06', '2026-01-06', 1),
-(197, 1, 'saw', 'en', '2026-01-06', '2026-01-06', 1),
-(198, 1, 'anymore', 'en', '2026-01-06', '2026-01-06', 1),
-(199, 1, 'sido', 'es', '2026-01-06', '2026-01-06', 1),
-(200, 1, 'dicho', 'es', '2026-01-06', '2026-01-06', 1),
-(201, 1, 'hizo', 'es', '2026-01-06', '2026-01-06', 1),
-(202, 1, 'बीसीएम', 'hi', '2026-01-06', '2026-01-06', 1),
-(203, 1, 'उसन', 'hi', '2026-01-06', '2026-01-06', 1),
-(204, 1, 'फाइल', 'hi', '2026-01-06', '2026-01-06', 1),
-(205, 1, 'फोट', 'hi', '2026-01-06', '2026-01-06', 1),
-(206, 1, 'वीडिय', 'hi', '2026-01-06', '2026-01-06', 1),
-(207, 1, 'रिलीज', 'hi', '2026-01-06', '2026-01-06', 1),
-(208, 1, 'अनुष्ठान', 'hi', '2026-01-06', '2026-01-06', 1),
-(209, 1, 'खास', 'hi', '2026-01-06', '2026-01-06', 1),
-(210, 1, 'सार', 'hi', '2026-01-06', '2026-01-06', 1),
-(211, 1, 'इलाज', 'hi', '2026-01-06', '2026-01-06', 1),
-(212, 1, 'रिमोट', 'hi', '2026-01-06', '2026-01-06', 1),
-(213, 1, 'समझ', 'hi', '2026-01-06', '2026-01-06', 1),
-(214, 1, 'पहनत', 'hi', '2026-01-06', '2026-01-06', 1),
-(215, 1, 'acusaré', 'es', '2026-01-06', '2026-01-06', 1),
-(216, 1, 'ante', 'es', '2026-01-06', '2026-01-06', 1),
-(217, 1, 'obras', 'es', '2026-01-06', '2026-01-06', 1),
-(218, 1, 'piano', 'es', '2026-01-06', '2026-01-06', 1),
-(219, 1, 'violín', 'es', '2026-01-06', '2026-01-06', 1),
-(220, 1, 'chino', 'es', '2026-01-06', '2026-01-06', 1),
-(221, 1, 'can', 'en', '2026-01-06', '2026-01-06', 1),
-(222, 1, 'man', 'en', '2026-01-06', '2026-01-06', 1),
-(223, 1, 'इटल', 'hi', '2026-01-06', '2026-01-06', 1),
-(224, 1, 'पेड', 'hi', '2026-01-06', '2026-01-06', 1),
-(225, 1, 'बीच', 'hi', '2026-01-06', '2026-01-06', 1),
-(226, 1, 'जीन', 'hi', '2026-01-06', '2026-01-06', 1),
-(227, 1, 'चाहत', 'hi', '2026-01-06', '2026-01-06', 1),
-(228, 1, 'डबल', 'hi', '2026-01-06', '2026-01-06', 1),
-(229, 1, 'मीनिंग', 'hi', '2026-01-06', '2026-01-06', 1),
-(230, 1, 'has', 'en', '2026-01-06', '2026-01-06', 1),
-(231, 1, 'happened', 'en', '2026-01-06', '2026-01-06', 1),
-(232, 1, 'दूसर', 'hi', '2026-01-06', '2026-01-06', 1),
-(233, 1, 'चार', 'hi', '2026-01-06', '2026-01-06', 1),
-(234, 1, 'मध्यम', 'hi', '2026-01-06', '2026-01-06', 1),
-(235, 1, 'cualquier', 'es', '2026-01-06', '2026-01-06', 1),
-(236, 1, 'institución', 'es', '2026-01-06', '2026-01-06', 1),
-(237, 1, 'echado', 'es', '2026-01-06', '2026-01-06', 1),
-(238, 1, 'mandemos', 'es', '2026-01-06', '2026-01-06', 1),
-(239, 1, 'cited', 'en', '2026-01-06', '2026-01-06', 1),
-(240, 1, 'news', 'en', '2026-01-06', '2026-01-06', 1),
-(241, 1, 'channels', 'en', '2026-01-06', '2026-01-06', 1),
-(242, 1, 'mundos', 'es', '2026-01-06', '2026-01-06', 1),
-(243, 1, 'sin', 'es', '2026-01-06', '2026-01-06', 1),
-(244, 1, 'usted', 'es', '2026-01-06', '2026-01-06', 1),
-(245, 1, 'pretexto', 'es', '2026-01-06', '2026-01-06', 1),
-(246, 1, 'nada', 'es', '2026-01-06', '2026-01-06', 1),
-(247, 1, 'this', 'en', '2026-01-06', '2026-01-06', 1),
-(248, 1, 'know', 'en', '2026-01-06', '2026-01-06', 1),
-(249, 1, 'why', 'en', '2026-01-06', '2026-01-06', 1),
-(250, 1, 'wouldn', 'en', '2026-01-06', '2026-01-06', 1),
-(251, 1, 'anything', 'en', '2026-01-06', '2026-01-06', 1),
-(252, 1, 'except', 'en', '2026-01-06', '2026-01-06', 1),
-(253, 1, 'ellas', 'es', '2026-01-06', '2026-01-06', 1),
-(254, 1, 'resaltar', 'es', '2026-01-06', '2026-01-06', 1),
-(255, 1, 'शब्दार्थ', 'hi', '2026-01-06', '2026-01-06', 1),
-(256, 1, 'दृष्टिगत', 'hi', '2026-01-06', '2026-01-06', 1),
-(257, 1, 'दुष्कर्म', 'hi', '2026-01-06', '2026-01-06', 1),
-(258, 1, 'शिकार', 'hi', '2026-01-06', '2026-01-06', 1),
-(259, 1, 'entonces', 'es', '2026-01-06', '2026-01-06', 1),
-(260, 1, 'tienes', 'es', '2026-01-06', '2026-01-06', 1),
-(261, 1, 'suerte', 'es', '2026-01-06', '2026-01-06', 1),
-(262, 1, 'dan', 'es', '2026-01-06', '2026-01-06', 1),
-(263, 1, 'sensación', 'es', '2026-01-06', '2026-01-06', 1),
-(264, 1, 'rubor', 'es', '2026-01-06', '2026-01-06', 1),
-(265, 1, 'second', 'en', '2026-01-06', '2026-01-06', 1),
-(266, 1, 'plastered', 'en', '2026-01-06', '2026-01-06', 1),
-(267, 1, 'just', 'en', '2026-01-06', '2026-01-06', 1),
-(268, 1, 'matter', 'en', '2026-01-06', '2026-01-06', 1),
-(269, 1, 'springboard', 'en', '2026-01-06', '2026-01-06', 1),
-(270, 1, 'business', 'en', '2026-01-06', '2026-01-06', 1),
-(271, 1, 'tax', 'en', '2026-01-06', '2026-01-06', 1),
-(272, 1, 'buy', 'en', '2026-01-06', '2026-01-06', 1),
-(273, 1, 'nine', 'en', '2026-01-06', '2026-01-06', 1),
-(274, 1, 'nothing', 'en', '2026-01-06', '2026-01-06', 1),
-(275, 1, 'million', 'en', '2026-01-06', '2026-01-06', 1),
-(276, 1, 'कृष्ण', 'hi', '2026-01-06', '2026-01-06', 1),
-(277, 1, 'मलिक', 'hi', '2026-01-06', '2026-01-06', 1),
-(278, 1, 'यूजर्स', 'hi', '2026-01-06', '2026-01-06', 1),
-(279, 1, 'मिल', 'hi', '2026-01-06', '2026-01-06', 1),
-(280, 1, 'buena', 'es', '2026-01-06', '2026-01-06', 1),
-(281, 1, 'onda', 'es', '2026-01-06', '2026-01-06', 1),
-(282, 1, 'máquinas', 'es', '2026-01-06', '2026-01-06', 1),
-(283, 1, 'molienda', 'es', '2026-01-06', '2026-01-06', 1),
-(284, 1, 'coches', 'es', '2026-01-06', '2026-01-06', 1),
-(285, 1, 'अगर', 'hi', '2026-01-06', '2026-01-06', 1),
-(286, 1, 'एकनाथ', 'hi', '2026-01-06', '2026-01-06', 1),
-(287, 1, 'शिंद', 'hi', '2026-01-06', '2026-01-06', 1),
-(288, 1, 'सिट', 'hi', '2026-01-06', '2026-01-06', 1),
-(289, 1, 'which', 'en', '2026-01-06', '2026-01-06', 1),
-(290, 1, 'pursuing', 'en', '2026-01-06', '2026-01-06', 1),
-(291, 1, 'cities', 'en', '2026-01-06', '2026-01-06', 1),
-(292, 1, 'computer', 'en', '2026-01-06', '2026-01-06', 1),
-(293, 1, 'बीजेप', 'hi', '2026-01-06', '2026-01-06', 1),
-(294, 1, 'मार्ग', 'hi', '2026-01-06', '2026-01-06', 1),
-(295, 1, 'प्रशस्त', 'hi', '2026-01-06', '2026-01-06', 1),
-(296, 1, 'रांच', 'hi', '2026-01-06', '2026-01-06', 1),
-(297, 1, 'स्थित', 'hi', '2026-01-06', '2026-01-06', 1),
-(298, 1, 'tengan', 'es', '2026-01-06', '2026-01-06', 1),
-(299, 1, 'presente', 'es', '2026-01-06', '2026-01-06', 1),
-(300, 1, 'sus', 'es', '2026-01-06', '2026-01-06', 1),
-(301, 1, 'necesidades', 'es', '2026-01-06', '2026-01-06', 1),
-(302, 1, 'este', 'es', '2026-01-06', '2026-01-06', 1),
-(303, 1, 'cambios', 'es', '2026-01-06', '2026-01-06', 1),
-(304, 1, 'pacto', 'es', '2026-01-06', '2026-01-06', 1),
-(305, 1, 'विशिष्ट', 'hi', '2026-01-06', '2026-01-06', 1),
-(306, 1, 'पैंतीस', 'hi', '2026-01-06', '2026-01-06', 1),
-(307, 1, 'फीसद', 'hi', '2026-01-06', '2026-01-06', 1),
-(308, 1, 'empresa', 'es', '2026-01-06', '2026-01-06', 1),
-(309, 1, 'pies', 'es', '2026-01-06', '2026-01-06', 1),
-(310, 1, 'सिस्टम', 'hi', '2026-01-06', '2026-01-06', 1),
-(311, 1, 'एनपीएस', 'hi', '2026-01-06', '2026-01-06', 1),
-(312, 1, 'वर्ष', 'hi', '2026-01-06', '2026-01-06', 1),
-(313, 1, 'sister', 'en', '2026-01-06', '2026-01-06', 1),
-(314, 1, 'head', 'en', '2026-01-06', '2026-01-06', 1),
-(315, 1, 'office', 'en', '2026-01-06', '2026-01-06', 1),
-(316, 1, 'anger', 'en', '2026-01-06', '2026-01-06', 1),
-(317, 1, 'focusing', 'en', '2026-01-06', '2026-01-06', 1),
-(318, 1, 'than', 'en', '2026-01-06', '2026-01-06', 1),
-(319, 1, 'bad', 'en', '2026-01-06', '2026-01-06', 1),
-(320, 1, 'conference', 'en', '2026-01-06', '2026-01-06', 1),
-(321, 1, 'johnson', 'en', '2026-01-06', '2026-01-06', 1),
-(322, 1, 'will', 'en', '2026-01-06', '2026-01-06', 1),
-(323, 1, 'soon', 'en', '2026-01-06', '2026-01-06', 1),
-(324, 1, 'assessing', 'en', '2026-01-06', '2026-01-06', 1),
-(325, 1, 'emphasis', 'en', '2026-01-06', '2026-01-06', 1),
-(326, 1, 'masters', 'en', '2026-01-06', '2026-01-06', 1),
-(327, 1, 'option', 'en', '2026-01-06', '2026-01-06', 1),
-(328, 1, 'leaving', 'en', '2026-01-06', '2026-01-06', 1),
-(329, 1, 'let', 'en', '2026-01-06', '2026-01-06', 1),
-(330, 1, 'मुस्लिम', 'hi', '2026-01-06', '2026-01-06', 1),
-(331, 1, 'लेन', 'hi', '2026-01-06', '2026-01-06', 1),
-(332, 1, 'जश्न', 'hi', '2026-01-06', '2026-01-06', 1),
-(333, 1, 'होग', 'hi', '2026-01-06', '2026-01-06', 1),
-(334, 1, 'fechas', 'es', '2026-01-06', '2026-01-06', 1),
-(335, 1, 'cuando', 'es', '2026-01-06', '2026-01-06', 1),
-(336, 1, 'ochenta', 'es', '2026-01-06', '2026-01-06', 1),
-(337, 1, 'siete', 'es', '2026-01-06', '2026-01-06', 1),
-(338, 1, 'ciudad', 'es', '2026-01-06', '2026-01-06', 1),
-(339, 1, 'empleo', 'es', '2026-01-06', '2026-01-06', 1),
-(340, 1, 'imagine', 'en', '2026-01-06', '2026-01-06', 1),
-(341, 1, 'shake', 'en', '2026-01-06', '2026-01-06', 1),
-(342, 1, 'enough', 'en', '2026-01-06', '2026-01-06', 1),
-(343, 1, 'states', 'en', '2026-01-06', '2026-01-06', 1),
-(344, 1, 'build', 'en', '2026-01-06', '2026-01-06', 1),
-(345, 1, 'new', 'en', '2026-01-06', '2026-01-06', 1),
-(346, 1, 'put', 'en', '2026-01-06', '2026-01-06', 1),
-(347, 1, 'approaching', 'en', '2026-01-06', '2026-01-06', 1),
-(348, 1, 'देर', 'hi', '2026-01-06', '2026-01-06', 1),
-(349, 1, 'शाम', 'hi', '2026-01-06', '2026-01-06', 1),
-(350, 1, 'पहुंच', 'hi', '2026-01-06', '2026-01-06', 1),
-(351, 1, 'ser', 'es', '2026-01-06', '2026-01-06', 1),
-(352, 1, 'color', 'es', '2026-01-06', '2026-01-06', 1),
-(353, 1, 'sangre', 'es', '2026-01-06', '2026-01-06', 1),
-(354, 1, 'ten', 'en', '2026-01-06', '2026-01-06', 1),
-(355, 1, 'cuddle', 'en', '2026-01-06', '2026-01-06', 1),
-(356, 1, 'single', 'en', '2026-01-06', '2026-01-06', 1),
-(357, 1, 'रिकॉर्ड', 'hi', '2026-01-06', '2026-01-06', 1),
-(358, 1, 'करन', 'hi', '2026-01-06', '2026-01-06', 1),
-(359, 1, 'काफ', 'hi', '2026-01-06', '2026-01-06', 1),
-(360, 1, 'रुच', 'hi', '2026-01-06', '2026-01-06', 1),
-(361, 1, 'wait', 'en', '2026-01-06', '2026-01-06', 1),
-(362, 1, 'see', 'en', '2026-01-06', '2026-01-06', 1),
-(363, 1, 'geomapping', 'en', '2026-01-06', '2026-01-06', 1),
-(364, 1, 'able', 'en', '2026-01-06', '2026-01-06', 1),
-(365, 1, 'sleep', 'en', '2026-01-06', '2026-01-06', 1),
-(366, 1, 'galeno', 'es', '2026-01-06', '2026-01-06', 1),
-(367, 1, 'encimeras', 'es', '2026-01-06', '2026-01-06', 1),
-(368, 1, 'echen', 'es', '2026-01-06', '2026-01-06', 1),
-(369, 1, 'los', 'es', '2026-01-06', '2026-01-06', 1),
-(370, 1, 'sufren', 'es', '2026-01-06', '2026-01-06', 1),
-(371, 1, 'clientes', 'es', '2026-01-06', '2026-01-06', 1),
-(372, 1, 'cámara', 'es', '2026-01-06', '2026-01-06', 1),
-(373, 1, 'सोच', 'hi', '2026-01-06', '2026-01-06', 1),
-(374, 1, 'finally', 'en', '2026-01-06', '2026-01-06', 1),
-(375, 1, 'such', 'en', '2026-01-06', '2026-01-06', 1),
-(376, 1, 'lot', 'en', '2026-01-06', '2026-01-06', 1),
-(377, 1, 'partner', 'en', '2026-01-06', '2026-01-06', 1),
-(378, 1, 'said', 'en', '2026-01-06', '2026-01-06', 1),
-(379, 1, 'been', 'en', '2026-01-06', '2026-01-06', 1),
-(380, 1, 'again', 'en', '2026-01-06', '2026-01-06', 1),
-(381, 1, 'होन', 'hi', '2026-01-06', '2026-01-06', 1),
-(382, 1, 'लिए', 'hi', '2026-01-06', '2026-01-06', 1),
-(383, 1, 'अपन', 'hi', '2026-01-06', '2026-01-06', 1),
-(384, 1, 'live', 'en', '2026-01-06', '2026-01-06', 1),
-(385, 1, 'openings', 'en', '2026-01-06', '2026-01-06', 1),
-(386, 1, 'couldn', 'en', '2026-01-06', '2026-01-06', 1),
-(387, 1, 'use', 'en', '2026-01-06', '2026-01-06', 1),
-(388, 1, 'ponemos', 'es', '2026-01-06', '2026-01-06', 1),
-(389, 1, 'fueran', 'es', '2026-01-06', '2026-01-06', 1),
-(390, 1, 'discúlpenme', 'es', '2026-01-06', '2026-01-06', 1),
-(391, 1, 'sonrisa', 'es', '2026-01-06', '2026-01-06', 1),
-(392, 1, 'उनस', 'hi', '2026-01-06', '2026-01-06', 1),
-(393, 1, 'सकत', 'hi', '2026-01-06', '2026-01-06', 1),
-(394, 1, 'सेकंड', 'hi', '2026-01-06', '2026-01-06', 1),
-(395, 1, 'didn', 'en', '2026-01-06', '2026-01-06', 1),
-(396, 1, 'now', 'en', '2026-01-06', '2026-01-06', 1),
-(397, 1, 'find', 'en', '2026-01-06', '2026-01-06', 1),
-(398, 1, 'epidemic', 'en', '2026-01-06', '2026-01-06', 1),
-(399, 1, 'negado', 'es', '2026-01-06', '2026-01-06', 1),
-(400, 1, 'फोन', 'hi', '2026-01-06', '2026-01-06', 1),
-(401, 1, 'जाए', 'hi', '2026-01-06', '2026-01-06', 1),
-(402, 1, 'población', 'es', '2026-01-06', '2026-01-06', 1),
-(403, 1, 'irán', 'es', '2026-01-06', '2026-01-06', 1),
-(404, 1, 'mes', 'es', '2026-01-06', '2026-01-06', 1),
-(405, 1, 'empezamos', 'es', '2026-01-06', '2026-01-06', 1),
-(406, 1, 'peter', 'en', '2026-01-06', '2026-01-06', 1),
-(407, 1, 'one', 'en', '2026-01-06', '2026-01-06', 1),
-(408, 1, 'name', 'en', '2026-01-06', '2026-01-06', 1),
-(409, 1, 'tenant', 'en', '2026-01-06', '2026-01-06', 1),
-(410, 1, 'forty', 'en', '2026-01-06', '2026-01-06', 1),
-(411, 1, 'seven', 'en', '2026-01-06', '2026-01-06', 1),
-(412, 1, 'hundred', 'en', '2026-01-06', '2026-01-06', 1),
-(413, 1, 'eighty', 'en', '2026-01-06', '2026-01-06', 1),
-(414, 1, 'व्यक्तिगत', 'hi', '2026-01-06', '2026-01-06', 1),
-(415, 1, 'चैनल', 'hi', '2026-01-06', '2026-01-06', 1),
-(416, 1, 'भारत', 'hi', '2026-01-06', '2026-01-06', 1),
-(417, 1, 'कारण', 'hi', '2026-01-06', '2026-01-06', 1),
-(418, 1, 'anduvo', 'es', '2026-01-06', '2026-01-06', 1),
-(419, 1, 'fogones', 'es', '2026-01-06', '2026-01-06', 1),
-(420, 1, 'tapar', 'es', '2026-01-06', '2026-01-06', 1),
-(421, 1, 'echar', 'es', '2026-01-06', '2026-01-06', 1),
-(422, 1, 'for', 'en', '2026-01-06', '2026-01-06', 1),
-(423, 1, 'reading', 'en', '2026-01-06', '2026-01-06', 1),
-(424, 1, 'never', 'en', '2026-01-06', '2026-01-06', 1),
-(425, 1, 'wanted', 'en', '2026-01-06', '2026-01-06', 1),
-(426, 1, 'our', 'en', '2026-01-06', '2026-01-06', 1),
-(427, 1, 'time', 'en', '2026-01-06', '2026-01-06', 1),
-(428, 1, 'मदीन', 'hi', '2026-01-06', '2026-01-06', 1),
-(429, 1, 'सुपर', 'hi', '2026-01-06', '2026-01-06', 1),
-(430, 1, 'डीलक्स', 'hi', '2026-01-06', '2026-01-06', 1),
-(431, 1, 'राज', 'hi', '2026-01-06', '2026-01-06', 1),
-(432, 1, 'बिस्तर', 'hi', '2026-01-06', '2026-01-06', 1),
-(433, 1, 'अनुसार', 'hi', '2026-01-06', '2026-01-06', 1),
-(434, 1, 'निस्तारण', 'hi', '2026-01-06', '2026-01-06', 1),
-(435, 1, 'everybody', 'en', '2026-01-06', '2026-01-06', 1),
-(436, 1, 'signed', 'en', '2026-01-06', '2026-01-06', 1),
-(437, 1, 'fan', 'en', '2026-01-06', '2026-01-06', 1),
-(438, 1, 'idiot', 'en', '2026-01-06', '2026-01-06', 1),
-(439, 1, 'बाइबिल', 'hi', '2026-01-06', '2026-01-06', 1),
-(440, 1, 'उनक', 'hi', '2026-01-06', '2026-01-06', 1),
-(441, 1, 'मोबाइल', 'hi', '2026-01-06', '2026-01-06', 1),
-(442, 1, 'hmm', 'en', '2026-01-06', '2026-01-06', 1),
-(443, 1, 'more', 'en', '2026-01-06', '2026-01-06', 1),
-(444, 1, 'drilling', 'en', '2026-01-06', '2026-01-06', 1),
-(445, 1, 'form', 'en', '2026-01-06', '2026-01-06', 1),
-(446, 1, 'these', 'en', '2026-01-06', '2026-01-06', 1),
-(447, 1, 'gonna', 'en', '2026-01-06', '2026-01-06', 1),
-(448, 1, 'wasted', 'en', '2026-01-06', '2026-01-06', 1),
-(449, 1, 'ways', 'en', '2026-01-06', '2026-01-06', 1),
-(450, 1, 'charla', 'es', '2026-01-06', '2026-01-06', 1),
-(451, 1, 'manden', 'es', '2026-01-06', '2026-01-06', 1),
-(452, 1, 'súper', 'es', '2026-01-06', '2026-01-06', 1),
-(453, 1, 'bética', 'es', '2026-01-06', '2026-01-06', 1),
-(454, 1, 'balance', 'es', '2026-01-06', '2026-01-06', 1),
-(455, 1, 'mantiene', 'es', '2026-01-06', '2026-01-06', 1),
-(456, 1, 'está', 'es', '2026-01-06', '2026-01-06', 1),
-(457, 1, 'conjunta', 'es', '2026-01-06', '2026-01-06', 1),
-(458, 1, 'harían', 'es', '2026-01-06', '2026-01-06', 1),
-(459, 1, 'fuera', 'es', '2026-01-06', '2026-01-06', 1),
-(460, 1, 'del', 'es', '2026-01-06', '2026-01-06', 1),
-(461, 1, 'pie', 'es', '2026-01-06', '2026-01-06', 1),
-(462, 1, 'estamos', 'es', '2026-01-06', '2026-01-06', 1),
-(463, 1, 'endesa', 'es', '2026-01-06', '2026-01-06', 1),
-(464, 1, 'ganar', 'es', '2026-01-06', '2026-01-06', 1),
-(465, 1, 'tienen', 'es', '2026-01-06', '2026-01-06', 1),
-(466, 1, 'grande', 'es', '2026-01-06', '2026-01-06', 1),
-(467, 1, 'convento', 'es', '2026-01-06', '2026-01-06', 1),
-(468, 1, 'baile', 'es', '2026-01-06', '2026-01-06', 1),
-(469, 1, 'muerte', 'es', '2026-01-06', '2026-01-06', 1),
-(470, 1, 'fueron', 'es', '2026-01-06', '2026-01-06', 1),
-(471, 1, 'diez', 'es', '2026-01-06', '2026-01-06', 1),
-(472, 1, 'qne', 'es', '2026-01-06', '2026-01-06', 1),
-(473, 1, 'decir', 'es', '2026-01-06', '2026-01-06', 1),
-(474, 1, 'cuestionar', 'es', '2026-01-06', '2026-01-06', 1),
-(475, 1, 'ventana', 'es', '2026-01-06', '2026-01-06', 1),
-(476, 1, 'finalmente', 'es', '2026-01-06', '2026-01-06', 1),
-(477, 1, 'disco', 'es', '2026-01-06', '2026-01-06', 1),
-(478, 1, 'सिंगर', 'hi', '2026-01-06', '2026-01-06', 1),
-(479, 1, 'चाइन', 'hi', '2026-01-06', '2026-01-06', 1),
-(480, 1, 'पॉलिस', 'hi', '2026-01-06', '2026-01-06', 1),
-(481, 1, 'कमेट', 'hi', '2026-01-06', '2026-01-06', 1),
-(482, 1, 'una', 'en', '2026-01-06', '2026-01-06', 1),
-(483, 1, 'pizza', 'en', '2026-01-06', '2026-01-06', 1),
-(484, 1, 'सोनम', 'hi', '2026-01-06', '2026-01-06', 1),
-(485, 1, 'कपूर', 'hi', '2026-01-06', '2026-01-06', 1),
-(486, 1, 'फोड', 'hi', '2026-01-06', '2026-01-06', 1),
-(487, 1, 'परीक्षण', 'hi', '2026-01-06', '2026-01-06', 1),
-(488, 1, 'among', 'en', '2026-01-06', '2026-01-06', 1),
-(489, 1, 'many', 'en', '2026-01-06', '2026-01-06', 1),
-(490, 1, 'ट्रेडिशनल', 'hi', '2026-01-06', '2026-01-06', 1),
-(491, 1, 'एशियन', 'hi', '2026-01-06', '2026-01-06', 1),
-(492, 1, 'पेंट्स', 'hi', '2026-01-06', '2026-01-06', 1),
-(493, 1, 'सिनेम', 'hi', '2026-01-06', '2026-01-06', 1),
-(494, 1, 'शूटिंग', 'hi', '2026-01-06', '2026-01-06', 1),
-(495, 1, 'chasing', 'en', '2026-01-06', '2026-01-06', 1),
-(496, 1, 'इंटरनेट', 'hi', '2026-01-06', '2026-01-06', 1),
-(497, 1, 'मीडिय', 'hi', '2026-01-06', '2026-01-06', 1),
-(498, 1, 'लिप्त', 'hi', '2026-01-06', '2026-01-06', 1),
-(499, 1, 'meme', 'en', '2026-01-06', '2026-01-06', 1),
-(500, 1, 'believe', 'en', '2026-01-06', '2026-01-06', 1),
-(501, 1, 'paper', 'en', '2026-01-06', '2026-01-06', 1),
-(502, 1, 'mean', 'en', '2026-01-06', '2026-01-06', 1),
-(503, 1, 'handle', 'en', '2026-01-06', '2026-01-06', 1),
-(504, 1, 'हिंद', 'hi', '2026-01-06', '2026-01-06', 1),
-(505, 1, 'दैनिक', 'hi', '2026-01-06', '2026-01-06', 1),
-(506, 1, 'अनुच्छेद', 'hi', '2026-01-06', '2026-01-06', 1),
-(507, 1, 'रिश्तेदार', 'hi', '2026-01-06', '2026-01-06', 1),
-(508, 1, 'percentage', 'en', '2026-01-06', '2026-01-06', 1),
-(509, 1, 'edge', 'en', '2026-01-06', '2026-01-06', 1),
-(510, 1, 'yang', 'en', '2026-01-06', '2026-01-06', 1),
-(511, 1, 'दिय', 'hi', '2026-01-06', '2026-01-06', 1),
-(512, 1, 'innocent', 'en', '2026-01-06', '2026-01-06', 1),
-(513, 1, 'each', 'en', '2026-01-06', '2026-01-06', 1),
-(514, 1, 'independent', 'en', '2026-01-06', '2026-01-06', 1),
-(515, 1, 'remember', 'en', '2026-01-06', '2026-01-06', 1),
-(516, 1, 'show', 'en', '2026-01-06', '2026-01-06', 1),
-(517, 1, 'when', 'en', '2026-01-06', '2026-01-06', 1),
-(518, 1, 'miss', 'en', '2026-01-06', '2026-01-06', 1),
-(519, 1, 'them', 'en', '2026-01-06', '2026-01-06', 1),
-(520, 1, 'ahora', 'es', '2026-01-06', '2026-01-06', 1),
-(521, 1, 'only', 'en', '2026-01-06', '2026-01-06', 1),
-(522, 1, 'wish', 'en', '2026-01-06', '2026-01-06', 1),
-(523, 1, 'प्रशिक्षण', 'hi', '2026-01-06', '2026-01-06', 1),
-(524, 1, 'your', 'en', '2026-01-06', '2026-01-06', 1),
-(525, 1, 'honor', 'en', '2026-01-06', '2026-01-06', 1),
-(526, 1, 'इंडियन', 'hi', '2026-01-06', '2026-01-06', 1),
-(527, 1, 'मुजाहिदीन', 'hi', '2026-01-06', '2026-01-06', 1),
-(528, 1, 'yeah', 'en', '2026-01-06', '2026-01-06', 1),
-(529, 1, 'क्य', 'hi', '2026-01-06', '2026-01-06', 1),
-(530, 1, 'película', 'es', '2026-01-06', '2026-01-06', 1),
-(531, 1, 'bueno', 'es', '2026-01-07', '2026-01-07', 1),
-(532, 1, 'teléfono', 'es', '2026-01-07', '2026-01-07', 1),
-(533, 1, 'panteón', 'es', '2026-01-07', '2026-01-07', 1),
-(534, 1, 'amagando', 'es', '2026-01-07', '2026-01-07', 1),
-(535, 1, 'mochila', 'es', '2026-01-07', '2026-01-07', 1),
-(536, 1, 'tenía', 'es', '2026-01-07', '2026-01-07', 1),
-(537, 1, 'parece', 'es', '2026-01-07', '2026-01-07', 1),
-(538, 1, 'but', 'en', '2026-01-07', '2026-01-07', 1),
-(539, 1, 'huh', 'en', '2026-01-09', '2026-01-09', 1),
-(540, 3, 'huh', 'en', '2026-01-21', '2026-01-21', 1),
-(541, 5, 'time', 'en', '2026-02-03', '2026-02-03', 1),
-(542, 5, 'know', 'en', '2026-02-03', '2026-02-03', 1),
-(543, 5, 'guy', 'en', '2026-02-03', '2026-02-03', 1),
-(544, 5, 'but', 'en', '2026-02-03', '2026-02-03', 1),
-(545, 5, 'gasoline', 'en', '2026-02-03', '2026-02-03', 1),
-(546, 5, 'क्य', 'hi', '2026-02-03', '2026-02-03', 1),
-(547, 5, 'life', 'en', '2026-02-03', '2026-02-03', 1),
-(548, 5, 'really', 'en', '2026-02-03', '2026-02-03', 1),
-(549, 5, 'how', 'en', '2026-02-03', '2026-02-03', 1),
-(550, 5, 'वीडिय', 'hi', '2026-02-03', '2026-02-03', 1),
-(551, 5, 'सऊद', 'hi', '2026-02-03', '2026-02-03', 1),
-(552, 5, 'because', 'en', '2026-02-03', '2026-02-03', 1),
-(553, 5, 'and', 'en', '2026-02-03', '2026-02-03', 1),
-(554, 5, 'हमन', 'hi', '2026-02-03', '2026-02-03', 1),
-(555, 5, 'reading', 'en', '2026-02-03', '2026-02-03', 1),
-(556, 5, 'विभिन्न', 'hi', '2026-02-03', '2026-02-03', 1),
-(557, 5, 'get', 'en', '2026-02-03', '2026-02-03', 1),
-(558, 5, 'que', 'es', '2026-02-03', '2026-02-03', 1),
-(559, 5, 'los', 'es', '2026-02-03', '2026-02-03', 1),
-(560, 5, 'noventa', 'es', '2026-02-03', '2026-02-03', 1),
-(561, 5, 'tres', 'es', '2026-02-03', '2026-02-03', 1),
-(562, 5, 'monday', 'en', '2026-02-03', '2026-02-03', 1),
-(563, 5, 'don', 'en', '2026-02-03', '2026-02-03', 1),
-(564, 5, 'want', 'en', '2026-02-03', '2026-02-03', 1),
-(565, 5, 'under', 'en', '2026-02-03', '2026-02-03', 1),
-(566, 5, 'your', 'en', '2026-02-03', '2026-02-03', 1),
-(567, 5, 'bed', 'en', '2026-02-03', '2026-02-03', 1),
-(568, 5, 'anyway', 'en', '2026-02-03', '2026-02-03', 1),
-(569, 5, 'ट्रिब्यूनल', 'hi', '2026-02-03', '2026-02-03', 1),
-(570, 5, 'another', 'en', '2026-02-03', '2026-02-03', 1),
-(571, 5, 'este', 'es', '2026-02-03', '2026-02-03', 1),
-(572, 5, 'mercado', 'es', '2026-02-03', '2026-02-03', 1),
-(573, 5, 'shipping', 'en', '2026-02-03', '2026-02-03', 1),
-(574, 5, 'lot', 'en', '2026-02-03', '2026-02-03', 1),
-(575, 5, 'heading', 'en', '2026-02-03', '2026-02-03', 1),
-(576, 5, 'navarra', 'es', '2026-02-03', '2026-02-03', 1),
-(577, 5, 'haré', 'es', '2026-02-03', '2026-02-03', 1),
-(578, 5, 'हेलेन', 'hi', '2026-02-03', '2026-02-03', 1),
-(579, 5, 'हमार', 'hi', '2026-02-03', '2026-02-03', 1),
-(580, 5, 'company', 'en', '2026-02-03', '2026-02-03', 1),
-(581, 5, 'compañía', 'es', '2026-02-03', '2026-02-03', 1),
-(582, 5, 'अन्य', 'hi', '2026-02-03', '2026-02-03', 1),
-(583, 5, 'neighbor', 'en', '2026-02-03', '2026-02-03', 1),
-(584, 5, 'what', 'en', '2026-02-03', '2026-02-03', 1),
-(585, 5, 'tomatoes', 'en', '2026-02-03', '2026-02-03', 1),
-(586, 5, 'por', 'es', '2026-02-03', '2026-02-03', 1),
-(587, 5, 'ganaderos', 'es', '2026-02-03', '2026-02-03', 1),
-(588, 5, 'would', 'en', '2026-02-03', '2026-02-03', 1),
-(589, 5, 'work', 'en', '2026-02-03', '2026-02-03', 1),
-(590, 5, 'खाद', 'hi', '2026-02-03', '2026-02-03', 1),
-(591, 5, 'real', 'en', '2026-02-03', '2026-02-03', 1),
-(592, 5, 'happy', 'en', '2026-02-03', '2026-02-03', 1),
-(593, 5, 'birthday', 'en', '2026-02-03', '2026-02-03', 1),
-(594, 5, 'older', 'en', '2026-02-03', '2026-02-03', 1),
-(595, 5, 'good', 'en', '2026-02-03', '2026-02-03', 1),
-(596, 5, 'added', 'en', '2026-02-03', '2026-02-03', 1),
-(597, 5, 'going', 'en', '2026-02-03', '2026-02-03', 1),
-(598, 5, 'हैप्प', 'hi', '2026-02-03', '2026-02-03', 1),
-(599, 5, 'बर्थड', 'hi', '2026-02-03', '2026-02-03', 1),
-(600, 5, 'पार्ट', 'hi', '2026-02-03', '2026-02-03', 1),
-(601, 5, 'garden', 'en', '2026-02-03', '2026-02-03', 1),
-(602, 5, 'कार्ड', 'hi', '2026-02-03', '2026-02-03', 1),
-(603, 5, 'cada', 'es', '2026-02-03', '2026-02-03', 1),
-(604, 5, 'vez', 'es', '2026-02-03', '2026-02-03', 1),
-(605, 5, 'alma', 'es', '2026-02-03', '2026-02-03', 1),
-(606, 5, 'zapata', 'en', '2026-02-03', '2026-02-03', 1),
-(607, 5, 'skill', 'en', '2026-02-03', '2026-02-03', 1),
-(608, 5, 'aardman', 'en', '2026-02-03', '2026-02-03', 1),
-(609, 5, 'armonía', 'es', '2026-02-03', '2026-02-03', 1),
-(610, 5, 'mental', 'es', '2026-02-03', '2026-02-03', 1),
-(611, 5, 'mis', 'es', '2026-02-03', '2026-02-03', 1),
-(612, 5, 'estrellas', 'es', '2026-02-03', '2026-02-03', 1),
-(613, 5, 'मंत्रालय', 'hi', '2026-02-03', '2026-02-03', 1),
-(614, 5, 'परेशान', 'hi', '2026-02-03', '2026-02-03', 1),
-(615, 5, 'रहेग', 'hi', '2026-02-03', '2026-02-03', 1),
-(616, 5, 'era', 'es', '2026-02-03', '2026-02-03', 1),
-(617, 5, 'mar', 'es', '2026-02-03', '2026-02-03', 1),
-(618, 5, 'adamant', 'en', '2026-02-03', '2026-02-03', 1),
-(619, 5, 'that', 'en', '2026-02-03', '2026-02-03', 1),
-(620, 5, 'have', 'en', '2026-02-03', '2026-02-03', 1),
-(621, 5, 'any', 'en', '2026-02-03', '2026-02-03', 1),
-(622, 5, 'antisocial', 'en', '2026-02-03', '2026-02-03', 1),
-(623, 5, 'our', 'en', '2026-02-03', '2026-02-03', 1),
-(624, 5, 'data', 'en', '2026-02-03', '2026-02-03', 1),
-(625, 5, 'did', 'en', '2026-02-03', '2026-02-03', 1),
-(626, 5, 'भारतीय', 'hi', '2026-02-03', '2026-02-03', 1),
-(627, 5, 'रेलव', 'hi', '2026-02-03', '2026-02-03', 1),
-(628, 5, 'पाटील', 'hi', '2026-02-03', '2026-02-03', 1),
-(629, 5, 'haréis', 'es', '2026-02-03', '2026-02-03', 1),
-(630, 5, 'eso', 'es', '2026-02-03', '2026-02-03', 1),
-(631, 5, 'verdad', 'es', '2026-02-03', '2026-02-03', 1),
-(632, 5, 'existen', 'es', '2026-02-03', '2026-02-03', 1),
-(633, 5, 'दिन', 'hi', '2026-02-03', '2026-02-03', 1),
-(634, 5, 'पहल', 'hi', '2026-02-03', '2026-02-03', 1),
-(635, 5, 'spent', 'en', '2026-02-03', '2026-02-03', 1),
-(636, 5, 'with', 'en', '2026-02-03', '2026-02-03', 1),
-(637, 5, 'existing', 'en', '2026-02-03', '2026-02-03', 1),
-(638, 5, 'think', 'en', '2026-02-03', '2026-02-03', 1),
-(639, 5, 'buildings', 'en', '2026-02-03', '2026-02-03', 1),
-(640, 5, 'school', 'en', '2026-02-03', '2026-02-03', 1),
-(641, 5, 'उसक', 'hi', '2026-02-03', '2026-02-03', 1),
-(642, 5, 'gossip', 'en', '2026-02-03', '2026-02-03', 1),
-(643, 5, 'lose', 'en', '2026-02-03', '2026-02-03', 1),
-(644, 5, 'understood', 'en', '2026-02-03', '2026-02-03', 1),
-(645, 5, 'donde', 'es', '2026-02-03', '2026-02-03', 1),
-(646, 5, 'साउंड', 'hi', '2026-02-03', '2026-02-03', 1),
-(647, 5, 'difference', 'en', '2026-02-03', '2026-02-03', 1),
-(648, 5, 'जैस', 'hi', '2026-02-03', '2026-02-03', 1),
-(649, 5, 'gasol', 'en', '2026-02-03', '2026-02-03', 1),
-(650, 5, 'कैस', 'hi', '2026-02-03', '2026-02-03', 1),
-(651, 5, 'casi', 'es', '2026-02-03', '2026-02-03', 1),
-(652, 5, 'anexo', 'es', '2026-02-03', '2026-02-03', 1),
-(653, 5, 'next', 'en', '2026-02-03', '2026-02-03', 1),
-(654, 5, 'नेक्स्ट', 'hi', '2026-02-03', '2026-02-03', 1),
-(655, 5, 'suerte', 'es', '2026-02-03', '2026-02-03', 1),
-(656, 5, 'lessons', 'en', '2026-02-03', '2026-02-03', 1),
-(657, 5, 'begun', 'en', '2026-02-03', '2026-02-03', 1),
-(658, 5, 'पाई', 'hi', '2026-02-03', '2026-02-03', 1),
-(659, 5, 'देग', 'hi', '2026-02-03', '2026-02-03', 1),
-(660, 5, 'las', 'es', '2026-02-03', '2026-02-03', 1),
-(661, 5, 'ahí', 'es', '2026-02-03', '2026-02-03', 1),
-(662, 5, 'पुरान', 'hi', '2026-02-03', '2026-02-03', 1),
-(663, 5, 'छोड', 'hi', '2026-02-03', '2026-02-03', 1),
-(664, 5, 'said', 'en', '2026-02-03', '2026-02-03', 1),
-(665, 5, 'grew', 'en', '2026-02-03', '2026-02-03', 1),
-(666, 5, 'around', 'en', '2026-02-03', '2026-02-03', 1),
-(667, 5, 'human', 'en', '2026-02-03', '2026-02-03', 1),
-(668, 5, 'him', 'en', '2026-02-03', '2026-02-03', 1),
-(669, 5, 'learn', 'en', '2026-02-03', '2026-02-03', 1),
-(670, 5, 'understand', 'en', '2026-02-03', '2026-02-03', 1),
-(671, 5, 'cosa', 'es', '2026-02-03', '2026-02-03', 1),
-(672, 5, 'otro', 'es', '2026-02-03', '2026-02-03', 1),
-(673, 5, 'animal', 'es', '2026-02-03', '2026-02-03', 1),
-(674, 5, 'hubieran', 'es', '2026-02-03', '2026-02-03', 1),
-(675, 5, 'españa', 'es', '2026-02-03', '2026-02-03', 1),
-(676, 5, 'they', 'en', '2026-02-03', '2026-02-03', 1),
-(677, 5, 'see', 'en', '2026-02-03', '2026-02-03', 1),
-(678, 5, 'interesting', 'en', '2026-02-03', '2026-02-03', 1),
-(679, 5, 'सिंह', 'hi', '2026-02-03', '2026-02-03', 1),
-(680, 5, 'टेस्टिंग', 'hi', '2026-02-03', '2026-02-03', 1),
-(681, 5, 'नाड', 'hi', '2026-02-03', '2026-02-03', 1),
-(682, 5, 'examiner', 'en', '2026-02-03', '2026-02-03', 1),
-(683, 5, 'फिक्स', 'hi', '2026-02-03', '2026-02-03', 1),
-(684, 5, 'jupiter', 'en', '2026-02-03', '2026-02-03', 1),
-(685, 5, 'last', 'en', '2026-02-03', '2026-02-03', 1),
-(686, 5, 'more', 'en', '2026-02-03', '2026-02-03', 1),
-(687, 5, 'than', 'en', '2026-02-03', '2026-02-03', 1),
-(688, 5, 'six', 'en', '2026-02-03', '2026-02-03', 1),
-(689, 5, 'minutes', 'en', '2026-02-03', '2026-02-03', 1),
-(690, 5, 'mueren', 'es', '2026-02-03', '2026-02-03', 1),
-(691, 5, 'columnas', 'es', '2026-02-03', '2026-02-03', 1),
-(692, 5, 'panicking', 'en', '2026-02-03', '2026-02-03', 1),
-(693, 5, 'आसमान', 'hi', '2026-02-03', '2026-02-03', 1),
-(694, 5, 'सिकुड़न', 'hi', '2026-02-03', '2026-02-03', 1),
-(695, 5, 'वास्तविक', 'hi', '2026-02-03', '2026-02-03', 1),
-(696, 5, 'चंडीगढ', 'hi', '2026-02-03', '2026-02-03', 1),
-(697, 5, 'पुलिस', 'hi', '2026-02-03', '2026-02-03', 1),
-(698, 5, 'accent', 'en', '2026-02-03', '2026-02-03', 1),
-(699, 5, 'allowed', 'en', '2026-02-03', '2026-02-03', 1),
-(700, 5, 'picture', 'en', '2026-02-03', '2026-02-03', 1),
-(701, 5, 'excited', 'en', '2026-02-03', '2026-02-03', 1),
-(702, 5, 'there', 'en', '2026-02-03', '2026-02-03', 1),
-(703, 5, 'can', 'en', '2026-02-03', '2026-02-03', 1),
-(704, 5, 'make', 'en', '2026-02-03', '2026-02-03', 1),
-(705, 5, 'new', 'en', '2026-02-03', '2026-02-03', 1),
-(706, 5, 'years', 'en', '2026-02-03', '2026-02-03', 1),
-(707, 5, 'now', 'en', '2026-02-03', '2026-02-03', 1),
-(708, 5, 'हेल', 'hi', '2026-02-03', '2026-02-03', 1),
-(709, 5, 'दिल्ल', 'hi', '2026-02-03', '2026-02-03', 1),
-(710, 5, 'yeah', 'en', '2026-02-03', '2026-02-03', 1),
-(711, 5, 'head', 'en', '2026-02-03', '2026-02-03', 1),
-(712, 5, 'ahead', 'en', '2026-02-03', '2026-02-03', 1),
-(713, 5, 'talking', 'en', '2026-02-03', '2026-02-03', 1),
-(714, 5, 'about', 'en', '2026-02-03', '2026-02-03', 1),
-(715, 5, 'murió', 'es', '2026-02-03', '2026-02-03', 1),
-(716, 5, 'andersen', 'es', '2026-02-03', '2026-02-03', 1),
-(717, 5, 'morán', 'es', '2026-02-03', '2026-02-03', 1),
-(718, 5, 'फिर', 'hi', '2026-02-03', '2026-02-03', 1),
-(719, 5, 'काफ', 'hi', '2026-02-03', '2026-02-03', 1),
-(720, 5, 'दबाव', 'hi', '2026-02-03', '2026-02-03', 1),
-(721, 5, 'here', 'en', '2026-02-03', '2026-02-03', 1),
-(722, 5, 'दिय', 'hi', '2026-02-03', '2026-02-03', 1),
-(723, 5, 'quiñones', 'es', '2026-02-03', '2026-02-03', 1),
-(724, 5, 'them', 'en', '2026-02-03', '2026-02-03', 1),
-(725, 5, 'hurt', 'en', '2026-02-03', '2026-02-03', 1),
-(726, 5, 'barco', 'es', '2026-02-03', '2026-02-03', 1),
-(727, 5, 'taste', 'en', '2026-02-03', '2026-02-03', 1),
-(728, 5, 'eleven', 'en', '2026-02-03', '2026-02-03', 1),
-(729, 5, 'feel', 'en', '2026-02-03', '2026-02-03', 1),
-(730, 5, 'angry', 'en', '2026-02-03', '2026-02-03', 1),
-(731, 5, 'más', 'es', '2026-02-03', '2026-02-03', 1),
-(732, 5, 'करन', 'hi', '2026-02-03', '2026-02-03', 1),
-(733, 5, 'होग', 'hi', '2026-02-03', '2026-02-03', 1),
-(734, 5, 'need', 'en', '2026-02-03', '2026-02-03', 1),
-(735, 5, 'bañera', 'es', '2026-02-03', '2026-02-03', 1),
-(736, 5, 'बेईमान', 'hi', '2026-02-03', '2026-02-03', 1),
-(737, 5, 'wasn', 'en', '2026-02-03', '2026-02-03', 1),
-(738, 5, 'world', 'en', '2026-02-03', '2026-02-03', 1),
-(739, 5, 'four', 'en', '2026-02-03', '2026-02-03', 1),
-(740, 5, 'hundred', 'en', '2026-02-03', '2026-02-03', 1),
-(741, 5, 'never', 'en', '2026-02-03', '2026-02-03', 1),
-(742, 5, 'actually', 'en', '2026-02-03', '2026-02-03', 1),
-(743, 5, 'been', 'en', '2026-02-03', '2026-02-03', 1),
-(744, 5, 'close', 'en', '2026-02-03', '2026-02-03', 1),
-(745, 5, 'together', 'en', '2026-02-03', '2026-02-03', 1),
-(746, 5, 'made', 'en', '2026-02-03', '2026-02-03', 1),
-(747, 5, 'वंद', 'hi', '2026-02-03', '2026-02-03', 1),
-(748, 5, 'मातरम', 'hi', '2026-02-03', '2026-02-03', 1),
-(749, 5, 'popular', 'en', '2026-02-03', '2026-02-03', 1),
-(750, 5, 'noise', 'en', '2026-02-03', '2026-02-03', 1),
-(751, 5, 'रोहित', 'hi', '2026-02-03', '2026-02-03', 1),
-(752, 5, 'money', 'en', '2026-02-03', '2026-02-03', 1),
-(753, 5, 'recently', 'en', '2026-02-03', '2026-02-03', 1),
-(754, 5, 'didn', 'en', '2026-02-03', '2026-02-03', 1),
-(755, 5, 'इसम', 'hi', '2026-02-03', '2026-02-03', 1),
-(756, 5, 'mean', 'en', '2026-02-03', '2026-02-03', 1),
-(757, 5, 'who', 'en', '2026-02-03', '2026-02-03', 1),
-(758, 5, 'wouldn', 'en', '2026-02-03', '2026-02-03', 1),
-(759, 5, 'missing', 'en', '2026-02-03', '2026-02-03', 1),
-(760, 5, 'from', 'en', '2026-02-03', '2026-02-03', 1),
-(761, 5, 'retain', 'en', '2026-02-03', '2026-02-03', 1),
-(762, 5, 'noche', 'es', '2026-02-03', '2026-02-03', 1),
-(763, 5, 'género', 'es', '2026-02-03', '2026-02-03', 1),
-(764, 5, 'हुआ', 'hi', '2026-02-03', '2026-02-03', 1),
-(765, 5, 'आजकल', 'hi', '2026-02-03', '2026-02-03', 1),
-(766, 5, 'dare', 'en', '2026-02-03', '2026-02-03', 1),
-(767, 5, 'better', 'en', '2026-02-03', '2026-02-03', 1),
-(768, 5, 'mine', 'en', '2026-02-03', '2026-02-03', 1),
-(769, 5, 'let', 'en', '2026-02-03', '2026-02-03', 1),
-(770, 5, 'qué', 'es', '2026-02-03', '2026-02-03', 1),
-(771, 5, 'okay', 'en', '2026-02-03', '2026-02-03', 1),
-(772, 5, 'people', 'en', '2026-02-03', '2026-02-03', 1),
-(773, 5, 'रात', 'hi', '2026-02-03', '2026-02-03', 1),
-(774, 5, 'तीव्र', 'hi', '2026-02-03', '2026-02-03', 1),
-(775, 5, 'boy', 'en', '2026-02-03', '2026-02-03', 1),
-(776, 5, 'आजमगढ', 'hi', '2026-02-03', '2026-02-03', 1),
-(777, 5, 'libertad', 'es', '2026-02-03', '2026-02-03', 1),
-(778, 5, 'linda', 'en', '2026-02-03', '2026-02-03', 1),
-(779, 5, 'lovelace', 'en', '2026-02-03', '2026-02-03', 1),
-(780, 5, 'sort', 'en', '2026-02-03', '2026-02-03', 1),
-(781, 5, 'thing', 'en', '2026-02-03', '2026-02-03', 1),
-(782, 5, 'like', 'en', '2026-02-03', '2026-02-03', 1),
-(783, 5, 'निर्भर', 'hi', '2026-02-03', '2026-02-03', 1),
-(784, 5, 'main', 'en', '2026-02-03', '2026-02-03', 1),
-(785, 5, 'story', 'en', '2026-02-03', '2026-02-03', 1),
-(786, 5, 'बावन', 'hi', '2026-02-03', '2026-02-03', 1),
-(787, 5, 'unless', 'en', '2026-02-03', '2026-02-03', 1),
-(788, 5, 'pulling', 'en', '2026-02-03', '2026-02-03', 1),
-(789, 5, 'planet', 'en', '2026-02-03', '2026-02-03', 1),
-(790, 5, 'हिन', 'hi', '2026-02-03', '2026-02-03', 1),
-(791, 5, 'पायनियर', 'hi', '2026-02-03', '2026-02-03', 1),
-(792, 5, 'प्लैनेट', 'hi', '2026-02-03', '2026-02-03', 1),
-(793, 5, 'cedillo', 'en', '2026-02-03', '2026-02-03', 1),
-(794, 5, 'land', 'en', '2026-02-03', '2026-02-03', 1),
-(795, 5, 'future', 'en', '2026-02-03', '2026-02-03', 1),
-(796, 5, 'lower', 'en', '2026-02-03', '2026-02-03', 1),
-(797, 5, 'nineties', 'en', '2026-02-03', '2026-02-03', 1),
-(798, 5, 'farming', 'en', '2026-02-03', '2026-02-03', 1),
-(799, 5, 'dólares', 'es', '2026-02-03', '2026-02-03', 1),
-(800, 5, 'अभिनेत', 'hi', '2026-02-03', '2026-02-03', 1),
-(801, 5, 'अमित', 'hi', '2026-02-03', '2026-02-03', 1),
-(802, 5, 'habita', 'es', '2026-02-03', '2026-02-03', 1),
-(803, 5, 'ended', 'en', '2026-02-03', '2026-02-03', 1),
-(804, 5, 'much', 'en', '2026-02-03', '2026-02-03', 1),
-(805, 5, 'damage', 'en', '2026-02-03', '2026-02-03', 1),
-(806, 5, 'इंडिय', 'hi', '2026-02-03', '2026-02-03', 1),
-(807, 5, 'इंडियन', 'hi', '2026-02-03', '2026-02-03', 1),
-(808, 5, 'injuries', 'en', '2026-02-03', '2026-02-03', 1),
-(809, 5, 'उन्होंन', 'hi', '2026-02-03', '2026-02-03', 1),
-(810, 5, 'इंश्योरेंस', 'hi', '2026-02-03', '2026-02-03', 1),
-(811, 5, 'centro', 'es', '2026-02-03', '2026-02-03', 1),
-(812, 5, 'cádiz', 'es', '2026-02-03', '2026-02-03', 1),
-(813, 5, 'children', 'en', '2026-02-03', '2026-02-03', 1),
-(814, 5, 'acting', 'en', '2026-02-03', '2026-02-03', 1),
-(815, 5, 'deposited', 'en', '2026-02-03', '2026-02-03', 1),
-(816, 5, 'hay', 'es', '2026-02-03', '2026-02-03', 1),
-(817, 5, 'nice', 'en', '2026-02-03', '2026-02-03', 1),
-(818, 5, 'group', 'en', '2026-02-03', '2026-02-03', 1),
-(819, 5, 'not', 'en', '2026-02-03', '2026-02-03', 1),
-(820, 5, 'रूप', 'hi', '2026-02-03', '2026-02-03', 1),
-(821, 5, 'mováis', 'es', '2026-02-03', '2026-02-03', 1),
-(822, 5, 'rocola', 'es', '2026-02-03', '2026-02-03', 1),
-(823, 6, 'world', 'en', '2026-02-03', '2026-02-03', 1),
-(824, 6, 'testing', 'en', '2026-02-03', '2026-02-03', 1),
-(825, 6, 'images', 'en', '2026-02-03', '2026-02-03', 1),
-(826, 6, 'quick', 'en', '2026-02-03', '2026-02-03', 1),
-(827, 6, 'country', 'en', '2026-02-03', '2026-02-03', 1),
-(828, 6, 'oferta', 'es', '2026-02-03', '2026-02-03', 1),
-(829, 6, 'este', 'es', '2026-02-03', '2026-02-03', 1),
-(830, 6, 'mangueras', 'es', '2026-02-03', '2026-02-03', 1),
-(831, 6, 'así', 'es', '2026-02-03', '2026-02-03', 1),
-(832, 6, 'that', 'en', '2026-02-03', '2026-02-03', 1),
-(833, 6, 'new', 'en', '2026-02-03', '2026-02-03', 1),
-(834, 6, 'this', 'en', '2026-02-03', '2026-02-03', 1),
-(835, 6, 'get', 'en', '2026-02-03', '2026-02-03', 1),
-(836, 6, 'hundred', 'en', '2026-02-03', '2026-02-03', 1),
-(837, 6, 'घटन', 'hi', '2026-02-03', '2026-02-03', 1),
-(838, 6, 'क्षेत्र', 'hi', '2026-02-03', '2026-02-03', 1),
-(839, 6, 'children', 'en', '2026-02-03', '2026-02-03', 1),
-(840, 6, 'choose', 'en', '2026-02-03', '2026-02-03', 1),
-(841, 6, 'bitch', 'en', '2026-02-03', '2026-02-03', 1),
-(842, 6, 'with', 'en', '2026-02-03', '2026-02-03', 1),
-(843, 6, 'much', 'en', '2026-02-03', '2026-02-03', 1),
-(844, 6, 'another', 'en', '2026-02-03', '2026-02-03', 1),
-(845, 6, 'know', 'en', '2026-02-03', '2026-02-03', 1),
-(846, 6, 'and', 'en', '2026-02-03', '2026-02-03', 1),
-(847, 6, 'eleven', 'en', '2026-02-03', '2026-02-03', 1),
-(848, 6, 'menos', 'es', '2026-02-03', '2026-02-03', 1),
-(849, 6, 'habana', 'es', '2026-02-03', '2026-02-03', 1),
-(850, 6, 'लगान', 'hi', '2026-02-03', '2026-02-03', 1),
-(851, 6, 'gareca', 'es', '2026-02-03', '2026-02-03', 1),
-(852, 6, 'rana', 'es', '2026-02-03', '2026-02-03', 1),
-(853, 6, 'gonna', 'en', '2026-02-03', '2026-02-03', 1),
-(854, 6, 'around', 'en', '2026-02-03', '2026-02-03', 1),
-(855, 6, 'alone', 'en', '2026-02-03', '2026-02-03', 1),
-(856, 6, 'name', 'en', '2026-02-03', '2026-02-03', 1),
-(857, 6, 'relationship', 'en', '2026-02-03', '2026-02-03', 1),
-(858, 6, 'have', 'en', '2026-02-03', '2026-02-03', 1),
-(859, 6, 'plans', 'en', '2026-02-03', '2026-02-03', 1),
-(860, 6, 'enseñar', 'es', '2026-02-03', '2026-02-03', 1),
-(861, 6, 'प्लांट', 'hi', '2026-02-03', '2026-02-03', 1),
-(862, 6, 'हनुमानगढ', 'hi', '2026-02-03', '2026-02-03', 1),
-(863, 6, 'not', 'en', '2026-02-03', '2026-02-03', 1),
-(864, 6, 'identity', 'en', '2026-02-03', '2026-02-03', 1),
-(865, 6, 'bit', 'en', '2026-02-03', '2026-02-03', 1),
-(866, 6, 'going', 'en', '2026-02-03', '2026-02-03', 1),
-(867, 6, 'bien', 'es', '2026-02-03', '2026-02-03', 1),
-(868, 6, 'vera', 'es', '2026-02-03', '2026-02-03', 1),
-(869, 6, 'ईवीएम', 'hi', '2026-02-03', '2026-02-03', 1),
-(870, 6, 'open', 'en', '2026-02-03', '2026-02-03', 1),
-(871, 6, 'digo', 'es', '2026-02-03', '2026-02-03', 1),
-(872, 6, 'que', 'es', '2026-02-03', '2026-02-03', 1),
-(873, 6, 'okay', 'en', '2026-02-03', '2026-02-03', 1),
-(874, 6, 'two', 'en', '2026-02-03', '2026-02-03', 1),
-(875, 6, 'million', 'en', '2026-02-03', '2026-02-03', 1),
-(876, 6, 'उनस', 'hi', '2026-02-03', '2026-02-03', 1),
-(877, 6, 'पहल', 'hi', '2026-02-03', '2026-02-03', 1),
-(878, 6, 'right', 'en', '2026-02-03', '2026-02-03', 1),
-(879, 6, 'never', 'en', '2026-02-03', '2026-02-03', 1),
-(880, 6, 'don', 'en', '2026-02-03', '2026-02-03', 1),
-(881, 6, 'juro', 'es', '2026-02-03', '2026-02-03', 1),
-(882, 6, 'guy', 'en', '2026-02-03', '2026-02-03', 1),
-(883, 6, 'who', 'en', '2026-02-03', '2026-02-03', 1),
-(884, 6, 'looks', 'en', '2026-02-03', '2026-02-03', 1),
-(885, 6, 'riley', 'en', '2026-02-03', '2026-02-03', 1),
-(886, 6, 'they', 'en', '2026-02-03', '2026-02-03', 1),
-(887, 6, 'नुकसान', 'hi', '2026-02-03', '2026-02-03', 1),
-(888, 6, 'झाल', 'hi', '2026-02-03', '2026-02-03', 1),
-(889, 6, 'taxes', 'en', '2026-02-03', '2026-02-03', 1),
-(890, 6, 'aló', 'es', '2026-02-03', '2026-02-03', 1),
-(891, 6, 'accept', 'es', '2026-02-03', '2026-02-03', 1),
-(892, 6, 'ocho', 'es', '2026-02-03', '2026-02-03', 1),
-(893, 6, 'muy', 'es', '2026-02-03', '2026-02-03', 1),
-(894, 6, 'instale', 'es', '2026-02-03', '2026-02-03', 1),
-(895, 6, 'google', 'es', '2026-02-03', '2026-02-03', 1),
-(896, 6, 'accept', 'en', '2026-02-03', '2026-02-03', 1),
-(897, 6, 'road', 'en', '2026-02-03', '2026-02-03', 1),
-(898, 6, 'actually', 'en', '2026-02-03', '2026-02-03', 1),
-(899, 6, 'pretty', 'en', '2026-02-03', '2026-02-03', 1),
-(900, 6, 'stunning', 'en', '2026-02-03', '2026-02-03', 1),
-(901, 6, 'google', 'en', '2026-02-03', '2026-02-03', 1),
-(902, 6, 'हेल', 'hi', '2026-02-03', '2026-02-03', 1),
-(903, 6, 'एक्सप्लोरर', 'hi', '2026-02-03', '2026-02-03', 1),
-(904, 6, 'हिंदुस्तान', 'hi', '2026-02-03', '2026-02-03', 1),
-(905, 6, 'गूगल', 'hi', '2026-02-03', '2026-02-03', 1),
-(906, 6, 'डिप्रेशन', 'hi', '2026-02-03', '2026-02-03', 1),
-(907, 6, 'फैसल', 'hi', '2026-02-03', '2026-02-03', 1),
-(908, 6, 'बेहतर', 'hi', '2026-02-03', '2026-02-03', 1),
-(909, 6, 'प्रत्येक', 'hi', '2026-02-03', '2026-02-03', 1),
-(910, 6, 'banda', 'es', '2026-02-03', '2026-02-03', 1),
-(911, 6, 'presencia', 'es', '2026-02-03', '2026-02-03', 1),
-(912, 6, 'verter', 'es', '2026-02-03', '2026-02-03', 1),
-(913, 6, 'partido', 'es', '2026-02-03', '2026-02-03', 1),
-(914, 6, 'gobernante', 'es', '2026-02-03', '2026-02-03', 1),
-(915, 6, 'move', 'en', '2026-02-03', '2026-02-03', 1),
-(916, 6, 'military', 'en', '2026-02-03', '2026-02-03', 1),
-(917, 6, 'depression', 'en', '2026-02-03', '2026-02-03', 1),
-(918, 6, 'faced', 'en', '2026-02-03', '2026-02-03', 1),
-(919, 6, 'but', 'en', '2026-02-03', '2026-02-03', 1),
-(920, 6, 'their', 'en', '2026-02-03', '2026-02-03', 1),
-(921, 6, 'lives', 'en', '2026-02-03', '2026-02-03', 1),
-(922, 6, 'andar', 'es', '2026-02-03', '2026-02-03', 1),
-(923, 6, 'venden', 'es', '2026-02-03', '2026-02-03', 1),
-(924, 6, 'english', 'es', '2026-02-03', '2026-02-03', 1),
-(925, 6, 'अंदर', 'hi', '2026-02-03', '2026-02-03', 1),
-(926, 6, 'विदित', 'hi', '2026-02-03', '2026-02-03', 1),
-(927, 6, 'बिछिय', 'hi', '2026-02-03', '2026-02-03', 1),
-(928, 6, 'then', 'en', '2026-02-03', '2026-02-03', 1),
-(929, 6, 'game', 'en', '2026-02-03', '2026-02-03', 1),
-(930, 6, 'put', 'en', '2026-02-03', '2026-02-03', 1),
-(931, 6, 'piece', 'en', '2026-02-03', '2026-02-03', 1),
-(932, 6, 'make', 'en', '2026-02-03', '2026-02-03', 1),
-(933, 6, 'big', 'en', '2026-02-03', '2026-02-03', 1),
-(934, 6, 'lawyer', 'en', '2026-02-03', '2026-02-03', 1),
-(935, 6, 'your', 'en', '2026-02-03', '2026-02-03', 1),
-(936, 6, 'body', 'en', '2026-02-03', '2026-02-03', 1),
-(937, 6, 'veintiséis', 'es', '2026-02-03', '2026-02-03', 1),
-(938, 6, 'dolor', 'es', '2026-02-03', '2026-02-03', 1),
-(939, 6, 'menor', 'es', '2026-02-03', '2026-02-03', 1),
-(940, 6, 'nivel', 'es', '2026-02-03', '2026-02-03', 1),
-(941, 6, 'primario', 'es', '2026-02-03', '2026-02-03', 1),
-(942, 6, 'mugabe', 'en', '2026-02-03', '2026-02-03', 1),
-(943, 6, 'lot', 'en', '2026-02-03', '2026-02-03', 1),
-(944, 6, 'vida', 'es', '2026-02-03', '2026-02-03', 1),
-(945, 6, 'later', 'en', '2026-02-03', '2026-02-03', 1),
-(946, 6, 'been', 'en', '2026-02-03', '2026-02-03', 1),
-(947, 6, 'even', 'en', '2026-02-03', '2026-02-03', 1),
-(948, 6, 'today', 'en', '2026-02-03', '2026-02-03', 1),
-(949, 6, 'उन्होंन', 'hi', '2026-02-03', '2026-02-03', 1),
-(950, 6, 'year', 'en', '2026-02-03', '2026-02-03', 1),
-(951, 7, 'world', 'en', '2026-02-03', '2026-02-03', 1),
-(952, 7, 'testing', 'en', '2026-02-03', '2026-02-03', 1),
-(953, 7, 'उनक', 'hi', '2026-02-03', '2026-02-03', 1),
-(954, 7, 'पुलिस', 'hi', '2026-02-03', '2026-02-03', 1),
-(955, 7, 'oye', 'es', '2026-02-03', '2026-02-03', 1),
-(956, 7, 'yeah', 'en', '2026-02-03', '2026-02-03', 1),
-(957, 7, 'how', 'en', '2026-02-03', '2026-02-03', 1),
-(958, 7, 'could', 'en', '2026-02-03', '2026-02-03', 1),
-(959, 7, 'have', 'en', '2026-02-03', '2026-02-03', 1),
-(960, 7, 'good', 'en', '2026-02-03', '2026-02-03', 1),
-(961, 7, 'has', 'en', '2026-02-03', '2026-02-03', 1),
-(962, 7, 'खैर', 'hi', '2026-02-03', '2026-02-03', 1),
-(963, 7, 'way', 'en', '2026-02-03', '2026-02-03', 1),
-(964, 7, 'going', 'en', '2026-02-03', '2026-02-03', 1),
-(965, 7, 'televised', 'en', '2026-02-03', '2026-02-03', 1),
-(966, 7, 'बिल्कुल', 'hi', '2026-02-03', '2026-02-03', 1),
-(967, 7, 'सलाम', 'hi', '2026-02-03', '2026-02-03', 1),
-(968, 7, 'don', 'en', '2026-02-03', '2026-02-03', 1),
-(969, 7, 'really', 'en', '2026-02-03', '2026-02-03', 1),
-(970, 7, 'business', 'en', '2026-02-03', '2026-02-03', 1),
-(971, 7, 'lot', 'en', '2026-02-03', '2026-02-03', 1),
-(972, 7, 'eating', 'en', '2026-02-03', '2026-02-03', 1),
-(973, 7, 'these', 'en', '2026-02-03', '2026-02-03', 1),
-(974, 7, 'living', 'en', '2026-02-03', '2026-02-03', 1),
-(975, 7, 'didn', 'en', '2026-02-03', '2026-02-03', 1),
-(976, 7, 'love', 'en', '2026-02-03', '2026-02-03', 1),
-(977, 7, 'liability', 'en', '2026-02-03', '2026-02-03', 1),
-(978, 7, 'लाल', 'hi', '2026-02-03', '2026-02-03', 1),
-(979, 7, 'haré', 'es', '2026-02-03', '2026-02-03', 1),
-(980, 7, 'nube', 'es', '2026-02-03', '2026-02-03', 1),
-(981, 7, 'que', 'es', '2026-02-03', '2026-02-03', 1),
-(982, 7, 'más', 'es', '2026-02-03', '2026-02-03', 1),
-(983, 7, 'god', 'en', '2026-02-03', '2026-02-03', 1),
-(984, 7, 'asked', 'en', '2026-02-03', '2026-02-03', 1),
-(985, 7, 'and', 'en', '2026-02-03', '2026-02-03', 1),
-(986, 7, 'most', 'en', '2026-02-03', '2026-02-03', 1),
-(987, 7, 'likely', 'en', '2026-02-03', '2026-02-03', 1),
-(988, 7, 'pretty', 'en', '2026-02-03', '2026-02-03', 1),
-(989, 7, 'माट', 'hi', '2026-02-03', '2026-02-03', 1),
-(990, 7, 'सुप्रीम', 'hi', '2026-02-03', '2026-02-03', 1),
-(991, 7, 'daddy', 'en', '2026-02-03', '2026-02-03', 1),
-(992, 7, 'gotten', 'en', '2026-02-03', '2026-02-03', 1),
-(993, 7, 'hooked', 'en', '2026-02-03', '2026-02-03', 1),
-(994, 7, 'habló', 'es', '2026-02-03', '2026-02-03', 1),
-(995, 7, 'mal', 'es', '2026-02-03', '2026-02-03', 1),
-(996, 7, 'supremo', 'es', '2026-02-03', '2026-02-03', 1),
-(997, 7, 'algo', 'es', '2026-02-03', '2026-02-03', 1),
-(998, 7, 'unless', 'en', '2026-02-03', '2026-02-03', 1),
-(999, 7, 'उत्तर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1000, 5, 'tend', 'en', '2026-02-03', '2026-02-03', 1),
-(1001, 5, 'even', 'en', '2026-02-03', '2026-02-03', 1),
-(1002, 5, 'extremely', 'en', '2026-02-03', '2026-02-03', 1),
-(1003, 5, 'flat', 'en', '2026-02-03', '2026-02-03', 1),
-(1004, 5, 'this', 'en', '2026-02-03', '2026-02-03', 1),
-(1005, 5, 'isn', 'en', '2026-02-03', '2026-02-03', 1),
-(1006, 5, 'लिय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1007, 5, 'dio', 'es', '2026-02-03', '2026-02-03', 1),
-(1008, 5, 'golpe', 'es', '2026-02-03', '2026-02-03', 1),
-(1009, 5, 'clear', 'es', '2026-02-03', '2026-02-03', 1),
-(1010, 5, 'barcelona', 'es', '2026-02-03', '2026-02-03', 1),
-(1011, 5, 'donaire', 'es', '2026-02-03', '2026-02-03', 1),
-(1012, 5, 'अंतिम', 'hi', '2026-02-03', '2026-02-03', 1),
-(1013, 5, 'वॉन्ट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1014, 5, 'एयर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1015, 5, 'मार्शल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1016, 5, 'होन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1017, 5, 'देन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1018, 5, 'these', 'en', '2026-02-03', '2026-02-03', 1),
-(1019, 5, 'come', 'en', '2026-02-03', '2026-02-03', 1),
-(1020, 5, 'won', 'en', '2026-02-03', '2026-02-03', 1),
-(1021, 5, 'clear', 'en', '2026-02-03', '2026-02-03', 1),
-(1022, 5, 'batasuna', 'en', '2026-02-03', '2026-02-03', 1),
-(1023, 5, 'putting', 'en', '2026-02-03', '2026-02-03', 1),
-(1024, 5, 'पड़ेग', 'hi', '2026-02-03', '2026-02-03', 1),
-(1025, 5, 'already', 'en', '2026-02-03', '2026-02-03', 1),
-(1026, 5, 'read', 'en', '2026-02-03', '2026-02-03', 1),
-(1027, 5, 'बनाई', 'hi', '2026-02-03', '2026-02-03', 1),
-(1028, 5, 'हुई', 'hi', '2026-02-03', '2026-02-03', 1),
-(1029, 5, 'why', 'en', '2026-02-03', '2026-02-03', 1),
-(1030, 5, 'could', 'en', '2026-02-03', '2026-02-03', 1),
-(1031, 5, 'hot', 'en', '2026-02-03', '2026-02-03', 1),
-(1032, 5, 'enough', 'en', '2026-02-03', '2026-02-03', 1),
-(1033, 5, 'mark', 'en', '2026-02-03', '2026-02-03', 1),
-(1034, 5, 'discount', 'en', '2026-02-03', '2026-02-03', 1),
-(1035, 5, 'hurry', 'en', '2026-02-03', '2026-02-03', 1),
-(1036, 5, 'área', 'es', '2026-02-03', '2026-02-03', 1),
-(1037, 5, 'राम', 'hi', '2026-02-03', '2026-02-03', 1),
-(1038, 5, 'men', 'en', '2026-02-03', '2026-02-03', 1),
-(1039, 5, 'मेर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1040, 5, 'नाम', 'hi', '2026-02-03', '2026-02-03', 1),
-(1041, 5, 'सोहिन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1042, 5, 'nada', 'es', '2026-02-03', '2026-02-03', 1),
-(1043, 5, 'sony', 'es', '2026-02-03', '2026-02-03', 1),
-(1044, 5, 'alex', 'en', '2026-02-03', '2026-02-03', 1),
-(1045, 5, 'उनक', 'hi', '2026-02-03', '2026-02-03', 1),
-(1046, 5, 'ocupan', 'es', '2026-02-03', '2026-02-03', 1),
-(1047, 5, 'तुकोगंज', 'hi', '2026-02-03', '2026-02-03', 1),
-(1048, 5, 'met', 'en', '2026-02-03', '2026-02-03', 1),
-(1049, 5, 'his', 'en', '2026-02-03', '2026-02-03', 1),
-(1050, 5, 'honey', 'en', '2026-02-03', '2026-02-03', 1),
-(1051, 5, 'metodologías', 'es', '2026-02-03', '2026-02-03', 1),
-(1052, 5, 'hermione', 'en', '2026-02-03', '2026-02-03', 1),
-(1053, 5, 'स्थानीय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1054, 5, 'either', 'en', '2026-02-03', '2026-02-03', 1),
-(1055, 5, 'para', 'es', '2026-02-03', '2026-02-03', 1),
-(1056, 5, 'बराबर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1057, 5, 'escaramuza', 'es', '2026-02-03', '2026-02-03', 1),
-(1058, 5, 'entró', 'es', '2026-02-03', '2026-02-03', 1),
-(1059, 5, 'just', 'en', '2026-02-03', '2026-02-03', 1),
-(1060, 5, 'got', 'en', '2026-02-03', '2026-02-03', 1),
-(1061, 5, 'कारण', 'hi', '2026-02-03', '2026-02-03', 1),
-(1062, 5, 'क्राइम', 'hi', '2026-02-03', '2026-02-03', 1),
-(1063, 5, 'फ्र', 'hi', '2026-02-03', '2026-02-03', 1),
-(1064, 5, 'हेल्पलाइन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1065, 5, 'aunque', 'es', '2026-02-03', '2026-02-03', 1),
-(1066, 5, 'माहित', 'hi', '2026-02-03', '2026-02-03', 1),
-(1067, 5, 'दिल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1068, 5, 'इराक', 'hi', '2026-02-03', '2026-02-03', 1),
-(1069, 5, 'विराट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1070, 5, 'legal', 'en', '2026-02-03', '2026-02-03', 1),
-(1071, 5, 'sit', 'en', '2026-02-03', '2026-02-03', 1),
-(1072, 5, 'out', 'en', '2026-02-03', '2026-02-03', 1),
-(1073, 5, 'might', 'en', '2026-02-03', '2026-02-03', 1),
-(1074, 5, 'irá', 'es', '2026-02-03', '2026-02-03', 1),
-(1075, 5, 'libro', 'es', '2026-02-03', '2026-02-03', 1),
-(1076, 5, 'andros', 'es', '2026-02-03', '2026-02-03', 1),
-(1077, 5, 'senador', 'es', '2026-02-03', '2026-02-03', 1),
-(1078, 5, 'email', 'es', '2026-02-03', '2026-02-03', 1),
-(1079, 5, 'admeto', 'es', '2026-02-03', '2026-02-03', 1),
-(1080, 5, 'पायलट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1081, 5, 'तोड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1082, 5, 'logic', 'en', '2026-02-03', '2026-02-03', 1),
-(1083, 5, 'अपन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1084, 5, 'sus', 'es', '2026-02-03', '2026-02-03', 1),
-(1085, 5, 'versos', 'es', '2026-02-03', '2026-02-03', 1),
-(1086, 5, 'stop', 'en', '2026-02-03', '2026-02-03', 1),
-(1087, 5, 'nine', 'en', '2026-02-03', '2026-02-03', 1),
-(1088, 5, 'axilares', 'es', '2026-02-03', '2026-02-03', 1),
-(1089, 5, 'ganar', 'es', '2026-02-03', '2026-02-03', 1),
-(1090, 5, 'china', 'es', '2026-02-03', '2026-02-03', 1),
-(1091, 5, 'fanatical', 'en', '2026-02-03', '2026-02-03', 1),
-(1092, 5, 'nicotine', 'en', '2026-02-03', '2026-02-03', 1),
-(1093, 5, 'खेल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1094, 5, 'other', 'en', '2026-02-03', '2026-02-03', 1),
-(1095, 5, 'देख', 'hi', '2026-02-03', '2026-02-03', 1),
-(1096, 5, 'today', 'en', '2026-02-03', '2026-02-03', 1),
-(1097, 5, 'adecuado', 'es', '2026-02-03', '2026-02-03', 1),
-(1098, 5, 'पूर्व', 'hi', '2026-02-03', '2026-02-03', 1),
-(1099, 5, 'rather', 'en', '2026-02-03', '2026-02-03', 1),
-(1100, 5, 'gosh', 'en', '2026-02-03', '2026-02-03', 1),
-(1101, 5, 'ऑफलाइन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1102, 5, 'mama', 'en', '2026-02-03', '2026-02-03', 1),
-(1103, 5, 'list', 'en', '2026-02-03', '2026-02-03', 1),
-(1104, 5, 'audition', 'en', '2026-02-03', '2026-02-03', 1),
-(1105, 5, 'bummer', 'en', '2026-02-03', '2026-02-03', 1),
-(1106, 5, 'baba', 'es', '2026-02-03', '2026-02-03', 1),
-(1107, 5, 'males', 'es', '2026-02-03', '2026-02-03', 1),
-(1108, 5, 'falleció', 'es', '2026-02-03', '2026-02-03', 1),
-(1109, 5, 'वाल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1110, 5, 'साजिशन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1111, 5, 'aeronaves', 'es', '2026-02-03', '2026-02-03', 1),
-(1112, 5, 'holguín', 'es', '2026-02-03', '2026-02-03', 1),
-(1113, 5, 'इतन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1114, 5, 'lives', 'en', '2026-02-03', '2026-02-03', 1),
-(1115, 5, 'ana', 'es', '2026-02-03', '2026-02-03', 1),
-(1116, 5, 'maría', 'es', '2026-02-03', '2026-02-03', 1),
-(1117, 5, 'रहेंग', 'hi', '2026-02-03', '2026-02-03', 1),
-(1118, 5, 'पहुंच', 'hi', '2026-02-03', '2026-02-03', 1),
-(1119, 5, 'aquí', 'es', '2026-02-03', '2026-02-03', 1),
-(1120, 5, 'making', 'en', '2026-02-03', '2026-02-03', 1),
-(1121, 5, 'mailbox', 'en', '2026-02-03', '2026-02-03', 1),
-(1122, 5, 'हिंद', 'hi', '2026-02-03', '2026-02-03', 1),
-(1123, 5, 'बात', 'hi', '2026-02-03', '2026-02-03', 1),
-(1124, 5, 'column', 'en', '2026-02-03', '2026-02-03', 1),
-(1125, 5, 'como', 'es', '2026-02-03', '2026-02-03', 1),
-(1126, 5, 'magia', 'es', '2026-02-03', '2026-02-03', 1),
-(1127, 5, 'कौम', 'hi', '2026-02-03', '2026-02-03', 1),
-(1128, 5, 'समस्य', 'hi', '2026-02-03', '2026-02-03', 1),
-(1129, 5, 'those', 'en', '2026-02-03', '2026-02-03', 1),
-(1130, 5, 'llama', 'en', '2026-02-03', '2026-02-03', 1),
-(1131, 5, 'पीरियड्स', 'hi', '2026-02-03', '2026-02-03', 1),
-(1132, 5, 'मतल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1133, 5, 'water', 'es', '2026-02-03', '2026-02-03', 1),
-(1134, 5, 'मुर्ग', 'hi', '2026-02-03', '2026-02-03', 1),
-(1135, 5, 'किय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1136, 5, 'name', 'en', '2026-02-03', '2026-02-03', 1),
-(1137, 5, 'union', 'en', '2026-02-03', '2026-02-03', 1),
-(1138, 5, 'महीन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1139, 5, 'mhm', 'es', '2026-02-03', '2026-02-03', 1),
-(1140, 5, 'genera', 'es', '2026-02-03', '2026-02-03', 1),
-(1141, 5, 'voy', 'es', '2026-02-03', '2026-02-03', 1),
-(1142, 5, 'look', 'en', '2026-02-03', '2026-02-03', 1),
-(1143, 5, 'लिखन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1144, 5, 'फ्यूचर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1145, 5, 'israeli', 'en', '2026-02-03', '2026-02-03', 1),
-(1146, 5, 'अंग्रेज', 'hi', '2026-02-03', '2026-02-03', 1),
-(1147, 5, 'करत', 'hi', '2026-02-03', '2026-02-03', 1),
-(1148, 5, 'trece', 'es', '2026-02-03', '2026-02-03', 1),
-(1149, 5, 'has', 'en', '2026-02-03', '2026-02-03', 1),
-(1150, 5, 'husband', 'en', '2026-02-03', '2026-02-03', 1),
-(1151, 5, 'wounded', 'en', '2026-02-03', '2026-02-03', 1),
-(1152, 5, 'when', 'en', '2026-02-03', '2026-02-03', 1),
-(1153, 5, 'jolly', 'en', '2026-02-03', '2026-02-03', 1),
-(1154, 5, 'वित्त', 'hi', '2026-02-03', '2026-02-03', 1),
-(1155, 5, 'झाल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1156, 5, 'नाह', 'hi', '2026-02-03', '2026-02-03', 1),
-(1157, 5, 'अंकल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1158, 5, 'love', 'en', '2026-02-03', '2026-02-03', 1),
-(1159, 5, 'security', 'en', '2026-02-03', '2026-02-03', 1),
-(1160, 5, 'guard', 'en', '2026-02-03', '2026-02-03', 1),
-(1161, 5, 'सिक्योरिट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1162, 5, 'गार्ड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1163, 5, 'hambre', 'es', '2026-02-03', '2026-02-03', 1),
-(1164, 5, 'quiere', 'es', '2026-02-03', '2026-02-03', 1),
-(1165, 5, 'gálvez', 'es', '2026-02-03', '2026-02-03', 1),
-(1166, 5, 'orgánico', 'es', '2026-02-03', '2026-02-03', 1),
-(1167, 5, 'británico', 'es', '2026-02-03', '2026-02-03', 1),
-(1168, 5, 'डोंगरगढ', 'hi', '2026-02-03', '2026-02-03', 1),
-(1169, 5, 'wonder', 'en', '2026-02-03', '2026-02-03', 1),
-(1170, 5, 'for', 'en', '2026-02-03', '2026-02-03', 1),
-(1171, 5, 'उन्ह', 'hi', '2026-02-03', '2026-02-03', 1),
-(1172, 5, 'lol', 'en', '2026-02-03', '2026-02-03', 1),
-(1173, 5, 'brought', 'en', '2026-02-03', '2026-02-03', 1),
-(1174, 5, 'everything', 'en', '2026-02-03', '2026-02-03', 1),
-(1175, 5, 'eighteen', 'en', '2026-02-03', '2026-02-03', 1),
-(1176, 5, 'gothic', 'en', '2026-02-03', '2026-02-03', 1),
-(1177, 5, 'कहत', 'hi', '2026-02-03', '2026-02-03', 1),
-(1178, 5, 'स्वय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1179, 5, 'रिक्वेस्ट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1180, 5, 'soy', 'es', '2026-02-03', '2026-02-03', 1),
-(1181, 5, 'jericó', 'es', '2026-02-03', '2026-02-03', 1),
-(1182, 5, 'del', 'es', '2026-02-03', '2026-02-03', 1),
-(1183, 5, 'sur', 'es', '2026-02-03', '2026-02-03', 1),
-(1184, 5, 'within', 'en', '2026-02-03', '2026-02-03', 1),
-(1185, 5, 'three', 'en', '2026-02-03', '2026-02-03', 1),
-(1186, 5, 'months', 'en', '2026-02-03', '2026-02-03', 1),
-(1187, 5, 'including', 'en', '2026-02-03', '2026-02-03', 1),
-(1188, 5, 'undergo', 'en', '2026-02-03', '2026-02-03', 1),
-(1189, 5, 'rockefeller', 'en', '2026-02-03', '2026-02-03', 1),
-(1190, 5, 'plaza', 'en', '2026-02-03', '2026-02-03', 1),
-(1191, 5, 'bueno', 'es', '2026-02-03', '2026-02-03', 1),
-(1192, 5, 'critican', 'es', '2026-02-03', '2026-02-03', 1),
-(1193, 5, 'largaba', 'es', '2026-02-03', '2026-02-03', 1),
-(1194, 5, 'batata', 'es', '2026-02-03', '2026-02-03', 1),
-(1195, 5, 'मनुष्य', 'hi', '2026-02-03', '2026-02-03', 1),
-(1196, 5, 'घंट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1197, 5, 'घनघन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1198, 5, 'बतात', 'hi', '2026-02-03', '2026-02-03', 1),
-(1199, 5, 'चार', 'hi', '2026-02-03', '2026-02-03', 1),
-(1200, 5, 'विदेश', 'hi', '2026-02-03', '2026-02-03', 1),
-(1201, 5, 'बाद', 'hi', '2026-02-03', '2026-02-03', 1),
-(1202, 5, 'bachelor', 'en', '2026-02-03', '2026-02-03', 1),
-(1203, 5, 'attack', 'en', '2026-02-03', '2026-02-03', 1),
-(1204, 5, 'आलोक', 'hi', '2026-02-03', '2026-02-03', 1),
-(1205, 5, 'तोमर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1206, 5, 'sayal', 'es', '2026-02-03', '2026-02-03', 1),
-(1207, 5, 'mundo', 'es', '2026-02-03', '2026-02-03', 1),
-(1208, 5, 'रूस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1209, 5, 'शाल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1210, 5, 'समय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1211, 5, 'एल्यूमीनियम', 'hi', '2026-02-03', '2026-02-03', 1),
-(1212, 5, 'essentially', 'en', '2026-02-03', '2026-02-03', 1),
-(1213, 5, 'little', 'en', '2026-02-03', '2026-02-03', 1),
-(1214, 5, 'unemployment', 'en', '2026-02-03', '2026-02-03', 1),
-(1215, 5, 'certainly', 'en', '2026-02-03', '2026-02-03', 1),
-(1216, 5, 'sea', 'es', '2026-02-03', '2026-02-03', 1),
-(1217, 5, 'canadá', 'es', '2026-02-03', '2026-02-03', 1),
-(1218, 5, 'उत्तराखंड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1219, 5, 'आखिर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1220, 5, 'only', 'en', '2026-02-03', '2026-02-03', 1),
-(1221, 5, 'ones', 'en', '2026-02-03', '2026-02-03', 1),
-(1222, 5, 'लेकिन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1223, 5, 'wondering', 'en', '2026-02-03', '2026-02-03', 1),
-(1224, 5, 'रोल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1225, 5, 'कुछ', 'hi', '2026-02-03', '2026-02-03', 1),
-(1226, 5, 'una', 'es', '2026-02-03', '2026-02-03', 1),
-(1227, 5, 'explica', 'es', '2026-02-03', '2026-02-03', 1),
-(1228, 5, 'इसक', 'hi', '2026-02-03', '2026-02-03', 1),
-(1229, 5, 'अलाव', 'hi', '2026-02-03', '2026-02-03', 1),
-(1230, 5, 'नक्सल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1231, 5, 'unit', 'en', '2026-02-03', '2026-02-03', 1),
-(1232, 5, 'smoke', 'en', '2026-02-03', '2026-02-03', 1),
-(1233, 5, 'recording', 'en', '2026-02-03', '2026-02-03', 1),
-(1234, 5, 'प्रॉसेस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1235, 5, 'शुर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1236, 5, 'vicinity', 'en', '2026-02-03', '2026-02-03', 1),
-(1237, 5, 'projects', 'en', '2026-02-03', '2026-02-03', 1),
-(1238, 5, 'basically', 'en', '2026-02-03', '2026-02-03', 1),
-(1239, 5, 'implement', 'en', '2026-02-03', '2026-02-03', 1),
-(1240, 5, 'visita', 'es', '2026-02-03', '2026-02-03', 1),
-(1241, 5, 'obligó', 'es', '2026-02-03', '2026-02-03', 1),
-(1242, 5, 'implemente', 'es', '2026-02-03', '2026-02-03', 1),
-(1243, 5, 'while', 'en', '2026-02-03', '2026-02-03', 1),
-(1244, 5, 'stocks', 'en', '2026-02-03', '2026-02-03', 1),
-(1245, 5, 'आईआईट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1246, 5, 'स्पॉट्स', 'hi', '2026-02-03', '2026-02-03', 1),
-(1247, 5, 'stuff', 'en', '2026-02-03', '2026-02-03', 1),
-(1248, 5, 'खिलाड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1249, 5, 'ट्रेडिंग', 'hi', '2026-02-03', '2026-02-03', 1),
-(1250, 5, 'शुल्क', 'hi', '2026-02-03', '2026-02-03', 1),
-(1251, 5, 'परीक्षण', 'hi', '2026-02-03', '2026-02-03', 1),
-(1252, 5, 'libertarian', 'en', '2026-02-03', '2026-02-03', 1),
-(1253, 5, 'election', 'en', '2026-02-03', '2026-02-03', 1),
-(1254, 5, 'capability', 'en', '2026-02-03', '2026-02-03', 1),
-(1255, 5, 'wanted', 'en', '2026-02-03', '2026-02-03', 1),
-(1256, 5, 'green', 'en', '2026-02-03', '2026-02-03', 1),
-(1257, 5, 'vegetable', 'en', '2026-02-03', '2026-02-03', 1),
-(1258, 5, 'matter', 'en', '2026-02-03', '2026-02-03', 1),
-(1259, 5, 'creando', 'es', '2026-02-03', '2026-02-03', 1),
-(1260, 5, 'nuevos', 'es', '2026-02-03', '2026-02-03', 1),
-(1261, 5, 'diccionario', 'es', '2026-02-03', '2026-02-03', 1),
-(1262, 5, 'bribón', 'es', '2026-02-03', '2026-02-03', 1),
-(1263, 5, 'siento', 'es', '2026-02-03', '2026-02-03', 1),
-(1264, 5, 'pilas', 'es', '2026-02-03', '2026-02-03', 1),
-(1265, 5, 'iguales', 'es', '2026-02-03', '2026-02-03', 1),
-(1266, 5, 'fin', 'es', '2026-02-03', '2026-02-03', 1),
-(1267, 5, 'textualmente', 'es', '2026-02-03', '2026-02-03', 1),
-(1268, 5, 'करेंग', 'hi', '2026-02-03', '2026-02-03', 1),
-(1269, 5, 'खरीद', 'hi', '2026-02-03', '2026-02-03', 1),
-(1270, 5, 'अडूस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1271, 5, 'getting', 'en', '2026-02-03', '2026-02-03', 1),
-(1272, 5, 'zero', 'en', '2026-02-03', '2026-02-03', 1),
-(1273, 5, 'dijeron', 'es', '2026-02-03', '2026-02-03', 1),
-(1274, 5, 'जरूरत', 'hi', '2026-02-03', '2026-02-03', 1),
-(1275, 5, 'apartment', 'en', '2026-02-03', '2026-02-03', 1),
-(1276, 5, 'building', 'en', '2026-02-03', '2026-02-03', 1),
-(1277, 5, 'evidente', 'es', '2026-02-03', '2026-02-03', 1),
-(1278, 5, 'सार', 'hi', '2026-02-03', '2026-02-03', 1),
-(1279, 5, 'lil', 'en', '2026-02-03', '2026-02-03', 1),
-(1280, 5, 'kim', 'en', '2026-02-03', '2026-02-03', 1),
-(1281, 5, 'अधिकांश', 'hi', '2026-02-03', '2026-02-03', 1),
-(1282, 5, 'अरुण', 'hi', '2026-02-03', '2026-02-03', 1),
-(1283, 5, 'obviously', 'en', '2026-02-03', '2026-02-03', 1),
-(1284, 5, 'okay', 'es', '2026-02-03', '2026-02-03', 1),
-(1285, 5, 'फैसल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1286, 5, 'रहत', 'hi', '2026-02-03', '2026-02-03', 1),
-(1287, 5, 'address', 'en', '2026-02-03', '2026-02-03', 1),
-(1288, 5, 'estas', 'es', '2026-02-03', '2026-02-03', 1),
-(1289, 5, 'guess', 'en', '2026-02-03', '2026-02-03', 1),
-(1290, 5, 'empresa', 'es', '2026-02-03', '2026-02-03', 1),
-(1291, 5, 'learned', 'en', '2026-02-03', '2026-02-03', 1),
-(1292, 5, 'इंग्लैंड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1293, 5, 'सोचिए', 'hi', '2026-02-03', '2026-02-03', 1),
-(1294, 5, 'लगाय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1295, 5, 'right', 'en', '2026-02-03', '2026-02-03', 1),
-(1296, 5, 'además', 'es', '2026-02-03', '2026-02-03', 1),
-(1297, 5, 'then', 'en', '2026-02-03', '2026-02-03', 1),
-(1298, 5, 'también', 'es', '2026-02-03', '2026-02-03', 1),
-(1299, 5, 'रहन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1300, 5, 'area', 'en', '2026-02-03', '2026-02-03', 1),
-(1301, 5, 'फिल्म', 'hi', '2026-02-03', '2026-02-03', 1),
-(1302, 5, 'believe', 'en', '2026-02-03', '2026-02-03', 1),
-(1303, 5, 'ready', 'en', '2026-02-03', '2026-02-03', 1),
-(1304, 5, 'कमर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1305, 5, 'running', 'en', '2026-02-03', '2026-02-03', 1),
-(1306, 5, 'amazing', 'en', '2026-02-03', '2026-02-03', 1),
-(1307, 5, 'सुन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1308, 5, 'god', 'en', '2026-02-03', '2026-02-03', 1),
-(1309, 5, 'kidding', 'en', '2026-02-03', '2026-02-03', 1),
-(1310, 5, 'sir', 'en', '2026-02-03', '2026-02-03', 1),
-(1311, 5, 'यशवंत', 'hi', '2026-02-03', '2026-02-03', 1),
-(1312, 5, 'सिन्ह', 'hi', '2026-02-03', '2026-02-03', 1),
-(1313, 5, 'thirty', 'en', '2026-02-03', '2026-02-03', 1),
-(1314, 5, 'help', 'en', '2026-02-03', '2026-02-03', 1),
-(1315, 5, 'commend', 'en', '2026-02-03', '2026-02-03', 1),
-(1316, 5, 'पंहुच', 'hi', '2026-02-03', '2026-02-03', 1),
-(1317, 5, 'two', 'en', '2026-02-03', '2026-02-03', 1),
-(1318, 5, 'रोशन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1319, 5, 'blog', 'es', '2026-02-03', '2026-02-03', 1),
-(1320, 5, 'गुर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1321, 5, 'revenue', 'en', '2026-02-03', '2026-02-03', 1),
-(1322, 5, 'असलियत', 'hi', '2026-02-03', '2026-02-03', 1),
-(1323, 5, 'रुधिर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1324, 5, 'plan', 'en', '2026-02-03', '2026-02-03', 1),
-(1325, 5, 'cruz', 'es', '2026-02-03', '2026-02-03', 1),
-(1326, 5, 'बयान', 'hi', '2026-02-03', '2026-02-03', 1),
-(1327, 5, 'चाहत', 'hi', '2026-02-03', '2026-02-03', 1),
-(1328, 5, 'over', 'en', '2026-02-03', '2026-02-03', 1),
-(1329, 5, 'neighbors', 'en', '2026-02-03', '2026-02-03', 1),
-(1330, 5, 'awesome', 'en', '2026-02-03', '2026-02-03', 1),
-(1331, 5, 'así', 'es', '2026-02-03', '2026-02-03', 1),
-(1332, 5, 'मुसाफिर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1333, 5, 'बीबीस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1334, 5, 'लिंक', 'hi', '2026-02-03', '2026-02-03', 1),
-(1335, 5, 'gonna', 'en', '2026-02-03', '2026-02-03', 1),
-(1336, 5, 'मतलब', 'hi', '2026-02-03', '2026-02-03', 1),
-(1337, 5, 'facebook', 'en', '2026-02-03', '2026-02-03', 1),
-(1338, 5, 'अखबार', 'hi', '2026-02-03', '2026-02-03', 1),
-(1339, 5, 'मानन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1340, 5, 'mother', 'en', '2026-02-03', '2026-02-03', 1),
-(1341, 5, 'one', 'en', '2026-02-03', '2026-02-03', 1),
-(1342, 5, 'अनुमान', 'hi', '2026-02-03', '2026-02-03', 1),
-(1343, 5, 'also', 'en', '2026-02-03', '2026-02-03', 1),
-(1344, 5, 'गांधीज', 'hi', '2026-02-03', '2026-02-03', 1),
-(1345, 5, 'हाथ', 'hi', '2026-02-03', '2026-02-03', 1),
-(1346, 5, 'उठाकर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1347, 5, 'luz', 'es', '2026-02-03', '2026-02-03', 1),
-(1348, 5, 'diurna', 'es', '2026-02-03', '2026-02-03', 1),
-(1349, 5, 'their', 'en', '2026-02-03', '2026-02-03', 1),
-(1350, 5, 'community', 'en', '2026-02-03', '2026-02-03', 1),
-(1351, 5, 'निर्मल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1352, 5, 'सुंदर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1353, 5, 'शिकार', 'hi', '2026-02-03', '2026-02-03', 1),
-(1354, 5, 'well', 'en', '2026-02-03', '2026-02-03', 1),
-(1355, 5, 'दुख', 'hi', '2026-02-03', '2026-02-03', 1),
-(1356, 5, 'cool', 'en', '2026-02-03', '2026-02-03', 1),
-(1357, 5, 'बढ़िय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1358, 5, 'martín', 'es', '2026-02-03', '2026-02-03', 1),
-(1359, 5, 'iceland', 'en', '2026-02-03', '2026-02-03', 1),
-(1360, 5, 'आइसलैंड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1361, 5, 'माइकल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1362, 5, 'cause', 'en', '2026-02-03', '2026-02-03', 1),
-(1363, 5, 'गाय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1364, 5, 'संतुष्ट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1365, 5, 'where', 'en', '2026-02-03', '2026-02-03', 1),
-(1366, 5, 'guys', 'en', '2026-02-03', '2026-02-03', 1),
-(1367, 5, 'start', 'en', '2026-02-03', '2026-02-03', 1),
-(1368, 5, 'doing', 'en', '2026-02-03', '2026-02-03', 1),
-(1369, 5, 'liga', 'es', '2026-02-03', '2026-02-03', 1),
-(1370, 5, 'sánchez', 'es', '2026-02-03', '2026-02-03', 1),
-(1371, 5, 'hábito', 'es', '2026-02-03', '2026-02-03', 1),
-(1372, 5, 'lector', 'es', '2026-02-03', '2026-02-03', 1),
-(1373, 5, 'verla', 'es', '2026-02-03', '2026-02-03', 1),
-(1374, 5, 'वर्ल्डवाइड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1375, 5, 'बॉक्स', 'hi', '2026-02-03', '2026-02-03', 1),
-(1376, 5, 'डीमैट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1377, 5, 'अकाउंट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1378, 5, 'demon', 'en', '2026-02-03', '2026-02-03', 1),
-(1379, 5, 'legítima', 'es', '2026-02-03', '2026-02-03', 1),
-(1380, 5, 'compartir', 'es', '2026-02-03', '2026-02-03', 1),
-(1381, 5, 'ayuda', 'es', '2026-02-03', '2026-02-03', 1),
-(1382, 5, 'lick', 'en', '2026-02-03', '2026-02-03', 1),
-(1383, 5, 'veteran', 'en', '2026-02-03', '2026-02-03', 1),
-(1384, 5, 'वेल्ड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1385, 5, 'हिंदुस्तान', 'hi', '2026-02-03', '2026-02-03', 1),
-(1386, 5, 'pregnant', 'en', '2026-02-03', '2026-02-03', 1),
-(1387, 5, 'transcribe', 'en', '2026-02-03', '2026-02-03', 1),
-(1388, 5, 'all', 'en', '2026-02-03', '2026-02-03', 1),
-(1389, 5, 'clinton', 'en', '2026-02-03', '2026-02-03', 1),
-(1390, 5, 'river', 'en', '2026-02-03', '2026-02-03', 1),
-(1391, 5, 'internship', 'en', '2026-02-03', '2026-02-03', 1),
-(1392, 5, 'हिन्द', 'hi', '2026-02-03', '2026-02-03', 1),
-(1393, 5, 'मैच', 'hi', '2026-02-03', '2026-02-03', 1),
-(1394, 5, 'प्यास', 'hi', '2026-02-03', '2026-02-03', 1),
-(1395, 5, 'लौट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1396, 5, 'श्रीनगर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1397, 5, 'लडक', 'hi', '2026-02-03', '2026-02-03', 1),
-(1398, 5, 'रेड्ड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1399, 5, 'situación', 'es', '2026-02-03', '2026-02-03', 1),
-(1400, 5, 'uno', 'es', '2026-02-03', '2026-02-03', 1),
-(1401, 5, 'alarmante', 'es', '2026-02-03', '2026-02-03', 1),
-(1402, 5, 'matriz', 'es', '2026-02-03', '2026-02-03', 1),
-(1403, 5, 'aprehensión', 'es', '2026-02-03', '2026-02-03', 1),
-(1404, 5, 'nuevo', 'es', '2026-02-03', '2026-02-03', 1),
-(1405, 5, 'vale', 'es', '2026-02-03', '2026-02-03', 1),
-(1406, 5, 'primera', 'es', '2026-02-03', '2026-02-03', 1),
-(1407, 5, 'dama', 'es', '2026-02-03', '2026-02-03', 1),
-(1408, 5, 'diseño', 'es', '2026-02-03', '2026-02-03', 1),
-(1409, 5, 'भारत', 'hi', '2026-02-03', '2026-02-03', 1),
-(1410, 5, 'महान', 'hi', '2026-02-03', '2026-02-03', 1),
-(1411, 5, 'इंसान', 'hi', '2026-02-03', '2026-02-03', 1),
-(1412, 5, 'बहुत', 'hi', '2026-02-03', '2026-02-03', 1),
-(1413, 5, 'मार', 'hi', '2026-02-03', '2026-02-03', 1),
-(1414, 5, 'माहौल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1415, 5, 'बुलबुल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1416, 5, 'अनूप', 'hi', '2026-02-03', '2026-02-03', 1),
-(1417, 5, 'मिश्र', 'hi', '2026-02-03', '2026-02-03', 1),
-(1418, 5, 'argument', 'en', '2026-02-03', '2026-02-03', 1),
-(1419, 5, 'computer', 'en', '2026-02-03', '2026-02-03', 1),
-(1420, 5, 'english', 'en', '2026-02-03', '2026-02-03', 1),
-(1421, 5, 'tomorrow', 'en', '2026-02-03', '2026-02-03', 1),
-(1422, 5, 'reply', 'en', '2026-02-03', '2026-02-03', 1),
-(1423, 5, 'live', 'en', '2026-02-03', '2026-02-03', 1),
-(1424, 5, 'without', 'en', '2026-02-03', '2026-02-03', 1),
-(1425, 5, 'bomb', 'en', '2026-02-03', '2026-02-03', 1),
-(1426, 5, 'exploded', 'en', '2026-02-03', '2026-02-03', 1),
-(1427, 5, 'hands', 'en', '2026-02-03', '2026-02-03', 1),
-(1428, 5, 'handsome', 'en', '2026-02-03', '2026-02-03', 1),
-(1429, 5, 'edited', 'en', '2026-02-03', '2026-02-03', 1),
-(1430, 5, 'current', 'en', '2026-02-03', '2026-02-03', 1),
-(1431, 5, 'events', 'en', '2026-02-03', '2026-02-03', 1),
-(1432, 5, 'thought', 'en', '2026-02-03', '2026-02-03', 1),
-(1433, 5, 'hey', 'en', '2026-02-03', '2026-02-03', 1),
-(1434, 5, 'worked', 'en', '2026-02-03', '2026-02-03', 1),
-(1435, 5, 'whatever', 'en', '2026-02-03', '2026-02-03', 1),
-(1436, 5, 'happening', 'en', '2026-02-03', '2026-02-03', 1),
-(1437, 5, 'will', 'en', '2026-02-03', '2026-02-03', 1),
-(1438, 5, 'being', 'en', '2026-02-03', '2026-02-03', 1),
-(1439, 5, 'hold', 'en', '2026-02-03', '2026-02-03', 1),
-(1440, 5, 'ago', 'en', '2026-02-03', '2026-02-03', 1),
-(1441, 5, 'liberal', 'en', '2026-02-03', '2026-02-03', 1),
-(1442, 5, 'muslims', 'en', '2026-02-03', '2026-02-03', 1),
-(1443, 5, 'herbal', 'en', '2026-02-03', '2026-02-03', 1),
-(1444, 5, 'screen', 'en', '2026-02-03', '2026-02-03', 1),
-(1445, 5, 'generally', 'en', '2026-02-03', '2026-02-03', 1),
-(1446, 5, 'show', 'en', '2026-02-03', '2026-02-03', 1),
-(1447, 5, 'demoting', 'en', '2026-02-03', '2026-02-03', 1),
-(1448, 5, 'plants', 'en', '2026-02-03', '2026-02-03', 1),
-(1449, 5, 'voting', 'en', '2026-02-03', '2026-02-03', 1),
-(1450, 5, 'every', 'en', '2026-02-03', '2026-02-03', 1),
-(1451, 5, 'idiotic', 'en', '2026-02-03', '2026-02-03', 1),
-(1452, 5, 'transcript', 'en', '2026-02-03', '2026-02-03', 1),
-(1453, 5, 'sure', 'en', '2026-02-03', '2026-02-03', 1),
-(1454, 5, 'facing', 'en', '2026-02-03', '2026-02-03', 1),
-(1455, 5, 'second', 'en', '2026-02-03', '2026-02-03', 1),
-(1456, 5, 'article', 'en', '2026-02-03', '2026-02-03', 1),
-(1457, 5, 'having', 'en', '2026-02-03', '2026-02-03', 1),
-(1458, 5, 'problem', 'en', '2026-02-03', '2026-02-03', 1),
-(1459, 5, 'fixed', 'en', '2026-02-03', '2026-02-03', 1),
-(1460, 5, 'something', 'en', '2026-02-03', '2026-02-03', 1),
-(1461, 5, 'spanish', 'en', '2026-02-03', '2026-02-03', 1),
-(1462, 5, 'इसलिए', 'hi', '2026-02-03', '2026-02-03', 1),
-(1463, 5, 'अजीब', 'hi', '2026-02-03', '2026-02-03', 1),
-(1464, 5, 'आंस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1465, 5, 'मेट्र', 'hi', '2026-02-03', '2026-02-03', 1),
-(1466, 5, 'फार', 'hi', '2026-02-03', '2026-02-03', 1),
-(1467, 5, 'खबर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1468, 5, 'मॉडल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1469, 5, 'वर्ग', 'hi', '2026-02-03', '2026-02-03', 1),
-(1470, 5, 'एसआईट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1471, 5, 'अनिल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1472, 5, 'पाइपलाइन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1473, 5, 'भोजन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1474, 5, 'फ्लोटिंग', 'hi', '2026-02-03', '2026-02-03', 1),
-(1475, 5, 'कुसुम', 'hi', '2026-02-03', '2026-02-03', 1),
-(1476, 5, 'रीजन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1477, 5, 'अट्ठावन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1478, 5, 'मैन्युअल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1479, 5, 'इंस्टॉल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1480, 5, 'उतर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1481, 5, 'बॉस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1482, 5, 'निर्णय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1483, 5, 'लिमिटेड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1484, 5, 'अहम', 'hi', '2026-02-03', '2026-02-03', 1),
-(1485, 5, 'नोटिस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1486, 5, 'शुभ', 'hi', '2026-02-03', '2026-02-03', 1),
-(1487, 5, 'विनय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1488, 5, 'गोट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1489, 5, 'अनशन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1490, 5, 'हाउस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1491, 5, 'कोर्ट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1492, 5, 'कांग्रेस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1493, 5, 'सर्वथ', 'hi', '2026-02-03', '2026-02-03', 1),
-(1494, 5, 'उदय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1495, 5, 'कोटक', 'hi', '2026-02-03', '2026-02-03', 1),
-(1496, 5, 'एमेजॉन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1497, 5, 'एपिसोड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1498, 5, 'सबकुछ', 'hi', '2026-02-03', '2026-02-03', 1),
-(1499, 5, 'ओवर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1500, 5, 'जश्न', 'hi', '2026-02-03', '2026-02-03', 1),
-(1501, 5, 'क्योंक', 'hi', '2026-02-03', '2026-02-03', 1),
-(1502, 5, 'रिकॉर्ड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1503, 5, 'टूट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1504, 5, 'लिंक्स', 'hi', '2026-02-03', '2026-02-03', 1),
-(1505, 5, 'रखन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1506, 5, 'प्रैक्टिस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1507, 5, 'तस्वीर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1508, 5, 'कंपन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1509, 5, 'स्टिंग', 'hi', '2026-02-03', '2026-02-03', 1),
-(1510, 5, 'अंध', 'hi', '2026-02-03', '2026-02-03', 1),
-(1511, 5, 'जूस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1512, 5, 'प्रदेश', 'hi', '2026-02-03', '2026-02-03', 1),
-(1513, 5, 'वर्ष', 'hi', '2026-02-03', '2026-02-03', 1),
-(1514, 5, 'अरावल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1515, 5, 'किन्त', 'hi', '2026-02-03', '2026-02-03', 1),
-(1516, 5, 'अन्न', 'hi', '2026-02-03', '2026-02-03', 1),
-(1517, 5, 'यूक्रेन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1518, 5, 'इंप्लीमेंट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1519, 5, 'सिंध', 'hi', '2026-02-03', '2026-02-03', 1),
-(1520, 5, 'प्रांत', 'hi', '2026-02-03', '2026-02-03', 1),
-(1521, 5, 'ब्रिक्स', 'hi', '2026-02-03', '2026-02-03', 1),
-(1522, 5, 'नकल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1523, 5, 'अक्सर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1524, 5, 'ब्लड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1525, 5, 'दोन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1526, 5, 'स्वाम', 'hi', '2026-02-03', '2026-02-03', 1),
-(1527, 5, 'विधायक', 'hi', '2026-02-03', '2026-02-03', 1),
-(1528, 5, 'यूटर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1529, 5, 'इंच', 'hi', '2026-02-03', '2026-02-03', 1),
-(1530, 5, 'आपक', 'hi', '2026-02-03', '2026-02-03', 1),
-(1531, 5, 'सिर्फ', 'hi', '2026-02-03', '2026-02-03', 1),
-(1532, 5, 'रशिय', 'hi', '2026-02-03', '2026-02-03', 1),
-(1533, 5, 'सियास', 'hi', '2026-02-03', '2026-02-03', 1),
-(1534, 5, 'चुनौत', 'hi', '2026-02-03', '2026-02-03', 1),
-(1535, 5, 'आवाजाह', 'hi', '2026-02-03', '2026-02-03', 1),
-(1536, 5, 'ट्राई', 'hi', '2026-02-03', '2026-02-03', 1),
-(1537, 5, 'लीटर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1538, 5, 'विंस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1539, 5, 'वॉटर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1540, 5, 'जनपद', 'hi', '2026-02-03', '2026-02-03', 1),
-(1541, 5, 'प्रोजेक्ट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1542, 5, 'उच्च', 'hi', '2026-02-03', '2026-02-03', 1),
-(1543, 5, 'पदस्थ', 'hi', '2026-02-03', '2026-02-03', 1),
-(1544, 5, 'फ्रांस', 'hi', '2026-02-03', '2026-02-03', 1),
-(1545, 5, 'सिंगर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1546, 5, 'ट्रांसफर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1547, 5, 'संदर्भ', 'hi', '2026-02-03', '2026-02-03', 1),
-(1548, 5, 'वार्त', 'hi', '2026-02-03', '2026-02-03', 1),
-(1549, 5, 'अच्छ', 'hi', '2026-02-03', '2026-02-03', 1),
-(1550, 5, 'युव', 'hi', '2026-02-03', '2026-02-03', 1),
-(1551, 5, 'बुकिंग', 'hi', '2026-02-03', '2026-02-03', 1),
-(1552, 5, 'नायब', 'hi', '2026-02-03', '2026-02-03', 1),
-(1553, 5, 'सैन', 'hi', '2026-02-03', '2026-02-03', 1),
-(1554, 5, 'पिप्पलाद', 'hi', '2026-02-03', '2026-02-03', 1),
-(1555, 5, 'स्मॉल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1556, 5, 'थिंग्स', 'hi', '2026-02-03', '2026-02-03', 1),
-(1557, 5, 'एंड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1558, 5, 'पॉसिबल', 'hi', '2026-02-03', '2026-02-03', 1),
-(1559, 5, 'गठित', 'hi', '2026-02-03', '2026-02-03', 1),
-(1560, 5, 'किताब', 'hi', '2026-02-03', '2026-02-03', 1),
-(1561, 5, 'रिपोर्ट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1562, 5, 'पुष्ट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1563, 5, 'स्कोड', 'hi', '2026-02-03', '2026-02-03', 1),
-(1564, 5, 'खास', 'hi', '2026-02-03', '2026-02-03', 1),
-(1565, 5, 'लेटेस्ट', 'hi', '2026-02-03', '2026-02-03', 1),
-(1566, 5, 'धीम', 'hi', '2026-02-03', '2026-02-03', 1),
-(1567, 5, 'मिलकर', 'hi', '2026-02-03', '2026-02-03', 1),
-(1568, 5, 'tried', 'en', '2026-02-03', '2026-02-03', 1),
-(1569, 5, 'spot', 'en', '2026-02-03', '2026-02-03', 1),
-(1570, 5, 'once', 'en', '2026-02-03', '2026-02-03', 1),
-(1571, 5, 'working', 'en', '2026-02-03', '2026-02-03', 1),
-(1572, 5, 'say', 'en', '2026-02-03', '2026-02-03', 1),
-(1573, 5, 'despite', 'en', '2026-02-03', '2026-02-03', 1),
-(1574, 5, 'fish', 'en', '2026-02-03', '2026-02-03', 1),
-(1575, 5, 'speaking', 'en', '2026-02-03', '2026-02-03', 1),
-(1576, 5, 'again', 'en', '2026-02-03', '2026-02-03', 1),
-(1577, 5, 'seeing', 'en', '2026-02-03', '2026-02-03', 1),
-(1578, 5, 'speech', 'en', '2026-02-03', '2026-02-03', 1),
-(1579, 5, 'supported', 'en', '2026-02-03', '2026-02-03', 1),
-(1580, 5, 'yup', 'en', '2026-02-03', '2026-02-03', 1),
-(1581, 5, 'heard', 'en', '2026-02-03', '2026-02-03', 1),
-(1582, 5, 'dirt', 'en', '2026-02-03', '2026-02-03', 1),
-(1583, 5, 'some', 'en', '2026-02-03', '2026-02-03', 1),
-(1584, 5, 'oil', 'en', '2026-02-03', '2026-02-03', 1),
-(1585, 5, 'logo', 'en', '2026-02-03', '2026-02-03', 1),
-(1586, 5, 'learning', 'en', '2026-02-03', '2026-02-03', 1),
-(1587, 5, 'potter', 'en', '2026-02-03', '2026-02-03', 1),
-(1588, 5, 'add', 'en', '2026-02-03', '2026-02-03', 1),
-(1589, 5, 'click', 'en', '2026-02-03', '2026-02-03', 1),
-(1590, 5, 'ripped', 'en', '2026-02-03', '2026-02-03', 1),
-(1591, 5, 'hard', 'en', '2026-02-03', '2026-02-03', 1),
-(1592, 5, 'still', 'en', '2026-02-03', '2026-02-03', 1),
-(1593, 5, 'looking', 'en', '2026-02-03', '2026-02-03', 1),
-(1594, 5, 'seen', 'en', '2026-02-03', '2026-02-03', 1),
-(1595, 5, 'key', 'en', '2026-02-03', '2026-02-03', 1),
-(1596, 5, 'germany', 'en', '2026-02-03', '2026-02-03', 1),
-(1597, 5, 'feeling', 'en', '2026-02-03', '2026-02-03', 1),
-(1598, 5, 'else', 'en', '2026-02-03', '2026-02-03', 1),
-(1599, 5, 'try', 'en', '2026-02-03', '2026-02-03', 1),
-(1600, 5, 'changes', 'en', '2026-02-03', '2026-02-03', 1),
-(1601, 5, 'back', 'en', '2026-02-03', '2026-02-03', 1),
-(1602, 5, 'home', 'en', '2026-02-03', '2026-02-03', 1),
-(1603, 5, 'connect', 'en', '2026-02-03', '2026-02-03', 1),
-(1604, 5, 'nifty', 'en', '2026-02-03', '2026-02-03', 1),
-(1605, 5, 'higher', 'en', '2026-02-03', '2026-02-03', 1),
-(1606, 5, 'elo', 'en', '2026-02-03', '2026-02-03', 1),
-(1607, 5, 'though', 'en', '2026-02-03', '2026-02-03', 1),
-(1608, 5, 'done', 'en', '2026-02-03', '2026-02-03', 1),
-(1609, 5, 'does', 'en', '2026-02-03', '2026-02-03', 1),
-(1610, 5, 'stash', 'en', '2026-02-03', '2026-02-03', 1),
-(1611, 5, 'sad', 'en', '2026-02-03', '2026-02-03', 1),
-(1612, 5, 'predecessor', 'en', '2026-02-03', '2026-02-03', 1),
-(1613, 5, 'admit', 'en', '2026-02-03', '2026-02-03', 1),
-(1614, 5, 'rupees', 'en', '2026-02-03', '2026-02-03', 1),
-(1615, 5, 'stock', 'en', '2026-02-03', '2026-02-03', 1),
-(1616, 5, 'market', 'en', '2026-02-03', '2026-02-03', 1),
-(1617, 5, 'prior', 'en', '2026-02-03', '2026-02-03', 1),
-(1618, 5, 'knowledge', 'en', '2026-02-03', '2026-02-03', 1),
-(1619, 5, 'buffy', 'en', '2026-02-03', '2026-02-03', 1),
-(1620, 5, 'product', 'en', '2026-02-03', '2026-02-03', 1),
-(1621, 5, 'ando', 'en', '2026-02-03', '2026-02-03', 1),
-(1622, 5, 'mana', 'en', '2026-02-03', '2026-02-03', 1),
-(1623, 5, 'cushion', 'en', '2026-02-03', '2026-02-03', 1),
-(1624, 5, 'major', 'en', '2026-02-03', '2026-02-03', 1),
-(1625, 5, 'should', 'en', '2026-02-03', '2026-02-03', 1),
-(1626, 5, 'transcriber', 'en', '2026-02-03', '2026-02-03', 1),
-(1627, 5, 'project', 'en', '2026-02-03', '2026-02-03', 1),
-(1628, 5, 'health', 'en', '2026-02-03', '2026-02-03', 1),
-(1629, 5, 'had', 'en', '2026-02-03', '2026-02-03', 1),
-(1630, 5, 'fears', 'en', '2026-02-03', '2026-02-03', 1),
-(1631, 5, 'doctor', 'en', '2026-02-03', '2026-02-03', 1),
-(1632, 5, 'financial', 'en', '2026-02-03', '2026-02-03', 1),
-(1633, 5, 'proponent', 'en', '2026-02-03', '2026-02-03', 1),
-(1634, 5, 'anything', 'en', '2026-02-03', '2026-02-03', 1),
-(1635, 5, 'soul', 'en', '2026-02-03', '2026-02-03', 1),
-(1636, 5, 'dead', 'en', '2026-02-03', '2026-02-03', 1),
-(1637, 5, 'adding', 'en', '2026-02-03', '2026-02-03', 1),
-(1638, 5, 'extra', 'en', '2026-02-03', '2026-02-03', 1),
-(1639, 5, 'features', 'en', '2026-02-03', '2026-02-03', 1),
-(1640, 5, 'environment', 'en', '2026-02-03', '2026-02-03', 1),
-(1641, 5, 'pages', 'en', '2026-02-03', '2026-02-03', 1),
-(1642, 5, 'take', 'en', '2026-02-03', '2026-02-03', 1),
-(1643, 5, 'london', 'en', '2026-02-03', '2026-02-03', 1),
-(1644, 5, 'alright', 'en', '2026-02-03', '2026-02-03', 1),
-(1645, 5, 'guns', 'en', '2026-02-03', '2026-02-03', 1),
-(1646, 5, 'neither', 'en', '2026-02-03', '2026-02-03', 1),
-(1647, 5, 'issue', 'en', '2026-02-04', '2026-02-04', 1),
-(1648, 5, 'probably', 'en', '2026-02-04', '2026-02-04', 1),
-(1649, 5, 'man', 'en', '2026-02-04', '2026-02-04', 1),
-(1650, 5, 'fan', 'en', '2026-02-04', '2026-02-04', 1),
-(1651, 5, 'grassroots', 'en', '2026-02-04', '2026-02-04', 1),
-(1652, 5, 'grassy', 'en', '2026-02-04', '2026-02-04', 1),
-(1653, 5, 'lack', 'en', '2026-02-04', '2026-02-04', 1),
-(1654, 5, 'support', 'en', '2026-02-04', '2026-02-04', 1),
-(1655, 5, 'same', 'en', '2026-02-04', '2026-02-04', 1),
-(1656, 5, 'image', 'en', '2026-02-04', '2026-02-04', 1),
-(1657, 5, 'haven', 'en', '2026-02-04', '2026-02-04', 1),
-(1658, 5, 'declared', 'en', '2026-02-04', '2026-02-04', 1),
-(1659, 5, 'stable', 'en', '2026-02-04', '2026-02-04', 1),
-(1660, 5, 'emotional', 'en', '2026-02-04', '2026-02-04', 1),
-(1661, 5, 'arousal', 'en', '2026-02-04', '2026-02-04', 1),
-(1662, 5, 'office', 'en', '2026-02-04', '2026-02-04', 1),
-(1663, 5, 'dust', 'en', '2026-02-04', '2026-02-04', 1),
-(1664, 5, 'voters', 'en', '2026-02-04', '2026-02-04', 1),
-(1665, 5, 'information', 'en', '2026-02-04', '2026-02-04', 1),
-(1666, 5, 'luck', 'en', '2026-02-04', '2026-02-04', 1),
-(1667, 5, 'multiplicity', 'en', '2026-02-04', '2026-02-04', 1),
-(1668, 5, 'nearly', 'en', '2026-02-04', '2026-02-04', 1),
-(1669, 5, 'great', 'en', '2026-02-04', '2026-02-04', 1),
-(1670, 5, 'play', 'en', '2026-02-04', '2026-02-04', 1),
-(1671, 5, 'things', 'en', '2026-02-04', '2026-02-04', 1),
-(1672, 5, 'sooner', 'en', '2026-02-04', '2026-02-04', 1),
-(1673, 5, 'flu', 'en', '2026-02-04', '2026-02-04', 1),
-(1674, 5, 'everybody', 'en', '2026-02-04', '2026-02-04', 1),
-(1675, 5, 'novel', 'en', '2026-02-04', '2026-02-04', 1),
-(1676, 5, 'own', 'en', '2026-02-04', '2026-02-04', 1),
-(1677, 5, 'mistakes', 'en', '2026-02-04', '2026-02-04', 1),
-(1678, 5, 'voice', 'en', '2026-02-04', '2026-02-04', 1),
-(1679, 5, 'gets', 'en', '2026-02-04', '2026-02-04', 1),
-(1680, 5, 'refused', 'en', '2026-02-04', '2026-02-04', 1),
-(1681, 5, 'short', 'en', '2026-02-04', '2026-02-04', 1),
-(1682, 5, 'comedy', 'en', '2026-02-04', '2026-02-04', 1),
-(1683, 5, 'care', 'en', '2026-02-04', '2026-02-04', 1),
-(1684, 5, 'approach', 'en', '2026-02-04', '2026-02-04', 1),
-(1685, 5, 'malibu', 'en', '2026-02-04', '2026-02-04', 1),
-(1686, 5, 'inmates', 'en', '2026-02-04', '2026-02-04', 1),
-(1687, 5, 'year', 'en', '2026-02-04', '2026-02-04', 1),
-(1688, 5, 'due', 'en', '2026-02-04', '2026-02-04', 1),
-(1689, 5, 'yesterday', 'en', '2026-02-04', '2026-02-04', 1),
-(1690, 5, 'thinking', 'en', '2026-02-04', '2026-02-04', 1),
-(1691, 5, 'fire', 'en', '2026-02-04', '2026-02-04', 1),
-(1692, 5, 'onto', 'en', '2026-02-04', '2026-02-04', 1),
-(1693, 5, 'process', 'en', '2026-02-04', '2026-02-04', 1),
-(1694, 5, 'members', 'en', '2026-02-04', '2026-02-04', 1),
-(1695, 5, 'produce', 'en', '2026-02-04', '2026-02-04', 1),
-(1696, 5, 'standard', 'en', '2026-02-04', '2026-02-04', 1),
-(1697, 5, 'smoking', 'en', '2026-02-04', '2026-02-04', 1),
-(1698, 5, 'check', 'en', '2026-02-04', '2026-02-04', 1),
-(1699, 5, 'bills', 'en', '2026-02-04', '2026-02-04', 1),
-(1700, 5, 'message', 'en', '2026-02-04', '2026-02-04', 1),
-(1701, 5, 'unmet', 'en', '2026-02-04', '2026-02-04', 1),
-(1702, 5, 'comes', 'en', '2026-02-04', '2026-02-04', 1),
-(1703, 5, 'practice', 'en', '2026-02-04', '2026-02-04', 1),
-(1704, 5, 'best', 'en', '2026-02-04', '2026-02-04', 1),
-(1705, 5, 'obvious', 'en', '2026-02-04', '2026-02-04', 1),
-(1706, 5, 'aren', 'en', '2026-02-04', '2026-02-04', 1),
-(1707, 5, 'update', 'en', '2026-02-04', '2026-02-04', 1),
-(1708, 5, 'independent', 'en', '2026-02-04', '2026-02-04', 1),
-(1709, 5, 'off', 'en', '2026-02-04', '2026-02-04', 1),
-(1710, 5, 'pub', 'en', '2026-02-04', '2026-02-04', 1),
-(1711, 5, 'recent', 'en', '2026-02-04', '2026-02-04', 1),
-(1712, 5, 'democrats', 'en', '2026-02-04', '2026-02-04', 1),
-(1713, 5, 'economic', 'en', '2026-02-04', '2026-02-04', 1),
-(1714, 5, 'remember', 'en', '2026-02-04', '2026-02-04', 1),
-(1715, 5, 'trap', 'en', '2026-02-04', '2026-02-04', 1),
-(1716, 5, 'recruited', 'en', '2026-02-04', '2026-02-04', 1),
-(1717, 5, 'patio', 'en', '2026-02-04', '2026-02-04', 1),
-(1718, 5, 'paid', 'en', '2026-02-04', '2026-02-04', 1),
-(1719, 5, 'lax', 'en', '2026-02-04', '2026-02-04', 1),
-(1720, 5, 'grandmother', 'en', '2026-02-04', '2026-02-04', 1),
-(1721, 5, 'fewer', 'en', '2026-02-04', '2026-02-04', 1),
-(1722, 5, 'workers', 'en', '2026-02-04', '2026-02-04', 1),
-(1723, 5, 'always', 'en', '2026-02-04', '2026-02-04', 1),
-(1724, 5, 'war', 'en', '2026-02-04', '2026-02-04', 1),
-(1725, 5, 'became', 'en', '2026-02-04', '2026-02-04', 1),
-(1726, 5, 'ice', 'en', '2026-02-04', '2026-02-04', 1),
-(1727, 5, 'hours', 'en', '2026-02-04', '2026-02-04', 1),
-(1728, 5, 'true', 'en', '2026-02-04', '2026-02-04', 1),
-(1729, 5, 'thanks', 'en', '2026-02-04', '2026-02-04', 1),
-(1730, 5, 'media', 'en', '2026-02-04', '2026-02-04', 1),
-(1731, 5, 'images', 'en', '2026-02-04', '2026-02-04', 1),
-(1732, 5, 'glad', 'en', '2026-02-04', '2026-02-04', 1),
-(1733, 5, 'economy', 'en', '2026-02-04', '2026-02-04', 1),
-(1734, 5, 'doesn', 'en', '2026-02-04', '2026-02-04', 1),
-(1735, 5, 'obama', 'en', '2026-02-04', '2026-02-04', 1),
-(1736, 5, 'israel', 'en', '2026-02-04', '2026-02-04', 1),
-(1737, 5, 'person', 'en', '2026-02-04', '2026-02-04', 1),
-(1738, 5, 'party', 'en', '2026-02-04', '2026-02-04', 1),
-(1739, 5, 'bet', 'en', '2026-02-04', '2026-02-04', 1),
-(1740, 5, 'modern', 'en', '2026-02-04', '2026-02-04', 1),
-(1741, 5, 'day', 'en', '2026-02-04', '2026-02-04', 1),
-(1742, 5, 'united', 'en', '2026-02-04', '2026-02-04', 1),
-(1743, 5, 'states', 'en', '2026-02-04', '2026-02-04', 1),
-(1744, 5, 'autograph', 'en', '2026-02-04', '2026-02-04', 1),
-(1745, 5, 'melanie', 'en', '2026-02-04', '2026-02-04', 1),
-(1746, 5, 'distorted', 'en', '2026-02-04', '2026-02-04', 1),
-(1747, 5, 'islam', 'en', '2026-02-04', '2026-02-04', 1),
-(1748, 5, 'wow', 'en', '2026-02-04', '2026-02-04', 1),
-(1749, 5, 'idea', 'en', '2026-02-04', '2026-02-04', 1),
-(1750, 5, 'fifty', 'en', '2026-02-04', '2026-02-04', 1),
-(1751, 5, 'many', 'en', '2026-02-04', '2026-02-04', 1),
-(1752, 5, 'essential', 'en', '2026-02-04', '2026-02-04', 1),
-(1753, 5, 'grabs', 'en', '2026-02-04', '2026-02-04', 1),
-(1754, 5, 'million', 'en', '2026-02-04', '2026-02-04', 1),
-(1755, 5, 'friend', 'en', '2026-02-04', '2026-02-04', 1),
-(1756, 5, 'change', 'en', '2026-02-04', '2026-02-04', 1),
-(1757, 5, 'shop', 'en', '2026-02-04', '2026-02-04', 1),
-(1758, 5, 'functional', 'en', '2026-02-04', '2026-02-04', 1),
-(1759, 5, 'top', 'en', '2026-02-04', '2026-02-04', 1),
-(1760, 5, 'five', 'en', '2026-02-04', '2026-02-04', 1),
-(1761, 5, 'talk', 'en', '2026-02-04', '2026-02-04', 1),
-(1762, 5, 'speller', 'en', '2026-02-04', '2026-02-04', 1),
-(1763, 5, 'linux', 'en', '2026-02-04', '2026-02-04', 1),
-(1764, 5, 'pick', 'en', '2026-02-04', '2026-02-04', 1),
-(1765, 5, 'which', 'en', '2026-02-04', '2026-02-04', 1),
-(1766, 5, 'dogs', 'en', '2026-02-04', '2026-02-04', 1),
-(1767, 5, 'insane', 'en', '2026-02-04', '2026-02-04', 1),
-(1768, 5, 'exactly', 'en', '2026-02-04', '2026-02-04', 1),
-(1769, 5, 'shoe', 'en', '2026-02-04', '2026-02-04', 1),
-(1770, 5, 'meaning', 'en', '2026-02-04', '2026-02-04', 1),
-(1771, 5, 'buddha', 'en', '2026-02-04', '2026-02-04', 1),
-(1772, 5, 'pretty', 'en', '2026-02-04', '2026-02-04', 1),
-(1773, 5, 'sydney', 'en', '2026-02-04', '2026-02-04', 1),
-(1774, 5, 'radio', 'en', '2026-02-04', '2026-02-04', 1),
-(1775, 5, 'religious', 'en', '2026-02-04', '2026-02-04', 1),
-(1776, 5, 'aha', 'en', '2026-02-04', '2026-02-04', 1),
-(1777, 5, 'way', 'en', '2026-02-04', '2026-02-04', 1),
-(1778, 5, 'example', 'en', '2026-02-04', '2026-02-04', 1),
-(1779, 5, 'demographics', 'en', '2026-02-04', '2026-02-04', 1),
-(1780, 5, 'outta', 'en', '2026-02-04', '2026-02-04', 1),
-(1781, 5, 'gotta', 'en', '2026-02-04', '2026-02-04', 1),
-(1782, 5, 'clue', 'en', '2026-02-04', '2026-02-04', 1),
-(1783, 5, 'software', 'en', '2026-02-04', '2026-02-04', 1),
-(1784, 5, 'lie', 'en', '2026-02-04', '2026-02-04', 1),
-(1785, 5, 'modem', 'en', '2026-02-04', '2026-02-04', 1),
-(1786, 5, 'shit', 'en', '2026-02-04', '2026-02-04', 1),
-(1787, 5, 'supposed', 'en', '2026-02-04', '2026-02-04', 1),
-(1788, 5, 'create', 'en', '2026-02-04', '2026-02-04', 1),
-(1789, 5, 'python', 'en', '2026-02-04', '2026-02-04', 1),
-(1790, 5, 'script', 'en', '2026-02-04', '2026-02-04', 1),
-(1791, 5, 'reunited', 'en', '2026-02-04', '2026-02-04', 1),
-(1792, 5, 'meals', 'en', '2026-02-04', '2026-02-04', 1),
-(1793, 5, 'network', 'en', '2026-02-04', '2026-02-04', 1),
-(1794, 5, 'pinterest', 'en', '2026-02-04', '2026-02-04', 1),
-(1795, 5, 'move', 'en', '2026-02-04', '2026-02-04', 1),
-(1796, 5, 'normally', 'en', '2026-02-04', '2026-02-04', 1),
-(1797, 5, 'miles', 'en', '2026-02-04', '2026-02-04', 1),
-(1798, 5, 'used', 'en', '2026-02-04', '2026-02-04', 1),
-(1799, 5, 'before', 'en', '2026-02-04', '2026-02-04', 1),
-(1800, 5, 'usually', 'en', '2026-02-04', '2026-02-04', 1),
-(1801, 5, 'bloated', 'en', '2026-02-04', '2026-02-04', 1),
-(1802, 5, 'worse', 'en', '2026-02-04', '2026-02-04', 1),
-(1803, 5, 'suppose', 'en', '2026-02-04', '2026-02-04', 1),
-(1804, 5, 'york', 'en', '2026-02-04', '2026-02-04', 1),
-(1805, 5, 'seattle', 'en', '2026-02-04', '2026-02-04', 1),
-(1806, 5, 'means', 'en', '2026-02-04', '2026-02-04', 1),
-(1807, 5, 'customer', 'en', '2026-02-04', '2026-02-04', 1),
-(1808, 5, 'relation', 'en', '2026-02-04', '2026-02-04', 1),
-(1809, 5, 'relations', 'en', '2026-02-04', '2026-02-04', 1),
-(1810, 5, 'manager', 'en', '2026-02-04', '2026-02-04', 1);
-
-DROP TABLE IF EXISTS `performance_analytics`;
-CREATE TABLE `performance_analytics` (
-  `id` INT NOT NULL AUTO_INCREMENT,
-  `user_id` INT,
-  `language` TEXT,
-  `word` TEXT,
-  `lesson_type` TEXT,
-  `response_time` REAL,
-  `is_correct` TINYINT(1),
-  `timestamp` DATETIME,
-  `difficulty_level` TEXT,
-  PRIMARY KEY (`id`)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-
-DROP TABLE IF EXISTS `user_completed_levels`;
-CREATE TABLE `user_completed_levels` (
-  `user_id` INT NOT NULL,
-  `level_id` INT NOT NULL,
-  `xp_earned` INT,
-  `score` INT,
-  `passed` TINYINT(1),
-  `timestamp` DATETIME DEFAULT CURRENT_TIMESTAMP,
-  PRIMARY KEY (`user_id`, `level_id`)
-) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-
-INSERT INTO `user_completed_levels` (`user_id`, `level_id`, `xp_earned`, `score`, `passed`, `timestamp`) VALUES 
-(1, 1, 40, 80, 1, '2026-01-27 13:50:19'),
-(1, 2, 50, 100, 1, '2026-01-27 13:50:54'),
-(1, 3, 40, 80, 1, '2026-01-27 14:40:19'),
-(1, 4, 50, 80, 1, '2026-01-30 13:11:51'),
-(1, 5, 50, 80, 1, '2026-02-11 04:49:26'),
-(1, 6, 50, 80, 1, '2026-02-11 05:13:15'),
-(1, 7, 50, 80, 1, '2026-02-11 05:14:53');
-
-SET FOREIGN_KEY_CHECKS = 1;
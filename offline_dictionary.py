@@ -1,58 +1,217 @@
 """
 Offline Dictionary Service
-Provides word definitions for Spanish and Hindi when API is unavailable
+Provides word definitions, prefix search (autocomplete) and accent-insensitive
+lookups for English, Spanish and Hindi without network access.
+
+The JSON dictionaries in dictionaries/ are the source of truth; on first use
+each one is imported into an indexed SQLite file, which is rebuilt only when
+its source file changes. Nothing is loaded at import time and lookups read
+from disk, so large dictionaries cost neither startup time nor memory.
 """
 import json
 import os
+import sqlite3
+import threading
+from config import OFFLINE_DICT_DB
+from fuzzy_index import FuzzyIndexCache
+from tokenizer import fold_accents
+
+DICT_DIR = os.path.join(os.path.dirname(__file__), 'dictionaries')
+
+DICTIONARY_FILES = {
+    'en': 'english_dict.json',
+    'es': 'spanish_dict.json',
+    'hi': 'hindi_dict.json',
+}
+
+# Upper bound for prefix range scans: word >= prefix AND word < prefix + MAX_CHAR
+MAX_CHAR = '\U0010ffff'
+
 
 class OfflineDictionary:
-    """Offline dictionary with Spanish and Hindi words"""
-    
-    def __init__(self):
-        self.dictionaries = {}
-        self.load_dictionaries()
-    
-    def load_dictionaries(self):
-        """Load dictionary JSON files"""
-        dict_dir = os.path.join(os.path.dirname(__file__), 'dictionaries')
-        
-        # Load Spanish dictionary
+    """Lazily indexed offline dictionary backed by SQLite"""
+
+    def __init__(self, db_path=OFFLINE_DICT_DB, dict_dir=DICT_DIR, files=None):
+        self.db_path = db_path
+        self.dict_dir = dict_dir
+        self.files = files or DICTIONARY_FILES
+        self.ready = set()  # languages whose index is known to be current
+        self.lock = threading.Lock()
+        self.fuzzy = FuzzyIndexCache(self.headwords)
+
+    def get_connection(self):
+        return sqlite3.connect(self.db_path, check_same_thread=False)
+
+    # --- Index management ---
+
+    def ensure_language(self, language: str) -> bool:
+        """Build or refresh the index for a language on first use"""
+        if language in self.ready:
+            return True
+        filename = self.files.get(language)
+        if not filename:
+            return False
+
+        with self.lock:
+            if language in self.ready:
+                return True
+            path = os.path.join(self.dict_dir, filename)
+            try:
+                st = os.stat(path)
+            except OSError as e:
+                print(f"[OFFLINE_DICT] Missing dictionary for {language}: {e}")
+                return False
+
+            conn = self.get_connection()
+            try:
+                self._create_schema(conn)
+                row = conn.execute(
+                    "SELECT mtime, size FROM dictionary_sources WHERE language=?", (language,)
+                ).fetchone()
+                if row != (st.st_mtime, st.st_size):
+                    self._import(conn, language, path, st)
+            except Exception as e:
+                print(f"[OFFLINE_DICT] Error indexing {language} dictionary: {e}")
+                return False
+            finally:
+                conn.close()
+
+            self.ready.add(language)
+            return True
+
+    def _create_schema(self, conn):
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS dictionary_entries (
+                language TEXT NOT NULL,
+                word TEXT NOT NULL,
+                folded TEXT NOT NULL,
+                definition TEXT,
+                PRIMARY KEY (language, word)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_dictionary_folded ON dictionary_entries (language, folded)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS dictionary_sources (
+                language TEXT PRIMARY KEY,
+                mtime REAL,
+                size INTEGER
+            )
+        """)
+        conn.commit()
+
+    def _import(self, conn, language, path, st):
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+
+        rows = []
+        for word, definition in entries.items():
+            key = word.lower().strip()
+            if key:
+                rows.append((language, key, fold_accents(key), definition))
+
+        with conn:
+            conn.execute("DELETE FROM dictionary_entries WHERE language=?", (language,))
+            conn.executemany(
+                "INSERT OR REPLACE INTO dictionary_entries (language, word, folded, definition) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO dictionary_sources (language, mtime, size) VALUES (?, ?, ?)",
+                (language, st.st_mtime, st.st_size)
+            )
+        print(f"[OFFLINE_DICT] Indexed {len(rows)} {language} words")
+
+    # --- Lookups ---
+
+    def lookup(self, word: str, language: str, accent_insensitive: bool = True):
+        """
+        Return (headword, definition) for an exact match, falling back to an
+        accent-insensitive match ("cafe" finds "café"). None if not found.
+        """
+        if not word or not self.ensure_language(language):
+            return None
+        key = word.lower().strip()
+
+        conn = self.get_connection()
+        try:
+            row = conn.execute(
+                "SELECT word, definition FROM dictionary_entries WHERE language=? AND word=?",
+                (language, key)
+            ).fetchone()
+            if row is None and accent_insensitive:
+                row = conn.execute(
+                    "SELECT word, definition FROM dictionary_entries WHERE language=? AND folded=? ORDER BY word LIMIT 1",
+                    (language, fold_accents(key))
+                ).fetchone()
+            return row
+        finally:
+            conn.close()
+
+    def prefix_search(self, prefix: str, language: str = 'en', limit: int = 10, accent_insensitive: bool = True):
+        """Headwords starting with prefix, in alphabetical order (for autocomplete)"""
+        if not prefix or not self.ensure_language(language):
+            return []
+
+        if accent_insensitive:
+            column, key = 'folded', fold_accents(prefix.strip())
+        else:
+            column, key = 'word', prefix.lower().strip()
+
+        conn = self.get_connection()
         try:
-            with open(os.path.join(dict_dir, 'spanish_dict.json'), 'r', encoding='utf-8') as f:
-                self.dictionaries['es'] = json.load(f)
-            print(f"[OFFLINE_DICT] Loaded {len(self.dictionaries['es'])} Spanish words")
-        except Exception as e:
-            print(f"[OFFLINE_DICT] Error loading Spanish dict: {e}")
-            self.dictionaries['es'] = {}
-        
-        # Load Hindi dictionary
+            rows = conn.execute(
+                f"""SELECT word FROM dictionary_entries
+                    WHERE language=? AND {column} >= ? AND {column} < ?
+                    ORDER BY {column}, word LIMIT ?""",
+                (language, key, key + MAX_CHAR, limit)
+            ).fetchall()
+            return [r[0] for r in rows]
+        finally:
+            conn.close()
+
+    def headwords(self, language: str):
+        """Every headword of a language (used to build the fuzzy index)"""
+        if not self.ensure_language(language):
+            return []
+        conn = self.get_connection()
         try:
-            with open(os.path.join(dict_dir, 'hindi_dict.json'), 'r', encoding='utf-8') as f:
-                self.dictionaries['hi'] = json.load(f)
-            print(f"[OFFLINE_DICT] Loaded {len(self.dictionaries['hi'])} Hindi words")
-        except Exception as e:
-            print(f"[OFFLINE_DICT] Error loading Hindi dict: {e}")
-            self.dictionaries['hi'] = {}
-    
-    def get_definition(self, word: str, language: str = 'en'):
-        """Get word definition from offline dictionary"""
-        if language not in ['es', 'hi']:
+            rows = conn.execute("SELECT word FROM dictionary_entries WHERE language=?", (language,))
+            return [r[0] for r in rows]
+        finally:
+            conn.close()
+
+    def fuzzy_lookup(self, word: str, language: str):
+        """Nearest headword within the word's edit budget, as (headword, distance), or None"""
+        if not word or not self.ensure_language(language):
             return None
-        
-        # Normalize word (lowercase)
-        word_lower = word.lower().strip()
-        
-        # Check if word exists in dictionary
-        if word_lower in self.dictionaries.get(language, {}):
-            definition = self.dictionaries[language][word_lower]
-            print(f"[OFFLINE_DICT] ✓ Found {word} ({language}): {definition[:50]}...")
-            return {
-                'word': word,
-                'definition': definition,
-                'source': 'offline_dictionary'
-            }
-        
-        return None
+        return self.fuzzy.nearest(word.lower().strip(), language)
+
+    def get_definition(self, word: str, language: str = 'en', fuzzy: bool = False):
+        """
+        Get word definition from offline dictionary. With fuzzy=True a miss
+        falls back to an unambiguous near-miss spelling (e.g. ASR output
+        "gracia" -> "gracias"), returned with 'variant' set.
+        """
+        row = self.lookup(word, language)
+        distance, variant = 0, False
+        if row is None and fuzzy and self.ensure_language(language):
+            match = self.fuzzy.variant_of(word.lower().strip(), language)
+            if match:
+                row = self.lookup(match[0], language, accent_insensitive=False)
+                distance, variant = match[1], True
+        if row is None:
+            return None
+
+        headword, definition = row
+        print(f"[OFFLINE_DICT] ✓ Found {word} ({language}): {definition[:50]}...")
+        return {
+            'word': word,
+            'headword': headword,
+            'definition': definition,
+            'distance': distance,
+            'variant': variant,
+            'source': 'offline_dictionary'
+        }
 
 # Global instance
 offline_dict = OfflineDictionary()
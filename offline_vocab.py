@@ -0,0 +1,65 @@
+"""
+Offline Vocabulary for LinguaVoice
+The leveled starter vocabulary for each language, loaded once from
+dictionaries/offline_vocab.json into frozenset membership indexes and a
+word -> level map shared by the chatbot, transcriber and API.
+"""
+import json
+import os
+from fuzzy_index import FuzzyIndexCache
+
+VOCAB_FILE = os.path.join(os.path.dirname(__file__), 'dictionaries', 'offline_vocab.json')
+
+
+class OfflineVocabulary:
+    """Read-only vocabulary index, built once"""
+
+    def __init__(self, path=VOCAB_FILE):
+        self.levels = {}      # lang -> {level: tuple of words}, in file order
+        self.words = {}       # lang -> frozenset of words
+        self.word_level = {}  # lang -> {word: level}
+        self.load(path)
+        # Edit-distance index per language, so ASR spelling variants
+        # ("gracia", "dhanyavaad") still count as known words
+        self.fuzzy = FuzzyIndexCache(self.all_words)
+
+    def load(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[OFFLINE_VOCAB] Error loading {path}: {e}")
+            data = {}
+
+        for language, levels in data.items():
+            self.levels[language] = {level: tuple(w.lower() for w in words) for level, words in levels.items()}
+            word_level = {}
+            for level, words in self.levels[language].items():
+                for word in words:
+                    word_level.setdefault(word, level)  # first (easiest) level wins
+            self.word_level[language] = word_level
+            self.words[language] = frozenset(word_level)
+        print(f"[OFFLINE_VOCAB] Loaded {sum(len(w) for w in self.words.values())} words for {', '.join(self.words)}")
+
+    def get_levels(self, language):
+        """{level: tuple of words} for a language ({} if unknown)"""
+        return self.levels.get(language, {})
+
+    def all_words(self, language):
+        """Every word of a language, easiest level first"""
+        return [w for words in self.get_levels(language).values() for w in words]
+
+    def level_of(self, word, language):
+        return self.word_level.get(language, {}).get(word)
+
+    def contains(self, word, language, fuzzy=False):
+        words = self.words.get(language)
+        if words is None:
+            return False
+        if word in words:
+            return True
+        return fuzzy and self.fuzzy.variant_of(word, language) is not None
+
+
+# Global instance
+offline_vocab = OfflineVocabulary()
@@ -0,0 +1,141 @@
+"""
+Progress Service for LinguaVoice
+Applies XP and streak changes to user_progress in a single upsert
+(ON CONFLICT / ON DUPLICATE KEY UPDATE), with the streak rules and level
+thresholds evaluated in SQL, so concurrent answers cannot overwrite each
+other and no read-modify-write round trip is needed.
+
+Optionally (PROGRESS_COALESCE_SEC > 0) rapid XP events are merged in memory
+per user/language/day and flushed in one transaction every few seconds.
+"""
+import atexit
+import threading
+from datetime import date, datetime, timedelta
+import storage
+from config import PROGRESS_COALESCE_SEC
+
+# (minimum XP, level), highest first
+LEVEL_THRESHOLDS = [(1500, 'proficient'), (500, 'advanced'), (100, 'intermediate'), (0, 'beginner')]
+
+
+def level_for_xp(xp):
+    for minimum, level in LEVEL_THRESHOLDS:
+        if xp >= minimum:
+            return level
+    return LEVEL_THRESHOLDS[-1][1]
+
+
+def _level_case(xp_expr):
+    whens = ' '.join(f"WHEN {xp_expr} >= {minimum} THEN '{level}'" for minimum, level in LEVEL_THRESHOLDS[:-1])
+    return f"CASE {whens} ELSE '{LEVEL_THRESHOLDS[-1][1]}' END"
+
+
+def upsert_progress_sql(backend):
+    """
+    The XP/streak upsert for a backend; parameters are
+    (user_id, language, xp, level, day, day before).
+
+    Activity on the day after the last active day extends the streak, a gap
+    resets it to 1, a second activity on the same day keeps it. Update
+    expressions read the row as it was before the update: MySQL applies
+    assignments in order, so the columns others depend on are assigned last.
+    """
+    new = backend.excluded
+    xp = f"COALESCE(user_progress.total_xp, 0) + {new('total_xp')}"
+    last_day = "SUBSTR(user_progress.last_activity, 1, 10)"
+    return f"""
+    INSERT INTO user_progress (user_id, language, total_xp, current_level, streak_days, last_activity)
+    VALUES (?, ?, ?, ?, 1, ?)""" + backend.on_conflict(('user_id', 'language'), [
+        f"current_level = {_level_case(xp)}",
+        f"""streak_days = CASE
+            WHEN user_progress.last_activity IS NULL THEN 1
+            WHEN {last_day} = {new('last_activity')}
+                THEN CASE WHEN user_progress.streak_days > 1 THEN user_progress.streak_days ELSE 1 END
+            WHEN {last_day} = ? THEN COALESCE(user_progress.streak_days, 0) + 1
+            WHEN {last_day} < {new('last_activity')} THEN 1
+            ELSE user_progress.streak_days
+        END""",
+        f"total_xp = {xp}",
+        f"last_activity = CASE WHEN {last_day} > {new('last_activity')} THEN {last_day} ELSE {new('last_activity')} END",
+    ])
+
+
+UPSERT_PROGRESS = upsert_progress_sql(storage.store.backend)
+
+
+class ProgressService:
+    """Atomic XP/streak updates with an optional coalescing buffer"""
+
+    def __init__(self, coalesce_sec=PROGRESS_COALESCE_SEC):
+        self.coalesce_sec = coalesce_sec
+        self.pending = {}  # (user_id, language, day) -> xp
+        self.lock = threading.Lock()
+        self.flush_event = threading.Event()
+        self.flusher_thread = None
+
+    def apply_xp(self, user_id, language, xp, cursor=None, day=None):
+        """Add XP and advance the streak now; pass `cursor` to join the caller's transaction (no commit)"""
+        self.apply_many([(user_id, language, day or datetime.now().date().isoformat(), xp)], cursor=cursor)
+
+    def apply_many(self, events, cursor=None):
+        """events: iterable of (user_id, language, day 'YYYY-MM-DD', xp), written with one executemany"""
+        rows = [(user_id, language, xp, level_for_xp(xp), day,
+                 (date.fromisoformat(day) - timedelta(days=1)).isoformat())
+                for user_id, language, day, xp in events]
+        storage.store.executemany(UPSERT_PROGRESS, rows, cursor=cursor)
+
+    def add_xp(self, user_id, language, xp, cursor=None):
+        """
+        Record an XP event. With coalescing enabled it is merged into the
+        pending total for the user/language/day and written on the next
+        flush; otherwise it is applied immediately (on `cursor` if given).
+        """
+        if self.coalesce_sec <= 0:
+            self.apply_xp(user_id, language, xp, cursor=cursor)
+            return
+        key = (user_id, language, datetime.now().date().isoformat())
+        with self.lock:
+            self.pending[key] = self.pending.get(key, 0) + xp
+        self.start_flusher()
+
+    def flush(self):
+        """Write all pending XP in one transaction; on failure it stays pending for the next flush"""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        if pending:
+            try:
+                self.apply_many((user_id, language, day, xp) for (user_id, language, day), xp in pending.items())
+            except Exception:
+                with self.lock:
+                    for key, xp in pending.items():
+                        self.pending[key] = self.pending.get(key, 0) + xp
+                raise
+        return len(pending)
+
+    def _flush_loop(self):
+        while not self.flush_event.wait(self.coalesce_sec):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[PROGRESS] Flush error: {e}", flush=True)
+
+    def start_flusher(self):
+        if self.flusher_thread and self.flusher_thread.is_alive():
+            return
+        with self.lock:
+            if self.flusher_thread and self.flusher_thread.is_alive():
+                return
+            self.flush_event.clear()
+            self.flusher_thread = threading.Thread(target=self._flush_loop, daemon=True)
+            self.flusher_thread.start()
+
+    def stop_flusher(self):
+        """Stop the background flusher and write whatever is still pending"""
+        self.flush_event.set()
+        self.flush()
+
+
+# Global instance
+progress_service = ProgressService()
+if progress_service.coalesce_sec > 0:
+    atexit.register(progress_service.stop_flusher)
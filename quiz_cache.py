@@ -0,0 +1,60 @@
+"""
+Quiz Cache for LinguaVoice
+Keeps generated quiz questions per (level, language, word set) so repeated
+quiz loads for the same flashcards don't go back to Gemini
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from config import QUIZ_CACHE_TTL
+
+
+class QuizCache:
+    """In-memory TTL cache for generated quiz questions"""
+
+    def __init__(self, ttl_seconds=3600, max_entries=512):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def make_key(self, level_id, language, words=None):
+        """Build a cache key from the level, language and the level's word list"""
+        word_list = [(w.get('word', ''), w.get('meaning', '')) for w in (words or [])]
+        digest = hashlib.sha1(
+            json.dumps(word_list, ensure_ascii=False).encode('utf-8')
+        ).hexdigest()
+        return (int(level_id), language, digest)
+
+    def get(self, key):
+        """Return cached questions for key, or None if missing/expired"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, questions = entry
+            if time.time() - stored_at > self.ttl_seconds:
+                del self.entries[key]
+                return None
+
+            self.entries.move_to_end(key)
+            return questions
+
+    def set(self, key, questions):
+        """Store questions for key, evicting the least recently used entries"""
+        with self.lock:
+            self.entries[key] = (time.time(), questions)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+# Global instance
+quiz_cache = QuizCache(ttl_seconds=QUIZ_CACHE_TTL)
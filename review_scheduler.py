@@ -0,0 +1,137 @@
+"""
+Review Scheduler for LinguaVoice
+SM-2 spaced repetition over the vocabulary table. Every word carries its
+ease factor, interval, repetition count and next due time; the
+(user_id, language, due_at) index turns "next N due cards" into an index
+range scan however large a user's vocabulary grows.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import storage
+
+DUE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+MIN_EASE = 1.3
+DEFAULT_EASE = 2.5
+PASSING_QUALITY = 3  # SM-2 grades 0-5; below 3 the card lapses
+
+
+def format_due(when: datetime) -> str:
+    """due_at storage format: sorts lexicographically like the time it encodes"""
+    return when.strftime(DUE_FORMAT)
+
+
+def quality_from_answer(is_correct, response_time=None) -> int:
+    """Map a right/wrong answer and its response time (seconds) to an SM-2 grade"""
+    if not is_correct:
+        return 1
+    if response_time is None:
+        return 4
+    if response_time <= 3:
+        return 5
+    return 4 if response_time <= 8 else 3
+
+
+def sm2(ease: float, interval: float, repetitions: int, quality: int):
+    """
+    One SM-2 step. Returns (ease, interval_days, repetitions, lapsed):
+    a passing grade grows the interval 1 -> 6 -> interval * ease days,
+    a failing one resets it to a day and restarts the repetition count.
+    """
+    quality = max(0, min(5, int(quality)))
+    ease = ease or DEFAULT_EASE
+    if quality >= PASSING_QUALITY:
+        if repetitions == 0:
+            interval = 1
+        elif repetitions == 1:
+            interval = 6
+        else:
+            interval = round((interval or 1) * ease)
+        repetitions += 1
+        lapsed = False
+    else:
+        repetitions = 0
+        interval = 1
+        lapsed = True
+    ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    return ease, interval, repetitions, lapsed
+
+
+def mastery_for(repetitions: int) -> int:
+    """mastery_level (0-5) shown in the UI, from consecutive successful reviews"""
+    return min(5, repetitions)
+
+
+class ReviewScheduler:
+    """Due queue and review submission for vocabulary cards"""
+
+    def due_cards(self, user_id, language, limit=20, now: Optional[datetime] = None) -> List[Dict]:
+        """Cards due by `now`, most overdue first"""
+        return storage.reviews.due(user_id, language, format_due(now or datetime.now()), limit)
+
+    def due_count(self, user_id, language, now: Optional[datetime] = None) -> int:
+        return storage.reviews.due_count(user_id, language, format_due(now or datetime.now()))
+
+    def submit_reviews(self, user_id, language, reviews, lesson_type='review',
+                       now: Optional[datetime] = None, cursor=None) -> Dict:
+        """
+        Apply a batch of reviews in one transaction.
+
+        Each review is a dict with 'word' and either an SM-2 'quality' (0-5)
+        or 'is_correct' (plus optional 'response_time' in seconds,
+        'lesson_type' and 'difficulty_level'). Every review is logged to
+        performance_analytics; repeated answers for a word are applied in
+        order and the word's row is written once. Words not in the user's
+        vocabulary are reported back as 'unknown'. Returns
+        {'updated': [{word, due_at, interval_days, mastery_level}], 'unknown': [words],
+        'answered': n, 'correct': n}. Pass `cursor` to join the caller's
+        transaction (no commit).
+        """
+        with storage.store.transaction(cursor) as cursor:
+            return self._submit(user_id, language, reviews, lesson_type, now or datetime.now(), cursor)
+
+    def _submit(self, user_id, language, reviews, lesson_type, now, cursor):
+        words = list(dict.fromkeys(
+            w for w in ((r.get('word') or '').strip().lower() for r in reviews) if w
+        ))
+        states = storage.reviews.states(user_id, language, words, cursor=cursor)
+
+        analytics = []
+        result = {'updated': [], 'unknown': [], 'answered': 0, 'correct': 0}
+        timestamp = format_due(now)
+        for review in reviews:
+            word = (review.get('word') or '').strip().lower()
+            if review.get('quality') is not None:
+                quality = int(review['quality'])
+                is_correct = quality >= PASSING_QUALITY
+            else:
+                is_correct = bool(review.get('is_correct'))
+                quality = quality_from_answer(is_correct, review.get('response_time'))
+            analytics.append((user_id, language, word or None, review.get('lesson_type', lesson_type),
+                              review.get('response_time'), int(is_correct), timestamp, review.get('difficulty_level')))
+            result['answered'] += 1
+            result['correct'] += int(is_correct)
+
+            state = states.get(word)
+            if state is None:
+                if word and word not in result['unknown']:
+                    result['unknown'].append(word)
+                continue
+            ease, interval, repetitions, lapsed = sm2(state[0], state[1], state[2], quality)
+            state[:4] = [ease, interval, repetitions, state[3] + int(lapsed)]
+            state[4 if is_correct else 5] += 1
+
+        updates = []
+        for word, (ease, interval, repetitions, lapses, correct, incorrect) in states.items():
+            due_at = format_due(now + timedelta(days=interval or 0))
+            mastery = mastery_for(repetitions)
+            updates.append((ease, interval, repetitions, lapses, due_at, mastery,
+                            correct, incorrect, timestamp, user_id, word, language))
+            result['updated'].append({'word': word, 'due_at': due_at, 'interval_days': interval, 'mastery_level': mastery})
+
+        storage.reviews.save(updates, analytics, cursor=cursor)
+        return result
+
+
+# Global instance
+review_scheduler = ReviewScheduler()
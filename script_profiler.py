@@ -0,0 +1,183 @@
+"""
+Script Profiler for LinguaVoice
+Classifies every character of a transcript in one str.translate pass and
+checks the per-script counts against a table-driven policy for each language.
+Romanized Hindi (Latin-script Hindi words such as "namaste") is recognized
+through a lexicon so it is not mistaken for English.
+"""
+import json
+import os
+from tokenizer import WORD_RE, normalize_text
+
+DEVANAGARI = 'D'
+LATIN = 'L'
+SPANISH = 'S'  # Latin letters and punctuation that only Spanish uses here
+DIGIT = 'N'
+SPACE = ' '
+OTHER = 'O'
+
+SPANISH_MARKERS = 'áéíóúüñÁÉÍÓÚÜÑ¿¡'
+
+
+class _ScriptTable(dict):
+    """str.translate table: code point -> script class, filled in on first sight"""
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        if 0x0900 <= codepoint <= 0x097F:
+            script = DEVANAGARI
+        elif char in SPANISH_MARKERS:
+            script = SPANISH
+        elif char.isascii() and char.isalpha():
+            script = LATIN
+        elif char.isdigit():
+            script = DIGIT
+        elif char.isspace():
+            script = SPACE
+        else:
+            script = OTHER
+        self[codepoint] = script
+        return script
+
+
+SCRIPT_TABLE = _ScriptTable()
+
+
+class ScriptProfile:
+    """Per-script character counts of one text"""
+
+    __slots__ = ('text', 'devanagari', 'latin', 'spanish', 'digits', 'other', 'length', '_words')
+
+    def __init__(self, text):
+        classes = text.translate(SCRIPT_TABLE)
+        self.text = text
+        self.length = len(text)
+        self.devanagari = classes.count(DEVANAGARI)
+        self.spanish = classes.count(SPANISH)
+        self.latin = classes.count(LATIN) + self.spanish
+        self.digits = classes.count(DIGIT)
+        self.other = self.length - self.devanagari - self.latin - self.digits - classes.count(SPACE)
+        self._words = None
+
+    @property
+    def visible(self):
+        """Characters that are not whitespace"""
+        return self.devanagari + self.latin + self.digits + self.other
+
+    def ratio(self, count):
+        return count / self.visible if self.visible else 0.0
+
+    @property
+    def words(self):
+        if self._words is None:
+            self._words = WORD_RE.findall(normalize_text(self.text))
+        return self._words
+
+    def lexicon_ratio(self, lexicon):
+        """Share of the words that are in `lexicon`"""
+        if not self.words:
+            return 0.0
+        return sum(1 for w in self.words if w in lexicon) / len(self.words)
+
+
+# What each model's output must look like to be accepted. Ratios are of
+# visible (non-space) characters; 'detected_*' refer to the offline language
+# detector; romanized Hindi is judged by the share of lexicon words.
+LANGUAGE_POLICIES = {
+    'hi': {
+        'min_devanagari_ratio': 0.7,
+        'min_romanized_hindi_ratio': 0.5,  # Latin-script Hindi is accepted too
+    },
+    'es': {
+        'max_devanagari': 0,
+        'require_marker_or_detected': True,
+        'reject_detected': ('en',),
+    },
+    'en': {
+        'max_devanagari': 0,
+        'max_spanish_ratio': 0.3,
+        'romanized_hindi_as': 'hi',  # a Latin transcript of mostly Hindi words
+        'accept_detected': ('en', 'unknown'),
+    },
+}
+
+
+class ScriptProfiler:
+    """Applies LANGUAGE_POLICIES to transcripts"""
+
+    def __init__(self, romanized_hindi=(), policies=None):
+        self.policies = policies or LANGUAGE_POLICIES
+        self.romanized_hindi = set()
+        self.add_romanized_hindi(romanized_hindi)
+
+    def add_romanized_hindi(self, words):
+        for word in words:
+            word = word.lower().strip()
+            if word and word.isascii():
+                self.romanized_hindi.add(word)
+
+    def profile(self, text):
+        return ScriptProfile(text)
+
+    def check(self, text, lang, detect=None):
+        """
+        Validate a transcript produced by the `lang` model.
+
+        `detect` is an optional callable returning the offline detector's
+        language for the text; it is only called if the policy needs it.
+        Returns (language, reason): language is the accepted language
+        (possibly re-labelled, e.g. romanized Hindi) or None if rejected.
+        """
+        policy = self.policies.get(lang)
+        if policy is None:
+            return lang, "no policy"
+        p = ScriptProfile(text)
+
+        if 'min_devanagari_ratio' in policy:
+            ratio = p.ratio(p.devanagari)
+            if p.devanagari and ratio >= policy['min_devanagari_ratio']:
+                return lang, f"Devanagari {ratio:.0%}"
+            if not p.devanagari and 'min_romanized_hindi_ratio' in policy:
+                romanized = p.lexicon_ratio(self.romanized_hindi)
+                if romanized >= policy['min_romanized_hindi_ratio']:
+                    return lang, f"romanized Hindi {romanized:.0%}"
+            return None, f"Insufficient Devanagari content ({p.devanagari}/{p.visible})"
+
+        if p.devanagari > policy.get('max_devanagari', p.devanagari):
+            return None, f"Contains Devanagari in {lang.upper()} model"
+
+        if 'max_spanish_ratio' in policy and p.ratio(p.spanish) > policy['max_spanish_ratio']:
+            return None, f"Too many Spanish chars in {lang.upper()} model"
+
+        if 'romanized_hindi_as' in policy and self.romanized_hindi:
+            romanized = p.lexicon_ratio(self.romanized_hindi)
+            if romanized >= self.policies['hi'].get('min_romanized_hindi_ratio', 0.5):
+                return policy['romanized_hindi_as'], f"romanized Hindi {romanized:.0%}"
+
+        detected = None
+        if detect and ('accept_detected' in policy or 'reject_detected' in policy
+                       or 'require_marker_or_detected' in policy):
+            detected = detect(text)
+
+        if policy.get('require_marker_or_detected') and not p.spanish and detected != lang:
+            return None, f"No {lang.upper()} indicators found"
+        if detected in policy.get('reject_detected', ()):
+            return None, f"Detected as {detected}"
+        if detected is not None and 'accept_detected' in policy and detected not in policy['accept_detected']:
+            return None, f"Detected as {detected}"
+        return lang, "script policy passed"
+
+
+def load_romanized_hindi(dict_dir=None):
+    """Romanized Hindi words from the bundled Hindi dictionary keys"""
+    dict_dir = dict_dir or os.path.join(os.path.dirname(__file__), 'dictionaries')
+    try:
+        with open(os.path.join(dict_dir, 'hindi_dict.json'), 'r', encoding='utf-8') as f:
+            return list(json.load(f))
+    except Exception as e:
+        print(f"[SCRIPT] Error loading romanized Hindi lexicon: {e}")
+        return []
+
+
+# Global instance
+script_profiler = ScriptProfiler(load_romanized_hindi())
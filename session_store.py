@@ -0,0 +1,66 @@
+"""
+Server-side Session Store for LinguaVoice
+Holds large per-session values (e.g. generated level word lists) in the
+session_blobs table so the Flask cookie session only has to carry a short store id
+"""
+import json
+import time
+import uuid
+import storage
+
+
+class SessionStore:
+    """Database-backed key/value store scoped by a session id, with age-based eviction"""
+
+    def __init__(self, ttl_seconds=7 * 24 * 3600, evict_every=100):
+        self.ttl_seconds = ttl_seconds
+        self.evict_every = evict_every
+        self.writes = 0
+
+    def new_session_id(self):
+        return uuid.uuid4().hex
+
+    def get(self, session_id, name, default=None):
+        """Return the stored value for (session_id, name), or default"""
+        if not session_id:
+            return default
+
+        row = storage.store.query_one(
+            "SELECT data, updated_at FROM session_blobs WHERE session_id=? AND name=?",
+            (session_id, name)
+        )
+
+        if not row or time.time() - row[1] > self.ttl_seconds:
+            return default
+        return json.loads(row[0])
+
+    def set(self, session_id, name, value):
+        """Store a JSON-serialisable value under (session_id, name)"""
+        storage.store.upsert('session_blobs', {
+            'session_id': session_id, 'name': name,
+            'data': json.dumps(value, ensure_ascii=False), 'updated_at': time.time()
+        }, keys=('session_id', 'name'))
+
+        self.writes += 1
+        if self.writes % self.evict_every == 0:
+            self.evict_expired()
+
+    def clear(self, session_id):
+        """Drop everything stored for a session (e.g. on logout)"""
+        if not session_id:
+            return
+        storage.store.execute("DELETE FROM session_blobs WHERE session_id=?", (session_id,))
+
+    def evict_expired(self):
+        """Delete entries older than the TTL"""
+        removed = storage.store.execute(
+            "DELETE FROM session_blobs WHERE updated_at < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+        if removed:
+            print(f"[SESSION_STORE] Evicted {removed} expired entries")
+        return removed
+
+
+# Global instance
+session_store = SessionStore()
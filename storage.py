@@ -0,0 +1,668 @@
+"""
+Storage Layer for LinguaVoice
+Repositories for users, transcripts, vocabulary, reviews, progress, stats,
+lessons and completed levels on top of a pluggable backend: the local SQLite file (default) or a
+MySQL/PostgreSQL server through a pooled driver, selected with
+STORAGE_BACKEND / DATABASE_URL in config.py.
+
+Queries are written once with '?' placeholders and portable SQL; the
+backend rewrites placeholders and upserts for its dialect. Server schemas
+and data are created by migrate_storage.py. The derived counters
+(user_stats, daily_stats, vocabulary_versions) are kept by triggers:
+database_manager.py creates them on SQLite, migrate_storage.py on servers.
+"""
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, unquote
+from config import STORAGE_BACKEND, DATABASE_URL, DB_POOL_SIZE, DB_POOL_TIMEOUT
+from database_manager import db
+
+
+# Statements bind at most this many values in an IN (...) list (SQLite caps
+# bound parameters per statement)
+LOOKUP_CHUNK = 500
+
+
+class StorageError(Exception):
+    """Backend misconfiguration or missing driver"""
+
+
+class SQLiteBackend:
+    """The local SQLite database (schema managed by DatabaseManager)"""
+
+    dialect = 'sqlite'
+
+    def __init__(self, path):
+        self.path = path
+        self.integrity_errors = (sqlite3.IntegrityError,)
+
+    def acquire(self):
+        return sqlite3.connect(self.path, check_same_thread=False)
+
+    def release(self, conn):
+        conn.close()
+
+    def sql(self, query):
+        return query
+
+    def excluded(self, column):
+        """The value an upsert tried to insert, for use in its update expressions"""
+        return f"excluded.{column}"
+
+    def on_conflict(self, keys, assignments):
+        """Upsert clause applying `assignments` ("col = expr") when `keys` already exist"""
+        if not assignments:
+            return f" ON CONFLICT({', '.join(keys)}) DO NOTHING"
+        return f" ON CONFLICT({', '.join(keys)}) DO UPDATE SET {', '.join(assignments)}"
+
+    def upsert_clause(self, keys, columns):
+        return self.on_conflict(keys, [f"{c}={self.excluded(c)}" for c in columns])
+
+    def describe(self):
+        return {'backend': 'sqlite', 'path': self.path}
+
+
+class ConnectionPool:
+    """Fixed-size pool: idle connections are reused, new ones opened up to `size`"""
+
+    def __init__(self, connect, size, timeout):
+        self.connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.idle = queue.LifoQueue()
+        self.opened = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            if self.opened < self.size:
+                self.opened += 1
+                try:
+                    return self.connect()
+                except Exception:
+                    self.opened -= 1
+                    raise
+        try:
+            return self.idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise StorageError(f"No database connection available within {self.timeout}s (pool size {self.size})")
+
+    def release(self, conn, broken=False):
+        if broken:
+            with self.lock:
+                self.opened -= 1
+            try:
+                conn.close()
+            except Exception:
+                pass
+            return
+        self.idle.put(conn)
+
+
+class ServerBackend:
+    """MySQL (PyMySQL) or PostgreSQL (psycopg2) behind a connection pool"""
+
+    SCHEMES = {'mysql': 'mysql', 'mysql+pymysql': 'mysql', 'postgres': 'postgresql', 'postgresql': 'postgresql'}
+
+    def __init__(self, url, pool_size=DB_POOL_SIZE, pool_timeout=DB_POOL_TIMEOUT):
+        parsed = urlparse(url)
+        self.dialect = self.SCHEMES.get(parsed.scheme)
+        if self.dialect is None:
+            raise StorageError(f"Unsupported DATABASE_URL scheme: {parsed.scheme!r}")
+        self.params = {
+            'host': parsed.hostname or 'localhost',
+            'port': parsed.port,
+            'user': unquote(parsed.username or ''),
+            'password': unquote(parsed.password or ''),
+            'database': parsed.path.lstrip('/'),
+        }
+        self.driver = self._load_driver()
+        self.integrity_errors = (self.driver.IntegrityError,)
+        self.pool = ConnectionPool(self._connect, pool_size, pool_timeout)
+
+    def _load_driver(self):
+        try:
+            if self.dialect == 'mysql':
+                import pymysql
+                return pymysql
+            import psycopg2
+            return psycopg2
+        except ImportError as e:
+            package = 'PyMySQL' if self.dialect == 'mysql' else 'psycopg2-binary'
+            raise StorageError(f"{self.dialect} backend needs the {package} package: {e}")
+
+    def _connect(self):
+        p = self.params
+        if self.dialect == 'mysql':
+            return self.driver.connect(host=p['host'], port=p['port'] or 3306, user=p['user'],
+                                       password=p['password'], database=p['database'], charset='utf8mb4')
+        return self.driver.connect(host=p['host'], port=p['port'] or 5432, user=p['user'],
+                                   password=p['password'], dbname=p['database'])
+
+    def acquire(self):
+        conn = self.pool.acquire()
+        try:
+            if self.dialect == 'mysql':
+                conn.ping(reconnect=True)
+            elif conn.closed:
+                raise self.driver.InterfaceError("connection closed")
+        except Exception:
+            self.pool.release(conn, broken=True)
+            return self.acquire()
+        return conn
+
+    def release(self, conn):
+        try:
+            conn.rollback()  # never hand out a connection with an open transaction
+        except Exception:
+            self.pool.release(conn, broken=True)
+            return
+        self.pool.release(conn)
+
+    def sql(self, query):
+        return query.replace('?', '%s')
+
+    def excluded(self, column):
+        return f"VALUES({column})" if self.dialect == 'mysql' else f"excluded.{column}"
+
+    def on_conflict(self, keys, assignments):
+        # MySQL applies assignments left to right, each seeing the ones before
+        # it: callers list the columns other expressions read last
+        if self.dialect == 'mysql':
+            assignments = assignments or [f"{keys[0]}={keys[0]}"]  # no DO NOTHING; a no-op assignment instead
+            return " ON DUPLICATE KEY UPDATE " + ', '.join(assignments)
+        if not assignments:
+            return f" ON CONFLICT({', '.join(keys)}) DO NOTHING"
+        return f" ON CONFLICT({', '.join(keys)}) DO UPDATE SET {', '.join(assignments)}"
+
+    def upsert_clause(self, keys, columns):
+        return self.on_conflict(keys, [f"{c}={self.excluded(c)}" for c in columns])
+
+    def describe(self):
+        return {'backend': self.dialect, 'host': self.params['host'], 'database': self.params['database'],
+                'pool_size': self.pool.size, 'pool_open': self.pool.opened}
+
+
+class Store:
+    """Runs portable SQL against a backend"""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    @contextmanager
+    def transaction(self, cursor=None):
+        """
+        Cursor whose statements commit together (rolled back on error). Given
+        the cursor of an open transaction, joins it instead: the caller commits.
+        """
+        if cursor is not None:
+            yield cursor
+            return
+        conn = self.backend.acquire()
+        try:
+            cursor = conn.cursor()
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.backend.release(conn)
+
+    def query(self, sql, params=(), cursor=None):
+        with self.transaction(cursor) as cursor:
+            cursor.execute(self.backend.sql(sql), params)
+            return cursor.fetchall()
+
+    def query_one(self, sql, params=(), cursor=None):
+        rows = self.query(sql, params, cursor=cursor)
+        return rows[0] if rows else None
+
+    def execute(self, sql, params=(), cursor=None):
+        """Run a write; returns the number of affected rows"""
+        with self.transaction(cursor) as cursor:
+            cursor.execute(self.backend.sql(sql), params)
+            return cursor.rowcount
+
+    def executemany(self, sql, rows, cursor=None):
+        rows = list(rows)
+        if rows:
+            with self.transaction(cursor) as cursor:
+                cursor.executemany(self.backend.sql(sql), rows)
+
+    def insert(self, table, values, cursor=None):
+        """Insert one row and return its generated id"""
+        columns = list(values)
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        if self.backend.dialect == 'postgresql':
+            sql += " RETURNING id"
+        with self.transaction(cursor) as cursor:
+            cursor.execute(self.backend.sql(sql), [values[c] for c in columns])
+            return cursor.fetchone()[0] if self.backend.dialect == 'postgresql' else cursor.lastrowid
+
+    def upsert(self, table, values, keys, cursor=None):
+        """Insert a row or, if `keys` already exist, overwrite its other columns"""
+        columns = list(values)
+        sql = (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+               + self.backend.upsert_clause(list(keys), [c for c in columns if c not in keys]))
+        return self.execute(sql, [values[c] for c in columns], cursor=cursor)
+
+
+class UserRepository:
+    def __init__(self, store):
+        self.store = store
+
+    def create(self, email, password_hash, name, target_language=None):
+        """New user id, or None if the email is taken"""
+        try:
+            return self.store.insert('users', {
+                'email': email, 'password_hash': password_hash,
+                'name': name, 'target_language': target_language,
+                'created_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            })
+        except self.store.backend.integrity_errors:
+            return None
+
+    def by_email(self, email):
+        row = self.store.query_one("SELECT id, password_hash, name, target_language FROM users WHERE email=?", (email,))
+        if row:
+            return {"id": row[0], "password_hash": row[1], "name": row[2], "email": email, "target_language": row[3]}
+        return None
+
+    def by_id(self, user_id):
+        row = self.store.query_one("SELECT id, name, email, target_language FROM users WHERE id=?", (user_id,))
+        if row:
+            return {"id": row[0], "name": row[1], "email": row[2], "target_language": row[3]}
+        return None
+
+    def target_language(self, user_id, default=None):
+        row = self.store.query_one("SELECT target_language FROM users WHERE id=?", (user_id,))
+        return row[0] if row and row[0] else default
+
+    def set_target_language(self, user_id, language):
+        self.store.execute("UPDATE users SET target_language=? WHERE id=?", (language, user_id))
+
+
+class TranscriptRepository:
+    def __init__(self, store):
+        self.store = store
+
+    def add(self, user_id, language, text, audio_file=None, audio_start_ms=None, audio_end_ms=None, timestamp=None):
+        return self.store.insert('transcripts', {
+            'user_id': user_id,
+            'timestamp': timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'language': language,
+            'text': text,
+            'audio_file': audio_file,
+            'audio_start_ms': audio_start_ms,
+            'audio_end_ms': audio_end_ms,
+        })
+
+    def page(self, user_id, since_id=None, before_id=None, limit=50):
+        """Newer than since_id (oldest first), or newest first optionally before before_id"""
+        query = "SELECT id, timestamp, language, text, audio_file FROM transcripts WHERE user_id=?"
+        params = [user_id]
+        if since_id is not None:
+            query += " AND id > ? ORDER BY id ASC"
+            params.append(since_id)
+        else:
+            if before_id is not None:
+                query += " AND id < ?"
+                params.append(before_id)
+            query += " ORDER BY id DESC"
+        query += " LIMIT ?"
+        params.append(limit)
+        return [{"id": r[0], "timestamp": r[1], "language": r[2], "text": r[3], "audio_file": r[4]}
+                for r in self.store.query(query, params)]
+
+    def latest_id(self, user_id):
+        row = self.store.query_one("SELECT MAX(id) FROM transcripts WHERE user_id=?", (user_id,))
+        return row[0] if row else None
+
+    def recent(self, user_id, seconds):
+        """Transcripts of the last `seconds` seconds, oldest first (timestamps are local time)"""
+        cutoff = (datetime.now() - timedelta(seconds=seconds)).strftime("%Y-%m-%d %H:%M:%S")
+        rows = self.store.query(
+            "SELECT text, language, timestamp FROM transcripts WHERE user_id=? AND timestamp >= ? ORDER BY timestamp ASC",
+            (user_id, cutoff)
+        )
+        return [{"text": r[0], "language": r[1], "id": str(r[2])} for r in rows]
+
+
+    def clear_audio(self, paths):
+        """Unlink transcripts from deleted clip files"""
+        with self.store.transaction() as cursor:
+            for i in range(0, len(paths), 500):
+                batch = paths[i:i + 500]
+                cursor.execute(self.store.backend.sql(
+                    f"UPDATE transcripts SET audio_file=NULL WHERE audio_file IN ({','.join('?' * len(batch))})"
+                ), batch)
+
+
+class VocabularyRepository:
+    def __init__(self, store):
+        self.store = store
+
+    def words(self, user_id, language=None):
+        query = "SELECT word FROM vocabulary WHERE user_id=?"
+        params = [user_id]
+        if language:
+            query += " AND language=?"
+            params.append(language)
+        return [r[0] for r in self.store.query(query, params)]
+
+    def entries(self, user_id):
+        """(word, language, meaning) of every word the user has"""
+        return self.store.query("SELECT word, language, meaning FROM vocabulary WHERE user_id=?", (user_id,))
+
+    def meaning(self, user_id, word, language):
+        """(meaning, is_valid) of a stored word, or None"""
+        return self.store.query_one(
+            "SELECT meaning, is_valid FROM vocabulary WHERE user_id=? AND word=? AND language=?",
+            (user_id, word, language)
+        )
+
+    def set_meaning(self, user_id, word, language, meaning, **columns):
+        """Update a stored word's meaning (and any other vocabulary columns given)"""
+        values = {'meaning': meaning, **columns}
+        self.store.execute(
+            f"UPDATE vocabulary SET {', '.join(f'{c}=?' for c in values)} WHERE user_id=? AND word=? AND language=?",
+            [*values.values(), user_id, word, language]
+        )
+
+    def add(self, user_id, word, language, seen, due_at, cursor=None, **columns):
+        """New word, due for review at `due_at` (extra vocabulary columns as keywords)"""
+        return self.store.insert('vocabulary', {
+            'user_id': user_id, 'word': word, 'language': language,
+            'first_seen': seen, 'last_practiced': seen, 'due_at': due_at, **columns
+        }, cursor=cursor)
+
+    def practice(self, user_id, word, language, day, cursor=None):
+        """Count another use of a word; False if the user does not have it yet"""
+        return self.store.execute(
+            "UPDATE vocabulary SET frequency=COALESCE(frequency, 0)+1, last_practiced=? WHERE user_id=? AND word=? AND language=?",
+            (day, user_id, word, language), cursor=cursor
+        ) > 0
+
+    def record_oov(self, user_id, word, language, day, cursor=None):
+        """Note a word missing from the offline vocabulary (occurrences counted per sighting)"""
+        backend = self.store.backend
+        self.store.execute(
+            "INSERT INTO oov_words (user_id, word, language, first_seen, last_seen, occurrences) VALUES (?, ?, ?, ?, ?, 1)"
+            + backend.on_conflict(('user_id', 'word', 'language'), [
+                f"last_seen={backend.excluded('last_seen')}", "occurrences=oov_words.occurrences+1"
+            ]),
+            (user_id, word, language, day, day), cursor=cursor
+        )
+
+    def oov(self, user_id, language=None):
+        query = "SELECT word, language, first_seen, last_seen, occurrences FROM oov_words WHERE user_id=?"
+        params = [user_id]
+        if language:
+            query += " AND language=?"
+            params.append(language)
+        rows = self.store.query(query + " ORDER BY last_seen DESC", params)
+        return [{'word': r[0], 'language': r[1], 'first_seen': r[2], 'last_seen': r[3], 'occurrences': r[4]} for r in rows]
+
+    def added_since(self, user_id, day, language=None):
+        """(first_seen, word, language) of words first seen on or after `day`, newest first"""
+        query = "SELECT first_seen, word, language FROM vocabulary WHERE user_id=? AND first_seen >= ?"
+        params = [user_id, day]
+        if language:
+            query += " AND language=?"
+            params.append(language)
+        return self.store.query(query + " ORDER BY first_seen DESC", params)
+
+    def recent(self, user_id, language=None, limit=200):
+        """Words with their practice counts, most recently practiced first"""
+        query = """SELECT word, language, first_seen, frequency, mastery_level, correct_attempts, incorrect_attempts
+                   FROM vocabulary WHERE user_id=?"""
+        params = [user_id]
+        if language:
+            query += " AND language=?"
+            params.append(language)
+        query += " ORDER BY last_practiced DESC LIMIT ?"
+        params.append(limit)
+        return [
+            {
+                'word': r[0],
+                'language': r[1],
+                'first_seen': r[2],
+                'frequency': r[3],
+                'mastery_level': r[4],
+                'correct_attempts': r[5],
+                'incorrect_attempts': r[6]
+            } for r in self.store.query(query, params)
+        ]
+
+    def count(self, user_id, language):
+        return self.store.query_one("SELECT COUNT(*) FROM vocabulary WHERE user_id=? AND language=?", (user_id, language))[0]
+
+    def page(self, user_id, columns, language=None, after=None, limit=None):
+        """
+        Rows of (id, COALESCE(last_practiced, ''), *columns), most recently
+        practiced first, continuing after the (last_practiced, id) key `after`
+        """
+        query = f"""SELECT id, COALESCE(last_practiced, ''){', ' + ', '.join(columns) if columns else ''}
+                    FROM vocabulary WHERE user_id=?"""
+        params = [user_id]
+        if language:
+            query += " AND language=?"
+            params.append(language)
+        if after:
+            last_key, last_id = after
+            query += """ AND COALESCE(last_practiced, '') <= ?
+                         AND (COALESCE(last_practiced, '') < ? OR id < ?)"""
+            params += [last_key, last_key, last_id]
+        query += " ORDER BY COALESCE(last_practiced, '') DESC, id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return self.store.query(query, params)
+
+    def version(self, user_id):
+        """Counter that changes whenever any of the user's vocabulary rows change"""
+        row = self.store.query_one("SELECT version FROM vocabulary_versions WHERE user_id=?", (user_id,))
+        return row[0] if row else 0
+
+
+class ReviewRepository:
+    """Spaced-repetition state on vocabulary rows and the answer log (performance_analytics)"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def due(self, user_id, language, due_by, limit):
+        """Cards due by `due_by`, most overdue first"""
+        rows = self.store.query("""
+            SELECT word, meaning, mastery_level, ease_factor, interval_days, repetitions, due_at
+            FROM vocabulary
+            WHERE user_id=? AND language=? AND due_at <= ?
+            ORDER BY due_at
+            LIMIT ?
+        """, (user_id, language, due_by, limit))
+        return [
+            {
+                'word': r[0],
+                'meaning': r[1],
+                'mastery_level': r[2] or 0,
+                'ease_factor': r[3],
+                'interval_days': r[4],
+                'repetitions': r[5],
+                'due_at': r[6]
+            } for r in rows
+        ]
+
+    def due_count(self, user_id, language, due_by):
+        return self.store.query_one(
+            "SELECT COUNT(*) FROM vocabulary WHERE user_id=? AND language=? AND due_at <= ?",
+            (user_id, language, due_by)
+        )[0]
+
+    def states(self, user_id, language, words, cursor=None):
+        """{word: [ease_factor, interval_days, repetitions, lapses, correct_attempts, incorrect_attempts]}"""
+        states = {}
+        for i in range(0, len(words), LOOKUP_CHUNK):
+            chunk = words[i:i + LOOKUP_CHUNK]
+            for row in self.store.query(f"""
+                SELECT word, ease_factor, interval_days, repetitions, lapses, correct_attempts, incorrect_attempts
+                FROM vocabulary WHERE user_id=? AND language=? AND word IN ({','.join('?' * len(chunk))})
+            """, [user_id, language] + chunk, cursor=cursor):
+                states[row[0]] = [row[1], row[2], row[3] or 0, row[4] or 0, row[5] or 0, row[6] or 0]
+        return states
+
+    def save(self, updates, answers, cursor=None):
+        """
+        updates: (ease, interval, repetitions, lapses, due_at, mastery, correct, incorrect,
+        last_practiced, user_id, word, language) rows; answers: performance_analytics rows
+        (user_id, language, word, lesson_type, response_time, is_correct, timestamp, difficulty_level)
+        """
+        with self.store.transaction(cursor) as cursor:
+            self.store.executemany("""
+                UPDATE vocabulary
+                SET ease_factor=?, interval_days=?, repetitions=?, lapses=?, due_at=?, mastery_level=?,
+                    correct_attempts=?, incorrect_attempts=?, last_practiced=?
+                WHERE user_id=? AND word=? AND language=?
+            """, updates, cursor=cursor)
+            self.store.executemany("""
+                INSERT INTO performance_analytics
+                (user_id, language, word, lesson_type, response_time, is_correct, timestamp, difficulty_level)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, answers, cursor=cursor)
+
+
+class ProgressRepository:
+    def __init__(self, store):
+        self.store = store
+
+    def latest_language(self, user_id):
+        """Language the user was most recently active in, or None"""
+        row = self.store.query_one(
+            "SELECT language FROM user_progress WHERE user_id=? ORDER BY last_activity DESC LIMIT 1", (user_id,)
+        )
+        return row[0] if row else None
+
+    def get(self, user_id, language):
+        """(total_xp, current_level, streak_days), or None for a language not started yet"""
+        return self.store.query_one(
+            "SELECT total_xp, current_level, streak_days FROM user_progress WHERE user_id=? AND language=?",
+            (user_id, language)
+        )
+
+    def all(self, user_id):
+        """(language, total_xp, current_level, streak_days) per language"""
+        return self.store.query(
+            "SELECT language, total_xp, current_level, streak_days FROM user_progress WHERE user_id=?", (user_id,)
+        )
+
+    def log_words_learned(self, user_id, language, day, count):
+        """Add to the day's learning_sessions row"""
+        with self.store.transaction() as cursor:
+            if self.store.query_one(
+                "SELECT 1 FROM learning_sessions WHERE user_id=? AND language=? AND session_date=?",
+                (user_id, language, day), cursor=cursor
+            ):
+                self.store.execute(
+                    "UPDATE learning_sessions SET words_learned=words_learned+? WHERE user_id=? AND language=? AND session_date=?",
+                    (count, user_id, language, day), cursor=cursor
+                )
+            else:
+                self.store.insert('learning_sessions', {
+                    'user_id': user_id, 'language': language, 'session_date': day, 'words_learned': count
+                }, cursor=cursor)
+
+
+class StatsRepository:
+    """The trigger-maintained rollups: user_stats and daily_stats"""
+
+    def __init__(self, store):
+        self.store = store
+
+    def by_language(self, user_id):
+        """(language, total_xp, current_level, streak_days, vocabulary_count, oov_count, transcript_count)"""
+        return self.store.query("""
+            SELECT language, total_xp, current_level, streak_days,
+                   vocabulary_count, oov_count, transcript_count
+            FROM user_stats WHERE user_id=?
+        """, (user_id,))
+
+    def daily(self, user_id, since, language=None):
+        """
+        {day: (attempts, correct, response_time_total, response_time_count, words_learned)}
+        from `since` on, summed over languages unless one is given
+        """
+        query = """SELECT day, SUM(attempts), SUM(correct), SUM(response_time_total),
+                          SUM(response_time_count), SUM(words_learned)
+                   FROM daily_stats WHERE user_id=? AND day >= ?"""
+        params = [user_id, since]
+        if language:
+            query += " AND language=?"
+            params.append(language)
+        # Server SUMs come back as Decimal; normalise so callers can mix them with floats
+        return {r[0]: (int(r[1] or 0), int(r[2] or 0), float(r[3] or 0), int(r[4] or 0), int(r[5] or 0))
+                for r in self.store.query(query + " GROUP BY day", params)}
+
+
+class LessonRepository:
+    def __init__(self, store):
+        self.store = store
+
+    def content(self, language, level):
+        """JSON content of a lesson for the language and level, or None"""
+        row = self.store.query_one("SELECT content FROM lessons WHERE language=? AND level=? LIMIT 1", (language, level))
+        return row[0] if row else None
+
+
+class LevelRepository:
+    def __init__(self, store):
+        self.store = store
+
+    def completed(self, user_id):
+        """Passed level ids, ascending"""
+        rows = self.store.query(
+            "SELECT level_id FROM user_completed_levels WHERE user_id=? AND passed=1 ORDER BY level_id", (user_id,)
+        )
+        return [r[0] for r in rows]
+
+    def current_level(self, user_id):
+        completed = self.completed(user_id)
+        return max(completed) + 1 if completed else 1
+
+    def save(self, user_id, level_id, xp_earned, score, passed):
+        self.store.upsert('user_completed_levels', {
+            'user_id': user_id, 'level_id': level_id, 'xp_earned': xp_earned,
+            'score': score, 'passed': int(bool(passed)),
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }, keys=('user_id', 'level_id'))
+
+
+def create_backend(kind=STORAGE_BACKEND, url=DATABASE_URL):
+    if kind == 'sqlite':
+        return SQLiteBackend(db.db_name)
+    if kind not in ('mysql', 'postgresql'):
+        raise StorageError(f"Unknown STORAGE_BACKEND: {kind}")
+    if not url:
+        raise StorageError(f"STORAGE_BACKEND={kind} needs DATABASE_URL")
+    backend = ServerBackend(url)
+    if backend.dialect != kind:
+        raise StorageError(f"STORAGE_BACKEND={kind} does not match DATABASE_URL ({backend.dialect})")
+    return backend
+
+
+# Global instances
+store = Store(create_backend())
+users = UserRepository(store)
+transcripts = TranscriptRepository(store)
+vocabulary = VocabularyRepository(store)
+reviews = ReviewRepository(store)
+progress = ProgressRepository(store)
+stats = StatsRepository(store)
+lessons = LessonRepository(store)
+levels = LevelRepository(store)
@@ -0,0 +1,130 @@
+"""
+Tokenizer for LinguaVoice
+Shared word extraction for the chatbot, validator and transcriber: Unicode
+normalization, precompiled word patterns that keep Devanagari vowel signs
+inside words, per-language stop words (dictionaries/stopwords.json) and
+merging of multiword vocabulary entries such as "por favor".
+"""
+import json
+import os
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional
+
+STOPWORDS_FILE = os.path.join(os.path.dirname(__file__), 'dictionaries', 'stopwords.json')
+
+# Latin letters (incl. accented Latin-1/Latin Extended-A) and Devanagari
+# letters, vowel signs, nukta and virama; apostrophes are kept inside
+# contractions ("don't"). Digits, danda and punctuation separate words.
+_LETTERS = 'a-zà-öø-ÿĀ-ſऀ-ॣ०-ॿ'
+WORD_RE = re.compile(f"[{_LETTERS}]+(?:['’][{_LETTERS}]+)*")
+
+# Shortest word kept as vocabulary, in code points
+MIN_WORD_LENGTH = {'en': 3, 'es': 3, 'hi': 2}
+DEFAULT_MIN_WORD_LENGTH = 3
+
+
+def fold_accents(text: str) -> str:
+    """
+    Lowercase and strip Latin diacritics (é -> e, ñ -> n, ü -> u).
+    Only the Combining Diacritical Marks block is removed, so Devanagari
+    vowel signs, nukta and virama are left untouched.
+    """
+    decomposed = unicodedata.normalize('NFD', text.lower())
+    stripped = ''.join(c for c in decomposed if not 0x0300 <= ord(c) <= 0x036F)
+    return unicodedata.normalize('NFC', stripped)
+
+
+def normalize_text(text: str, fold: bool = False) -> str:
+    """NFC-normalize and lowercase (optionally also fold Latin accents)"""
+    text = unicodedata.normalize('NFC', text).lower().replace('’', "'")
+    return fold_accents(text) if fold else text
+
+
+class Tokenizer:
+    """Per-language word extraction with stop words and multiword entries"""
+
+    def __init__(self, stopwords: Optional[Dict[str, Iterable[str]]] = None,
+                 multiwords: Optional[Dict[str, Iterable[str]]] = None):
+        self.stopwords: Dict[str, frozenset] = {}
+        self.multiwords: Dict[str, Dict[str, List[tuple]]] = {}  # lang -> first token -> phrases, longest first
+        for language, words in (stopwords or {}).items():
+            self.set_stopwords(language, words)
+        for language, phrases in (multiwords or {}).items():
+            self.add_multiwords(language, phrases)
+
+    def set_stopwords(self, language: str, words: Iterable[str]):
+        self.stopwords[language] = frozenset(normalize_text(w) for w in words)
+
+    def add_multiwords(self, language: str, phrases: Iterable[str]):
+        """Register phrases that should come out as a single token"""
+        table = self.multiwords.setdefault(language, {})
+        for phrase in phrases:
+            tokens = tuple(WORD_RE.findall(normalize_text(phrase)))
+            if len(tokens) < 2:
+                continue
+            entries = table.setdefault(tokens[0], [])
+            if tokens not in entries:
+                entries.append(tokens)
+                entries.sort(key=len, reverse=True)
+
+    def tokenize(self, text: str, language: Optional[str] = None, fold: bool = False) -> List[str]:
+        """All word tokens in order, with multiword entries merged"""
+        tokens = WORD_RE.findall(normalize_text(text))
+        table = self.multiwords.get(language)
+        if table:
+            tokens = self._merge_multiwords(tokens, table)
+        if fold:
+            tokens = [fold_accents(t) for t in tokens]
+        return tokens
+
+    def _merge_multiwords(self, tokens: List[str], table: Dict[str, List[tuple]]) -> List[str]:
+        merged = []
+        i = 0
+        while i < len(tokens):
+            for phrase in table.get(tokens[i], ()):
+                if tuple(tokens[i:i + len(phrase)]) == phrase:
+                    merged.append(' '.join(phrase))
+                    i += len(phrase)
+                    break
+            else:
+                merged.append(tokens[i])
+                i += 1
+        return merged
+
+    def is_stopword(self, word: str, language: Optional[str]) -> bool:
+        return word in self.stopwords.get(language, ())
+
+    def content_words(self, text: str, language: Optional[str] = None, fold: bool = False) -> List[str]:
+        """
+        Vocabulary-worthy words: tokens minus stop words and words shorter
+        than the language's minimum length (multiword entries are always kept).
+        """
+        stopwords = self.stopwords.get(language, frozenset())
+        min_length = MIN_WORD_LENGTH.get(language, DEFAULT_MIN_WORD_LENGTH)
+        return [
+            t for t in self.tokenize(text, language, fold)
+            if t not in stopwords and (len(t) >= min_length or ' ' in t)
+        ]
+
+    def normalize_word(self, word: str) -> str:
+        """Canonical form of a single word for storage and lookups"""
+        return ' '.join(WORD_RE.findall(normalize_text(word))) or normalize_text(word).strip()
+
+
+def load_stopwords(path: str = STOPWORDS_FILE) -> Dict[str, List[str]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[TOKENIZER] Error loading stop words: {e}")
+        return {}
+
+
+def _default_multiwords() -> Dict[str, List[str]]:
+    from offline_vocab import offline_vocab
+    return {language: [w for w in offline_vocab.all_words(language) if ' ' in w] for language in offline_vocab.words}
+
+
+# Global instance
+tokenizer = Tokenizer(stopwords=load_stopwords(), multiwords=_default_multiwords())
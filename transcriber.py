@@ -1,13 +1,22 @@
-import os, queue, json, time, threading, wave
+import os, json, time, threading
+from concurrent.futures import ThreadPoolExecutor
 try:
     import sounddevice as sd
 except ImportError:
     print("Warning: sounddevice not available, audio recording disabled")
     sd = None
 import vosk
-from database_manager import db # Unified DB
+import storage
+from transcript_recorder import record_transcript
+from clip_store import clip_store
+from decoder_pool import decoder_pool
+from audio_buffer import BlockQueue, AudioRingBuffer, RecognizerClock, SpeechSegmenter
+from config import (MULTI_LANGUAGE_DECODING, MULTI_LANGUAGE_VAD_RMS,
+                    MULTI_LANGUAGE_MAX_SEGMENT_SEC, MULTI_LANGUAGE_DETECTOR_WEIGHT)
 
 from language_detector import OfflineLanguageDetector
+from script_profiler import script_profiler
+from offline_vocab import offline_vocab
 
 # Global Active User Context
 active_user_id = None
@@ -31,6 +40,15 @@ def set_active_language(lang):
     else:
         print(f"[TRANSCRIBER] Warning: Invalid language '{lang}' requested", flush=True)
 
+# Multi-language mode: decode speech segments with every model (opt-in)
+multi_language_enabled = MULTI_LANGUAGE_DECODING
+
+def set_multi_language(enabled):
+    global multi_language_enabled
+    multi_language_enabled = bool(enabled)
+    speech_segmenter.reset()
+    print(f"[TRANSCRIBER] Multi-language decoding {'enabled' if multi_language_enabled else 'disabled'}", flush=True)
+
     
 def detect_language_offline(text):
     return lang_detector.detect_language(text)
@@ -50,6 +68,11 @@ models_loaded = False
 
 def _load_models_task():
     global models_loaded
+    if decoder_pool.size:
+        # Models live in the decoder processes, not in this one
+        decoder_pool.start(MODEL_PATHS)
+        models_loaded = True
+        return
     print("Loading Vosk models in background...", flush=True)
     for lang, path in MODEL_PATHS.items():
         if not os.path.exists(path):
@@ -69,91 +92,166 @@ def _load_models_task():
     models_loaded = True
     print("[OK] All models loaded successfully!", flush=True)
 
+def loaded_languages():
+    """Languages that can be decoded right now (in-process models or the decoder pool)"""
+    return decoder_pool.languages if decoder_pool.size else list(models)
+
 # Start loading thread immediately
 threading.Thread(target=_load_models_task, daemon=True).start()
 
 DB_FILE = "transcriptions.db"
-AUDIO_DIR = "audio_clips"
-os.makedirs(AUDIO_DIR, exist_ok=True)
-
-q = queue.Queue()
+AUDIO_DIR = clip_store.root
+
+SAMPLE_RATE = 16000
+BYTES_PER_SEC = SAMPLE_RATE * 2 # 16kHz * 16-bit
+BLOCK_FRAMES = 8000
+RING_SECONDS = 30
+CLIP_PADDING_SEC = 0.2 # Audio kept either side of the first/last word
+
+# Preallocated capture path: the callback copies into a bounded block queue
+# (oldest blocks dropped if decoding falls behind), and the loop keeps the
+# most recent audio in a ring buffer shared by the VAD and clip saver
+block_queue = BlockQueue(BLOCK_FRAMES * 2, slots=32, policy='drop_oldest')
+audio_ring = AudioRingBuffer(BYTES_PER_SEC * RING_SECONDS)
+recognizer_clocks = {} # lang -> RecognizerClock, maps word timings to ring positions
+
+# Multi-language mode: the VAD closes speech segments, each segment is decoded
+# by all models at once (Vosk releases the GIL while decoding). At most
+# MAX_PENDING_SEGMENTS wait for decoding; further segments are dropped.
+MAX_PENDING_SEGMENTS = 2
+speech_segmenter = SpeechSegmenter(
+    threshold=MULTI_LANGUAGE_VAD_RMS,
+    pre_roll=BYTES_PER_SEC // 2,
+    hangover=BYTES_PER_SEC,
+    max_bytes=int(BYTES_PER_SEC * MULTI_LANGUAGE_MAX_SEGMENT_SEC) & ~1
+)
+segment_slots = threading.BoundedSemaphore(MAX_PENDING_SEGMENTS)
+segment_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="segment")
+decode_pool = ThreadPoolExecutor(max_workers=len(MODEL_PATHS), thread_name_prefix="decode")
+MIC_SESSION = "mic" # decoder pool session of the microphone stream
 stop_event = threading.Event()
 listener_thread = None
+is_listening = False
 
 
-from adaptive_chatbot import AdaptiveChatbot
+# Latin-script Hindi in the offline vocabulary counts as Hindi, not English
+script_profiler.add_romanized_hindi(offline_vocab.all_words('hi'))
 
-# Initialize Chatbot for Learning Tracking
-chatbot = AdaptiveChatbot()
 
-def validate_word_task(user_id, word, lang):
-    # This is a helper to bridge the gap since we are refactoring
-    # Ideally, WordValidator should be singleton or util
-    from word_validator import WordValidator
-    validator = WordValidator()
-    validator.validate_and_store_word(user_id, word, lang)
+# Replaces init_db and standardizes saving
+def save_transcript(text, lang, audio_path=None, audio_start_ms=None, audio_end_ms=None):
+    return record_transcript(active_user_id, text, lang, audio_path, audio_start_ms, audio_end_ms)
 
 
-# Replaces init_db and standardizes saving
-def save_transcript(text, lang, audio_path=None):
-    if active_user_id is None:
-        # print("No active user, skipping transcript save", flush=True)
-        return
+def save_audio_chunk(raw_data, lang):
+    return clip_store.save(raw_data, user_id=active_user_id, lang=lang)
 
-    ts = time.strftime("%Y-%m-%d %H:%M:%S")
-    
-    conn = db.get_connection()
-    conn.execute(
-        "INSERT INTO transcripts (user_id, timestamp, language, text, audio_file) VALUES (?, ?, ?, ?, ?)",
-        (active_user_id, ts, lang, text, audio_path)
-    )
-    conn.commit()
-    conn.close()
-    
-    # 2. Process Spoken Words (The "Working" Logic for Tracking & Stats)
-    # This updates frequencies, user progress, and identifies new words
+def utterance_span(result, clock):
+    """
+    Capture-timeline byte range [start, end) of the words in a final Vosk
+    result, located through the word timings and the recognizer's clock.
+    Returns None if there are no words or the audio is no longer tracked.
+    """
+    words = result.get("result") or []
+    if not words:
+        return None
     try:
-        processed_stats = chatbot.process_spoken_words(active_user_id, text, lang)
-        
-        # 3. Trigger Validation for NEW words (found by chatbot)
-        # We only need to validate words that are genuinely new/OOV to save resources
-        if processed_stats and 'new_words' in processed_stats:
-            for new_word in processed_stats['new_words']:
-                threading.Thread(target=validate_word_task, args=(active_user_id, new_word, lang), daemon=True).start()
-                
-    except Exception as e:
-        print(f"Error processing spoken words: {e}", flush=True)
+        return clock.position(words[0]["start"]), clock.position(words[-1]["end"])
+    except ValueError as e:
+        print(f"[SYSTEM] Utterance audio unavailable: {e}", flush=True)
+        return None
+
+def span_ms(span):
+    """Utterance span in milliseconds of captured audio, as stored with the transcript"""
+    if span is None:
+        return None, None
+    return span[0] * 1000 // BYTES_PER_SEC, span[1] * 1000 // BYTES_PER_SEC
+
+def save_clip(clip, lang):
+    """Store a clip if it contains usable speech; returns its path or None"""
+    if active_user_id is None or len(clip) == 0:
+        return None
+    rms = audio_rms(clip)
+    if not has_speech_activity(clip, threshold=100):
+        print(f"[SYSTEM] No speech detected (RMS: {rms:.1f}), skipping save", flush=True)
+        return None
+    audio_quality = calculate_audio_quality(clip)
+    if audio_quality <= 0.01:
+        print(f"[SYSTEM] Audio quality too low ({audio_quality:.2f}), skipping save", flush=True)
+        return None
+
+    path = save_audio_chunk(clip, lang)
+    print(f"[SYSTEM] ✓ Audio Saved: {path} ({len(clip) / BYTES_PER_SEC:.2f}s, RMS: {rms:.1f}, Quality: {audio_quality:.2f})", flush=True)
+    return path
+
+def save_utterance_clip(result, clock, lang):
+    """
+    Save exactly the ring-buffer audio covering a finalized utterance.
+    Returns (path, span); path is None when the audio has left the ring
+    buffer or contains no usable speech.
+    """
+    span = utterance_span(result, clock)
+    if span is None:
+        return None, None
+    padding = int(CLIP_PADDING_SEC * BYTES_PER_SEC) & ~1
+    start = max(span[0] - padding, audio_ring.start_pos)
+    end = min(span[1] + padding, audio_ring.write_pos)
+    if end <= start:
+        print(f"[SYSTEM] Utterance audio already overwritten, skipping save", flush=True)
+        return None, span
+    return save_clip(audio_ring.slice(start, end), lang), span
+
+def record_utterance(text, lang, audio_path, span):
+    """Save a validated transcription together with its clip and span"""
+    if audio_path:
+        print(f"[✓ SAVED] [{lang.upper()}] {text} → {audio_path}", flush=True)
+    else:
+        print(f"[✓ SAVED] [{lang.upper()}] {text} (No Audio)", flush=True)
+    save_transcript(text, lang, audio_path, *span_ms(span))
 
+def clear_evicted_clips(paths):
+    """Unlink transcripts from clips removed by the retention sweeper"""
+    storage.transcripts.clear_audio(paths)
 
-def save_audio_chunk(raw_data, lang):
-    ts = time.strftime("%Y%m%d_%H%M%S")
-    filename = f"{lang}_{ts}.wav"
-    filepath = os.path.join(AUDIO_DIR, filename)
-    with wave.open(filepath, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(16000)
-        wf.writeframes(raw_data)
-    return filepath
+clip_store.on_evict = clear_evicted_clips
 
 def audio_callback(indata, frames, time, status):
     if status:
         print("Audio status:", status, flush=True)
-    q.put(bytes(indata))
+    # Drops are counted by the queue (get_audio_stats); no I/O in the real-time callback
+    block_queue.put(indata)
+
+def get_status():
+    """Worker state reported to the web app"""
+    return {
+        'active_user_id': active_user_id,
+        'active_language': active_language,
+        'multi_language': multi_language_enabled,
+        'models_loaded': sorted(loaded_languages()),
+        'listening': is_listening,
+        'audio': get_audio_stats(),
+        'decoders': decoder_pool.stats() if decoder_pool.size else None
+    }
+
+def get_audio_stats():
+    """Capture queue depth and drop counters, for monitoring"""
+    stats = block_queue.stats()
+    stats['ring_bytes_written'] = audio_ring.write_pos
+    return stats
+
+def audio_rms(audio_data):
+    """RMS energy of 16-bit PCM (bytes or a memoryview slice, no copy)"""
+    samples = memoryview(audio_data).cast('B').cast('h')
+    if len(samples) == 0:
+        return 0.0
+    return (sum(s * s for s in samples) / len(samples)) ** 0.5
 
 def has_speech_activity(audio_data, threshold=500):
     """
     Detect if audio chunk contains actual speech based on energy levels.
     Returns True if speech is likely present.
     """
-    import struct
-    
-    # Convert bytes to samples
-    samples = struct.unpack(f'{len(audio_data)//2}h', audio_data)
-    
-    # Calculate RMS (Root Mean Square) energy
-    sum_squares = sum(s * s for s in samples)
-    rms = (sum_squares / len(samples)) ** 0.5
+    rms = audio_rms(audio_data)
     
     # Check if energy exceeds threshold (Lowered to 100)
     return rms > 100
@@ -163,12 +261,10 @@ def calculate_audio_quality(audio_data):
     Calculate a quality score for the audio chunk.
     Returns a value between 0 and 1.
     """
-    import struct
-    
-    samples = struct.unpack(f'{len(audio_data)//2}h', audio_data)
+    samples = memoryview(audio_data).cast('B').cast('h')
     
     # Calculate signal strength
-    rms = (sum(s * s for s in samples) / len(samples)) ** 0.5
+    rms = audio_rms(samples)
     
     # Calculate zero-crossing rate (helps detect speech vs noise)
     zero_crossings = sum(1 for i in range(1, len(samples)) 
@@ -182,6 +278,124 @@ def calculate_audio_quality(audio_data):
     
     return (rms_score + zcr_score) / 2
 
+def validate_transcription(result, lang):
+    """
+    Run the confidence and language filters on a final Vosk result from the
+    `lang` model. Returns the validated language, or None to discard it.
+    """
+    text = result.get("text", "").strip()
+
+    # ===== FILTER 1: Skip empty or very short text =====
+    if not text or len(text) < 3:
+        return None
+
+    # Calculate confidence from word-level results
+    confidence = 0
+    word_count = 0
+    if "result" in result and result["result"]:
+        word_results = result["result"]
+        conf_sum = sum(w.get("conf", 0.0) for w in word_results)
+        word_count = len(word_results)
+        confidence = conf_sum / word_count if word_count > 0 else 0
+
+    # ===== FILTER 2: Minimum confidence threshold (Lowered) =====
+    if confidence < 0.1:
+        print(f"[FILTER] Low confidence ({confidence:.2f}) for '{text}', skipping", flush=True)
+        return None
+
+    # ===== FILTER 3: Minimum word count for non-Hindi =====
+    # Very short transcriptions may be noise, but allow single words with good confidence
+    if lang in ['en', 'es'] and word_count < 1:
+        print(f"[FILTER] Too few words ({word_count}) for '{text}', skipping", flush=True)
+        return None
+
+    # Language-specific validation: one script-profiling pass checked
+    # against the per-language policy table (see script_profiler)
+    detected_lang, reason = script_profiler.check(text, lang, detect=detect_language_offline)
+    if detected_lang is None:
+        print(f"[FILTER] {reason}, skipping from {lang.upper()} model", flush=True)
+        return None
+    
+    print(f"[{detected_lang.upper()}] ✓ Clean transcript: {text} (conf: {confidence:.2f}, words: {word_count}, {reason})", flush=True)
+    return detected_lang
+
+def decode_segment(lang, pcm):
+    """Decode a whole segment with a fresh recognizer for `lang`"""
+    if decoder_pool.size:
+        return decoder_pool.decode(lang, pcm)
+    rec = vosk.KaldiRecognizer(models[lang], SAMPLE_RATE)
+    rec.SetWords(True)
+    rec.AcceptWaveform(pcm)
+    return json.loads(rec.FinalResult())
+
+def arbitrate_segment(pcm, seg_start):
+    """
+    Decode a speech segment with every loaded model in parallel and keep the
+    best transcription: average word confidence plus the offline detector's
+    score for that model's language.
+    """
+    try:
+        futures = {lang: decode_pool.submit(decode_segment, lang, pcm) for lang in loaded_languages()}
+        best = None
+        for lang, future in futures.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"[MULTI] {lang.upper()} decode error: {e}", flush=True)
+                continue
+            text = result.get("text", "").strip()
+            words = result.get("result") or []
+            if not text or not words:
+                continue
+            confidence = sum(w.get("conf", 0.0) for w in words) / len(words)
+            detector_score = lang_detector.score_languages(text)[lang]
+            score = confidence + MULTI_LANGUAGE_DETECTOR_WEIGHT * detector_score
+            print(f"[MULTI] {lang.upper()}: '{text}' (conf: {confidence:.2f}, detector: {detector_score:.2f}, score: {score:.2f})", flush=True)
+            if best is None or score > best[0]:
+                best = (score, lang, text, result)
+
+        if best is None:
+            return
+        _, lang, text, result = best
+        detected_lang = validate_transcription(result, lang)
+        if not detected_lang:
+            return
+
+        # Word timings are relative to the segment start
+        clock = RecognizerClock(BYTES_PER_SEC)
+        clock.feed(seg_start, len(pcm))
+        span = utterance_span(result, clock)
+        audio_path = None
+        if span:
+            padding = int(CLIP_PADDING_SEC * BYTES_PER_SEC) & ~1
+            start = max(span[0] - padding, seg_start) - seg_start
+            end = min(span[1] + padding, seg_start + len(pcm)) - seg_start
+            audio_path = save_clip(memoryview(pcm)[start:end], detected_lang)
+        record_utterance(text, detected_lang, audio_path, span)
+    except Exception as e:
+        print(f"[MULTI] Segment error: {e}", flush=True)
+    finally:
+        segment_slots.release()
+
+def submit_segment(start, end):
+    """Copy a closed speech segment out of the ring and decode it in the background"""
+    start = max(start, audio_ring.start_pos)
+    if end <= start:
+        return
+    if not segment_slots.acquire(blocking=False):
+        print(f"[MULTI] Decoders busy, dropping {(end - start) / BYTES_PER_SEC:.1f}s speech segment", flush=True)
+        return
+    segment_executor.submit(arbitrate_segment, bytes(audio_ring.slice(start, end)), start)
+
+def feed_stream(lang, pcm):
+    """Feed captured audio to the `lang` recognizer; returns the final result when an utterance ends"""
+    if decoder_pool.size:
+        return decoder_pool.feed(MIC_SESSION, lang, pcm)
+    rec = recognizers[lang]
+    if rec.AcceptWaveform(pcm):
+        return json.loads(rec.Result())
+    return None
+
 def transcribe_loop():
     global is_listening
     if sd is None:
@@ -190,166 +404,49 @@ def transcribe_loop():
         return
 
     try:
-        with sd.RawInputStream(samplerate=16000, blocksize=8000,
+        with sd.RawInputStream(samplerate=SAMPLE_RATE, blocksize=BLOCK_FRAMES,
                                dtype="int16", channels=1,
                                callback=audio_callback):
             print("[MIC] Listening... (EN, ES, HI + offline detection + validation)")
             is_listening = True
             
-            # Continuous recording buffer
-            audio_buffer = bytearray()
-            CHUNK_DURATION_SEC = 3
-            BYTES_PER_SEC = 16000 * 2 # 16kHz * 16-bit
-            CHUNK_SIZE = BYTES_PER_SEC * CHUNK_DURATION_SEC
-            last_saved_audio_path = None
-
             while not stop_event.is_set():
-                data = q.get()
-                if stop_event.is_set():
+                data = block_queue.get()
+                if stop_event.is_set() or data is None:
                     break
                 if not data:
                     continue
                 
-                # 1. Accumulate audio data
-                audio_buffer.extend(data)
+                # 1. Keep the recent audio so finalized utterances can be cut out of it
+                audio_ring.append(data)
                 
-                # 2. Save only high-quality audio chunks every 3 seconds
-                if len(audio_buffer) >= CHUNK_SIZE:
-                    chunk_to_save = audio_buffer[:CHUNK_SIZE]
-                    audio_buffer = audio_buffer[CHUNK_SIZE:] # Keep remainder for next chunk
-                    
-                    # ===== DEBUG: Check audio levels =====
-                    import struct
-                    samples = struct.unpack(f'{len(chunk_to_save)//2}h', chunk_to_save)
-                    rms = (sum(s * s for s in samples) / len(samples)) ** 0.5
-                    
-                    print(f"[DEBUG] Audio RMS Energy: {rms:.1f} (threshold: 200)", flush=True)
-                    
-                    # Lower threshold for better sensitivity
-                    if has_speech_activity(chunk_to_save, threshold=100):
-                        audio_quality = calculate_audio_quality(chunk_to_save)
-                        
-                        # Save with very low threshold for testing
-                        if audio_quality > 0.01:
-                            ts_check = time.time()
-                            last_saved_audio_path = save_audio_chunk(chunk_to_save, "rec")
-                            print(f"[SYSTEM] ✓ Audio Saved: {last_saved_audio_path} (RMS: {rms:.1f}, Quality: {audio_quality:.2f})", flush=True)
-                        else:
-                            print(f"[SYSTEM] Audio quality too low ({audio_quality:.2f}), skipping save", flush=True)
-                            last_saved_audio_path = None
-                    else:
-                        print(f"[SYSTEM] No speech detected (RMS: {rms:.1f} < threshold 50), skipping save", flush=True)
-                        last_saved_audio_path = None
-
-                # 3. Process transcription with improved logic
+                # Multi-language mode: only closed speech segments are decoded
+                if multi_language_enabled:
+                    segment = speech_segmenter.push(audio_ring.write_pos - len(data), len(data), audio_rms(data))
+                    if segment:
+                        submit_segment(*segment)
+                    continue
+                
+                # 2. Process transcription with improved logic
                 # Only run the recognizer for the active language to prevent cross-talk and confusion
                 
                 target_lang = active_language
-                if target_lang in recognizers:
-                    rec = recognizers[target_lang]
+                if target_lang in recognizers or target_lang in decoder_pool.languages:
+                    clock = recognizer_clocks.setdefault(target_lang, RecognizerClock(BYTES_PER_SEC))
+                    clock.feed(audio_ring.write_pos - len(data), len(data))
                     
-                    if rec.AcceptWaveform(data):
-                        result = json.loads(rec.Result())
+                    # Vosk's C binding needs bytes, not a memoryview
+                    result = feed_stream(target_lang, bytes(data))
+                    if result:
                         text = result.get("text", "").strip()
-                        lang = target_lang # Explicitly set valid language
-                        
-                        # ===== FILTER 1: Skip empty or very short text =====
-                        
-                        # ===== FILTER 1: Skip empty or very short text =====
-                        if not text or len(text) < 3:
-                            continue
-                        
-                        # Calculate confidence from word-level results
-                        confidence = 0
-                        word_count = 0
-                        if "result" in result and result["result"]:
-                            word_results = result["result"]
-                            conf_sum = sum(w.get("conf", 0.0) for w in word_results)
-                            word_count = len(word_results)
-                            confidence = conf_sum / word_count if word_count > 0 else 0
-                        
-                        # ===== FILTER 2: Minimum confidence threshold (Lowered) =====
-                        if confidence < 0.1:
-                            print(f"[FILTER] Low confidence ({confidence:.2f}) for '{text}', skipping", flush=True)
-                            continue
-                        
-                        # ===== FILTER 3: Minimum word count for non-Hindi =====
-                        # Very short transcriptions may be noise, but allow single words with good confidence
-                        if lang in ['en', 'es'] and word_count < 1:
-                            print(f"[FILTER] Too few words ({word_count}) for '{text}', skipping", flush=True)
-                            continue
-                        
-                        # Language-specific validation with stricter rules
-                        is_valid = False
-                        detected_lang = lang  # Default to the model's language
-                        
-                        # Hindi: Check for Devanagari script
-                        if lang == 'hi':
-                            devanagari_chars = sum(1 for c in text if 0x0900 <= ord(c) <= 0x097F)
-                            total_chars = len(text)
-                            
-                            # At least 70% of characters should be Devanagari for Hindi
-                            if devanagari_chars > 0 and (devanagari_chars / total_chars) >= 0.7:
-                                is_valid = True
-                                detected_lang = 'hi'
-                                print(f"[HI] ✓ Clean Hindi: {text} (conf: {confidence:.2f}, words: {word_count})", flush=True)
-                            else:
-                                print(f"[FILTER] Insufficient Devanagari content ({devanagari_chars}/{total_chars}), skipping", flush=True)
-                        
-                        # Spanish: Check for Spanish-specific patterns
-                        elif lang == 'es':
-                            # Check for Spanish-specific characters
-                            has_spanish_chars = any(c in text for c in 'áéíóúüñÁÉÍÓÚÜÑ¿¡')
-                            # Use offline detector
-                            offline_detected = detect_language_offline(text)
-                            
-                            # More strict: require either Spanish chars OR confident offline detection
-                            if has_spanish_chars or offline_detected == 'es':
-                                # Double-check it's not actually English
-                                if offline_detected != 'en':
-                                    is_valid = True
-                                    detected_lang = 'es'
-                                    print(f"[ES] ✓ Clean Spanish: {text} (conf: {confidence:.2f}, words: {word_count})", flush=True)
-                                else:
-                                    print(f"[FILTER] Detected as English, skipping from ES model", flush=True)
-                            else:
-                                print(f"[FILTER] No Spanish indicators found, skipping", flush=True)
-                        
-                        # English: Default, but verify it's not another language
-                        elif lang == 'en':
-                            # Check it's not Hindi (no Devanagari)
-                            has_devanagari = any(ord(c) >= 0x0900 and ord(c) <= 0x097F for c in text)
-                            if has_devanagari:
-                                print(f"[FILTER] Contains Devanagari in EN model, skipping", flush=True)
-                                continue
-                            
-                            # Check for Spanish contamination
-                            spanish_char_count = sum(1 for c in text if c in 'áéíóúüñÁÉÍÓÚÜÑ¿¡')
-                            if spanish_char_count / len(text) > 0.3:
-                                print(f"[FILTER] Too many Spanish chars in EN model, skipping", flush=True)
-                                continue
-                            
-                            # Use offline detector for final validation
-                            offline_detected = detect_language_offline(text)
-                            if offline_detected in ['en', 'unknown']:
-                                is_valid = True
-                                detected_lang = 'en'
-                                print(f"[EN] ✓ Clean English: {text} (conf: {confidence:.2f}, words: {word_count})", flush=True)
-                            else:
-                                print(f"[FILTER] Detected as {offline_detected}, skipping from EN model", flush=True)
+                        detected_lang = validate_transcription(result, target_lang)
                         
                         # ===== SAVE ONLY VALID, HIGH-QUALITY TRANSCRIPTIONS =====
                         # Must pass all filters
-                        if is_valid:
+                        if detected_lang:
                             # Prefer saving with audio, but save text regardless
-                            final_audio_path = last_saved_audio_path if last_saved_audio_path else None
-                            
-                            if final_audio_path:
-                                print(f"[✓ SAVED] [{detected_lang.upper()}] {text} → {final_audio_path}", flush=True)
-                            else:
-                                print(f"[✓ SAVED] [{detected_lang.upper()}] {text} (No Audio)", flush=True)
-                                
-                            save_transcript(text, detected_lang, final_audio_path)
+                            final_audio_path, span = save_utterance_clip(result, clock, detected_lang)
+                            record_utterance(text, detected_lang, final_audio_path, span)
     except Exception as e:
         print(f"Audio error: {e}")
     finally:
@@ -360,9 +457,11 @@ def start_transcriber():
     if listener_thread and listener_thread.is_alive():
         return
     stop_event.clear()
+    block_queue.reset()
     listener_thread = threading.Thread(target=transcribe_loop, daemon=True)
     listener_thread.start()
+    clip_store.start_sweeper()
 
 def stop_transcriber():
     stop_event.set()
-    q.put(b"")  # unblock queue
+    block_queue.close()  # unblock the loop
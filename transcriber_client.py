@@ -0,0 +1,201 @@
+"""
+Transcriber Client for LinguaVoice
+Web-side proxy for the transcriber worker process (transcriber_worker.py).
+Mirrors the controls app.py used on the in-process transcriber module, so
+the web app imports no audio or Vosk code and any number of web workers can
+share one worker.
+
+When the worker cannot be reached the client degrades instead of failing
+requests: control calls are dropped, manual transcripts that never reached
+it are saved locally and delta polls fall back to the database.
+"""
+import os
+import secrets
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import Client, AuthenticationError
+from config import TRANSCRIBER_ADDRESS, TRANSCRIBER_AUTHKEY, TRANSCRIBER_TIMEOUT, TRANSCRIBER_AUTOSTART
+from transcript_recorder import record_transcript
+
+RETRY_BACKOFF_SEC = 5.0  # don't retry a down worker on every request
+
+
+def parse_address(address):
+    """'host:port' -> (host, port)"""
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+class TranscriberUnavailable(Exception):
+    """`delivered` is True when the command was sent but no reply came back"""
+
+    def __init__(self, message, delivered=False):
+        super().__init__(message)
+        self.delivered = delivered
+
+
+class TranscriberClient:
+    """One persistent connection to the worker, shared by the web process's threads"""
+
+    def __init__(self, address=TRANSCRIBER_ADDRESS, authkey=TRANSCRIBER_AUTHKEY,
+                 timeout=TRANSCRIBER_TIMEOUT, autostart=TRANSCRIBER_AUTOSTART):
+        self.address = parse_address(address)
+        if not authkey:
+            if not autostart:
+                raise RuntimeError("TRANSCRIBER_AUTHKEY must be set when TRANSCRIBER_AUTOSTART is off")
+            # Private key for the worker we start ourselves, inherited through its environment
+            os.environ["TRANSCRIBER_AUTHKEY"] = secrets.token_hex(16)
+            authkey = os.environ["TRANSCRIBER_AUTHKEY"].encode()
+        self.authkey = authkey
+        self.timeout = timeout
+        self.autostart = autostart
+        self.conn = None
+        self.lock = threading.Lock()
+        self.retry_at = 0
+        self.worker_process = None
+        self.state = {'active_user_id': None, 'active_language': 'en', 'multi_language': False}
+        self.unsynced = {}  # user_id -> id of a transcript saved locally that the worker has not seen
+
+    def _connect(self):
+        try:
+            return Client(self.address, authkey=self.authkey)
+        except (ConnectionError, OSError):
+            if not self.autostart:
+                raise
+        self._spawn_worker()
+        deadline = time.time() + self.timeout
+        while True:
+            try:
+                return Client(self.address, authkey=self.authkey)
+            except (ConnectionError, OSError):
+                if time.time() >= deadline:
+                    raise
+                time.sleep(0.2)
+
+    def _spawn_worker(self):
+        if self.worker_process and self.worker_process.poll() is None:
+            return
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'transcriber_worker.py')
+        print(f"[TRANSCRIBER] Starting worker process on {self.address[0]}:{self.address[1]}", flush=True)
+        self.worker_process = subprocess.Popen([sys.executable, script])
+
+    def _drop(self):
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except OSError:
+                pass
+        self.conn = None
+
+    def _send(self, message):
+        """Deliver a message, reconnecting once if the connection went stale"""
+        for attempt in range(2):
+            try:
+                if self.conn is not None and self.conn.poll(0):
+                    self._drop()  # readable with no request pending: the worker closed it
+                if self.conn is None:
+                    self.conn = self._connect()
+                self.conn.send(message)
+                return
+            except (EOFError, OSError):
+                self._drop()
+                if attempt == 1:
+                    raise
+
+    def call(self, cmd, **params):
+        """
+        Send one command and return its result. Raises TranscriberUnavailable;
+        its `delivered` flag tells whether the worker may still execute it.
+        """
+        with self.lock:
+            if self.conn is None and time.time() < self.retry_at:
+                raise TranscriberUnavailable("transcriber worker unavailable")
+            delivered = False
+            try:
+                self._send(dict(params, cmd=cmd))
+                delivered = True
+                if not self.conn.poll(self.timeout):
+                    raise TimeoutError(f"no reply to {cmd} within {self.timeout}s")
+                reply = self.conn.recv()
+            except (EOFError, OSError, AuthenticationError) as e:  # OSError includes ConnectionError and TimeoutError
+                self._drop()  # a late reply would answer the next command
+                self.retry_at = time.time() + RETRY_BACKOFF_SEC
+                print(f"[TRANSCRIBER] Worker unavailable: {e}", flush=True)
+                raise TranscriberUnavailable(str(e), delivered=delivered) from e
+            self.retry_at = 0
+        self.state.update(reply.get('state') or {})
+        if not reply.get('ok'):
+            raise RuntimeError(reply.get('error'))
+        return reply.get('result')
+
+    def _control(self, cmd, **params):
+        try:
+            return self.call(cmd, **params)
+        except TranscriberUnavailable:
+            return None
+
+    def set_active_user(self, user_id):
+        self.state['active_user_id'] = user_id
+        self._control('set_active_user', user_id=user_id)
+
+    def set_active_language(self, language):
+        self.state['active_language'] = language
+        self._control('set_active_language', language=language)
+
+    def set_multi_language(self, enabled):
+        self._control('set_multi_language', enabled=enabled)
+
+    @property
+    def multi_language_enabled(self):
+        return self.state.get('multi_language', False)
+
+    def save_transcript(self, user_id, text, language, audio_path=None):
+        """
+        Save a transcript through the worker, or locally when the command
+        never reached it. Once delivered the worker may still complete the
+        save, so a missing reply is not retried (that would duplicate it).
+        """
+        try:
+            return self.call('save_transcript', user_id=user_id, text=text, language=language, audio_path=audio_path)
+        except TranscriberUnavailable as e:
+            if e.delivered:
+                print(f"[TRANSCRIBER] No reply to save for user {user_id}; not saving again locally", flush=True)
+                return None
+        transcript_id = record_transcript(user_id, text, language, audio_path)
+        if transcript_id is not None:
+            self.unsynced[user_id] = max(transcript_id, self.unsynced.get(user_id, 0))
+        return transcript_id
+
+    def _sync_local_save(self, user_id):
+        """Tell the worker about a locally saved transcript; True once it knows"""
+        transcript_id = self.unsynced.get(user_id)
+        try:
+            self.call('note_transcript', user_id=user_id, transcript_id=transcript_id)
+        except TranscriberUnavailable:
+            return False
+        if self.unsynced.get(user_id) == transcript_id:
+            self.unsynced.pop(user_id, None)
+        return True
+
+    def latest_id(self, user_id):
+        """Newest transcript id known to the worker, or None if it is unavailable"""
+        return self._control('latest_id', user_id=user_id)
+
+    def has_newer(self, user_id, since_id):
+        """False only when the worker knows there is nothing newer than since_id"""
+        if user_id in self.unsynced:
+            # The worker's high-water mark is behind a local save: this poll goes to the database
+            self._sync_local_save(user_id)
+            return True
+        latest = self.latest_id(user_id)
+        return latest is None or latest > since_id
+
+    def status(self):
+        status = self._control('status')
+        return status if status is not None else {'available': False}
+
+
+# Global instance
+transcriber_client = TranscriberClient()
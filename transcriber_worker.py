@@ -0,0 +1,107 @@
+"""
+Transcriber Worker for LinguaVoice
+Runs audio capture and Vosk decoding (transcriber.py) in a process of its
+own, so web workers load no models and decoding cannot starve HTTP
+handling. Web processes send it commands through transcriber_client.py over
+a local multiprocessing.connection socket.
+
+Usage:
+    python transcriber_worker.py
+"""
+import sys
+import threading
+from multiprocessing.connection import Listener, AuthenticationError
+from config import TRANSCRIBER_ADDRESS, TRANSCRIBER_AUTHKEY
+import storage
+import transcriber
+from transcriber_client import parse_address
+from transcript_feed import transcript_feed
+from transcript_recorder import record_transcript
+
+
+def latest_id(user_id):
+    """Newest transcript id for a user (0 if none), seeded from the database on first request"""
+    latest = transcript_feed.latest_id(user_id)
+    if latest is None:
+        latest = storage.transcripts.latest_id(user_id) or 0
+        transcript_feed.note(user_id, latest)
+    return latest
+
+
+def note_transcript(user_id, transcript_id):
+    """A web process saved a transcript itself while this worker was unreachable"""
+    latest_id(user_id)  # seed first, so the note cannot hide older rows
+    transcript_feed.note(user_id, transcript_id)
+
+
+# Command name -> handler(message); the handler's return value is the reply result
+COMMANDS = {
+    'set_active_user': lambda m: transcriber.set_active_user(m['user_id']),
+    'set_active_language': lambda m: transcriber.set_active_language(m['language']),
+    'set_multi_language': lambda m: transcriber.set_multi_language(m['enabled']),
+    'save_transcript': lambda m: record_transcript(m['user_id'], m['text'], m['language'], m.get('audio_path')),
+    'note_transcript': lambda m: note_transcript(m['user_id'], m['transcript_id']),
+    'latest_id': lambda m: latest_id(m['user_id']),
+    'status': lambda m: transcriber.get_status(),
+}
+
+
+def state():
+    return {
+        'active_user_id': transcriber.active_user_id,
+        'active_language': transcriber.active_language,
+        'multi_language': transcriber.multi_language_enabled,
+    }
+
+
+def handle_connection(conn):
+    """Serve one web process: request/reply until it disconnects"""
+    with conn:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                return
+            handler = COMMANDS.get(message.get('cmd')) if isinstance(message, dict) else None
+            if handler is None:
+                reply = {'ok': False, 'error': f"Unknown command: {message!r}"}
+            else:
+                try:
+                    reply = {'ok': True, 'result': handler(message)}
+                except Exception as e:
+                    print(f"[WORKER] {message.get('cmd')} failed: {e}", flush=True)
+                    reply = {'ok': False, 'error': str(e)}
+            reply['state'] = state()
+            try:
+                conn.send(reply)
+            except (EOFError, OSError):
+                return
+
+
+def serve(address=TRANSCRIBER_ADDRESS, authkey=TRANSCRIBER_AUTHKEY):
+    if not authkey:
+        print("[WORKER] TRANSCRIBER_AUTHKEY is not set; refusing to accept unauthenticated commands", flush=True)
+        return 1
+    try:
+        listener = Listener(parse_address(address), authkey=authkey)
+    except OSError as e:
+        print(f"[WORKER] Cannot listen on {address} ({e}); is another worker running?", flush=True)
+        return 1
+
+    transcriber.start_transcriber()
+    print(f"[WORKER] Transcriber worker listening on {address}", flush=True)
+    with listener:
+        while True:
+            try:
+                conn = listener.accept()
+            except AuthenticationError:
+                print("[WORKER] Rejected connection with a wrong auth key", flush=True)
+                continue
+            except OSError as e:
+                print(f"[WORKER] Accept failed: {e}", flush=True)
+                continue
+            threading.Thread(target=handle_connection, args=(conn,), daemon=True).start()
+
+
+if __name__ == "__main__":
+    sys.exit(serve())
@@ -0,0 +1,40 @@
+"""
+Transcript Feed for LinguaVoice
+Tracks the newest transcript id per user in memory, so delta polls
+(`/api/get_transcripts?since_id=N`) that have nothing new can be answered
+without querying SQLite.
+"""
+import threading
+
+
+class TranscriptFeed:
+    """Per-user high-water mark of saved transcript ids"""
+
+    def __init__(self):
+        self.high_water = {}
+        self.lock = threading.Lock()
+
+    def note(self, user_id, transcript_id):
+        """Record that a transcript with this id was saved for the user"""
+        if user_id is None or transcript_id is None:
+            return
+        with self.lock:
+            if transcript_id > self.high_water.get(user_id, -1):  # 0 = known to have none
+                self.high_water[user_id] = transcript_id
+
+    def latest_id(self, user_id):
+        """Newest known transcript id for the user, or None if not yet known"""
+        with self.lock:
+            return self.high_water.get(user_id)
+
+    def has_newer(self, user_id, since_id):
+        """
+        False only when we know there is nothing newer than since_id.
+        Unknown users return True so the caller falls back to the database.
+        """
+        latest = self.latest_id(user_id)
+        return latest is None or latest > since_id
+
+
+# Global instance
+transcript_feed = TranscriptFeed()
@@ -0,0 +1,44 @@
+"""
+Transcript Recorder for LinguaVoice
+Stores a finished transcript and feeds its words into vocabulary tracking.
+Shared by the transcriber worker and the web app (manual entries), and free
+of any audio/Vosk imports.
+"""
+import threading
+import storage
+from adaptive_chatbot import AdaptiveChatbot
+from transcript_feed import transcript_feed
+
+# Initialize Chatbot for Learning Tracking
+chatbot = AdaptiveChatbot()
+
+def validate_word_task(user_id, word, lang):
+    # This is a helper to bridge the gap since we are refactoring
+    # Ideally, WordValidator should be singleton or util
+    from word_validator import WordValidator
+    validator = WordValidator()
+    validator.validate_and_store_word(user_id, word, lang)
+
+
+def record_transcript(user_id, text, lang, audio_path=None, audio_start_ms=None, audio_end_ms=None):
+    """Save a transcript for a user; returns its id (None without a user)"""
+    if user_id is None:
+        return None
+
+    transcript_id = storage.transcripts.add(user_id, lang, text, audio_path, audio_start_ms, audio_end_ms)
+    transcript_feed.note(user_id, transcript_id)
+    
+    # 2. Process Spoken Words (The "Working" Logic for Tracking & Stats)
+    # This updates frequencies, user progress, and identifies new words
+    try:
+        processed_stats = chatbot.process_spoken_words(user_id, text, lang)
+        
+        # 3. Trigger Validation for NEW words (found by chatbot)
+        # We only need to validate words that are genuinely new/OOV to save resources
+        if processed_stats and 'new_words' in processed_stats:
+            for new_word in processed_stats['new_words']:
+                threading.Thread(target=validate_word_task, args=(user_id, new_word, lang), daemon=True).start()
+                
+    except Exception as e:
+        print(f"Error processing spoken words: {e}", flush=True)
+    return transcript_id
@@ -43,4 +43,21 @@ try:
 except ImportError as e:
     print(f"✗ GeminiWordService import failed: {e}")
 
+print("\nChecking BlockQueue overflow...")
+try:
+    from audio_buffer import BlockQueue
+    queue = BlockQueue(4, slots=3, policy='drop_oldest')
+    queue.put(b'aaaa')
+    held = queue.get()  # view the consumer is still decoding
+    for block in (b'bbbb', b'cccc', b'dddd'):  # the last put overflows
+        queue.put(block)
+    if bytes(held) != b'aaaa':
+        print(f"✗ Block held by the consumer was overwritten: {bytes(held)!r}")
+    elif [bytes(queue.get()) for _ in range(2)] != [b'cccc', b'dddd']:
+        print("✗ Queue order wrong after dropping the oldest block")
+    else:
+        print("✓ Overflowing put leaves the consumer's block intact")
+except Exception as e:
+    print(f"✗ BlockQueue check failed: {e}")
+
 print("\nVerification Complete.")
@@ -1,10 +1,12 @@
-import sqlite3
 import requests
 import json
 import time
+import base64
 from threading import Lock
-from database_manager import db
+import storage
 from api_service import api_service
+from offline_dictionary import offline_dict
+from tokenizer import tokenizer
 
 class WordValidator:
     def __init__(self):
@@ -15,9 +17,27 @@ class WordValidator:
     
     def get_word_meaning(self, word, language):
         """Get enhanced word information using the API service"""
-        if not self.is_online():
-            return None
+        return self.lookup_meaning(word, language)[0]
+    
+    def lookup_meaning(self, word, language):
+        """
+        (meaning, is_variant). Exact offline hits come first; an unambiguous
+        near-miss spelling ("gracia" -> "gracias") is answered offline too,
+        marked as a variant of its headword rather than as the word's own
+        meaning; only then are the online APIs asked.
+        """
+        offline = offline_dict.get_definition(word, language, fuzzy=True)
+        if offline:
+            if offline['variant']:
+                return f"Variant of '{offline['headword']}': {offline['definition']}", True
+            return offline['definition'], False
         
+        if not self.is_online():
+            return None, False
+        return self.fetch_remote_meaning(word, language), False
+    
+    def fetch_remote_meaning(self, word, language):
+        """Rich meaning string from the online APIs, or None"""
         try:
             # Use the enhanced API service
             word_info = api_service.get_enhanced_word_info(word, language)
@@ -50,28 +70,37 @@ class WordValidator:
             print(f"[VALIDATOR] Error fetching meaning for {word} ({language}): {e}")
             return None
 
+    def suggest_meaning(self, word, language):
+        """
+        Definition of the nearest offline spelling, for when the word itself
+        could not be resolved. A suggestion only: a real word close to another
+        headword would otherwise get that neighbour's definition.
+        """
+        match = offline_dict.fuzzy_lookup(word, language)
+        row = offline_dict.lookup(match[0], language, accent_insensitive=False) if match else None
+        if not row:
+            return None
+        return f"Did you mean '{row[0]}'? {row[1]}"
     
     def validate_and_store_word(self, user_id, word, language):
+        word = tokenizer.normalize_word(word)
         with self.lock:
-            conn = db.get_connection()
-            cursor = conn.cursor()
-            
             # Check existing
-            cursor.execute(
-                "SELECT meaning, is_valid FROM vocabulary WHERE user_id=? AND word=? AND language=?",
-                (user_id, word.lower(), language)
-            )
-            result = cursor.fetchone()
+            result = storage.vocabulary.meaning(user_id, word, language)
             
             # If found and has a meaning, OR if we are still offline and can't improve it, return cached
             if result and (result[0] or not self.is_online()):
-                conn.close()
                 return {'cached': True, 'meaning': result[0], 'is_valid': bool(result[1])}
             
             # If we are here, either it's new, OR it's existing but missing meaning and we are online.
             # Helper: Validate online
-            meaning = self.get_word_meaning(word, language)
-            is_valid = meaning is not None
+            meaning, is_variant = self.lookup_meaning(word, language)
+            # A variant keeps its "Variant of ..." meaning (no remote call next
+            # time) but the word itself is not marked valid
+            is_valid = meaning is not None and not is_variant
+            # Offline or remote lookup failed: offer the nearest spelling, but
+            # store nothing for it so the word is looked up again later
+            suggestion = None if meaning else self.suggest_meaning(word, language)
             
             # If we failed to get meaning again (different kind of failure?), keep old if exists? 
             # But here we just update/insert.
@@ -81,54 +110,73 @@ class WordValidator:
             try:
                 if result:
                     # UPDATE existing - preserve frequency, mastery
-                    cursor.execute(
-                        "UPDATE vocabulary SET meaning=?, is_valid=?, last_practiced=? WHERE user_id=? AND word=? AND language=?",
-                        (meaning or '', int(is_valid), timestamp, user_id, word.lower(), language)
-                    )
+                    storage.vocabulary.set_meaning(user_id, word, language, meaning or '',
+                                                   is_valid=int(is_valid), last_practiced=timestamp)
                     print(f"[VALIDATOR] Updated: {word} ({language}) - {meaning[:50] if meaning else 'No meaning'}", flush=True)
                 else:
                     # INSERT new
-                    cursor.execute(
-                        """INSERT INTO vocabulary 
-                           (user_id, word, language, meaning, is_valid, first_seen, last_practiced) 
-                           VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                        (user_id, word.lower(), language, meaning or '', int(is_valid), timestamp, timestamp)
-                    )
+                    storage.vocabulary.add(user_id, word, language, timestamp, timestamp,
+                                           meaning=meaning or '', is_valid=int(is_valid))
                     print(f"[VALIDATOR] Inserted: {word} ({language}) - {meaning[:50] if meaning else 'No meaning'}", flush=True)
-                conn.commit()
             except Exception as e:
                 print(f"DB Error in validator: {e}", flush=True)
-            finally:
-                conn.close()
             
-            return {'cached': False, 'meaning': meaning, 'is_valid': is_valid}
+            return {'cached': False, 'meaning': meaning, 'is_valid': is_valid, 'suggestion': suggestion}
     
     def get_user_words(self, user_id, language=None):
-        conn = db.get_connection()
-        cursor = conn.cursor()
-        
-        query = """SELECT word, language, meaning, is_valid, last_practiced, source_context, 
-                          frequency, mastery_level 
-                   FROM vocabulary WHERE user_id=?"""
-        params = [user_id]
+        words, _ = self.get_user_words_page(user_id, language)
+        return words
+    
+    def get_user_words_page(self, user_id, language=None, limit=None, cursor=None, fields=None):
+        """
+        Return (words, next_cursor) for a user, most recently practiced first.
         
-        if language:
-            query += " AND language=?"
-            params.append(language)
-            
-        query += " ORDER BY last_practiced DESC"
+        `cursor` is the opaque value returned as next_cursor by the previous
+        page; `fields` restricts each word dict to the given keys.
+        """
+        fields = [f for f in (fields or USER_WORD_FIELDS) if f in USER_WORD_FIELDS]
+        results = storage.vocabulary.page(
+            user_id, [USER_WORD_FIELDS[f][0] for f in fields], language=language,
+            after=decode_cursor(cursor) if cursor else None,
+            limit=limit + 1 if limit else None  # One extra row tells us if there's a next page
+        )
         
-        cursor.execute(query, params)
-        results = cursor.fetchall()
-        conn.close()
+        next_cursor = None
+        if limit and len(results) > limit:
+            results = results[:limit]
+            next_cursor = encode_cursor(results[-1][1], results[-1][0])
         
-        return [{
-            'word': r[0], 
-            'language': r[1], 
-            'meaning': r[2], 
-            'is_valid': bool(r[3]), 
-            'timestamp': r[4], 
-            'source': r[5],
-            'frequency': r[6] or 1,
-            'mastery_level': r[7] or 0
-        } for r in results]
+        words = [
+            {f: USER_WORD_FIELDS[f][1](r[i + 2]) for i, f in enumerate(fields)}
+            for r in results
+        ]
+        return words, next_cursor
+    
+    def get_vocabulary_version(self, user_id):
+        """Counter that changes whenever any of the user's vocabulary rows change"""
+        return storage.vocabulary.version(user_id)
+
+
+# API field name -> (vocabulary column, value converter)
+USER_WORD_FIELDS = {
+    'word': ('word', lambda v: v),
+    'language': ('language', lambda v: v),
+    'meaning': ('meaning', lambda v: v),
+    'is_valid': ('is_valid', bool),
+    'timestamp': ('last_practiced', lambda v: v),
+    'source': ('source_context', lambda v: v),
+    'frequency': ('frequency', lambda v: v or 1),
+    'mastery_level': ('mastery_level', lambda v: v or 0),
+}
+
+def encode_cursor(last_practiced, row_id):
+    raw = json.dumps([last_practiced, row_id]).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+def decode_cursor(cursor):
+    """Decode a page cursor; raises ValueError if it is malformed"""
+    try:
+        last_practiced, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return str(last_practiced), int(row_id)
+    except Exception:
+        raise ValueError("Invalid cursor")